@@ -168,6 +168,7 @@ CartService::Service::~Service() {
 
 static const char* RecommendationService_method_names[] = {
   "/oteldemo.RecommendationService/ListRecommendations",
+  "/oteldemo.RecommendationService/ListRecommendationsBatch",
 };
 
 std::unique_ptr< RecommendationService::Stub> RecommendationService::NewStub(const std::shared_ptr< ::grpc::ChannelInterface>& channel, const ::grpc::StubOptions& options) {
@@ -178,6 +179,7 @@ std::unique_ptr< RecommendationService::Stub> RecommendationService::NewStub(con
 
 RecommendationService::Stub::Stub(const std::shared_ptr< ::grpc::ChannelInterface>& channel, const ::grpc::StubOptions& options)
   : channel_(channel), rpcmethod_ListRecommendations_(RecommendationService_method_names[0], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_ListRecommendationsBatch_(RecommendationService_method_names[1], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
   {}
 
 ::grpc::Status RecommendationService::Stub::ListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::oteldemo::ListRecommendationsResponse* response) {
@@ -203,6 +205,29 @@ void RecommendationService::Stub::async::ListRecommendations(::grpc::ClientConte
   return result;
 }
 
+::grpc::Status RecommendationService::Stub::ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::oteldemo::ListRecommendationsBatchResponse* response) {
+  return ::grpc::internal::BlockingUnaryCall< ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), rpcmethod_ListRecommendationsBatch_, context, request, response);
+}
+
+void RecommendationService::Stub::async::ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, std::function<void(::grpc::Status)> f) {
+  ::grpc::internal::CallbackUnaryCall< ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_ListRecommendationsBatch_, context, request, response, std::move(f));
+}
+
+void RecommendationService::Stub::async::ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) {
+  ::grpc::internal::ClientCallbackUnaryFactory::Create< ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_ListRecommendationsBatch_, context, request, response, reactor);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>* RecommendationService::Stub::PrepareAsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc::internal::ClientAsyncResponseReaderHelper::Create< ::oteldemo::ListRecommendationsBatchResponse, ::oteldemo::ListRecommendationsBatchRequest, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), cq, rpcmethod_ListRecommendationsBatch_, context, request);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>* RecommendationService::Stub::AsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+  auto* result =
+    this->PrepareAsyncListRecommendationsBatchRaw(context, request, cq);
+  result->StartCall();
+  return result;
+}
+
 RecommendationService::Service::Service() {
   AddMethod(new ::grpc::internal::RpcServiceMethod(
       RecommendationService_method_names[0],
@@ -214,6 +239,16 @@ RecommendationService::Service::Service() {
              ::oteldemo::ListRecommendationsResponse* resp) {
                return service->ListRecommendations(ctx, req, resp);
              }, this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      RecommendationService_method_names[1],
+      ::grpc::internal::RpcMethod::NORMAL_RPC,
+      new ::grpc::internal::RpcMethodHandler< RecommendationService::Service, ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(
+          [](RecommendationService::Service* service,
+             ::grpc::ServerContext* ctx,
+             const ::oteldemo::ListRecommendationsBatchRequest* req,
+             ::oteldemo::ListRecommendationsBatchResponse* resp) {
+               return service->ListRecommendationsBatch(ctx, req, resp);
+             }, this)));
 }
 
 RecommendationService::Service::~Service() {
@@ -226,6 +261,13 @@ RecommendationService::Service::~Service() {
   return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
 }
 
+::grpc::Status RecommendationService::Service::ListRecommendationsBatch(::grpc::ServerContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response) {
+  (void) context;
+  (void) request;
+  (void) response;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
 
 static const char* ProductCatalogService_method_names[] = {
   "/oteldemo.ProductCatalogService/ListProducts",
@@ -376,6 +418,11 @@ static const char* ProductReviewService_method_names[] = {
   "/oteldemo.ProductReviewService/GetProductReviews",
   "/oteldemo.ProductReviewService/GetAverageProductReviewScore",
   "/oteldemo.ProductReviewService/AskProductAIAssistant",
+  "/oteldemo.ProductReviewService/GetProductReviewScoreHistogram",
+  "/oteldemo.ProductReviewService/GetProductReviewsBatch",
+  "/oteldemo.ProductReviewService/GetAverageScoresBatch",
+  "/oteldemo.ProductReviewService/GetProductReviewsPage",
+  "/oteldemo.ProductReviewService/StreamProductReviews",
 };
 
 std::unique_ptr< ProductReviewService::Stub> ProductReviewService::NewStub(const std::shared_ptr< ::grpc::ChannelInterface>& channel, const ::grpc::StubOptions& options) {
@@ -388,6 +435,11 @@ ProductReviewService::Stub::Stub(const std::shared_ptr< ::grpc::ChannelInterface
   : channel_(channel), rpcmethod_GetProductReviews_(ProductReviewService_method_names[0], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
   , rpcmethod_GetAverageProductReviewScore_(ProductReviewService_method_names[1], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
   , rpcmethod_AskProductAIAssistant_(ProductReviewService_method_names[2], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_GetProductReviewScoreHistogram_(ProductReviewService_method_names[3], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_GetProductReviewsBatch_(ProductReviewService_method_names[4], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_GetAverageScoresBatch_(ProductReviewService_method_names[5], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_GetProductReviewsPage_(ProductReviewService_method_names[6], options.suffix_for_stats(),::grpc::internal::RpcMethod::NORMAL_RPC, channel)
+  , rpcmethod_StreamProductReviews_(ProductReviewService_method_names[7], options.suffix_for_stats(),::grpc::internal::RpcMethod::SERVER_STREAMING, channel)
   {}
 
 ::grpc::Status ProductReviewService::Stub::GetProductReviews(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsRequest& request, ::oteldemo::GetProductReviewsResponse* response) {
@@ -459,6 +511,114 @@ void ProductReviewService::Stub::async::AskProductAIAssistant(::grpc::ClientCont
   return result;
 }
 
+::grpc::Status ProductReviewService::Stub::GetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::oteldemo::GetProductReviewScoreHistogramResponse* response) {
+  return ::grpc::internal::BlockingUnaryCall< ::oteldemo::GetProductReviewScoreHistogramRequest, ::oteldemo::GetProductReviewScoreHistogramResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), rpcmethod_GetProductReviewScoreHistogram_, context, request, response);
+}
+
+void ProductReviewService::Stub::async::GetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest* request, ::oteldemo::GetProductReviewScoreHistogramResponse* response, std::function<void(::grpc::Status)> f) {
+  ::grpc::internal::CallbackUnaryCall< ::oteldemo::GetProductReviewScoreHistogramRequest, ::oteldemo::GetProductReviewScoreHistogramResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_GetProductReviewScoreHistogram_, context, request, response, std::move(f));
+}
+
+void ProductReviewService::Stub::async::GetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest* request, ::oteldemo::GetProductReviewScoreHistogramResponse* response, ::grpc::ClientUnaryReactor* reactor) {
+  ::grpc::internal::ClientCallbackUnaryFactory::Create< ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_GetProductReviewScoreHistogram_, context, request, response, reactor);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewScoreHistogramResponse>* ProductReviewService::Stub::PrepareAsyncGetProductReviewScoreHistogramRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc::internal::ClientAsyncResponseReaderHelper::Create< ::oteldemo::GetProductReviewScoreHistogramResponse, ::oteldemo::GetProductReviewScoreHistogramRequest, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), cq, rpcmethod_GetProductReviewScoreHistogram_, context, request);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewScoreHistogramResponse>* ProductReviewService::Stub::AsyncGetProductReviewScoreHistogramRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq) {
+  auto* result =
+    this->PrepareAsyncGetProductReviewScoreHistogramRaw(context, request, cq);
+  result->StartCall();
+  return result;
+}
+
+::grpc::Status ProductReviewService::Stub::GetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::oteldemo::GetProductReviewsBatchResponse* response) {
+  return ::grpc::internal::BlockingUnaryCall< ::oteldemo::GetProductReviewsBatchRequest, ::oteldemo::GetProductReviewsBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), rpcmethod_GetProductReviewsBatch_, context, request, response);
+}
+
+void ProductReviewService::Stub::async::GetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest* request, ::oteldemo::GetProductReviewsBatchResponse* response, std::function<void(::grpc::Status)> f) {
+  ::grpc::internal::CallbackUnaryCall< ::oteldemo::GetProductReviewsBatchRequest, ::oteldemo::GetProductReviewsBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_GetProductReviewsBatch_, context, request, response, std::move(f));
+}
+
+void ProductReviewService::Stub::async::GetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest* request, ::oteldemo::GetProductReviewsBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) {
+  ::grpc::internal::ClientCallbackUnaryFactory::Create< ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_GetProductReviewsBatch_, context, request, response, reactor);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsBatchResponse>* ProductReviewService::Stub::PrepareAsyncGetProductReviewsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc::internal::ClientAsyncResponseReaderHelper::Create< ::oteldemo::GetProductReviewsBatchResponse, ::oteldemo::GetProductReviewsBatchRequest, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), cq, rpcmethod_GetProductReviewsBatch_, context, request);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsBatchResponse>* ProductReviewService::Stub::AsyncGetProductReviewsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+  auto* result =
+    this->PrepareAsyncGetProductReviewsBatchRaw(context, request, cq);
+  result->StartCall();
+  return result;
+}
+
+::grpc::Status ProductReviewService::Stub::GetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::oteldemo::GetAverageScoresBatchResponse* response) {
+  return ::grpc::internal::BlockingUnaryCall< ::oteldemo::GetAverageScoresBatchRequest, ::oteldemo::GetAverageScoresBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), rpcmethod_GetAverageScoresBatch_, context, request, response);
+}
+
+void ProductReviewService::Stub::async::GetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest* request, ::oteldemo::GetAverageScoresBatchResponse* response, std::function<void(::grpc::Status)> f) {
+  ::grpc::internal::CallbackUnaryCall< ::oteldemo::GetAverageScoresBatchRequest, ::oteldemo::GetAverageScoresBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_GetAverageScoresBatch_, context, request, response, std::move(f));
+}
+
+void ProductReviewService::Stub::async::GetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest* request, ::oteldemo::GetAverageScoresBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) {
+  ::grpc::internal::ClientCallbackUnaryFactory::Create< ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_GetAverageScoresBatch_, context, request, response, reactor);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::GetAverageScoresBatchResponse>* ProductReviewService::Stub::PrepareAsyncGetAverageScoresBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc::internal::ClientAsyncResponseReaderHelper::Create< ::oteldemo::GetAverageScoresBatchResponse, ::oteldemo::GetAverageScoresBatchRequest, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), cq, rpcmethod_GetAverageScoresBatch_, context, request);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::GetAverageScoresBatchResponse>* ProductReviewService::Stub::AsyncGetAverageScoresBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq) {
+  auto* result =
+    this->PrepareAsyncGetAverageScoresBatchRaw(context, request, cq);
+  result->StartCall();
+  return result;
+}
+
+::grpc::Status ProductReviewService::Stub::GetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::oteldemo::GetProductReviewsPageResponse* response) {
+  return ::grpc::internal::BlockingUnaryCall< ::oteldemo::GetProductReviewsPageRequest, ::oteldemo::GetProductReviewsPageResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), rpcmethod_GetProductReviewsPage_, context, request, response);
+}
+
+void ProductReviewService::Stub::async::GetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest* request, ::oteldemo::GetProductReviewsPageResponse* response, std::function<void(::grpc::Status)> f) {
+  ::grpc::internal::CallbackUnaryCall< ::oteldemo::GetProductReviewsPageRequest, ::oteldemo::GetProductReviewsPageResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_GetProductReviewsPage_, context, request, response, std::move(f));
+}
+
+void ProductReviewService::Stub::async::GetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest* request, ::oteldemo::GetProductReviewsPageResponse* response, ::grpc::ClientUnaryReactor* reactor) {
+  ::grpc::internal::ClientCallbackUnaryFactory::Create< ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(stub_->channel_.get(), stub_->rpcmethod_GetProductReviewsPage_, context, request, response, reactor);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsPageResponse>* ProductReviewService::Stub::PrepareAsyncGetProductReviewsPageRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc::internal::ClientAsyncResponseReaderHelper::Create< ::oteldemo::GetProductReviewsPageResponse, ::oteldemo::GetProductReviewsPageRequest, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(channel_.get(), cq, rpcmethod_GetProductReviewsPage_, context, request);
+}
+
+::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsPageResponse>* ProductReviewService::Stub::AsyncGetProductReviewsPageRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq) {
+  auto* result =
+    this->PrepareAsyncGetProductReviewsPageRaw(context, request, cq);
+  result->StartCall();
+  return result;
+}
+
+::grpc::ClientReader< ::oteldemo::ProductReview>* ProductReviewService::Stub::StreamProductReviewsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request) {
+  return ::grpc::internal::ClientReaderFactory< ::oteldemo::ProductReview>::Create(channel_.get(), rpcmethod_StreamProductReviews_, context, request);
+}
+
+void ProductReviewService::Stub::async::StreamProductReviews(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest* request, ::grpc::ClientReadReactor< ::oteldemo::ProductReview>* reactor) {
+  ::grpc::internal::ClientCallbackReaderFactory< ::oteldemo::ProductReview>::Create(stub_->channel_.get(), stub_->rpcmethod_StreamProductReviews_, context, request, reactor);
+}
+
+::grpc::ClientAsyncReader< ::oteldemo::ProductReview>* ProductReviewService::Stub::AsyncStreamProductReviewsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+  return ::grpc::internal::ClientAsyncReaderFactory< ::oteldemo::ProductReview>::Create(channel_.get(), cq, rpcmethod_StreamProductReviews_, context, request, true, tag);
+}
+
+::grpc::ClientAsyncReader< ::oteldemo::ProductReview>* ProductReviewService::Stub::PrepareAsyncStreamProductReviewsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq) {
+  return ::grpc::internal::ClientAsyncReaderFactory< ::oteldemo::ProductReview>::Create(channel_.get(), cq, rpcmethod_StreamProductReviews_, context, request, false, nullptr);
+}
+
 ProductReviewService::Service::Service() {
   AddMethod(new ::grpc::internal::RpcServiceMethod(
       ProductReviewService_method_names[0],
@@ -490,6 +650,56 @@ ProductReviewService::Service::Service() {
              ::oteldemo::AskProductAIAssistantResponse* resp) {
                return service->AskProductAIAssistant(ctx, req, resp);
              }, this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      ProductReviewService_method_names[3],
+      ::grpc::internal::RpcMethod::NORMAL_RPC,
+      new ::grpc::internal::RpcMethodHandler< ProductReviewService::Service, ::oteldemo::GetProductReviewScoreHistogramRequest, ::oteldemo::GetProductReviewScoreHistogramResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(
+          [](ProductReviewService::Service* service,
+             ::grpc::ServerContext* ctx,
+             const ::oteldemo::GetProductReviewScoreHistogramRequest* req,
+             ::oteldemo::GetProductReviewScoreHistogramResponse* resp) {
+               return service->GetProductReviewScoreHistogram(ctx, req, resp);
+             }, this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      ProductReviewService_method_names[4],
+      ::grpc::internal::RpcMethod::NORMAL_RPC,
+      new ::grpc::internal::RpcMethodHandler< ProductReviewService::Service, ::oteldemo::GetProductReviewsBatchRequest, ::oteldemo::GetProductReviewsBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(
+          [](ProductReviewService::Service* service,
+             ::grpc::ServerContext* ctx,
+             const ::oteldemo::GetProductReviewsBatchRequest* req,
+             ::oteldemo::GetProductReviewsBatchResponse* resp) {
+               return service->GetProductReviewsBatch(ctx, req, resp);
+             }, this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      ProductReviewService_method_names[5],
+      ::grpc::internal::RpcMethod::NORMAL_RPC,
+      new ::grpc::internal::RpcMethodHandler< ProductReviewService::Service, ::oteldemo::GetAverageScoresBatchRequest, ::oteldemo::GetAverageScoresBatchResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(
+          [](ProductReviewService::Service* service,
+             ::grpc::ServerContext* ctx,
+             const ::oteldemo::GetAverageScoresBatchRequest* req,
+             ::oteldemo::GetAverageScoresBatchResponse* resp) {
+               return service->GetAverageScoresBatch(ctx, req, resp);
+             }, this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      ProductReviewService_method_names[6],
+      ::grpc::internal::RpcMethod::NORMAL_RPC,
+      new ::grpc::internal::RpcMethodHandler< ProductReviewService::Service, ::oteldemo::GetProductReviewsPageRequest, ::oteldemo::GetProductReviewsPageResponse, ::grpc::protobuf::MessageLite, ::grpc::protobuf::MessageLite>(
+          [](ProductReviewService::Service* service,
+             ::grpc::ServerContext* ctx,
+             const ::oteldemo::GetProductReviewsPageRequest* req,
+             ::oteldemo::GetProductReviewsPageResponse* resp) {
+               return service->GetProductReviewsPage(ctx, req, resp);
+             }, this)));
+  AddMethod(new ::grpc::internal::RpcServiceMethod(
+      ProductReviewService_method_names[7],
+      ::grpc::internal::RpcMethod::SERVER_STREAMING,
+      new ::grpc::internal::ServerStreamingHandler< ProductReviewService::Service, ::oteldemo::StreamProductReviewsRequest, ::oteldemo::ProductReview>(
+          [](ProductReviewService::Service* service,
+             ::grpc::ServerContext* ctx,
+             const ::oteldemo::StreamProductReviewsRequest* req,
+             ::grpc::ServerWriter<::oteldemo::ProductReview>* writer) {
+               return service->StreamProductReviews(ctx, req, writer);
+             }, this)));
 }
 
 ProductReviewService::Service::~Service() {
@@ -516,6 +726,41 @@ ProductReviewService::Service::~Service() {
   return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
 }
 
+::grpc::Status ProductReviewService::Service::GetProductReviewScoreHistogram(::grpc::ServerContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest* request, ::oteldemo::GetProductReviewScoreHistogramResponse* response) {
+  (void) context;
+  (void) request;
+  (void) response;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
+::grpc::Status ProductReviewService::Service::GetProductReviewsBatch(::grpc::ServerContext* context, const ::oteldemo::GetProductReviewsBatchRequest* request, ::oteldemo::GetProductReviewsBatchResponse* response) {
+  (void) context;
+  (void) request;
+  (void) response;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
+::grpc::Status ProductReviewService::Service::GetAverageScoresBatch(::grpc::ServerContext* context, const ::oteldemo::GetAverageScoresBatchRequest* request, ::oteldemo::GetAverageScoresBatchResponse* response) {
+  (void) context;
+  (void) request;
+  (void) response;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
+::grpc::Status ProductReviewService::Service::GetProductReviewsPage(::grpc::ServerContext* context, const ::oteldemo::GetProductReviewsPageRequest* request, ::oteldemo::GetProductReviewsPageResponse* response) {
+  (void) context;
+  (void) request;
+  (void) response;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
+::grpc::Status ProductReviewService::Service::StreamProductReviews(::grpc::ServerContext* context, const ::oteldemo::StreamProductReviewsRequest* request, ::grpc::ServerWriter< ::oteldemo::ProductReview>* writer) {
+  (void) context;
+  (void) request;
+  (void) writer;
+  return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+}
+
 
 static const char* ShippingService_method_names[] = {
   "/oteldemo.ShippingService/GetQuote",
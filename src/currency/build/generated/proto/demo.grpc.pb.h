@@ -582,11 +582,20 @@ class RecommendationService final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>> PrepareAsyncListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>>(PrepareAsyncListRecommendationsRaw(context, request, cq));
     }
+    virtual ::grpc::Status ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::oteldemo::ListRecommendationsBatchResponse* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>> AsyncListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>>(AsyncListRecommendationsBatchRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>> PrepareAsyncListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>>(PrepareAsyncListRecommendationsBatchRaw(context, request, cq));
+    }
     class async_interface {
      public:
       virtual ~async_interface() {}
       virtual void ListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest* request, ::oteldemo::ListRecommendationsResponse* response, std::function<void(::grpc::Status)>) = 0;
       virtual void ListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest* request, ::oteldemo::ListRecommendationsResponse* response, ::grpc::ClientUnaryReactor* reactor) = 0;
+      virtual void ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) = 0;
     };
     typedef class async_interface experimental_async_interface;
     virtual class async_interface* async() { return nullptr; }
@@ -594,6 +603,8 @@ class RecommendationService final {
    private:
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>* AsyncListRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>* PrepareAsyncListRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>* AsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>* PrepareAsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) = 0;
   };
   class Stub final : public StubInterface {
    public:
@@ -605,11 +616,20 @@ class RecommendationService final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsResponse>> PrepareAsyncListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsResponse>>(PrepareAsyncListRecommendationsRaw(context, request, cq));
     }
+    ::grpc::Status ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::oteldemo::ListRecommendationsBatchResponse* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>> AsyncListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>>(AsyncListRecommendationsBatchRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>> PrepareAsyncListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>>(PrepareAsyncListRecommendationsBatchRaw(context, request, cq));
+    }
     class async final :
       public StubInterface::async_interface {
      public:
       void ListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest* request, ::oteldemo::ListRecommendationsResponse* response, std::function<void(::grpc::Status)>) override;
       void ListRecommendations(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest* request, ::oteldemo::ListRecommendationsResponse* response, ::grpc::ClientUnaryReactor* reactor) override;
+      void ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, std::function<void(::grpc::Status)>) override;
+      void ListRecommendationsBatch(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) override;
      private:
       friend class Stub;
       explicit async(Stub* stub): stub_(stub) { }
@@ -623,7 +643,10 @@ class RecommendationService final {
     class async async_stub_{this};
     ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsResponse>* AsyncListRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsResponse>* PrepareAsyncListRecommendationsRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>* AsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::ListRecommendationsBatchResponse>* PrepareAsyncListRecommendationsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq) override;
     const ::grpc::internal::RpcMethod rpcmethod_ListRecommendations_;
+    const ::grpc::internal::RpcMethod rpcmethod_ListRecommendationsBatch_;
   };
   static std::unique_ptr<Stub> NewStub(const std::shared_ptr< ::grpc::ChannelInterface>& channel, const ::grpc::StubOptions& options = ::grpc::StubOptions());
 
@@ -632,6 +655,7 @@ class RecommendationService final {
     Service();
     virtual ~Service();
     virtual ::grpc::Status ListRecommendations(::grpc::ServerContext* context, const ::oteldemo::ListRecommendationsRequest* request, ::oteldemo::ListRecommendationsResponse* response);
+    virtual ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response);
   };
   template <class BaseClass>
   class WithAsyncMethod_ListRecommendations : public BaseClass {
@@ -653,7 +677,27 @@ class RecommendationService final {
       ::grpc::Service::RequestAsyncUnary(0, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
-  typedef WithAsyncMethod_ListRecommendations<Service > AsyncService;
+  template <class BaseClass>
+  class WithAsyncMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodAsync(1);
+    }
+    ~WithAsyncMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestListRecommendationsBatch(::grpc::ServerContext* context, ::oteldemo::ListRecommendationsBatchRequest* request, ::grpc::ServerAsyncResponseWriter< ::oteldemo::ListRecommendationsBatchResponse>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(1, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  typedef WithAsyncMethod_ListRecommendations<WithAsyncMethod_ListRecommendationsBatch<Service > > AsyncService;
   template <class BaseClass>
   class WithCallbackMethod_ListRecommendations : public BaseClass {
    private:
@@ -681,7 +725,34 @@ class RecommendationService final {
     virtual ::grpc::ServerUnaryReactor* ListRecommendations(
       ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::ListRecommendationsRequest* /*request*/, ::oteldemo::ListRecommendationsResponse* /*response*/)  { return nullptr; }
   };
-  typedef WithCallbackMethod_ListRecommendations<Service > CallbackService;
+  template <class BaseClass>
+  class WithCallbackMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithCallbackMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodCallback(1,
+          new ::grpc::internal::CallbackUnaryHandler< ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::oteldemo::ListRecommendationsBatchRequest* request, ::oteldemo::ListRecommendationsBatchResponse* response) { return this->ListRecommendationsBatch(context, request, response); }));}
+    void SetMessageAllocatorFor_ListRecommendationsBatch(
+        ::grpc::MessageAllocator< ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse>* allocator) {
+      ::grpc::internal::MethodHandler* const handler = ::grpc::Service::GetHandler(1);
+      static_cast<::grpc::internal::CallbackUnaryHandler< ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse>*>(handler)
+              ->SetMessageAllocator(allocator);
+    }
+    ~WithCallbackMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerUnaryReactor* ListRecommendationsBatch(
+      ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/)  { return nullptr; }
+  };
+  typedef WithCallbackMethod_ListRecommendations<WithCallbackMethod_ListRecommendationsBatch<Service > > CallbackService;
   typedef CallbackService ExperimentalCallbackService;
   template <class BaseClass>
   class WithGenericMethod_ListRecommendations : public BaseClass {
@@ -701,6 +772,23 @@ class RecommendationService final {
     }
   };
   template <class BaseClass>
+  class WithGenericMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodGeneric(1);
+    }
+    ~WithGenericMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
   class WithRawMethod_ListRecommendations : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
@@ -721,6 +809,26 @@ class RecommendationService final {
     }
   };
   template <class BaseClass>
+  class WithRawMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodRaw(1);
+    }
+    ~WithRawMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestListRecommendationsBatch(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(1, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
   class WithRawCallbackMethod_ListRecommendations : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
@@ -743,6 +851,28 @@ class RecommendationService final {
       ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/)  { return nullptr; }
   };
   template <class BaseClass>
+  class WithRawCallbackMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawCallbackMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodRawCallback(1,
+          new ::grpc::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->ListRecommendationsBatch(context, request, response); }));
+    }
+    ~WithRawCallbackMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerUnaryReactor* ListRecommendationsBatch(
+      ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/)  { return nullptr; }
+  };
+  template <class BaseClass>
   class WithStreamedUnaryMethod_ListRecommendations : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
@@ -769,9 +899,36 @@ class RecommendationService final {
     // replace default version of method with streamed unary
     virtual ::grpc::Status StreamedListRecommendations(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::oteldemo::ListRecommendationsRequest,::oteldemo::ListRecommendationsResponse>* server_unary_streamer) = 0;
   };
-  typedef WithStreamedUnaryMethod_ListRecommendations<Service > StreamedUnaryService;
+  template <class BaseClass>
+  class WithStreamedUnaryMethod_ListRecommendationsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithStreamedUnaryMethod_ListRecommendationsBatch() {
+      ::grpc::Service::MarkMethodStreamed(1,
+        new ::grpc::internal::StreamedUnaryHandler<
+          ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse>(
+            [this](::grpc::ServerContext* context,
+                   ::grpc::ServerUnaryStreamer<
+                     ::oteldemo::ListRecommendationsBatchRequest, ::oteldemo::ListRecommendationsBatchResponse>* streamer) {
+                       return this->StreamedListRecommendationsBatch(context,
+                         streamer);
+                  }));
+    }
+    ~WithStreamedUnaryMethod_ListRecommendationsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status ListRecommendationsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::ListRecommendationsBatchRequest* /*request*/, ::oteldemo::ListRecommendationsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with streamed unary
+    virtual ::grpc::Status StreamedListRecommendationsBatch(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::oteldemo::ListRecommendationsBatchRequest,::oteldemo::ListRecommendationsBatchResponse>* server_unary_streamer) = 0;
+  };
+  typedef WithStreamedUnaryMethod_ListRecommendations<WithStreamedUnaryMethod_ListRecommendationsBatch<Service > > StreamedUnaryService;
   typedef Service SplitStreamedService;
-  typedef WithStreamedUnaryMethod_ListRecommendations<Service > StreamedService;
+  typedef WithStreamedUnaryMethod_ListRecommendations<WithStreamedUnaryMethod_ListRecommendationsBatch<Service > > StreamedService;
 };
 
 // ---------------Product Catalog----------------
@@ -1328,6 +1485,43 @@ class ProductReviewService final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::AskProductAIAssistantResponse>> PrepareAsyncAskProductAIAssistant(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::AskProductAIAssistantResponse>>(PrepareAsyncAskProductAIAssistantRaw(context, request, cq));
     }
+    virtual ::grpc::Status GetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::oteldemo::GetProductReviewScoreHistogramResponse* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewScoreHistogramResponse>> AsyncGetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewScoreHistogramResponse>>(AsyncGetProductReviewScoreHistogramRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewScoreHistogramResponse>> PrepareAsyncGetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewScoreHistogramResponse>>(PrepareAsyncGetProductReviewScoreHistogramRaw(context, request, cq));
+    }
+    virtual ::grpc::Status GetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::oteldemo::GetProductReviewsBatchResponse* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsBatchResponse>> AsyncGetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsBatchResponse>>(AsyncGetProductReviewsBatchRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsBatchResponse>> PrepareAsyncGetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsBatchResponse>>(PrepareAsyncGetProductReviewsBatchRaw(context, request, cq));
+    }
+    virtual ::grpc::Status GetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::oteldemo::GetAverageScoresBatchResponse* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetAverageScoresBatchResponse>> AsyncGetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetAverageScoresBatchResponse>>(AsyncGetAverageScoresBatchRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetAverageScoresBatchResponse>> PrepareAsyncGetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetAverageScoresBatchResponse>>(PrepareAsyncGetAverageScoresBatchRaw(context, request, cq));
+    }
+    virtual ::grpc::Status GetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::oteldemo::GetProductReviewsPageResponse* response) = 0;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsPageResponse>> AsyncGetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsPageResponse>>(AsyncGetProductReviewsPageRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsPageResponse>> PrepareAsyncGetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsPageResponse>>(PrepareAsyncGetProductReviewsPageRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientReaderInterface< ::oteldemo::ProductReview>> StreamProductReviews(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request) {
+      return std::unique_ptr< ::grpc::ClientReaderInterface< ::oteldemo::ProductReview>>(StreamProductReviewsRaw(context, request));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::oteldemo::ProductReview>> AsyncStreamProductReviews(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::oteldemo::ProductReview>>(AsyncStreamProductReviewsRaw(context, request, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::oteldemo::ProductReview>> PrepareAsyncStreamProductReviews(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReaderInterface< ::oteldemo::ProductReview>>(PrepareAsyncStreamProductReviewsRaw(context, request, cq));
+    }
     class async_interface {
      public:
       virtual ~async_interface() {}
@@ -1337,6 +1531,15 @@ class ProductReviewService final {
       virtual void GetAverageProductReviewScore(::grpc::ClientContext* context, const ::oteldemo::GetAverageProductReviewScoreRequest* request, ::oteldemo::GetAverageProductReviewScoreResponse* response, ::grpc::ClientUnaryReactor* reactor) = 0;
       virtual void AskProductAIAssistant(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest* request, ::oteldemo::AskProductAIAssistantResponse* response, std::function<void(::grpc::Status)>) = 0;
       virtual void AskProductAIAssistant(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest* request, ::oteldemo::AskProductAIAssistantResponse* response, ::grpc::ClientUnaryReactor* reactor) = 0;
+      virtual void GetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest* request, ::oteldemo::GetProductReviewScoreHistogramResponse* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void GetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest* request, ::oteldemo::GetProductReviewScoreHistogramResponse* response, ::grpc::ClientUnaryReactor* reactor) = 0;
+      virtual void GetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest* request, ::oteldemo::GetProductReviewsBatchResponse* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void GetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest* request, ::oteldemo::GetProductReviewsBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) = 0;
+      virtual void GetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest* request, ::oteldemo::GetAverageScoresBatchResponse* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void GetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest* request, ::oteldemo::GetAverageScoresBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) = 0;
+      virtual void GetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest* request, ::oteldemo::GetProductReviewsPageResponse* response, std::function<void(::grpc::Status)>) = 0;
+      virtual void GetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest* request, ::oteldemo::GetProductReviewsPageResponse* response, ::grpc::ClientUnaryReactor* reactor) = 0;
+      virtual void StreamProductReviews(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest* request, ::grpc::ClientReadReactor< ::oteldemo::ProductReview>* reactor) = 0;
     };
     typedef class async_interface experimental_async_interface;
     virtual class async_interface* async() { return nullptr; }
@@ -1348,6 +1551,17 @@ class ProductReviewService final {
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetAverageProductReviewScoreResponse>* PrepareAsyncGetAverageProductReviewScoreRaw(::grpc::ClientContext* context, const ::oteldemo::GetAverageProductReviewScoreRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::AskProductAIAssistantResponse>* AsyncAskProductAIAssistantRaw(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest& request, ::grpc::CompletionQueue* cq) = 0;
     virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::AskProductAIAssistantResponse>* PrepareAsyncAskProductAIAssistantRaw(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewScoreHistogramResponse>* AsyncGetProductReviewScoreHistogramRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewScoreHistogramResponse>* PrepareAsyncGetProductReviewScoreHistogramRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsBatchResponse>* AsyncGetProductReviewsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsBatchResponse>* PrepareAsyncGetProductReviewsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetAverageScoresBatchResponse>* AsyncGetAverageScoresBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetAverageScoresBatchResponse>* PrepareAsyncGetAverageScoresBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsPageResponse>* AsyncGetProductReviewsPageRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsPageResponse>* PrepareAsyncGetProductReviewsPageRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq) = 0;
+    virtual ::grpc::ClientReaderInterface< ::oteldemo::ProductReview>* StreamProductReviewsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request) = 0;
+    virtual ::grpc::ClientAsyncReaderInterface< ::oteldemo::ProductReview>* AsyncStreamProductReviewsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq, void* tag) = 0;
+    virtual ::grpc::ClientAsyncReaderInterface< ::oteldemo::ProductReview>* PrepareAsyncStreamProductReviewsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq) = 0;
   };
   class Stub final : public StubInterface {
    public:
@@ -1373,6 +1587,43 @@ class ProductReviewService final {
     std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::AskProductAIAssistantResponse>> PrepareAsyncAskProductAIAssistant(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest& request, ::grpc::CompletionQueue* cq) {
       return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::AskProductAIAssistantResponse>>(PrepareAsyncAskProductAIAssistantRaw(context, request, cq));
     }
+    ::grpc::Status GetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::oteldemo::GetProductReviewScoreHistogramResponse* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewScoreHistogramResponse>> AsyncGetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewScoreHistogramResponse>>(AsyncGetProductReviewScoreHistogramRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewScoreHistogramResponse>> PrepareAsyncGetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewScoreHistogramResponse>>(PrepareAsyncGetProductReviewScoreHistogramRaw(context, request, cq));
+    }
+    ::grpc::Status GetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::oteldemo::GetProductReviewsBatchResponse* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsBatchResponse>> AsyncGetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsBatchResponse>>(AsyncGetProductReviewsBatchRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsBatchResponse>> PrepareAsyncGetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsBatchResponse>>(PrepareAsyncGetProductReviewsBatchRaw(context, request, cq));
+    }
+    ::grpc::Status GetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::oteldemo::GetAverageScoresBatchResponse* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetAverageScoresBatchResponse>> AsyncGetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetAverageScoresBatchResponse>>(AsyncGetAverageScoresBatchRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetAverageScoresBatchResponse>> PrepareAsyncGetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetAverageScoresBatchResponse>>(PrepareAsyncGetAverageScoresBatchRaw(context, request, cq));
+    }
+    ::grpc::Status GetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::oteldemo::GetProductReviewsPageResponse* response) override;
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsPageResponse>> AsyncGetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsPageResponse>>(AsyncGetProductReviewsPageRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsPageResponse>> PrepareAsyncGetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsPageResponse>>(PrepareAsyncGetProductReviewsPageRaw(context, request, cq));
+    }
+    std::unique_ptr< ::grpc::ClientReader< ::oteldemo::ProductReview>> StreamProductReviews(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request) {
+      return std::unique_ptr< ::grpc::ClientReader< ::oteldemo::ProductReview>>(StreamProductReviewsRaw(context, request));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReader< ::oteldemo::ProductReview>> AsyncStreamProductReviews(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq, void* tag) {
+      return std::unique_ptr< ::grpc::ClientAsyncReader< ::oteldemo::ProductReview>>(AsyncStreamProductReviewsRaw(context, request, cq, tag));
+    }
+    std::unique_ptr< ::grpc::ClientAsyncReader< ::oteldemo::ProductReview>> PrepareAsyncStreamProductReviews(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq) {
+      return std::unique_ptr< ::grpc::ClientAsyncReader< ::oteldemo::ProductReview>>(PrepareAsyncStreamProductReviewsRaw(context, request, cq));
+    }
     class async final :
       public StubInterface::async_interface {
      public:
@@ -1382,6 +1633,15 @@ class ProductReviewService final {
       void GetAverageProductReviewScore(::grpc::ClientContext* context, const ::oteldemo::GetAverageProductReviewScoreRequest* request, ::oteldemo::GetAverageProductReviewScoreResponse* response, ::grpc::ClientUnaryReactor* reactor) override;
       void AskProductAIAssistant(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest* request, ::oteldemo::AskProductAIAssistantResponse* response, std::function<void(::grpc::Status)>) override;
       void AskProductAIAssistant(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest* request, ::oteldemo::AskProductAIAssistantResponse* response, ::grpc::ClientUnaryReactor* reactor) override;
+      void GetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest* request, ::oteldemo::GetProductReviewScoreHistogramResponse* response, std::function<void(::grpc::Status)>) override;
+      void GetProductReviewScoreHistogram(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest* request, ::oteldemo::GetProductReviewScoreHistogramResponse* response, ::grpc::ClientUnaryReactor* reactor) override;
+      void GetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest* request, ::oteldemo::GetProductReviewsBatchResponse* response, std::function<void(::grpc::Status)>) override;
+      void GetProductReviewsBatch(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest* request, ::oteldemo::GetProductReviewsBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) override;
+      void GetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest* request, ::oteldemo::GetAverageScoresBatchResponse* response, std::function<void(::grpc::Status)>) override;
+      void GetAverageScoresBatch(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest* request, ::oteldemo::GetAverageScoresBatchResponse* response, ::grpc::ClientUnaryReactor* reactor) override;
+      void GetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest* request, ::oteldemo::GetProductReviewsPageResponse* response, std::function<void(::grpc::Status)>) override;
+      void GetProductReviewsPage(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest* request, ::oteldemo::GetProductReviewsPageResponse* response, ::grpc::ClientUnaryReactor* reactor) override;
+      void StreamProductReviews(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest* request, ::grpc::ClientReadReactor< ::oteldemo::ProductReview>* reactor) override;
      private:
       friend class Stub;
       explicit async(Stub* stub): stub_(stub) { }
@@ -1399,9 +1659,25 @@ class ProductReviewService final {
     ::grpc::ClientAsyncResponseReader< ::oteldemo::GetAverageProductReviewScoreResponse>* PrepareAsyncGetAverageProductReviewScoreRaw(::grpc::ClientContext* context, const ::oteldemo::GetAverageProductReviewScoreRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::oteldemo::AskProductAIAssistantResponse>* AsyncAskProductAIAssistantRaw(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest& request, ::grpc::CompletionQueue* cq) override;
     ::grpc::ClientAsyncResponseReader< ::oteldemo::AskProductAIAssistantResponse>* PrepareAsyncAskProductAIAssistantRaw(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewScoreHistogramResponse>* AsyncGetProductReviewScoreHistogramRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewScoreHistogramResponse>* PrepareAsyncGetProductReviewScoreHistogramRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsBatchResponse>* AsyncGetProductReviewsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsBatchResponse>* PrepareAsyncGetProductReviewsBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::GetAverageScoresBatchResponse>* AsyncGetAverageScoresBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::GetAverageScoresBatchResponse>* PrepareAsyncGetAverageScoresBatchRaw(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsPageResponse>* AsyncGetProductReviewsPageRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientAsyncResponseReader< ::oteldemo::GetProductReviewsPageResponse>* PrepareAsyncGetProductReviewsPageRaw(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq) override;
+    ::grpc::ClientReader< ::oteldemo::ProductReview>* StreamProductReviewsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request) override;
+    ::grpc::ClientAsyncReader< ::oteldemo::ProductReview>* AsyncStreamProductReviewsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq, void* tag) override;
+    ::grpc::ClientAsyncReader< ::oteldemo::ProductReview>* PrepareAsyncStreamProductReviewsRaw(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq) override;
     const ::grpc::internal::RpcMethod rpcmethod_GetProductReviews_;
     const ::grpc::internal::RpcMethod rpcmethod_GetAverageProductReviewScore_;
     const ::grpc::internal::RpcMethod rpcmethod_AskProductAIAssistant_;
+    const ::grpc::internal::RpcMethod rpcmethod_GetProductReviewScoreHistogram_;
+    const ::grpc::internal::RpcMethod rpcmethod_GetProductReviewsBatch_;
+    const ::grpc::internal::RpcMethod rpcmethod_GetAverageScoresBatch_;
+    const ::grpc::internal::RpcMethod rpcmethod_GetProductReviewsPage_;
+    const ::grpc::internal::RpcMethod rpcmethod_StreamProductReviews_;
   };
   static std::unique_ptr<Stub> NewStub(const std::shared_ptr< ::grpc::ChannelInterface>& channel, const ::grpc::StubOptions& options = ::grpc::StubOptions());
 
@@ -1412,6 +1688,11 @@ class ProductReviewService final {
     virtual ::grpc::Status GetProductReviews(::grpc::ServerContext* context, const ::oteldemo::GetProductReviewsRequest* request, ::oteldemo::GetProductReviewsResponse* response);
     virtual ::grpc::Status GetAverageProductReviewScore(::grpc::ServerContext* context, const ::oteldemo::GetAverageProductReviewScoreRequest* request, ::oteldemo::GetAverageProductReviewScoreResponse* response);
     virtual ::grpc::Status AskProductAIAssistant(::grpc::ServerContext* context, const ::oteldemo::AskProductAIAssistantRequest* request, ::oteldemo::AskProductAIAssistantResponse* response);
+    virtual ::grpc::Status GetProductReviewScoreHistogram(::grpc::ServerContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest* request, ::oteldemo::GetProductReviewScoreHistogramResponse* response);
+    virtual ::grpc::Status GetProductReviewsBatch(::grpc::ServerContext* context, const ::oteldemo::GetProductReviewsBatchRequest* request, ::oteldemo::GetProductReviewsBatchResponse* response);
+    virtual ::grpc::Status GetAverageScoresBatch(::grpc::ServerContext* context, const ::oteldemo::GetAverageScoresBatchRequest* request, ::oteldemo::GetAverageScoresBatchResponse* response);
+    virtual ::grpc::Status GetProductReviewsPage(::grpc::ServerContext* context, const ::oteldemo::GetProductReviewsPageRequest* request, ::oteldemo::GetProductReviewsPageResponse* response);
+    virtual ::grpc::Status StreamProductReviews(::grpc::ServerContext* context, const ::oteldemo::StreamProductReviewsRequest* request, ::grpc::ServerWriter< ::oteldemo::ProductReview>* writer);
   };
   template <class BaseClass>
   class WithAsyncMethod_GetProductReviews : public BaseClass {
@@ -1473,7 +1754,107 @@ class ProductReviewService final {
       ::grpc::Service::RequestAsyncUnary(2, context, request, response, new_call_cq, notification_cq, tag);
     }
   };
-  typedef WithAsyncMethod_GetProductReviews<WithAsyncMethod_GetAverageProductReviewScore<WithAsyncMethod_AskProductAIAssistant<Service > > > AsyncService;
+  template <class BaseClass>
+  class WithAsyncMethod_GetProductReviewScoreHistogram : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_GetProductReviewScoreHistogram() {
+      ::grpc::Service::MarkMethodAsync(3);
+    }
+    ~WithAsyncMethod_GetProductReviewScoreHistogram() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewScoreHistogram(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewScoreHistogramRequest* /*request*/, ::oteldemo::GetProductReviewScoreHistogramResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestGetProductReviewScoreHistogram(::grpc::ServerContext* context, ::oteldemo::GetProductReviewScoreHistogramRequest* request, ::grpc::ServerAsyncResponseWriter< ::oteldemo::GetProductReviewScoreHistogramResponse>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(3, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_GetProductReviewsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_GetProductReviewsBatch() {
+      ::grpc::Service::MarkMethodAsync(4);
+    }
+    ~WithAsyncMethod_GetProductReviewsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsBatchRequest* /*request*/, ::oteldemo::GetProductReviewsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestGetProductReviewsBatch(::grpc::ServerContext* context, ::oteldemo::GetProductReviewsBatchRequest* request, ::grpc::ServerAsyncResponseWriter< ::oteldemo::GetProductReviewsBatchResponse>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(4, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_GetAverageScoresBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_GetAverageScoresBatch() {
+      ::grpc::Service::MarkMethodAsync(5);
+    }
+    ~WithAsyncMethod_GetAverageScoresBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetAverageScoresBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetAverageScoresBatchRequest* /*request*/, ::oteldemo::GetAverageScoresBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestGetAverageScoresBatch(::grpc::ServerContext* context, ::oteldemo::GetAverageScoresBatchRequest* request, ::grpc::ServerAsyncResponseWriter< ::oteldemo::GetAverageScoresBatchResponse>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(5, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_GetProductReviewsPage : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_GetProductReviewsPage() {
+      ::grpc::Service::MarkMethodAsync(6);
+    }
+    ~WithAsyncMethod_GetProductReviewsPage() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewsPage(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsPageRequest* /*request*/, ::oteldemo::GetProductReviewsPageResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestGetProductReviewsPage(::grpc::ServerContext* context, ::oteldemo::GetProductReviewsPageRequest* request, ::grpc::ServerAsyncResponseWriter< ::oteldemo::GetProductReviewsPageResponse>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(6, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithAsyncMethod_StreamProductReviews : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithAsyncMethod_StreamProductReviews() {
+      ::grpc::Service::MarkMethodAsync(7);
+    }
+    ~WithAsyncMethod_StreamProductReviews() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status StreamProductReviews(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamProductReviewsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::ProductReview>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestStreamProductReviews(::grpc::ServerContext* context, ::oteldemo::StreamProductReviewsRequest* request, ::grpc::ServerAsyncWriter< ::oteldemo::ProductReview>* writer, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncServerStreaming(7, context, request, writer, new_call_cq, notification_cq, tag);
+    }
+  };
+  typedef WithAsyncMethod_GetProductReviews<WithAsyncMethod_GetAverageProductReviewScore<WithAsyncMethod_AskProductAIAssistant<WithAsyncMethod_GetProductReviewScoreHistogram<WithAsyncMethod_GetProductReviewsBatch<WithAsyncMethod_GetAverageScoresBatch<WithAsyncMethod_GetProductReviewsPage<WithAsyncMethod_StreamProductReviews<Service > > > > > > > > AsyncService;
   template <class BaseClass>
   class WithCallbackMethod_GetProductReviews : public BaseClass {
    private:
@@ -1555,130 +1936,445 @@ class ProductReviewService final {
     virtual ::grpc::ServerUnaryReactor* AskProductAIAssistant(
       ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::AskProductAIAssistantRequest* /*request*/, ::oteldemo::AskProductAIAssistantResponse* /*response*/)  { return nullptr; }
   };
-  typedef WithCallbackMethod_GetProductReviews<WithCallbackMethod_GetAverageProductReviewScore<WithCallbackMethod_AskProductAIAssistant<Service > > > CallbackService;
-  typedef CallbackService ExperimentalCallbackService;
   template <class BaseClass>
-  class WithGenericMethod_GetProductReviews : public BaseClass {
+  class WithCallbackMethod_GetProductReviewScoreHistogram : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithGenericMethod_GetProductReviews() {
-      ::grpc::Service::MarkMethodGeneric(0);
+    WithCallbackMethod_GetProductReviewScoreHistogram() {
+      ::grpc::Service::MarkMethodCallback(3,
+          new ::grpc::internal::CallbackUnaryHandler< ::oteldemo::GetProductReviewScoreHistogramRequest, ::oteldemo::GetProductReviewScoreHistogramResponse>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest* request, ::oteldemo::GetProductReviewScoreHistogramResponse* response) { return this->GetProductReviewScoreHistogram(context, request, response); }));}
+    void SetMessageAllocatorFor_GetProductReviewScoreHistogram(
+        ::grpc::MessageAllocator< ::oteldemo::GetProductReviewScoreHistogramRequest, ::oteldemo::GetProductReviewScoreHistogramResponse>* allocator) {
+      ::grpc::internal::MethodHandler* const handler = ::grpc::Service::GetHandler(3);
+      static_cast<::grpc::internal::CallbackUnaryHandler< ::oteldemo::GetProductReviewScoreHistogramRequest, ::oteldemo::GetProductReviewScoreHistogramResponse>*>(handler)
+              ->SetMessageAllocator(allocator);
     }
-    ~WithGenericMethod_GetProductReviews() override {
+    ~WithCallbackMethod_GetProductReviewScoreHistogram() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status GetProductReviews(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsRequest* /*request*/, ::oteldemo::GetProductReviewsResponse* /*response*/) override {
+    ::grpc::Status GetProductReviewScoreHistogram(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewScoreHistogramRequest* /*request*/, ::oteldemo::GetProductReviewScoreHistogramResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
+    virtual ::grpc::ServerUnaryReactor* GetProductReviewScoreHistogram(
+      ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::GetProductReviewScoreHistogramRequest* /*request*/, ::oteldemo::GetProductReviewScoreHistogramResponse* /*response*/)  { return nullptr; }
   };
   template <class BaseClass>
-  class WithGenericMethod_GetAverageProductReviewScore : public BaseClass {
+  class WithCallbackMethod_GetProductReviewsBatch : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithGenericMethod_GetAverageProductReviewScore() {
-      ::grpc::Service::MarkMethodGeneric(1);
+    WithCallbackMethod_GetProductReviewsBatch() {
+      ::grpc::Service::MarkMethodCallback(4,
+          new ::grpc::internal::CallbackUnaryHandler< ::oteldemo::GetProductReviewsBatchRequest, ::oteldemo::GetProductReviewsBatchResponse>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::oteldemo::GetProductReviewsBatchRequest* request, ::oteldemo::GetProductReviewsBatchResponse* response) { return this->GetProductReviewsBatch(context, request, response); }));}
+    void SetMessageAllocatorFor_GetProductReviewsBatch(
+        ::grpc::MessageAllocator< ::oteldemo::GetProductReviewsBatchRequest, ::oteldemo::GetProductReviewsBatchResponse>* allocator) {
+      ::grpc::internal::MethodHandler* const handler = ::grpc::Service::GetHandler(4);
+      static_cast<::grpc::internal::CallbackUnaryHandler< ::oteldemo::GetProductReviewsBatchRequest, ::oteldemo::GetProductReviewsBatchResponse>*>(handler)
+              ->SetMessageAllocator(allocator);
     }
-    ~WithGenericMethod_GetAverageProductReviewScore() override {
+    ~WithCallbackMethod_GetProductReviewsBatch() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status GetAverageProductReviewScore(::grpc::ServerContext* /*context*/, const ::oteldemo::GetAverageProductReviewScoreRequest* /*request*/, ::oteldemo::GetAverageProductReviewScoreResponse* /*response*/) override {
+    ::grpc::Status GetProductReviewsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsBatchRequest* /*request*/, ::oteldemo::GetProductReviewsBatchResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
+    virtual ::grpc::ServerUnaryReactor* GetProductReviewsBatch(
+      ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::GetProductReviewsBatchRequest* /*request*/, ::oteldemo::GetProductReviewsBatchResponse* /*response*/)  { return nullptr; }
   };
   template <class BaseClass>
-  class WithGenericMethod_AskProductAIAssistant : public BaseClass {
+  class WithCallbackMethod_GetAverageScoresBatch : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithGenericMethod_AskProductAIAssistant() {
-      ::grpc::Service::MarkMethodGeneric(2);
+    WithCallbackMethod_GetAverageScoresBatch() {
+      ::grpc::Service::MarkMethodCallback(5,
+          new ::grpc::internal::CallbackUnaryHandler< ::oteldemo::GetAverageScoresBatchRequest, ::oteldemo::GetAverageScoresBatchResponse>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::oteldemo::GetAverageScoresBatchRequest* request, ::oteldemo::GetAverageScoresBatchResponse* response) { return this->GetAverageScoresBatch(context, request, response); }));}
+    void SetMessageAllocatorFor_GetAverageScoresBatch(
+        ::grpc::MessageAllocator< ::oteldemo::GetAverageScoresBatchRequest, ::oteldemo::GetAverageScoresBatchResponse>* allocator) {
+      ::grpc::internal::MethodHandler* const handler = ::grpc::Service::GetHandler(5);
+      static_cast<::grpc::internal::CallbackUnaryHandler< ::oteldemo::GetAverageScoresBatchRequest, ::oteldemo::GetAverageScoresBatchResponse>*>(handler)
+              ->SetMessageAllocator(allocator);
     }
-    ~WithGenericMethod_AskProductAIAssistant() override {
+    ~WithCallbackMethod_GetAverageScoresBatch() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status AskProductAIAssistant(::grpc::ServerContext* /*context*/, const ::oteldemo::AskProductAIAssistantRequest* /*request*/, ::oteldemo::AskProductAIAssistantResponse* /*response*/) override {
+    ::grpc::Status GetAverageScoresBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetAverageScoresBatchRequest* /*request*/, ::oteldemo::GetAverageScoresBatchResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
+    virtual ::grpc::ServerUnaryReactor* GetAverageScoresBatch(
+      ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::GetAverageScoresBatchRequest* /*request*/, ::oteldemo::GetAverageScoresBatchResponse* /*response*/)  { return nullptr; }
   };
   template <class BaseClass>
-  class WithRawMethod_GetProductReviews : public BaseClass {
+  class WithCallbackMethod_GetProductReviewsPage : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_GetProductReviews() {
-      ::grpc::Service::MarkMethodRaw(0);
+    WithCallbackMethod_GetProductReviewsPage() {
+      ::grpc::Service::MarkMethodCallback(6,
+          new ::grpc::internal::CallbackUnaryHandler< ::oteldemo::GetProductReviewsPageRequest, ::oteldemo::GetProductReviewsPageResponse>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::oteldemo::GetProductReviewsPageRequest* request, ::oteldemo::GetProductReviewsPageResponse* response) { return this->GetProductReviewsPage(context, request, response); }));}
+    void SetMessageAllocatorFor_GetProductReviewsPage(
+        ::grpc::MessageAllocator< ::oteldemo::GetProductReviewsPageRequest, ::oteldemo::GetProductReviewsPageResponse>* allocator) {
+      ::grpc::internal::MethodHandler* const handler = ::grpc::Service::GetHandler(6);
+      static_cast<::grpc::internal::CallbackUnaryHandler< ::oteldemo::GetProductReviewsPageRequest, ::oteldemo::GetProductReviewsPageResponse>*>(handler)
+              ->SetMessageAllocator(allocator);
     }
-    ~WithRawMethod_GetProductReviews() override {
+    ~WithCallbackMethod_GetProductReviewsPage() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status GetProductReviews(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsRequest* /*request*/, ::oteldemo::GetProductReviewsResponse* /*response*/) override {
+    ::grpc::Status GetProductReviewsPage(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsPageRequest* /*request*/, ::oteldemo::GetProductReviewsPageResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestGetProductReviews(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(0, context, request, response, new_call_cq, notification_cq, tag);
-    }
+    virtual ::grpc::ServerUnaryReactor* GetProductReviewsPage(
+      ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::GetProductReviewsPageRequest* /*request*/, ::oteldemo::GetProductReviewsPageResponse* /*response*/)  { return nullptr; }
   };
   template <class BaseClass>
-  class WithRawMethod_GetAverageProductReviewScore : public BaseClass {
+  class WithCallbackMethod_StreamProductReviews : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_GetAverageProductReviewScore() {
-      ::grpc::Service::MarkMethodRaw(1);
+    WithCallbackMethod_StreamProductReviews() {
+      ::grpc::Service::MarkMethodCallback(7,
+          new ::grpc::internal::CallbackServerStreamingHandler< ::oteldemo::StreamProductReviewsRequest, ::oteldemo::ProductReview>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::oteldemo::StreamProductReviewsRequest* request) { return this->StreamProductReviews(context, request); }));
     }
-    ~WithRawMethod_GetAverageProductReviewScore() override {
+    ~WithCallbackMethod_StreamProductReviews() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status GetAverageProductReviewScore(::grpc::ServerContext* /*context*/, const ::oteldemo::GetAverageProductReviewScoreRequest* /*request*/, ::oteldemo::GetAverageProductReviewScoreResponse* /*response*/) override {
+    ::grpc::Status StreamProductReviews(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamProductReviewsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::ProductReview>* /*writer*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestGetAverageProductReviewScore(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(1, context, request, response, new_call_cq, notification_cq, tag);
-    }
+    virtual ::grpc::ServerWriteReactor< ::oteldemo::ProductReview>* StreamProductReviews(
+      ::grpc::CallbackServerContext* /*context*/, const ::oteldemo::StreamProductReviewsRequest* /*request*/)  { return nullptr; }
   };
+  typedef WithCallbackMethod_GetProductReviews<WithCallbackMethod_GetAverageProductReviewScore<WithCallbackMethod_AskProductAIAssistant<WithCallbackMethod_GetProductReviewScoreHistogram<WithCallbackMethod_GetProductReviewsBatch<WithCallbackMethod_GetAverageScoresBatch<WithCallbackMethod_GetProductReviewsPage<WithCallbackMethod_StreamProductReviews<Service > > > > > > > > CallbackService;
+  typedef CallbackService ExperimentalCallbackService;
   template <class BaseClass>
-  class WithRawMethod_AskProductAIAssistant : public BaseClass {
+  class WithGenericMethod_GetProductReviews : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawMethod_AskProductAIAssistant() {
-      ::grpc::Service::MarkMethodRaw(2);
+    WithGenericMethod_GetProductReviews() {
+      ::grpc::Service::MarkMethodGeneric(0);
     }
-    ~WithRawMethod_AskProductAIAssistant() override {
+    ~WithGenericMethod_GetProductReviews() override {
       BaseClassMustBeDerivedFromService(this);
     }
     // disable synchronous version of this method
-    ::grpc::Status AskProductAIAssistant(::grpc::ServerContext* /*context*/, const ::oteldemo::AskProductAIAssistantRequest* /*request*/, ::oteldemo::AskProductAIAssistantResponse* /*response*/) override {
+    ::grpc::Status GetProductReviews(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsRequest* /*request*/, ::oteldemo::GetProductReviewsResponse* /*response*/) override {
       abort();
       return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
     }
-    void RequestAskProductAIAssistant(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
-      ::grpc::Service::RequestAsyncUnary(2, context, request, response, new_call_cq, notification_cq, tag);
-    }
   };
   template <class BaseClass>
-  class WithRawCallbackMethod_GetProductReviews : public BaseClass {
+  class WithGenericMethod_GetAverageProductReviewScore : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
    public:
-    WithRawCallbackMethod_GetProductReviews() {
-      ::grpc::Service::MarkMethodRawCallback(0,
-          new ::grpc::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
-            [this](
-                   ::grpc::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->GetProductReviews(context, request, response); }));
-    }
+    WithGenericMethod_GetAverageProductReviewScore() {
+      ::grpc::Service::MarkMethodGeneric(1);
+    }
+    ~WithGenericMethod_GetAverageProductReviewScore() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetAverageProductReviewScore(::grpc::ServerContext* /*context*/, const ::oteldemo::GetAverageProductReviewScoreRequest* /*request*/, ::oteldemo::GetAverageProductReviewScoreResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithGenericMethod_AskProductAIAssistant : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_AskProductAIAssistant() {
+      ::grpc::Service::MarkMethodGeneric(2);
+    }
+    ~WithGenericMethod_AskProductAIAssistant() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status AskProductAIAssistant(::grpc::ServerContext* /*context*/, const ::oteldemo::AskProductAIAssistantRequest* /*request*/, ::oteldemo::AskProductAIAssistantResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithGenericMethod_GetProductReviewScoreHistogram : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_GetProductReviewScoreHistogram() {
+      ::grpc::Service::MarkMethodGeneric(3);
+    }
+    ~WithGenericMethod_GetProductReviewScoreHistogram() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewScoreHistogram(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewScoreHistogramRequest* /*request*/, ::oteldemo::GetProductReviewScoreHistogramResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithGenericMethod_GetProductReviewsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_GetProductReviewsBatch() {
+      ::grpc::Service::MarkMethodGeneric(4);
+    }
+    ~WithGenericMethod_GetProductReviewsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsBatchRequest* /*request*/, ::oteldemo::GetProductReviewsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithGenericMethod_GetAverageScoresBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_GetAverageScoresBatch() {
+      ::grpc::Service::MarkMethodGeneric(5);
+    }
+    ~WithGenericMethod_GetAverageScoresBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetAverageScoresBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetAverageScoresBatchRequest* /*request*/, ::oteldemo::GetAverageScoresBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithGenericMethod_GetProductReviewsPage : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_GetProductReviewsPage() {
+      ::grpc::Service::MarkMethodGeneric(6);
+    }
+    ~WithGenericMethod_GetProductReviewsPage() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewsPage(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsPageRequest* /*request*/, ::oteldemo::GetProductReviewsPageResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithGenericMethod_StreamProductReviews : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithGenericMethod_StreamProductReviews() {
+      ::grpc::Service::MarkMethodGeneric(7);
+    }
+    ~WithGenericMethod_StreamProductReviews() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status StreamProductReviews(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamProductReviewsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::ProductReview>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_GetProductReviews : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_GetProductReviews() {
+      ::grpc::Service::MarkMethodRaw(0);
+    }
+    ~WithRawMethod_GetProductReviews() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviews(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsRequest* /*request*/, ::oteldemo::GetProductReviewsResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestGetProductReviews(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(0, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_GetAverageProductReviewScore : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_GetAverageProductReviewScore() {
+      ::grpc::Service::MarkMethodRaw(1);
+    }
+    ~WithRawMethod_GetAverageProductReviewScore() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetAverageProductReviewScore(::grpc::ServerContext* /*context*/, const ::oteldemo::GetAverageProductReviewScoreRequest* /*request*/, ::oteldemo::GetAverageProductReviewScoreResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestGetAverageProductReviewScore(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(1, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_AskProductAIAssistant : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_AskProductAIAssistant() {
+      ::grpc::Service::MarkMethodRaw(2);
+    }
+    ~WithRawMethod_AskProductAIAssistant() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status AskProductAIAssistant(::grpc::ServerContext* /*context*/, const ::oteldemo::AskProductAIAssistantRequest* /*request*/, ::oteldemo::AskProductAIAssistantResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestAskProductAIAssistant(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(2, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_GetProductReviewScoreHistogram : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_GetProductReviewScoreHistogram() {
+      ::grpc::Service::MarkMethodRaw(3);
+    }
+    ~WithRawMethod_GetProductReviewScoreHistogram() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewScoreHistogram(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewScoreHistogramRequest* /*request*/, ::oteldemo::GetProductReviewScoreHistogramResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestGetProductReviewScoreHistogram(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(3, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_GetProductReviewsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_GetProductReviewsBatch() {
+      ::grpc::Service::MarkMethodRaw(4);
+    }
+    ~WithRawMethod_GetProductReviewsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsBatchRequest* /*request*/, ::oteldemo::GetProductReviewsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestGetProductReviewsBatch(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(4, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_GetAverageScoresBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_GetAverageScoresBatch() {
+      ::grpc::Service::MarkMethodRaw(5);
+    }
+    ~WithRawMethod_GetAverageScoresBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetAverageScoresBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetAverageScoresBatchRequest* /*request*/, ::oteldemo::GetAverageScoresBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestGetAverageScoresBatch(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(5, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_GetProductReviewsPage : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_GetProductReviewsPage() {
+      ::grpc::Service::MarkMethodRaw(6);
+    }
+    ~WithRawMethod_GetProductReviewsPage() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewsPage(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsPageRequest* /*request*/, ::oteldemo::GetProductReviewsPageResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestGetProductReviewsPage(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncResponseWriter< ::grpc::ByteBuffer>* response, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncUnary(6, context, request, response, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawMethod_StreamProductReviews : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawMethod_StreamProductReviews() {
+      ::grpc::Service::MarkMethodRaw(7);
+    }
+    ~WithRawMethod_StreamProductReviews() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status StreamProductReviews(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamProductReviewsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::ProductReview>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    void RequestStreamProductReviews(::grpc::ServerContext* context, ::grpc::ByteBuffer* request, ::grpc::ServerAsyncWriter< ::grpc::ByteBuffer>* writer, ::grpc::CompletionQueue* new_call_cq, ::grpc::ServerCompletionQueue* notification_cq, void *tag) {
+      ::grpc::Service::RequestAsyncServerStreaming(7, context, request, writer, new_call_cq, notification_cq, tag);
+    }
+  };
+  template <class BaseClass>
+  class WithRawCallbackMethod_GetProductReviews : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawCallbackMethod_GetProductReviews() {
+      ::grpc::Service::MarkMethodRawCallback(0,
+          new ::grpc::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->GetProductReviews(context, request, response); }));
+    }
     ~WithRawCallbackMethod_GetProductReviews() override {
       BaseClassMustBeDerivedFromService(this);
     }
@@ -1735,6 +2431,116 @@ class ProductReviewService final {
       ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/)  { return nullptr; }
   };
   template <class BaseClass>
+  class WithRawCallbackMethod_GetProductReviewScoreHistogram : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawCallbackMethod_GetProductReviewScoreHistogram() {
+      ::grpc::Service::MarkMethodRawCallback(3,
+          new ::grpc::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->GetProductReviewScoreHistogram(context, request, response); }));
+    }
+    ~WithRawCallbackMethod_GetProductReviewScoreHistogram() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewScoreHistogram(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewScoreHistogramRequest* /*request*/, ::oteldemo::GetProductReviewScoreHistogramResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerUnaryReactor* GetProductReviewScoreHistogram(
+      ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/)  { return nullptr; }
+  };
+  template <class BaseClass>
+  class WithRawCallbackMethod_GetProductReviewsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawCallbackMethod_GetProductReviewsBatch() {
+      ::grpc::Service::MarkMethodRawCallback(4,
+          new ::grpc::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->GetProductReviewsBatch(context, request, response); }));
+    }
+    ~WithRawCallbackMethod_GetProductReviewsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsBatchRequest* /*request*/, ::oteldemo::GetProductReviewsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerUnaryReactor* GetProductReviewsBatch(
+      ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/)  { return nullptr; }
+  };
+  template <class BaseClass>
+  class WithRawCallbackMethod_GetAverageScoresBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawCallbackMethod_GetAverageScoresBatch() {
+      ::grpc::Service::MarkMethodRawCallback(5,
+          new ::grpc::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->GetAverageScoresBatch(context, request, response); }));
+    }
+    ~WithRawCallbackMethod_GetAverageScoresBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetAverageScoresBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetAverageScoresBatchRequest* /*request*/, ::oteldemo::GetAverageScoresBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerUnaryReactor* GetAverageScoresBatch(
+      ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/)  { return nullptr; }
+  };
+  template <class BaseClass>
+  class WithRawCallbackMethod_GetProductReviewsPage : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawCallbackMethod_GetProductReviewsPage() {
+      ::grpc::Service::MarkMethodRawCallback(6,
+          new ::grpc::internal::CallbackUnaryHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const ::grpc::ByteBuffer* request, ::grpc::ByteBuffer* response) { return this->GetProductReviewsPage(context, request, response); }));
+    }
+    ~WithRawCallbackMethod_GetProductReviewsPage() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status GetProductReviewsPage(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsPageRequest* /*request*/, ::oteldemo::GetProductReviewsPageResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerUnaryReactor* GetProductReviewsPage(
+      ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/, ::grpc::ByteBuffer* /*response*/)  { return nullptr; }
+  };
+  template <class BaseClass>
+  class WithRawCallbackMethod_StreamProductReviews : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithRawCallbackMethod_StreamProductReviews() {
+      ::grpc::Service::MarkMethodRawCallback(7,
+          new ::grpc::internal::CallbackServerStreamingHandler< ::grpc::ByteBuffer, ::grpc::ByteBuffer>(
+            [this](
+                   ::grpc::CallbackServerContext* context, const::grpc::ByteBuffer* request) { return this->StreamProductReviews(context, request); }));
+    }
+    ~WithRawCallbackMethod_StreamProductReviews() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable synchronous version of this method
+    ::grpc::Status StreamProductReviews(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamProductReviewsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::ProductReview>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    virtual ::grpc::ServerWriteReactor< ::grpc::ByteBuffer>* StreamProductReviews(
+      ::grpc::CallbackServerContext* /*context*/, const ::grpc::ByteBuffer* /*request*/)  { return nullptr; }
+  };
+  template <class BaseClass>
   class WithStreamedUnaryMethod_GetProductReviews : public BaseClass {
    private:
     void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
@@ -1815,9 +2621,144 @@ class ProductReviewService final {
     // replace default version of method with streamed unary
     virtual ::grpc::Status StreamedAskProductAIAssistant(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::oteldemo::AskProductAIAssistantRequest,::oteldemo::AskProductAIAssistantResponse>* server_unary_streamer) = 0;
   };
-  typedef WithStreamedUnaryMethod_GetProductReviews<WithStreamedUnaryMethod_GetAverageProductReviewScore<WithStreamedUnaryMethod_AskProductAIAssistant<Service > > > StreamedUnaryService;
-  typedef Service SplitStreamedService;
-  typedef WithStreamedUnaryMethod_GetProductReviews<WithStreamedUnaryMethod_GetAverageProductReviewScore<WithStreamedUnaryMethod_AskProductAIAssistant<Service > > > StreamedService;
+  template <class BaseClass>
+  class WithStreamedUnaryMethod_GetProductReviewScoreHistogram : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithStreamedUnaryMethod_GetProductReviewScoreHistogram() {
+      ::grpc::Service::MarkMethodStreamed(3,
+        new ::grpc::internal::StreamedUnaryHandler<
+          ::oteldemo::GetProductReviewScoreHistogramRequest, ::oteldemo::GetProductReviewScoreHistogramResponse>(
+            [this](::grpc::ServerContext* context,
+                   ::grpc::ServerUnaryStreamer<
+                     ::oteldemo::GetProductReviewScoreHistogramRequest, ::oteldemo::GetProductReviewScoreHistogramResponse>* streamer) {
+                       return this->StreamedGetProductReviewScoreHistogram(context,
+                         streamer);
+                  }));
+    }
+    ~WithStreamedUnaryMethod_GetProductReviewScoreHistogram() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status GetProductReviewScoreHistogram(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewScoreHistogramRequest* /*request*/, ::oteldemo::GetProductReviewScoreHistogramResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with streamed unary
+    virtual ::grpc::Status StreamedGetProductReviewScoreHistogram(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::oteldemo::GetProductReviewScoreHistogramRequest,::oteldemo::GetProductReviewScoreHistogramResponse>* server_unary_streamer) = 0;
+  };
+  template <class BaseClass>
+  class WithStreamedUnaryMethod_GetProductReviewsBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithStreamedUnaryMethod_GetProductReviewsBatch() {
+      ::grpc::Service::MarkMethodStreamed(4,
+        new ::grpc::internal::StreamedUnaryHandler<
+          ::oteldemo::GetProductReviewsBatchRequest, ::oteldemo::GetProductReviewsBatchResponse>(
+            [this](::grpc::ServerContext* context,
+                   ::grpc::ServerUnaryStreamer<
+                     ::oteldemo::GetProductReviewsBatchRequest, ::oteldemo::GetProductReviewsBatchResponse>* streamer) {
+                       return this->StreamedGetProductReviewsBatch(context,
+                         streamer);
+                  }));
+    }
+    ~WithStreamedUnaryMethod_GetProductReviewsBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status GetProductReviewsBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsBatchRequest* /*request*/, ::oteldemo::GetProductReviewsBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with streamed unary
+    virtual ::grpc::Status StreamedGetProductReviewsBatch(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::oteldemo::GetProductReviewsBatchRequest,::oteldemo::GetProductReviewsBatchResponse>* server_unary_streamer) = 0;
+  };
+  template <class BaseClass>
+  class WithStreamedUnaryMethod_GetAverageScoresBatch : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithStreamedUnaryMethod_GetAverageScoresBatch() {
+      ::grpc::Service::MarkMethodStreamed(5,
+        new ::grpc::internal::StreamedUnaryHandler<
+          ::oteldemo::GetAverageScoresBatchRequest, ::oteldemo::GetAverageScoresBatchResponse>(
+            [this](::grpc::ServerContext* context,
+                   ::grpc::ServerUnaryStreamer<
+                     ::oteldemo::GetAverageScoresBatchRequest, ::oteldemo::GetAverageScoresBatchResponse>* streamer) {
+                       return this->StreamedGetAverageScoresBatch(context,
+                         streamer);
+                  }));
+    }
+    ~WithStreamedUnaryMethod_GetAverageScoresBatch() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status GetAverageScoresBatch(::grpc::ServerContext* /*context*/, const ::oteldemo::GetAverageScoresBatchRequest* /*request*/, ::oteldemo::GetAverageScoresBatchResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with streamed unary
+    virtual ::grpc::Status StreamedGetAverageScoresBatch(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::oteldemo::GetAverageScoresBatchRequest,::oteldemo::GetAverageScoresBatchResponse>* server_unary_streamer) = 0;
+  };
+  template <class BaseClass>
+  class WithStreamedUnaryMethod_GetProductReviewsPage : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithStreamedUnaryMethod_GetProductReviewsPage() {
+      ::grpc::Service::MarkMethodStreamed(6,
+        new ::grpc::internal::StreamedUnaryHandler<
+          ::oteldemo::GetProductReviewsPageRequest, ::oteldemo::GetProductReviewsPageResponse>(
+            [this](::grpc::ServerContext* context,
+                   ::grpc::ServerUnaryStreamer<
+                     ::oteldemo::GetProductReviewsPageRequest, ::oteldemo::GetProductReviewsPageResponse>* streamer) {
+                       return this->StreamedGetProductReviewsPage(context,
+                         streamer);
+                  }));
+    }
+    ~WithStreamedUnaryMethod_GetProductReviewsPage() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status GetProductReviewsPage(::grpc::ServerContext* /*context*/, const ::oteldemo::GetProductReviewsPageRequest* /*request*/, ::oteldemo::GetProductReviewsPageResponse* /*response*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with streamed unary
+    virtual ::grpc::Status StreamedGetProductReviewsPage(::grpc::ServerContext* context, ::grpc::ServerUnaryStreamer< ::oteldemo::GetProductReviewsPageRequest,::oteldemo::GetProductReviewsPageResponse>* server_unary_streamer) = 0;
+  };
+  typedef WithStreamedUnaryMethod_GetProductReviews<WithStreamedUnaryMethod_GetAverageProductReviewScore<WithStreamedUnaryMethod_AskProductAIAssistant<WithStreamedUnaryMethod_GetProductReviewScoreHistogram<WithStreamedUnaryMethod_GetProductReviewsBatch<WithStreamedUnaryMethod_GetAverageScoresBatch<WithStreamedUnaryMethod_GetProductReviewsPage<Service > > > > > > > StreamedUnaryService;
+  template <class BaseClass>
+  class WithSplitStreamingMethod_StreamProductReviews : public BaseClass {
+   private:
+    void BaseClassMustBeDerivedFromService(const Service* /*service*/) {}
+   public:
+    WithSplitStreamingMethod_StreamProductReviews() {
+      ::grpc::Service::MarkMethodStreamed(7,
+        new ::grpc::internal::SplitServerStreamingHandler<
+          ::oteldemo::StreamProductReviewsRequest, ::oteldemo::ProductReview>(
+            [this](::grpc::ServerContext* context,
+                   ::grpc::ServerSplitStreamer<
+                     ::oteldemo::StreamProductReviewsRequest, ::oteldemo::ProductReview>* streamer) {
+                       return this->StreamedStreamProductReviews(context,
+                         streamer);
+                  }));
+    }
+    ~WithSplitStreamingMethod_StreamProductReviews() override {
+      BaseClassMustBeDerivedFromService(this);
+    }
+    // disable regular version of this method
+    ::grpc::Status StreamProductReviews(::grpc::ServerContext* /*context*/, const ::oteldemo::StreamProductReviewsRequest* /*request*/, ::grpc::ServerWriter< ::oteldemo::ProductReview>* /*writer*/) override {
+      abort();
+      return ::grpc::Status(::grpc::StatusCode::UNIMPLEMENTED, "");
+    }
+    // replace default version of method with split streamed
+    virtual ::grpc::Status StreamedStreamProductReviews(::grpc::ServerContext* context, ::grpc::ServerSplitStreamer< ::oteldemo::StreamProductReviewsRequest,::oteldemo::ProductReview>* server_split_streamer) = 0;
+  };
+  typedef WithSplitStreamingMethod_StreamProductReviews<Service > SplitStreamedService;
+  typedef WithStreamedUnaryMethod_GetProductReviews<WithStreamedUnaryMethod_GetAverageProductReviewScore<WithStreamedUnaryMethod_AskProductAIAssistant<WithStreamedUnaryMethod_GetProductReviewScoreHistogram<WithStreamedUnaryMethod_GetProductReviewsBatch<WithStreamedUnaryMethod_GetAverageScoresBatch<WithStreamedUnaryMethod_GetProductReviewsPage<WithSplitStreamingMethod_StreamProductReviews<Service > > > > > > > > StreamedService;
 };
 
 // ---------------Shipping Service----------
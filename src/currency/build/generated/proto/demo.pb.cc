@@ -169,6 +169,38 @@ struct ListRecommendationsResponseDefaultTypeInternal {
 PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
     PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ListRecommendationsResponseDefaultTypeInternal _ListRecommendationsResponse_default_instance_;
         template <typename>
+PROTOBUF_CONSTEXPR ListRecommendationsBatchRequest::ListRecommendationsBatchRequest(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.requests_)*/ {},
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct ListRecommendationsBatchRequestDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ListRecommendationsBatchRequestDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ListRecommendationsBatchRequestDefaultTypeInternal() {}
+  union {
+    ListRecommendationsBatchRequest _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ListRecommendationsBatchRequestDefaultTypeInternal _ListRecommendationsBatchRequest_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR ListRecommendationsBatchResponse::ListRecommendationsBatchResponse(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.responses_)*/ {},
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct ListRecommendationsBatchResponseDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ListRecommendationsBatchResponseDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ListRecommendationsBatchResponseDefaultTypeInternal() {}
+  union {
+    ListRecommendationsBatchResponse _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ListRecommendationsBatchResponseDefaultTypeInternal _ListRecommendationsBatchResponse_default_instance_;
+        template <typename>
 PROTOBUF_CONSTEXPR Product::Product(::_pbi::ConstantInitialized)
     : _impl_{
       /*decltype(_impl_._has_bits_)*/ {},
@@ -373,6 +405,218 @@ struct GetAverageProductReviewScoreResponseDefaultTypeInternal {
 PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
     PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 GetAverageProductReviewScoreResponseDefaultTypeInternal _GetAverageProductReviewScoreResponse_default_instance_;
         template <typename>
+PROTOBUF_CONSTEXPR GetProductReviewScoreHistogramRequest::GetProductReviewScoreHistogramRequest(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.product_id_)*/ {
+          &::_pbi::fixed_address_empty_string,
+          ::_pbi::ConstantInitialized{},
+      },
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct GetProductReviewScoreHistogramRequestDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR GetProductReviewScoreHistogramRequestDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~GetProductReviewScoreHistogramRequestDefaultTypeInternal() {}
+  union {
+    GetProductReviewScoreHistogramRequest _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 GetProductReviewScoreHistogramRequestDefaultTypeInternal _GetProductReviewScoreHistogramRequest_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR GetProductReviewScoreHistogramResponse::GetProductReviewScoreHistogramResponse(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.star_counts_)*/ {},
+      /* _impl_._star_counts_cached_byte_size_ = */ {0},
+      /*decltype(_impl_.average_score_)*/ {
+          &::_pbi::fixed_address_empty_string,
+          ::_pbi::ConstantInitialized{},
+      },
+      /*decltype(_impl_.review_count_)*/ 0,
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct GetProductReviewScoreHistogramResponseDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR GetProductReviewScoreHistogramResponseDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~GetProductReviewScoreHistogramResponseDefaultTypeInternal() {}
+  union {
+    GetProductReviewScoreHistogramResponse _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 GetProductReviewScoreHistogramResponseDefaultTypeInternal _GetProductReviewScoreHistogramResponse_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR GetProductReviewsBatchRequest::GetProductReviewsBatchRequest(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.product_ids_)*/ {},
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct GetProductReviewsBatchRequestDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR GetProductReviewsBatchRequestDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~GetProductReviewsBatchRequestDefaultTypeInternal() {}
+  union {
+    GetProductReviewsBatchRequest _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 GetProductReviewsBatchRequestDefaultTypeInternal _GetProductReviewsBatchRequest_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR ProductReviews::ProductReviews(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.product_reviews_)*/ {},
+      /*decltype(_impl_.product_id_)*/ {
+          &::_pbi::fixed_address_empty_string,
+          ::_pbi::ConstantInitialized{},
+      },
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct ProductReviewsDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ProductReviewsDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ProductReviewsDefaultTypeInternal() {}
+  union {
+    ProductReviews _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ProductReviewsDefaultTypeInternal _ProductReviews_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR GetProductReviewsBatchResponse::GetProductReviewsBatchResponse(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.product_reviews_)*/ {},
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct GetProductReviewsBatchResponseDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR GetProductReviewsBatchResponseDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~GetProductReviewsBatchResponseDefaultTypeInternal() {}
+  union {
+    GetProductReviewsBatchResponse _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 GetProductReviewsBatchResponseDefaultTypeInternal _GetProductReviewsBatchResponse_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR GetAverageScoresBatchRequest::GetAverageScoresBatchRequest(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.product_ids_)*/ {},
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct GetAverageScoresBatchRequestDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR GetAverageScoresBatchRequestDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~GetAverageScoresBatchRequestDefaultTypeInternal() {}
+  union {
+    GetAverageScoresBatchRequest _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 GetAverageScoresBatchRequestDefaultTypeInternal _GetAverageScoresBatchRequest_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR ProductAverageScore::ProductAverageScore(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.product_id_)*/ {
+          &::_pbi::fixed_address_empty_string,
+          ::_pbi::ConstantInitialized{},
+      },
+      /*decltype(_impl_.average_score_)*/ {
+          &::_pbi::fixed_address_empty_string,
+          ::_pbi::ConstantInitialized{},
+      },
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct ProductAverageScoreDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ProductAverageScoreDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ProductAverageScoreDefaultTypeInternal() {}
+  union {
+    ProductAverageScore _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ProductAverageScoreDefaultTypeInternal _ProductAverageScore_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR GetAverageScoresBatchResponse::GetAverageScoresBatchResponse(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.average_scores_)*/ {},
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct GetAverageScoresBatchResponseDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR GetAverageScoresBatchResponseDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~GetAverageScoresBatchResponseDefaultTypeInternal() {}
+  union {
+    GetAverageScoresBatchResponse _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 GetAverageScoresBatchResponseDefaultTypeInternal _GetAverageScoresBatchResponse_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR GetProductReviewsPageRequest::GetProductReviewsPageRequest(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.product_id_)*/ {
+          &::_pbi::fixed_address_empty_string,
+          ::_pbi::ConstantInitialized{},
+      },
+      /*decltype(_impl_.page_token_)*/ {
+          &::_pbi::fixed_address_empty_string,
+          ::_pbi::ConstantInitialized{},
+      },
+      /*decltype(_impl_.page_size_)*/ 0,
+      /*decltype(_impl_.order_by_score_)*/ false,
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct GetProductReviewsPageRequestDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR GetProductReviewsPageRequestDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~GetProductReviewsPageRequestDefaultTypeInternal() {}
+  union {
+    GetProductReviewsPageRequest _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 GetProductReviewsPageRequestDefaultTypeInternal _GetProductReviewsPageRequest_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR GetProductReviewsPageResponse::GetProductReviewsPageResponse(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.product_reviews_)*/ {},
+      /*decltype(_impl_.next_page_token_)*/ {
+          &::_pbi::fixed_address_empty_string,
+          ::_pbi::ConstantInitialized{},
+      },
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct GetProductReviewsPageResponseDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR GetProductReviewsPageResponseDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~GetProductReviewsPageResponseDefaultTypeInternal() {}
+  union {
+    GetProductReviewsPageResponse _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 GetProductReviewsPageResponseDefaultTypeInternal _GetProductReviewsPageResponse_default_instance_;
+        template <typename>
+PROTOBUF_CONSTEXPR StreamProductReviewsRequest::StreamProductReviewsRequest(::_pbi::ConstantInitialized)
+    : _impl_{
+      /*decltype(_impl_.product_id_)*/ {
+          &::_pbi::fixed_address_empty_string,
+          ::_pbi::ConstantInitialized{},
+      },
+      /*decltype(_impl_._cached_size_)*/ {},
+    } {}
+struct StreamProductReviewsRequestDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR StreamProductReviewsRequestDefaultTypeInternal() : _instance(::_pbi::ConstantInitialized{}) {}
+  ~StreamProductReviewsRequestDefaultTypeInternal() {}
+  union {
+    StreamProductReviewsRequest _instance;
+  };
+};
+
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
+    PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 StreamProductReviewsRequestDefaultTypeInternal _StreamProductReviewsRequest_default_instance_;
+        template <typename>
 PROTOBUF_CONSTEXPR AskProductAIAssistantRequest::AskProductAIAssistantRequest(::_pbi::ConstantInitialized)
     : _impl_{
       /*decltype(_impl_.product_id_)*/ {
@@ -999,7 +1243,7 @@ struct DeleteFlagResponseDefaultTypeInternal {
 PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT
     PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 DeleteFlagResponseDefaultTypeInternal _DeleteFlagResponse_default_instance_;
 }  // namespace oteldemo
-static ::_pb::Metadata file_level_metadata_demo_2eproto[50];
+static ::_pb::Metadata file_level_metadata_demo_2eproto[63];
 static constexpr const ::_pb::EnumDescriptor**
     file_level_enum_descriptors_demo_2eproto = nullptr;
 static constexpr const ::_pb::ServiceDescriptor**
@@ -1083,6 +1327,24 @@ const ::uint32_t TableStruct_demo_2eproto::offsets[] PROTOBUF_SECTION_VARIABLE(
     ~0u,  // no _split_
     ~0u,  // no sizeof(Split)
     PROTOBUF_FIELD_OFFSET(::oteldemo::ListRecommendationsResponse, _impl_.product_ids_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::ListRecommendationsBatchRequest, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::ListRecommendationsBatchRequest, _impl_.requests_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::ListRecommendationsBatchResponse, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::ListRecommendationsBatchResponse, _impl_.responses_),
     PROTOBUF_FIELD_OFFSET(::oteldemo::Product, _impl_._has_bits_),
     PROTOBUF_FIELD_OFFSET(::oteldemo::Product, _internal_metadata_),
     ~0u,  // no _extensions_
@@ -1187,6 +1449,113 @@ const ::uint32_t TableStruct_demo_2eproto::offsets[] PROTOBUF_SECTION_VARIABLE(
     ~0u,  // no sizeof(Split)
     PROTOBUF_FIELD_OFFSET(::oteldemo::GetAverageProductReviewScoreResponse, _impl_.average_score_),
     ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewScoreHistogramRequest, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewScoreHistogramRequest, _impl_.product_id_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewScoreHistogramResponse, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewScoreHistogramResponse, _impl_.review_count_),
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewScoreHistogramResponse, _impl_.average_score_),
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewScoreHistogramResponse, _impl_.star_counts_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsBatchRequest, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsBatchRequest, _impl_.product_ids_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::ProductReviews, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::ProductReviews, _impl_.product_id_),
+    PROTOBUF_FIELD_OFFSET(::oteldemo::ProductReviews, _impl_.product_reviews_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsBatchResponse, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsBatchResponse, _impl_.product_reviews_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetAverageScoresBatchRequest, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetAverageScoresBatchRequest, _impl_.product_ids_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::ProductAverageScore, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::ProductAverageScore, _impl_.product_id_),
+    PROTOBUF_FIELD_OFFSET(::oteldemo::ProductAverageScore, _impl_.average_score_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetAverageScoresBatchResponse, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetAverageScoresBatchResponse, _impl_.average_scores_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsPageRequest, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsPageRequest, _impl_.product_id_),
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsPageRequest, _impl_.page_size_),
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsPageRequest, _impl_.page_token_),
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsPageRequest, _impl_.order_by_score_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsPageResponse, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsPageResponse, _impl_.product_reviews_),
+    PROTOBUF_FIELD_OFFSET(::oteldemo::GetProductReviewsPageResponse, _impl_.next_page_token_),
+    ~0u,  // no _has_bits_
+    PROTOBUF_FIELD_OFFSET(::oteldemo::StreamProductReviewsRequest, _internal_metadata_),
+    ~0u,  // no _extensions_
+    ~0u,  // no _oneof_case_
+    ~0u,  // no _weak_field_map_
+    ~0u,  // no _inlined_string_donated_
+    ~0u,  // no _split_
+    ~0u,  // no sizeof(Split)
+    PROTOBUF_FIELD_OFFSET(::oteldemo::StreamProductReviewsRequest, _impl_.product_id_),
+    ~0u,  // no _has_bits_
     PROTOBUF_FIELD_OFFSET(::oteldemo::AskProductAIAssistantRequest, _internal_metadata_),
     ~0u,  // no _extensions_
     ~0u,  // no _oneof_case_
@@ -1539,48 +1908,61 @@ static const ::_pbi::MigrationSchema
         {50, -1, -1, sizeof(::oteldemo::Empty)},
         {58, -1, -1, sizeof(::oteldemo::ListRecommendationsRequest)},
         {68, -1, -1, sizeof(::oteldemo::ListRecommendationsResponse)},
-        {77, 91, -1, sizeof(::oteldemo::Product)},
-        {97, -1, -1, sizeof(::oteldemo::ListProductsResponse)},
-        {106, -1, -1, sizeof(::oteldemo::GetProductRequest)},
-        {115, -1, -1, sizeof(::oteldemo::SearchProductsRequest)},
-        {124, -1, -1, sizeof(::oteldemo::SearchProductsResponse)},
-        {133, -1, -1, sizeof(::oteldemo::ProductReview)},
-        {144, -1, -1, sizeof(::oteldemo::GetProductReviewsRequest)},
-        {153, -1, -1, sizeof(::oteldemo::GetProductReviewsResponse)},
-        {162, -1, -1, sizeof(::oteldemo::GetAverageProductReviewScoreRequest)},
-        {171, -1, -1, sizeof(::oteldemo::GetAverageProductReviewScoreResponse)},
-        {180, -1, -1, sizeof(::oteldemo::AskProductAIAssistantRequest)},
-        {190, -1, -1, sizeof(::oteldemo::AskProductAIAssistantResponse)},
-        {199, 209, -1, sizeof(::oteldemo::GetQuoteRequest)},
-        {211, 220, -1, sizeof(::oteldemo::GetQuoteResponse)},
-        {221, 231, -1, sizeof(::oteldemo::ShipOrderRequest)},
-        {233, -1, -1, sizeof(::oteldemo::ShipOrderResponse)},
-        {242, -1, -1, sizeof(::oteldemo::Address)},
-        {255, -1, -1, sizeof(::oteldemo::Money)},
-        {266, -1, -1, sizeof(::oteldemo::GetSupportedCurrenciesResponse)},
-        {275, 285, -1, sizeof(::oteldemo::CurrencyConversionRequest)},
-        {287, -1, -1, sizeof(::oteldemo::CreditCardInfo)},
-        {299, 309, -1, sizeof(::oteldemo::ChargeRequest)},
-        {311, -1, -1, sizeof(::oteldemo::ChargeResponse)},
-        {320, 330, -1, sizeof(::oteldemo::OrderItem)},
-        {332, 345, -1, sizeof(::oteldemo::OrderResult)},
-        {350, 360, -1, sizeof(::oteldemo::SendOrderConfirmationRequest)},
-        {362, 375, -1, sizeof(::oteldemo::PlaceOrderRequest)},
-        {380, 389, -1, sizeof(::oteldemo::PlaceOrderResponse)},
-        {390, -1, -1, sizeof(::oteldemo::AdRequest)},
-        {399, -1, -1, sizeof(::oteldemo::AdResponse)},
-        {408, -1, -1, sizeof(::oteldemo::Ad)},
-        {418, -1, -1, sizeof(::oteldemo::Flag)},
-        {429, -1, -1, sizeof(::oteldemo::GetFlagRequest)},
-        {438, 447, -1, sizeof(::oteldemo::GetFlagResponse)},
-        {448, -1, -1, sizeof(::oteldemo::CreateFlagRequest)},
-        {459, 468, -1, sizeof(::oteldemo::CreateFlagResponse)},
-        {469, -1, -1, sizeof(::oteldemo::UpdateFlagRequest)},
-        {479, -1, -1, sizeof(::oteldemo::UpdateFlagResponse)},
-        {487, -1, -1, sizeof(::oteldemo::ListFlagsRequest)},
-        {495, -1, -1, sizeof(::oteldemo::ListFlagsResponse)},
-        {504, -1, -1, sizeof(::oteldemo::DeleteFlagRequest)},
-        {513, -1, -1, sizeof(::oteldemo::DeleteFlagResponse)},
+        {77, -1, -1, sizeof(::oteldemo::ListRecommendationsBatchRequest)},
+        {86, -1, -1, sizeof(::oteldemo::ListRecommendationsBatchResponse)},
+        {95, 109, -1, sizeof(::oteldemo::Product)},
+        {115, -1, -1, sizeof(::oteldemo::ListProductsResponse)},
+        {124, -1, -1, sizeof(::oteldemo::GetProductRequest)},
+        {133, -1, -1, sizeof(::oteldemo::SearchProductsRequest)},
+        {142, -1, -1, sizeof(::oteldemo::SearchProductsResponse)},
+        {151, -1, -1, sizeof(::oteldemo::ProductReview)},
+        {162, -1, -1, sizeof(::oteldemo::GetProductReviewsRequest)},
+        {171, -1, -1, sizeof(::oteldemo::GetProductReviewsResponse)},
+        {180, -1, -1, sizeof(::oteldemo::GetAverageProductReviewScoreRequest)},
+        {189, -1, -1, sizeof(::oteldemo::GetAverageProductReviewScoreResponse)},
+        {198, -1, -1, sizeof(::oteldemo::GetProductReviewScoreHistogramRequest)},
+        {207, -1, -1, sizeof(::oteldemo::GetProductReviewScoreHistogramResponse)},
+        {218, -1, -1, sizeof(::oteldemo::GetProductReviewsBatchRequest)},
+        {227, -1, -1, sizeof(::oteldemo::ProductReviews)},
+        {237, -1, -1, sizeof(::oteldemo::GetProductReviewsBatchResponse)},
+        {246, -1, -1, sizeof(::oteldemo::GetAverageScoresBatchRequest)},
+        {255, -1, -1, sizeof(::oteldemo::ProductAverageScore)},
+        {265, -1, -1, sizeof(::oteldemo::GetAverageScoresBatchResponse)},
+        {274, -1, -1, sizeof(::oteldemo::GetProductReviewsPageRequest)},
+        {286, -1, -1, sizeof(::oteldemo::GetProductReviewsPageResponse)},
+        {296, -1, -1, sizeof(::oteldemo::StreamProductReviewsRequest)},
+        {305, -1, -1, sizeof(::oteldemo::AskProductAIAssistantRequest)},
+        {315, -1, -1, sizeof(::oteldemo::AskProductAIAssistantResponse)},
+        {324, 334, -1, sizeof(::oteldemo::GetQuoteRequest)},
+        {336, 345, -1, sizeof(::oteldemo::GetQuoteResponse)},
+        {346, 356, -1, sizeof(::oteldemo::ShipOrderRequest)},
+        {358, -1, -1, sizeof(::oteldemo::ShipOrderResponse)},
+        {367, -1, -1, sizeof(::oteldemo::Address)},
+        {380, -1, -1, sizeof(::oteldemo::Money)},
+        {391, -1, -1, sizeof(::oteldemo::GetSupportedCurrenciesResponse)},
+        {400, 410, -1, sizeof(::oteldemo::CurrencyConversionRequest)},
+        {412, -1, -1, sizeof(::oteldemo::CreditCardInfo)},
+        {424, 434, -1, sizeof(::oteldemo::ChargeRequest)},
+        {436, -1, -1, sizeof(::oteldemo::ChargeResponse)},
+        {445, 455, -1, sizeof(::oteldemo::OrderItem)},
+        {457, 470, -1, sizeof(::oteldemo::OrderResult)},
+        {475, 485, -1, sizeof(::oteldemo::SendOrderConfirmationRequest)},
+        {487, 500, -1, sizeof(::oteldemo::PlaceOrderRequest)},
+        {505, 514, -1, sizeof(::oteldemo::PlaceOrderResponse)},
+        {515, -1, -1, sizeof(::oteldemo::AdRequest)},
+        {524, -1, -1, sizeof(::oteldemo::AdResponse)},
+        {533, -1, -1, sizeof(::oteldemo::Ad)},
+        {543, -1, -1, sizeof(::oteldemo::Flag)},
+        {554, -1, -1, sizeof(::oteldemo::GetFlagRequest)},
+        {563, 572, -1, sizeof(::oteldemo::GetFlagResponse)},
+        {573, -1, -1, sizeof(::oteldemo::CreateFlagRequest)},
+        {584, 593, -1, sizeof(::oteldemo::CreateFlagResponse)},
+        {594, -1, -1, sizeof(::oteldemo::UpdateFlagRequest)},
+        {604, -1, -1, sizeof(::oteldemo::UpdateFlagResponse)},
+        {612, -1, -1, sizeof(::oteldemo::ListFlagsRequest)},
+        {620, -1, -1, sizeof(::oteldemo::ListFlagsResponse)},
+        {629, -1, -1, sizeof(::oteldemo::DeleteFlagRequest)},
+        {638, -1, -1, sizeof(::oteldemo::DeleteFlagResponse)},
 };
 
 static const ::_pb::Message* const file_default_instances[] = {
@@ -1592,6 +1974,8 @@ static const ::_pb::Message* const file_default_instances[] = {
     &::oteldemo::_Empty_default_instance_._instance,
     &::oteldemo::_ListRecommendationsRequest_default_instance_._instance,
     &::oteldemo::_ListRecommendationsResponse_default_instance_._instance,
+    &::oteldemo::_ListRecommendationsBatchRequest_default_instance_._instance,
+    &::oteldemo::_ListRecommendationsBatchResponse_default_instance_._instance,
     &::oteldemo::_Product_default_instance_._instance,
     &::oteldemo::_ListProductsResponse_default_instance_._instance,
     &::oteldemo::_GetProductRequest_default_instance_._instance,
@@ -1602,6 +1986,17 @@ static const ::_pb::Message* const file_default_instances[] = {
     &::oteldemo::_GetProductReviewsResponse_default_instance_._instance,
     &::oteldemo::_GetAverageProductReviewScoreRequest_default_instance_._instance,
     &::oteldemo::_GetAverageProductReviewScoreResponse_default_instance_._instance,
+    &::oteldemo::_GetProductReviewScoreHistogramRequest_default_instance_._instance,
+    &::oteldemo::_GetProductReviewScoreHistogramResponse_default_instance_._instance,
+    &::oteldemo::_GetProductReviewsBatchRequest_default_instance_._instance,
+    &::oteldemo::_ProductReviews_default_instance_._instance,
+    &::oteldemo::_GetProductReviewsBatchResponse_default_instance_._instance,
+    &::oteldemo::_GetAverageScoresBatchRequest_default_instance_._instance,
+    &::oteldemo::_ProductAverageScore_default_instance_._instance,
+    &::oteldemo::_GetAverageScoresBatchResponse_default_instance_._instance,
+    &::oteldemo::_GetProductReviewsPageRequest_default_instance_._instance,
+    &::oteldemo::_GetProductReviewsPageResponse_default_instance_._instance,
+    &::oteldemo::_StreamProductReviewsRequest_default_instance_._instance,
     &::oteldemo::_AskProductAIAssistantRequest_default_instance_._instance,
     &::oteldemo::_AskProductAIAssistantResponse_default_instance_._instance,
     &::oteldemo::_GetQuoteRequest_default_instance_._instance,
@@ -1646,138 +2041,182 @@ const char descriptor_table_protodef_demo_2eproto[] PROTOBUF_SECTION_VARIABLE(pr
     "ty\"B\n\032ListRecommendationsRequest\022\017\n\007user"
     "_id\030\001 \001(\t\022\023\n\013product_ids\030\002 \003(\t\"2\n\033ListRe"
     "commendationsResponse\022\023\n\013product_ids\030\001 \003"
-    "(\t\"\201\001\n\007Product\022\n\n\002id\030\001 \001(\t\022\014\n\004name\030\002 \001(\t"
-    "\022\023\n\013description\030\003 \001(\t\022\017\n\007picture\030\004 \001(\t\022\""
-    "\n\tprice_usd\030\005 \001(\0132\017.oteldemo.Money\022\022\n\nca"
-    "tegories\030\006 \003(\t\";\n\024ListProductsResponse\022#"
-    "\n\010products\030\001 \003(\0132\021.oteldemo.Product\"\037\n\021G"
-    "etProductRequest\022\n\n\002id\030\001 \001(\t\"&\n\025SearchPr"
-    "oductsRequest\022\r\n\005query\030\001 \001(\t\"<\n\026SearchPr"
-    "oductsResponse\022\"\n\007results\030\001 \003(\0132\021.otelde"
-    "mo.Product\"E\n\rProductReview\022\020\n\010username\030"
-    "\001 \001(\t\022\023\n\013description\030\002 \001(\t\022\r\n\005score\030\003 \001("
-    "\t\".\n\030GetProductReviewsRequest\022\022\n\nproduct"
-    "_id\030\001 \001(\t\"M\n\031GetProductReviewsResponse\0220"
-    "\n\017product_reviews\030\001 \003(\0132\027.oteldemo.Produ"
-    "ctReview\"9\n#GetAverageProductReviewScore"
-    "Request\022\022\n\nproduct_id\030\001 \001(\t\"=\n$GetAverag"
-    "eProductReviewScoreResponse\022\025\n\raverage_s"
-    "core\030\001 \001(\t\"D\n\034AskProductAIAssistantReque"
-    "st\022\022\n\nproduct_id\030\001 \001(\t\022\020\n\010question\030\002 \001(\t"
-    "\"1\n\035AskProductAIAssistantResponse\022\020\n\010res"
-    "ponse\030\001 \001(\t\"X\n\017GetQuoteRequest\022\"\n\007addres"
-    "s\030\001 \001(\0132\021.oteldemo.Address\022!\n\005items\030\002 \003("
-    "\0132\022.oteldemo.CartItem\"5\n\020GetQuoteRespons"
-    "e\022!\n\010cost_usd\030\001 \001(\0132\017.oteldemo.Money\"Y\n\020"
-    "ShipOrderRequest\022\"\n\007address\030\001 \001(\0132\021.otel"
-    "demo.Address\022!\n\005items\030\002 \003(\0132\022.oteldemo.C"
-    "artItem\"(\n\021ShipOrderResponse\022\023\n\013tracking"
-    "_id\030\001 \001(\t\"a\n\007Address\022\026\n\016street_address\030\001"
-    " \001(\t\022\014\n\004city\030\002 \001(\t\022\r\n\005state\030\003 \001(\t\022\017\n\007cou"
-    "ntry\030\004 \001(\t\022\020\n\010zip_code\030\005 \001(\t\"<\n\005Money\022\025\n"
-    "\rcurrency_code\030\001 \001(\t\022\r\n\005units\030\002 \001(\003\022\r\n\005n"
-    "anos\030\003 \001(\005\"8\n\036GetSupportedCurrenciesResp"
-    "onse\022\026\n\016currency_codes\030\001 \003(\t\"K\n\031Currency"
-    "ConversionRequest\022\035\n\004from\030\001 \001(\0132\017.otelde"
-    "mo.Money\022\017\n\007to_code\030\002 \001(\t\"\220\001\n\016CreditCard"
-    "Info\022\032\n\022credit_card_number\030\001 \001(\t\022\027\n\017cred"
-    "it_card_cvv\030\002 \001(\005\022#\n\033credit_card_expirat"
-    "ion_year\030\003 \001(\005\022$\n\034credit_card_expiration"
-    "_month\030\004 \001(\005\"_\n\rChargeRequest\022\037\n\006amount\030"
-    "\001 \001(\0132\017.oteldemo.Money\022-\n\013credit_card\030\002 "
-    "\001(\0132\030.oteldemo.CreditCardInfo\"(\n\016ChargeR"
-    "esponse\022\026\n\016transaction_id\030\001 \001(\t\"L\n\tOrder"
-    "Item\022 \n\004item\030\001 \001(\0132\022.oteldemo.CartItem\022\035"
-    "\n\004cost\030\002 \001(\0132\017.oteldemo.Money\"\266\001\n\013OrderR"
-    "esult\022\020\n\010order_id\030\001 \001(\t\022\034\n\024shipping_trac"
-    "king_id\030\002 \001(\t\022&\n\rshipping_cost\030\003 \001(\0132\017.o"
-    "teldemo.Money\022+\n\020shipping_address\030\004 \001(\0132"
-    "\021.oteldemo.Address\022\"\n\005items\030\005 \003(\0132\023.otel"
-    "demo.OrderItem\"S\n\034SendOrderConfirmationR"
-    "equest\022\r\n\005email\030\001 \001(\t\022$\n\005order\030\002 \001(\0132\025.o"
-    "teldemo.OrderResult\"\235\001\n\021PlaceOrderReques"
-    "t\022\017\n\007user_id\030\001 \001(\t\022\025\n\ruser_currency\030\002 \001("
-    "\t\022\"\n\007address\030\003 \001(\0132\021.oteldemo.Address\022\r\n"
-    "\005email\030\005 \001(\t\022-\n\013credit_card\030\006 \001(\0132\030.otel"
-    "demo.CreditCardInfo\":\n\022PlaceOrderRespons"
-    "e\022$\n\005order\030\001 \001(\0132\025.oteldemo.OrderResult\""
-    "!\n\tAdRequest\022\024\n\014context_keys\030\001 \003(\t\"\'\n\nAd"
-    "Response\022\031\n\003ads\030\001 \003(\0132\014.oteldemo.Ad\"(\n\002A"
-    "d\022\024\n\014redirect_url\030\001 \001(\t\022\014\n\004text\030\002 \001(\t\":\n"
-    "\004Flag\022\014\n\004name\030\001 \001(\t\022\023\n\013description\030\002 \001(\t"
-    "\022\017\n\007enabled\030\003 \001(\010\"\036\n\016GetFlagRequest\022\014\n\004n"
-    "ame\030\001 \001(\t\"/\n\017GetFlagResponse\022\034\n\004flag\030\001 \001"
-    "(\0132\016.oteldemo.Flag\"G\n\021CreateFlagRequest\022"
-    "\014\n\004name\030\001 \001(\t\022\023\n\013description\030\002 \001(\t\022\017\n\007en"
-    "abled\030\003 \001(\010\"2\n\022CreateFlagResponse\022\034\n\004fla"
-    "g\030\001 \001(\0132\016.oteldemo.Flag\"2\n\021UpdateFlagReq"
-    "uest\022\014\n\004name\030\001 \001(\t\022\017\n\007enabled\030\002 \001(\010\"\024\n\022U"
-    "pdateFlagResponse\"\022\n\020ListFlagsRequest\"1\n"
-    "\021ListFlagsResponse\022\034\n\004flag\030\001 \003(\0132\016.oteld"
-    "emo.Flag\"!\n\021DeleteFlagRequest\022\014\n\004name\030\001 "
-    "\001(\t\"\024\n\022DeleteFlagResponse2\270\001\n\013CartServic"
-    "e\0226\n\007AddItem\022\030.oteldemo.AddItemRequest\032\017"
-    ".oteldemo.Empty\"\000\0225\n\007GetCart\022\030.oteldemo."
-    "GetCartRequest\032\016.oteldemo.Cart\"\000\022:\n\tEmpt"
-    "yCart\022\032.oteldemo.EmptyCartRequest\032\017.otel"
-    "demo.Empty\"\0002}\n\025RecommendationService\022d\n"
-    "\023ListRecommendations\022$.oteldemo.ListReco"
-    "mmendationsRequest\032%.oteldemo.ListRecomm"
-    "endationsResponse\"\0002\361\001\n\025ProductCatalogSe"
-    "rvice\022A\n\014ListProducts\022\017.oteldemo.Empty\032\036"
-    ".oteldemo.ListProductsResponse\"\000\022>\n\nGetP"
-    "roduct\022\033.oteldemo.GetProductRequest\032\021.ot"
-    "eldemo.Product\"\000\022U\n\016SearchProducts\022\037.ote"
-    "ldemo.SearchProductsRequest\032 .oteldemo.S"
-    "earchProductsResponse\"\0002\343\002\n\024ProductRevie"
-    "wService\022^\n\021GetProductReviews\022\".oteldemo"
-    ".GetProductReviewsRequest\032#.oteldemo.Get"
-    "ProductReviewsResponse\"\000\022\177\n\034GetAveragePr"
-    "oductReviewScore\022-.oteldemo.GetAveragePr"
-    "oductReviewScoreRequest\032..oteldemo.GetAv"
-    "erageProductReviewScoreResponse\"\000\022j\n\025Ask"
-    "ProductAIAssistant\022&.oteldemo.AskProduct"
-    "AIAssistantRequest\032\'.oteldemo.AskProduct"
-    "AIAssistantResponse\"\0002\236\001\n\017ShippingServic"
-    "e\022C\n\010GetQuote\022\031.oteldemo.GetQuoteRequest"
-    "\032\032.oteldemo.GetQuoteResponse\"\000\022F\n\tShipOr"
-    "der\022\032.oteldemo.ShipOrderRequest\032\033.otelde"
-    "mo.ShipOrderResponse\"\0002\253\001\n\017CurrencyServi"
-    "ce\022U\n\026GetSupportedCurrencies\022\017.oteldemo."
-    "Empty\032(.oteldemo.GetSupportedCurrenciesR"
-    "esponse\"\000\022A\n\007Convert\022#.oteldemo.Currency"
-    "ConversionRequest\032\017.oteldemo.Money\"\0002O\n\016"
-    "PaymentService\022=\n\006Charge\022\027.oteldemo.Char"
-    "geRequest\032\030.oteldemo.ChargeResponse\"\0002b\n"
-    "\014EmailService\022R\n\025SendOrderConfirmation\022&"
-    ".oteldemo.SendOrderConfirmationRequest\032\017"
-    ".oteldemo.Empty\"\0002\\\n\017CheckoutService\022I\n\n"
-    "PlaceOrder\022\033.oteldemo.PlaceOrderRequest\032"
-    "\034.oteldemo.PlaceOrderResponse\"\0002B\n\tAdSer"
-    "vice\0225\n\006GetAds\022\023.oteldemo.AdRequest\032\024.ot"
-    "eldemo.AdResponse\"\0002\377\002\n\022FeatureFlagServi"
-    "ce\022@\n\007GetFlag\022\030.oteldemo.GetFlagRequest\032"
-    "\031.oteldemo.GetFlagResponse\"\000\022I\n\nCreateFl"
-    "ag\022\033.oteldemo.CreateFlagRequest\032\034.otelde"
-    "mo.CreateFlagResponse\"\000\022I\n\nUpdateFlag\022\033."
-    "oteldemo.UpdateFlagRequest\032\034.oteldemo.Up"
-    "dateFlagResponse\"\000\022F\n\tListFlags\022\032.otelde"
-    "mo.ListFlagsRequest\032\033.oteldemo.ListFlags"
-    "Response\"\000\022I\n\nDeleteFlag\022\033.oteldemo.Dele"
-    "teFlagRequest\032\034.oteldemo.DeleteFlagRespo"
-    "nse\"\000B\023Z\021genproto/oteldemob\006proto3"
+    "(\t\"Y\n\037ListRecommendationsBatchRequest\0226\n"
+    "\010requests\030\001 \003(\0132$.oteldemo.ListRecommend"
+    "ationsRequest\"\\\n ListRecommendationsBatc"
+    "hResponse\0228\n\tresponses\030\001 \003(\0132%.oteldemo."
+    "ListRecommendationsResponse\"\201\001\n\007Product\022"
+    "\n\n\002id\030\001 \001(\t\022\014\n\004name\030\002 \001(\t\022\023\n\013description"
+    "\030\003 \001(\t\022\017\n\007picture\030\004 \001(\t\022\"\n\tprice_usd\030\005 \001"
+    "(\0132\017.oteldemo.Money\022\022\n\ncategories\030\006 \003(\t\""
+    ";\n\024ListProductsResponse\022#\n\010products\030\001 \003("
+    "\0132\021.oteldemo.Product\"\037\n\021GetProductReques"
+    "t\022\n\n\002id\030\001 \001(\t\"&\n\025SearchProductsRequest\022\r"
+    "\n\005query\030\001 \001(\t\"<\n\026SearchProductsResponse\022"
+    "\"\n\007results\030\001 \003(\0132\021.oteldemo.Product\"E\n\rP"
+    "roductReview\022\020\n\010username\030\001 \001(\t\022\023\n\013descri"
+    "ption\030\002 \001(\t\022\r\n\005score\030\003 \001(\t\".\n\030GetProduct"
+    "ReviewsRequest\022\022\n\nproduct_id\030\001 \001(\t\"M\n\031Ge"
+    "tProductReviewsResponse\0220\n\017product_revie"
+    "ws\030\001 \003(\0132\027.oteldemo.ProductReview\"9\n#Get"
+    "AverageProductReviewScoreRequest\022\022\n\nprod"
+    "uct_id\030\001 \001(\t\"=\n$GetAverageProductReviewS"
+    "coreResponse\022\025\n\raverage_score\030\001 \001(\t\";\n%G"
+    "etProductReviewScoreHistogramRequest\022\022\n\n"
+    "product_id\030\001 \001(\t\"j\n&GetProductReviewScor"
+    "eHistogramResponse\022\024\n\014review_count\030\001 \001(\005"
+    "\022\025\n\raverage_score\030\002 \001(\t\022\023\n\013star_counts\030\003"
+    " \003(\005\"4\n\035GetProductReviewsBatchRequest\022\023\n"
+    "\013product_ids\030\001 \003(\t\"V\n\016ProductReviews\022\022\n\n"
+    "product_id\030\001 \001(\t\0220\n\017product_reviews\030\002 \003("
+    "\0132\027.oteldemo.ProductReview\"S\n\036GetProduct"
+    "ReviewsBatchResponse\0221\n\017product_reviews\030"
+    "\001 \003(\0132\030.oteldemo.ProductReviews\"3\n\034GetAv"
+    "erageScoresBatchRequest\022\023\n\013product_ids\030\001"
+    " \003(\t\"@\n\023ProductAverageScore\022\022\n\nproduct_i"
+    "d\030\001 \001(\t\022\025\n\raverage_score\030\002 \001(\t\"V\n\035GetAve"
+    "rageScoresBatchResponse\0225\n\016average_score"
+    "s\030\001 \003(\0132\035.oteldemo.ProductAverageScore\"q"
+    "\n\034GetProductReviewsPageRequest\022\022\n\nproduc"
+    "t_id\030\001 \001(\t\022\021\n\tpage_size\030\002 \001(\005\022\022\n\npage_to"
+    "ken\030\003 \001(\t\022\026\n\016order_by_score\030\004 \001(\010\"j\n\035Get"
+    "ProductReviewsPageResponse\0220\n\017product_re"
+    "views\030\001 \003(\0132\027.oteldemo.ProductReview\022\027\n\017"
+    "next_page_token\030\002 \001(\t\"1\n\033StreamProductRe"
+    "viewsRequest\022\022\n\nproduct_id\030\001 \001(\t\"D\n\034AskP"
+    "roductAIAssistantRequest\022\022\n\nproduct_id\030\001"
+    " \001(\t\022\020\n\010question\030\002 \001(\t\"1\n\035AskProductAIAs"
+    "sistantResponse\022\020\n\010response\030\001 \001(\t\"X\n\017Get"
+    "QuoteRequest\022\"\n\007address\030\001 \001(\0132\021.oteldemo"
+    ".Address\022!\n\005items\030\002 \003(\0132\022.oteldemo.CartI"
+    "tem\"5\n\020GetQuoteResponse\022!\n\010cost_usd\030\001 \001("
+    "\0132\017.oteldemo.Money\"Y\n\020ShipOrderRequest\022\""
+    "\n\007address\030\001 \001(\0132\021.oteldemo.Address\022!\n\005it"
+    "ems\030\002 \003(\0132\022.oteldemo.CartItem\"(\n\021ShipOrd"
+    "erResponse\022\023\n\013tracking_id\030\001 \001(\t\"a\n\007Addre"
+    "ss\022\026\n\016street_address\030\001 \001(\t\022\014\n\004city\030\002 \001(\t"
+    "\022\r\n\005state\030\003 \001(\t\022\017\n\007country\030\004 \001(\t\022\020\n\010zip_"
+    "code\030\005 \001(\t\"<\n\005Money\022\025\n\rcurrency_code\030\001 \001"
+    "(\t\022\r\n\005units\030\002 \001(\003\022\r\n\005nanos\030\003 \001(\005\"8\n\036GetS"
+    "upportedCurrenciesResponse\022\026\n\016currency_c"
+    "odes\030\001 \003(\t\"K\n\031CurrencyConversionRequest\022"
+    "\035\n\004from\030\001 \001(\0132\017.oteldemo.Money\022\017\n\007to_cod"
+    "e\030\002 \001(\t\"\220\001\n\016CreditCardInfo\022\032\n\022credit_car"
+    "d_number\030\001 \001(\t\022\027\n\017credit_card_cvv\030\002 \001(\005\022"
+    "#\n\033credit_card_expiration_year\030\003 \001(\005\022$\n\034"
+    "credit_card_expiration_month\030\004 \001(\005\"_\n\rCh"
+    "argeRequest\022\037\n\006amount\030\001 \001(\0132\017.oteldemo.M"
+    "oney\022-\n\013credit_card\030\002 \001(\0132\030.oteldemo.Cre"
+    "ditCardInfo\"(\n\016ChargeResponse\022\026\n\016transac"
+    "tion_id\030\001 \001(\t\"L\n\tOrderItem\022 \n\004item\030\001 \001(\013"
+    "2\022.oteldemo.CartItem\022\035\n\004cost\030\002 \001(\0132\017.ote"
+    "ldemo.Money\"\266\001\n\013OrderResult\022\020\n\010order_id\030"
+    "\001 \001(\t\022\034\n\024shipping_tracking_id\030\002 \001(\t\022&\n\rs"
+    "hipping_cost\030\003 \001(\0132\017.oteldemo.Money\022+\n\020s"
+    "hipping_address\030\004 \001(\0132\021.oteldemo.Address"
+    "\022\"\n\005items\030\005 \003(\0132\023.oteldemo.OrderItem\"S\n\034"
+    "SendOrderConfirmationRequest\022\r\n\005email\030\001 "
+    "\001(\t\022$\n\005order\030\002 \001(\0132\025.oteldemo.OrderResul"
+    "t\"\235\001\n\021PlaceOrderRequest\022\017\n\007user_id\030\001 \001(\t"
+    "\022\025\n\ruser_currency\030\002 \001(\t\022\"\n\007address\030\003 \001(\013"
+    "2\021.oteldemo.Address\022\r\n\005email\030\005 \001(\t\022-\n\013cr"
+    "edit_card\030\006 \001(\0132\030.oteldemo.CreditCardInf"
+    "o\":\n\022PlaceOrderResponse\022$\n\005order\030\001 \001(\0132\025"
+    ".oteldemo.OrderResult\"!\n\tAdRequest\022\024\n\014co"
+    "ntext_keys\030\001 \003(\t\"\'\n\nAdResponse\022\031\n\003ads\030\001 "
+    "\003(\0132\014.oteldemo.Ad\"(\n\002Ad\022\024\n\014redirect_url\030"
+    "\001 \001(\t\022\014\n\004text\030\002 \001(\t\":\n\004Flag\022\014\n\004name\030\001 \001("
+    "\t\022\023\n\013description\030\002 \001(\t\022\017\n\007enabled\030\003 \001(\010\""
+    "\036\n\016GetFlagRequest\022\014\n\004name\030\001 \001(\t\"/\n\017GetFl"
+    "agResponse\022\034\n\004flag\030\001 \001(\0132\016.oteldemo.Flag"
+    "\"G\n\021CreateFlagRequest\022\014\n\004name\030\001 \001(\t\022\023\n\013d"
+    "escription\030\002 \001(\t\022\017\n\007enabled\030\003 \001(\010\"2\n\022Cre"
+    "ateFlagResponse\022\034\n\004flag\030\001 \001(\0132\016.oteldemo"
+    ".Flag\"2\n\021UpdateFlagRequest\022\014\n\004name\030\001 \001(\t"
+    "\022\017\n\007enabled\030\002 \001(\010\"\024\n\022UpdateFlagResponse\""
+    "\022\n\020ListFlagsRequest\"1\n\021ListFlagsResponse"
+    "\022\034\n\004flag\030\001 \003(\0132\016.oteldemo.Flag\"!\n\021Delete"
+    "FlagRequest\022\014\n\004name\030\001 \001(\t\"\024\n\022DeleteFlagR"
+    "esponse2\270\001\n\013CartService\0226\n\007AddItem\022\030.ote"
+    "ldemo.AddItemRequest\032\017.oteldemo.Empty\"\000\022"
+    "5\n\007GetCart\022\030.oteldemo.GetCartRequest\032\016.o"
+    "teldemo.Cart\"\000\022:\n\tEmptyCart\022\032.oteldemo.E"
+    "mptyCartRequest\032\017.oteldemo.Empty\"\0002\362\001\n\025R"
+    "ecommendationService\022d\n\023ListRecommendati"
+    "ons\022$.oteldemo.ListRecommendationsReques"
+    "t\032%.oteldemo.ListRecommendationsResponse"
+    "\"\000\022s\n\030ListRecommendationsBatch\022).oteldem"
+    "o.ListRecommendationsBatchRequest\032*.otel"
+    "demo.ListRecommendationsBatchResponse\"\0002"
+    "\361\001\n\025ProductCatalogService\022A\n\014ListProduct"
+    "s\022\017.oteldemo.Empty\032\036.oteldemo.ListProduc"
+    "tsResponse\"\000\022>\n\nGetProduct\022\033.oteldemo.Ge"
+    "tProductRequest\032\021.oteldemo.Product\"\000\022U\n\016"
+    "SearchProducts\022\037.oteldemo.SearchProducts"
+    "Request\032 .oteldemo.SearchProductsRespons"
+    "e\"\0002\216\007\n\024ProductReviewService\022^\n\021GetProdu"
+    "ctReviews\022\".oteldemo.GetProductReviewsRe"
+    "quest\032#.oteldemo.GetProductReviewsRespon"
+    "se\"\000\022\177\n\034GetAverageProductReviewScore\022-.o"
+    "teldemo.GetAverageProductReviewScoreRequ"
+    "est\032..oteldemo.GetAverageProductReviewSc"
+    "oreResponse\"\000\022j\n\025AskProductAIAssistant\022&"
+    ".oteldemo.AskProductAIAssistantRequest\032\'"
+    ".oteldemo.AskProductAIAssistantResponse\""
+    "\000\022\205\001\n\036GetProductReviewScoreHistogram\022/.o"
+    "teldemo.GetProductReviewScoreHistogramRe"
+    "quest\0320.oteldemo.GetProductReviewScoreHi"
+    "stogramResponse\"\000\022m\n\026GetProductReviewsBa"
+    "tch\022\'.oteldemo.GetProductReviewsBatchReq"
+    "uest\032(.oteldemo.GetProductReviewsBatchRe"
+    "sponse\"\000\022j\n\025GetAverageScoresBatch\022&.otel"
+    "demo.GetAverageScoresBatchRequest\032\'.otel"
+    "demo.GetAverageScoresBatchResponse\"\000\022j\n\025"
+    "GetProductReviewsPage\022&.oteldemo.GetProd"
+    "uctReviewsPageRequest\032\'.oteldemo.GetProd"
+    "uctReviewsPageResponse\"\000\022Z\n\024StreamProduc"
+    "tReviews\022%.oteldemo.StreamProductReviews"
+    "Request\032\027.oteldemo.ProductReview\"\0000\0012\236\001\n"
+    "\017ShippingService\022C\n\010GetQuote\022\031.oteldemo."
+    "GetQuoteRequest\032\032.oteldemo.GetQuoteRespo"
+    "nse\"\000\022F\n\tShipOrder\022\032.oteldemo.ShipOrderR"
+    "equest\032\033.oteldemo.ShipOrderResponse\"\0002\253\001"
+    "\n\017CurrencyService\022U\n\026GetSupportedCurrenc"
+    "ies\022\017.oteldemo.Empty\032(.oteldemo.GetSuppo"
+    "rtedCurrenciesResponse\"\000\022A\n\007Convert\022#.ot"
+    "eldemo.CurrencyConversionRequest\032\017.oteld"
+    "emo.Money\"\0002O\n\016PaymentService\022=\n\006Charge\022"
+    "\027.oteldemo.ChargeRequest\032\030.oteldemo.Char"
+    "geResponse\"\0002b\n\014EmailService\022R\n\025SendOrde"
+    "rConfirmation\022&.oteldemo.SendOrderConfir"
+    "mationRequest\032\017.oteldemo.Empty\"\0002\\\n\017Chec"
+    "koutService\022I\n\nPlaceOrder\022\033.oteldemo.Pla"
+    "ceOrderRequest\032\034.oteldemo.PlaceOrderResp"
+    "onse\"\0002B\n\tAdService\0225\n\006GetAds\022\023.oteldemo"
+    ".AdRequest\032\024.oteldemo.AdResponse\"\0002\377\002\n\022F"
+    "eatureFlagService\022@\n\007GetFlag\022\030.oteldemo."
+    "GetFlagRequest\032\031.oteldemo.GetFlagRespons"
+    "e\"\000\022I\n\nCreateFlag\022\033.oteldemo.CreateFlagR"
+    "equest\032\034.oteldemo.CreateFlagResponse\"\000\022I"
+    "\n\nUpdateFlag\022\033.oteldemo.UpdateFlagReques"
+    "t\032\034.oteldemo.UpdateFlagResponse\"\000\022F\n\tLis"
+    "tFlags\022\032.oteldemo.ListFlagsRequest\032\033.ote"
+    "ldemo.ListFlagsResponse\"\000\022I\n\nDeleteFlag\022"
+    "\033.oteldemo.DeleteFlagRequest\032\034.oteldemo."
+    "DeleteFlagResponse\"\000B\023Z\021genproto/oteldem"
+    "ob\006proto3"
 };
 static ::absl::once_flag descriptor_table_demo_2eproto_once;
 const ::_pbi::DescriptorTable descriptor_table_demo_2eproto = {
     false,
     false,
-    5194,
+    6929,
     descriptor_table_protodef_demo_2eproto,
     "demo.proto",
     &descriptor_table_demo_2eproto_once,
     nullptr,
     0,
-    50,
+    63,
     schemas,
     file_default_instances,
     TableStruct_demo_2eproto::offsets,
@@ -3298,18 +3737,362 @@ void ListRecommendationsResponse::InternalSwap(ListRecommendationsResponse* othe
 }
 // ===================================================================
 
-class Product::_Internal {
+class ListRecommendationsBatchRequest::_Internal {
  public:
-  using HasBits = decltype(std::declval<Product>()._impl_._has_bits_);
-  static constexpr ::int32_t kHasBitsOffset =
-    8 * PROTOBUF_FIELD_OFFSET(Product, _impl_._has_bits_);
-  static const ::oteldemo::Money& price_usd(const Product* msg);
-  static void set_has_price_usd(HasBits* has_bits) {
-    (*has_bits)[0] |= 1u;
-  }
 };
 
-const ::oteldemo::Money& Product::_Internal::price_usd(const Product* msg) {
+ListRecommendationsBatchRequest::ListRecommendationsBatchRequest(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.ListRecommendationsBatchRequest)
+}
+ListRecommendationsBatchRequest::ListRecommendationsBatchRequest(const ListRecommendationsBatchRequest& from) : ::google::protobuf::Message() {
+  ListRecommendationsBatchRequest* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.requests_){from._impl_.requests_},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.ListRecommendationsBatchRequest)
+}
+inline void ListRecommendationsBatchRequest::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.requests_){arena},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+}
+ListRecommendationsBatchRequest::~ListRecommendationsBatchRequest() {
+  // @@protoc_insertion_point(destructor:oteldemo.ListRecommendationsBatchRequest)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void ListRecommendationsBatchRequest::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.requests_.~RepeatedPtrField();
+}
+void ListRecommendationsBatchRequest::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void ListRecommendationsBatchRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.ListRecommendationsBatchRequest)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _internal_mutable_requests()->Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* ListRecommendationsBatchRequest::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 1, 0, 2> ListRecommendationsBatchRequest::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    1,  // num_aux_entries
+    offsetof(decltype(_table_), aux_entries),
+    &_ListRecommendationsBatchRequest_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // repeated .oteldemo.ListRecommendationsRequest requests = 1;
+    {::_pbi::TcParser::FastMtR1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchRequest, _impl_.requests_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // repeated .oteldemo.ListRecommendationsRequest requests = 1;
+    {PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchRequest, _impl_.requests_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kMessage | ::_fl::kTvTable)},
+  }}, {{
+    {::_pbi::TcParser::GetTable<::oteldemo::ListRecommendationsRequest>()},
+  }}, {{
+  }},
+};
+
+::uint8_t* ListRecommendationsBatchRequest::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.ListRecommendationsBatchRequest)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // repeated .oteldemo.ListRecommendationsRequest requests = 1;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_requests_size()); i < n; i++) {
+    const auto& repfield = this->_internal_requests().Get(i);
+    target = ::google::protobuf::internal::WireFormatLite::
+        InternalWriteMessage(1, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.ListRecommendationsBatchRequest)
+  return target;
+}
+
+::size_t ListRecommendationsBatchRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.ListRecommendationsBatchRequest)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .oteldemo.ListRecommendationsRequest requests = 1;
+  total_size += 1UL * this->_internal_requests_size();
+  for (const auto& msg : this->_internal_requests()) {
+    total_size +=
+      ::google::protobuf::internal::WireFormatLite::MessageSize(msg);
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData ListRecommendationsBatchRequest::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    ListRecommendationsBatchRequest::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*ListRecommendationsBatchRequest::GetClassData() const { return &_class_data_; }
+
+
+void ListRecommendationsBatchRequest::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<ListRecommendationsBatchRequest*>(&to_msg);
+  auto& from = static_cast<const ListRecommendationsBatchRequest&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.ListRecommendationsBatchRequest)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_requests()->MergeFrom(from._internal_requests());
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ListRecommendationsBatchRequest::CopyFrom(const ListRecommendationsBatchRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.ListRecommendationsBatchRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool ListRecommendationsBatchRequest::IsInitialized() const {
+  return true;
+}
+
+void ListRecommendationsBatchRequest::InternalSwap(ListRecommendationsBatchRequest* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.requests_.InternalSwap(&other->_impl_.requests_);
+}
+
+::google::protobuf::Metadata ListRecommendationsBatchRequest::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[8]);
+}
+// ===================================================================
+
+class ListRecommendationsBatchResponse::_Internal {
+ public:
+};
+
+ListRecommendationsBatchResponse::ListRecommendationsBatchResponse(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.ListRecommendationsBatchResponse)
+}
+ListRecommendationsBatchResponse::ListRecommendationsBatchResponse(const ListRecommendationsBatchResponse& from) : ::google::protobuf::Message() {
+  ListRecommendationsBatchResponse* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.responses_){from._impl_.responses_},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.ListRecommendationsBatchResponse)
+}
+inline void ListRecommendationsBatchResponse::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.responses_){arena},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+}
+ListRecommendationsBatchResponse::~ListRecommendationsBatchResponse() {
+  // @@protoc_insertion_point(destructor:oteldemo.ListRecommendationsBatchResponse)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void ListRecommendationsBatchResponse::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.responses_.~RepeatedPtrField();
+}
+void ListRecommendationsBatchResponse::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void ListRecommendationsBatchResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.ListRecommendationsBatchResponse)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _internal_mutable_responses()->Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* ListRecommendationsBatchResponse::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 1, 0, 2> ListRecommendationsBatchResponse::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    1,  // num_aux_entries
+    offsetof(decltype(_table_), aux_entries),
+    &_ListRecommendationsBatchResponse_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // repeated .oteldemo.ListRecommendationsResponse responses = 1;
+    {::_pbi::TcParser::FastMtR1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchResponse, _impl_.responses_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // repeated .oteldemo.ListRecommendationsResponse responses = 1;
+    {PROTOBUF_FIELD_OFFSET(ListRecommendationsBatchResponse, _impl_.responses_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kMessage | ::_fl::kTvTable)},
+  }}, {{
+    {::_pbi::TcParser::GetTable<::oteldemo::ListRecommendationsResponse>()},
+  }}, {{
+  }},
+};
+
+::uint8_t* ListRecommendationsBatchResponse::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.ListRecommendationsBatchResponse)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // repeated .oteldemo.ListRecommendationsResponse responses = 1;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_responses_size()); i < n; i++) {
+    const auto& repfield = this->_internal_responses().Get(i);
+    target = ::google::protobuf::internal::WireFormatLite::
+        InternalWriteMessage(1, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.ListRecommendationsBatchResponse)
+  return target;
+}
+
+::size_t ListRecommendationsBatchResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.ListRecommendationsBatchResponse)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .oteldemo.ListRecommendationsResponse responses = 1;
+  total_size += 1UL * this->_internal_responses_size();
+  for (const auto& msg : this->_internal_responses()) {
+    total_size +=
+      ::google::protobuf::internal::WireFormatLite::MessageSize(msg);
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData ListRecommendationsBatchResponse::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    ListRecommendationsBatchResponse::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*ListRecommendationsBatchResponse::GetClassData() const { return &_class_data_; }
+
+
+void ListRecommendationsBatchResponse::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<ListRecommendationsBatchResponse*>(&to_msg);
+  auto& from = static_cast<const ListRecommendationsBatchResponse&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.ListRecommendationsBatchResponse)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_responses()->MergeFrom(from._internal_responses());
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ListRecommendationsBatchResponse::CopyFrom(const ListRecommendationsBatchResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.ListRecommendationsBatchResponse)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool ListRecommendationsBatchResponse::IsInitialized() const {
+  return true;
+}
+
+void ListRecommendationsBatchResponse::InternalSwap(ListRecommendationsBatchResponse* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.responses_.InternalSwap(&other->_impl_.responses_);
+}
+
+::google::protobuf::Metadata ListRecommendationsBatchResponse::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[9]);
+}
+// ===================================================================
+
+class Product::_Internal {
+ public:
+  using HasBits = decltype(std::declval<Product>()._impl_._has_bits_);
+  static constexpr ::int32_t kHasBitsOffset =
+    8 * PROTOBUF_FIELD_OFFSET(Product, _impl_._has_bits_);
+  static const ::oteldemo::Money& price_usd(const Product* msg);
+  static void set_has_price_usd(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+};
+
+const ::oteldemo::Money& Product::_Internal::price_usd(const Product* msg) {
   return *msg->_impl_.price_usd_;
 }
 Product::Product(::google::protobuf::Arena* arena)
@@ -3689,7 +4472,7 @@ void Product::InternalSwap(Product* other) {
 ::google::protobuf::Metadata Product::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[8]);
+      file_level_metadata_demo_2eproto[10]);
 }
 // ===================================================================
 
@@ -3861,7 +4644,7 @@ void ListProductsResponse::InternalSwap(ListProductsResponse* other) {
 ::google::protobuf::Metadata ListProductsResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[9]);
+      file_level_metadata_demo_2eproto[11]);
 }
 // ===================================================================
 
@@ -4052,7 +4835,7 @@ void GetProductRequest::InternalSwap(GetProductRequest* other) {
 ::google::protobuf::Metadata GetProductRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[10]);
+      file_level_metadata_demo_2eproto[12]);
 }
 // ===================================================================
 
@@ -4243,7 +5026,7 @@ void SearchProductsRequest::InternalSwap(SearchProductsRequest* other) {
 ::google::protobuf::Metadata SearchProductsRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[11]);
+      file_level_metadata_demo_2eproto[13]);
 }
 // ===================================================================
 
@@ -4415,7 +5198,7 @@ void SearchProductsResponse::InternalSwap(SearchProductsResponse* other) {
 ::google::protobuf::Metadata SearchProductsResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[12]);
+      file_level_metadata_demo_2eproto[14]);
 }
 // ===================================================================
 
@@ -4689,7 +5472,7 @@ void ProductReview::InternalSwap(ProductReview* other) {
 ::google::protobuf::Metadata ProductReview::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[13]);
+      file_level_metadata_demo_2eproto[15]);
 }
 // ===================================================================
 
@@ -4880,7 +5663,7 @@ void GetProductReviewsRequest::InternalSwap(GetProductReviewsRequest* other) {
 ::google::protobuf::Metadata GetProductReviewsRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[14]);
+      file_level_metadata_demo_2eproto[16]);
 }
 // ===================================================================
 
@@ -5032,93 +5815,2359 @@ void GetProductReviewsResponse::MergeImpl(::google::protobuf::Message& to_msg, c
   _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
 }
 
-void GetProductReviewsResponse::CopyFrom(const GetProductReviewsResponse& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetProductReviewsResponse)
+void GetProductReviewsResponse::CopyFrom(const GetProductReviewsResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetProductReviewsResponse)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool GetProductReviewsResponse::IsInitialized() const {
+  return true;
+}
+
+void GetProductReviewsResponse::InternalSwap(GetProductReviewsResponse* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.product_reviews_.InternalSwap(&other->_impl_.product_reviews_);
+}
+
+::google::protobuf::Metadata GetProductReviewsResponse::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[17]);
+}
+// ===================================================================
+
+class GetAverageProductReviewScoreRequest::_Internal {
+ public:
+};
+
+GetAverageProductReviewScoreRequest::GetAverageProductReviewScoreRequest(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.GetAverageProductReviewScoreRequest)
+}
+GetAverageProductReviewScoreRequest::GetAverageProductReviewScoreRequest(const GetAverageProductReviewScoreRequest& from) : ::google::protobuf::Message() {
+  GetAverageProductReviewScoreRequest* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_id_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  _impl_.product_id_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.product_id_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (!from._internal_product_id().empty()) {
+    _this->_impl_.product_id_.Set(from._internal_product_id(), _this->GetArenaForAllocation());
+  }
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.GetAverageProductReviewScoreRequest)
+}
+inline void GetAverageProductReviewScoreRequest::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_id_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _impl_.product_id_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.product_id_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+GetAverageProductReviewScoreRequest::~GetAverageProductReviewScoreRequest() {
+  // @@protoc_insertion_point(destructor:oteldemo.GetAverageProductReviewScoreRequest)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void GetAverageProductReviewScoreRequest::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.product_id_.Destroy();
+}
+void GetAverageProductReviewScoreRequest::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void GetAverageProductReviewScoreRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.GetAverageProductReviewScoreRequest)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.product_id_.ClearToEmpty();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* GetAverageProductReviewScoreRequest::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 0, 63, 2> GetAverageProductReviewScoreRequest::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    &_GetAverageProductReviewScoreRequest_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // string product_id = 1;
+    {::_pbi::TcParser::FastUS1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetAverageProductReviewScoreRequest, _impl_.product_id_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // string product_id = 1;
+    {PROTOBUF_FIELD_OFFSET(GetAverageProductReviewScoreRequest, _impl_.product_id_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
+  }},
+  // no aux_entries
+  {{
+    "\54\12\0\0\0\0\0\0"
+    "oteldemo.GetAverageProductReviewScoreRequest"
+    "product_id"
+  }},
+};
+
+::uint8_t* GetAverageProductReviewScoreRequest::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetAverageProductReviewScoreRequest)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    const std::string& _s = this->_internal_product_id();
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetAverageProductReviewScoreRequest.product_id");
+    target = stream->WriteStringMaybeAliased(1, _s, target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetAverageProductReviewScoreRequest)
+  return target;
+}
+
+::size_t GetAverageProductReviewScoreRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetAverageProductReviewScoreRequest)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                    this->_internal_product_id());
+  }
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData GetAverageProductReviewScoreRequest::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    GetAverageProductReviewScoreRequest::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*GetAverageProductReviewScoreRequest::GetClassData() const { return &_class_data_; }
+
+
+void GetAverageProductReviewScoreRequest::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<GetAverageProductReviewScoreRequest*>(&to_msg);
+  auto& from = static_cast<const GetAverageProductReviewScoreRequest&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetAverageProductReviewScoreRequest)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (!from._internal_product_id().empty()) {
+    _this->_internal_set_product_id(from._internal_product_id());
+  }
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void GetAverageProductReviewScoreRequest::CopyFrom(const GetAverageProductReviewScoreRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetAverageProductReviewScoreRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool GetAverageProductReviewScoreRequest::IsInitialized() const {
+  return true;
+}
+
+void GetAverageProductReviewScoreRequest::InternalSwap(GetAverageProductReviewScoreRequest* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.product_id_, lhs_arena,
+                                       &other->_impl_.product_id_, rhs_arena);
+}
+
+::google::protobuf::Metadata GetAverageProductReviewScoreRequest::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[18]);
+}
+// ===================================================================
+
+class GetAverageProductReviewScoreResponse::_Internal {
+ public:
+};
+
+GetAverageProductReviewScoreResponse::GetAverageProductReviewScoreResponse(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.GetAverageProductReviewScoreResponse)
+}
+GetAverageProductReviewScoreResponse::GetAverageProductReviewScoreResponse(const GetAverageProductReviewScoreResponse& from) : ::google::protobuf::Message() {
+  GetAverageProductReviewScoreResponse* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.average_score_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  _impl_.average_score_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.average_score_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (!from._internal_average_score().empty()) {
+    _this->_impl_.average_score_.Set(from._internal_average_score(), _this->GetArenaForAllocation());
+  }
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.GetAverageProductReviewScoreResponse)
+}
+inline void GetAverageProductReviewScoreResponse::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.average_score_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _impl_.average_score_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.average_score_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+GetAverageProductReviewScoreResponse::~GetAverageProductReviewScoreResponse() {
+  // @@protoc_insertion_point(destructor:oteldemo.GetAverageProductReviewScoreResponse)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void GetAverageProductReviewScoreResponse::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.average_score_.Destroy();
+}
+void GetAverageProductReviewScoreResponse::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void GetAverageProductReviewScoreResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.GetAverageProductReviewScoreResponse)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.average_score_.ClearToEmpty();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* GetAverageProductReviewScoreResponse::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 0, 67, 2> GetAverageProductReviewScoreResponse::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    &_GetAverageProductReviewScoreResponse_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // string average_score = 1;
+    {::_pbi::TcParser::FastUS1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetAverageProductReviewScoreResponse, _impl_.average_score_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // string average_score = 1;
+    {PROTOBUF_FIELD_OFFSET(GetAverageProductReviewScoreResponse, _impl_.average_score_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
+  }},
+  // no aux_entries
+  {{
+    "\55\15\0\0\0\0\0\0"
+    "oteldemo.GetAverageProductReviewScoreResponse"
+    "average_score"
+  }},
+};
+
+::uint8_t* GetAverageProductReviewScoreResponse::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetAverageProductReviewScoreResponse)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // string average_score = 1;
+  if (!this->_internal_average_score().empty()) {
+    const std::string& _s = this->_internal_average_score();
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetAverageProductReviewScoreResponse.average_score");
+    target = stream->WriteStringMaybeAliased(1, _s, target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetAverageProductReviewScoreResponse)
+  return target;
+}
+
+::size_t GetAverageProductReviewScoreResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetAverageProductReviewScoreResponse)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // string average_score = 1;
+  if (!this->_internal_average_score().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                    this->_internal_average_score());
+  }
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData GetAverageProductReviewScoreResponse::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    GetAverageProductReviewScoreResponse::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*GetAverageProductReviewScoreResponse::GetClassData() const { return &_class_data_; }
+
+
+void GetAverageProductReviewScoreResponse::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<GetAverageProductReviewScoreResponse*>(&to_msg);
+  auto& from = static_cast<const GetAverageProductReviewScoreResponse&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetAverageProductReviewScoreResponse)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (!from._internal_average_score().empty()) {
+    _this->_internal_set_average_score(from._internal_average_score());
+  }
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void GetAverageProductReviewScoreResponse::CopyFrom(const GetAverageProductReviewScoreResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetAverageProductReviewScoreResponse)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool GetAverageProductReviewScoreResponse::IsInitialized() const {
+  return true;
+}
+
+void GetAverageProductReviewScoreResponse::InternalSwap(GetAverageProductReviewScoreResponse* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.average_score_, lhs_arena,
+                                       &other->_impl_.average_score_, rhs_arena);
+}
+
+::google::protobuf::Metadata GetAverageProductReviewScoreResponse::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[19]);
+}
+// ===================================================================
+
+class GetProductReviewScoreHistogramRequest::_Internal {
+ public:
+};
+
+GetProductReviewScoreHistogramRequest::GetProductReviewScoreHistogramRequest(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.GetProductReviewScoreHistogramRequest)
+}
+GetProductReviewScoreHistogramRequest::GetProductReviewScoreHistogramRequest(const GetProductReviewScoreHistogramRequest& from) : ::google::protobuf::Message() {
+  GetProductReviewScoreHistogramRequest* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_id_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  _impl_.product_id_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.product_id_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (!from._internal_product_id().empty()) {
+    _this->_impl_.product_id_.Set(from._internal_product_id(), _this->GetArenaForAllocation());
+  }
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.GetProductReviewScoreHistogramRequest)
+}
+inline void GetProductReviewScoreHistogramRequest::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_id_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _impl_.product_id_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.product_id_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+GetProductReviewScoreHistogramRequest::~GetProductReviewScoreHistogramRequest() {
+  // @@protoc_insertion_point(destructor:oteldemo.GetProductReviewScoreHistogramRequest)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void GetProductReviewScoreHistogramRequest::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.product_id_.Destroy();
+}
+void GetProductReviewScoreHistogramRequest::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void GetProductReviewScoreHistogramRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.GetProductReviewScoreHistogramRequest)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.product_id_.ClearToEmpty();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* GetProductReviewScoreHistogramRequest::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 0, 65, 2> GetProductReviewScoreHistogramRequest::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    &_GetProductReviewScoreHistogramRequest_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // string product_id = 1;
+    {::_pbi::TcParser::FastUS1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewScoreHistogramRequest, _impl_.product_id_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // string product_id = 1;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewScoreHistogramRequest, _impl_.product_id_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
+  }},
+  // no aux_entries
+  {{
+    "\56\12\0\0\0\0\0\0"
+    "oteldemo.GetProductReviewScoreHistogramRequest"
+    "product_id"
+  }},
+};
+
+::uint8_t* GetProductReviewScoreHistogramRequest::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetProductReviewScoreHistogramRequest)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    const std::string& _s = this->_internal_product_id();
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetProductReviewScoreHistogramRequest.product_id");
+    target = stream->WriteStringMaybeAliased(1, _s, target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetProductReviewScoreHistogramRequest)
+  return target;
+}
+
+::size_t GetProductReviewScoreHistogramRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetProductReviewScoreHistogramRequest)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                    this->_internal_product_id());
+  }
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData GetProductReviewScoreHistogramRequest::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    GetProductReviewScoreHistogramRequest::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*GetProductReviewScoreHistogramRequest::GetClassData() const { return &_class_data_; }
+
+
+void GetProductReviewScoreHistogramRequest::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<GetProductReviewScoreHistogramRequest*>(&to_msg);
+  auto& from = static_cast<const GetProductReviewScoreHistogramRequest&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetProductReviewScoreHistogramRequest)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (!from._internal_product_id().empty()) {
+    _this->_internal_set_product_id(from._internal_product_id());
+  }
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void GetProductReviewScoreHistogramRequest::CopyFrom(const GetProductReviewScoreHistogramRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetProductReviewScoreHistogramRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool GetProductReviewScoreHistogramRequest::IsInitialized() const {
+  return true;
+}
+
+void GetProductReviewScoreHistogramRequest::InternalSwap(GetProductReviewScoreHistogramRequest* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.product_id_, lhs_arena,
+                                       &other->_impl_.product_id_, rhs_arena);
+}
+
+::google::protobuf::Metadata GetProductReviewScoreHistogramRequest::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[20]);
+}
+// ===================================================================
+
+class GetProductReviewScoreHistogramResponse::_Internal {
+ public:
+};
+
+GetProductReviewScoreHistogramResponse::GetProductReviewScoreHistogramResponse(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.GetProductReviewScoreHistogramResponse)
+}
+GetProductReviewScoreHistogramResponse::GetProductReviewScoreHistogramResponse(const GetProductReviewScoreHistogramResponse& from) : ::google::protobuf::Message() {
+  GetProductReviewScoreHistogramResponse* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.star_counts_){from._impl_.star_counts_},
+      /* _impl_._star_counts_cached_byte_size_ = */ {0},
+      decltype(_impl_.average_score_){},
+      decltype(_impl_.review_count_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  _impl_.average_score_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.average_score_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (!from._internal_average_score().empty()) {
+    _this->_impl_.average_score_.Set(from._internal_average_score(), _this->GetArenaForAllocation());
+  }
+  _this->_impl_.review_count_ = from._impl_.review_count_;
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.GetProductReviewScoreHistogramResponse)
+}
+inline void GetProductReviewScoreHistogramResponse::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.star_counts_){arena},
+      /* _impl_._star_counts_cached_byte_size_ = */ {0},
+      decltype(_impl_.average_score_){},
+      decltype(_impl_.review_count_){0},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _impl_.average_score_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.average_score_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+GetProductReviewScoreHistogramResponse::~GetProductReviewScoreHistogramResponse() {
+  // @@protoc_insertion_point(destructor:oteldemo.GetProductReviewScoreHistogramResponse)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void GetProductReviewScoreHistogramResponse::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.star_counts_.~RepeatedField();
+  _impl_.average_score_.Destroy();
+}
+void GetProductReviewScoreHistogramResponse::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void GetProductReviewScoreHistogramResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.GetProductReviewScoreHistogramResponse)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _internal_mutable_star_counts()->Clear();
+  _impl_.average_score_.ClearToEmpty();
+  _impl_.review_count_ = 0;
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* GetProductReviewScoreHistogramResponse::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<2, 3, 0, 69, 2> GetProductReviewScoreHistogramResponse::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    3, 24,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967288,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    3,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    &_GetProductReviewScoreHistogramResponse_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    {::_pbi::TcParser::MiniParse, {}},
+    // int32 review_count = 1;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(GetProductReviewScoreHistogramResponse, _impl_.review_count_), 63>(),
+     {8, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewScoreHistogramResponse, _impl_.review_count_)}},
+    // string average_score = 2;
+    {::_pbi::TcParser::FastUS1,
+     {18, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewScoreHistogramResponse, _impl_.average_score_)}},
+    // repeated int32 star_counts = 3;
+    {::_pbi::TcParser::FastV32P1,
+     {26, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewScoreHistogramResponse, _impl_.star_counts_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // int32 review_count = 1;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewScoreHistogramResponse, _impl_.review_count_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kInt32)},
+    // string average_score = 2;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewScoreHistogramResponse, _impl_.average_score_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
+    // repeated int32 star_counts = 3;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewScoreHistogramResponse, _impl_.star_counts_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kPackedInt32)},
+  }},
+  // no aux_entries
+  {{
+    "\57\0\15\0\0\0\0\0"
+    "oteldemo.GetProductReviewScoreHistogramResponse"
+    "average_score"
+  }},
+};
+
+::uint8_t* GetProductReviewScoreHistogramResponse::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetProductReviewScoreHistogramResponse)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // int32 review_count = 1;
+  if (this->_internal_review_count() != 0) {
+    target = ::google::protobuf::internal::WireFormatLite::
+        WriteInt32ToArrayWithField<1>(
+            stream, this->_internal_review_count(), target);
+  }
+
+  // string average_score = 2;
+  if (!this->_internal_average_score().empty()) {
+    const std::string& _s = this->_internal_average_score();
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetProductReviewScoreHistogramResponse.average_score");
+    target = stream->WriteStringMaybeAliased(2, _s, target);
+  }
+
+  // repeated int32 star_counts = 3;
+  {
+    int byte_size = _impl_._star_counts_cached_byte_size_.Get();
+    if (byte_size > 0) {
+      target = stream->WriteInt32Packed(3, _internal_star_counts(),
+                                                 byte_size, target);
+    }
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetProductReviewScoreHistogramResponse)
+  return target;
+}
+
+::size_t GetProductReviewScoreHistogramResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetProductReviewScoreHistogramResponse)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated int32 star_counts = 3;
+  {
+    std::size_t data_size = ::_pbi::WireFormatLite::Int32Size(
+        this->_internal_star_counts())
+    ;
+    _impl_._star_counts_cached_byte_size_.Set(::_pbi::ToCachedSize(data_size));
+    std::size_t tag_size = data_size == 0
+        ? 0
+        : 1 + ::_pbi::WireFormatLite::Int32Size(
+                            static_cast<int32_t>(data_size))
+    ;
+    total_size += tag_size + data_size;
+  }
+  // string average_score = 2;
+  if (!this->_internal_average_score().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                    this->_internal_average_score());
+  }
+
+  // int32 review_count = 1;
+  if (this->_internal_review_count() != 0) {
+    total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(
+        this->_internal_review_count());
+  }
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData GetProductReviewScoreHistogramResponse::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    GetProductReviewScoreHistogramResponse::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*GetProductReviewScoreHistogramResponse::GetClassData() const { return &_class_data_; }
+
+
+void GetProductReviewScoreHistogramResponse::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<GetProductReviewScoreHistogramResponse*>(&to_msg);
+  auto& from = static_cast<const GetProductReviewScoreHistogramResponse&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetProductReviewScoreHistogramResponse)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_star_counts()->MergeFrom(from._internal_star_counts());
+  if (!from._internal_average_score().empty()) {
+    _this->_internal_set_average_score(from._internal_average_score());
+  }
+  if (from._internal_review_count() != 0) {
+    _this->_internal_set_review_count(from._internal_review_count());
+  }
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void GetProductReviewScoreHistogramResponse::CopyFrom(const GetProductReviewScoreHistogramResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetProductReviewScoreHistogramResponse)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool GetProductReviewScoreHistogramResponse::IsInitialized() const {
+  return true;
+}
+
+void GetProductReviewScoreHistogramResponse::InternalSwap(GetProductReviewScoreHistogramResponse* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.star_counts_.InternalSwap(&other->_impl_.star_counts_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.average_score_, lhs_arena,
+                                       &other->_impl_.average_score_, rhs_arena);
+        swap(_impl_.review_count_, other->_impl_.review_count_);
+}
+
+::google::protobuf::Metadata GetProductReviewScoreHistogramResponse::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[21]);
+}
+// ===================================================================
+
+class GetProductReviewsBatchRequest::_Internal {
+ public:
+};
+
+GetProductReviewsBatchRequest::GetProductReviewsBatchRequest(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.GetProductReviewsBatchRequest)
+}
+GetProductReviewsBatchRequest::GetProductReviewsBatchRequest(const GetProductReviewsBatchRequest& from) : ::google::protobuf::Message() {
+  GetProductReviewsBatchRequest* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_ids_){from._impl_.product_ids_},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.GetProductReviewsBatchRequest)
+}
+inline void GetProductReviewsBatchRequest::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_ids_){arena},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+}
+GetProductReviewsBatchRequest::~GetProductReviewsBatchRequest() {
+  // @@protoc_insertion_point(destructor:oteldemo.GetProductReviewsBatchRequest)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void GetProductReviewsBatchRequest::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _internal_mutable_product_ids()->~RepeatedPtrField();
+}
+void GetProductReviewsBatchRequest::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void GetProductReviewsBatchRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.GetProductReviewsBatchRequest)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _internal_mutable_product_ids()->Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* GetProductReviewsBatchRequest::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 0, 58, 2> GetProductReviewsBatchRequest::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    &_GetProductReviewsBatchRequest_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // repeated string product_ids = 1;
+    {::_pbi::TcParser::FastUR1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewsBatchRequest, _impl_.product_ids_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // repeated string product_ids = 1;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewsBatchRequest, _impl_.product_ids_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kUtf8String | ::_fl::kRepSString)},
+  }},
+  // no aux_entries
+  {{
+    "\46\13\0\0\0\0\0\0"
+    "oteldemo.GetProductReviewsBatchRequest"
+    "product_ids"
+  }},
+};
+
+::uint8_t* GetProductReviewsBatchRequest::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetProductReviewsBatchRequest)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // repeated string product_ids = 1;
+  for (int i = 0, n = this->_internal_product_ids_size(); i < n; ++i) {
+    const auto& s = this->_internal_product_ids().Get(i);
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        s.data(), static_cast<int>(s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetProductReviewsBatchRequest.product_ids");
+    target = stream->WriteString(1, s, target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetProductReviewsBatchRequest)
+  return target;
+}
+
+::size_t GetProductReviewsBatchRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetProductReviewsBatchRequest)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated string product_ids = 1;
+  total_size += 1 * ::google::protobuf::internal::FromIntSize(_internal_product_ids().size());
+  for (int i = 0, n = _internal_product_ids().size(); i < n; ++i) {
+    total_size += ::google::protobuf::internal::WireFormatLite::StringSize(
+        _internal_product_ids().Get(i));
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData GetProductReviewsBatchRequest::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    GetProductReviewsBatchRequest::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*GetProductReviewsBatchRequest::GetClassData() const { return &_class_data_; }
+
+
+void GetProductReviewsBatchRequest::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<GetProductReviewsBatchRequest*>(&to_msg);
+  auto& from = static_cast<const GetProductReviewsBatchRequest&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetProductReviewsBatchRequest)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_product_ids()->MergeFrom(from._internal_product_ids());
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void GetProductReviewsBatchRequest::CopyFrom(const GetProductReviewsBatchRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetProductReviewsBatchRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool GetProductReviewsBatchRequest::IsInitialized() const {
+  return true;
+}
+
+void GetProductReviewsBatchRequest::InternalSwap(GetProductReviewsBatchRequest* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.product_ids_.InternalSwap(&other->_impl_.product_ids_);
+}
+
+::google::protobuf::Metadata GetProductReviewsBatchRequest::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[22]);
+}
+// ===================================================================
+
+class ProductReviews::_Internal {
+ public:
+};
+
+ProductReviews::ProductReviews(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.ProductReviews)
+}
+ProductReviews::ProductReviews(const ProductReviews& from) : ::google::protobuf::Message() {
+  ProductReviews* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_reviews_){from._impl_.product_reviews_},
+      decltype(_impl_.product_id_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  _impl_.product_id_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.product_id_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (!from._internal_product_id().empty()) {
+    _this->_impl_.product_id_.Set(from._internal_product_id(), _this->GetArenaForAllocation());
+  }
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.ProductReviews)
+}
+inline void ProductReviews::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_reviews_){arena},
+      decltype(_impl_.product_id_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _impl_.product_id_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.product_id_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+ProductReviews::~ProductReviews() {
+  // @@protoc_insertion_point(destructor:oteldemo.ProductReviews)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void ProductReviews::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.product_reviews_.~RepeatedPtrField();
+  _impl_.product_id_.Destroy();
+}
+void ProductReviews::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void ProductReviews::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.ProductReviews)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _internal_mutable_product_reviews()->Clear();
+  _impl_.product_id_.ClearToEmpty();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* ProductReviews::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<1, 2, 1, 42, 2> ProductReviews::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    2, 8,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967292,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    2,  // num_field_entries
+    1,  // num_aux_entries
+    offsetof(decltype(_table_), aux_entries),
+    &_ProductReviews_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // repeated .oteldemo.ProductReview product_reviews = 2;
+    {::_pbi::TcParser::FastMtR1,
+     {18, 63, 0, PROTOBUF_FIELD_OFFSET(ProductReviews, _impl_.product_reviews_)}},
+    // string product_id = 1;
+    {::_pbi::TcParser::FastUS1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(ProductReviews, _impl_.product_id_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // string product_id = 1;
+    {PROTOBUF_FIELD_OFFSET(ProductReviews, _impl_.product_id_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
+    // repeated .oteldemo.ProductReview product_reviews = 2;
+    {PROTOBUF_FIELD_OFFSET(ProductReviews, _impl_.product_reviews_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kMessage | ::_fl::kTvTable)},
+  }}, {{
+    {::_pbi::TcParser::GetTable<::oteldemo::ProductReview>()},
+  }}, {{
+    "\27\12\0\0\0\0\0\0"
+    "oteldemo.ProductReviews"
+    "product_id"
+  }},
+};
+
+::uint8_t* ProductReviews::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.ProductReviews)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    const std::string& _s = this->_internal_product_id();
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.ProductReviews.product_id");
+    target = stream->WriteStringMaybeAliased(1, _s, target);
+  }
+
+  // repeated .oteldemo.ProductReview product_reviews = 2;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_product_reviews_size()); i < n; i++) {
+    const auto& repfield = this->_internal_product_reviews().Get(i);
+    target = ::google::protobuf::internal::WireFormatLite::
+        InternalWriteMessage(2, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.ProductReviews)
+  return target;
+}
+
+::size_t ProductReviews::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.ProductReviews)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .oteldemo.ProductReview product_reviews = 2;
+  total_size += 1UL * this->_internal_product_reviews_size();
+  for (const auto& msg : this->_internal_product_reviews()) {
+    total_size +=
+      ::google::protobuf::internal::WireFormatLite::MessageSize(msg);
+  }
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                    this->_internal_product_id());
+  }
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData ProductReviews::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    ProductReviews::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*ProductReviews::GetClassData() const { return &_class_data_; }
+
+
+void ProductReviews::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<ProductReviews*>(&to_msg);
+  auto& from = static_cast<const ProductReviews&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.ProductReviews)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_product_reviews()->MergeFrom(from._internal_product_reviews());
+  if (!from._internal_product_id().empty()) {
+    _this->_internal_set_product_id(from._internal_product_id());
+  }
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ProductReviews::CopyFrom(const ProductReviews& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.ProductReviews)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool ProductReviews::IsInitialized() const {
+  return true;
+}
+
+void ProductReviews::InternalSwap(ProductReviews* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.product_reviews_.InternalSwap(&other->_impl_.product_reviews_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.product_id_, lhs_arena,
+                                       &other->_impl_.product_id_, rhs_arena);
+}
+
+::google::protobuf::Metadata ProductReviews::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[23]);
+}
+// ===================================================================
+
+class GetProductReviewsBatchResponse::_Internal {
+ public:
+};
+
+GetProductReviewsBatchResponse::GetProductReviewsBatchResponse(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.GetProductReviewsBatchResponse)
+}
+GetProductReviewsBatchResponse::GetProductReviewsBatchResponse(const GetProductReviewsBatchResponse& from) : ::google::protobuf::Message() {
+  GetProductReviewsBatchResponse* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_reviews_){from._impl_.product_reviews_},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.GetProductReviewsBatchResponse)
+}
+inline void GetProductReviewsBatchResponse::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_reviews_){arena},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+}
+GetProductReviewsBatchResponse::~GetProductReviewsBatchResponse() {
+  // @@protoc_insertion_point(destructor:oteldemo.GetProductReviewsBatchResponse)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void GetProductReviewsBatchResponse::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.product_reviews_.~RepeatedPtrField();
+}
+void GetProductReviewsBatchResponse::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void GetProductReviewsBatchResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.GetProductReviewsBatchResponse)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _internal_mutable_product_reviews()->Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* GetProductReviewsBatchResponse::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 1, 0, 2> GetProductReviewsBatchResponse::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    1,  // num_aux_entries
+    offsetof(decltype(_table_), aux_entries),
+    &_GetProductReviewsBatchResponse_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // repeated .oteldemo.ProductReviews product_reviews = 1;
+    {::_pbi::TcParser::FastMtR1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewsBatchResponse, _impl_.product_reviews_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // repeated .oteldemo.ProductReviews product_reviews = 1;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewsBatchResponse, _impl_.product_reviews_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kMessage | ::_fl::kTvTable)},
+  }}, {{
+    {::_pbi::TcParser::GetTable<::oteldemo::ProductReviews>()},
+  }}, {{
+  }},
+};
+
+::uint8_t* GetProductReviewsBatchResponse::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetProductReviewsBatchResponse)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // repeated .oteldemo.ProductReviews product_reviews = 1;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_product_reviews_size()); i < n; i++) {
+    const auto& repfield = this->_internal_product_reviews().Get(i);
+    target = ::google::protobuf::internal::WireFormatLite::
+        InternalWriteMessage(1, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetProductReviewsBatchResponse)
+  return target;
+}
+
+::size_t GetProductReviewsBatchResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetProductReviewsBatchResponse)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .oteldemo.ProductReviews product_reviews = 1;
+  total_size += 1UL * this->_internal_product_reviews_size();
+  for (const auto& msg : this->_internal_product_reviews()) {
+    total_size +=
+      ::google::protobuf::internal::WireFormatLite::MessageSize(msg);
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData GetProductReviewsBatchResponse::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    GetProductReviewsBatchResponse::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*GetProductReviewsBatchResponse::GetClassData() const { return &_class_data_; }
+
+
+void GetProductReviewsBatchResponse::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<GetProductReviewsBatchResponse*>(&to_msg);
+  auto& from = static_cast<const GetProductReviewsBatchResponse&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetProductReviewsBatchResponse)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_product_reviews()->MergeFrom(from._internal_product_reviews());
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void GetProductReviewsBatchResponse::CopyFrom(const GetProductReviewsBatchResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetProductReviewsBatchResponse)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool GetProductReviewsBatchResponse::IsInitialized() const {
+  return true;
+}
+
+void GetProductReviewsBatchResponse::InternalSwap(GetProductReviewsBatchResponse* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.product_reviews_.InternalSwap(&other->_impl_.product_reviews_);
+}
+
+::google::protobuf::Metadata GetProductReviewsBatchResponse::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[24]);
+}
+// ===================================================================
+
+class GetAverageScoresBatchRequest::_Internal {
+ public:
+};
+
+GetAverageScoresBatchRequest::GetAverageScoresBatchRequest(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.GetAverageScoresBatchRequest)
+}
+GetAverageScoresBatchRequest::GetAverageScoresBatchRequest(const GetAverageScoresBatchRequest& from) : ::google::protobuf::Message() {
+  GetAverageScoresBatchRequest* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_ids_){from._impl_.product_ids_},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.GetAverageScoresBatchRequest)
+}
+inline void GetAverageScoresBatchRequest::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_ids_){arena},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+}
+GetAverageScoresBatchRequest::~GetAverageScoresBatchRequest() {
+  // @@protoc_insertion_point(destructor:oteldemo.GetAverageScoresBatchRequest)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void GetAverageScoresBatchRequest::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _internal_mutable_product_ids()->~RepeatedPtrField();
+}
+void GetAverageScoresBatchRequest::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void GetAverageScoresBatchRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.GetAverageScoresBatchRequest)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _internal_mutable_product_ids()->Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* GetAverageScoresBatchRequest::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 0, 57, 2> GetAverageScoresBatchRequest::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    &_GetAverageScoresBatchRequest_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // repeated string product_ids = 1;
+    {::_pbi::TcParser::FastUR1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetAverageScoresBatchRequest, _impl_.product_ids_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // repeated string product_ids = 1;
+    {PROTOBUF_FIELD_OFFSET(GetAverageScoresBatchRequest, _impl_.product_ids_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kUtf8String | ::_fl::kRepSString)},
+  }},
+  // no aux_entries
+  {{
+    "\45\13\0\0\0\0\0\0"
+    "oteldemo.GetAverageScoresBatchRequest"
+    "product_ids"
+  }},
+};
+
+::uint8_t* GetAverageScoresBatchRequest::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetAverageScoresBatchRequest)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // repeated string product_ids = 1;
+  for (int i = 0, n = this->_internal_product_ids_size(); i < n; ++i) {
+    const auto& s = this->_internal_product_ids().Get(i);
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        s.data(), static_cast<int>(s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetAverageScoresBatchRequest.product_ids");
+    target = stream->WriteString(1, s, target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetAverageScoresBatchRequest)
+  return target;
+}
+
+::size_t GetAverageScoresBatchRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetAverageScoresBatchRequest)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated string product_ids = 1;
+  total_size += 1 * ::google::protobuf::internal::FromIntSize(_internal_product_ids().size());
+  for (int i = 0, n = _internal_product_ids().size(); i < n; ++i) {
+    total_size += ::google::protobuf::internal::WireFormatLite::StringSize(
+        _internal_product_ids().Get(i));
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData GetAverageScoresBatchRequest::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    GetAverageScoresBatchRequest::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*GetAverageScoresBatchRequest::GetClassData() const { return &_class_data_; }
+
+
+void GetAverageScoresBatchRequest::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<GetAverageScoresBatchRequest*>(&to_msg);
+  auto& from = static_cast<const GetAverageScoresBatchRequest&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetAverageScoresBatchRequest)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_product_ids()->MergeFrom(from._internal_product_ids());
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void GetAverageScoresBatchRequest::CopyFrom(const GetAverageScoresBatchRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetAverageScoresBatchRequest)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool GetAverageScoresBatchRequest::IsInitialized() const {
+  return true;
+}
+
+void GetAverageScoresBatchRequest::InternalSwap(GetAverageScoresBatchRequest* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.product_ids_.InternalSwap(&other->_impl_.product_ids_);
+}
+
+::google::protobuf::Metadata GetAverageScoresBatchRequest::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[25]);
+}
+// ===================================================================
+
+class ProductAverageScore::_Internal {
+ public:
+};
+
+ProductAverageScore::ProductAverageScore(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.ProductAverageScore)
+}
+ProductAverageScore::ProductAverageScore(const ProductAverageScore& from) : ::google::protobuf::Message() {
+  ProductAverageScore* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_id_){},
+      decltype(_impl_.average_score_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  _impl_.product_id_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.product_id_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (!from._internal_product_id().empty()) {
+    _this->_impl_.product_id_.Set(from._internal_product_id(), _this->GetArenaForAllocation());
+  }
+  _impl_.average_score_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.average_score_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (!from._internal_average_score().empty()) {
+    _this->_impl_.average_score_.Set(from._internal_average_score(), _this->GetArenaForAllocation());
+  }
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.ProductAverageScore)
+}
+inline void ProductAverageScore::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_id_){},
+      decltype(_impl_.average_score_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _impl_.product_id_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.product_id_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  _impl_.average_score_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.average_score_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+ProductAverageScore::~ProductAverageScore() {
+  // @@protoc_insertion_point(destructor:oteldemo.ProductAverageScore)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void ProductAverageScore::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.product_id_.Destroy();
+  _impl_.average_score_.Destroy();
+}
+void ProductAverageScore::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void ProductAverageScore::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.ProductAverageScore)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.product_id_.ClearToEmpty();
+  _impl_.average_score_.ClearToEmpty();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* ProductAverageScore::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<1, 2, 0, 60, 2> ProductAverageScore::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    2, 8,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967292,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    2,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    &_ProductAverageScore_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // string average_score = 2;
+    {::_pbi::TcParser::FastUS1,
+     {18, 63, 0, PROTOBUF_FIELD_OFFSET(ProductAverageScore, _impl_.average_score_)}},
+    // string product_id = 1;
+    {::_pbi::TcParser::FastUS1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(ProductAverageScore, _impl_.product_id_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // string product_id = 1;
+    {PROTOBUF_FIELD_OFFSET(ProductAverageScore, _impl_.product_id_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
+    // string average_score = 2;
+    {PROTOBUF_FIELD_OFFSET(ProductAverageScore, _impl_.average_score_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
+  }},
+  // no aux_entries
+  {{
+    "\34\12\15\0\0\0\0\0"
+    "oteldemo.ProductAverageScore"
+    "product_id"
+    "average_score"
+  }},
+};
+
+::uint8_t* ProductAverageScore::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.ProductAverageScore)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    const std::string& _s = this->_internal_product_id();
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.ProductAverageScore.product_id");
+    target = stream->WriteStringMaybeAliased(1, _s, target);
+  }
+
+  // string average_score = 2;
+  if (!this->_internal_average_score().empty()) {
+    const std::string& _s = this->_internal_average_score();
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.ProductAverageScore.average_score");
+    target = stream->WriteStringMaybeAliased(2, _s, target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.ProductAverageScore)
+  return target;
+}
+
+::size_t ProductAverageScore::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.ProductAverageScore)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                    this->_internal_product_id());
+  }
+
+  // string average_score = 2;
+  if (!this->_internal_average_score().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                    this->_internal_average_score());
+  }
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData ProductAverageScore::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    ProductAverageScore::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*ProductAverageScore::GetClassData() const { return &_class_data_; }
+
+
+void ProductAverageScore::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<ProductAverageScore*>(&to_msg);
+  auto& from = static_cast<const ProductAverageScore&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.ProductAverageScore)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (!from._internal_product_id().empty()) {
+    _this->_internal_set_product_id(from._internal_product_id());
+  }
+  if (!from._internal_average_score().empty()) {
+    _this->_internal_set_average_score(from._internal_average_score());
+  }
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ProductAverageScore::CopyFrom(const ProductAverageScore& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.ProductAverageScore)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool ProductAverageScore::IsInitialized() const {
+  return true;
+}
+
+void ProductAverageScore::InternalSwap(ProductAverageScore* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.product_id_, lhs_arena,
+                                       &other->_impl_.product_id_, rhs_arena);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.average_score_, lhs_arena,
+                                       &other->_impl_.average_score_, rhs_arena);
+}
+
+::google::protobuf::Metadata ProductAverageScore::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[26]);
+}
+// ===================================================================
+
+class GetAverageScoresBatchResponse::_Internal {
+ public:
+};
+
+GetAverageScoresBatchResponse::GetAverageScoresBatchResponse(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.GetAverageScoresBatchResponse)
+}
+GetAverageScoresBatchResponse::GetAverageScoresBatchResponse(const GetAverageScoresBatchResponse& from) : ::google::protobuf::Message() {
+  GetAverageScoresBatchResponse* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.average_scores_){from._impl_.average_scores_},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.GetAverageScoresBatchResponse)
+}
+inline void GetAverageScoresBatchResponse::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.average_scores_){arena},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+}
+GetAverageScoresBatchResponse::~GetAverageScoresBatchResponse() {
+  // @@protoc_insertion_point(destructor:oteldemo.GetAverageScoresBatchResponse)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void GetAverageScoresBatchResponse::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.average_scores_.~RepeatedPtrField();
+}
+void GetAverageScoresBatchResponse::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void GetAverageScoresBatchResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.GetAverageScoresBatchResponse)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _internal_mutable_average_scores()->Clear();
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* GetAverageScoresBatchResponse::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<0, 1, 1, 0, 2> GetAverageScoresBatchResponse::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    1, 0,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967294,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    1,  // num_field_entries
+    1,  // num_aux_entries
+    offsetof(decltype(_table_), aux_entries),
+    &_GetAverageScoresBatchResponse_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // repeated .oteldemo.ProductAverageScore average_scores = 1;
+    {::_pbi::TcParser::FastMtR1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetAverageScoresBatchResponse, _impl_.average_scores_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // repeated .oteldemo.ProductAverageScore average_scores = 1;
+    {PROTOBUF_FIELD_OFFSET(GetAverageScoresBatchResponse, _impl_.average_scores_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kMessage | ::_fl::kTvTable)},
+  }}, {{
+    {::_pbi::TcParser::GetTable<::oteldemo::ProductAverageScore>()},
+  }}, {{
+  }},
+};
+
+::uint8_t* GetAverageScoresBatchResponse::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetAverageScoresBatchResponse)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // repeated .oteldemo.ProductAverageScore average_scores = 1;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_average_scores_size()); i < n; i++) {
+    const auto& repfield = this->_internal_average_scores().Get(i);
+    target = ::google::protobuf::internal::WireFormatLite::
+        InternalWriteMessage(1, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetAverageScoresBatchResponse)
+  return target;
+}
+
+::size_t GetAverageScoresBatchResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetAverageScoresBatchResponse)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .oteldemo.ProductAverageScore average_scores = 1;
+  total_size += 1UL * this->_internal_average_scores_size();
+  for (const auto& msg : this->_internal_average_scores()) {
+    total_size +=
+      ::google::protobuf::internal::WireFormatLite::MessageSize(msg);
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData GetAverageScoresBatchResponse::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    GetAverageScoresBatchResponse::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*GetAverageScoresBatchResponse::GetClassData() const { return &_class_data_; }
+
+
+void GetAverageScoresBatchResponse::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<GetAverageScoresBatchResponse*>(&to_msg);
+  auto& from = static_cast<const GetAverageScoresBatchResponse&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetAverageScoresBatchResponse)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_internal_mutable_average_scores()->MergeFrom(from._internal_average_scores());
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void GetAverageScoresBatchResponse::CopyFrom(const GetAverageScoresBatchResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetAverageScoresBatchResponse)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+PROTOBUF_NOINLINE bool GetAverageScoresBatchResponse::IsInitialized() const {
+  return true;
+}
+
+void GetAverageScoresBatchResponse::InternalSwap(GetAverageScoresBatchResponse* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  _impl_.average_scores_.InternalSwap(&other->_impl_.average_scores_);
+}
+
+::google::protobuf::Metadata GetAverageScoresBatchResponse::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
+      file_level_metadata_demo_2eproto[27]);
+}
+// ===================================================================
+
+class GetProductReviewsPageRequest::_Internal {
+ public:
+};
+
+GetProductReviewsPageRequest::GetProductReviewsPageRequest(::google::protobuf::Arena* arena)
+    : ::google::protobuf::Message(arena) {
+  SharedCtor(arena);
+  // @@protoc_insertion_point(arena_constructor:oteldemo.GetProductReviewsPageRequest)
+}
+GetProductReviewsPageRequest::GetProductReviewsPageRequest(const GetProductReviewsPageRequest& from) : ::google::protobuf::Message() {
+  GetProductReviewsPageRequest* const _this = this;
+  (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_id_){},
+      decltype(_impl_.page_token_){},
+      decltype(_impl_.page_size_){},
+      decltype(_impl_.order_by_score_){},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
+      from._internal_metadata_);
+  _impl_.product_id_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.product_id_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (!from._internal_product_id().empty()) {
+    _this->_impl_.product_id_.Set(from._internal_product_id(), _this->GetArenaForAllocation());
+  }
+  _impl_.page_token_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.page_token_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (!from._internal_page_token().empty()) {
+    _this->_impl_.page_token_.Set(from._internal_page_token(), _this->GetArenaForAllocation());
+  }
+  ::memcpy(&_impl_.page_size_, &from._impl_.page_size_,
+    static_cast<::size_t>(reinterpret_cast<char*>(&_impl_.order_by_score_) -
+    reinterpret_cast<char*>(&_impl_.page_size_)) + sizeof(_impl_.order_by_score_));
+
+  // @@protoc_insertion_point(copy_constructor:oteldemo.GetProductReviewsPageRequest)
+}
+inline void GetProductReviewsPageRequest::SharedCtor(::_pb::Arena* arena) {
+  (void)arena;
+  new (&_impl_) Impl_{
+      decltype(_impl_.product_id_){},
+      decltype(_impl_.page_token_){},
+      decltype(_impl_.page_size_){0},
+      decltype(_impl_.order_by_score_){false},
+      /*decltype(_impl_._cached_size_)*/ {},
+  };
+  _impl_.product_id_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.product_id_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  _impl_.page_token_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        _impl_.page_token_.Set("", GetArenaForAllocation());
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+GetProductReviewsPageRequest::~GetProductReviewsPageRequest() {
+  // @@protoc_insertion_point(destructor:oteldemo.GetProductReviewsPageRequest)
+  _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
+  SharedDtor();
+}
+inline void GetProductReviewsPageRequest::SharedDtor() {
+  ABSL_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.product_id_.Destroy();
+  _impl_.page_token_.Destroy();
+}
+void GetProductReviewsPageRequest::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+PROTOBUF_NOINLINE void GetProductReviewsPageRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.GetProductReviewsPageRequest)
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.product_id_.ClearToEmpty();
+  _impl_.page_token_.ClearToEmpty();
+  ::memset(&_impl_.page_size_, 0, static_cast<::size_t>(
+      reinterpret_cast<char*>(&_impl_.order_by_score_) -
+      reinterpret_cast<char*>(&_impl_.page_size_)) + sizeof(_impl_.order_by_score_));
+  _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
+}
+
+const char* GetProductReviewsPageRequest::_InternalParse(
+    const char* ptr, ::_pbi::ParseContext* ctx) {
+  ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
+  return ptr;
+}
+
+
+PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
+const ::_pbi::TcParseTable<2, 4, 0, 66, 2> GetProductReviewsPageRequest::_table_ = {
+  {
+    0,  // no _has_bits_
+    0, // no _extensions_
+    4, 24,  // max_field_number, fast_idx_mask
+    offsetof(decltype(_table_), field_lookup_table),
+    4294967280,  // skipmap
+    offsetof(decltype(_table_), field_entries),
+    4,  // num_field_entries
+    0,  // num_aux_entries
+    offsetof(decltype(_table_), field_names),  // no aux_entries
+    &_GetProductReviewsPageRequest_default_instance_._instance,
+    ::_pbi::TcParser::GenericFallback,  // fallback
+  }, {{
+    // bool order_by_score = 4;
+    {::_pbi::TcParser::SingularVarintNoZag1<bool, offsetof(GetProductReviewsPageRequest, _impl_.order_by_score_), 63>(),
+     {32, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewsPageRequest, _impl_.order_by_score_)}},
+    // string product_id = 1;
+    {::_pbi::TcParser::FastUS1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewsPageRequest, _impl_.product_id_)}},
+    // int32 page_size = 2;
+    {::_pbi::TcParser::SingularVarintNoZag1<::uint32_t, offsetof(GetProductReviewsPageRequest, _impl_.page_size_), 63>(),
+     {16, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewsPageRequest, _impl_.page_size_)}},
+    // string page_token = 3;
+    {::_pbi::TcParser::FastUS1,
+     {26, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewsPageRequest, _impl_.page_token_)}},
+  }}, {{
+    65535, 65535
+  }}, {{
+    // string product_id = 1;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewsPageRequest, _impl_.product_id_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
+    // int32 page_size = 2;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewsPageRequest, _impl_.page_size_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kInt32)},
+    // string page_token = 3;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewsPageRequest, _impl_.page_token_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
+    // bool order_by_score = 4;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewsPageRequest, _impl_.order_by_score_), 0, 0,
+    (0 | ::_fl::kFcSingular | ::_fl::kBool)},
+  }},
+  // no aux_entries
+  {{
+    "\45\12\0\12\0\0\0\0"
+    "oteldemo.GetProductReviewsPageRequest"
+    "product_id"
+    "page_token"
+  }},
+};
+
+::uint8_t* GetProductReviewsPageRequest::_InternalSerialize(
+    ::uint8_t* target,
+    ::google::protobuf::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetProductReviewsPageRequest)
+  ::uint32_t cached_has_bits = 0;
+  (void)cached_has_bits;
+
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    const std::string& _s = this->_internal_product_id();
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetProductReviewsPageRequest.product_id");
+    target = stream->WriteStringMaybeAliased(1, _s, target);
+  }
+
+  // int32 page_size = 2;
+  if (this->_internal_page_size() != 0) {
+    target = ::google::protobuf::internal::WireFormatLite::
+        WriteInt32ToArrayWithField<2>(
+            stream, this->_internal_page_size(), target);
+  }
+
+  // string page_token = 3;
+  if (!this->_internal_page_token().empty()) {
+    const std::string& _s = this->_internal_page_token();
+    ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetProductReviewsPageRequest.page_token");
+    target = stream->WriteStringMaybeAliased(3, _s, target);
+  }
+
+  // bool order_by_score = 4;
+  if (this->_internal_order_by_score() != 0) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(
+        4, this->_internal_order_by_score(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target =
+        ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+            _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetProductReviewsPageRequest)
+  return target;
+}
+
+::size_t GetProductReviewsPageRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetProductReviewsPageRequest)
+  ::size_t total_size = 0;
+
+  ::uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                    this->_internal_product_id());
+  }
+
+  // string page_token = 3;
+  if (!this->_internal_page_token().empty()) {
+    total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
+                                    this->_internal_page_token());
+  }
+
+  // int32 page_size = 2;
+  if (this->_internal_page_size() != 0) {
+    total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(
+        this->_internal_page_size());
+  }
+
+  // bool order_by_score = 4;
+  if (this->_internal_order_by_score() != 0) {
+    total_size += 2;
+  }
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::google::protobuf::Message::ClassData GetProductReviewsPageRequest::_class_data_ = {
+    ::google::protobuf::Message::CopyWithSourceCheck,
+    GetProductReviewsPageRequest::MergeImpl
+};
+const ::google::protobuf::Message::ClassData*GetProductReviewsPageRequest::GetClassData() const { return &_class_data_; }
+
+
+void GetProductReviewsPageRequest::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<GetProductReviewsPageRequest*>(&to_msg);
+  auto& from = static_cast<const GetProductReviewsPageRequest&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetProductReviewsPageRequest)
+  ABSL_DCHECK_NE(&from, _this);
+  ::uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  if (!from._internal_product_id().empty()) {
+    _this->_internal_set_product_id(from._internal_product_id());
+  }
+  if (!from._internal_page_token().empty()) {
+    _this->_internal_set_page_token(from._internal_page_token());
+  }
+  if (from._internal_page_size() != 0) {
+    _this->_internal_set_page_size(from._internal_page_size());
+  }
+  if (from._internal_order_by_score() != 0) {
+    _this->_internal_set_order_by_score(from._internal_order_by_score());
+  }
+  _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void GetProductReviewsPageRequest::CopyFrom(const GetProductReviewsPageRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetProductReviewsPageRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-PROTOBUF_NOINLINE bool GetProductReviewsResponse::IsInitialized() const {
+PROTOBUF_NOINLINE bool GetProductReviewsPageRequest::IsInitialized() const {
   return true;
 }
 
-void GetProductReviewsResponse::InternalSwap(GetProductReviewsResponse* other) {
+void GetProductReviewsPageRequest::InternalSwap(GetProductReviewsPageRequest* other) {
   using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
   _internal_metadata_.InternalSwap(&other->_internal_metadata_);
-  _impl_.product_reviews_.InternalSwap(&other->_impl_.product_reviews_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.product_id_, lhs_arena,
+                                       &other->_impl_.product_id_, rhs_arena);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.page_token_, lhs_arena,
+                                       &other->_impl_.page_token_, rhs_arena);
+  ::google::protobuf::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(GetProductReviewsPageRequest, _impl_.order_by_score_)
+      + sizeof(GetProductReviewsPageRequest::_impl_.order_by_score_)
+      - PROTOBUF_FIELD_OFFSET(GetProductReviewsPageRequest, _impl_.page_size_)>(
+          reinterpret_cast<char*>(&_impl_.page_size_),
+          reinterpret_cast<char*>(&other->_impl_.page_size_));
 }
 
-::google::protobuf::Metadata GetProductReviewsResponse::GetMetadata() const {
+::google::protobuf::Metadata GetProductReviewsPageRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[15]);
+      file_level_metadata_demo_2eproto[28]);
 }
 // ===================================================================
 
-class GetAverageProductReviewScoreRequest::_Internal {
+class GetProductReviewsPageResponse::_Internal {
  public:
 };
 
-GetAverageProductReviewScoreRequest::GetAverageProductReviewScoreRequest(::google::protobuf::Arena* arena)
+GetProductReviewsPageResponse::GetProductReviewsPageResponse(::google::protobuf::Arena* arena)
     : ::google::protobuf::Message(arena) {
   SharedCtor(arena);
-  // @@protoc_insertion_point(arena_constructor:oteldemo.GetAverageProductReviewScoreRequest)
+  // @@protoc_insertion_point(arena_constructor:oteldemo.GetProductReviewsPageResponse)
 }
-GetAverageProductReviewScoreRequest::GetAverageProductReviewScoreRequest(const GetAverageProductReviewScoreRequest& from) : ::google::protobuf::Message() {
-  GetAverageProductReviewScoreRequest* const _this = this;
+GetProductReviewsPageResponse::GetProductReviewsPageResponse(const GetProductReviewsPageResponse& from) : ::google::protobuf::Message() {
+  GetProductReviewsPageResponse* const _this = this;
   (void)_this;
   new (&_impl_) Impl_{
-      decltype(_impl_.product_id_){},
+      decltype(_impl_.product_reviews_){from._impl_.product_reviews_},
+      decltype(_impl_.next_page_token_){},
       /*decltype(_impl_._cached_size_)*/ {},
   };
   _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
       from._internal_metadata_);
-  _impl_.product_id_.InitDefault();
+  _impl_.next_page_token_.InitDefault();
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        _impl_.product_id_.Set("", GetArenaForAllocation());
+        _impl_.next_page_token_.Set("", GetArenaForAllocation());
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  if (!from._internal_product_id().empty()) {
-    _this->_impl_.product_id_.Set(from._internal_product_id(), _this->GetArenaForAllocation());
+  if (!from._internal_next_page_token().empty()) {
+    _this->_impl_.next_page_token_.Set(from._internal_next_page_token(), _this->GetArenaForAllocation());
   }
 
-  // @@protoc_insertion_point(copy_constructor:oteldemo.GetAverageProductReviewScoreRequest)
+  // @@protoc_insertion_point(copy_constructor:oteldemo.GetProductReviewsPageResponse)
 }
-inline void GetAverageProductReviewScoreRequest::SharedCtor(::_pb::Arena* arena) {
+inline void GetProductReviewsPageResponse::SharedCtor(::_pb::Arena* arena) {
   (void)arena;
   new (&_impl_) Impl_{
-      decltype(_impl_.product_id_){},
+      decltype(_impl_.product_reviews_){arena},
+      decltype(_impl_.next_page_token_){},
       /*decltype(_impl_._cached_size_)*/ {},
   };
-  _impl_.product_id_.InitDefault();
+  _impl_.next_page_token_.InitDefault();
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        _impl_.product_id_.Set("", GetArenaForAllocation());
+        _impl_.next_page_token_.Set("", GetArenaForAllocation());
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
 }
-GetAverageProductReviewScoreRequest::~GetAverageProductReviewScoreRequest() {
-  // @@protoc_insertion_point(destructor:oteldemo.GetAverageProductReviewScoreRequest)
+GetProductReviewsPageResponse::~GetProductReviewsPageResponse() {
+  // @@protoc_insertion_point(destructor:oteldemo.GetProductReviewsPageResponse)
   _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
   SharedDtor();
 }
-inline void GetAverageProductReviewScoreRequest::SharedDtor() {
+inline void GetProductReviewsPageResponse::SharedDtor() {
   ABSL_DCHECK(GetArenaForAllocation() == nullptr);
-  _impl_.product_id_.Destroy();
+  _impl_.product_reviews_.~RepeatedPtrField();
+  _impl_.next_page_token_.Destroy();
 }
-void GetAverageProductReviewScoreRequest::SetCachedSize(int size) const {
+void GetProductReviewsPageResponse::SetCachedSize(int size) const {
   _impl_._cached_size_.Set(size);
 }
 
-PROTOBUF_NOINLINE void GetAverageProductReviewScoreRequest::Clear() {
-// @@protoc_insertion_point(message_clear_start:oteldemo.GetAverageProductReviewScoreRequest)
+PROTOBUF_NOINLINE void GetProductReviewsPageResponse::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.GetProductReviewsPageResponse)
   ::uint32_t cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  _impl_.product_id_.ClearToEmpty();
+  _internal_mutable_product_reviews()->Clear();
+  _impl_.next_page_token_.ClearToEmpty();
   _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
 }
 
-const char* GetAverageProductReviewScoreRequest::_InternalParse(
+const char* GetProductReviewsPageResponse::_InternalParse(
     const char* ptr, ::_pbi::ParseContext* ctx) {
   ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
   return ptr;
@@ -5126,51 +8175,65 @@ const char* GetAverageProductReviewScoreRequest::_InternalParse(
 
 
 PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
-const ::_pbi::TcParseTable<0, 1, 0, 63, 2> GetAverageProductReviewScoreRequest::_table_ = {
+const ::_pbi::TcParseTable<1, 2, 1, 62, 2> GetProductReviewsPageResponse::_table_ = {
   {
     0,  // no _has_bits_
     0, // no _extensions_
-    1, 0,  // max_field_number, fast_idx_mask
+    2, 8,  // max_field_number, fast_idx_mask
     offsetof(decltype(_table_), field_lookup_table),
-    4294967294,  // skipmap
+    4294967292,  // skipmap
     offsetof(decltype(_table_), field_entries),
-    1,  // num_field_entries
-    0,  // num_aux_entries
-    offsetof(decltype(_table_), field_names),  // no aux_entries
-    &_GetAverageProductReviewScoreRequest_default_instance_._instance,
+    2,  // num_field_entries
+    1,  // num_aux_entries
+    offsetof(decltype(_table_), aux_entries),
+    &_GetProductReviewsPageResponse_default_instance_._instance,
     ::_pbi::TcParser::GenericFallback,  // fallback
   }, {{
-    // string product_id = 1;
+    // string next_page_token = 2;
     {::_pbi::TcParser::FastUS1,
-     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetAverageProductReviewScoreRequest, _impl_.product_id_)}},
+     {18, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewsPageResponse, _impl_.next_page_token_)}},
+    // repeated .oteldemo.ProductReview product_reviews = 1;
+    {::_pbi::TcParser::FastMtR1,
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetProductReviewsPageResponse, _impl_.product_reviews_)}},
   }}, {{
     65535, 65535
   }}, {{
-    // string product_id = 1;
-    {PROTOBUF_FIELD_OFFSET(GetAverageProductReviewScoreRequest, _impl_.product_id_), 0, 0,
+    // repeated .oteldemo.ProductReview product_reviews = 1;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewsPageResponse, _impl_.product_reviews_), 0, 0,
+    (0 | ::_fl::kFcRepeated | ::_fl::kMessage | ::_fl::kTvTable)},
+    // string next_page_token = 2;
+    {PROTOBUF_FIELD_OFFSET(GetProductReviewsPageResponse, _impl_.next_page_token_), 0, 0,
     (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
-  }},
-  // no aux_entries
-  {{
-    "\54\12\0\0\0\0\0\0"
-    "oteldemo.GetAverageProductReviewScoreRequest"
-    "product_id"
+  }}, {{
+    {::_pbi::TcParser::GetTable<::oteldemo::ProductReview>()},
+  }}, {{
+    "\46\0\17\0\0\0\0\0"
+    "oteldemo.GetProductReviewsPageResponse"
+    "next_page_token"
   }},
 };
 
-::uint8_t* GetAverageProductReviewScoreRequest::_InternalSerialize(
+::uint8_t* GetProductReviewsPageResponse::_InternalSerialize(
     ::uint8_t* target,
     ::google::protobuf::io::EpsCopyOutputStream* stream) const {
-  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetAverageProductReviewScoreRequest)
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetProductReviewsPageResponse)
   ::uint32_t cached_has_bits = 0;
   (void)cached_has_bits;
 
-  // string product_id = 1;
-  if (!this->_internal_product_id().empty()) {
-    const std::string& _s = this->_internal_product_id();
+  // repeated .oteldemo.ProductReview product_reviews = 1;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_product_reviews_size()); i < n; i++) {
+    const auto& repfield = this->_internal_product_reviews().Get(i);
+    target = ::google::protobuf::internal::WireFormatLite::
+        InternalWriteMessage(1, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // string next_page_token = 2;
+  if (!this->_internal_next_page_token().empty()) {
+    const std::string& _s = this->_internal_next_page_token();
     ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
-        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetAverageProductReviewScoreRequest.product_id");
-    target = stream->WriteStringMaybeAliased(1, _s, target);
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetProductReviewsPageResponse.next_page_token");
+    target = stream->WriteStringMaybeAliased(2, _s, target);
   }
 
   if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
@@ -5178,138 +8241,146 @@ const ::_pbi::TcParseTable<0, 1, 0, 63, 2> GetAverageProductReviewScoreRequest::
         ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
             _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetAverageProductReviewScoreRequest)
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetProductReviewsPageResponse)
   return target;
 }
 
-::size_t GetAverageProductReviewScoreRequest::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetAverageProductReviewScoreRequest)
+::size_t GetProductReviewsPageResponse::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetProductReviewsPageResponse)
   ::size_t total_size = 0;
 
   ::uint32_t cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // string product_id = 1;
-  if (!this->_internal_product_id().empty()) {
+  // repeated .oteldemo.ProductReview product_reviews = 1;
+  total_size += 1UL * this->_internal_product_reviews_size();
+  for (const auto& msg : this->_internal_product_reviews()) {
+    total_size +=
+      ::google::protobuf::internal::WireFormatLite::MessageSize(msg);
+  }
+  // string next_page_token = 2;
+  if (!this->_internal_next_page_token().empty()) {
     total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
-                                    this->_internal_product_id());
+                                    this->_internal_next_page_token());
   }
 
   return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
 }
 
-const ::google::protobuf::Message::ClassData GetAverageProductReviewScoreRequest::_class_data_ = {
+const ::google::protobuf::Message::ClassData GetProductReviewsPageResponse::_class_data_ = {
     ::google::protobuf::Message::CopyWithSourceCheck,
-    GetAverageProductReviewScoreRequest::MergeImpl
+    GetProductReviewsPageResponse::MergeImpl
 };
-const ::google::protobuf::Message::ClassData*GetAverageProductReviewScoreRequest::GetClassData() const { return &_class_data_; }
+const ::google::protobuf::Message::ClassData*GetProductReviewsPageResponse::GetClassData() const { return &_class_data_; }
 
 
-void GetAverageProductReviewScoreRequest::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
-  auto* const _this = static_cast<GetAverageProductReviewScoreRequest*>(&to_msg);
-  auto& from = static_cast<const GetAverageProductReviewScoreRequest&>(from_msg);
-  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetAverageProductReviewScoreRequest)
+void GetProductReviewsPageResponse::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<GetProductReviewsPageResponse*>(&to_msg);
+  auto& from = static_cast<const GetProductReviewsPageResponse&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetProductReviewsPageResponse)
   ABSL_DCHECK_NE(&from, _this);
   ::uint32_t cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (!from._internal_product_id().empty()) {
-    _this->_internal_set_product_id(from._internal_product_id());
+  _this->_internal_mutable_product_reviews()->MergeFrom(from._internal_product_reviews());
+  if (!from._internal_next_page_token().empty()) {
+    _this->_internal_set_next_page_token(from._internal_next_page_token());
   }
   _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
 }
 
-void GetAverageProductReviewScoreRequest::CopyFrom(const GetAverageProductReviewScoreRequest& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetAverageProductReviewScoreRequest)
+void GetProductReviewsPageResponse::CopyFrom(const GetProductReviewsPageResponse& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetProductReviewsPageResponse)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-PROTOBUF_NOINLINE bool GetAverageProductReviewScoreRequest::IsInitialized() const {
+PROTOBUF_NOINLINE bool GetProductReviewsPageResponse::IsInitialized() const {
   return true;
 }
 
-void GetAverageProductReviewScoreRequest::InternalSwap(GetAverageProductReviewScoreRequest* other) {
+void GetProductReviewsPageResponse::InternalSwap(GetProductReviewsPageResponse* other) {
   using std::swap;
   auto* lhs_arena = GetArenaForAllocation();
   auto* rhs_arena = other->GetArenaForAllocation();
   _internal_metadata_.InternalSwap(&other->_internal_metadata_);
-  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.product_id_, lhs_arena,
-                                       &other->_impl_.product_id_, rhs_arena);
+  _impl_.product_reviews_.InternalSwap(&other->_impl_.product_reviews_);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.next_page_token_, lhs_arena,
+                                       &other->_impl_.next_page_token_, rhs_arena);
 }
 
-::google::protobuf::Metadata GetAverageProductReviewScoreRequest::GetMetadata() const {
+::google::protobuf::Metadata GetProductReviewsPageResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[16]);
+      file_level_metadata_demo_2eproto[29]);
 }
 // ===================================================================
 
-class GetAverageProductReviewScoreResponse::_Internal {
+class StreamProductReviewsRequest::_Internal {
  public:
 };
 
-GetAverageProductReviewScoreResponse::GetAverageProductReviewScoreResponse(::google::protobuf::Arena* arena)
+StreamProductReviewsRequest::StreamProductReviewsRequest(::google::protobuf::Arena* arena)
     : ::google::protobuf::Message(arena) {
   SharedCtor(arena);
-  // @@protoc_insertion_point(arena_constructor:oteldemo.GetAverageProductReviewScoreResponse)
+  // @@protoc_insertion_point(arena_constructor:oteldemo.StreamProductReviewsRequest)
 }
-GetAverageProductReviewScoreResponse::GetAverageProductReviewScoreResponse(const GetAverageProductReviewScoreResponse& from) : ::google::protobuf::Message() {
-  GetAverageProductReviewScoreResponse* const _this = this;
+StreamProductReviewsRequest::StreamProductReviewsRequest(const StreamProductReviewsRequest& from) : ::google::protobuf::Message() {
+  StreamProductReviewsRequest* const _this = this;
   (void)_this;
   new (&_impl_) Impl_{
-      decltype(_impl_.average_score_){},
+      decltype(_impl_.product_id_){},
       /*decltype(_impl_._cached_size_)*/ {},
   };
   _internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(
       from._internal_metadata_);
-  _impl_.average_score_.InitDefault();
+  _impl_.product_id_.InitDefault();
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        _impl_.average_score_.Set("", GetArenaForAllocation());
+        _impl_.product_id_.Set("", GetArenaForAllocation());
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  if (!from._internal_average_score().empty()) {
-    _this->_impl_.average_score_.Set(from._internal_average_score(), _this->GetArenaForAllocation());
+  if (!from._internal_product_id().empty()) {
+    _this->_impl_.product_id_.Set(from._internal_product_id(), _this->GetArenaForAllocation());
   }
 
-  // @@protoc_insertion_point(copy_constructor:oteldemo.GetAverageProductReviewScoreResponse)
+  // @@protoc_insertion_point(copy_constructor:oteldemo.StreamProductReviewsRequest)
 }
-inline void GetAverageProductReviewScoreResponse::SharedCtor(::_pb::Arena* arena) {
+inline void StreamProductReviewsRequest::SharedCtor(::_pb::Arena* arena) {
   (void)arena;
   new (&_impl_) Impl_{
-      decltype(_impl_.average_score_){},
+      decltype(_impl_.product_id_){},
       /*decltype(_impl_._cached_size_)*/ {},
   };
-  _impl_.average_score_.InitDefault();
+  _impl_.product_id_.InitDefault();
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        _impl_.average_score_.Set("", GetArenaForAllocation());
+        _impl_.product_id_.Set("", GetArenaForAllocation());
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
 }
-GetAverageProductReviewScoreResponse::~GetAverageProductReviewScoreResponse() {
-  // @@protoc_insertion_point(destructor:oteldemo.GetAverageProductReviewScoreResponse)
+StreamProductReviewsRequest::~StreamProductReviewsRequest() {
+  // @@protoc_insertion_point(destructor:oteldemo.StreamProductReviewsRequest)
   _internal_metadata_.Delete<::google::protobuf::UnknownFieldSet>();
   SharedDtor();
 }
-inline void GetAverageProductReviewScoreResponse::SharedDtor() {
+inline void StreamProductReviewsRequest::SharedDtor() {
   ABSL_DCHECK(GetArenaForAllocation() == nullptr);
-  _impl_.average_score_.Destroy();
+  _impl_.product_id_.Destroy();
 }
-void GetAverageProductReviewScoreResponse::SetCachedSize(int size) const {
+void StreamProductReviewsRequest::SetCachedSize(int size) const {
   _impl_._cached_size_.Set(size);
 }
 
-PROTOBUF_NOINLINE void GetAverageProductReviewScoreResponse::Clear() {
-// @@protoc_insertion_point(message_clear_start:oteldemo.GetAverageProductReviewScoreResponse)
+PROTOBUF_NOINLINE void StreamProductReviewsRequest::Clear() {
+// @@protoc_insertion_point(message_clear_start:oteldemo.StreamProductReviewsRequest)
   ::uint32_t cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  _impl_.average_score_.ClearToEmpty();
+  _impl_.product_id_.ClearToEmpty();
   _internal_metadata_.Clear<::google::protobuf::UnknownFieldSet>();
 }
 
-const char* GetAverageProductReviewScoreResponse::_InternalParse(
+const char* StreamProductReviewsRequest::_InternalParse(
     const char* ptr, ::_pbi::ParseContext* ctx) {
   ptr = ::_pbi::TcParser::ParseLoop(this, ptr, ctx, &_table_.header);
   return ptr;
@@ -5317,7 +8388,7 @@ const char* GetAverageProductReviewScoreResponse::_InternalParse(
 
 
 PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1
-const ::_pbi::TcParseTable<0, 1, 0, 67, 2> GetAverageProductReviewScoreResponse::_table_ = {
+const ::_pbi::TcParseTable<0, 1, 0, 55, 2> StreamProductReviewsRequest::_table_ = {
   {
     0,  // no _has_bits_
     0, // no _extensions_
@@ -5328,39 +8399,39 @@ const ::_pbi::TcParseTable<0, 1, 0, 67, 2> GetAverageProductReviewScoreResponse:
     1,  // num_field_entries
     0,  // num_aux_entries
     offsetof(decltype(_table_), field_names),  // no aux_entries
-    &_GetAverageProductReviewScoreResponse_default_instance_._instance,
+    &_StreamProductReviewsRequest_default_instance_._instance,
     ::_pbi::TcParser::GenericFallback,  // fallback
   }, {{
-    // string average_score = 1;
+    // string product_id = 1;
     {::_pbi::TcParser::FastUS1,
-     {10, 63, 0, PROTOBUF_FIELD_OFFSET(GetAverageProductReviewScoreResponse, _impl_.average_score_)}},
+     {10, 63, 0, PROTOBUF_FIELD_OFFSET(StreamProductReviewsRequest, _impl_.product_id_)}},
   }}, {{
     65535, 65535
   }}, {{
-    // string average_score = 1;
-    {PROTOBUF_FIELD_OFFSET(GetAverageProductReviewScoreResponse, _impl_.average_score_), 0, 0,
+    // string product_id = 1;
+    {PROTOBUF_FIELD_OFFSET(StreamProductReviewsRequest, _impl_.product_id_), 0, 0,
     (0 | ::_fl::kFcSingular | ::_fl::kUtf8String | ::_fl::kRepAString)},
   }},
   // no aux_entries
   {{
-    "\55\15\0\0\0\0\0\0"
-    "oteldemo.GetAverageProductReviewScoreResponse"
-    "average_score"
+    "\44\12\0\0\0\0\0\0"
+    "oteldemo.StreamProductReviewsRequest"
+    "product_id"
   }},
 };
 
-::uint8_t* GetAverageProductReviewScoreResponse::_InternalSerialize(
+::uint8_t* StreamProductReviewsRequest::_InternalSerialize(
     ::uint8_t* target,
     ::google::protobuf::io::EpsCopyOutputStream* stream) const {
-  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.GetAverageProductReviewScoreResponse)
+  // @@protoc_insertion_point(serialize_to_array_start:oteldemo.StreamProductReviewsRequest)
   ::uint32_t cached_has_bits = 0;
   (void)cached_has_bits;
 
-  // string average_score = 1;
-  if (!this->_internal_average_score().empty()) {
-    const std::string& _s = this->_internal_average_score();
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
+    const std::string& _s = this->_internal_product_id();
     ::google::protobuf::internal::WireFormatLite::VerifyUtf8String(
-        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.GetAverageProductReviewScoreResponse.average_score");
+        _s.data(), static_cast<int>(_s.length()), ::google::protobuf::internal::WireFormatLite::SERIALIZE, "oteldemo.StreamProductReviewsRequest.product_id");
     target = stream->WriteStringMaybeAliased(1, _s, target);
   }
 
@@ -5369,72 +8440,72 @@ const ::_pbi::TcParseTable<0, 1, 0, 67, 2> GetAverageProductReviewScoreResponse:
         ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
             _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance), target, stream);
   }
-  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.GetAverageProductReviewScoreResponse)
+  // @@protoc_insertion_point(serialize_to_array_end:oteldemo.StreamProductReviewsRequest)
   return target;
 }
 
-::size_t GetAverageProductReviewScoreResponse::ByteSizeLong() const {
-// @@protoc_insertion_point(message_byte_size_start:oteldemo.GetAverageProductReviewScoreResponse)
+::size_t StreamProductReviewsRequest::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:oteldemo.StreamProductReviewsRequest)
   ::size_t total_size = 0;
 
   ::uint32_t cached_has_bits = 0;
   // Prevent compiler warnings about cached_has_bits being unused
   (void) cached_has_bits;
 
-  // string average_score = 1;
-  if (!this->_internal_average_score().empty()) {
+  // string product_id = 1;
+  if (!this->_internal_product_id().empty()) {
     total_size += 1 + ::google::protobuf::internal::WireFormatLite::StringSize(
-                                    this->_internal_average_score());
+                                    this->_internal_product_id());
   }
 
   return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
 }
 
-const ::google::protobuf::Message::ClassData GetAverageProductReviewScoreResponse::_class_data_ = {
+const ::google::protobuf::Message::ClassData StreamProductReviewsRequest::_class_data_ = {
     ::google::protobuf::Message::CopyWithSourceCheck,
-    GetAverageProductReviewScoreResponse::MergeImpl
+    StreamProductReviewsRequest::MergeImpl
 };
-const ::google::protobuf::Message::ClassData*GetAverageProductReviewScoreResponse::GetClassData() const { return &_class_data_; }
+const ::google::protobuf::Message::ClassData*StreamProductReviewsRequest::GetClassData() const { return &_class_data_; }
 
 
-void GetAverageProductReviewScoreResponse::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
-  auto* const _this = static_cast<GetAverageProductReviewScoreResponse*>(&to_msg);
-  auto& from = static_cast<const GetAverageProductReviewScoreResponse&>(from_msg);
-  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.GetAverageProductReviewScoreResponse)
+void StreamProductReviewsRequest::MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg) {
+  auto* const _this = static_cast<StreamProductReviewsRequest*>(&to_msg);
+  auto& from = static_cast<const StreamProductReviewsRequest&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:oteldemo.StreamProductReviewsRequest)
   ABSL_DCHECK_NE(&from, _this);
   ::uint32_t cached_has_bits = 0;
   (void) cached_has_bits;
 
-  if (!from._internal_average_score().empty()) {
-    _this->_internal_set_average_score(from._internal_average_score());
+  if (!from._internal_product_id().empty()) {
+    _this->_internal_set_product_id(from._internal_product_id());
   }
   _this->_internal_metadata_.MergeFrom<::google::protobuf::UnknownFieldSet>(from._internal_metadata_);
 }
 
-void GetAverageProductReviewScoreResponse::CopyFrom(const GetAverageProductReviewScoreResponse& from) {
-// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.GetAverageProductReviewScoreResponse)
+void StreamProductReviewsRequest::CopyFrom(const StreamProductReviewsRequest& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:oteldemo.StreamProductReviewsRequest)
   if (&from == this) return;
   Clear();
   MergeFrom(from);
 }
 
-PROTOBUF_NOINLINE bool GetAverageProductReviewScoreResponse::IsInitialized() const {
+PROTOBUF_NOINLINE bool StreamProductReviewsRequest::IsInitialized() const {
   return true;
 }
 
-void GetAverageProductReviewScoreResponse::InternalSwap(GetAverageProductReviewScoreResponse* other) {
+void StreamProductReviewsRequest::InternalSwap(StreamProductReviewsRequest* other) {
   using std::swap;
   auto* lhs_arena = GetArenaForAllocation();
   auto* rhs_arena = other->GetArenaForAllocation();
   _internal_metadata_.InternalSwap(&other->_internal_metadata_);
-  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.average_score_, lhs_arena,
-                                       &other->_impl_.average_score_, rhs_arena);
+  ::_pbi::ArenaStringPtr::InternalSwap(&_impl_.product_id_, lhs_arena,
+                                       &other->_impl_.product_id_, rhs_arena);
 }
 
-::google::protobuf::Metadata GetAverageProductReviewScoreResponse::GetMetadata() const {
+::google::protobuf::Metadata StreamProductReviewsRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[17]);
+      file_level_metadata_demo_2eproto[30]);
 }
 // ===================================================================
 
@@ -5666,7 +8737,7 @@ void AskProductAIAssistantRequest::InternalSwap(AskProductAIAssistantRequest* ot
 ::google::protobuf::Metadata AskProductAIAssistantRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[18]);
+      file_level_metadata_demo_2eproto[31]);
 }
 // ===================================================================
 
@@ -5857,7 +8928,7 @@ void AskProductAIAssistantResponse::InternalSwap(AskProductAIAssistantResponse*
 ::google::protobuf::Metadata AskProductAIAssistantResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[19]);
+      file_level_metadata_demo_2eproto[32]);
 }
 // ===================================================================
 
@@ -6082,7 +9153,7 @@ void GetQuoteRequest::InternalSwap(GetQuoteRequest* other) {
 ::google::protobuf::Metadata GetQuoteRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[20]);
+      file_level_metadata_demo_2eproto[33]);
 }
 // ===================================================================
 
@@ -6280,7 +9351,7 @@ void GetQuoteResponse::InternalSwap(GetQuoteResponse* other) {
 ::google::protobuf::Metadata GetQuoteResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[21]);
+      file_level_metadata_demo_2eproto[34]);
 }
 // ===================================================================
 
@@ -6505,7 +9576,7 @@ void ShipOrderRequest::InternalSwap(ShipOrderRequest* other) {
 ::google::protobuf::Metadata ShipOrderRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[22]);
+      file_level_metadata_demo_2eproto[35]);
 }
 // ===================================================================
 
@@ -6696,7 +9767,7 @@ void ShipOrderResponse::InternalSwap(ShipOrderResponse* other) {
 ::google::protobuf::Metadata ShipOrderResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[23]);
+      file_level_metadata_demo_2eproto[36]);
 }
 // ===================================================================
 
@@ -7054,7 +10125,7 @@ void Address::InternalSwap(Address* other) {
 ::google::protobuf::Metadata Address::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[24]);
+      file_level_metadata_demo_2eproto[37]);
 }
 // ===================================================================
 
@@ -7306,7 +10377,7 @@ void Money::InternalSwap(Money* other) {
 ::google::protobuf::Metadata Money::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[25]);
+      file_level_metadata_demo_2eproto[38]);
 }
 // ===================================================================
 
@@ -7481,7 +10552,7 @@ void GetSupportedCurrenciesResponse::InternalSwap(GetSupportedCurrenciesResponse
 ::google::protobuf::Metadata GetSupportedCurrenciesResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[26]);
+      file_level_metadata_demo_2eproto[39]);
 }
 // ===================================================================
 
@@ -7724,7 +10795,7 @@ void CurrencyConversionRequest::InternalSwap(CurrencyConversionRequest* other) {
 ::google::protobuf::Metadata CurrencyConversionRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[27]);
+      file_level_metadata_demo_2eproto[40]);
 }
 // ===================================================================
 
@@ -7999,7 +11070,7 @@ void CreditCardInfo::InternalSwap(CreditCardInfo* other) {
 ::google::protobuf::Metadata CreditCardInfo::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[28]);
+      file_level_metadata_demo_2eproto[41]);
 }
 // ===================================================================
 
@@ -8251,7 +11322,7 @@ void ChargeRequest::InternalSwap(ChargeRequest* other) {
 ::google::protobuf::Metadata ChargeRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[29]);
+      file_level_metadata_demo_2eproto[42]);
 }
 // ===================================================================
 
@@ -8442,7 +11513,7 @@ void ChargeResponse::InternalSwap(ChargeResponse* other) {
 ::google::protobuf::Metadata ChargeResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[30]);
+      file_level_metadata_demo_2eproto[43]);
 }
 // ===================================================================
 
@@ -8694,7 +11765,7 @@ void OrderItem::InternalSwap(OrderItem* other) {
 ::google::protobuf::Metadata OrderItem::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[31]);
+      file_level_metadata_demo_2eproto[44]);
 }
 // ===================================================================
 
@@ -9062,7 +12133,7 @@ void OrderResult::InternalSwap(OrderResult* other) {
 ::google::protobuf::Metadata OrderResult::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[32]);
+      file_level_metadata_demo_2eproto[45]);
 }
 // ===================================================================
 
@@ -9305,7 +12376,7 @@ void SendOrderConfirmationRequest::InternalSwap(SendOrderConfirmationRequest* ot
 ::google::protobuf::Metadata SendOrderConfirmationRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[33]);
+      file_level_metadata_demo_2eproto[46]);
 }
 // ===================================================================
 
@@ -9687,7 +12758,7 @@ void PlaceOrderRequest::InternalSwap(PlaceOrderRequest* other) {
 ::google::protobuf::Metadata PlaceOrderRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[34]);
+      file_level_metadata_demo_2eproto[47]);
 }
 // ===================================================================
 
@@ -9885,7 +12956,7 @@ void PlaceOrderResponse::InternalSwap(PlaceOrderResponse* other) {
 ::google::protobuf::Metadata PlaceOrderResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[35]);
+      file_level_metadata_demo_2eproto[48]);
 }
 // ===================================================================
 
@@ -10060,7 +13131,7 @@ void AdRequest::InternalSwap(AdRequest* other) {
 ::google::protobuf::Metadata AdRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[36]);
+      file_level_metadata_demo_2eproto[49]);
 }
 // ===================================================================
 
@@ -10232,7 +13303,7 @@ void AdResponse::InternalSwap(AdResponse* other) {
 ::google::protobuf::Metadata AdResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[37]);
+      file_level_metadata_demo_2eproto[50]);
 }
 // ===================================================================
 
@@ -10464,7 +13535,7 @@ void Ad::InternalSwap(Ad* other) {
 ::google::protobuf::Metadata Ad::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[38]);
+      file_level_metadata_demo_2eproto[51]);
 }
 // ===================================================================
 
@@ -10723,7 +13794,7 @@ void Flag::InternalSwap(Flag* other) {
 ::google::protobuf::Metadata Flag::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[39]);
+      file_level_metadata_demo_2eproto[52]);
 }
 // ===================================================================
 
@@ -10914,7 +13985,7 @@ void GetFlagRequest::InternalSwap(GetFlagRequest* other) {
 ::google::protobuf::Metadata GetFlagRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[40]);
+      file_level_metadata_demo_2eproto[53]);
 }
 // ===================================================================
 
@@ -11112,7 +14183,7 @@ void GetFlagResponse::InternalSwap(GetFlagResponse* other) {
 ::google::protobuf::Metadata GetFlagResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[41]);
+      file_level_metadata_demo_2eproto[54]);
 }
 // ===================================================================
 
@@ -11371,7 +14442,7 @@ void CreateFlagRequest::InternalSwap(CreateFlagRequest* other) {
 ::google::protobuf::Metadata CreateFlagRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[42]);
+      file_level_metadata_demo_2eproto[55]);
 }
 // ===================================================================
 
@@ -11569,7 +14640,7 @@ void CreateFlagResponse::InternalSwap(CreateFlagResponse* other) {
 ::google::protobuf::Metadata CreateFlagResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[43]);
+      file_level_metadata_demo_2eproto[56]);
 }
 // ===================================================================
 
@@ -11786,7 +14857,7 @@ void UpdateFlagRequest::InternalSwap(UpdateFlagRequest* other) {
 ::google::protobuf::Metadata UpdateFlagRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[44]);
+      file_level_metadata_demo_2eproto[57]);
 }
 // ===================================================================
 
@@ -11825,7 +14896,7 @@ const ::google::protobuf::Message::ClassData*UpdateFlagResponse::GetClassData()
 ::google::protobuf::Metadata UpdateFlagResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[45]);
+      file_level_metadata_demo_2eproto[58]);
 }
 // ===================================================================
 
@@ -11864,7 +14935,7 @@ const ::google::protobuf::Message::ClassData*ListFlagsRequest::GetClassData() co
 ::google::protobuf::Metadata ListFlagsRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[46]);
+      file_level_metadata_demo_2eproto[59]);
 }
 // ===================================================================
 
@@ -12036,7 +15107,7 @@ void ListFlagsResponse::InternalSwap(ListFlagsResponse* other) {
 ::google::protobuf::Metadata ListFlagsResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[47]);
+      file_level_metadata_demo_2eproto[60]);
 }
 // ===================================================================
 
@@ -12227,7 +15298,7 @@ void DeleteFlagRequest::InternalSwap(DeleteFlagRequest* other) {
 ::google::protobuf::Metadata DeleteFlagRequest::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[48]);
+      file_level_metadata_demo_2eproto[61]);
 }
 // ===================================================================
 
@@ -12266,7 +15337,7 @@ const ::google::protobuf::Message::ClassData*DeleteFlagResponse::GetClassData()
 ::google::protobuf::Metadata DeleteFlagResponse::GetMetadata() const {
   return ::_pbi::AssignDescriptors(
       &descriptor_table_demo_2eproto_getter, &descriptor_table_demo_2eproto_once,
-      file_level_metadata_demo_2eproto[49]);
+      file_level_metadata_demo_2eproto[62]);
 }
 // @@protoc_insertion_point(namespace_scope)
 }  // namespace oteldemo
@@ -121,6 +121,12 @@ extern GetAverageProductReviewScoreRequestDefaultTypeInternal _GetAverageProduct
 class GetAverageProductReviewScoreResponse;
 struct GetAverageProductReviewScoreResponseDefaultTypeInternal;
 extern GetAverageProductReviewScoreResponseDefaultTypeInternal _GetAverageProductReviewScoreResponse_default_instance_;
+class GetAverageScoresBatchRequest;
+struct GetAverageScoresBatchRequestDefaultTypeInternal;
+extern GetAverageScoresBatchRequestDefaultTypeInternal _GetAverageScoresBatchRequest_default_instance_;
+class GetAverageScoresBatchResponse;
+struct GetAverageScoresBatchResponseDefaultTypeInternal;
+extern GetAverageScoresBatchResponseDefaultTypeInternal _GetAverageScoresBatchResponse_default_instance_;
 class GetCartRequest;
 struct GetCartRequestDefaultTypeInternal;
 extern GetCartRequestDefaultTypeInternal _GetCartRequest_default_instance_;
@@ -133,6 +139,24 @@ extern GetFlagResponseDefaultTypeInternal _GetFlagResponse_default_instance_;
 class GetProductRequest;
 struct GetProductRequestDefaultTypeInternal;
 extern GetProductRequestDefaultTypeInternal _GetProductRequest_default_instance_;
+class GetProductReviewScoreHistogramRequest;
+struct GetProductReviewScoreHistogramRequestDefaultTypeInternal;
+extern GetProductReviewScoreHistogramRequestDefaultTypeInternal _GetProductReviewScoreHistogramRequest_default_instance_;
+class GetProductReviewScoreHistogramResponse;
+struct GetProductReviewScoreHistogramResponseDefaultTypeInternal;
+extern GetProductReviewScoreHistogramResponseDefaultTypeInternal _GetProductReviewScoreHistogramResponse_default_instance_;
+class GetProductReviewsBatchRequest;
+struct GetProductReviewsBatchRequestDefaultTypeInternal;
+extern GetProductReviewsBatchRequestDefaultTypeInternal _GetProductReviewsBatchRequest_default_instance_;
+class GetProductReviewsBatchResponse;
+struct GetProductReviewsBatchResponseDefaultTypeInternal;
+extern GetProductReviewsBatchResponseDefaultTypeInternal _GetProductReviewsBatchResponse_default_instance_;
+class GetProductReviewsPageRequest;
+struct GetProductReviewsPageRequestDefaultTypeInternal;
+extern GetProductReviewsPageRequestDefaultTypeInternal _GetProductReviewsPageRequest_default_instance_;
+class GetProductReviewsPageResponse;
+struct GetProductReviewsPageResponseDefaultTypeInternal;
+extern GetProductReviewsPageResponseDefaultTypeInternal _GetProductReviewsPageResponse_default_instance_;
 class GetProductReviewsRequest;
 struct GetProductReviewsRequestDefaultTypeInternal;
 extern GetProductReviewsRequestDefaultTypeInternal _GetProductReviewsRequest_default_instance_;
@@ -157,6 +181,12 @@ extern ListFlagsResponseDefaultTypeInternal _ListFlagsResponse_default_instance_
 class ListProductsResponse;
 struct ListProductsResponseDefaultTypeInternal;
 extern ListProductsResponseDefaultTypeInternal _ListProductsResponse_default_instance_;
+class ListRecommendationsBatchRequest;
+struct ListRecommendationsBatchRequestDefaultTypeInternal;
+extern ListRecommendationsBatchRequestDefaultTypeInternal _ListRecommendationsBatchRequest_default_instance_;
+class ListRecommendationsBatchResponse;
+struct ListRecommendationsBatchResponseDefaultTypeInternal;
+extern ListRecommendationsBatchResponseDefaultTypeInternal _ListRecommendationsBatchResponse_default_instance_;
 class ListRecommendationsRequest;
 struct ListRecommendationsRequestDefaultTypeInternal;
 extern ListRecommendationsRequestDefaultTypeInternal _ListRecommendationsRequest_default_instance_;
@@ -181,9 +211,15 @@ extern PlaceOrderResponseDefaultTypeInternal _PlaceOrderResponse_default_instanc
 class Product;
 struct ProductDefaultTypeInternal;
 extern ProductDefaultTypeInternal _Product_default_instance_;
+class ProductAverageScore;
+struct ProductAverageScoreDefaultTypeInternal;
+extern ProductAverageScoreDefaultTypeInternal _ProductAverageScore_default_instance_;
 class ProductReview;
 struct ProductReviewDefaultTypeInternal;
 extern ProductReviewDefaultTypeInternal _ProductReview_default_instance_;
+class ProductReviews;
+struct ProductReviewsDefaultTypeInternal;
+extern ProductReviewsDefaultTypeInternal _ProductReviews_default_instance_;
 class SearchProductsRequest;
 struct SearchProductsRequestDefaultTypeInternal;
 extern SearchProductsRequestDefaultTypeInternal _SearchProductsRequest_default_instance_;
@@ -199,6 +235,9 @@ extern ShipOrderRequestDefaultTypeInternal _ShipOrderRequest_default_instance_;
 class ShipOrderResponse;
 struct ShipOrderResponseDefaultTypeInternal;
 extern ShipOrderResponseDefaultTypeInternal _ShipOrderResponse_default_instance_;
+class StreamProductReviewsRequest;
+struct StreamProductReviewsRequestDefaultTypeInternal;
+extern StreamProductReviewsRequestDefaultTypeInternal _StreamProductReviewsRequest_default_instance_;
 class UpdateFlagRequest;
 struct UpdateFlagRequestDefaultTypeInternal;
 extern UpdateFlagRequestDefaultTypeInternal _UpdateFlagRequest_default_instance_;
@@ -1583,6 +1622,338 @@ class ListRecommendationsResponse final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
+class ListRecommendationsBatchRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ListRecommendationsBatchRequest) */ {
+ public:
+  inline ListRecommendationsBatchRequest() : ListRecommendationsBatchRequest(nullptr) {}
+  ~ListRecommendationsBatchRequest() override;
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR ListRecommendationsBatchRequest(::google::protobuf::internal::ConstantInitialized);
+
+  ListRecommendationsBatchRequest(const ListRecommendationsBatchRequest& from);
+  ListRecommendationsBatchRequest(ListRecommendationsBatchRequest&& from) noexcept
+    : ListRecommendationsBatchRequest() {
+    *this = ::std::move(from);
+  }
+
+  inline ListRecommendationsBatchRequest& operator=(const ListRecommendationsBatchRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline ListRecommendationsBatchRequest& operator=(ListRecommendationsBatchRequest&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const ListRecommendationsBatchRequest& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const ListRecommendationsBatchRequest* internal_default_instance() {
+    return reinterpret_cast<const ListRecommendationsBatchRequest*>(
+               &_ListRecommendationsBatchRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    8;
+
+  friend void swap(ListRecommendationsBatchRequest& a, ListRecommendationsBatchRequest& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(ListRecommendationsBatchRequest* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(ListRecommendationsBatchRequest* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  ListRecommendationsBatchRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ListRecommendationsBatchRequest>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const ListRecommendationsBatchRequest& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const ListRecommendationsBatchRequest& from) {
+    ListRecommendationsBatchRequest::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(ListRecommendationsBatchRequest* other);
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.ListRecommendationsBatchRequest";
+  }
+  protected:
+  explicit ListRecommendationsBatchRequest(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kRequestsFieldNumber = 1,
+  };
+  // repeated .oteldemo.ListRecommendationsRequest requests = 1;
+  int requests_size() const;
+  private:
+  int _internal_requests_size() const;
+
+  public:
+  void clear_requests() ;
+  ::oteldemo::ListRecommendationsRequest* mutable_requests(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsRequest >*
+      mutable_requests();
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>& _internal_requests() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>* _internal_mutable_requests();
+  public:
+  const ::oteldemo::ListRecommendationsRequest& requests(int index) const;
+  ::oteldemo::ListRecommendationsRequest* add_requests();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsRequest >&
+      requests() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.ListRecommendationsBatchRequest)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsRequest > requests_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class ListRecommendationsBatchResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ListRecommendationsBatchResponse) */ {
+ public:
+  inline ListRecommendationsBatchResponse() : ListRecommendationsBatchResponse(nullptr) {}
+  ~ListRecommendationsBatchResponse() override;
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR ListRecommendationsBatchResponse(::google::protobuf::internal::ConstantInitialized);
+
+  ListRecommendationsBatchResponse(const ListRecommendationsBatchResponse& from);
+  ListRecommendationsBatchResponse(ListRecommendationsBatchResponse&& from) noexcept
+    : ListRecommendationsBatchResponse() {
+    *this = ::std::move(from);
+  }
+
+  inline ListRecommendationsBatchResponse& operator=(const ListRecommendationsBatchResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline ListRecommendationsBatchResponse& operator=(ListRecommendationsBatchResponse&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const ListRecommendationsBatchResponse& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const ListRecommendationsBatchResponse* internal_default_instance() {
+    return reinterpret_cast<const ListRecommendationsBatchResponse*>(
+               &_ListRecommendationsBatchResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    9;
+
+  friend void swap(ListRecommendationsBatchResponse& a, ListRecommendationsBatchResponse& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(ListRecommendationsBatchResponse* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(ListRecommendationsBatchResponse* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  ListRecommendationsBatchResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ListRecommendationsBatchResponse>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const ListRecommendationsBatchResponse& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const ListRecommendationsBatchResponse& from) {
+    ListRecommendationsBatchResponse::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(ListRecommendationsBatchResponse* other);
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.ListRecommendationsBatchResponse";
+  }
+  protected:
+  explicit ListRecommendationsBatchResponse(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kResponsesFieldNumber = 1,
+  };
+  // repeated .oteldemo.ListRecommendationsResponse responses = 1;
+  int responses_size() const;
+  private:
+  int _internal_responses_size() const;
+
+  public:
+  void clear_responses() ;
+  ::oteldemo::ListRecommendationsResponse* mutable_responses(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsResponse >*
+      mutable_responses();
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>& _internal_responses() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>* _internal_mutable_responses();
+  public:
+  const ::oteldemo::ListRecommendationsResponse& responses(int index) const;
+  ::oteldemo::ListRecommendationsResponse* add_responses();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsResponse >&
+      responses() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.ListRecommendationsBatchResponse)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsResponse > responses_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
 class Product final :
     public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.Product) */ {
  public:
@@ -1639,7 +2010,7 @@ class Product final :
                &_Product_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    8;
+    10;
 
   friend void swap(Product& a, Product& b) {
     a.Swap(&b);
@@ -1905,7 +2276,7 @@ class ListProductsResponse final :
                &_ListProductsResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    9;
+    11;
 
   friend void swap(ListProductsResponse& a, ListProductsResponse& b) {
     a.Swap(&b);
@@ -2071,7 +2442,7 @@ class GetProductRequest final :
                &_GetProductRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    10;
+    12;
 
   friend void swap(GetProductRequest& a, GetProductRequest& b) {
     a.Swap(&b);
@@ -2235,7 +2606,7 @@ class SearchProductsRequest final :
                &_SearchProductsRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    11;
+    13;
 
   friend void swap(SearchProductsRequest& a, SearchProductsRequest& b) {
     a.Swap(&b);
@@ -2399,7 +2770,7 @@ class SearchProductsResponse final :
                &_SearchProductsResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    12;
+    14;
 
   friend void swap(SearchProductsResponse& a, SearchProductsResponse& b) {
     a.Swap(&b);
@@ -2565,7 +2936,7 @@ class ProductReview final :
                &_ProductReview_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    13;
+    15;
 
   friend void swap(ProductReview& a, ProductReview& b) {
     a.Swap(&b);
@@ -2765,7 +3136,7 @@ class GetProductReviewsRequest final :
                &_GetProductReviewsRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    14;
+    16;
 
   friend void swap(GetProductReviewsRequest& a, GetProductReviewsRequest& b) {
     a.Swap(&b);
@@ -2929,7 +3300,7 @@ class GetProductReviewsResponse final :
                &_GetProductReviewsResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    15;
+    17;
 
   friend void swap(GetProductReviewsResponse& a, GetProductReviewsResponse& b) {
     a.Swap(&b);
@@ -3095,7 +3466,7 @@ class GetAverageProductReviewScoreRequest final :
                &_GetAverageProductReviewScoreRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    16;
+    18;
 
   friend void swap(GetAverageProductReviewScoreRequest& a, GetAverageProductReviewScoreRequest& b) {
     a.Swap(&b);
@@ -3259,7 +3630,7 @@ class GetAverageProductReviewScoreResponse final :
                &_GetAverageProductReviewScoreResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    17;
+    19;
 
   friend void swap(GetAverageProductReviewScoreResponse& a, GetAverageProductReviewScoreResponse& b) {
     a.Swap(&b);
@@ -3367,25 +3738,25 @@ class GetAverageProductReviewScoreResponse final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class AskProductAIAssistantRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.AskProductAIAssistantRequest) */ {
+class GetProductReviewScoreHistogramRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetProductReviewScoreHistogramRequest) */ {
  public:
-  inline AskProductAIAssistantRequest() : AskProductAIAssistantRequest(nullptr) {}
-  ~AskProductAIAssistantRequest() override;
+  inline GetProductReviewScoreHistogramRequest() : GetProductReviewScoreHistogramRequest(nullptr) {}
+  ~GetProductReviewScoreHistogramRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR AskProductAIAssistantRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetProductReviewScoreHistogramRequest(::google::protobuf::internal::ConstantInitialized);
 
-  AskProductAIAssistantRequest(const AskProductAIAssistantRequest& from);
-  AskProductAIAssistantRequest(AskProductAIAssistantRequest&& from) noexcept
-    : AskProductAIAssistantRequest() {
+  GetProductReviewScoreHistogramRequest(const GetProductReviewScoreHistogramRequest& from);
+  GetProductReviewScoreHistogramRequest(GetProductReviewScoreHistogramRequest&& from) noexcept
+    : GetProductReviewScoreHistogramRequest() {
     *this = ::std::move(from);
   }
 
-  inline AskProductAIAssistantRequest& operator=(const AskProductAIAssistantRequest& from) {
+  inline GetProductReviewScoreHistogramRequest& operator=(const GetProductReviewScoreHistogramRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline AskProductAIAssistantRequest& operator=(AskProductAIAssistantRequest&& from) noexcept {
+  inline GetProductReviewScoreHistogramRequest& operator=(GetProductReviewScoreHistogramRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -3415,20 +3786,20 @@ class AskProductAIAssistantRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const AskProductAIAssistantRequest& default_instance() {
+  static const GetProductReviewScoreHistogramRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const AskProductAIAssistantRequest* internal_default_instance() {
-    return reinterpret_cast<const AskProductAIAssistantRequest*>(
-               &_AskProductAIAssistantRequest_default_instance_);
+  static inline const GetProductReviewScoreHistogramRequest* internal_default_instance() {
+    return reinterpret_cast<const GetProductReviewScoreHistogramRequest*>(
+               &_GetProductReviewScoreHistogramRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    18;
+    20;
 
-  friend void swap(AskProductAIAssistantRequest& a, AskProductAIAssistantRequest& b) {
+  friend void swap(GetProductReviewScoreHistogramRequest& a, GetProductReviewScoreHistogramRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(AskProductAIAssistantRequest* other) {
+  inline void Swap(GetProductReviewScoreHistogramRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -3441,7 +3812,7 @@ class AskProductAIAssistantRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(AskProductAIAssistantRequest* other) {
+  void UnsafeArenaSwap(GetProductReviewScoreHistogramRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -3449,14 +3820,14 @@ class AskProductAIAssistantRequest final :
 
   // implements Message ----------------------------------------------
 
-  AskProductAIAssistantRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<AskProductAIAssistantRequest>(arena);
+  GetProductReviewScoreHistogramRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetProductReviewScoreHistogramRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const AskProductAIAssistantRequest& from);
+  void CopyFrom(const GetProductReviewScoreHistogramRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const AskProductAIAssistantRequest& from) {
-    AskProductAIAssistantRequest::MergeImpl(*this, from);
+  void MergeFrom( const GetProductReviewScoreHistogramRequest& from) {
+    GetProductReviewScoreHistogramRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -3474,15 +3845,15 @@ class AskProductAIAssistantRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(AskProductAIAssistantRequest* other);
+  void InternalSwap(GetProductReviewScoreHistogramRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.AskProductAIAssistantRequest";
+    return "oteldemo.GetProductReviewScoreHistogramRequest";
   }
   protected:
-  explicit AskProductAIAssistantRequest(::google::protobuf::Arena* arena);
+  explicit GetProductReviewScoreHistogramRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -3496,7 +3867,6 @@ class AskProductAIAssistantRequest final :
 
   enum : int {
     kProductIdFieldNumber = 1,
-    kQuestionFieldNumber = 2,
   };
   // string product_id = 1;
   void clear_product_id() ;
@@ -3514,34 +3884,17 @@ class AskProductAIAssistantRequest final :
   std::string* _internal_mutable_product_id();
 
   public:
-  // string question = 2;
-  void clear_question() ;
-  const std::string& question() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_question(Arg_&& arg, Args_... args);
-  std::string* mutable_question();
-  PROTOBUF_NODISCARD std::string* release_question();
-  void set_allocated_question(std::string* ptr);
-
-  private:
-  const std::string& _internal_question() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_question(
-      const std::string& value);
-  std::string* _internal_mutable_question();
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.AskProductAIAssistantRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetProductReviewScoreHistogramRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2, 0, 64, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 65, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
     ::google::protobuf::internal::ArenaStringPtr product_id_;
-    ::google::protobuf::internal::ArenaStringPtr question_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -3549,25 +3902,25 @@ class AskProductAIAssistantRequest final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class AskProductAIAssistantResponse final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.AskProductAIAssistantResponse) */ {
+class GetProductReviewScoreHistogramResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetProductReviewScoreHistogramResponse) */ {
  public:
-  inline AskProductAIAssistantResponse() : AskProductAIAssistantResponse(nullptr) {}
-  ~AskProductAIAssistantResponse() override;
+  inline GetProductReviewScoreHistogramResponse() : GetProductReviewScoreHistogramResponse(nullptr) {}
+  ~GetProductReviewScoreHistogramResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR AskProductAIAssistantResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetProductReviewScoreHistogramResponse(::google::protobuf::internal::ConstantInitialized);
 
-  AskProductAIAssistantResponse(const AskProductAIAssistantResponse& from);
-  AskProductAIAssistantResponse(AskProductAIAssistantResponse&& from) noexcept
-    : AskProductAIAssistantResponse() {
+  GetProductReviewScoreHistogramResponse(const GetProductReviewScoreHistogramResponse& from);
+  GetProductReviewScoreHistogramResponse(GetProductReviewScoreHistogramResponse&& from) noexcept
+    : GetProductReviewScoreHistogramResponse() {
     *this = ::std::move(from);
   }
 
-  inline AskProductAIAssistantResponse& operator=(const AskProductAIAssistantResponse& from) {
+  inline GetProductReviewScoreHistogramResponse& operator=(const GetProductReviewScoreHistogramResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline AskProductAIAssistantResponse& operator=(AskProductAIAssistantResponse&& from) noexcept {
+  inline GetProductReviewScoreHistogramResponse& operator=(GetProductReviewScoreHistogramResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -3597,20 +3950,20 @@ class AskProductAIAssistantResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const AskProductAIAssistantResponse& default_instance() {
+  static const GetProductReviewScoreHistogramResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const AskProductAIAssistantResponse* internal_default_instance() {
-    return reinterpret_cast<const AskProductAIAssistantResponse*>(
-               &_AskProductAIAssistantResponse_default_instance_);
+  static inline const GetProductReviewScoreHistogramResponse* internal_default_instance() {
+    return reinterpret_cast<const GetProductReviewScoreHistogramResponse*>(
+               &_GetProductReviewScoreHistogramResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    19;
+    21;
 
-  friend void swap(AskProductAIAssistantResponse& a, AskProductAIAssistantResponse& b) {
+  friend void swap(GetProductReviewScoreHistogramResponse& a, GetProductReviewScoreHistogramResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(AskProductAIAssistantResponse* other) {
+  inline void Swap(GetProductReviewScoreHistogramResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -3623,7 +3976,7 @@ class AskProductAIAssistantResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(AskProductAIAssistantResponse* other) {
+  void UnsafeArenaSwap(GetProductReviewScoreHistogramResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -3631,14 +3984,14 @@ class AskProductAIAssistantResponse final :
 
   // implements Message ----------------------------------------------
 
-  AskProductAIAssistantResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<AskProductAIAssistantResponse>(arena);
+  GetProductReviewScoreHistogramResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetProductReviewScoreHistogramResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const AskProductAIAssistantResponse& from);
+  void CopyFrom(const GetProductReviewScoreHistogramResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const AskProductAIAssistantResponse& from) {
-    AskProductAIAssistantResponse::MergeImpl(*this, from);
+  void MergeFrom( const GetProductReviewScoreHistogramResponse& from) {
+    GetProductReviewScoreHistogramResponse::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -3656,15 +4009,15 @@ class AskProductAIAssistantResponse final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(AskProductAIAssistantResponse* other);
+  void InternalSwap(GetProductReviewScoreHistogramResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.AskProductAIAssistantResponse";
+    return "oteldemo.GetProductReviewScoreHistogramResponse";
   }
   protected:
-  explicit AskProductAIAssistantResponse(::google::protobuf::Arena* arena);
+  explicit GetProductReviewScoreHistogramResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -3677,35 +4030,68 @@ class AskProductAIAssistantResponse final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kResponseFieldNumber = 1,
+    kStarCountsFieldNumber = 3,
+    kAverageScoreFieldNumber = 2,
+    kReviewCountFieldNumber = 1,
   };
-  // string response = 1;
-  void clear_response() ;
-  const std::string& response() const;
+  // repeated int32 star_counts = 3;
+  int star_counts_size() const;
+  private:
+  int _internal_star_counts_size() const;
+
+  public:
+  void clear_star_counts() ;
+  ::int32_t star_counts(int index) const;
+  void set_star_counts(int index, ::int32_t value);
+  void add_star_counts(::int32_t value);
+  const ::google::protobuf::RepeatedField<::int32_t>& star_counts() const;
+  ::google::protobuf::RepeatedField<::int32_t>* mutable_star_counts();
+
+  private:
+  const ::google::protobuf::RepeatedField<::int32_t>& _internal_star_counts() const;
+  ::google::protobuf::RepeatedField<::int32_t>* _internal_mutable_star_counts();
+
+  public:
+  // string average_score = 2;
+  void clear_average_score() ;
+  const std::string& average_score() const;
   template <typename Arg_ = const std::string&, typename... Args_>
-  void set_response(Arg_&& arg, Args_... args);
-  std::string* mutable_response();
-  PROTOBUF_NODISCARD std::string* release_response();
-  void set_allocated_response(std::string* ptr);
+  void set_average_score(Arg_&& arg, Args_... args);
+  std::string* mutable_average_score();
+  PROTOBUF_NODISCARD std::string* release_average_score();
+  void set_allocated_average_score(std::string* ptr);
 
   private:
-  const std::string& _internal_response() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_response(
+  const std::string& _internal_average_score() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_average_score(
       const std::string& value);
-  std::string* _internal_mutable_response();
+  std::string* _internal_mutable_average_score();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.AskProductAIAssistantResponse)
+  // int32 review_count = 1;
+  void clear_review_count() ;
+  ::int32_t review_count() const;
+  void set_review_count(::int32_t value);
+
+  private:
+  ::int32_t _internal_review_count() const;
+  void _internal_set_review_count(::int32_t value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.GetProductReviewScoreHistogramResponse)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 55, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<2, 3, 0, 69, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr response_;
+    ::google::protobuf::RepeatedField<::int32_t> star_counts_;
+    mutable ::google::protobuf::internal::CachedSize _star_counts_cached_byte_size_;
+    ::google::protobuf::internal::ArenaStringPtr average_score_;
+    ::int32_t review_count_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -3713,25 +4099,25 @@ class AskProductAIAssistantResponse final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class GetQuoteRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetQuoteRequest) */ {
+class GetProductReviewsBatchRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetProductReviewsBatchRequest) */ {
  public:
-  inline GetQuoteRequest() : GetQuoteRequest(nullptr) {}
-  ~GetQuoteRequest() override;
+  inline GetProductReviewsBatchRequest() : GetProductReviewsBatchRequest(nullptr) {}
+  ~GetProductReviewsBatchRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR GetQuoteRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetProductReviewsBatchRequest(::google::protobuf::internal::ConstantInitialized);
 
-  GetQuoteRequest(const GetQuoteRequest& from);
-  GetQuoteRequest(GetQuoteRequest&& from) noexcept
-    : GetQuoteRequest() {
+  GetProductReviewsBatchRequest(const GetProductReviewsBatchRequest& from);
+  GetProductReviewsBatchRequest(GetProductReviewsBatchRequest&& from) noexcept
+    : GetProductReviewsBatchRequest() {
     *this = ::std::move(from);
   }
 
-  inline GetQuoteRequest& operator=(const GetQuoteRequest& from) {
+  inline GetProductReviewsBatchRequest& operator=(const GetProductReviewsBatchRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetQuoteRequest& operator=(GetQuoteRequest&& from) noexcept {
+  inline GetProductReviewsBatchRequest& operator=(GetProductReviewsBatchRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -3761,20 +4147,20 @@ class GetQuoteRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetQuoteRequest& default_instance() {
+  static const GetProductReviewsBatchRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const GetQuoteRequest* internal_default_instance() {
-    return reinterpret_cast<const GetQuoteRequest*>(
-               &_GetQuoteRequest_default_instance_);
+  static inline const GetProductReviewsBatchRequest* internal_default_instance() {
+    return reinterpret_cast<const GetProductReviewsBatchRequest*>(
+               &_GetProductReviewsBatchRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    20;
+    22;
 
-  friend void swap(GetQuoteRequest& a, GetQuoteRequest& b) {
+  friend void swap(GetProductReviewsBatchRequest& a, GetProductReviewsBatchRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(GetQuoteRequest* other) {
+  inline void Swap(GetProductReviewsBatchRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -3787,7 +4173,7 @@ class GetQuoteRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetQuoteRequest* other) {
+  void UnsafeArenaSwap(GetProductReviewsBatchRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -3795,14 +4181,14 @@ class GetQuoteRequest final :
 
   // implements Message ----------------------------------------------
 
-  GetQuoteRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<GetQuoteRequest>(arena);
+  GetProductReviewsBatchRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetProductReviewsBatchRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetQuoteRequest& from);
+  void CopyFrom(const GetProductReviewsBatchRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const GetQuoteRequest& from) {
-    GetQuoteRequest::MergeImpl(*this, from);
+  void MergeFrom( const GetProductReviewsBatchRequest& from) {
+    GetProductReviewsBatchRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -3820,15 +4206,15 @@ class GetQuoteRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(GetQuoteRequest* other);
+  void InternalSwap(GetProductReviewsBatchRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.GetQuoteRequest";
+    return "oteldemo.GetProductReviewsBatchRequest";
   }
   protected:
-  explicit GetQuoteRequest(::google::protobuf::Arena* arena);
+  explicit GetProductReviewsBatchRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -3841,81 +4227,73 @@ class GetQuoteRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kItemsFieldNumber = 2,
-    kAddressFieldNumber = 1,
+    kProductIdsFieldNumber = 1,
   };
-  // repeated .oteldemo.CartItem items = 2;
-  int items_size() const;
+  // repeated string product_ids = 1;
+  int product_ids_size() const;
   private:
-  int _internal_items_size() const;
+  int _internal_product_ids_size() const;
 
   public:
-  void clear_items() ;
-  ::oteldemo::CartItem* mutable_items(int index);
-  ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >*
-      mutable_items();
-  private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& _internal_items() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* _internal_mutable_items();
-  public:
-  const ::oteldemo::CartItem& items(int index) const;
-  ::oteldemo::CartItem* add_items();
-  const ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >&
-      items() const;
-  // .oteldemo.Address address = 1;
-  bool has_address() const;
-  void clear_address() ;
-  const ::oteldemo::Address& address() const;
-  PROTOBUF_NODISCARD ::oteldemo::Address* release_address();
-  ::oteldemo::Address* mutable_address();
-  void set_allocated_address(::oteldemo::Address* value);
-  void unsafe_arena_set_allocated_address(::oteldemo::Address* value);
-  ::oteldemo::Address* unsafe_arena_release_address();
+  void clear_product_ids() ;
+  const std::string& product_ids(int index) const;
+  std::string* mutable_product_ids(int index);
+  void set_product_ids(int index, const std::string& value);
+  void set_product_ids(int index, std::string&& value);
+  void set_product_ids(int index, const char* value);
+  void set_product_ids(int index, const char* value, std::size_t size);
+  void set_product_ids(int index, absl::string_view value);
+  std::string* add_product_ids();
+  void add_product_ids(const std::string& value);
+  void add_product_ids(std::string&& value);
+  void add_product_ids(const char* value);
+  void add_product_ids(const char* value, std::size_t size);
+  void add_product_ids(absl::string_view value);
+  const ::google::protobuf::RepeatedPtrField<std::string>& product_ids() const;
+  ::google::protobuf::RepeatedPtrField<std::string>* mutable_product_ids();
 
   private:
-  const ::oteldemo::Address& _internal_address() const;
-  ::oteldemo::Address* _internal_mutable_address();
+  const ::google::protobuf::RepeatedPtrField<std::string>& _internal_product_ids() const;
+  ::google::protobuf::RepeatedPtrField<std::string>* _internal_mutable_product_ids();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetQuoteRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetProductReviewsBatchRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2, 2, 0, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 58, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::RepeatedPtrField<std::string> product_ids_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem > items_;
-    ::oteldemo::Address* address_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class GetQuoteResponse final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetQuoteResponse) */ {
+class ProductReviews final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ProductReviews) */ {
  public:
-  inline GetQuoteResponse() : GetQuoteResponse(nullptr) {}
-  ~GetQuoteResponse() override;
+  inline ProductReviews() : ProductReviews(nullptr) {}
+  ~ProductReviews() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR GetQuoteResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ProductReviews(::google::protobuf::internal::ConstantInitialized);
 
-  GetQuoteResponse(const GetQuoteResponse& from);
-  GetQuoteResponse(GetQuoteResponse&& from) noexcept
-    : GetQuoteResponse() {
+  ProductReviews(const ProductReviews& from);
+  ProductReviews(ProductReviews&& from) noexcept
+    : ProductReviews() {
     *this = ::std::move(from);
   }
 
-  inline GetQuoteResponse& operator=(const GetQuoteResponse& from) {
+  inline ProductReviews& operator=(const ProductReviews& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetQuoteResponse& operator=(GetQuoteResponse&& from) noexcept {
+  inline ProductReviews& operator=(ProductReviews&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -3945,20 +4323,20 @@ class GetQuoteResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetQuoteResponse& default_instance() {
+  static const ProductReviews& default_instance() {
     return *internal_default_instance();
   }
-  static inline const GetQuoteResponse* internal_default_instance() {
-    return reinterpret_cast<const GetQuoteResponse*>(
-               &_GetQuoteResponse_default_instance_);
+  static inline const ProductReviews* internal_default_instance() {
+    return reinterpret_cast<const ProductReviews*>(
+               &_ProductReviews_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    21;
+    23;
 
-  friend void swap(GetQuoteResponse& a, GetQuoteResponse& b) {
+  friend void swap(ProductReviews& a, ProductReviews& b) {
     a.Swap(&b);
   }
-  inline void Swap(GetQuoteResponse* other) {
+  inline void Swap(ProductReviews* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -3971,7 +4349,7 @@ class GetQuoteResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetQuoteResponse* other) {
+  void UnsafeArenaSwap(ProductReviews* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -3979,14 +4357,14 @@ class GetQuoteResponse final :
 
   // implements Message ----------------------------------------------
 
-  GetQuoteResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<GetQuoteResponse>(arena);
+  ProductReviews* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ProductReviews>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetQuoteResponse& from);
+  void CopyFrom(const ProductReviews& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const GetQuoteResponse& from) {
-    GetQuoteResponse::MergeImpl(*this, from);
+  void MergeFrom( const ProductReviews& from) {
+    ProductReviews::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -4004,15 +4382,15 @@ class GetQuoteResponse final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(GetQuoteResponse* other);
+  void InternalSwap(ProductReviews* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.GetQuoteResponse";
+    return "oteldemo.ProductReviews";
   }
   protected:
-  explicit GetQuoteResponse(::google::protobuf::Arena* arena);
+  explicit ProductReviews(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -4025,61 +4403,81 @@ class GetQuoteResponse final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kCostUsdFieldNumber = 1,
+    kProductReviewsFieldNumber = 2,
+    kProductIdFieldNumber = 1,
   };
-  // .oteldemo.Money cost_usd = 1;
-  bool has_cost_usd() const;
-  void clear_cost_usd() ;
-  const ::oteldemo::Money& cost_usd() const;
-  PROTOBUF_NODISCARD ::oteldemo::Money* release_cost_usd();
-  ::oteldemo::Money* mutable_cost_usd();
-  void set_allocated_cost_usd(::oteldemo::Money* value);
-  void unsafe_arena_set_allocated_cost_usd(::oteldemo::Money* value);
-  ::oteldemo::Money* unsafe_arena_release_cost_usd();
-
+  // repeated .oteldemo.ProductReview product_reviews = 2;
+  int product_reviews_size() const;
   private:
-  const ::oteldemo::Money& _internal_cost_usd() const;
-  ::oteldemo::Money* _internal_mutable_cost_usd();
+  int _internal_product_reviews_size() const;
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetQuoteResponse)
- private:
-  class _Internal;
-
-  friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
-  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  void clear_product_reviews() ;
+  ::oteldemo::ProductReview* mutable_product_reviews(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview >*
+      mutable_product_reviews();
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReview>& _internal_product_reviews() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReview>* _internal_mutable_product_reviews();
+  public:
+  const ::oteldemo::ProductReview& product_reviews(int index) const;
+  ::oteldemo::ProductReview* add_product_reviews();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview >&
+      product_reviews() const;
+  // string product_id = 1;
+  void clear_product_id() ;
+  const std::string& product_id() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_product_id(Arg_&& arg, Args_... args);
+  std::string* mutable_product_id();
+  PROTOBUF_NODISCARD std::string* release_product_id();
+  void set_allocated_product_id(std::string* ptr);
+
+  private:
+  const std::string& _internal_product_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_product_id(
+      const std::string& value);
+  std::string* _internal_mutable_product_id();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.ProductReviews)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 1, 42, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview > product_reviews_;
+    ::google::protobuf::internal::ArenaStringPtr product_id_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::Money* cost_usd_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class ShipOrderRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ShipOrderRequest) */ {
+class GetProductReviewsBatchResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetProductReviewsBatchResponse) */ {
  public:
-  inline ShipOrderRequest() : ShipOrderRequest(nullptr) {}
-  ~ShipOrderRequest() override;
+  inline GetProductReviewsBatchResponse() : GetProductReviewsBatchResponse(nullptr) {}
+  ~GetProductReviewsBatchResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR ShipOrderRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetProductReviewsBatchResponse(::google::protobuf::internal::ConstantInitialized);
 
-  ShipOrderRequest(const ShipOrderRequest& from);
-  ShipOrderRequest(ShipOrderRequest&& from) noexcept
-    : ShipOrderRequest() {
+  GetProductReviewsBatchResponse(const GetProductReviewsBatchResponse& from);
+  GetProductReviewsBatchResponse(GetProductReviewsBatchResponse&& from) noexcept
+    : GetProductReviewsBatchResponse() {
     *this = ::std::move(from);
   }
 
-  inline ShipOrderRequest& operator=(const ShipOrderRequest& from) {
+  inline GetProductReviewsBatchResponse& operator=(const GetProductReviewsBatchResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ShipOrderRequest& operator=(ShipOrderRequest&& from) noexcept {
+  inline GetProductReviewsBatchResponse& operator=(GetProductReviewsBatchResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -4109,20 +4507,20 @@ class ShipOrderRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ShipOrderRequest& default_instance() {
+  static const GetProductReviewsBatchResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const ShipOrderRequest* internal_default_instance() {
-    return reinterpret_cast<const ShipOrderRequest*>(
-               &_ShipOrderRequest_default_instance_);
+  static inline const GetProductReviewsBatchResponse* internal_default_instance() {
+    return reinterpret_cast<const GetProductReviewsBatchResponse*>(
+               &_GetProductReviewsBatchResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    22;
+    24;
 
-  friend void swap(ShipOrderRequest& a, ShipOrderRequest& b) {
+  friend void swap(GetProductReviewsBatchResponse& a, GetProductReviewsBatchResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(ShipOrderRequest* other) {
+  inline void Swap(GetProductReviewsBatchResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -4135,7 +4533,7 @@ class ShipOrderRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ShipOrderRequest* other) {
+  void UnsafeArenaSwap(GetProductReviewsBatchResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -4143,14 +4541,14 @@ class ShipOrderRequest final :
 
   // implements Message ----------------------------------------------
 
-  ShipOrderRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<ShipOrderRequest>(arena);
+  GetProductReviewsBatchResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetProductReviewsBatchResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ShipOrderRequest& from);
+  void CopyFrom(const GetProductReviewsBatchResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const ShipOrderRequest& from) {
-    ShipOrderRequest::MergeImpl(*this, from);
+  void MergeFrom( const GetProductReviewsBatchResponse& from) {
+    GetProductReviewsBatchResponse::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -4168,15 +4566,15 @@ class ShipOrderRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(ShipOrderRequest* other);
+  void InternalSwap(GetProductReviewsBatchResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.ShipOrderRequest";
+    return "oteldemo.GetProductReviewsBatchResponse";
   }
   protected:
-  explicit ShipOrderRequest(::google::protobuf::Arena* arena);
+  explicit GetProductReviewsBatchResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -4189,81 +4587,63 @@ class ShipOrderRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kItemsFieldNumber = 2,
-    kAddressFieldNumber = 1,
+    kProductReviewsFieldNumber = 1,
   };
-  // repeated .oteldemo.CartItem items = 2;
-  int items_size() const;
+  // repeated .oteldemo.ProductReviews product_reviews = 1;
+  int product_reviews_size() const;
   private:
-  int _internal_items_size() const;
+  int _internal_product_reviews_size() const;
 
   public:
-  void clear_items() ;
-  ::oteldemo::CartItem* mutable_items(int index);
-  ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >*
-      mutable_items();
-  private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& _internal_items() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* _internal_mutable_items();
-  public:
-  const ::oteldemo::CartItem& items(int index) const;
-  ::oteldemo::CartItem* add_items();
-  const ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >&
-      items() const;
-  // .oteldemo.Address address = 1;
-  bool has_address() const;
-  void clear_address() ;
-  const ::oteldemo::Address& address() const;
-  PROTOBUF_NODISCARD ::oteldemo::Address* release_address();
-  ::oteldemo::Address* mutable_address();
-  void set_allocated_address(::oteldemo::Address* value);
-  void unsafe_arena_set_allocated_address(::oteldemo::Address* value);
-  ::oteldemo::Address* unsafe_arena_release_address();
-
+  void clear_product_reviews() ;
+  ::oteldemo::ProductReviews* mutable_product_reviews(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReviews >*
+      mutable_product_reviews();
   private:
-  const ::oteldemo::Address& _internal_address() const;
-  ::oteldemo::Address* _internal_mutable_address();
-
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReviews>& _internal_product_reviews() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReviews>* _internal_mutable_product_reviews();
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.ShipOrderRequest)
+  const ::oteldemo::ProductReviews& product_reviews(int index) const;
+  ::oteldemo::ProductReviews* add_product_reviews();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReviews >&
+      product_reviews() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.GetProductReviewsBatchResponse)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2, 2, 0, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReviews > product_reviews_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem > items_;
-    ::oteldemo::Address* address_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class ShipOrderResponse final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ShipOrderResponse) */ {
+class GetAverageScoresBatchRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetAverageScoresBatchRequest) */ {
  public:
-  inline ShipOrderResponse() : ShipOrderResponse(nullptr) {}
-  ~ShipOrderResponse() override;
+  inline GetAverageScoresBatchRequest() : GetAverageScoresBatchRequest(nullptr) {}
+  ~GetAverageScoresBatchRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR ShipOrderResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetAverageScoresBatchRequest(::google::protobuf::internal::ConstantInitialized);
 
-  ShipOrderResponse(const ShipOrderResponse& from);
-  ShipOrderResponse(ShipOrderResponse&& from) noexcept
-    : ShipOrderResponse() {
+  GetAverageScoresBatchRequest(const GetAverageScoresBatchRequest& from);
+  GetAverageScoresBatchRequest(GetAverageScoresBatchRequest&& from) noexcept
+    : GetAverageScoresBatchRequest() {
     *this = ::std::move(from);
   }
 
-  inline ShipOrderResponse& operator=(const ShipOrderResponse& from) {
+  inline GetAverageScoresBatchRequest& operator=(const GetAverageScoresBatchRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ShipOrderResponse& operator=(ShipOrderResponse&& from) noexcept {
+  inline GetAverageScoresBatchRequest& operator=(GetAverageScoresBatchRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -4293,20 +4673,20 @@ class ShipOrderResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ShipOrderResponse& default_instance() {
+  static const GetAverageScoresBatchRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const ShipOrderResponse* internal_default_instance() {
-    return reinterpret_cast<const ShipOrderResponse*>(
-               &_ShipOrderResponse_default_instance_);
+  static inline const GetAverageScoresBatchRequest* internal_default_instance() {
+    return reinterpret_cast<const GetAverageScoresBatchRequest*>(
+               &_GetAverageScoresBatchRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    23;
+    25;
 
-  friend void swap(ShipOrderResponse& a, ShipOrderResponse& b) {
+  friend void swap(GetAverageScoresBatchRequest& a, GetAverageScoresBatchRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(ShipOrderResponse* other) {
+  inline void Swap(GetAverageScoresBatchRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -4319,7 +4699,7 @@ class ShipOrderResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ShipOrderResponse* other) {
+  void UnsafeArenaSwap(GetAverageScoresBatchRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -4327,14 +4707,14 @@ class ShipOrderResponse final :
 
   // implements Message ----------------------------------------------
 
-  ShipOrderResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<ShipOrderResponse>(arena);
+  GetAverageScoresBatchRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetAverageScoresBatchRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ShipOrderResponse& from);
+  void CopyFrom(const GetAverageScoresBatchRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const ShipOrderResponse& from) {
-    ShipOrderResponse::MergeImpl(*this, from);
+  void MergeFrom( const GetAverageScoresBatchRequest& from) {
+    GetAverageScoresBatchRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -4352,15 +4732,15 @@ class ShipOrderResponse final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(ShipOrderResponse* other);
+  void InternalSwap(GetAverageScoresBatchRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.ShipOrderResponse";
+    return "oteldemo.GetAverageScoresBatchRequest";
   }
   protected:
-  explicit ShipOrderResponse(::google::protobuf::Arena* arena);
+  explicit GetAverageScoresBatchRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -4373,35 +4753,47 @@ class ShipOrderResponse final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kTrackingIdFieldNumber = 1,
+    kProductIdsFieldNumber = 1,
   };
-  // string tracking_id = 1;
-  void clear_tracking_id() ;
-  const std::string& tracking_id() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_tracking_id(Arg_&& arg, Args_... args);
-  std::string* mutable_tracking_id();
-  PROTOBUF_NODISCARD std::string* release_tracking_id();
-  void set_allocated_tracking_id(std::string* ptr);
+  // repeated string product_ids = 1;
+  int product_ids_size() const;
+  private:
+  int _internal_product_ids_size() const;
+
+  public:
+  void clear_product_ids() ;
+  const std::string& product_ids(int index) const;
+  std::string* mutable_product_ids(int index);
+  void set_product_ids(int index, const std::string& value);
+  void set_product_ids(int index, std::string&& value);
+  void set_product_ids(int index, const char* value);
+  void set_product_ids(int index, const char* value, std::size_t size);
+  void set_product_ids(int index, absl::string_view value);
+  std::string* add_product_ids();
+  void add_product_ids(const std::string& value);
+  void add_product_ids(std::string&& value);
+  void add_product_ids(const char* value);
+  void add_product_ids(const char* value, std::size_t size);
+  void add_product_ids(absl::string_view value);
+  const ::google::protobuf::RepeatedPtrField<std::string>& product_ids() const;
+  ::google::protobuf::RepeatedPtrField<std::string>* mutable_product_ids();
 
   private:
-  const std::string& _internal_tracking_id() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_tracking_id(
-      const std::string& value);
-  std::string* _internal_mutable_tracking_id();
+  const ::google::protobuf::RepeatedPtrField<std::string>& _internal_product_ids() const;
+  ::google::protobuf::RepeatedPtrField<std::string>* _internal_mutable_product_ids();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.ShipOrderResponse)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetAverageScoresBatchRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 46, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 57, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr tracking_id_;
+    ::google::protobuf::RepeatedPtrField<std::string> product_ids_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -4409,25 +4801,25 @@ class ShipOrderResponse final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class Address final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.Address) */ {
+class ProductAverageScore final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ProductAverageScore) */ {
  public:
-  inline Address() : Address(nullptr) {}
-  ~Address() override;
+  inline ProductAverageScore() : ProductAverageScore(nullptr) {}
+  ~ProductAverageScore() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR Address(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ProductAverageScore(::google::protobuf::internal::ConstantInitialized);
 
-  Address(const Address& from);
-  Address(Address&& from) noexcept
-    : Address() {
+  ProductAverageScore(const ProductAverageScore& from);
+  ProductAverageScore(ProductAverageScore&& from) noexcept
+    : ProductAverageScore() {
     *this = ::std::move(from);
   }
 
-  inline Address& operator=(const Address& from) {
+  inline ProductAverageScore& operator=(const ProductAverageScore& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Address& operator=(Address&& from) noexcept {
+  inline ProductAverageScore& operator=(ProductAverageScore&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -4457,20 +4849,20 @@ class Address final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Address& default_instance() {
+  static const ProductAverageScore& default_instance() {
     return *internal_default_instance();
   }
-  static inline const Address* internal_default_instance() {
-    return reinterpret_cast<const Address*>(
-               &_Address_default_instance_);
+  static inline const ProductAverageScore* internal_default_instance() {
+    return reinterpret_cast<const ProductAverageScore*>(
+               &_ProductAverageScore_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    24;
+    26;
 
-  friend void swap(Address& a, Address& b) {
+  friend void swap(ProductAverageScore& a, ProductAverageScore& b) {
     a.Swap(&b);
   }
-  inline void Swap(Address* other) {
+  inline void Swap(ProductAverageScore* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -4483,7 +4875,7 @@ class Address final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Address* other) {
+  void UnsafeArenaSwap(ProductAverageScore* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -4491,14 +4883,14 @@ class Address final :
 
   // implements Message ----------------------------------------------
 
-  Address* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<Address>(arena);
+  ProductAverageScore* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ProductAverageScore>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Address& from);
+  void CopyFrom(const ProductAverageScore& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const Address& from) {
-    Address::MergeImpl(*this, from);
+  void MergeFrom( const ProductAverageScore& from) {
+    ProductAverageScore::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -4516,15 +4908,15 @@ class Address final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(Address* other);
+  void InternalSwap(ProductAverageScore* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.Address";
+    return "oteldemo.ProductAverageScore";
   }
   protected:
-  explicit Address(::google::protobuf::Arena* arena);
+  explicit ProductAverageScore(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -4537,107 +4929,53 @@ class Address final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kStreetAddressFieldNumber = 1,
-    kCityFieldNumber = 2,
-    kStateFieldNumber = 3,
-    kCountryFieldNumber = 4,
-    kZipCodeFieldNumber = 5,
+    kProductIdFieldNumber = 1,
+    kAverageScoreFieldNumber = 2,
   };
-  // string street_address = 1;
-  void clear_street_address() ;
-  const std::string& street_address() const;
+  // string product_id = 1;
+  void clear_product_id() ;
+  const std::string& product_id() const;
   template <typename Arg_ = const std::string&, typename... Args_>
-  void set_street_address(Arg_&& arg, Args_... args);
-  std::string* mutable_street_address();
-  PROTOBUF_NODISCARD std::string* release_street_address();
-  void set_allocated_street_address(std::string* ptr);
+  void set_product_id(Arg_&& arg, Args_... args);
+  std::string* mutable_product_id();
+  PROTOBUF_NODISCARD std::string* release_product_id();
+  void set_allocated_product_id(std::string* ptr);
 
   private:
-  const std::string& _internal_street_address() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_street_address(
+  const std::string& _internal_product_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_product_id(
       const std::string& value);
-  std::string* _internal_mutable_street_address();
+  std::string* _internal_mutable_product_id();
 
   public:
-  // string city = 2;
-  void clear_city() ;
-  const std::string& city() const;
+  // string average_score = 2;
+  void clear_average_score() ;
+  const std::string& average_score() const;
   template <typename Arg_ = const std::string&, typename... Args_>
-  void set_city(Arg_&& arg, Args_... args);
-  std::string* mutable_city();
-  PROTOBUF_NODISCARD std::string* release_city();
-  void set_allocated_city(std::string* ptr);
+  void set_average_score(Arg_&& arg, Args_... args);
+  std::string* mutable_average_score();
+  PROTOBUF_NODISCARD std::string* release_average_score();
+  void set_allocated_average_score(std::string* ptr);
 
   private:
-  const std::string& _internal_city() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_city(
+  const std::string& _internal_average_score() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_average_score(
       const std::string& value);
-  std::string* _internal_mutable_city();
+  std::string* _internal_mutable_average_score();
 
   public:
-  // string state = 3;
-  void clear_state() ;
-  const std::string& state() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_state(Arg_&& arg, Args_... args);
-  std::string* mutable_state();
-  PROTOBUF_NODISCARD std::string* release_state();
-  void set_allocated_state(std::string* ptr);
-
-  private:
-  const std::string& _internal_state() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_state(
-      const std::string& value);
-  std::string* _internal_mutable_state();
-
-  public:
-  // string country = 4;
-  void clear_country() ;
-  const std::string& country() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_country(Arg_&& arg, Args_... args);
-  std::string* mutable_country();
-  PROTOBUF_NODISCARD std::string* release_country();
-  void set_allocated_country(std::string* ptr);
-
-  private:
-  const std::string& _internal_country() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_country(
-      const std::string& value);
-  std::string* _internal_mutable_country();
-
-  public:
-  // string zip_code = 5;
-  void clear_zip_code() ;
-  const std::string& zip_code() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_zip_code(Arg_&& arg, Args_... args);
-  std::string* mutable_zip_code();
-  PROTOBUF_NODISCARD std::string* release_zip_code();
-  void set_allocated_zip_code(std::string* ptr);
-
-  private:
-  const std::string& _internal_zip_code() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_zip_code(
-      const std::string& value);
-  std::string* _internal_mutable_zip_code();
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.Address)
+  // @@protoc_insertion_point(class_scope:oteldemo.ProductAverageScore)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<3, 5, 0, 63, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 0, 60, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr street_address_;
-    ::google::protobuf::internal::ArenaStringPtr city_;
-    ::google::protobuf::internal::ArenaStringPtr state_;
-    ::google::protobuf::internal::ArenaStringPtr country_;
-    ::google::protobuf::internal::ArenaStringPtr zip_code_;
+    ::google::protobuf::internal::ArenaStringPtr product_id_;
+    ::google::protobuf::internal::ArenaStringPtr average_score_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -4645,25 +4983,25 @@ class Address final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class Money final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.Money) */ {
+class GetAverageScoresBatchResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetAverageScoresBatchResponse) */ {
  public:
-  inline Money() : Money(nullptr) {}
-  ~Money() override;
+  inline GetAverageScoresBatchResponse() : GetAverageScoresBatchResponse(nullptr) {}
+  ~GetAverageScoresBatchResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR Money(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetAverageScoresBatchResponse(::google::protobuf::internal::ConstantInitialized);
 
-  Money(const Money& from);
-  Money(Money&& from) noexcept
-    : Money() {
+  GetAverageScoresBatchResponse(const GetAverageScoresBatchResponse& from);
+  GetAverageScoresBatchResponse(GetAverageScoresBatchResponse&& from) noexcept
+    : GetAverageScoresBatchResponse() {
     *this = ::std::move(from);
   }
 
-  inline Money& operator=(const Money& from) {
+  inline GetAverageScoresBatchResponse& operator=(const GetAverageScoresBatchResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Money& operator=(Money&& from) noexcept {
+  inline GetAverageScoresBatchResponse& operator=(GetAverageScoresBatchResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -4693,20 +5031,20 @@ class Money final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Money& default_instance() {
+  static const GetAverageScoresBatchResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const Money* internal_default_instance() {
-    return reinterpret_cast<const Money*>(
-               &_Money_default_instance_);
+  static inline const GetAverageScoresBatchResponse* internal_default_instance() {
+    return reinterpret_cast<const GetAverageScoresBatchResponse*>(
+               &_GetAverageScoresBatchResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    25;
+    27;
 
-  friend void swap(Money& a, Money& b) {
+  friend void swap(GetAverageScoresBatchResponse& a, GetAverageScoresBatchResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(Money* other) {
+  inline void Swap(GetAverageScoresBatchResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -4719,7 +5057,7 @@ class Money final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Money* other) {
+  void UnsafeArenaSwap(GetAverageScoresBatchResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -4727,14 +5065,14 @@ class Money final :
 
   // implements Message ----------------------------------------------
 
-  Money* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<Money>(arena);
+  GetAverageScoresBatchResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetAverageScoresBatchResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Money& from);
+  void CopyFrom(const GetAverageScoresBatchResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const Money& from) {
-    Money::MergeImpl(*this, from);
+  void MergeFrom( const GetAverageScoresBatchResponse& from) {
+    GetAverageScoresBatchResponse::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -4752,15 +5090,15 @@ class Money final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(Money* other);
+  void InternalSwap(GetAverageScoresBatchResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.Money";
+    return "oteldemo.GetAverageScoresBatchResponse";
   }
   protected:
-  explicit Money(::google::protobuf::Arena* arena);
+  explicit GetAverageScoresBatchResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -4773,59 +5111,37 @@ class Money final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kCurrencyCodeFieldNumber = 1,
-    kUnitsFieldNumber = 2,
-    kNanosFieldNumber = 3,
+    kAverageScoresFieldNumber = 1,
   };
-  // string currency_code = 1;
-  void clear_currency_code() ;
-  const std::string& currency_code() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_currency_code(Arg_&& arg, Args_... args);
-  std::string* mutable_currency_code();
-  PROTOBUF_NODISCARD std::string* release_currency_code();
-  void set_allocated_currency_code(std::string* ptr);
-
-  private:
-  const std::string& _internal_currency_code() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_currency_code(
-      const std::string& value);
-  std::string* _internal_mutable_currency_code();
-
-  public:
-  // int64 units = 2;
-  void clear_units() ;
-  ::int64_t units() const;
-  void set_units(::int64_t value);
-
+  // repeated .oteldemo.ProductAverageScore average_scores = 1;
+  int average_scores_size() const;
   private:
-  ::int64_t _internal_units() const;
-  void _internal_set_units(::int64_t value);
+  int _internal_average_scores_size() const;
 
   public:
-  // int32 nanos = 3;
-  void clear_nanos() ;
-  ::int32_t nanos() const;
-  void set_nanos(::int32_t value);
-
+  void clear_average_scores() ;
+  ::oteldemo::ProductAverageScore* mutable_average_scores(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductAverageScore >*
+      mutable_average_scores();
   private:
-  ::int32_t _internal_nanos() const;
-  void _internal_set_nanos(::int32_t value);
-
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::ProductAverageScore>& _internal_average_scores() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::ProductAverageScore>* _internal_mutable_average_scores();
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.Money)
+  const ::oteldemo::ProductAverageScore& average_scores(int index) const;
+  ::oteldemo::ProductAverageScore* add_average_scores();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductAverageScore >&
+      average_scores() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.GetAverageScoresBatchResponse)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<2, 3, 0, 36, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr currency_code_;
-    ::int64_t units_;
-    ::int32_t nanos_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductAverageScore > average_scores_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -4833,25 +5149,25 @@ class Money final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class GetSupportedCurrenciesResponse final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetSupportedCurrenciesResponse) */ {
+class GetProductReviewsPageRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetProductReviewsPageRequest) */ {
  public:
-  inline GetSupportedCurrenciesResponse() : GetSupportedCurrenciesResponse(nullptr) {}
-  ~GetSupportedCurrenciesResponse() override;
+  inline GetProductReviewsPageRequest() : GetProductReviewsPageRequest(nullptr) {}
+  ~GetProductReviewsPageRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR GetSupportedCurrenciesResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetProductReviewsPageRequest(::google::protobuf::internal::ConstantInitialized);
 
-  GetSupportedCurrenciesResponse(const GetSupportedCurrenciesResponse& from);
-  GetSupportedCurrenciesResponse(GetSupportedCurrenciesResponse&& from) noexcept
-    : GetSupportedCurrenciesResponse() {
+  GetProductReviewsPageRequest(const GetProductReviewsPageRequest& from);
+  GetProductReviewsPageRequest(GetProductReviewsPageRequest&& from) noexcept
+    : GetProductReviewsPageRequest() {
     *this = ::std::move(from);
   }
 
-  inline GetSupportedCurrenciesResponse& operator=(const GetSupportedCurrenciesResponse& from) {
+  inline GetProductReviewsPageRequest& operator=(const GetProductReviewsPageRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetSupportedCurrenciesResponse& operator=(GetSupportedCurrenciesResponse&& from) noexcept {
+  inline GetProductReviewsPageRequest& operator=(GetProductReviewsPageRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -4881,20 +5197,20 @@ class GetSupportedCurrenciesResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetSupportedCurrenciesResponse& default_instance() {
+  static const GetProductReviewsPageRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const GetSupportedCurrenciesResponse* internal_default_instance() {
-    return reinterpret_cast<const GetSupportedCurrenciesResponse*>(
-               &_GetSupportedCurrenciesResponse_default_instance_);
+  static inline const GetProductReviewsPageRequest* internal_default_instance() {
+    return reinterpret_cast<const GetProductReviewsPageRequest*>(
+               &_GetProductReviewsPageRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    26;
+    28;
 
-  friend void swap(GetSupportedCurrenciesResponse& a, GetSupportedCurrenciesResponse& b) {
+  friend void swap(GetProductReviewsPageRequest& a, GetProductReviewsPageRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(GetSupportedCurrenciesResponse* other) {
+  inline void Swap(GetProductReviewsPageRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -4907,7 +5223,7 @@ class GetSupportedCurrenciesResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetSupportedCurrenciesResponse* other) {
+  void UnsafeArenaSwap(GetProductReviewsPageRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -4915,14 +5231,14 @@ class GetSupportedCurrenciesResponse final :
 
   // implements Message ----------------------------------------------
 
-  GetSupportedCurrenciesResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<GetSupportedCurrenciesResponse>(arena);
+  GetProductReviewsPageRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetProductReviewsPageRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetSupportedCurrenciesResponse& from);
+  void CopyFrom(const GetProductReviewsPageRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const GetSupportedCurrenciesResponse& from) {
-    GetSupportedCurrenciesResponse::MergeImpl(*this, from);
+  void MergeFrom( const GetProductReviewsPageRequest& from) {
+    GetProductReviewsPageRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -4940,15 +5256,15 @@ class GetSupportedCurrenciesResponse final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(GetSupportedCurrenciesResponse* other);
+  void InternalSwap(GetProductReviewsPageRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.GetSupportedCurrenciesResponse";
+    return "oteldemo.GetProductReviewsPageRequest";
   }
   protected:
-  explicit GetSupportedCurrenciesResponse(::google::protobuf::Arena* arena);
+  explicit GetProductReviewsPageRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -4961,47 +5277,77 @@ class GetSupportedCurrenciesResponse final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kCurrencyCodesFieldNumber = 1,
+    kProductIdFieldNumber = 1,
+    kPageTokenFieldNumber = 3,
+    kPageSizeFieldNumber = 2,
+    kOrderByScoreFieldNumber = 4,
   };
-  // repeated string currency_codes = 1;
-  int currency_codes_size() const;
+  // string product_id = 1;
+  void clear_product_id() ;
+  const std::string& product_id() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_product_id(Arg_&& arg, Args_... args);
+  std::string* mutable_product_id();
+  PROTOBUF_NODISCARD std::string* release_product_id();
+  void set_allocated_product_id(std::string* ptr);
+
   private:
-  int _internal_currency_codes_size() const;
+  const std::string& _internal_product_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_product_id(
+      const std::string& value);
+  std::string* _internal_mutable_product_id();
 
   public:
-  void clear_currency_codes() ;
-  const std::string& currency_codes(int index) const;
-  std::string* mutable_currency_codes(int index);
-  void set_currency_codes(int index, const std::string& value);
-  void set_currency_codes(int index, std::string&& value);
-  void set_currency_codes(int index, const char* value);
-  void set_currency_codes(int index, const char* value, std::size_t size);
-  void set_currency_codes(int index, absl::string_view value);
-  std::string* add_currency_codes();
-  void add_currency_codes(const std::string& value);
-  void add_currency_codes(std::string&& value);
-  void add_currency_codes(const char* value);
-  void add_currency_codes(const char* value, std::size_t size);
-  void add_currency_codes(absl::string_view value);
-  const ::google::protobuf::RepeatedPtrField<std::string>& currency_codes() const;
-  ::google::protobuf::RepeatedPtrField<std::string>* mutable_currency_codes();
+  // string page_token = 3;
+  void clear_page_token() ;
+  const std::string& page_token() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_page_token(Arg_&& arg, Args_... args);
+  std::string* mutable_page_token();
+  PROTOBUF_NODISCARD std::string* release_page_token();
+  void set_allocated_page_token(std::string* ptr);
 
   private:
-  const ::google::protobuf::RepeatedPtrField<std::string>& _internal_currency_codes() const;
-  ::google::protobuf::RepeatedPtrField<std::string>* _internal_mutable_currency_codes();
+  const std::string& _internal_page_token() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_page_token(
+      const std::string& value);
+  std::string* _internal_mutable_page_token();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetSupportedCurrenciesResponse)
+  // int32 page_size = 2;
+  void clear_page_size() ;
+  ::int32_t page_size() const;
+  void set_page_size(::int32_t value);
+
+  private:
+  ::int32_t _internal_page_size() const;
+  void _internal_set_page_size(::int32_t value);
+
+  public:
+  // bool order_by_score = 4;
+  void clear_order_by_score() ;
+  bool order_by_score() const;
+  void set_order_by_score(bool value);
+
+  private:
+  bool _internal_order_by_score() const;
+  void _internal_set_order_by_score(bool value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.GetProductReviewsPageRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 62, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<2, 4, 0, 66, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::RepeatedPtrField<std::string> currency_codes_;
+    ::google::protobuf::internal::ArenaStringPtr product_id_;
+    ::google::protobuf::internal::ArenaStringPtr page_token_;
+    ::int32_t page_size_;
+    bool order_by_score_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -5009,25 +5355,25 @@ class GetSupportedCurrenciesResponse final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class CurrencyConversionRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.CurrencyConversionRequest) */ {
+class GetProductReviewsPageResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetProductReviewsPageResponse) */ {
  public:
-  inline CurrencyConversionRequest() : CurrencyConversionRequest(nullptr) {}
-  ~CurrencyConversionRequest() override;
+  inline GetProductReviewsPageResponse() : GetProductReviewsPageResponse(nullptr) {}
+  ~GetProductReviewsPageResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR CurrencyConversionRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetProductReviewsPageResponse(::google::protobuf::internal::ConstantInitialized);
 
-  CurrencyConversionRequest(const CurrencyConversionRequest& from);
-  CurrencyConversionRequest(CurrencyConversionRequest&& from) noexcept
-    : CurrencyConversionRequest() {
+  GetProductReviewsPageResponse(const GetProductReviewsPageResponse& from);
+  GetProductReviewsPageResponse(GetProductReviewsPageResponse&& from) noexcept
+    : GetProductReviewsPageResponse() {
     *this = ::std::move(from);
   }
 
-  inline CurrencyConversionRequest& operator=(const CurrencyConversionRequest& from) {
+  inline GetProductReviewsPageResponse& operator=(const GetProductReviewsPageResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline CurrencyConversionRequest& operator=(CurrencyConversionRequest&& from) noexcept {
+  inline GetProductReviewsPageResponse& operator=(GetProductReviewsPageResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -5057,20 +5403,20 @@ class CurrencyConversionRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const CurrencyConversionRequest& default_instance() {
+  static const GetProductReviewsPageResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const CurrencyConversionRequest* internal_default_instance() {
-    return reinterpret_cast<const CurrencyConversionRequest*>(
-               &_CurrencyConversionRequest_default_instance_);
+  static inline const GetProductReviewsPageResponse* internal_default_instance() {
+    return reinterpret_cast<const GetProductReviewsPageResponse*>(
+               &_GetProductReviewsPageResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    27;
+    29;
 
-  friend void swap(CurrencyConversionRequest& a, CurrencyConversionRequest& b) {
+  friend void swap(GetProductReviewsPageResponse& a, GetProductReviewsPageResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(CurrencyConversionRequest* other) {
+  inline void Swap(GetProductReviewsPageResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -5083,7 +5429,7 @@ class CurrencyConversionRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(CurrencyConversionRequest* other) {
+  void UnsafeArenaSwap(GetProductReviewsPageResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -5091,14 +5437,14 @@ class CurrencyConversionRequest final :
 
   // implements Message ----------------------------------------------
 
-  CurrencyConversionRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<CurrencyConversionRequest>(arena);
+  GetProductReviewsPageResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetProductReviewsPageResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const CurrencyConversionRequest& from);
+  void CopyFrom(const GetProductReviewsPageResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const CurrencyConversionRequest& from) {
-    CurrencyConversionRequest::MergeImpl(*this, from);
+  void MergeFrom( const GetProductReviewsPageResponse& from) {
+    GetProductReviewsPageResponse::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -5116,15 +5462,15 @@ class CurrencyConversionRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(CurrencyConversionRequest* other);
+  void InternalSwap(GetProductReviewsPageResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.CurrencyConversionRequest";
+    return "oteldemo.GetProductReviewsPageResponse";
   }
   protected:
-  explicit CurrencyConversionRequest(::google::protobuf::Arena* arena);
+  explicit GetProductReviewsPageResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -5137,79 +5483,81 @@ class CurrencyConversionRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kToCodeFieldNumber = 2,
-    kFromFieldNumber = 1,
+    kProductReviewsFieldNumber = 1,
+    kNextPageTokenFieldNumber = 2,
   };
-  // string to_code = 2;
-  void clear_to_code() ;
-  const std::string& to_code() const;
+  // repeated .oteldemo.ProductReview product_reviews = 1;
+  int product_reviews_size() const;
+  private:
+  int _internal_product_reviews_size() const;
+
+  public:
+  void clear_product_reviews() ;
+  ::oteldemo::ProductReview* mutable_product_reviews(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview >*
+      mutable_product_reviews();
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReview>& _internal_product_reviews() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReview>* _internal_mutable_product_reviews();
+  public:
+  const ::oteldemo::ProductReview& product_reviews(int index) const;
+  ::oteldemo::ProductReview* add_product_reviews();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview >&
+      product_reviews() const;
+  // string next_page_token = 2;
+  void clear_next_page_token() ;
+  const std::string& next_page_token() const;
   template <typename Arg_ = const std::string&, typename... Args_>
-  void set_to_code(Arg_&& arg, Args_... args);
-  std::string* mutable_to_code();
-  PROTOBUF_NODISCARD std::string* release_to_code();
-  void set_allocated_to_code(std::string* ptr);
+  void set_next_page_token(Arg_&& arg, Args_... args);
+  std::string* mutable_next_page_token();
+  PROTOBUF_NODISCARD std::string* release_next_page_token();
+  void set_allocated_next_page_token(std::string* ptr);
 
   private:
-  const std::string& _internal_to_code() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_to_code(
+  const std::string& _internal_next_page_token() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_next_page_token(
       const std::string& value);
-  std::string* _internal_mutable_to_code();
+  std::string* _internal_mutable_next_page_token();
 
   public:
-  // .oteldemo.Money from = 1;
-  bool has_from() const;
-  void clear_from() ;
-  const ::oteldemo::Money& from() const;
-  PROTOBUF_NODISCARD ::oteldemo::Money* release_from();
-  ::oteldemo::Money* mutable_from();
-  void set_allocated_from(::oteldemo::Money* value);
-  void unsafe_arena_set_allocated_from(::oteldemo::Money* value);
-  ::oteldemo::Money* unsafe_arena_release_from();
-
-  private:
-  const ::oteldemo::Money& _internal_from() const;
-  ::oteldemo::Money* _internal_mutable_from();
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.CurrencyConversionRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetProductReviewsPageResponse)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2, 1, 50, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 1, 62, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview > product_reviews_;
+    ::google::protobuf::internal::ArenaStringPtr next_page_token_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr to_code_;
-    ::oteldemo::Money* from_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class CreditCardInfo final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.CreditCardInfo) */ {
+class StreamProductReviewsRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.StreamProductReviewsRequest) */ {
  public:
-  inline CreditCardInfo() : CreditCardInfo(nullptr) {}
-  ~CreditCardInfo() override;
+  inline StreamProductReviewsRequest() : StreamProductReviewsRequest(nullptr) {}
+  ~StreamProductReviewsRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR CreditCardInfo(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR StreamProductReviewsRequest(::google::protobuf::internal::ConstantInitialized);
 
-  CreditCardInfo(const CreditCardInfo& from);
-  CreditCardInfo(CreditCardInfo&& from) noexcept
-    : CreditCardInfo() {
+  StreamProductReviewsRequest(const StreamProductReviewsRequest& from);
+  StreamProductReviewsRequest(StreamProductReviewsRequest&& from) noexcept
+    : StreamProductReviewsRequest() {
     *this = ::std::move(from);
   }
 
-  inline CreditCardInfo& operator=(const CreditCardInfo& from) {
+  inline StreamProductReviewsRequest& operator=(const StreamProductReviewsRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline CreditCardInfo& operator=(CreditCardInfo&& from) noexcept {
+  inline StreamProductReviewsRequest& operator=(StreamProductReviewsRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -5239,20 +5587,20 @@ class CreditCardInfo final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const CreditCardInfo& default_instance() {
+  static const StreamProductReviewsRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const CreditCardInfo* internal_default_instance() {
-    return reinterpret_cast<const CreditCardInfo*>(
-               &_CreditCardInfo_default_instance_);
+  static inline const StreamProductReviewsRequest* internal_default_instance() {
+    return reinterpret_cast<const StreamProductReviewsRequest*>(
+               &_StreamProductReviewsRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    28;
+    30;
 
-  friend void swap(CreditCardInfo& a, CreditCardInfo& b) {
+  friend void swap(StreamProductReviewsRequest& a, StreamProductReviewsRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(CreditCardInfo* other) {
+  inline void Swap(StreamProductReviewsRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -5265,7 +5613,7 @@ class CreditCardInfo final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(CreditCardInfo* other) {
+  void UnsafeArenaSwap(StreamProductReviewsRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -5273,14 +5621,14 @@ class CreditCardInfo final :
 
   // implements Message ----------------------------------------------
 
-  CreditCardInfo* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<CreditCardInfo>(arena);
+  StreamProductReviewsRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<StreamProductReviewsRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const CreditCardInfo& from);
+  void CopyFrom(const StreamProductReviewsRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const CreditCardInfo& from) {
-    CreditCardInfo::MergeImpl(*this, from);
+  void MergeFrom( const StreamProductReviewsRequest& from) {
+    StreamProductReviewsRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -5298,15 +5646,15 @@ class CreditCardInfo final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(CreditCardInfo* other);
+  void InternalSwap(StreamProductReviewsRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.CreditCardInfo";
+    return "oteldemo.StreamProductReviewsRequest";
   }
   protected:
-  explicit CreditCardInfo(::google::protobuf::Arena* arena);
+  explicit StreamProductReviewsRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -5319,71 +5667,35 @@ class CreditCardInfo final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kCreditCardNumberFieldNumber = 1,
-    kCreditCardCvvFieldNumber = 2,
-    kCreditCardExpirationYearFieldNumber = 3,
-    kCreditCardExpirationMonthFieldNumber = 4,
+    kProductIdFieldNumber = 1,
   };
-  // string credit_card_number = 1;
-  void clear_credit_card_number() ;
-  const std::string& credit_card_number() const;
+  // string product_id = 1;
+  void clear_product_id() ;
+  const std::string& product_id() const;
   template <typename Arg_ = const std::string&, typename... Args_>
-  void set_credit_card_number(Arg_&& arg, Args_... args);
-  std::string* mutable_credit_card_number();
-  PROTOBUF_NODISCARD std::string* release_credit_card_number();
-  void set_allocated_credit_card_number(std::string* ptr);
+  void set_product_id(Arg_&& arg, Args_... args);
+  std::string* mutable_product_id();
+  PROTOBUF_NODISCARD std::string* release_product_id();
+  void set_allocated_product_id(std::string* ptr);
 
   private:
-  const std::string& _internal_credit_card_number() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_credit_card_number(
+  const std::string& _internal_product_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_product_id(
       const std::string& value);
-  std::string* _internal_mutable_credit_card_number();
-
-  public:
-  // int32 credit_card_cvv = 2;
-  void clear_credit_card_cvv() ;
-  ::int32_t credit_card_cvv() const;
-  void set_credit_card_cvv(::int32_t value);
-
-  private:
-  ::int32_t _internal_credit_card_cvv() const;
-  void _internal_set_credit_card_cvv(::int32_t value);
-
-  public:
-  // int32 credit_card_expiration_year = 3;
-  void clear_credit_card_expiration_year() ;
-  ::int32_t credit_card_expiration_year() const;
-  void set_credit_card_expiration_year(::int32_t value);
-
-  private:
-  ::int32_t _internal_credit_card_expiration_year() const;
-  void _internal_set_credit_card_expiration_year(::int32_t value);
-
-  public:
-  // int32 credit_card_expiration_month = 4;
-  void clear_credit_card_expiration_month() ;
-  ::int32_t credit_card_expiration_month() const;
-  void set_credit_card_expiration_month(::int32_t value);
-
-  private:
-  ::int32_t _internal_credit_card_expiration_month() const;
-  void _internal_set_credit_card_expiration_month(::int32_t value);
+  std::string* _internal_mutable_product_id();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.CreditCardInfo)
+  // @@protoc_insertion_point(class_scope:oteldemo.StreamProductReviewsRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<2, 4, 0, 50, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 55, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr credit_card_number_;
-    ::int32_t credit_card_cvv_;
-    ::int32_t credit_card_expiration_year_;
-    ::int32_t credit_card_expiration_month_;
+    ::google::protobuf::internal::ArenaStringPtr product_id_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -5391,25 +5703,25 @@ class CreditCardInfo final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class ChargeRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ChargeRequest) */ {
+class AskProductAIAssistantRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.AskProductAIAssistantRequest) */ {
  public:
-  inline ChargeRequest() : ChargeRequest(nullptr) {}
-  ~ChargeRequest() override;
+  inline AskProductAIAssistantRequest() : AskProductAIAssistantRequest(nullptr) {}
+  ~AskProductAIAssistantRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR ChargeRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR AskProductAIAssistantRequest(::google::protobuf::internal::ConstantInitialized);
 
-  ChargeRequest(const ChargeRequest& from);
-  ChargeRequest(ChargeRequest&& from) noexcept
-    : ChargeRequest() {
+  AskProductAIAssistantRequest(const AskProductAIAssistantRequest& from);
+  AskProductAIAssistantRequest(AskProductAIAssistantRequest&& from) noexcept
+    : AskProductAIAssistantRequest() {
     *this = ::std::move(from);
   }
 
-  inline ChargeRequest& operator=(const ChargeRequest& from) {
+  inline AskProductAIAssistantRequest& operator=(const AskProductAIAssistantRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ChargeRequest& operator=(ChargeRequest&& from) noexcept {
+  inline AskProductAIAssistantRequest& operator=(AskProductAIAssistantRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -5439,20 +5751,20 @@ class ChargeRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ChargeRequest& default_instance() {
+  static const AskProductAIAssistantRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const ChargeRequest* internal_default_instance() {
-    return reinterpret_cast<const ChargeRequest*>(
-               &_ChargeRequest_default_instance_);
+  static inline const AskProductAIAssistantRequest* internal_default_instance() {
+    return reinterpret_cast<const AskProductAIAssistantRequest*>(
+               &_AskProductAIAssistantRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    29;
+    31;
 
-  friend void swap(ChargeRequest& a, ChargeRequest& b) {
+  friend void swap(AskProductAIAssistantRequest& a, AskProductAIAssistantRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(ChargeRequest* other) {
+  inline void Swap(AskProductAIAssistantRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -5465,7 +5777,7 @@ class ChargeRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ChargeRequest* other) {
+  void UnsafeArenaSwap(AskProductAIAssistantRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -5473,14 +5785,14 @@ class ChargeRequest final :
 
   // implements Message ----------------------------------------------
 
-  ChargeRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<ChargeRequest>(arena);
+  AskProductAIAssistantRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<AskProductAIAssistantRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ChargeRequest& from);
+  void CopyFrom(const AskProductAIAssistantRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const ChargeRequest& from) {
-    ChargeRequest::MergeImpl(*this, from);
+  void MergeFrom( const AskProductAIAssistantRequest& from) {
+    AskProductAIAssistantRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -5498,15 +5810,15 @@ class ChargeRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(ChargeRequest* other);
+  void InternalSwap(AskProductAIAssistantRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.ChargeRequest";
+    return "oteldemo.AskProductAIAssistantRequest";
   }
   protected:
-  explicit ChargeRequest(::google::protobuf::Arena* arena);
+  explicit AskProductAIAssistantRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -5519,78 +5831,79 @@ class ChargeRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kAmountFieldNumber = 1,
-    kCreditCardFieldNumber = 2,
+    kProductIdFieldNumber = 1,
+    kQuestionFieldNumber = 2,
   };
-  // .oteldemo.Money amount = 1;
-  bool has_amount() const;
-  void clear_amount() ;
-  const ::oteldemo::Money& amount() const;
-  PROTOBUF_NODISCARD ::oteldemo::Money* release_amount();
-  ::oteldemo::Money* mutable_amount();
-  void set_allocated_amount(::oteldemo::Money* value);
-  void unsafe_arena_set_allocated_amount(::oteldemo::Money* value);
-  ::oteldemo::Money* unsafe_arena_release_amount();
+  // string product_id = 1;
+  void clear_product_id() ;
+  const std::string& product_id() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_product_id(Arg_&& arg, Args_... args);
+  std::string* mutable_product_id();
+  PROTOBUF_NODISCARD std::string* release_product_id();
+  void set_allocated_product_id(std::string* ptr);
 
   private:
-  const ::oteldemo::Money& _internal_amount() const;
-  ::oteldemo::Money* _internal_mutable_amount();
+  const std::string& _internal_product_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_product_id(
+      const std::string& value);
+  std::string* _internal_mutable_product_id();
 
   public:
-  // .oteldemo.CreditCardInfo credit_card = 2;
-  bool has_credit_card() const;
-  void clear_credit_card() ;
-  const ::oteldemo::CreditCardInfo& credit_card() const;
-  PROTOBUF_NODISCARD ::oteldemo::CreditCardInfo* release_credit_card();
-  ::oteldemo::CreditCardInfo* mutable_credit_card();
-  void set_allocated_credit_card(::oteldemo::CreditCardInfo* value);
-  void unsafe_arena_set_allocated_credit_card(::oteldemo::CreditCardInfo* value);
-  ::oteldemo::CreditCardInfo* unsafe_arena_release_credit_card();
+  // string question = 2;
+  void clear_question() ;
+  const std::string& question() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_question(Arg_&& arg, Args_... args);
+  std::string* mutable_question();
+  PROTOBUF_NODISCARD std::string* release_question();
+  void set_allocated_question(std::string* ptr);
 
   private:
-  const ::oteldemo::CreditCardInfo& _internal_credit_card() const;
-  ::oteldemo::CreditCardInfo* _internal_mutable_credit_card();
+  const std::string& _internal_question() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_question(
+      const std::string& value);
+  std::string* _internal_mutable_question();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.ChargeRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.AskProductAIAssistantRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2, 2, 0, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 0, 64, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::ArenaStringPtr product_id_;
+    ::google::protobuf::internal::ArenaStringPtr question_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::Money* amount_;
-    ::oteldemo::CreditCardInfo* credit_card_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class ChargeResponse final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ChargeResponse) */ {
+class AskProductAIAssistantResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.AskProductAIAssistantResponse) */ {
  public:
-  inline ChargeResponse() : ChargeResponse(nullptr) {}
-  ~ChargeResponse() override;
+  inline AskProductAIAssistantResponse() : AskProductAIAssistantResponse(nullptr) {}
+  ~AskProductAIAssistantResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR ChargeResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR AskProductAIAssistantResponse(::google::protobuf::internal::ConstantInitialized);
 
-  ChargeResponse(const ChargeResponse& from);
-  ChargeResponse(ChargeResponse&& from) noexcept
-    : ChargeResponse() {
+  AskProductAIAssistantResponse(const AskProductAIAssistantResponse& from);
+  AskProductAIAssistantResponse(AskProductAIAssistantResponse&& from) noexcept
+    : AskProductAIAssistantResponse() {
     *this = ::std::move(from);
   }
 
-  inline ChargeResponse& operator=(const ChargeResponse& from) {
+  inline AskProductAIAssistantResponse& operator=(const AskProductAIAssistantResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ChargeResponse& operator=(ChargeResponse&& from) noexcept {
+  inline AskProductAIAssistantResponse& operator=(AskProductAIAssistantResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -5620,20 +5933,20 @@ class ChargeResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ChargeResponse& default_instance() {
+  static const AskProductAIAssistantResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const ChargeResponse* internal_default_instance() {
-    return reinterpret_cast<const ChargeResponse*>(
-               &_ChargeResponse_default_instance_);
+  static inline const AskProductAIAssistantResponse* internal_default_instance() {
+    return reinterpret_cast<const AskProductAIAssistantResponse*>(
+               &_AskProductAIAssistantResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    30;
+    32;
 
-  friend void swap(ChargeResponse& a, ChargeResponse& b) {
+  friend void swap(AskProductAIAssistantResponse& a, AskProductAIAssistantResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(ChargeResponse* other) {
+  inline void Swap(AskProductAIAssistantResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -5646,7 +5959,7 @@ class ChargeResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ChargeResponse* other) {
+  void UnsafeArenaSwap(AskProductAIAssistantResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -5654,14 +5967,14 @@ class ChargeResponse final :
 
   // implements Message ----------------------------------------------
 
-  ChargeResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<ChargeResponse>(arena);
+  AskProductAIAssistantResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<AskProductAIAssistantResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ChargeResponse& from);
+  void CopyFrom(const AskProductAIAssistantResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const ChargeResponse& from) {
-    ChargeResponse::MergeImpl(*this, from);
+  void MergeFrom( const AskProductAIAssistantResponse& from) {
+    AskProductAIAssistantResponse::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -5679,15 +5992,15 @@ class ChargeResponse final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(ChargeResponse* other);
+  void InternalSwap(AskProductAIAssistantResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.ChargeResponse";
+    return "oteldemo.AskProductAIAssistantResponse";
   }
   protected:
-  explicit ChargeResponse(::google::protobuf::Arena* arena);
+  explicit AskProductAIAssistantResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -5700,35 +6013,35 @@ class ChargeResponse final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kTransactionIdFieldNumber = 1,
+    kResponseFieldNumber = 1,
   };
-  // string transaction_id = 1;
-  void clear_transaction_id() ;
-  const std::string& transaction_id() const;
+  // string response = 1;
+  void clear_response() ;
+  const std::string& response() const;
   template <typename Arg_ = const std::string&, typename... Args_>
-  void set_transaction_id(Arg_&& arg, Args_... args);
-  std::string* mutable_transaction_id();
-  PROTOBUF_NODISCARD std::string* release_transaction_id();
-  void set_allocated_transaction_id(std::string* ptr);
+  void set_response(Arg_&& arg, Args_... args);
+  std::string* mutable_response();
+  PROTOBUF_NODISCARD std::string* release_response();
+  void set_allocated_response(std::string* ptr);
 
   private:
-  const std::string& _internal_transaction_id() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_transaction_id(
+  const std::string& _internal_response() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_response(
       const std::string& value);
-  std::string* _internal_mutable_transaction_id();
+  std::string* _internal_mutable_response();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.ChargeResponse)
+  // @@protoc_insertion_point(class_scope:oteldemo.AskProductAIAssistantResponse)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 46, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 55, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr transaction_id_;
+    ::google::protobuf::internal::ArenaStringPtr response_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -5736,25 +6049,25 @@ class ChargeResponse final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class OrderItem final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.OrderItem) */ {
+class GetQuoteRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetQuoteRequest) */ {
  public:
-  inline OrderItem() : OrderItem(nullptr) {}
-  ~OrderItem() override;
+  inline GetQuoteRequest() : GetQuoteRequest(nullptr) {}
+  ~GetQuoteRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR OrderItem(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetQuoteRequest(::google::protobuf::internal::ConstantInitialized);
 
-  OrderItem(const OrderItem& from);
-  OrderItem(OrderItem&& from) noexcept
-    : OrderItem() {
+  GetQuoteRequest(const GetQuoteRequest& from);
+  GetQuoteRequest(GetQuoteRequest&& from) noexcept
+    : GetQuoteRequest() {
     *this = ::std::move(from);
   }
 
-  inline OrderItem& operator=(const OrderItem& from) {
+  inline GetQuoteRequest& operator=(const GetQuoteRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline OrderItem& operator=(OrderItem&& from) noexcept {
+  inline GetQuoteRequest& operator=(GetQuoteRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -5784,20 +6097,20 @@ class OrderItem final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const OrderItem& default_instance() {
+  static const GetQuoteRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const OrderItem* internal_default_instance() {
-    return reinterpret_cast<const OrderItem*>(
-               &_OrderItem_default_instance_);
+  static inline const GetQuoteRequest* internal_default_instance() {
+    return reinterpret_cast<const GetQuoteRequest*>(
+               &_GetQuoteRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    31;
+    33;
 
-  friend void swap(OrderItem& a, OrderItem& b) {
+  friend void swap(GetQuoteRequest& a, GetQuoteRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(OrderItem* other) {
+  inline void Swap(GetQuoteRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -5810,7 +6123,7 @@ class OrderItem final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(OrderItem* other) {
+  void UnsafeArenaSwap(GetQuoteRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -5818,14 +6131,14 @@ class OrderItem final :
 
   // implements Message ----------------------------------------------
 
-  OrderItem* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<OrderItem>(arena);
+  GetQuoteRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetQuoteRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const OrderItem& from);
+  void CopyFrom(const GetQuoteRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const OrderItem& from) {
-    OrderItem::MergeImpl(*this, from);
+  void MergeFrom( const GetQuoteRequest& from) {
+    GetQuoteRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -5843,15 +6156,15 @@ class OrderItem final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(OrderItem* other);
+  void InternalSwap(GetQuoteRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.OrderItem";
+    return "oteldemo.GetQuoteRequest";
   }
   protected:
-  explicit OrderItem(::google::protobuf::Arena* arena);
+  explicit GetQuoteRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -5864,40 +6177,43 @@ class OrderItem final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kItemFieldNumber = 1,
-    kCostFieldNumber = 2,
+    kItemsFieldNumber = 2,
+    kAddressFieldNumber = 1,
   };
-  // .oteldemo.CartItem item = 1;
-  bool has_item() const;
-  void clear_item() ;
-  const ::oteldemo::CartItem& item() const;
-  PROTOBUF_NODISCARD ::oteldemo::CartItem* release_item();
-  ::oteldemo::CartItem* mutable_item();
-  void set_allocated_item(::oteldemo::CartItem* value);
-  void unsafe_arena_set_allocated_item(::oteldemo::CartItem* value);
-  ::oteldemo::CartItem* unsafe_arena_release_item();
-
+  // repeated .oteldemo.CartItem items = 2;
+  int items_size() const;
   private:
-  const ::oteldemo::CartItem& _internal_item() const;
-  ::oteldemo::CartItem* _internal_mutable_item();
+  int _internal_items_size() const;
 
   public:
-  // .oteldemo.Money cost = 2;
-  bool has_cost() const;
-  void clear_cost() ;
-  const ::oteldemo::Money& cost() const;
-  PROTOBUF_NODISCARD ::oteldemo::Money* release_cost();
-  ::oteldemo::Money* mutable_cost();
-  void set_allocated_cost(::oteldemo::Money* value);
-  void unsafe_arena_set_allocated_cost(::oteldemo::Money* value);
-  ::oteldemo::Money* unsafe_arena_release_cost();
+  void clear_items() ;
+  ::oteldemo::CartItem* mutable_items(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >*
+      mutable_items();
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& _internal_items() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* _internal_mutable_items();
+  public:
+  const ::oteldemo::CartItem& items(int index) const;
+  ::oteldemo::CartItem* add_items();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >&
+      items() const;
+  // .oteldemo.Address address = 1;
+  bool has_address() const;
+  void clear_address() ;
+  const ::oteldemo::Address& address() const;
+  PROTOBUF_NODISCARD ::oteldemo::Address* release_address();
+  ::oteldemo::Address* mutable_address();
+  void set_allocated_address(::oteldemo::Address* value);
+  void unsafe_arena_set_allocated_address(::oteldemo::Address* value);
+  ::oteldemo::Address* unsafe_arena_release_address();
 
   private:
-  const ::oteldemo::Money& _internal_cost() const;
-  ::oteldemo::Money* _internal_mutable_cost();
+  const ::oteldemo::Address& _internal_address() const;
+  ::oteldemo::Address* _internal_mutable_address();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.OrderItem)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetQuoteRequest)
  private:
   class _Internal;
 
@@ -5909,33 +6225,33 @@ class OrderItem final :
   struct Impl_ {
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::CartItem* item_;
-    ::oteldemo::Money* cost_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem > items_;
+    ::oteldemo::Address* address_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class OrderResult final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.OrderResult) */ {
+class GetQuoteResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetQuoteResponse) */ {
  public:
-  inline OrderResult() : OrderResult(nullptr) {}
-  ~OrderResult() override;
+  inline GetQuoteResponse() : GetQuoteResponse(nullptr) {}
+  ~GetQuoteResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR OrderResult(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetQuoteResponse(::google::protobuf::internal::ConstantInitialized);
 
-  OrderResult(const OrderResult& from);
-  OrderResult(OrderResult&& from) noexcept
-    : OrderResult() {
+  GetQuoteResponse(const GetQuoteResponse& from);
+  GetQuoteResponse(GetQuoteResponse&& from) noexcept
+    : GetQuoteResponse() {
     *this = ::std::move(from);
   }
 
-  inline OrderResult& operator=(const OrderResult& from) {
+  inline GetQuoteResponse& operator=(const GetQuoteResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline OrderResult& operator=(OrderResult&& from) noexcept {
+  inline GetQuoteResponse& operator=(GetQuoteResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -5965,20 +6281,20 @@ class OrderResult final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const OrderResult& default_instance() {
+  static const GetQuoteResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const OrderResult* internal_default_instance() {
-    return reinterpret_cast<const OrderResult*>(
-               &_OrderResult_default_instance_);
+  static inline const GetQuoteResponse* internal_default_instance() {
+    return reinterpret_cast<const GetQuoteResponse*>(
+               &_GetQuoteResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    32;
+    34;
 
-  friend void swap(OrderResult& a, OrderResult& b) {
+  friend void swap(GetQuoteResponse& a, GetQuoteResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(OrderResult* other) {
+  inline void Swap(GetQuoteResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -5991,7 +6307,7 @@ class OrderResult final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(OrderResult* other) {
+  void UnsafeArenaSwap(GetQuoteResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -5999,14 +6315,14 @@ class OrderResult final :
 
   // implements Message ----------------------------------------------
 
-  OrderResult* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<OrderResult>(arena);
+  GetQuoteResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetQuoteResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const OrderResult& from);
+  void CopyFrom(const GetQuoteResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const OrderResult& from) {
-    OrderResult::MergeImpl(*this, from);
+  void MergeFrom( const GetQuoteResponse& from) {
+    GetQuoteResponse::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -6024,15 +6340,15 @@ class OrderResult final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(OrderResult* other);
+  void InternalSwap(GetQuoteResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.OrderResult";
+    return "oteldemo.GetQuoteResponse";
   }
   protected:
-  explicit OrderResult(::google::protobuf::Arena* arena);
+  explicit GetQuoteResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -6045,134 +6361,61 @@ class OrderResult final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kItemsFieldNumber = 5,
-    kOrderIdFieldNumber = 1,
-    kShippingTrackingIdFieldNumber = 2,
-    kShippingCostFieldNumber = 3,
-    kShippingAddressFieldNumber = 4,
+    kCostUsdFieldNumber = 1,
   };
-  // repeated .oteldemo.OrderItem items = 5;
-  int items_size() const;
-  private:
-  int _internal_items_size() const;
-
-  public:
-  void clear_items() ;
-  ::oteldemo::OrderItem* mutable_items(int index);
-  ::google::protobuf::RepeatedPtrField< ::oteldemo::OrderItem >*
-      mutable_items();
-  private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>& _internal_items() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>* _internal_mutable_items();
-  public:
-  const ::oteldemo::OrderItem& items(int index) const;
-  ::oteldemo::OrderItem* add_items();
-  const ::google::protobuf::RepeatedPtrField< ::oteldemo::OrderItem >&
-      items() const;
-  // string order_id = 1;
-  void clear_order_id() ;
-  const std::string& order_id() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_order_id(Arg_&& arg, Args_... args);
-  std::string* mutable_order_id();
-  PROTOBUF_NODISCARD std::string* release_order_id();
-  void set_allocated_order_id(std::string* ptr);
+  // .oteldemo.Money cost_usd = 1;
+  bool has_cost_usd() const;
+  void clear_cost_usd() ;
+  const ::oteldemo::Money& cost_usd() const;
+  PROTOBUF_NODISCARD ::oteldemo::Money* release_cost_usd();
+  ::oteldemo::Money* mutable_cost_usd();
+  void set_allocated_cost_usd(::oteldemo::Money* value);
+  void unsafe_arena_set_allocated_cost_usd(::oteldemo::Money* value);
+  ::oteldemo::Money* unsafe_arena_release_cost_usd();
 
   private:
-  const std::string& _internal_order_id() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_order_id(
-      const std::string& value);
-  std::string* _internal_mutable_order_id();
+  const ::oteldemo::Money& _internal_cost_usd() const;
+  ::oteldemo::Money* _internal_mutable_cost_usd();
 
   public:
-  // string shipping_tracking_id = 2;
-  void clear_shipping_tracking_id() ;
-  const std::string& shipping_tracking_id() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_shipping_tracking_id(Arg_&& arg, Args_... args);
-  std::string* mutable_shipping_tracking_id();
-  PROTOBUF_NODISCARD std::string* release_shipping_tracking_id();
-  void set_allocated_shipping_tracking_id(std::string* ptr);
-
-  private:
-  const std::string& _internal_shipping_tracking_id() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_shipping_tracking_id(
-      const std::string& value);
-  std::string* _internal_mutable_shipping_tracking_id();
-
-  public:
-  // .oteldemo.Money shipping_cost = 3;
-  bool has_shipping_cost() const;
-  void clear_shipping_cost() ;
-  const ::oteldemo::Money& shipping_cost() const;
-  PROTOBUF_NODISCARD ::oteldemo::Money* release_shipping_cost();
-  ::oteldemo::Money* mutable_shipping_cost();
-  void set_allocated_shipping_cost(::oteldemo::Money* value);
-  void unsafe_arena_set_allocated_shipping_cost(::oteldemo::Money* value);
-  ::oteldemo::Money* unsafe_arena_release_shipping_cost();
-
-  private:
-  const ::oteldemo::Money& _internal_shipping_cost() const;
-  ::oteldemo::Money* _internal_mutable_shipping_cost();
-
-  public:
-  // .oteldemo.Address shipping_address = 4;
-  bool has_shipping_address() const;
-  void clear_shipping_address() ;
-  const ::oteldemo::Address& shipping_address() const;
-  PROTOBUF_NODISCARD ::oteldemo::Address* release_shipping_address();
-  ::oteldemo::Address* mutable_shipping_address();
-  void set_allocated_shipping_address(::oteldemo::Address* value);
-  void unsafe_arena_set_allocated_shipping_address(::oteldemo::Address* value);
-  ::oteldemo::Address* unsafe_arena_release_shipping_address();
-
-  private:
-  const ::oteldemo::Address& _internal_shipping_address() const;
-  ::oteldemo::Address* _internal_mutable_shipping_address();
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.OrderResult)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetQuoteResponse)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<3, 5, 3, 57, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::OrderItem > items_;
-    ::google::protobuf::internal::ArenaStringPtr order_id_;
-    ::google::protobuf::internal::ArenaStringPtr shipping_tracking_id_;
-    ::oteldemo::Money* shipping_cost_;
-    ::oteldemo::Address* shipping_address_;
+    ::oteldemo::Money* cost_usd_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class SendOrderConfirmationRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.SendOrderConfirmationRequest) */ {
+class ShipOrderRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ShipOrderRequest) */ {
  public:
-  inline SendOrderConfirmationRequest() : SendOrderConfirmationRequest(nullptr) {}
-  ~SendOrderConfirmationRequest() override;
+  inline ShipOrderRequest() : ShipOrderRequest(nullptr) {}
+  ~ShipOrderRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR SendOrderConfirmationRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ShipOrderRequest(::google::protobuf::internal::ConstantInitialized);
 
-  SendOrderConfirmationRequest(const SendOrderConfirmationRequest& from);
-  SendOrderConfirmationRequest(SendOrderConfirmationRequest&& from) noexcept
-    : SendOrderConfirmationRequest() {
+  ShipOrderRequest(const ShipOrderRequest& from);
+  ShipOrderRequest(ShipOrderRequest&& from) noexcept
+    : ShipOrderRequest() {
     *this = ::std::move(from);
   }
 
-  inline SendOrderConfirmationRequest& operator=(const SendOrderConfirmationRequest& from) {
+  inline ShipOrderRequest& operator=(const ShipOrderRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline SendOrderConfirmationRequest& operator=(SendOrderConfirmationRequest&& from) noexcept {
+  inline ShipOrderRequest& operator=(ShipOrderRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -6202,20 +6445,20 @@ class SendOrderConfirmationRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const SendOrderConfirmationRequest& default_instance() {
+  static const ShipOrderRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const SendOrderConfirmationRequest* internal_default_instance() {
-    return reinterpret_cast<const SendOrderConfirmationRequest*>(
-               &_SendOrderConfirmationRequest_default_instance_);
+  static inline const ShipOrderRequest* internal_default_instance() {
+    return reinterpret_cast<const ShipOrderRequest*>(
+               &_ShipOrderRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    33;
+    35;
 
-  friend void swap(SendOrderConfirmationRequest& a, SendOrderConfirmationRequest& b) {
+  friend void swap(ShipOrderRequest& a, ShipOrderRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(SendOrderConfirmationRequest* other) {
+  inline void Swap(ShipOrderRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -6228,7 +6471,7 @@ class SendOrderConfirmationRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(SendOrderConfirmationRequest* other) {
+  void UnsafeArenaSwap(ShipOrderRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -6236,14 +6479,14 @@ class SendOrderConfirmationRequest final :
 
   // implements Message ----------------------------------------------
 
-  SendOrderConfirmationRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<SendOrderConfirmationRequest>(arena);
+  ShipOrderRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ShipOrderRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const SendOrderConfirmationRequest& from);
+  void CopyFrom(const ShipOrderRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const SendOrderConfirmationRequest& from) {
-    SendOrderConfirmationRequest::MergeImpl(*this, from);
+  void MergeFrom( const ShipOrderRequest& from) {
+    ShipOrderRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -6261,15 +6504,15 @@ class SendOrderConfirmationRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(SendOrderConfirmationRequest* other);
+  void InternalSwap(ShipOrderRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.SendOrderConfirmationRequest";
+    return "oteldemo.ShipOrderRequest";
   }
   protected:
-  explicit SendOrderConfirmationRequest(::google::protobuf::Arena* arena);
+  explicit ShipOrderRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -6282,79 +6525,81 @@ class SendOrderConfirmationRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kEmailFieldNumber = 1,
-    kOrderFieldNumber = 2,
+    kItemsFieldNumber = 2,
+    kAddressFieldNumber = 1,
   };
-  // string email = 1;
-  void clear_email() ;
-  const std::string& email() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_email(Arg_&& arg, Args_... args);
-  std::string* mutable_email();
-  PROTOBUF_NODISCARD std::string* release_email();
-  void set_allocated_email(std::string* ptr);
-
+  // repeated .oteldemo.CartItem items = 2;
+  int items_size() const;
   private:
-  const std::string& _internal_email() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_email(
-      const std::string& value);
-  std::string* _internal_mutable_email();
+  int _internal_items_size() const;
 
   public:
-  // .oteldemo.OrderResult order = 2;
-  bool has_order() const;
-  void clear_order() ;
-  const ::oteldemo::OrderResult& order() const;
-  PROTOBUF_NODISCARD ::oteldemo::OrderResult* release_order();
-  ::oteldemo::OrderResult* mutable_order();
-  void set_allocated_order(::oteldemo::OrderResult* value);
-  void unsafe_arena_set_allocated_order(::oteldemo::OrderResult* value);
-  ::oteldemo::OrderResult* unsafe_arena_release_order();
+  void clear_items() ;
+  ::oteldemo::CartItem* mutable_items(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >*
+      mutable_items();
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>& _internal_items() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>* _internal_mutable_items();
+  public:
+  const ::oteldemo::CartItem& items(int index) const;
+  ::oteldemo::CartItem* add_items();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >&
+      items() const;
+  // .oteldemo.Address address = 1;
+  bool has_address() const;
+  void clear_address() ;
+  const ::oteldemo::Address& address() const;
+  PROTOBUF_NODISCARD ::oteldemo::Address* release_address();
+  ::oteldemo::Address* mutable_address();
+  void set_allocated_address(::oteldemo::Address* value);
+  void unsafe_arena_set_allocated_address(::oteldemo::Address* value);
+  ::oteldemo::Address* unsafe_arena_release_address();
 
   private:
-  const ::oteldemo::OrderResult& _internal_order() const;
-  ::oteldemo::OrderResult* _internal_mutable_order();
+  const ::oteldemo::Address& _internal_address() const;
+  ::oteldemo::Address* _internal_mutable_address();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.SendOrderConfirmationRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.ShipOrderRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2, 1, 51, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 2, 0, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr email_;
-    ::oteldemo::OrderResult* order_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem > items_;
+    ::oteldemo::Address* address_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class PlaceOrderRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.PlaceOrderRequest) */ {
+class ShipOrderResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ShipOrderResponse) */ {
  public:
-  inline PlaceOrderRequest() : PlaceOrderRequest(nullptr) {}
-  ~PlaceOrderRequest() override;
+  inline ShipOrderResponse() : ShipOrderResponse(nullptr) {}
+  ~ShipOrderResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR PlaceOrderRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ShipOrderResponse(::google::protobuf::internal::ConstantInitialized);
 
-  PlaceOrderRequest(const PlaceOrderRequest& from);
-  PlaceOrderRequest(PlaceOrderRequest&& from) noexcept
-    : PlaceOrderRequest() {
+  ShipOrderResponse(const ShipOrderResponse& from);
+  ShipOrderResponse(ShipOrderResponse&& from) noexcept
+    : ShipOrderResponse() {
     *this = ::std::move(from);
   }
 
-  inline PlaceOrderRequest& operator=(const PlaceOrderRequest& from) {
+  inline ShipOrderResponse& operator=(const ShipOrderResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline PlaceOrderRequest& operator=(PlaceOrderRequest&& from) noexcept {
+  inline ShipOrderResponse& operator=(ShipOrderResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -6384,20 +6629,20 @@ class PlaceOrderRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const PlaceOrderRequest& default_instance() {
+  static const ShipOrderResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const PlaceOrderRequest* internal_default_instance() {
-    return reinterpret_cast<const PlaceOrderRequest*>(
-               &_PlaceOrderRequest_default_instance_);
+  static inline const ShipOrderResponse* internal_default_instance() {
+    return reinterpret_cast<const ShipOrderResponse*>(
+               &_ShipOrderResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    34;
+    36;
 
-  friend void swap(PlaceOrderRequest& a, PlaceOrderRequest& b) {
+  friend void swap(ShipOrderResponse& a, ShipOrderResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(PlaceOrderRequest* other) {
+  inline void Swap(ShipOrderResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -6410,7 +6655,7 @@ class PlaceOrderRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(PlaceOrderRequest* other) {
+  void UnsafeArenaSwap(ShipOrderResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -6418,14 +6663,14 @@ class PlaceOrderRequest final :
 
   // implements Message ----------------------------------------------
 
-  PlaceOrderRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<PlaceOrderRequest>(arena);
+  ShipOrderResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ShipOrderResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const PlaceOrderRequest& from);
+  void CopyFrom(const ShipOrderResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const PlaceOrderRequest& from) {
-    PlaceOrderRequest::MergeImpl(*this, from);
+  void MergeFrom( const ShipOrderResponse& from) {
+    ShipOrderResponse::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -6443,15 +6688,15 @@ class PlaceOrderRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(PlaceOrderRequest* other);
+  void InternalSwap(ShipOrderResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.PlaceOrderRequest";
+    return "oteldemo.ShipOrderResponse";
   }
   protected:
-  explicit PlaceOrderRequest(::google::protobuf::Arena* arena);
+  explicit ShipOrderResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -6464,132 +6709,61 @@ class PlaceOrderRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kUserIdFieldNumber = 1,
-    kUserCurrencyFieldNumber = 2,
-    kEmailFieldNumber = 5,
-    kAddressFieldNumber = 3,
-    kCreditCardFieldNumber = 6,
+    kTrackingIdFieldNumber = 1,
   };
-  // string user_id = 1;
-  void clear_user_id() ;
-  const std::string& user_id() const;
+  // string tracking_id = 1;
+  void clear_tracking_id() ;
+  const std::string& tracking_id() const;
   template <typename Arg_ = const std::string&, typename... Args_>
-  void set_user_id(Arg_&& arg, Args_... args);
-  std::string* mutable_user_id();
-  PROTOBUF_NODISCARD std::string* release_user_id();
-  void set_allocated_user_id(std::string* ptr);
+  void set_tracking_id(Arg_&& arg, Args_... args);
+  std::string* mutable_tracking_id();
+  PROTOBUF_NODISCARD std::string* release_tracking_id();
+  void set_allocated_tracking_id(std::string* ptr);
 
   private:
-  const std::string& _internal_user_id() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(
+  const std::string& _internal_tracking_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_tracking_id(
       const std::string& value);
-  std::string* _internal_mutable_user_id();
+  std::string* _internal_mutable_tracking_id();
 
   public:
-  // string user_currency = 2;
-  void clear_user_currency() ;
-  const std::string& user_currency() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_user_currency(Arg_&& arg, Args_... args);
-  std::string* mutable_user_currency();
-  PROTOBUF_NODISCARD std::string* release_user_currency();
-  void set_allocated_user_currency(std::string* ptr);
-
-  private:
-  const std::string& _internal_user_currency() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_user_currency(
-      const std::string& value);
-  std::string* _internal_mutable_user_currency();
-
-  public:
-  // string email = 5;
-  void clear_email() ;
-  const std::string& email() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_email(Arg_&& arg, Args_... args);
-  std::string* mutable_email();
-  PROTOBUF_NODISCARD std::string* release_email();
-  void set_allocated_email(std::string* ptr);
-
-  private:
-  const std::string& _internal_email() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_email(
-      const std::string& value);
-  std::string* _internal_mutable_email();
-
-  public:
-  // .oteldemo.Address address = 3;
-  bool has_address() const;
-  void clear_address() ;
-  const ::oteldemo::Address& address() const;
-  PROTOBUF_NODISCARD ::oteldemo::Address* release_address();
-  ::oteldemo::Address* mutable_address();
-  void set_allocated_address(::oteldemo::Address* value);
-  void unsafe_arena_set_allocated_address(::oteldemo::Address* value);
-  ::oteldemo::Address* unsafe_arena_release_address();
-
-  private:
-  const ::oteldemo::Address& _internal_address() const;
-  ::oteldemo::Address* _internal_mutable_address();
-
-  public:
-  // .oteldemo.CreditCardInfo credit_card = 6;
-  bool has_credit_card() const;
-  void clear_credit_card() ;
-  const ::oteldemo::CreditCardInfo& credit_card() const;
-  PROTOBUF_NODISCARD ::oteldemo::CreditCardInfo* release_credit_card();
-  ::oteldemo::CreditCardInfo* mutable_credit_card();
-  void set_allocated_credit_card(::oteldemo::CreditCardInfo* value);
-  void unsafe_arena_set_allocated_credit_card(::oteldemo::CreditCardInfo* value);
-  ::oteldemo::CreditCardInfo* unsafe_arena_release_credit_card();
-
-  private:
-  const ::oteldemo::CreditCardInfo& _internal_credit_card() const;
-  ::oteldemo::CreditCardInfo* _internal_mutable_credit_card();
-
-  public:
-  // @@protoc_insertion_point(class_scope:oteldemo.PlaceOrderRequest)
- private:
-  class _Internal;
+  // @@protoc_insertion_point(class_scope:oteldemo.ShipOrderResponse)
+ private:
+  class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<3, 5, 2, 60, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 46, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::ArenaStringPtr tracking_id_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::google::protobuf::internal::ArenaStringPtr user_id_;
-    ::google::protobuf::internal::ArenaStringPtr user_currency_;
-    ::google::protobuf::internal::ArenaStringPtr email_;
-    ::oteldemo::Address* address_;
-    ::oteldemo::CreditCardInfo* credit_card_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class PlaceOrderResponse final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.PlaceOrderResponse) */ {
+class Address final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.Address) */ {
  public:
-  inline PlaceOrderResponse() : PlaceOrderResponse(nullptr) {}
-  ~PlaceOrderResponse() override;
+  inline Address() : Address(nullptr) {}
+  ~Address() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR PlaceOrderResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR Address(::google::protobuf::internal::ConstantInitialized);
 
-  PlaceOrderResponse(const PlaceOrderResponse& from);
-  PlaceOrderResponse(PlaceOrderResponse&& from) noexcept
-    : PlaceOrderResponse() {
+  Address(const Address& from);
+  Address(Address&& from) noexcept
+    : Address() {
     *this = ::std::move(from);
   }
 
-  inline PlaceOrderResponse& operator=(const PlaceOrderResponse& from) {
+  inline Address& operator=(const Address& from) {
     CopyFrom(from);
     return *this;
   }
-  inline PlaceOrderResponse& operator=(PlaceOrderResponse&& from) noexcept {
+  inline Address& operator=(Address&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -6619,20 +6793,20 @@ class PlaceOrderResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const PlaceOrderResponse& default_instance() {
+  static const Address& default_instance() {
     return *internal_default_instance();
   }
-  static inline const PlaceOrderResponse* internal_default_instance() {
-    return reinterpret_cast<const PlaceOrderResponse*>(
-               &_PlaceOrderResponse_default_instance_);
+  static inline const Address* internal_default_instance() {
+    return reinterpret_cast<const Address*>(
+               &_Address_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    35;
+    37;
 
-  friend void swap(PlaceOrderResponse& a, PlaceOrderResponse& b) {
+  friend void swap(Address& a, Address& b) {
     a.Swap(&b);
   }
-  inline void Swap(PlaceOrderResponse* other) {
+  inline void Swap(Address* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -6645,7 +6819,7 @@ class PlaceOrderResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(PlaceOrderResponse* other) {
+  void UnsafeArenaSwap(Address* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -6653,14 +6827,14 @@ class PlaceOrderResponse final :
 
   // implements Message ----------------------------------------------
 
-  PlaceOrderResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<PlaceOrderResponse>(arena);
+  Address* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<Address>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const PlaceOrderResponse& from);
+  void CopyFrom(const Address& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const PlaceOrderResponse& from) {
-    PlaceOrderResponse::MergeImpl(*this, from);
+  void MergeFrom( const Address& from) {
+    Address::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -6678,15 +6852,15 @@ class PlaceOrderResponse final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(PlaceOrderResponse* other);
+  void InternalSwap(Address* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.PlaceOrderResponse";
+    return "oteldemo.Address";
   }
   protected:
-  explicit PlaceOrderResponse(::google::protobuf::Arena* arena);
+  explicit Address(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -6699,61 +6873,133 @@ class PlaceOrderResponse final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kOrderFieldNumber = 1,
+    kStreetAddressFieldNumber = 1,
+    kCityFieldNumber = 2,
+    kStateFieldNumber = 3,
+    kCountryFieldNumber = 4,
+    kZipCodeFieldNumber = 5,
   };
-  // .oteldemo.OrderResult order = 1;
-  bool has_order() const;
-  void clear_order() ;
-  const ::oteldemo::OrderResult& order() const;
-  PROTOBUF_NODISCARD ::oteldemo::OrderResult* release_order();
-  ::oteldemo::OrderResult* mutable_order();
-  void set_allocated_order(::oteldemo::OrderResult* value);
-  void unsafe_arena_set_allocated_order(::oteldemo::OrderResult* value);
-  ::oteldemo::OrderResult* unsafe_arena_release_order();
+  // string street_address = 1;
+  void clear_street_address() ;
+  const std::string& street_address() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_street_address(Arg_&& arg, Args_... args);
+  std::string* mutable_street_address();
+  PROTOBUF_NODISCARD std::string* release_street_address();
+  void set_allocated_street_address(std::string* ptr);
 
   private:
-  const ::oteldemo::OrderResult& _internal_order() const;
-  ::oteldemo::OrderResult* _internal_mutable_order();
+  const std::string& _internal_street_address() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_street_address(
+      const std::string& value);
+  std::string* _internal_mutable_street_address();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.PlaceOrderResponse)
+  // string city = 2;
+  void clear_city() ;
+  const std::string& city() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_city(Arg_&& arg, Args_... args);
+  std::string* mutable_city();
+  PROTOBUF_NODISCARD std::string* release_city();
+  void set_allocated_city(std::string* ptr);
+
+  private:
+  const std::string& _internal_city() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_city(
+      const std::string& value);
+  std::string* _internal_mutable_city();
+
+  public:
+  // string state = 3;
+  void clear_state() ;
+  const std::string& state() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_state(Arg_&& arg, Args_... args);
+  std::string* mutable_state();
+  PROTOBUF_NODISCARD std::string* release_state();
+  void set_allocated_state(std::string* ptr);
+
+  private:
+  const std::string& _internal_state() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_state(
+      const std::string& value);
+  std::string* _internal_mutable_state();
+
+  public:
+  // string country = 4;
+  void clear_country() ;
+  const std::string& country() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_country(Arg_&& arg, Args_... args);
+  std::string* mutable_country();
+  PROTOBUF_NODISCARD std::string* release_country();
+  void set_allocated_country(std::string* ptr);
+
+  private:
+  const std::string& _internal_country() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_country(
+      const std::string& value);
+  std::string* _internal_mutable_country();
+
+  public:
+  // string zip_code = 5;
+  void clear_zip_code() ;
+  const std::string& zip_code() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_zip_code(Arg_&& arg, Args_... args);
+  std::string* mutable_zip_code();
+  PROTOBUF_NODISCARD std::string* release_zip_code();
+  void set_allocated_zip_code(std::string* ptr);
+
+  private:
+  const std::string& _internal_zip_code() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_zip_code(
+      const std::string& value);
+  std::string* _internal_mutable_zip_code();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.Address)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<3, 5, 0, 63, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::ArenaStringPtr street_address_;
+    ::google::protobuf::internal::ArenaStringPtr city_;
+    ::google::protobuf::internal::ArenaStringPtr state_;
+    ::google::protobuf::internal::ArenaStringPtr country_;
+    ::google::protobuf::internal::ArenaStringPtr zip_code_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::OrderResult* order_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class AdRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.AdRequest) */ {
+class Money final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.Money) */ {
  public:
-  inline AdRequest() : AdRequest(nullptr) {}
-  ~AdRequest() override;
+  inline Money() : Money(nullptr) {}
+  ~Money() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR AdRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR Money(::google::protobuf::internal::ConstantInitialized);
 
-  AdRequest(const AdRequest& from);
-  AdRequest(AdRequest&& from) noexcept
-    : AdRequest() {
+  Money(const Money& from);
+  Money(Money&& from) noexcept
+    : Money() {
     *this = ::std::move(from);
   }
 
-  inline AdRequest& operator=(const AdRequest& from) {
+  inline Money& operator=(const Money& from) {
     CopyFrom(from);
     return *this;
   }
-  inline AdRequest& operator=(AdRequest&& from) noexcept {
+  inline Money& operator=(Money&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -6783,20 +7029,20 @@ class AdRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const AdRequest& default_instance() {
+  static const Money& default_instance() {
     return *internal_default_instance();
   }
-  static inline const AdRequest* internal_default_instance() {
-    return reinterpret_cast<const AdRequest*>(
-               &_AdRequest_default_instance_);
+  static inline const Money* internal_default_instance() {
+    return reinterpret_cast<const Money*>(
+               &_Money_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    36;
+    38;
 
-  friend void swap(AdRequest& a, AdRequest& b) {
+  friend void swap(Money& a, Money& b) {
     a.Swap(&b);
   }
-  inline void Swap(AdRequest* other) {
+  inline void Swap(Money* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -6809,7 +7055,7 @@ class AdRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(AdRequest* other) {
+  void UnsafeArenaSwap(Money* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -6817,14 +7063,14 @@ class AdRequest final :
 
   // implements Message ----------------------------------------------
 
-  AdRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<AdRequest>(arena);
+  Money* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<Money>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const AdRequest& from);
+  void CopyFrom(const Money& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const AdRequest& from) {
-    AdRequest::MergeImpl(*this, from);
+  void MergeFrom( const Money& from) {
+    Money::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -6842,15 +7088,15 @@ class AdRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(AdRequest* other);
+  void InternalSwap(Money* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.AdRequest";
+    return "oteldemo.Money";
   }
   protected:
-  explicit AdRequest(::google::protobuf::Arena* arena);
+  explicit Money(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -6863,47 +7109,59 @@ class AdRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kContextKeysFieldNumber = 1,
+    kCurrencyCodeFieldNumber = 1,
+    kUnitsFieldNumber = 2,
+    kNanosFieldNumber = 3,
   };
-  // repeated string context_keys = 1;
-  int context_keys_size() const;
+  // string currency_code = 1;
+  void clear_currency_code() ;
+  const std::string& currency_code() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_currency_code(Arg_&& arg, Args_... args);
+  std::string* mutable_currency_code();
+  PROTOBUF_NODISCARD std::string* release_currency_code();
+  void set_allocated_currency_code(std::string* ptr);
+
   private:
-  int _internal_context_keys_size() const;
+  const std::string& _internal_currency_code() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_currency_code(
+      const std::string& value);
+  std::string* _internal_mutable_currency_code();
 
   public:
-  void clear_context_keys() ;
-  const std::string& context_keys(int index) const;
-  std::string* mutable_context_keys(int index);
-  void set_context_keys(int index, const std::string& value);
-  void set_context_keys(int index, std::string&& value);
-  void set_context_keys(int index, const char* value);
-  void set_context_keys(int index, const char* value, std::size_t size);
-  void set_context_keys(int index, absl::string_view value);
-  std::string* add_context_keys();
-  void add_context_keys(const std::string& value);
-  void add_context_keys(std::string&& value);
-  void add_context_keys(const char* value);
-  void add_context_keys(const char* value, std::size_t size);
-  void add_context_keys(absl::string_view value);
-  const ::google::protobuf::RepeatedPtrField<std::string>& context_keys() const;
-  ::google::protobuf::RepeatedPtrField<std::string>* mutable_context_keys();
+  // int64 units = 2;
+  void clear_units() ;
+  ::int64_t units() const;
+  void set_units(::int64_t value);
 
   private:
-  const ::google::protobuf::RepeatedPtrField<std::string>& _internal_context_keys() const;
-  ::google::protobuf::RepeatedPtrField<std::string>* _internal_mutable_context_keys();
+  ::int64_t _internal_units() const;
+  void _internal_set_units(::int64_t value);
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.AdRequest)
+  // int32 nanos = 3;
+  void clear_nanos() ;
+  ::int32_t nanos() const;
+  void set_nanos(::int32_t value);
+
+  private:
+  ::int32_t _internal_nanos() const;
+  void _internal_set_nanos(::int32_t value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.Money)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 39, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<2, 3, 0, 36, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::RepeatedPtrField<std::string> context_keys_;
+    ::google::protobuf::internal::ArenaStringPtr currency_code_;
+    ::int64_t units_;
+    ::int32_t nanos_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -6911,25 +7169,25 @@ class AdRequest final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class AdResponse final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.AdResponse) */ {
+class GetSupportedCurrenciesResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetSupportedCurrenciesResponse) */ {
  public:
-  inline AdResponse() : AdResponse(nullptr) {}
-  ~AdResponse() override;
+  inline GetSupportedCurrenciesResponse() : GetSupportedCurrenciesResponse(nullptr) {}
+  ~GetSupportedCurrenciesResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR AdResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR GetSupportedCurrenciesResponse(::google::protobuf::internal::ConstantInitialized);
 
-  AdResponse(const AdResponse& from);
-  AdResponse(AdResponse&& from) noexcept
-    : AdResponse() {
+  GetSupportedCurrenciesResponse(const GetSupportedCurrenciesResponse& from);
+  GetSupportedCurrenciesResponse(GetSupportedCurrenciesResponse&& from) noexcept
+    : GetSupportedCurrenciesResponse() {
     *this = ::std::move(from);
   }
 
-  inline AdResponse& operator=(const AdResponse& from) {
+  inline GetSupportedCurrenciesResponse& operator=(const GetSupportedCurrenciesResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline AdResponse& operator=(AdResponse&& from) noexcept {
+  inline GetSupportedCurrenciesResponse& operator=(GetSupportedCurrenciesResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -6959,20 +7217,20 @@ class AdResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const AdResponse& default_instance() {
+  static const GetSupportedCurrenciesResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const AdResponse* internal_default_instance() {
-    return reinterpret_cast<const AdResponse*>(
-               &_AdResponse_default_instance_);
+  static inline const GetSupportedCurrenciesResponse* internal_default_instance() {
+    return reinterpret_cast<const GetSupportedCurrenciesResponse*>(
+               &_GetSupportedCurrenciesResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    37;
+    39;
 
-  friend void swap(AdResponse& a, AdResponse& b) {
+  friend void swap(GetSupportedCurrenciesResponse& a, GetSupportedCurrenciesResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(AdResponse* other) {
+  inline void Swap(GetSupportedCurrenciesResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -6985,7 +7243,7 @@ class AdResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(AdResponse* other) {
+  void UnsafeArenaSwap(GetSupportedCurrenciesResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -6993,14 +7251,14 @@ class AdResponse final :
 
   // implements Message ----------------------------------------------
 
-  AdResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<AdResponse>(arena);
+  GetSupportedCurrenciesResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetSupportedCurrenciesResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const AdResponse& from);
+  void CopyFrom(const GetSupportedCurrenciesResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const AdResponse& from) {
-    AdResponse::MergeImpl(*this, from);
+  void MergeFrom( const GetSupportedCurrenciesResponse& from) {
+    GetSupportedCurrenciesResponse::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -7018,15 +7276,15 @@ class AdResponse final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(AdResponse* other);
+  void InternalSwap(GetSupportedCurrenciesResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.AdResponse";
+    return "oteldemo.GetSupportedCurrenciesResponse";
   }
   protected:
-  explicit AdResponse(::google::protobuf::Arena* arena);
+  explicit GetSupportedCurrenciesResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -7039,37 +7297,47 @@ class AdResponse final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kAdsFieldNumber = 1,
+    kCurrencyCodesFieldNumber = 1,
   };
-  // repeated .oteldemo.Ad ads = 1;
-  int ads_size() const;
+  // repeated string currency_codes = 1;
+  int currency_codes_size() const;
   private:
-  int _internal_ads_size() const;
+  int _internal_currency_codes_size() const;
 
   public:
-  void clear_ads() ;
-  ::oteldemo::Ad* mutable_ads(int index);
-  ::google::protobuf::RepeatedPtrField< ::oteldemo::Ad >*
-      mutable_ads();
+  void clear_currency_codes() ;
+  const std::string& currency_codes(int index) const;
+  std::string* mutable_currency_codes(int index);
+  void set_currency_codes(int index, const std::string& value);
+  void set_currency_codes(int index, std::string&& value);
+  void set_currency_codes(int index, const char* value);
+  void set_currency_codes(int index, const char* value, std::size_t size);
+  void set_currency_codes(int index, absl::string_view value);
+  std::string* add_currency_codes();
+  void add_currency_codes(const std::string& value);
+  void add_currency_codes(std::string&& value);
+  void add_currency_codes(const char* value);
+  void add_currency_codes(const char* value, std::size_t size);
+  void add_currency_codes(absl::string_view value);
+  const ::google::protobuf::RepeatedPtrField<std::string>& currency_codes() const;
+  ::google::protobuf::RepeatedPtrField<std::string>* mutable_currency_codes();
+
   private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>& _internal_ads() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>* _internal_mutable_ads();
+  const ::google::protobuf::RepeatedPtrField<std::string>& _internal_currency_codes() const;
+  ::google::protobuf::RepeatedPtrField<std::string>* _internal_mutable_currency_codes();
+
   public:
-  const ::oteldemo::Ad& ads(int index) const;
-  ::oteldemo::Ad* add_ads();
-  const ::google::protobuf::RepeatedPtrField< ::oteldemo::Ad >&
-      ads() const;
-  // @@protoc_insertion_point(class_scope:oteldemo.AdResponse)
+  // @@protoc_insertion_point(class_scope:oteldemo.GetSupportedCurrenciesResponse)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 62, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::Ad > ads_;
+    ::google::protobuf::RepeatedPtrField<std::string> currency_codes_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -7077,25 +7345,25 @@ class AdResponse final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class Ad final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.Ad) */ {
+class CurrencyConversionRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.CurrencyConversionRequest) */ {
  public:
-  inline Ad() : Ad(nullptr) {}
-  ~Ad() override;
+  inline CurrencyConversionRequest() : CurrencyConversionRequest(nullptr) {}
+  ~CurrencyConversionRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR Ad(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR CurrencyConversionRequest(::google::protobuf::internal::ConstantInitialized);
 
-  Ad(const Ad& from);
-  Ad(Ad&& from) noexcept
-    : Ad() {
+  CurrencyConversionRequest(const CurrencyConversionRequest& from);
+  CurrencyConversionRequest(CurrencyConversionRequest&& from) noexcept
+    : CurrencyConversionRequest() {
     *this = ::std::move(from);
   }
 
-  inline Ad& operator=(const Ad& from) {
+  inline CurrencyConversionRequest& operator=(const CurrencyConversionRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Ad& operator=(Ad&& from) noexcept {
+  inline CurrencyConversionRequest& operator=(CurrencyConversionRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -7125,20 +7393,20 @@ class Ad final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Ad& default_instance() {
+  static const CurrencyConversionRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const Ad* internal_default_instance() {
-    return reinterpret_cast<const Ad*>(
-               &_Ad_default_instance_);
+  static inline const CurrencyConversionRequest* internal_default_instance() {
+    return reinterpret_cast<const CurrencyConversionRequest*>(
+               &_CurrencyConversionRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    38;
+    40;
 
-  friend void swap(Ad& a, Ad& b) {
+  friend void swap(CurrencyConversionRequest& a, CurrencyConversionRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(Ad* other) {
+  inline void Swap(CurrencyConversionRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -7151,7 +7419,7 @@ class Ad final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Ad* other) {
+  void UnsafeArenaSwap(CurrencyConversionRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -7159,14 +7427,14 @@ class Ad final :
 
   // implements Message ----------------------------------------------
 
-  Ad* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<Ad>(arena);
+  CurrencyConversionRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<CurrencyConversionRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Ad& from);
+  void CopyFrom(const CurrencyConversionRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const Ad& from) {
-    Ad::MergeImpl(*this, from);
+  void MergeFrom( const CurrencyConversionRequest& from) {
+    CurrencyConversionRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -7184,15 +7452,15 @@ class Ad final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(Ad* other);
+  void InternalSwap(CurrencyConversionRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.Ad";
+    return "oteldemo.CurrencyConversionRequest";
   }
   protected:
-  explicit Ad(::google::protobuf::Arena* arena);
+  explicit CurrencyConversionRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -7205,79 +7473,79 @@ class Ad final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kRedirectUrlFieldNumber = 1,
-    kTextFieldNumber = 2,
+    kToCodeFieldNumber = 2,
+    kFromFieldNumber = 1,
   };
-  // string redirect_url = 1;
-  void clear_redirect_url() ;
-  const std::string& redirect_url() const;
+  // string to_code = 2;
+  void clear_to_code() ;
+  const std::string& to_code() const;
   template <typename Arg_ = const std::string&, typename... Args_>
-  void set_redirect_url(Arg_&& arg, Args_... args);
-  std::string* mutable_redirect_url();
-  PROTOBUF_NODISCARD std::string* release_redirect_url();
-  void set_allocated_redirect_url(std::string* ptr);
+  void set_to_code(Arg_&& arg, Args_... args);
+  std::string* mutable_to_code();
+  PROTOBUF_NODISCARD std::string* release_to_code();
+  void set_allocated_to_code(std::string* ptr);
 
   private:
-  const std::string& _internal_redirect_url() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_redirect_url(
+  const std::string& _internal_to_code() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_to_code(
       const std::string& value);
-  std::string* _internal_mutable_redirect_url();
+  std::string* _internal_mutable_to_code();
 
   public:
-  // string text = 2;
-  void clear_text() ;
-  const std::string& text() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_text(Arg_&& arg, Args_... args);
-  std::string* mutable_text();
-  PROTOBUF_NODISCARD std::string* release_text();
-  void set_allocated_text(std::string* ptr);
+  // .oteldemo.Money from = 1;
+  bool has_from() const;
+  void clear_from() ;
+  const ::oteldemo::Money& from() const;
+  PROTOBUF_NODISCARD ::oteldemo::Money* release_from();
+  ::oteldemo::Money* mutable_from();
+  void set_allocated_from(::oteldemo::Money* value);
+  void unsafe_arena_set_allocated_from(::oteldemo::Money* value);
+  ::oteldemo::Money* unsafe_arena_release_from();
 
   private:
-  const std::string& _internal_text() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_text(
-      const std::string& value);
-  std::string* _internal_mutable_text();
+  const ::oteldemo::Money& _internal_from() const;
+  ::oteldemo::Money* _internal_mutable_from();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.Ad)
+  // @@protoc_insertion_point(class_scope:oteldemo.CurrencyConversionRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2, 0, 36, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 1, 50, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr redirect_url_;
-    ::google::protobuf::internal::ArenaStringPtr text_;
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr to_code_;
+    ::oteldemo::Money* from_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class Flag final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.Flag) */ {
+class CreditCardInfo final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.CreditCardInfo) */ {
  public:
-  inline Flag() : Flag(nullptr) {}
-  ~Flag() override;
+  inline CreditCardInfo() : CreditCardInfo(nullptr) {}
+  ~CreditCardInfo() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR Flag(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR CreditCardInfo(::google::protobuf::internal::ConstantInitialized);
 
-  Flag(const Flag& from);
-  Flag(Flag&& from) noexcept
-    : Flag() {
+  CreditCardInfo(const CreditCardInfo& from);
+  CreditCardInfo(CreditCardInfo&& from) noexcept
+    : CreditCardInfo() {
     *this = ::std::move(from);
   }
 
-  inline Flag& operator=(const Flag& from) {
+  inline CreditCardInfo& operator=(const CreditCardInfo& from) {
     CopyFrom(from);
     return *this;
   }
-  inline Flag& operator=(Flag&& from) noexcept {
+  inline CreditCardInfo& operator=(CreditCardInfo&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -7307,20 +7575,20 @@ class Flag final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const Flag& default_instance() {
+  static const CreditCardInfo& default_instance() {
     return *internal_default_instance();
   }
-  static inline const Flag* internal_default_instance() {
-    return reinterpret_cast<const Flag*>(
-               &_Flag_default_instance_);
+  static inline const CreditCardInfo* internal_default_instance() {
+    return reinterpret_cast<const CreditCardInfo*>(
+               &_CreditCardInfo_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    39;
+    41;
 
-  friend void swap(Flag& a, Flag& b) {
+  friend void swap(CreditCardInfo& a, CreditCardInfo& b) {
     a.Swap(&b);
   }
-  inline void Swap(Flag* other) {
+  inline void Swap(CreditCardInfo* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -7333,7 +7601,7 @@ class Flag final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(Flag* other) {
+  void UnsafeArenaSwap(CreditCardInfo* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -7341,14 +7609,14 @@ class Flag final :
 
   // implements Message ----------------------------------------------
 
-  Flag* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<Flag>(arena);
+  CreditCardInfo* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<CreditCardInfo>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const Flag& from);
+  void CopyFrom(const CreditCardInfo& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const Flag& from) {
-    Flag::MergeImpl(*this, from);
+  void MergeFrom( const CreditCardInfo& from) {
+    CreditCardInfo::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -7366,15 +7634,15 @@ class Flag final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(Flag* other);
+  void InternalSwap(CreditCardInfo* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.Flag";
+    return "oteldemo.CreditCardInfo";
   }
   protected:
-  explicit Flag(::google::protobuf::Arena* arena);
+  explicit CreditCardInfo(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -7387,65 +7655,71 @@ class Flag final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kNameFieldNumber = 1,
-    kDescriptionFieldNumber = 2,
-    kEnabledFieldNumber = 3,
+    kCreditCardNumberFieldNumber = 1,
+    kCreditCardCvvFieldNumber = 2,
+    kCreditCardExpirationYearFieldNumber = 3,
+    kCreditCardExpirationMonthFieldNumber = 4,
   };
-  // string name = 1;
-  void clear_name() ;
-  const std::string& name() const;
+  // string credit_card_number = 1;
+  void clear_credit_card_number() ;
+  const std::string& credit_card_number() const;
   template <typename Arg_ = const std::string&, typename... Args_>
-  void set_name(Arg_&& arg, Args_... args);
-  std::string* mutable_name();
-  PROTOBUF_NODISCARD std::string* release_name();
-  void set_allocated_name(std::string* ptr);
+  void set_credit_card_number(Arg_&& arg, Args_... args);
+  std::string* mutable_credit_card_number();
+  PROTOBUF_NODISCARD std::string* release_credit_card_number();
+  void set_allocated_credit_card_number(std::string* ptr);
 
   private:
-  const std::string& _internal_name() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(
+  const std::string& _internal_credit_card_number() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_credit_card_number(
       const std::string& value);
-  std::string* _internal_mutable_name();
+  std::string* _internal_mutable_credit_card_number();
 
   public:
-  // string description = 2;
-  void clear_description() ;
-  const std::string& description() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_description(Arg_&& arg, Args_... args);
-  std::string* mutable_description();
-  PROTOBUF_NODISCARD std::string* release_description();
-  void set_allocated_description(std::string* ptr);
+  // int32 credit_card_cvv = 2;
+  void clear_credit_card_cvv() ;
+  ::int32_t credit_card_cvv() const;
+  void set_credit_card_cvv(::int32_t value);
 
   private:
-  const std::string& _internal_description() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_description(
-      const std::string& value);
-  std::string* _internal_mutable_description();
+  ::int32_t _internal_credit_card_cvv() const;
+  void _internal_set_credit_card_cvv(::int32_t value);
 
   public:
-  // bool enabled = 3;
-  void clear_enabled() ;
-  bool enabled() const;
-  void set_enabled(bool value);
+  // int32 credit_card_expiration_year = 3;
+  void clear_credit_card_expiration_year() ;
+  ::int32_t credit_card_expiration_year() const;
+  void set_credit_card_expiration_year(::int32_t value);
 
   private:
-  bool _internal_enabled() const;
-  void _internal_set_enabled(bool value);
+  ::int32_t _internal_credit_card_expiration_year() const;
+  void _internal_set_credit_card_expiration_year(::int32_t value);
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.Flag)
+  // int32 credit_card_expiration_month = 4;
+  void clear_credit_card_expiration_month() ;
+  ::int32_t credit_card_expiration_month() const;
+  void set_credit_card_expiration_month(::int32_t value);
+
+  private:
+  ::int32_t _internal_credit_card_expiration_month() const;
+  void _internal_set_credit_card_expiration_month(::int32_t value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.CreditCardInfo)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<2, 3, 0, 37, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<2, 4, 0, 50, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr name_;
-    ::google::protobuf::internal::ArenaStringPtr description_;
-    bool enabled_;
+    ::google::protobuf::internal::ArenaStringPtr credit_card_number_;
+    ::int32_t credit_card_cvv_;
+    ::int32_t credit_card_expiration_year_;
+    ::int32_t credit_card_expiration_month_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -7453,25 +7727,25 @@ class Flag final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class GetFlagRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetFlagRequest) */ {
+class ChargeRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ChargeRequest) */ {
  public:
-  inline GetFlagRequest() : GetFlagRequest(nullptr) {}
-  ~GetFlagRequest() override;
+  inline ChargeRequest() : ChargeRequest(nullptr) {}
+  ~ChargeRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR GetFlagRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ChargeRequest(::google::protobuf::internal::ConstantInitialized);
 
-  GetFlagRequest(const GetFlagRequest& from);
-  GetFlagRequest(GetFlagRequest&& from) noexcept
-    : GetFlagRequest() {
+  ChargeRequest(const ChargeRequest& from);
+  ChargeRequest(ChargeRequest&& from) noexcept
+    : ChargeRequest() {
     *this = ::std::move(from);
   }
 
-  inline GetFlagRequest& operator=(const GetFlagRequest& from) {
+  inline ChargeRequest& operator=(const ChargeRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetFlagRequest& operator=(GetFlagRequest&& from) noexcept {
+  inline ChargeRequest& operator=(ChargeRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -7501,20 +7775,20 @@ class GetFlagRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetFlagRequest& default_instance() {
+  static const ChargeRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const GetFlagRequest* internal_default_instance() {
-    return reinterpret_cast<const GetFlagRequest*>(
-               &_GetFlagRequest_default_instance_);
+  static inline const ChargeRequest* internal_default_instance() {
+    return reinterpret_cast<const ChargeRequest*>(
+               &_ChargeRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    40;
+    42;
 
-  friend void swap(GetFlagRequest& a, GetFlagRequest& b) {
+  friend void swap(ChargeRequest& a, ChargeRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(GetFlagRequest* other) {
+  inline void Swap(ChargeRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -7527,7 +7801,7 @@ class GetFlagRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetFlagRequest* other) {
+  void UnsafeArenaSwap(ChargeRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -7535,14 +7809,14 @@ class GetFlagRequest final :
 
   // implements Message ----------------------------------------------
 
-  GetFlagRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<GetFlagRequest>(arena);
+  ChargeRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ChargeRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetFlagRequest& from);
+  void CopyFrom(const ChargeRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const GetFlagRequest& from) {
-    GetFlagRequest::MergeImpl(*this, from);
+  void MergeFrom( const ChargeRequest& from) {
+    ChargeRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -7560,15 +7834,15 @@ class GetFlagRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(GetFlagRequest* other);
+  void InternalSwap(ChargeRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.GetFlagRequest";
+    return "oteldemo.ChargeRequest";
   }
   protected:
-  explicit GetFlagRequest(::google::protobuf::Arena* arena);
+  explicit ChargeRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -7581,61 +7855,78 @@ class GetFlagRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kNameFieldNumber = 1,
+    kAmountFieldNumber = 1,
+    kCreditCardFieldNumber = 2,
   };
-  // string name = 1;
-  void clear_name() ;
-  const std::string& name() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_name(Arg_&& arg, Args_... args);
-  std::string* mutable_name();
-  PROTOBUF_NODISCARD std::string* release_name();
-  void set_allocated_name(std::string* ptr);
+  // .oteldemo.Money amount = 1;
+  bool has_amount() const;
+  void clear_amount() ;
+  const ::oteldemo::Money& amount() const;
+  PROTOBUF_NODISCARD ::oteldemo::Money* release_amount();
+  ::oteldemo::Money* mutable_amount();
+  void set_allocated_amount(::oteldemo::Money* value);
+  void unsafe_arena_set_allocated_amount(::oteldemo::Money* value);
+  ::oteldemo::Money* unsafe_arena_release_amount();
 
   private:
-  const std::string& _internal_name() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(
-      const std::string& value);
-  std::string* _internal_mutable_name();
+  const ::oteldemo::Money& _internal_amount() const;
+  ::oteldemo::Money* _internal_mutable_amount();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetFlagRequest)
+  // .oteldemo.CreditCardInfo credit_card = 2;
+  bool has_credit_card() const;
+  void clear_credit_card() ;
+  const ::oteldemo::CreditCardInfo& credit_card() const;
+  PROTOBUF_NODISCARD ::oteldemo::CreditCardInfo* release_credit_card();
+  ::oteldemo::CreditCardInfo* mutable_credit_card();
+  void set_allocated_credit_card(::oteldemo::CreditCardInfo* value);
+  void unsafe_arena_set_allocated_credit_card(::oteldemo::CreditCardInfo* value);
+  ::oteldemo::CreditCardInfo* unsafe_arena_release_credit_card();
+
+  private:
+  const ::oteldemo::CreditCardInfo& _internal_credit_card() const;
+  ::oteldemo::CreditCardInfo* _internal_mutable_credit_card();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.ChargeRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 36, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 2, 0, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr name_;
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    ::oteldemo::Money* amount_;
+    ::oteldemo::CreditCardInfo* credit_card_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class GetFlagResponse final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetFlagResponse) */ {
+class ChargeResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ChargeResponse) */ {
  public:
-  inline GetFlagResponse() : GetFlagResponse(nullptr) {}
-  ~GetFlagResponse() override;
+  inline ChargeResponse() : ChargeResponse(nullptr) {}
+  ~ChargeResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR GetFlagResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR ChargeResponse(::google::protobuf::internal::ConstantInitialized);
 
-  GetFlagResponse(const GetFlagResponse& from);
-  GetFlagResponse(GetFlagResponse&& from) noexcept
-    : GetFlagResponse() {
+  ChargeResponse(const ChargeResponse& from);
+  ChargeResponse(ChargeResponse&& from) noexcept
+    : ChargeResponse() {
     *this = ::std::move(from);
   }
 
-  inline GetFlagResponse& operator=(const GetFlagResponse& from) {
+  inline ChargeResponse& operator=(const ChargeResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline GetFlagResponse& operator=(GetFlagResponse&& from) noexcept {
+  inline ChargeResponse& operator=(ChargeResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -7665,20 +7956,20 @@ class GetFlagResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const GetFlagResponse& default_instance() {
+  static const ChargeResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const GetFlagResponse* internal_default_instance() {
-    return reinterpret_cast<const GetFlagResponse*>(
-               &_GetFlagResponse_default_instance_);
+  static inline const ChargeResponse* internal_default_instance() {
+    return reinterpret_cast<const ChargeResponse*>(
+               &_ChargeResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    41;
+    43;
 
-  friend void swap(GetFlagResponse& a, GetFlagResponse& b) {
+  friend void swap(ChargeResponse& a, ChargeResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(GetFlagResponse* other) {
+  inline void Swap(ChargeResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -7691,7 +7982,7 @@ class GetFlagResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(GetFlagResponse* other) {
+  void UnsafeArenaSwap(ChargeResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -7699,14 +7990,14 @@ class GetFlagResponse final :
 
   // implements Message ----------------------------------------------
 
-  GetFlagResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<GetFlagResponse>(arena);
+  ChargeResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ChargeResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const GetFlagResponse& from);
+  void CopyFrom(const ChargeResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const GetFlagResponse& from) {
-    GetFlagResponse::MergeImpl(*this, from);
+  void MergeFrom( const ChargeResponse& from) {
+    ChargeResponse::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -7724,15 +8015,15 @@ class GetFlagResponse final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(GetFlagResponse* other);
+  void InternalSwap(ChargeResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.GetFlagResponse";
+    return "oteldemo.ChargeResponse";
   }
   protected:
-  explicit GetFlagResponse(::google::protobuf::Arena* arena);
+  explicit ChargeResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -7745,61 +8036,61 @@ class GetFlagResponse final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kFlagFieldNumber = 1,
+    kTransactionIdFieldNumber = 1,
   };
-  // .oteldemo.Flag flag = 1;
-  bool has_flag() const;
-  void clear_flag() ;
-  const ::oteldemo::Flag& flag() const;
-  PROTOBUF_NODISCARD ::oteldemo::Flag* release_flag();
-  ::oteldemo::Flag* mutable_flag();
-  void set_allocated_flag(::oteldemo::Flag* value);
-  void unsafe_arena_set_allocated_flag(::oteldemo::Flag* value);
-  ::oteldemo::Flag* unsafe_arena_release_flag();
+  // string transaction_id = 1;
+  void clear_transaction_id() ;
+  const std::string& transaction_id() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_transaction_id(Arg_&& arg, Args_... args);
+  std::string* mutable_transaction_id();
+  PROTOBUF_NODISCARD std::string* release_transaction_id();
+  void set_allocated_transaction_id(std::string* ptr);
 
   private:
-  const ::oteldemo::Flag& _internal_flag() const;
-  ::oteldemo::Flag* _internal_mutable_flag();
+  const std::string& _internal_transaction_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_transaction_id(
+      const std::string& value);
+  std::string* _internal_mutable_transaction_id();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.GetFlagResponse)
+  // @@protoc_insertion_point(class_scope:oteldemo.ChargeResponse)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 46, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    ::google::protobuf::internal::ArenaStringPtr transaction_id_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::Flag* flag_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class CreateFlagRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.CreateFlagRequest) */ {
+class OrderItem final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.OrderItem) */ {
  public:
-  inline CreateFlagRequest() : CreateFlagRequest(nullptr) {}
-  ~CreateFlagRequest() override;
+  inline OrderItem() : OrderItem(nullptr) {}
+  ~OrderItem() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR CreateFlagRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR OrderItem(::google::protobuf::internal::ConstantInitialized);
 
-  CreateFlagRequest(const CreateFlagRequest& from);
-  CreateFlagRequest(CreateFlagRequest&& from) noexcept
-    : CreateFlagRequest() {
+  OrderItem(const OrderItem& from);
+  OrderItem(OrderItem&& from) noexcept
+    : OrderItem() {
     *this = ::std::move(from);
   }
 
-  inline CreateFlagRequest& operator=(const CreateFlagRequest& from) {
+  inline OrderItem& operator=(const OrderItem& from) {
     CopyFrom(from);
     return *this;
   }
-  inline CreateFlagRequest& operator=(CreateFlagRequest&& from) noexcept {
+  inline OrderItem& operator=(OrderItem&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -7829,20 +8120,20 @@ class CreateFlagRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const CreateFlagRequest& default_instance() {
+  static const OrderItem& default_instance() {
     return *internal_default_instance();
   }
-  static inline const CreateFlagRequest* internal_default_instance() {
-    return reinterpret_cast<const CreateFlagRequest*>(
-               &_CreateFlagRequest_default_instance_);
+  static inline const OrderItem* internal_default_instance() {
+    return reinterpret_cast<const OrderItem*>(
+               &_OrderItem_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    42;
+    44;
 
-  friend void swap(CreateFlagRequest& a, CreateFlagRequest& b) {
+  friend void swap(OrderItem& a, OrderItem& b) {
     a.Swap(&b);
   }
-  inline void Swap(CreateFlagRequest* other) {
+  inline void Swap(OrderItem* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -7855,7 +8146,7 @@ class CreateFlagRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(CreateFlagRequest* other) {
+  void UnsafeArenaSwap(OrderItem* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -7863,14 +8154,14 @@ class CreateFlagRequest final :
 
   // implements Message ----------------------------------------------
 
-  CreateFlagRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<CreateFlagRequest>(arena);
+  OrderItem* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<OrderItem>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const CreateFlagRequest& from);
+  void CopyFrom(const OrderItem& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const CreateFlagRequest& from) {
-    CreateFlagRequest::MergeImpl(*this, from);
+  void MergeFrom( const OrderItem& from) {
+    OrderItem::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -7888,15 +8179,15 @@ class CreateFlagRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(CreateFlagRequest* other);
+  void InternalSwap(OrderItem* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.CreateFlagRequest";
+    return "oteldemo.OrderItem";
   }
   protected:
-  explicit CreateFlagRequest(::google::protobuf::Arena* arena);
+  explicit OrderItem(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -7909,91 +8200,78 @@ class CreateFlagRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kNameFieldNumber = 1,
-    kDescriptionFieldNumber = 2,
-    kEnabledFieldNumber = 3,
+    kItemFieldNumber = 1,
+    kCostFieldNumber = 2,
   };
-  // string name = 1;
-  void clear_name() ;
-  const std::string& name() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_name(Arg_&& arg, Args_... args);
-  std::string* mutable_name();
-  PROTOBUF_NODISCARD std::string* release_name();
-  void set_allocated_name(std::string* ptr);
-
-  private:
-  const std::string& _internal_name() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(
-      const std::string& value);
-  std::string* _internal_mutable_name();
-
-  public:
-  // string description = 2;
-  void clear_description() ;
-  const std::string& description() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_description(Arg_&& arg, Args_... args);
-  std::string* mutable_description();
-  PROTOBUF_NODISCARD std::string* release_description();
-  void set_allocated_description(std::string* ptr);
+  // .oteldemo.CartItem item = 1;
+  bool has_item() const;
+  void clear_item() ;
+  const ::oteldemo::CartItem& item() const;
+  PROTOBUF_NODISCARD ::oteldemo::CartItem* release_item();
+  ::oteldemo::CartItem* mutable_item();
+  void set_allocated_item(::oteldemo::CartItem* value);
+  void unsafe_arena_set_allocated_item(::oteldemo::CartItem* value);
+  ::oteldemo::CartItem* unsafe_arena_release_item();
 
   private:
-  const std::string& _internal_description() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_description(
-      const std::string& value);
-  std::string* _internal_mutable_description();
+  const ::oteldemo::CartItem& _internal_item() const;
+  ::oteldemo::CartItem* _internal_mutable_item();
 
   public:
-  // bool enabled = 3;
-  void clear_enabled() ;
-  bool enabled() const;
-  void set_enabled(bool value);
+  // .oteldemo.Money cost = 2;
+  bool has_cost() const;
+  void clear_cost() ;
+  const ::oteldemo::Money& cost() const;
+  PROTOBUF_NODISCARD ::oteldemo::Money* release_cost();
+  ::oteldemo::Money* mutable_cost();
+  void set_allocated_cost(::oteldemo::Money* value);
+  void unsafe_arena_set_allocated_cost(::oteldemo::Money* value);
+  ::oteldemo::Money* unsafe_arena_release_cost();
 
   private:
-  bool _internal_enabled() const;
-  void _internal_set_enabled(bool value);
+  const ::oteldemo::Money& _internal_cost() const;
+  ::oteldemo::Money* _internal_mutable_cost();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.CreateFlagRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.OrderItem)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<2, 3, 0, 50, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 2, 0, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr name_;
-    ::google::protobuf::internal::ArenaStringPtr description_;
-    bool enabled_;
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    ::oteldemo::CartItem* item_;
+    ::oteldemo::Money* cost_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class CreateFlagResponse final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.CreateFlagResponse) */ {
+class OrderResult final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.OrderResult) */ {
  public:
-  inline CreateFlagResponse() : CreateFlagResponse(nullptr) {}
-  ~CreateFlagResponse() override;
+  inline OrderResult() : OrderResult(nullptr) {}
+  ~OrderResult() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR CreateFlagResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR OrderResult(::google::protobuf::internal::ConstantInitialized);
 
-  CreateFlagResponse(const CreateFlagResponse& from);
-  CreateFlagResponse(CreateFlagResponse&& from) noexcept
-    : CreateFlagResponse() {
+  OrderResult(const OrderResult& from);
+  OrderResult(OrderResult&& from) noexcept
+    : OrderResult() {
     *this = ::std::move(from);
   }
 
-  inline CreateFlagResponse& operator=(const CreateFlagResponse& from) {
+  inline OrderResult& operator=(const OrderResult& from) {
     CopyFrom(from);
     return *this;
   }
-  inline CreateFlagResponse& operator=(CreateFlagResponse&& from) noexcept {
+  inline OrderResult& operator=(OrderResult&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -8023,20 +8301,20 @@ class CreateFlagResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const CreateFlagResponse& default_instance() {
+  static const OrderResult& default_instance() {
     return *internal_default_instance();
   }
-  static inline const CreateFlagResponse* internal_default_instance() {
-    return reinterpret_cast<const CreateFlagResponse*>(
-               &_CreateFlagResponse_default_instance_);
+  static inline const OrderResult* internal_default_instance() {
+    return reinterpret_cast<const OrderResult*>(
+               &_OrderResult_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    43;
+    45;
 
-  friend void swap(CreateFlagResponse& a, CreateFlagResponse& b) {
+  friend void swap(OrderResult& a, OrderResult& b) {
     a.Swap(&b);
   }
-  inline void Swap(CreateFlagResponse* other) {
+  inline void Swap(OrderResult* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -8049,7 +8327,7 @@ class CreateFlagResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(CreateFlagResponse* other) {
+  void UnsafeArenaSwap(OrderResult* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -8057,14 +8335,14 @@ class CreateFlagResponse final :
 
   // implements Message ----------------------------------------------
 
-  CreateFlagResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<CreateFlagResponse>(arena);
+  OrderResult* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<OrderResult>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const CreateFlagResponse& from);
+  void CopyFrom(const OrderResult& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const CreateFlagResponse& from) {
-    CreateFlagResponse::MergeImpl(*this, from);
+  void MergeFrom( const OrderResult& from) {
+    OrderResult::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -8082,15 +8360,15 @@ class CreateFlagResponse final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(CreateFlagResponse* other);
+  void InternalSwap(OrderResult* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.CreateFlagResponse";
+    return "oteldemo.OrderResult";
   }
   protected:
-  explicit CreateFlagResponse(::google::protobuf::Arena* arena);
+  explicit OrderResult(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -8103,61 +8381,134 @@ class CreateFlagResponse final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kFlagFieldNumber = 1,
+    kItemsFieldNumber = 5,
+    kOrderIdFieldNumber = 1,
+    kShippingTrackingIdFieldNumber = 2,
+    kShippingCostFieldNumber = 3,
+    kShippingAddressFieldNumber = 4,
   };
-  // .oteldemo.Flag flag = 1;
-  bool has_flag() const;
-  void clear_flag() ;
-  const ::oteldemo::Flag& flag() const;
-  PROTOBUF_NODISCARD ::oteldemo::Flag* release_flag();
-  ::oteldemo::Flag* mutable_flag();
-  void set_allocated_flag(::oteldemo::Flag* value);
-  void unsafe_arena_set_allocated_flag(::oteldemo::Flag* value);
-  ::oteldemo::Flag* unsafe_arena_release_flag();
+  // repeated .oteldemo.OrderItem items = 5;
+  int items_size() const;
+  private:
+  int _internal_items_size() const;
 
+  public:
+  void clear_items() ;
+  ::oteldemo::OrderItem* mutable_items(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::OrderItem >*
+      mutable_items();
   private:
-  const ::oteldemo::Flag& _internal_flag() const;
-  ::oteldemo::Flag* _internal_mutable_flag();
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>& _internal_items() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::OrderItem>* _internal_mutable_items();
+  public:
+  const ::oteldemo::OrderItem& items(int index) const;
+  ::oteldemo::OrderItem* add_items();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::OrderItem >&
+      items() const;
+  // string order_id = 1;
+  void clear_order_id() ;
+  const std::string& order_id() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_order_id(Arg_&& arg, Args_... args);
+  std::string* mutable_order_id();
+  PROTOBUF_NODISCARD std::string* release_order_id();
+  void set_allocated_order_id(std::string* ptr);
+
+  private:
+  const std::string& _internal_order_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_order_id(
+      const std::string& value);
+  std::string* _internal_mutable_order_id();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.CreateFlagResponse)
+  // string shipping_tracking_id = 2;
+  void clear_shipping_tracking_id() ;
+  const std::string& shipping_tracking_id() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_shipping_tracking_id(Arg_&& arg, Args_... args);
+  std::string* mutable_shipping_tracking_id();
+  PROTOBUF_NODISCARD std::string* release_shipping_tracking_id();
+  void set_allocated_shipping_tracking_id(std::string* ptr);
+
+  private:
+  const std::string& _internal_shipping_tracking_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_shipping_tracking_id(
+      const std::string& value);
+  std::string* _internal_mutable_shipping_tracking_id();
+
+  public:
+  // .oteldemo.Money shipping_cost = 3;
+  bool has_shipping_cost() const;
+  void clear_shipping_cost() ;
+  const ::oteldemo::Money& shipping_cost() const;
+  PROTOBUF_NODISCARD ::oteldemo::Money* release_shipping_cost();
+  ::oteldemo::Money* mutable_shipping_cost();
+  void set_allocated_shipping_cost(::oteldemo::Money* value);
+  void unsafe_arena_set_allocated_shipping_cost(::oteldemo::Money* value);
+  ::oteldemo::Money* unsafe_arena_release_shipping_cost();
+
+  private:
+  const ::oteldemo::Money& _internal_shipping_cost() const;
+  ::oteldemo::Money* _internal_mutable_shipping_cost();
+
+  public:
+  // .oteldemo.Address shipping_address = 4;
+  bool has_shipping_address() const;
+  void clear_shipping_address() ;
+  const ::oteldemo::Address& shipping_address() const;
+  PROTOBUF_NODISCARD ::oteldemo::Address* release_shipping_address();
+  ::oteldemo::Address* mutable_shipping_address();
+  void set_allocated_shipping_address(::oteldemo::Address* value);
+  void unsafe_arena_set_allocated_shipping_address(::oteldemo::Address* value);
+  ::oteldemo::Address* unsafe_arena_release_shipping_address();
+
+  private:
+  const ::oteldemo::Address& _internal_shipping_address() const;
+  ::oteldemo::Address* _internal_mutable_shipping_address();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.OrderResult)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<3, 5, 3, 57, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
     ::google::protobuf::internal::HasBits<1> _has_bits_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
-    ::oteldemo::Flag* flag_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::OrderItem > items_;
+    ::google::protobuf::internal::ArenaStringPtr order_id_;
+    ::google::protobuf::internal::ArenaStringPtr shipping_tracking_id_;
+    ::oteldemo::Money* shipping_cost_;
+    ::oteldemo::Address* shipping_address_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class UpdateFlagRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.UpdateFlagRequest) */ {
+class SendOrderConfirmationRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.SendOrderConfirmationRequest) */ {
  public:
-  inline UpdateFlagRequest() : UpdateFlagRequest(nullptr) {}
-  ~UpdateFlagRequest() override;
+  inline SendOrderConfirmationRequest() : SendOrderConfirmationRequest(nullptr) {}
+  ~SendOrderConfirmationRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR UpdateFlagRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR SendOrderConfirmationRequest(::google::protobuf::internal::ConstantInitialized);
 
-  UpdateFlagRequest(const UpdateFlagRequest& from);
-  UpdateFlagRequest(UpdateFlagRequest&& from) noexcept
-    : UpdateFlagRequest() {
+  SendOrderConfirmationRequest(const SendOrderConfirmationRequest& from);
+  SendOrderConfirmationRequest(SendOrderConfirmationRequest&& from) noexcept
+    : SendOrderConfirmationRequest() {
     *this = ::std::move(from);
   }
 
-  inline UpdateFlagRequest& operator=(const UpdateFlagRequest& from) {
+  inline SendOrderConfirmationRequest& operator=(const SendOrderConfirmationRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline UpdateFlagRequest& operator=(UpdateFlagRequest&& from) noexcept {
+  inline SendOrderConfirmationRequest& operator=(SendOrderConfirmationRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -8187,20 +8538,20 @@ class UpdateFlagRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const UpdateFlagRequest& default_instance() {
+  static const SendOrderConfirmationRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const UpdateFlagRequest* internal_default_instance() {
-    return reinterpret_cast<const UpdateFlagRequest*>(
-               &_UpdateFlagRequest_default_instance_);
+  static inline const SendOrderConfirmationRequest* internal_default_instance() {
+    return reinterpret_cast<const SendOrderConfirmationRequest*>(
+               &_SendOrderConfirmationRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    44;
+    46;
 
-  friend void swap(UpdateFlagRequest& a, UpdateFlagRequest& b) {
+  friend void swap(SendOrderConfirmationRequest& a, SendOrderConfirmationRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(UpdateFlagRequest* other) {
+  inline void Swap(SendOrderConfirmationRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -8213,7 +8564,7 @@ class UpdateFlagRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(UpdateFlagRequest* other) {
+  void UnsafeArenaSwap(SendOrderConfirmationRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -8221,14 +8572,14 @@ class UpdateFlagRequest final :
 
   // implements Message ----------------------------------------------
 
-  UpdateFlagRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<UpdateFlagRequest>(arena);
+  SendOrderConfirmationRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<SendOrderConfirmationRequest>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const UpdateFlagRequest& from);
+  void CopyFrom(const SendOrderConfirmationRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const UpdateFlagRequest& from) {
-    UpdateFlagRequest::MergeImpl(*this, from);
+  void MergeFrom( const SendOrderConfirmationRequest& from) {
+    SendOrderConfirmationRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -8246,15 +8597,15 @@ class UpdateFlagRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(UpdateFlagRequest* other);
+  void InternalSwap(SendOrderConfirmationRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.UpdateFlagRequest";
+    return "oteldemo.SendOrderConfirmationRequest";
   }
   protected:
-  explicit UpdateFlagRequest(::google::protobuf::Arena* arena);
+  explicit SendOrderConfirmationRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -8267,72 +8618,79 @@ class UpdateFlagRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kNameFieldNumber = 1,
-    kEnabledFieldNumber = 2,
+    kEmailFieldNumber = 1,
+    kOrderFieldNumber = 2,
   };
-  // string name = 1;
-  void clear_name() ;
-  const std::string& name() const;
+  // string email = 1;
+  void clear_email() ;
+  const std::string& email() const;
   template <typename Arg_ = const std::string&, typename... Args_>
-  void set_name(Arg_&& arg, Args_... args);
-  std::string* mutable_name();
-  PROTOBUF_NODISCARD std::string* release_name();
-  void set_allocated_name(std::string* ptr);
+  void set_email(Arg_&& arg, Args_... args);
+  std::string* mutable_email();
+  PROTOBUF_NODISCARD std::string* release_email();
+  void set_allocated_email(std::string* ptr);
 
   private:
-  const std::string& _internal_name() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(
+  const std::string& _internal_email() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_email(
       const std::string& value);
-  std::string* _internal_mutable_name();
+  std::string* _internal_mutable_email();
 
   public:
-  // bool enabled = 2;
-  void clear_enabled() ;
-  bool enabled() const;
-  void set_enabled(bool value);
+  // .oteldemo.OrderResult order = 2;
+  bool has_order() const;
+  void clear_order() ;
+  const ::oteldemo::OrderResult& order() const;
+  PROTOBUF_NODISCARD ::oteldemo::OrderResult* release_order();
+  ::oteldemo::OrderResult* mutable_order();
+  void set_allocated_order(::oteldemo::OrderResult* value);
+  void unsafe_arena_set_allocated_order(::oteldemo::OrderResult* value);
+  ::oteldemo::OrderResult* unsafe_arena_release_order();
 
   private:
-  bool _internal_enabled() const;
-  void _internal_set_enabled(bool value);
+  const ::oteldemo::OrderResult& _internal_order() const;
+  ::oteldemo::OrderResult* _internal_mutable_order();
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.UpdateFlagRequest)
+  // @@protoc_insertion_point(class_scope:oteldemo.SendOrderConfirmationRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<1, 2, 0, 39, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 1, 51, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr name_;
-    bool enabled_;
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr email_;
+    ::oteldemo::OrderResult* order_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
   union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class UpdateFlagResponse final :
-    public ::google::protobuf::internal::ZeroFieldsBase /* @@protoc_insertion_point(class_definition:oteldemo.UpdateFlagResponse) */ {
+class PlaceOrderRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.PlaceOrderRequest) */ {
  public:
-  inline UpdateFlagResponse() : UpdateFlagResponse(nullptr) {}
+  inline PlaceOrderRequest() : PlaceOrderRequest(nullptr) {}
+  ~PlaceOrderRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR UpdateFlagResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR PlaceOrderRequest(::google::protobuf::internal::ConstantInitialized);
 
-  UpdateFlagResponse(const UpdateFlagResponse& from);
-  UpdateFlagResponse(UpdateFlagResponse&& from) noexcept
-    : UpdateFlagResponse() {
+  PlaceOrderRequest(const PlaceOrderRequest& from);
+  PlaceOrderRequest(PlaceOrderRequest&& from) noexcept
+    : PlaceOrderRequest() {
     *this = ::std::move(from);
   }
 
-  inline UpdateFlagResponse& operator=(const UpdateFlagResponse& from) {
+  inline PlaceOrderRequest& operator=(const PlaceOrderRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline UpdateFlagResponse& operator=(UpdateFlagResponse&& from) noexcept {
+  inline PlaceOrderRequest& operator=(PlaceOrderRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -8362,20 +8720,20 @@ class UpdateFlagResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const UpdateFlagResponse& default_instance() {
+  static const PlaceOrderRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const UpdateFlagResponse* internal_default_instance() {
-    return reinterpret_cast<const UpdateFlagResponse*>(
-               &_UpdateFlagResponse_default_instance_);
+  static inline const PlaceOrderRequest* internal_default_instance() {
+    return reinterpret_cast<const PlaceOrderRequest*>(
+               &_PlaceOrderRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    45;
+    47;
 
-  friend void swap(UpdateFlagResponse& a, UpdateFlagResponse& b) {
+  friend void swap(PlaceOrderRequest& a, PlaceOrderRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(UpdateFlagResponse* other) {
+  inline void Swap(PlaceOrderRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -8388,7 +8746,7 @@ class UpdateFlagResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(UpdateFlagResponse* other) {
+  void UnsafeArenaSwap(PlaceOrderRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -8396,26 +8754,40 @@ class UpdateFlagResponse final :
 
   // implements Message ----------------------------------------------
 
-  UpdateFlagResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<UpdateFlagResponse>(arena);
+  PlaceOrderRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<PlaceOrderRequest>(arena);
   }
-  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
-  inline void CopyFrom(const UpdateFlagResponse& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
-  }
-  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
-  void MergeFrom(const UpdateFlagResponse& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const PlaceOrderRequest& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const PlaceOrderRequest& from) {
+    PlaceOrderRequest::MergeImpl(*this, from);
   }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
   public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(PlaceOrderRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.UpdateFlagResponse";
+    return "oteldemo.PlaceOrderRequest";
   }
   protected:
-  explicit UpdateFlagResponse(::google::protobuf::Arena* arena);
+  explicit PlaceOrderRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -8427,37 +8799,133 @@ class UpdateFlagResponse final :
 
   // accessors -------------------------------------------------------
 
-  // @@protoc_insertion_point(class_scope:oteldemo.UpdateFlagResponse)
+  enum : int {
+    kUserIdFieldNumber = 1,
+    kUserCurrencyFieldNumber = 2,
+    kEmailFieldNumber = 5,
+    kAddressFieldNumber = 3,
+    kCreditCardFieldNumber = 6,
+  };
+  // string user_id = 1;
+  void clear_user_id() ;
+  const std::string& user_id() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_user_id(Arg_&& arg, Args_... args);
+  std::string* mutable_user_id();
+  PROTOBUF_NODISCARD std::string* release_user_id();
+  void set_allocated_user_id(std::string* ptr);
+
+  private:
+  const std::string& _internal_user_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_user_id(
+      const std::string& value);
+  std::string* _internal_mutable_user_id();
+
+  public:
+  // string user_currency = 2;
+  void clear_user_currency() ;
+  const std::string& user_currency() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_user_currency(Arg_&& arg, Args_... args);
+  std::string* mutable_user_currency();
+  PROTOBUF_NODISCARD std::string* release_user_currency();
+  void set_allocated_user_currency(std::string* ptr);
+
+  private:
+  const std::string& _internal_user_currency() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_user_currency(
+      const std::string& value);
+  std::string* _internal_mutable_user_currency();
+
+  public:
+  // string email = 5;
+  void clear_email() ;
+  const std::string& email() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_email(Arg_&& arg, Args_... args);
+  std::string* mutable_email();
+  PROTOBUF_NODISCARD std::string* release_email();
+  void set_allocated_email(std::string* ptr);
+
+  private:
+  const std::string& _internal_email() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_email(
+      const std::string& value);
+  std::string* _internal_mutable_email();
+
+  public:
+  // .oteldemo.Address address = 3;
+  bool has_address() const;
+  void clear_address() ;
+  const ::oteldemo::Address& address() const;
+  PROTOBUF_NODISCARD ::oteldemo::Address* release_address();
+  ::oteldemo::Address* mutable_address();
+  void set_allocated_address(::oteldemo::Address* value);
+  void unsafe_arena_set_allocated_address(::oteldemo::Address* value);
+  ::oteldemo::Address* unsafe_arena_release_address();
+
+  private:
+  const ::oteldemo::Address& _internal_address() const;
+  ::oteldemo::Address* _internal_mutable_address();
+
+  public:
+  // .oteldemo.CreditCardInfo credit_card = 6;
+  bool has_credit_card() const;
+  void clear_credit_card() ;
+  const ::oteldemo::CreditCardInfo& credit_card() const;
+  PROTOBUF_NODISCARD ::oteldemo::CreditCardInfo* release_credit_card();
+  ::oteldemo::CreditCardInfo* mutable_credit_card();
+  void set_allocated_credit_card(::oteldemo::CreditCardInfo* value);
+  void unsafe_arena_set_allocated_credit_card(::oteldemo::CreditCardInfo* value);
+  ::oteldemo::CreditCardInfo* unsafe_arena_release_credit_card();
+
+  private:
+  const ::oteldemo::CreditCardInfo& _internal_credit_card() const;
+  ::oteldemo::CreditCardInfo* _internal_mutable_credit_card();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.PlaceOrderRequest)
  private:
   class _Internal;
 
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<3, 5, 2, 60, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    ::google::protobuf::internal::ArenaStringPtr user_id_;
+    ::google::protobuf::internal::ArenaStringPtr user_currency_;
+    ::google::protobuf::internal::ArenaStringPtr email_;
+    ::oteldemo::Address* address_;
+    ::oteldemo::CreditCardInfo* credit_card_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
+  union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class ListFlagsRequest final :
-    public ::google::protobuf::internal::ZeroFieldsBase /* @@protoc_insertion_point(class_definition:oteldemo.ListFlagsRequest) */ {
+class PlaceOrderResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.PlaceOrderResponse) */ {
  public:
-  inline ListFlagsRequest() : ListFlagsRequest(nullptr) {}
+  inline PlaceOrderResponse() : PlaceOrderResponse(nullptr) {}
+  ~PlaceOrderResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR ListFlagsRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR PlaceOrderResponse(::google::protobuf::internal::ConstantInitialized);
 
-  ListFlagsRequest(const ListFlagsRequest& from);
-  ListFlagsRequest(ListFlagsRequest&& from) noexcept
-    : ListFlagsRequest() {
+  PlaceOrderResponse(const PlaceOrderResponse& from);
+  PlaceOrderResponse(PlaceOrderResponse&& from) noexcept
+    : PlaceOrderResponse() {
     *this = ::std::move(from);
   }
 
-  inline ListFlagsRequest& operator=(const ListFlagsRequest& from) {
+  inline PlaceOrderResponse& operator=(const PlaceOrderResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ListFlagsRequest& operator=(ListFlagsRequest&& from) noexcept {
+  inline PlaceOrderResponse& operator=(PlaceOrderResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -8487,20 +8955,20 @@ class ListFlagsRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ListFlagsRequest& default_instance() {
+  static const PlaceOrderResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const ListFlagsRequest* internal_default_instance() {
-    return reinterpret_cast<const ListFlagsRequest*>(
-               &_ListFlagsRequest_default_instance_);
+  static inline const PlaceOrderResponse* internal_default_instance() {
+    return reinterpret_cast<const PlaceOrderResponse*>(
+               &_PlaceOrderResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    46;
+    48;
 
-  friend void swap(ListFlagsRequest& a, ListFlagsRequest& b) {
+  friend void swap(PlaceOrderResponse& a, PlaceOrderResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(ListFlagsRequest* other) {
+  inline void Swap(PlaceOrderResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -8513,7 +8981,7 @@ class ListFlagsRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ListFlagsRequest* other) {
+  void UnsafeArenaSwap(PlaceOrderResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -8521,26 +8989,40 @@ class ListFlagsRequest final :
 
   // implements Message ----------------------------------------------
 
-  ListFlagsRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<ListFlagsRequest>(arena);
-  }
-  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
-  inline void CopyFrom(const ListFlagsRequest& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
+  PlaceOrderResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<PlaceOrderResponse>(arena);
   }
-  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
-  void MergeFrom(const ListFlagsRequest& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const PlaceOrderResponse& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const PlaceOrderResponse& from) {
+    PlaceOrderResponse::MergeImpl(*this, from);
   }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
   public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(PlaceOrderResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.ListFlagsRequest";
+    return "oteldemo.PlaceOrderResponse";
   }
   protected:
-  explicit ListFlagsRequest(::google::protobuf::Arena* arena);
+  explicit PlaceOrderResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -8552,38 +9034,62 @@ class ListFlagsRequest final :
 
   // accessors -------------------------------------------------------
 
-  // @@protoc_insertion_point(class_scope:oteldemo.ListFlagsRequest)
+  enum : int {
+    kOrderFieldNumber = 1,
+  };
+  // .oteldemo.OrderResult order = 1;
+  bool has_order() const;
+  void clear_order() ;
+  const ::oteldemo::OrderResult& order() const;
+  PROTOBUF_NODISCARD ::oteldemo::OrderResult* release_order();
+  ::oteldemo::OrderResult* mutable_order();
+  void set_allocated_order(::oteldemo::OrderResult* value);
+  void unsafe_arena_set_allocated_order(::oteldemo::OrderResult* value);
+  ::oteldemo::OrderResult* unsafe_arena_release_order();
+
+  private:
+  const ::oteldemo::OrderResult& _internal_order() const;
+  ::oteldemo::OrderResult* _internal_mutable_order();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.PlaceOrderResponse)
  private:
   class _Internal;
 
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    ::oteldemo::OrderResult* order_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
+  union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class ListFlagsResponse final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ListFlagsResponse) */ {
+class AdRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.AdRequest) */ {
  public:
-  inline ListFlagsResponse() : ListFlagsResponse(nullptr) {}
-  ~ListFlagsResponse() override;
+  inline AdRequest() : AdRequest(nullptr) {}
+  ~AdRequest() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR ListFlagsResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR AdRequest(::google::protobuf::internal::ConstantInitialized);
 
-  ListFlagsResponse(const ListFlagsResponse& from);
-  ListFlagsResponse(ListFlagsResponse&& from) noexcept
-    : ListFlagsResponse() {
+  AdRequest(const AdRequest& from);
+  AdRequest(AdRequest&& from) noexcept
+    : AdRequest() {
     *this = ::std::move(from);
   }
 
-  inline ListFlagsResponse& operator=(const ListFlagsResponse& from) {
+  inline AdRequest& operator=(const AdRequest& from) {
     CopyFrom(from);
     return *this;
   }
-  inline ListFlagsResponse& operator=(ListFlagsResponse&& from) noexcept {
+  inline AdRequest& operator=(AdRequest&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -8613,20 +9119,20 @@ class ListFlagsResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const ListFlagsResponse& default_instance() {
+  static const AdRequest& default_instance() {
     return *internal_default_instance();
   }
-  static inline const ListFlagsResponse* internal_default_instance() {
-    return reinterpret_cast<const ListFlagsResponse*>(
-               &_ListFlagsResponse_default_instance_);
+  static inline const AdRequest* internal_default_instance() {
+    return reinterpret_cast<const AdRequest*>(
+               &_AdRequest_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    47;
+    49;
 
-  friend void swap(ListFlagsResponse& a, ListFlagsResponse& b) {
+  friend void swap(AdRequest& a, AdRequest& b) {
     a.Swap(&b);
   }
-  inline void Swap(ListFlagsResponse* other) {
+  inline void Swap(AdRequest* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -8639,7 +9145,7 @@ class ListFlagsResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(ListFlagsResponse* other) {
+  void UnsafeArenaSwap(AdRequest* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -8647,14 +9153,14 @@ class ListFlagsResponse final :
 
   // implements Message ----------------------------------------------
 
-  ListFlagsResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<ListFlagsResponse>(arena);
-  }
+  AdRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<AdRequest>(arena);
+  }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const ListFlagsResponse& from);
+  void CopyFrom(const AdRequest& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const ListFlagsResponse& from) {
-    ListFlagsResponse::MergeImpl(*this, from);
+  void MergeFrom( const AdRequest& from) {
+    AdRequest::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -8672,15 +9178,15 @@ class ListFlagsResponse final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(ListFlagsResponse* other);
+  void InternalSwap(AdRequest* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.ListFlagsResponse";
+    return "oteldemo.AdRequest";
   }
   protected:
-  explicit ListFlagsResponse(::google::protobuf::Arena* arena);
+  explicit AdRequest(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -8693,37 +9199,47 @@ class ListFlagsResponse final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kFlagFieldNumber = 1,
+    kContextKeysFieldNumber = 1,
   };
-  // repeated .oteldemo.Flag flag = 1;
-  int flag_size() const;
+  // repeated string context_keys = 1;
+  int context_keys_size() const;
   private:
-  int _internal_flag_size() const;
+  int _internal_context_keys_size() const;
 
   public:
-  void clear_flag() ;
-  ::oteldemo::Flag* mutable_flag(int index);
-  ::google::protobuf::RepeatedPtrField< ::oteldemo::Flag >*
-      mutable_flag();
+  void clear_context_keys() ;
+  const std::string& context_keys(int index) const;
+  std::string* mutable_context_keys(int index);
+  void set_context_keys(int index, const std::string& value);
+  void set_context_keys(int index, std::string&& value);
+  void set_context_keys(int index, const char* value);
+  void set_context_keys(int index, const char* value, std::size_t size);
+  void set_context_keys(int index, absl::string_view value);
+  std::string* add_context_keys();
+  void add_context_keys(const std::string& value);
+  void add_context_keys(std::string&& value);
+  void add_context_keys(const char* value);
+  void add_context_keys(const char* value, std::size_t size);
+  void add_context_keys(absl::string_view value);
+  const ::google::protobuf::RepeatedPtrField<std::string>& context_keys() const;
+  ::google::protobuf::RepeatedPtrField<std::string>* mutable_context_keys();
+
   private:
-  const ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>& _internal_flag() const;
-  ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>* _internal_mutable_flag();
+  const ::google::protobuf::RepeatedPtrField<std::string>& _internal_context_keys() const;
+  ::google::protobuf::RepeatedPtrField<std::string>* _internal_mutable_context_keys();
+
   public:
-  const ::oteldemo::Flag& flag(int index) const;
-  ::oteldemo::Flag* add_flag();
-  const ::google::protobuf::RepeatedPtrField< ::oteldemo::Flag >&
-      flag() const;
-  // @@protoc_insertion_point(class_scope:oteldemo.ListFlagsResponse)
+  // @@protoc_insertion_point(class_scope:oteldemo.AdRequest)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 39, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::RepeatedPtrField< ::oteldemo::Flag > flag_;
+    ::google::protobuf::RepeatedPtrField<std::string> context_keys_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -8731,25 +9247,25 @@ class ListFlagsResponse final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class DeleteFlagRequest final :
-    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.DeleteFlagRequest) */ {
+class AdResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.AdResponse) */ {
  public:
-  inline DeleteFlagRequest() : DeleteFlagRequest(nullptr) {}
-  ~DeleteFlagRequest() override;
+  inline AdResponse() : AdResponse(nullptr) {}
+  ~AdResponse() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR DeleteFlagRequest(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR AdResponse(::google::protobuf::internal::ConstantInitialized);
 
-  DeleteFlagRequest(const DeleteFlagRequest& from);
-  DeleteFlagRequest(DeleteFlagRequest&& from) noexcept
-    : DeleteFlagRequest() {
+  AdResponse(const AdResponse& from);
+  AdResponse(AdResponse&& from) noexcept
+    : AdResponse() {
     *this = ::std::move(from);
   }
 
-  inline DeleteFlagRequest& operator=(const DeleteFlagRequest& from) {
+  inline AdResponse& operator=(const AdResponse& from) {
     CopyFrom(from);
     return *this;
   }
-  inline DeleteFlagRequest& operator=(DeleteFlagRequest&& from) noexcept {
+  inline AdResponse& operator=(AdResponse&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -8779,20 +9295,20 @@ class DeleteFlagRequest final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const DeleteFlagRequest& default_instance() {
+  static const AdResponse& default_instance() {
     return *internal_default_instance();
   }
-  static inline const DeleteFlagRequest* internal_default_instance() {
-    return reinterpret_cast<const DeleteFlagRequest*>(
-               &_DeleteFlagRequest_default_instance_);
+  static inline const AdResponse* internal_default_instance() {
+    return reinterpret_cast<const AdResponse*>(
+               &_AdResponse_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    48;
+    50;
 
-  friend void swap(DeleteFlagRequest& a, DeleteFlagRequest& b) {
+  friend void swap(AdResponse& a, AdResponse& b) {
     a.Swap(&b);
   }
-  inline void Swap(DeleteFlagRequest* other) {
+  inline void Swap(AdResponse* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -8805,7 +9321,7 @@ class DeleteFlagRequest final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(DeleteFlagRequest* other) {
+  void UnsafeArenaSwap(AdResponse* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -8813,14 +9329,14 @@ class DeleteFlagRequest final :
 
   // implements Message ----------------------------------------------
 
-  DeleteFlagRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<DeleteFlagRequest>(arena);
+  AdResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<AdResponse>(arena);
   }
   using ::google::protobuf::Message::CopyFrom;
-  void CopyFrom(const DeleteFlagRequest& from);
+  void CopyFrom(const AdResponse& from);
   using ::google::protobuf::Message::MergeFrom;
-  void MergeFrom( const DeleteFlagRequest& from) {
-    DeleteFlagRequest::MergeImpl(*this, from);
+  void MergeFrom( const AdResponse& from) {
+    AdResponse::MergeImpl(*this, from);
   }
   private:
   static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
@@ -8838,15 +9354,15 @@ class DeleteFlagRequest final :
   void SharedCtor(::google::protobuf::Arena* arena);
   void SharedDtor();
   void SetCachedSize(int size) const final;
-  void InternalSwap(DeleteFlagRequest* other);
+  void InternalSwap(AdResponse* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.DeleteFlagRequest";
+    return "oteldemo.AdResponse";
   }
   protected:
-  explicit DeleteFlagRequest(::google::protobuf::Arena* arena);
+  explicit AdResponse(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -8859,35 +9375,37 @@ class DeleteFlagRequest final :
   // accessors -------------------------------------------------------
 
   enum : int {
-    kNameFieldNumber = 1,
+    kAdsFieldNumber = 1,
   };
-  // string name = 1;
-  void clear_name() ;
-  const std::string& name() const;
-  template <typename Arg_ = const std::string&, typename... Args_>
-  void set_name(Arg_&& arg, Args_... args);
-  std::string* mutable_name();
-  PROTOBUF_NODISCARD std::string* release_name();
-  void set_allocated_name(std::string* ptr);
-
+  // repeated .oteldemo.Ad ads = 1;
+  int ads_size() const;
   private:
-  const std::string& _internal_name() const;
-  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(
-      const std::string& value);
-  std::string* _internal_mutable_name();
+  int _internal_ads_size() const;
 
   public:
-  // @@protoc_insertion_point(class_scope:oteldemo.DeleteFlagRequest)
+  void clear_ads() ;
+  ::oteldemo::Ad* mutable_ads(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::Ad >*
+      mutable_ads();
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>& _internal_ads() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::Ad>* _internal_mutable_ads();
+  public:
+  const ::oteldemo::Ad& ads(int index) const;
+  ::oteldemo::Ad* add_ads();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::Ad >&
+      ads() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.AdResponse)
  private:
   class _Internal;
 
   friend class ::google::protobuf::internal::TcParser;
-  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 39, 2> _table_;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
-    ::google::protobuf::internal::ArenaStringPtr name_;
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::Ad > ads_;
     mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
@@ -8895,24 +9413,25 @@ class DeleteFlagRequest final :
   friend struct ::TableStruct_demo_2eproto;
 };// -------------------------------------------------------------------
 
-class DeleteFlagResponse final :
-    public ::google::protobuf::internal::ZeroFieldsBase /* @@protoc_insertion_point(class_definition:oteldemo.DeleteFlagResponse) */ {
+class Ad final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.Ad) */ {
  public:
-  inline DeleteFlagResponse() : DeleteFlagResponse(nullptr) {}
+  inline Ad() : Ad(nullptr) {}
+  ~Ad() override;
   template<typename = void>
-  explicit PROTOBUF_CONSTEXPR DeleteFlagResponse(::google::protobuf::internal::ConstantInitialized);
+  explicit PROTOBUF_CONSTEXPR Ad(::google::protobuf::internal::ConstantInitialized);
 
-  DeleteFlagResponse(const DeleteFlagResponse& from);
-  DeleteFlagResponse(DeleteFlagResponse&& from) noexcept
-    : DeleteFlagResponse() {
+  Ad(const Ad& from);
+  Ad(Ad&& from) noexcept
+    : Ad() {
     *this = ::std::move(from);
   }
 
-  inline DeleteFlagResponse& operator=(const DeleteFlagResponse& from) {
+  inline Ad& operator=(const Ad& from) {
     CopyFrom(from);
     return *this;
   }
-  inline DeleteFlagResponse& operator=(DeleteFlagResponse&& from) noexcept {
+  inline Ad& operator=(Ad&& from) noexcept {
     if (this == &from) return *this;
     if (GetOwningArena() == from.GetOwningArena()
   #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
@@ -8942,20 +9461,20 @@ class DeleteFlagResponse final :
   static const ::google::protobuf::Reflection* GetReflection() {
     return default_instance().GetMetadata().reflection;
   }
-  static const DeleteFlagResponse& default_instance() {
+  static const Ad& default_instance() {
     return *internal_default_instance();
   }
-  static inline const DeleteFlagResponse* internal_default_instance() {
-    return reinterpret_cast<const DeleteFlagResponse*>(
-               &_DeleteFlagResponse_default_instance_);
+  static inline const Ad* internal_default_instance() {
+    return reinterpret_cast<const Ad*>(
+               &_Ad_default_instance_);
   }
   static constexpr int kIndexInFileMessages =
-    49;
+    51;
 
-  friend void swap(DeleteFlagResponse& a, DeleteFlagResponse& b) {
+  friend void swap(Ad& a, Ad& b) {
     a.Swap(&b);
   }
-  inline void Swap(DeleteFlagResponse* other) {
+  inline void Swap(Ad* other) {
     if (other == this) return;
   #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
     if (GetOwningArena() != nullptr &&
@@ -8968,7 +9487,7 @@ class DeleteFlagResponse final :
       ::google::protobuf::internal::GenericSwap(this, other);
     }
   }
-  void UnsafeArenaSwap(DeleteFlagResponse* other) {
+  void UnsafeArenaSwap(Ad* other) {
     if (other == this) return;
     ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
     InternalSwap(other);
@@ -8976,26 +9495,40 @@ class DeleteFlagResponse final :
 
   // implements Message ----------------------------------------------
 
-  DeleteFlagResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
-    return CreateMaybeMessage<DeleteFlagResponse>(arena);
-  }
-  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
-  inline void CopyFrom(const DeleteFlagResponse& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
+  Ad* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<Ad>(arena);
   }
-  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
-  void MergeFrom(const DeleteFlagResponse& from) {
-    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const Ad& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const Ad& from) {
+    Ad::MergeImpl(*this, from);
   }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
   public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(Ad* other);
 
   private:
   friend class ::google::protobuf::internal::AnyMetadata;
   static ::absl::string_view FullMessageName() {
-    return "oteldemo.DeleteFlagResponse";
+    return "oteldemo.Ad";
   }
   protected:
-  explicit DeleteFlagResponse(::google::protobuf::Arena* arena);
+  explicit Ad(::google::protobuf::Arena* arena);
   public:
 
   static const ClassData _class_data_;
@@ -9007,201 +9540,2874 @@ class DeleteFlagResponse final :
 
   // accessors -------------------------------------------------------
 
-  // @@protoc_insertion_point(class_scope:oteldemo.DeleteFlagResponse)
+  enum : int {
+    kRedirectUrlFieldNumber = 1,
+    kTextFieldNumber = 2,
+  };
+  // string redirect_url = 1;
+  void clear_redirect_url() ;
+  const std::string& redirect_url() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_redirect_url(Arg_&& arg, Args_... args);
+  std::string* mutable_redirect_url();
+  PROTOBUF_NODISCARD std::string* release_redirect_url();
+  void set_allocated_redirect_url(std::string* ptr);
+
+  private:
+  const std::string& _internal_redirect_url() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_redirect_url(
+      const std::string& value);
+  std::string* _internal_mutable_redirect_url();
+
+  public:
+  // string text = 2;
+  void clear_text() ;
+  const std::string& text() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_text(Arg_&& arg, Args_... args);
+  std::string* mutable_text();
+  PROTOBUF_NODISCARD std::string* release_text();
+  void set_allocated_text(std::string* ptr);
+
+  private:
+  const std::string& _internal_text() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_text(
+      const std::string& value);
+  std::string* _internal_mutable_text();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.Ad)
  private:
   class _Internal;
 
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 0, 36, 2> _table_;
   template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
   typedef void InternalArenaConstructable_;
   typedef void DestructorSkippable_;
   struct Impl_ {
+    ::google::protobuf::internal::ArenaStringPtr redirect_url_;
+    ::google::protobuf::internal::ArenaStringPtr text_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
     PROTOBUF_TSAN_DECLARE_MEMBER
   };
+  union { Impl_ _impl_; };
   friend struct ::TableStruct_demo_2eproto;
-};
+};// -------------------------------------------------------------------
+
+class Flag final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.Flag) */ {
+ public:
+  inline Flag() : Flag(nullptr) {}
+  ~Flag() override;
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR Flag(::google::protobuf::internal::ConstantInitialized);
+
+  Flag(const Flag& from);
+  Flag(Flag&& from) noexcept
+    : Flag() {
+    *this = ::std::move(from);
+  }
+
+  inline Flag& operator=(const Flag& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline Flag& operator=(Flag&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const Flag& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const Flag* internal_default_instance() {
+    return reinterpret_cast<const Flag*>(
+               &_Flag_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    52;
+
+  friend void swap(Flag& a, Flag& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(Flag* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(Flag* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  Flag* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<Flag>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const Flag& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const Flag& from) {
+    Flag::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(Flag* other);
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.Flag";
+  }
+  protected:
+  explicit Flag(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kNameFieldNumber = 1,
+    kDescriptionFieldNumber = 2,
+    kEnabledFieldNumber = 3,
+  };
+  // string name = 1;
+  void clear_name() ;
+  const std::string& name() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_name(Arg_&& arg, Args_... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* ptr);
+
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(
+      const std::string& value);
+  std::string* _internal_mutable_name();
+
+  public:
+  // string description = 2;
+  void clear_description() ;
+  const std::string& description() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_description(Arg_&& arg, Args_... args);
+  std::string* mutable_description();
+  PROTOBUF_NODISCARD std::string* release_description();
+  void set_allocated_description(std::string* ptr);
+
+  private:
+  const std::string& _internal_description() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_description(
+      const std::string& value);
+  std::string* _internal_mutable_description();
+
+  public:
+  // bool enabled = 3;
+  void clear_enabled() ;
+  bool enabled() const;
+  void set_enabled(bool value);
+
+  private:
+  bool _internal_enabled() const;
+  void _internal_set_enabled(bool value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.Flag)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<2, 3, 0, 37, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::google::protobuf::internal::ArenaStringPtr name_;
+    ::google::protobuf::internal::ArenaStringPtr description_;
+    bool enabled_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class GetFlagRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetFlagRequest) */ {
+ public:
+  inline GetFlagRequest() : GetFlagRequest(nullptr) {}
+  ~GetFlagRequest() override;
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR GetFlagRequest(::google::protobuf::internal::ConstantInitialized);
+
+  GetFlagRequest(const GetFlagRequest& from);
+  GetFlagRequest(GetFlagRequest&& from) noexcept
+    : GetFlagRequest() {
+    *this = ::std::move(from);
+  }
+
+  inline GetFlagRequest& operator=(const GetFlagRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GetFlagRequest& operator=(GetFlagRequest&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const GetFlagRequest& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const GetFlagRequest* internal_default_instance() {
+    return reinterpret_cast<const GetFlagRequest*>(
+               &_GetFlagRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    53;
+
+  friend void swap(GetFlagRequest& a, GetFlagRequest& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(GetFlagRequest* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(GetFlagRequest* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  GetFlagRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetFlagRequest>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const GetFlagRequest& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const GetFlagRequest& from) {
+    GetFlagRequest::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GetFlagRequest* other);
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.GetFlagRequest";
+  }
+  protected:
+  explicit GetFlagRequest(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kNameFieldNumber = 1,
+  };
+  // string name = 1;
+  void clear_name() ;
+  const std::string& name() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_name(Arg_&& arg, Args_... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* ptr);
+
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(
+      const std::string& value);
+  std::string* _internal_mutable_name();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.GetFlagRequest)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 36, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::google::protobuf::internal::ArenaStringPtr name_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class GetFlagResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.GetFlagResponse) */ {
+ public:
+  inline GetFlagResponse() : GetFlagResponse(nullptr) {}
+  ~GetFlagResponse() override;
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR GetFlagResponse(::google::protobuf::internal::ConstantInitialized);
+
+  GetFlagResponse(const GetFlagResponse& from);
+  GetFlagResponse(GetFlagResponse&& from) noexcept
+    : GetFlagResponse() {
+    *this = ::std::move(from);
+  }
+
+  inline GetFlagResponse& operator=(const GetFlagResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GetFlagResponse& operator=(GetFlagResponse&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const GetFlagResponse& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const GetFlagResponse* internal_default_instance() {
+    return reinterpret_cast<const GetFlagResponse*>(
+               &_GetFlagResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    54;
+
+  friend void swap(GetFlagResponse& a, GetFlagResponse& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(GetFlagResponse* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(GetFlagResponse* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  GetFlagResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GetFlagResponse>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const GetFlagResponse& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const GetFlagResponse& from) {
+    GetFlagResponse::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GetFlagResponse* other);
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.GetFlagResponse";
+  }
+  protected:
+  explicit GetFlagResponse(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kFlagFieldNumber = 1,
+  };
+  // .oteldemo.Flag flag = 1;
+  bool has_flag() const;
+  void clear_flag() ;
+  const ::oteldemo::Flag& flag() const;
+  PROTOBUF_NODISCARD ::oteldemo::Flag* release_flag();
+  ::oteldemo::Flag* mutable_flag();
+  void set_allocated_flag(::oteldemo::Flag* value);
+  void unsafe_arena_set_allocated_flag(::oteldemo::Flag* value);
+  ::oteldemo::Flag* unsafe_arena_release_flag();
+
+  private:
+  const ::oteldemo::Flag& _internal_flag() const;
+  ::oteldemo::Flag* _internal_mutable_flag();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.GetFlagResponse)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    ::oteldemo::Flag* flag_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class CreateFlagRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.CreateFlagRequest) */ {
+ public:
+  inline CreateFlagRequest() : CreateFlagRequest(nullptr) {}
+  ~CreateFlagRequest() override;
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR CreateFlagRequest(::google::protobuf::internal::ConstantInitialized);
+
+  CreateFlagRequest(const CreateFlagRequest& from);
+  CreateFlagRequest(CreateFlagRequest&& from) noexcept
+    : CreateFlagRequest() {
+    *this = ::std::move(from);
+  }
+
+  inline CreateFlagRequest& operator=(const CreateFlagRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline CreateFlagRequest& operator=(CreateFlagRequest&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const CreateFlagRequest& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const CreateFlagRequest* internal_default_instance() {
+    return reinterpret_cast<const CreateFlagRequest*>(
+               &_CreateFlagRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    55;
+
+  friend void swap(CreateFlagRequest& a, CreateFlagRequest& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(CreateFlagRequest* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(CreateFlagRequest* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  CreateFlagRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<CreateFlagRequest>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const CreateFlagRequest& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const CreateFlagRequest& from) {
+    CreateFlagRequest::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(CreateFlagRequest* other);
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.CreateFlagRequest";
+  }
+  protected:
+  explicit CreateFlagRequest(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kNameFieldNumber = 1,
+    kDescriptionFieldNumber = 2,
+    kEnabledFieldNumber = 3,
+  };
+  // string name = 1;
+  void clear_name() ;
+  const std::string& name() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_name(Arg_&& arg, Args_... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* ptr);
+
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(
+      const std::string& value);
+  std::string* _internal_mutable_name();
+
+  public:
+  // string description = 2;
+  void clear_description() ;
+  const std::string& description() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_description(Arg_&& arg, Args_... args);
+  std::string* mutable_description();
+  PROTOBUF_NODISCARD std::string* release_description();
+  void set_allocated_description(std::string* ptr);
+
+  private:
+  const std::string& _internal_description() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_description(
+      const std::string& value);
+  std::string* _internal_mutable_description();
+
+  public:
+  // bool enabled = 3;
+  void clear_enabled() ;
+  bool enabled() const;
+  void set_enabled(bool value);
+
+  private:
+  bool _internal_enabled() const;
+  void _internal_set_enabled(bool value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.CreateFlagRequest)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<2, 3, 0, 50, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::google::protobuf::internal::ArenaStringPtr name_;
+    ::google::protobuf::internal::ArenaStringPtr description_;
+    bool enabled_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class CreateFlagResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.CreateFlagResponse) */ {
+ public:
+  inline CreateFlagResponse() : CreateFlagResponse(nullptr) {}
+  ~CreateFlagResponse() override;
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR CreateFlagResponse(::google::protobuf::internal::ConstantInitialized);
+
+  CreateFlagResponse(const CreateFlagResponse& from);
+  CreateFlagResponse(CreateFlagResponse&& from) noexcept
+    : CreateFlagResponse() {
+    *this = ::std::move(from);
+  }
+
+  inline CreateFlagResponse& operator=(const CreateFlagResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline CreateFlagResponse& operator=(CreateFlagResponse&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const CreateFlagResponse& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const CreateFlagResponse* internal_default_instance() {
+    return reinterpret_cast<const CreateFlagResponse*>(
+               &_CreateFlagResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    56;
+
+  friend void swap(CreateFlagResponse& a, CreateFlagResponse& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(CreateFlagResponse* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(CreateFlagResponse* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  CreateFlagResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<CreateFlagResponse>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const CreateFlagResponse& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const CreateFlagResponse& from) {
+    CreateFlagResponse::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(CreateFlagResponse* other);
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.CreateFlagResponse";
+  }
+  protected:
+  explicit CreateFlagResponse(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kFlagFieldNumber = 1,
+  };
+  // .oteldemo.Flag flag = 1;
+  bool has_flag() const;
+  void clear_flag() ;
+  const ::oteldemo::Flag& flag() const;
+  PROTOBUF_NODISCARD ::oteldemo::Flag* release_flag();
+  ::oteldemo::Flag* mutable_flag();
+  void set_allocated_flag(::oteldemo::Flag* value);
+  void unsafe_arena_set_allocated_flag(::oteldemo::Flag* value);
+  ::oteldemo::Flag* unsafe_arena_release_flag();
+
+  private:
+  const ::oteldemo::Flag& _internal_flag() const;
+  ::oteldemo::Flag* _internal_mutable_flag();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.CreateFlagResponse)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::google::protobuf::internal::HasBits<1> _has_bits_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    ::oteldemo::Flag* flag_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class UpdateFlagRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.UpdateFlagRequest) */ {
+ public:
+  inline UpdateFlagRequest() : UpdateFlagRequest(nullptr) {}
+  ~UpdateFlagRequest() override;
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR UpdateFlagRequest(::google::protobuf::internal::ConstantInitialized);
+
+  UpdateFlagRequest(const UpdateFlagRequest& from);
+  UpdateFlagRequest(UpdateFlagRequest&& from) noexcept
+    : UpdateFlagRequest() {
+    *this = ::std::move(from);
+  }
+
+  inline UpdateFlagRequest& operator=(const UpdateFlagRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline UpdateFlagRequest& operator=(UpdateFlagRequest&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const UpdateFlagRequest& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const UpdateFlagRequest* internal_default_instance() {
+    return reinterpret_cast<const UpdateFlagRequest*>(
+               &_UpdateFlagRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    57;
+
+  friend void swap(UpdateFlagRequest& a, UpdateFlagRequest& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(UpdateFlagRequest* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(UpdateFlagRequest* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  UpdateFlagRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<UpdateFlagRequest>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const UpdateFlagRequest& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const UpdateFlagRequest& from) {
+    UpdateFlagRequest::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(UpdateFlagRequest* other);
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.UpdateFlagRequest";
+  }
+  protected:
+  explicit UpdateFlagRequest(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kNameFieldNumber = 1,
+    kEnabledFieldNumber = 2,
+  };
+  // string name = 1;
+  void clear_name() ;
+  const std::string& name() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_name(Arg_&& arg, Args_... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* ptr);
+
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(
+      const std::string& value);
+  std::string* _internal_mutable_name();
+
+  public:
+  // bool enabled = 2;
+  void clear_enabled() ;
+  bool enabled() const;
+  void set_enabled(bool value);
+
+  private:
+  bool _internal_enabled() const;
+  void _internal_set_enabled(bool value);
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.UpdateFlagRequest)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<1, 2, 0, 39, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::google::protobuf::internal::ArenaStringPtr name_;
+    bool enabled_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class UpdateFlagResponse final :
+    public ::google::protobuf::internal::ZeroFieldsBase /* @@protoc_insertion_point(class_definition:oteldemo.UpdateFlagResponse) */ {
+ public:
+  inline UpdateFlagResponse() : UpdateFlagResponse(nullptr) {}
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR UpdateFlagResponse(::google::protobuf::internal::ConstantInitialized);
+
+  UpdateFlagResponse(const UpdateFlagResponse& from);
+  UpdateFlagResponse(UpdateFlagResponse&& from) noexcept
+    : UpdateFlagResponse() {
+    *this = ::std::move(from);
+  }
+
+  inline UpdateFlagResponse& operator=(const UpdateFlagResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline UpdateFlagResponse& operator=(UpdateFlagResponse&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const UpdateFlagResponse& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const UpdateFlagResponse* internal_default_instance() {
+    return reinterpret_cast<const UpdateFlagResponse*>(
+               &_UpdateFlagResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    58;
+
+  friend void swap(UpdateFlagResponse& a, UpdateFlagResponse& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(UpdateFlagResponse* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(UpdateFlagResponse* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  UpdateFlagResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<UpdateFlagResponse>(arena);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
+  inline void CopyFrom(const UpdateFlagResponse& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
+  void MergeFrom(const UpdateFlagResponse& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
+  }
+  public:
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.UpdateFlagResponse";
+  }
+  protected:
+  explicit UpdateFlagResponse(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // @@protoc_insertion_point(class_scope:oteldemo.UpdateFlagResponse)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class ListFlagsRequest final :
+    public ::google::protobuf::internal::ZeroFieldsBase /* @@protoc_insertion_point(class_definition:oteldemo.ListFlagsRequest) */ {
+ public:
+  inline ListFlagsRequest() : ListFlagsRequest(nullptr) {}
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR ListFlagsRequest(::google::protobuf::internal::ConstantInitialized);
+
+  ListFlagsRequest(const ListFlagsRequest& from);
+  ListFlagsRequest(ListFlagsRequest&& from) noexcept
+    : ListFlagsRequest() {
+    *this = ::std::move(from);
+  }
+
+  inline ListFlagsRequest& operator=(const ListFlagsRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline ListFlagsRequest& operator=(ListFlagsRequest&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const ListFlagsRequest& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const ListFlagsRequest* internal_default_instance() {
+    return reinterpret_cast<const ListFlagsRequest*>(
+               &_ListFlagsRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    59;
+
+  friend void swap(ListFlagsRequest& a, ListFlagsRequest& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(ListFlagsRequest* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(ListFlagsRequest* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  ListFlagsRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ListFlagsRequest>(arena);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
+  inline void CopyFrom(const ListFlagsRequest& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
+  void MergeFrom(const ListFlagsRequest& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
+  }
+  public:
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.ListFlagsRequest";
+  }
+  protected:
+  explicit ListFlagsRequest(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // @@protoc_insertion_point(class_scope:oteldemo.ListFlagsRequest)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class ListFlagsResponse final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.ListFlagsResponse) */ {
+ public:
+  inline ListFlagsResponse() : ListFlagsResponse(nullptr) {}
+  ~ListFlagsResponse() override;
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR ListFlagsResponse(::google::protobuf::internal::ConstantInitialized);
+
+  ListFlagsResponse(const ListFlagsResponse& from);
+  ListFlagsResponse(ListFlagsResponse&& from) noexcept
+    : ListFlagsResponse() {
+    *this = ::std::move(from);
+  }
+
+  inline ListFlagsResponse& operator=(const ListFlagsResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline ListFlagsResponse& operator=(ListFlagsResponse&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const ListFlagsResponse& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const ListFlagsResponse* internal_default_instance() {
+    return reinterpret_cast<const ListFlagsResponse*>(
+               &_ListFlagsResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    60;
+
+  friend void swap(ListFlagsResponse& a, ListFlagsResponse& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(ListFlagsResponse* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(ListFlagsResponse* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  ListFlagsResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ListFlagsResponse>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const ListFlagsResponse& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const ListFlagsResponse& from) {
+    ListFlagsResponse::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(ListFlagsResponse* other);
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.ListFlagsResponse";
+  }
+  protected:
+  explicit ListFlagsResponse(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kFlagFieldNumber = 1,
+  };
+  // repeated .oteldemo.Flag flag = 1;
+  int flag_size() const;
+  private:
+  int _internal_flag_size() const;
+
+  public:
+  void clear_flag() ;
+  ::oteldemo::Flag* mutable_flag(int index);
+  ::google::protobuf::RepeatedPtrField< ::oteldemo::Flag >*
+      mutable_flag();
+  private:
+  const ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>& _internal_flag() const;
+  ::google::protobuf::RepeatedPtrField<::oteldemo::Flag>* _internal_mutable_flag();
+  public:
+  const ::oteldemo::Flag& flag(int index) const;
+  ::oteldemo::Flag* add_flag();
+  const ::google::protobuf::RepeatedPtrField< ::oteldemo::Flag >&
+      flag() const;
+  // @@protoc_insertion_point(class_scope:oteldemo.ListFlagsResponse)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 1, 0, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::google::protobuf::RepeatedPtrField< ::oteldemo::Flag > flag_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class DeleteFlagRequest final :
+    public ::google::protobuf::Message /* @@protoc_insertion_point(class_definition:oteldemo.DeleteFlagRequest) */ {
+ public:
+  inline DeleteFlagRequest() : DeleteFlagRequest(nullptr) {}
+  ~DeleteFlagRequest() override;
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR DeleteFlagRequest(::google::protobuf::internal::ConstantInitialized);
+
+  DeleteFlagRequest(const DeleteFlagRequest& from);
+  DeleteFlagRequest(DeleteFlagRequest&& from) noexcept
+    : DeleteFlagRequest() {
+    *this = ::std::move(from);
+  }
+
+  inline DeleteFlagRequest& operator=(const DeleteFlagRequest& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline DeleteFlagRequest& operator=(DeleteFlagRequest&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const DeleteFlagRequest& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const DeleteFlagRequest* internal_default_instance() {
+    return reinterpret_cast<const DeleteFlagRequest*>(
+               &_DeleteFlagRequest_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    61;
+
+  friend void swap(DeleteFlagRequest& a, DeleteFlagRequest& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(DeleteFlagRequest* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(DeleteFlagRequest* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  DeleteFlagRequest* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<DeleteFlagRequest>(arena);
+  }
+  using ::google::protobuf::Message::CopyFrom;
+  void CopyFrom(const DeleteFlagRequest& from);
+  using ::google::protobuf::Message::MergeFrom;
+  void MergeFrom( const DeleteFlagRequest& from) {
+    DeleteFlagRequest::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::google::protobuf::Message& to_msg, const ::google::protobuf::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  ::size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::google::protobuf::internal::ParseContext* ctx) final;
+  ::uint8_t* _InternalSerialize(
+      ::uint8_t* target, ::google::protobuf::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::google::protobuf::Arena* arena);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(DeleteFlagRequest* other);
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.DeleteFlagRequest";
+  }
+  protected:
+  explicit DeleteFlagRequest(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kNameFieldNumber = 1,
+  };
+  // string name = 1;
+  void clear_name() ;
+  const std::string& name() const;
+  template <typename Arg_ = const std::string&, typename... Args_>
+  void set_name(Arg_&& arg, Args_... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* ptr);
+
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(
+      const std::string& value);
+  std::string* _internal_mutable_name();
+
+  public:
+  // @@protoc_insertion_point(class_scope:oteldemo.DeleteFlagRequest)
+ private:
+  class _Internal;
+
+  friend class ::google::protobuf::internal::TcParser;
+  static const ::google::protobuf::internal::TcParseTable<0, 1, 0, 39, 2> _table_;
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::google::protobuf::internal::ArenaStringPtr name_;
+    mutable ::google::protobuf::internal::CachedSize _cached_size_;
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_demo_2eproto;
+};// -------------------------------------------------------------------
+
+class DeleteFlagResponse final :
+    public ::google::protobuf::internal::ZeroFieldsBase /* @@protoc_insertion_point(class_definition:oteldemo.DeleteFlagResponse) */ {
+ public:
+  inline DeleteFlagResponse() : DeleteFlagResponse(nullptr) {}
+  template<typename = void>
+  explicit PROTOBUF_CONSTEXPR DeleteFlagResponse(::google::protobuf::internal::ConstantInitialized);
+
+  DeleteFlagResponse(const DeleteFlagResponse& from);
+  DeleteFlagResponse(DeleteFlagResponse&& from) noexcept
+    : DeleteFlagResponse() {
+    *this = ::std::move(from);
+  }
+
+  inline DeleteFlagResponse& operator=(const DeleteFlagResponse& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline DeleteFlagResponse& operator=(DeleteFlagResponse&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::google::protobuf::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::google::protobuf::UnknownFieldSet>(::google::protobuf::UnknownFieldSet::default_instance);
+  }
+  inline ::google::protobuf::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::google::protobuf::UnknownFieldSet>();
+  }
+
+  static const ::google::protobuf::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::google::protobuf::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::google::protobuf::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const DeleteFlagResponse& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const DeleteFlagResponse* internal_default_instance() {
+    return reinterpret_cast<const DeleteFlagResponse*>(
+               &_DeleteFlagResponse_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    62;
+
+  friend void swap(DeleteFlagResponse& a, DeleteFlagResponse& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(DeleteFlagResponse* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::google::protobuf::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(DeleteFlagResponse* other) {
+    if (other == this) return;
+    ABSL_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  DeleteFlagResponse* New(::google::protobuf::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<DeleteFlagResponse>(arena);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::CopyFrom;
+  inline void CopyFrom(const DeleteFlagResponse& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::CopyImpl(*this, from);
+  }
+  using ::google::protobuf::internal::ZeroFieldsBase::MergeFrom;
+  void MergeFrom(const DeleteFlagResponse& from) {
+    ::google::protobuf::internal::ZeroFieldsBase::MergeImpl(*this, from);
+  }
+  public:
+
+  private:
+  friend class ::google::protobuf::internal::AnyMetadata;
+  static ::absl::string_view FullMessageName() {
+    return "oteldemo.DeleteFlagResponse";
+  }
+  protected:
+  explicit DeleteFlagResponse(::google::protobuf::Arena* arena);
+  public:
+
+  static const ClassData _class_data_;
+  const ::google::protobuf::Message::ClassData*GetClassData() const final;
+
+  ::google::protobuf::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  // @@protoc_insertion_point(class_scope:oteldemo.DeleteFlagResponse)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::google::protobuf::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    PROTOBUF_TSAN_DECLARE_MEMBER
+  };
+  friend struct ::TableStruct_demo_2eproto;
+};
+
+// ===================================================================
+
+
+
+
+// ===================================================================
+
+
+#ifdef __GNUC__
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wstrict-aliasing"
+#endif  // __GNUC__
+// -------------------------------------------------------------------
+
+// CartItem
+
+// string product_id = 1;
+inline void CartItem::clear_product_id() {
+  _impl_.product_id_.ClearToEmpty();
+}
+inline const std::string& CartItem::product_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.CartItem.product_id)
+  return _internal_product_id();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void CartItem::set_product_id(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.CartItem.product_id)
+}
+inline std::string* CartItem::mutable_product_id() {
+  std::string* _s = _internal_mutable_product_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.CartItem.product_id)
+  return _s;
+}
+inline const std::string& CartItem::_internal_product_id() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.product_id_.Get();
+}
+inline void CartItem::_internal_set_product_id(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.product_id_.Set(value, GetArenaForAllocation());
+}
+inline std::string* CartItem::_internal_mutable_product_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  return _impl_.product_id_.Mutable( GetArenaForAllocation());
+}
+inline std::string* CartItem::release_product_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.CartItem.product_id)
+  return _impl_.product_id_.Release();
+}
+inline void CartItem::set_allocated_product_id(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.product_id_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.product_id_.IsDefault()) {
+          _impl_.product_id_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.CartItem.product_id)
+}
+
+// int32 quantity = 2;
+inline void CartItem::clear_quantity() {
+  _impl_.quantity_ = 0;
+}
+inline ::int32_t CartItem::quantity() const {
+  // @@protoc_insertion_point(field_get:oteldemo.CartItem.quantity)
+  return _internal_quantity();
+}
+inline void CartItem::set_quantity(::int32_t value) {
+  _internal_set_quantity(value);
+  // @@protoc_insertion_point(field_set:oteldemo.CartItem.quantity)
+}
+inline ::int32_t CartItem::_internal_quantity() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.quantity_;
+}
+inline void CartItem::_internal_set_quantity(::int32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.quantity_ = value;
+}
+
+// -------------------------------------------------------------------
+
+// AddItemRequest
+
+// string user_id = 1;
+inline void AddItemRequest::clear_user_id() {
+  _impl_.user_id_.ClearToEmpty();
+}
+inline const std::string& AddItemRequest::user_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.AddItemRequest.user_id)
+  return _internal_user_id();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void AddItemRequest::set_user_id(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.AddItemRequest.user_id)
+}
+inline std::string* AddItemRequest::mutable_user_id() {
+  std::string* _s = _internal_mutable_user_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.AddItemRequest.user_id)
+  return _s;
+}
+inline const std::string& AddItemRequest::_internal_user_id() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.user_id_.Get();
+}
+inline void AddItemRequest::_internal_set_user_id(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.user_id_.Set(value, GetArenaForAllocation());
+}
+inline std::string* AddItemRequest::_internal_mutable_user_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  return _impl_.user_id_.Mutable( GetArenaForAllocation());
+}
+inline std::string* AddItemRequest::release_user_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.AddItemRequest.user_id)
+  return _impl_.user_id_.Release();
+}
+inline void AddItemRequest::set_allocated_user_id(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.user_id_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.user_id_.IsDefault()) {
+          _impl_.user_id_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.AddItemRequest.user_id)
+}
+
+// .oteldemo.CartItem item = 2;
+inline bool AddItemRequest::has_item() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.item_ != nullptr);
+  return value;
+}
+inline void AddItemRequest::clear_item() {
+  if (_impl_.item_ != nullptr) _impl_.item_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::oteldemo::CartItem& AddItemRequest::_internal_item() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  const ::oteldemo::CartItem* p = _impl_.item_;
+  return p != nullptr ? *p : reinterpret_cast<const ::oteldemo::CartItem&>(::oteldemo::_CartItem_default_instance_);
+}
+inline const ::oteldemo::CartItem& AddItemRequest::item() const {
+  // @@protoc_insertion_point(field_get:oteldemo.AddItemRequest.item)
+  return _internal_item();
+}
+inline void AddItemRequest::unsafe_arena_set_allocated_item(::oteldemo::CartItem* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.item_);
+  }
+  _impl_.item_ = reinterpret_cast<::oteldemo::CartItem*>(value);
+  if (value != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:oteldemo.AddItemRequest.item)
+}
+inline ::oteldemo::CartItem* AddItemRequest::release_item() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::oteldemo::CartItem* released = _impl_.item_;
+  _impl_.item_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old = reinterpret_cast<::google::protobuf::MessageLite*>(released);
+  released = ::google::protobuf::internal::DuplicateIfNonNull(released);
+  if (GetArenaForAllocation() == nullptr) {
+    delete old;
+  }
+#else   // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    released = ::google::protobuf::internal::DuplicateIfNonNull(released);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return released;
+}
+inline ::oteldemo::CartItem* AddItemRequest::unsafe_arena_release_item() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.AddItemRequest.item)
+
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::oteldemo::CartItem* temp = _impl_.item_;
+  _impl_.item_ = nullptr;
+  return temp;
+}
+inline ::oteldemo::CartItem* AddItemRequest::_internal_mutable_item() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_._has_bits_[0] |= 0x00000001u;
+  if (_impl_.item_ == nullptr) {
+    auto* p = CreateMaybeMessage<::oteldemo::CartItem>(GetArenaForAllocation());
+    _impl_.item_ = reinterpret_cast<::oteldemo::CartItem*>(p);
+  }
+  return _impl_.item_;
+}
+inline ::oteldemo::CartItem* AddItemRequest::mutable_item() {
+  ::oteldemo::CartItem* _msg = _internal_mutable_item();
+  // @@protoc_insertion_point(field_mutable:oteldemo.AddItemRequest.item)
+  return _msg;
+}
+inline void AddItemRequest::set_allocated_item(::oteldemo::CartItem* value) {
+  ::google::protobuf::Arena* message_arena = GetArenaForAllocation();
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  if (message_arena == nullptr) {
+    delete reinterpret_cast<::oteldemo::CartItem*>(_impl_.item_);
+  }
+
+  if (value != nullptr) {
+    ::google::protobuf::Arena* submessage_arena =
+        ::google::protobuf::Arena::InternalGetOwningArena(reinterpret_cast<::oteldemo::CartItem*>(value));
+    if (message_arena != submessage_arena) {
+      value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+
+  _impl_.item_ = reinterpret_cast<::oteldemo::CartItem*>(value);
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.AddItemRequest.item)
+}
+
+// -------------------------------------------------------------------
+
+// EmptyCartRequest
+
+// string user_id = 1;
+inline void EmptyCartRequest::clear_user_id() {
+  _impl_.user_id_.ClearToEmpty();
+}
+inline const std::string& EmptyCartRequest::user_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.EmptyCartRequest.user_id)
+  return _internal_user_id();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void EmptyCartRequest::set_user_id(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.EmptyCartRequest.user_id)
+}
+inline std::string* EmptyCartRequest::mutable_user_id() {
+  std::string* _s = _internal_mutable_user_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.EmptyCartRequest.user_id)
+  return _s;
+}
+inline const std::string& EmptyCartRequest::_internal_user_id() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.user_id_.Get();
+}
+inline void EmptyCartRequest::_internal_set_user_id(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.user_id_.Set(value, GetArenaForAllocation());
+}
+inline std::string* EmptyCartRequest::_internal_mutable_user_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  return _impl_.user_id_.Mutable( GetArenaForAllocation());
+}
+inline std::string* EmptyCartRequest::release_user_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.EmptyCartRequest.user_id)
+  return _impl_.user_id_.Release();
+}
+inline void EmptyCartRequest::set_allocated_user_id(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.user_id_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.user_id_.IsDefault()) {
+          _impl_.user_id_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.EmptyCartRequest.user_id)
+}
+
+// -------------------------------------------------------------------
+
+// GetCartRequest
+
+// string user_id = 1;
+inline void GetCartRequest::clear_user_id() {
+  _impl_.user_id_.ClearToEmpty();
+}
+inline const std::string& GetCartRequest::user_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetCartRequest.user_id)
+  return _internal_user_id();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void GetCartRequest::set_user_id(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.GetCartRequest.user_id)
+}
+inline std::string* GetCartRequest::mutable_user_id() {
+  std::string* _s = _internal_mutable_user_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetCartRequest.user_id)
+  return _s;
+}
+inline const std::string& GetCartRequest::_internal_user_id() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.user_id_.Get();
+}
+inline void GetCartRequest::_internal_set_user_id(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.user_id_.Set(value, GetArenaForAllocation());
+}
+inline std::string* GetCartRequest::_internal_mutable_user_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  return _impl_.user_id_.Mutable( GetArenaForAllocation());
+}
+inline std::string* GetCartRequest::release_user_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.GetCartRequest.user_id)
+  return _impl_.user_id_.Release();
+}
+inline void GetCartRequest::set_allocated_user_id(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.user_id_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.user_id_.IsDefault()) {
+          _impl_.user_id_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetCartRequest.user_id)
+}
+
+// -------------------------------------------------------------------
+
+// Cart
+
+// string user_id = 1;
+inline void Cart::clear_user_id() {
+  _impl_.user_id_.ClearToEmpty();
+}
+inline const std::string& Cart::user_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.Cart.user_id)
+  return _internal_user_id();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void Cart::set_user_id(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.Cart.user_id)
+}
+inline std::string* Cart::mutable_user_id() {
+  std::string* _s = _internal_mutable_user_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.Cart.user_id)
+  return _s;
+}
+inline const std::string& Cart::_internal_user_id() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.user_id_.Get();
+}
+inline void Cart::_internal_set_user_id(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.user_id_.Set(value, GetArenaForAllocation());
+}
+inline std::string* Cart::_internal_mutable_user_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  return _impl_.user_id_.Mutable( GetArenaForAllocation());
+}
+inline std::string* Cart::release_user_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.Cart.user_id)
+  return _impl_.user_id_.Release();
+}
+inline void Cart::set_allocated_user_id(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.user_id_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.user_id_.IsDefault()) {
+          _impl_.user_id_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.Cart.user_id)
+}
+
+// repeated .oteldemo.CartItem items = 2;
+inline int Cart::_internal_items_size() const {
+  return _internal_items().size();
+}
+inline int Cart::items_size() const {
+  return _internal_items_size();
+}
+inline void Cart::clear_items() {
+  _internal_mutable_items()->Clear();
+}
+inline ::oteldemo::CartItem* Cart::mutable_items(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.Cart.items)
+  return _internal_mutable_items()->Mutable(index);
+}
+inline ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >*
+Cart::mutable_items() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.Cart.items)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_items();
+}
+inline const ::oteldemo::CartItem& Cart::items(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.Cart.items)
+    return _internal_items().Get(index);
+}
+inline ::oteldemo::CartItem* Cart::add_items() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ::oteldemo::CartItem* _add = _internal_mutable_items()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.Cart.items)
+  return _add;
+}
+inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >&
+Cart::items() const {
+  // @@protoc_insertion_point(field_list:oteldemo.Cart.items)
+  return _internal_items();
+}
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>&
+Cart::_internal_items() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.items_;
+}
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>*
+Cart::_internal_mutable_items() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.items_;
+}
+
+// -------------------------------------------------------------------
+
+// Empty
+
+// -------------------------------------------------------------------
+
+// ListRecommendationsRequest
+
+// string user_id = 1;
+inline void ListRecommendationsRequest::clear_user_id() {
+  _impl_.user_id_.ClearToEmpty();
+}
+inline const std::string& ListRecommendationsRequest::user_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsRequest.user_id)
+  return _internal_user_id();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void ListRecommendationsRequest::set_user_id(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsRequest.user_id)
+}
+inline std::string* ListRecommendationsRequest::mutable_user_id() {
+  std::string* _s = _internal_mutable_user_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsRequest.user_id)
+  return _s;
+}
+inline const std::string& ListRecommendationsRequest::_internal_user_id() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.user_id_.Get();
+}
+inline void ListRecommendationsRequest::_internal_set_user_id(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.user_id_.Set(value, GetArenaForAllocation());
+}
+inline std::string* ListRecommendationsRequest::_internal_mutable_user_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  return _impl_.user_id_.Mutable( GetArenaForAllocation());
+}
+inline std::string* ListRecommendationsRequest::release_user_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.ListRecommendationsRequest.user_id)
+  return _impl_.user_id_.Release();
+}
+inline void ListRecommendationsRequest::set_allocated_user_id(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.user_id_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.user_id_.IsDefault()) {
+          _impl_.user_id_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.ListRecommendationsRequest.user_id)
+}
+
+// repeated string product_ids = 2;
+inline int ListRecommendationsRequest::_internal_product_ids_size() const {
+  return _internal_product_ids().size();
+}
+inline int ListRecommendationsRequest::product_ids_size() const {
+  return _internal_product_ids_size();
+}
+inline void ListRecommendationsRequest::clear_product_ids() {
+  _internal_mutable_product_ids()->Clear();
+}
+inline std::string* ListRecommendationsRequest::add_product_ids() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  std::string* _s = _internal_mutable_product_ids()->Add();
+  // @@protoc_insertion_point(field_add_mutable:oteldemo.ListRecommendationsRequest.product_ids)
+  return _s;
+}
+inline const std::string& ListRecommendationsRequest::product_ids(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsRequest.product_ids)
+  return _internal_product_ids().Get(index);
+}
+inline std::string* ListRecommendationsRequest::mutable_product_ids(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsRequest.product_ids)
+  return _internal_mutable_product_ids()->Mutable(index);
+}
+inline void ListRecommendationsRequest::set_product_ids(int index, const std::string& value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline void ListRecommendationsRequest::set_product_ids(int index, std::string&& value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline void ListRecommendationsRequest::set_product_ids(int index, const char* value) {
+  ABSL_DCHECK(value != nullptr);
+  _internal_mutable_product_ids()->Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline void ListRecommendationsRequest::set_product_ids(int index, const char* value,
+                              std::size_t size) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(
+      reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline void ListRecommendationsRequest::set_product_ids(int index, absl::string_view value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(value.data(),
+                                                     value.size());
+  // @@protoc_insertion_point(field_set_string_piece:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline void ListRecommendationsRequest::add_product_ids(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(value);
+  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline void ListRecommendationsRequest::add_product_ids(std::string&& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add(std::move(value));
+  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline void ListRecommendationsRequest::add_product_ids(const char* value) {
+  ABSL_DCHECK(value != nullptr);
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline void ListRecommendationsRequest::add_product_ids(const char* value, std::size_t size) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(
+      reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline void ListRecommendationsRequest::add_product_ids(absl::string_view value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(value.data(), value.size());
+  // @@protoc_insertion_point(field_add_string_piece:oteldemo.ListRecommendationsRequest.product_ids)
+}
+inline const ::google::protobuf::RepeatedPtrField<std::string>&
+ListRecommendationsRequest::product_ids() const {
+  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsRequest.product_ids)
+  return _internal_product_ids();
+}
+inline ::google::protobuf::RepeatedPtrField<std::string>* ListRecommendationsRequest::mutable_product_ids() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsRequest.product_ids)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_product_ids();
+}
+inline const ::google::protobuf::RepeatedPtrField<std::string>&
+ListRecommendationsRequest::_internal_product_ids() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.product_ids_;
+}
+inline ::google::protobuf::RepeatedPtrField<std::string>*
+ListRecommendationsRequest::_internal_mutable_product_ids() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.product_ids_;
+}
+
+// -------------------------------------------------------------------
+
+// ListRecommendationsResponse
 
-// ===================================================================
+// repeated string product_ids = 1;
+inline int ListRecommendationsResponse::_internal_product_ids_size() const {
+  return _internal_product_ids().size();
+}
+inline int ListRecommendationsResponse::product_ids_size() const {
+  return _internal_product_ids_size();
+}
+inline void ListRecommendationsResponse::clear_product_ids() {
+  _internal_mutable_product_ids()->Clear();
+}
+inline std::string* ListRecommendationsResponse::add_product_ids() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  std::string* _s = _internal_mutable_product_ids()->Add();
+  // @@protoc_insertion_point(field_add_mutable:oteldemo.ListRecommendationsResponse.product_ids)
+  return _s;
+}
+inline const std::string& ListRecommendationsResponse::product_ids(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsResponse.product_ids)
+  return _internal_product_ids().Get(index);
+}
+inline std::string* ListRecommendationsResponse::mutable_product_ids(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsResponse.product_ids)
+  return _internal_mutable_product_ids()->Mutable(index);
+}
+inline void ListRecommendationsResponse::set_product_ids(int index, const std::string& value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline void ListRecommendationsResponse::set_product_ids(int index, std::string&& value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline void ListRecommendationsResponse::set_product_ids(int index, const char* value) {
+  ABSL_DCHECK(value != nullptr);
+  _internal_mutable_product_ids()->Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline void ListRecommendationsResponse::set_product_ids(int index, const char* value,
+                              std::size_t size) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(
+      reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline void ListRecommendationsResponse::set_product_ids(int index, absl::string_view value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(value.data(),
+                                                     value.size());
+  // @@protoc_insertion_point(field_set_string_piece:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline void ListRecommendationsResponse::add_product_ids(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(value);
+  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline void ListRecommendationsResponse::add_product_ids(std::string&& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add(std::move(value));
+  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline void ListRecommendationsResponse::add_product_ids(const char* value) {
+  ABSL_DCHECK(value != nullptr);
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline void ListRecommendationsResponse::add_product_ids(const char* value, std::size_t size) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(
+      reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline void ListRecommendationsResponse::add_product_ids(absl::string_view value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(value.data(), value.size());
+  // @@protoc_insertion_point(field_add_string_piece:oteldemo.ListRecommendationsResponse.product_ids)
+}
+inline const ::google::protobuf::RepeatedPtrField<std::string>&
+ListRecommendationsResponse::product_ids() const {
+  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsResponse.product_ids)
+  return _internal_product_ids();
+}
+inline ::google::protobuf::RepeatedPtrField<std::string>* ListRecommendationsResponse::mutable_product_ids() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsResponse.product_ids)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_product_ids();
+}
+inline const ::google::protobuf::RepeatedPtrField<std::string>&
+ListRecommendationsResponse::_internal_product_ids() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.product_ids_;
+}
+inline ::google::protobuf::RepeatedPtrField<std::string>*
+ListRecommendationsResponse::_internal_mutable_product_ids() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.product_ids_;
+}
 
+// -------------------------------------------------------------------
 
+// ListRecommendationsBatchRequest
 
+// repeated .oteldemo.ListRecommendationsRequest requests = 1;
+inline int ListRecommendationsBatchRequest::_internal_requests_size() const {
+  return _internal_requests().size();
+}
+inline int ListRecommendationsBatchRequest::requests_size() const {
+  return _internal_requests_size();
+}
+inline void ListRecommendationsBatchRequest::clear_requests() {
+  _internal_mutable_requests()->Clear();
+}
+inline ::oteldemo::ListRecommendationsRequest* ListRecommendationsBatchRequest::mutable_requests(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsBatchRequest.requests)
+  return _internal_mutable_requests()->Mutable(index);
+}
+inline ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsRequest >*
+ListRecommendationsBatchRequest::mutable_requests() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsBatchRequest.requests)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_requests();
+}
+inline const ::oteldemo::ListRecommendationsRequest& ListRecommendationsBatchRequest::requests(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsBatchRequest.requests)
+    return _internal_requests().Get(index);
+}
+inline ::oteldemo::ListRecommendationsRequest* ListRecommendationsBatchRequest::add_requests() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ::oteldemo::ListRecommendationsRequest* _add = _internal_mutable_requests()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsBatchRequest.requests)
+  return _add;
+}
+inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsRequest >&
+ListRecommendationsBatchRequest::requests() const {
+  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsBatchRequest.requests)
+  return _internal_requests();
+}
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>&
+ListRecommendationsBatchRequest::_internal_requests() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.requests_;
+}
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsRequest>*
+ListRecommendationsBatchRequest::_internal_mutable_requests() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.requests_;
+}
 
-// ===================================================================
+// -------------------------------------------------------------------
 
+// ListRecommendationsBatchResponse
+
+// repeated .oteldemo.ListRecommendationsResponse responses = 1;
+inline int ListRecommendationsBatchResponse::_internal_responses_size() const {
+  return _internal_responses().size();
+}
+inline int ListRecommendationsBatchResponse::responses_size() const {
+  return _internal_responses_size();
+}
+inline void ListRecommendationsBatchResponse::clear_responses() {
+  _internal_mutable_responses()->Clear();
+}
+inline ::oteldemo::ListRecommendationsResponse* ListRecommendationsBatchResponse::mutable_responses(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsBatchResponse.responses)
+  return _internal_mutable_responses()->Mutable(index);
+}
+inline ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsResponse >*
+ListRecommendationsBatchResponse::mutable_responses() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsBatchResponse.responses)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_responses();
+}
+inline const ::oteldemo::ListRecommendationsResponse& ListRecommendationsBatchResponse::responses(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsBatchResponse.responses)
+    return _internal_responses().Get(index);
+}
+inline ::oteldemo::ListRecommendationsResponse* ListRecommendationsBatchResponse::add_responses() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ::oteldemo::ListRecommendationsResponse* _add = _internal_mutable_responses()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsBatchResponse.responses)
+  return _add;
+}
+inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::ListRecommendationsResponse >&
+ListRecommendationsBatchResponse::responses() const {
+  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsBatchResponse.responses)
+  return _internal_responses();
+}
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>&
+ListRecommendationsBatchResponse::_internal_responses() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.responses_;
+}
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::ListRecommendationsResponse>*
+ListRecommendationsBatchResponse::_internal_mutable_responses() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.responses_;
+}
 
-#ifdef __GNUC__
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wstrict-aliasing"
-#endif  // __GNUC__
 // -------------------------------------------------------------------
 
-// CartItem
+// Product
 
-// string product_id = 1;
-inline void CartItem::clear_product_id() {
-  _impl_.product_id_.ClearToEmpty();
+// string id = 1;
+inline void Product::clear_id() {
+  _impl_.id_.ClearToEmpty();
 }
-inline const std::string& CartItem::product_id() const {
-  // @@protoc_insertion_point(field_get:oteldemo.CartItem.product_id)
-  return _internal_product_id();
+inline const std::string& Product::id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.Product.id)
+  return _internal_id();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void CartItem::set_product_id(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void Product::set_id(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.CartItem.product_id)
+  _impl_.id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.Product.id)
+}
+inline std::string* Product::mutable_id() {
+  std::string* _s = _internal_mutable_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.Product.id)
+  return _s;
+}
+inline const std::string& Product::_internal_id() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.id_.Get();
+}
+inline void Product::_internal_set_id(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.id_.Set(value, GetArenaForAllocation());
+}
+inline std::string* Product::_internal_mutable_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  return _impl_.id_.Mutable( GetArenaForAllocation());
+}
+inline std::string* Product::release_id() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.Product.id)
+  return _impl_.id_.Release();
+}
+inline void Product::set_allocated_id(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.id_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.id_.IsDefault()) {
+          _impl_.id_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.Product.id)
+}
+
+// string name = 2;
+inline void Product::clear_name() {
+  _impl_.name_.ClearToEmpty();
+}
+inline const std::string& Product::name() const {
+  // @@protoc_insertion_point(field_get:oteldemo.Product.name)
+  return _internal_name();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void Product::set_name(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.name_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.Product.name)
+}
+inline std::string* Product::mutable_name() {
+  std::string* _s = _internal_mutable_name();
+  // @@protoc_insertion_point(field_mutable:oteldemo.Product.name)
+  return _s;
+}
+inline const std::string& Product::_internal_name() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.name_.Get();
+}
+inline void Product::_internal_set_name(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* Product::_internal_mutable_name() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  return _impl_.name_.Mutable( GetArenaForAllocation());
+}
+inline std::string* Product::release_name() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.Product.name)
+  return _impl_.name_.Release();
+}
+inline void Product::set_allocated_name(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.name_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.name_.IsDefault()) {
+          _impl_.name_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.Product.name)
+}
+
+// string description = 3;
+inline void Product::clear_description() {
+  _impl_.description_.ClearToEmpty();
+}
+inline const std::string& Product::description() const {
+  // @@protoc_insertion_point(field_get:oteldemo.Product.description)
+  return _internal_description();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void Product::set_description(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.description_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.Product.description)
 }
-inline std::string* CartItem::mutable_product_id() {
-  std::string* _s = _internal_mutable_product_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.CartItem.product_id)
+inline std::string* Product::mutable_description() {
+  std::string* _s = _internal_mutable_description();
+  // @@protoc_insertion_point(field_mutable:oteldemo.Product.description)
   return _s;
 }
-inline const std::string& CartItem::_internal_product_id() const {
+inline const std::string& Product::_internal_description() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.product_id_.Get();
+  return _impl_.description_.Get();
 }
-inline void CartItem::_internal_set_product_id(const std::string& value) {
+inline void Product::_internal_set_description(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.product_id_.Set(value, GetArenaForAllocation());
+  _impl_.description_.Set(value, GetArenaForAllocation());
 }
-inline std::string* CartItem::_internal_mutable_product_id() {
+inline std::string* Product::_internal_mutable_description() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.product_id_.Mutable( GetArenaForAllocation());
+  return _impl_.description_.Mutable( GetArenaForAllocation());
 }
-inline std::string* CartItem::release_product_id() {
+inline std::string* Product::release_description() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.CartItem.product_id)
-  return _impl_.product_id_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.Product.description)
+  return _impl_.description_.Release();
 }
-inline void CartItem::set_allocated_product_id(std::string* value) {
+inline void Product::set_allocated_description(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.product_id_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.description_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.product_id_.IsDefault()) {
-          _impl_.product_id_.Set("", GetArenaForAllocation());
+        if (_impl_.description_.IsDefault()) {
+          _impl_.description_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.CartItem.product_id)
-}
-
-// int32 quantity = 2;
-inline void CartItem::clear_quantity() {
-  _impl_.quantity_ = 0;
-}
-inline ::int32_t CartItem::quantity() const {
-  // @@protoc_insertion_point(field_get:oteldemo.CartItem.quantity)
-  return _internal_quantity();
-}
-inline void CartItem::set_quantity(::int32_t value) {
-  _internal_set_quantity(value);
-  // @@protoc_insertion_point(field_set:oteldemo.CartItem.quantity)
-}
-inline ::int32_t CartItem::_internal_quantity() const {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.quantity_;
-}
-inline void CartItem::_internal_set_quantity(::int32_t value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ;
-  _impl_.quantity_ = value;
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.Product.description)
 }
 
-// -------------------------------------------------------------------
-
-// AddItemRequest
-
-// string user_id = 1;
-inline void AddItemRequest::clear_user_id() {
-  _impl_.user_id_.ClearToEmpty();
+// string picture = 4;
+inline void Product::clear_picture() {
+  _impl_.picture_.ClearToEmpty();
 }
-inline const std::string& AddItemRequest::user_id() const {
-  // @@protoc_insertion_point(field_get:oteldemo.AddItemRequest.user_id)
-  return _internal_user_id();
+inline const std::string& Product::picture() const {
+  // @@protoc_insertion_point(field_get:oteldemo.Product.picture)
+  return _internal_picture();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void AddItemRequest::set_user_id(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void Product::set_picture(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.AddItemRequest.user_id)
+  _impl_.picture_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.Product.picture)
 }
-inline std::string* AddItemRequest::mutable_user_id() {
-  std::string* _s = _internal_mutable_user_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.AddItemRequest.user_id)
+inline std::string* Product::mutable_picture() {
+  std::string* _s = _internal_mutable_picture();
+  // @@protoc_insertion_point(field_mutable:oteldemo.Product.picture)
   return _s;
 }
-inline const std::string& AddItemRequest::_internal_user_id() const {
+inline const std::string& Product::_internal_picture() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.user_id_.Get();
+  return _impl_.picture_.Get();
 }
-inline void AddItemRequest::_internal_set_user_id(const std::string& value) {
+inline void Product::_internal_set_picture(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.user_id_.Set(value, GetArenaForAllocation());
+  _impl_.picture_.Set(value, GetArenaForAllocation());
 }
-inline std::string* AddItemRequest::_internal_mutable_user_id() {
+inline std::string* Product::_internal_mutable_picture() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.user_id_.Mutable( GetArenaForAllocation());
+  return _impl_.picture_.Mutable( GetArenaForAllocation());
 }
-inline std::string* AddItemRequest::release_user_id() {
+inline std::string* Product::release_picture() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.AddItemRequest.user_id)
-  return _impl_.user_id_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.Product.picture)
+  return _impl_.picture_.Release();
 }
-inline void AddItemRequest::set_allocated_user_id(std::string* value) {
+inline void Product::set_allocated_picture(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.user_id_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.picture_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.user_id_.IsDefault()) {
-          _impl_.user_id_.Set("", GetArenaForAllocation());
+        if (_impl_.picture_.IsDefault()) {
+          _impl_.picture_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.AddItemRequest.user_id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.Product.picture)
 }
 
-// .oteldemo.CartItem item = 2;
-inline bool AddItemRequest::has_item() const {
+// .oteldemo.Money price_usd = 5;
+inline bool Product::has_price_usd() const {
   bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
-  PROTOBUF_ASSUME(!value || _impl_.item_ != nullptr);
+  PROTOBUF_ASSUME(!value || _impl_.price_usd_ != nullptr);
   return value;
 }
-inline void AddItemRequest::clear_item() {
-  if (_impl_.item_ != nullptr) _impl_.item_->Clear();
+inline void Product::clear_price_usd() {
+  if (_impl_.price_usd_ != nullptr) _impl_.price_usd_->Clear();
   _impl_._has_bits_[0] &= ~0x00000001u;
 }
-inline const ::oteldemo::CartItem& AddItemRequest::_internal_item() const {
+inline const ::oteldemo::Money& Product::_internal_price_usd() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  const ::oteldemo::CartItem* p = _impl_.item_;
-  return p != nullptr ? *p : reinterpret_cast<const ::oteldemo::CartItem&>(::oteldemo::_CartItem_default_instance_);
+  const ::oteldemo::Money* p = _impl_.price_usd_;
+  return p != nullptr ? *p : reinterpret_cast<const ::oteldemo::Money&>(::oteldemo::_Money_default_instance_);
 }
-inline const ::oteldemo::CartItem& AddItemRequest::item() const {
-  // @@protoc_insertion_point(field_get:oteldemo.AddItemRequest.item)
-  return _internal_item();
+inline const ::oteldemo::Money& Product::price_usd() const {
+  // @@protoc_insertion_point(field_get:oteldemo.Product.price_usd)
+  return _internal_price_usd();
 }
-inline void AddItemRequest::unsafe_arena_set_allocated_item(::oteldemo::CartItem* value) {
+inline void Product::unsafe_arena_set_allocated_price_usd(::oteldemo::Money* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   if (GetArenaForAllocation() == nullptr) {
-    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.item_);
+    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.price_usd_);
   }
-  _impl_.item_ = reinterpret_cast<::oteldemo::CartItem*>(value);
+  _impl_.price_usd_ = reinterpret_cast<::oteldemo::Money*>(value);
   if (value != nullptr) {
     _impl_._has_bits_[0] |= 0x00000001u;
   } else {
     _impl_._has_bits_[0] &= ~0x00000001u;
   }
-  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:oteldemo.AddItemRequest.item)
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:oteldemo.Product.price_usd)
 }
-inline ::oteldemo::CartItem* AddItemRequest::release_item() {
+inline ::oteldemo::Money* Product::release_price_usd() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
 
   _impl_._has_bits_[0] &= ~0x00000001u;
-  ::oteldemo::CartItem* released = _impl_.item_;
-  _impl_.item_ = nullptr;
+  ::oteldemo::Money* released = _impl_.price_usd_;
+  _impl_.price_usd_ = nullptr;
 #ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
   auto* old = reinterpret_cast<::google::protobuf::MessageLite*>(released);
   released = ::google::protobuf::internal::DuplicateIfNonNull(released);
@@ -9215,39 +12421,39 @@ inline ::oteldemo::CartItem* AddItemRequest::release_item() {
 #endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
   return released;
 }
-inline ::oteldemo::CartItem* AddItemRequest::unsafe_arena_release_item() {
+inline ::oteldemo::Money* Product::unsafe_arena_release_price_usd() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.AddItemRequest.item)
+  // @@protoc_insertion_point(field_release:oteldemo.Product.price_usd)
 
   _impl_._has_bits_[0] &= ~0x00000001u;
-  ::oteldemo::CartItem* temp = _impl_.item_;
-  _impl_.item_ = nullptr;
+  ::oteldemo::Money* temp = _impl_.price_usd_;
+  _impl_.price_usd_ = nullptr;
   return temp;
 }
-inline ::oteldemo::CartItem* AddItemRequest::_internal_mutable_item() {
+inline ::oteldemo::Money* Product::_internal_mutable_price_usd() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   _impl_._has_bits_[0] |= 0x00000001u;
-  if (_impl_.item_ == nullptr) {
-    auto* p = CreateMaybeMessage<::oteldemo::CartItem>(GetArenaForAllocation());
-    _impl_.item_ = reinterpret_cast<::oteldemo::CartItem*>(p);
+  if (_impl_.price_usd_ == nullptr) {
+    auto* p = CreateMaybeMessage<::oteldemo::Money>(GetArenaForAllocation());
+    _impl_.price_usd_ = reinterpret_cast<::oteldemo::Money*>(p);
   }
-  return _impl_.item_;
+  return _impl_.price_usd_;
 }
-inline ::oteldemo::CartItem* AddItemRequest::mutable_item() {
-  ::oteldemo::CartItem* _msg = _internal_mutable_item();
-  // @@protoc_insertion_point(field_mutable:oteldemo.AddItemRequest.item)
+inline ::oteldemo::Money* Product::mutable_price_usd() {
+  ::oteldemo::Money* _msg = _internal_mutable_price_usd();
+  // @@protoc_insertion_point(field_mutable:oteldemo.Product.price_usd)
   return _msg;
 }
-inline void AddItemRequest::set_allocated_item(::oteldemo::CartItem* value) {
+inline void Product::set_allocated_price_usd(::oteldemo::Money* value) {
   ::google::protobuf::Arena* message_arena = GetArenaForAllocation();
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   if (message_arena == nullptr) {
-    delete reinterpret_cast<::oteldemo::CartItem*>(_impl_.item_);
+    delete reinterpret_cast<::oteldemo::Money*>(_impl_.price_usd_);
   }
 
   if (value != nullptr) {
     ::google::protobuf::Arena* submessage_arena =
-        ::google::protobuf::Arena::InternalGetOwningArena(reinterpret_cast<::oteldemo::CartItem*>(value));
+        ::google::protobuf::Arena::InternalGetOwningArena(reinterpret_cast<::oteldemo::Money*>(value));
     if (message_arena != submessage_arena) {
       value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
     }
@@ -9256,1288 +12462,1414 @@ inline void AddItemRequest::set_allocated_item(::oteldemo::CartItem* value) {
     _impl_._has_bits_[0] &= ~0x00000001u;
   }
 
-  _impl_.item_ = reinterpret_cast<::oteldemo::CartItem*>(value);
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.AddItemRequest.item)
+  _impl_.price_usd_ = reinterpret_cast<::oteldemo::Money*>(value);
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.Product.price_usd)
+}
+
+// repeated string categories = 6;
+inline int Product::_internal_categories_size() const {
+  return _internal_categories().size();
+}
+inline int Product::categories_size() const {
+  return _internal_categories_size();
+}
+inline void Product::clear_categories() {
+  _internal_mutable_categories()->Clear();
+}
+inline std::string* Product::add_categories() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  std::string* _s = _internal_mutable_categories()->Add();
+  // @@protoc_insertion_point(field_add_mutable:oteldemo.Product.categories)
+  return _s;
+}
+inline const std::string& Product::categories(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.Product.categories)
+  return _internal_categories().Get(index);
+}
+inline std::string* Product::mutable_categories(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.Product.categories)
+  return _internal_mutable_categories()->Mutable(index);
+}
+inline void Product::set_categories(int index, const std::string& value) {
+  _internal_mutable_categories()->Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:oteldemo.Product.categories)
+}
+inline void Product::set_categories(int index, std::string&& value) {
+  _internal_mutable_categories()->Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:oteldemo.Product.categories)
+}
+inline void Product::set_categories(int index, const char* value) {
+  ABSL_DCHECK(value != nullptr);
+  _internal_mutable_categories()->Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:oteldemo.Product.categories)
+}
+inline void Product::set_categories(int index, const char* value,
+                              std::size_t size) {
+  _internal_mutable_categories()->Mutable(index)->assign(
+      reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:oteldemo.Product.categories)
+}
+inline void Product::set_categories(int index, absl::string_view value) {
+  _internal_mutable_categories()->Mutable(index)->assign(value.data(),
+                                                     value.size());
+  // @@protoc_insertion_point(field_set_string_piece:oteldemo.Product.categories)
+}
+inline void Product::add_categories(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_categories()->Add()->assign(value);
+  // @@protoc_insertion_point(field_add:oteldemo.Product.categories)
+}
+inline void Product::add_categories(std::string&& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_categories()->Add(std::move(value));
+  // @@protoc_insertion_point(field_add:oteldemo.Product.categories)
+}
+inline void Product::add_categories(const char* value) {
+  ABSL_DCHECK(value != nullptr);
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_categories()->Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:oteldemo.Product.categories)
+}
+inline void Product::add_categories(const char* value, std::size_t size) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_categories()->Add()->assign(
+      reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:oteldemo.Product.categories)
+}
+inline void Product::add_categories(absl::string_view value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_categories()->Add()->assign(value.data(), value.size());
+  // @@protoc_insertion_point(field_add_string_piece:oteldemo.Product.categories)
+}
+inline const ::google::protobuf::RepeatedPtrField<std::string>&
+Product::categories() const {
+  // @@protoc_insertion_point(field_list:oteldemo.Product.categories)
+  return _internal_categories();
+}
+inline ::google::protobuf::RepeatedPtrField<std::string>* Product::mutable_categories() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.Product.categories)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_categories();
+}
+inline const ::google::protobuf::RepeatedPtrField<std::string>&
+Product::_internal_categories() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.categories_;
+}
+inline ::google::protobuf::RepeatedPtrField<std::string>*
+Product::_internal_mutable_categories() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.categories_;
 }
 
 // -------------------------------------------------------------------
 
-// EmptyCartRequest
+// ListProductsResponse
 
-// string user_id = 1;
-inline void EmptyCartRequest::clear_user_id() {
-  _impl_.user_id_.ClearToEmpty();
-}
-inline const std::string& EmptyCartRequest::user_id() const {
-  // @@protoc_insertion_point(field_get:oteldemo.EmptyCartRequest.user_id)
-  return _internal_user_id();
+// repeated .oteldemo.Product products = 1;
+inline int ListProductsResponse::_internal_products_size() const {
+  return _internal_products().size();
 }
-template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void EmptyCartRequest::set_user_id(Arg_&& arg,
-                                                     Args_... args) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ;
-  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.EmptyCartRequest.user_id)
+inline int ListProductsResponse::products_size() const {
+  return _internal_products_size();
 }
-inline std::string* EmptyCartRequest::mutable_user_id() {
-  std::string* _s = _internal_mutable_user_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.EmptyCartRequest.user_id)
-  return _s;
+inline void ListProductsResponse::clear_products() {
+  _internal_mutable_products()->Clear();
 }
-inline const std::string& EmptyCartRequest::_internal_user_id() const {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.user_id_.Get();
+inline ::oteldemo::Product* ListProductsResponse::mutable_products(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.ListProductsResponse.products)
+  return _internal_mutable_products()->Mutable(index);
 }
-inline void EmptyCartRequest::_internal_set_user_id(const std::string& value) {
+inline ::google::protobuf::RepeatedPtrField< ::oteldemo::Product >*
+ListProductsResponse::mutable_products() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListProductsResponse.products)
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ;
-  _impl_.user_id_.Set(value, GetArenaForAllocation());
+  return _internal_mutable_products();
 }
-inline std::string* EmptyCartRequest::_internal_mutable_user_id() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ;
-  return _impl_.user_id_.Mutable( GetArenaForAllocation());
+inline const ::oteldemo::Product& ListProductsResponse::products(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.ListProductsResponse.products)
+    return _internal_products().Get(index);
 }
-inline std::string* EmptyCartRequest::release_user_id() {
+inline ::oteldemo::Product* ListProductsResponse::add_products() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.EmptyCartRequest.user_id)
-  return _impl_.user_id_.Release();
+  ::oteldemo::Product* _add = _internal_mutable_products()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.ListProductsResponse.products)
+  return _add;
 }
-inline void EmptyCartRequest::set_allocated_user_id(std::string* value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.user_id_.SetAllocated(value, GetArenaForAllocation());
-  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.user_id_.IsDefault()) {
-          _impl_.user_id_.Set("", GetArenaForAllocation());
-        }
-  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.EmptyCartRequest.user_id)
+inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::Product >&
+ListProductsResponse::products() const {
+  // @@protoc_insertion_point(field_list:oteldemo.ListProductsResponse.products)
+  return _internal_products();
+}
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>&
+ListProductsResponse::_internal_products() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.products_;
+}
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::Product>*
+ListProductsResponse::_internal_mutable_products() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.products_;
 }
 
 // -------------------------------------------------------------------
 
-// GetCartRequest
+// GetProductRequest
 
-// string user_id = 1;
-inline void GetCartRequest::clear_user_id() {
-  _impl_.user_id_.ClearToEmpty();
+// string id = 1;
+inline void GetProductRequest::clear_id() {
+  _impl_.id_.ClearToEmpty();
 }
-inline const std::string& GetCartRequest::user_id() const {
-  // @@protoc_insertion_point(field_get:oteldemo.GetCartRequest.user_id)
-  return _internal_user_id();
+inline const std::string& GetProductRequest::id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductRequest.id)
+  return _internal_id();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void GetCartRequest::set_user_id(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void GetProductRequest::set_id(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.GetCartRequest.user_id)
+  _impl_.id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductRequest.id)
 }
-inline std::string* GetCartRequest::mutable_user_id() {
-  std::string* _s = _internal_mutable_user_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.GetCartRequest.user_id)
+inline std::string* GetProductRequest::mutable_id() {
+  std::string* _s = _internal_mutable_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductRequest.id)
   return _s;
 }
-inline const std::string& GetCartRequest::_internal_user_id() const {
+inline const std::string& GetProductRequest::_internal_id() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.user_id_.Get();
+  return _impl_.id_.Get();
 }
-inline void GetCartRequest::_internal_set_user_id(const std::string& value) {
+inline void GetProductRequest::_internal_set_id(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.user_id_.Set(value, GetArenaForAllocation());
+  _impl_.id_.Set(value, GetArenaForAllocation());
 }
-inline std::string* GetCartRequest::_internal_mutable_user_id() {
+inline std::string* GetProductRequest::_internal_mutable_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.user_id_.Mutable( GetArenaForAllocation());
+  return _impl_.id_.Mutable( GetArenaForAllocation());
 }
-inline std::string* GetCartRequest::release_user_id() {
+inline std::string* GetProductRequest::release_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.GetCartRequest.user_id)
-  return _impl_.user_id_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.GetProductRequest.id)
+  return _impl_.id_.Release();
 }
-inline void GetCartRequest::set_allocated_user_id(std::string* value) {
+inline void GetProductRequest::set_allocated_id(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.user_id_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.id_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.user_id_.IsDefault()) {
-          _impl_.user_id_.Set("", GetArenaForAllocation());
+        if (_impl_.id_.IsDefault()) {
+          _impl_.id_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetCartRequest.user_id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetProductRequest.id)
 }
 
 // -------------------------------------------------------------------
 
-// Cart
+// SearchProductsRequest
 
-// string user_id = 1;
-inline void Cart::clear_user_id() {
-  _impl_.user_id_.ClearToEmpty();
+// string query = 1;
+inline void SearchProductsRequest::clear_query() {
+  _impl_.query_.ClearToEmpty();
 }
-inline const std::string& Cart::user_id() const {
-  // @@protoc_insertion_point(field_get:oteldemo.Cart.user_id)
-  return _internal_user_id();
+inline const std::string& SearchProductsRequest::query() const {
+  // @@protoc_insertion_point(field_get:oteldemo.SearchProductsRequest.query)
+  return _internal_query();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void Cart::set_user_id(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void SearchProductsRequest::set_query(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.Cart.user_id)
+  _impl_.query_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.SearchProductsRequest.query)
 }
-inline std::string* Cart::mutable_user_id() {
-  std::string* _s = _internal_mutable_user_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.Cart.user_id)
+inline std::string* SearchProductsRequest::mutable_query() {
+  std::string* _s = _internal_mutable_query();
+  // @@protoc_insertion_point(field_mutable:oteldemo.SearchProductsRequest.query)
   return _s;
 }
-inline const std::string& Cart::_internal_user_id() const {
+inline const std::string& SearchProductsRequest::_internal_query() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.user_id_.Get();
+  return _impl_.query_.Get();
 }
-inline void Cart::_internal_set_user_id(const std::string& value) {
+inline void SearchProductsRequest::_internal_set_query(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.user_id_.Set(value, GetArenaForAllocation());
+  _impl_.query_.Set(value, GetArenaForAllocation());
 }
-inline std::string* Cart::_internal_mutable_user_id() {
+inline std::string* SearchProductsRequest::_internal_mutable_query() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.user_id_.Mutable( GetArenaForAllocation());
+  return _impl_.query_.Mutable( GetArenaForAllocation());
 }
-inline std::string* Cart::release_user_id() {
+inline std::string* SearchProductsRequest::release_query() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.Cart.user_id)
-  return _impl_.user_id_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.SearchProductsRequest.query)
+  return _impl_.query_.Release();
 }
-inline void Cart::set_allocated_user_id(std::string* value) {
+inline void SearchProductsRequest::set_allocated_query(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.user_id_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.query_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.user_id_.IsDefault()) {
-          _impl_.user_id_.Set("", GetArenaForAllocation());
+        if (_impl_.query_.IsDefault()) {
+          _impl_.query_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.Cart.user_id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.SearchProductsRequest.query)
 }
 
-// repeated .oteldemo.CartItem items = 2;
-inline int Cart::_internal_items_size() const {
-  return _internal_items().size();
+// -------------------------------------------------------------------
+
+// SearchProductsResponse
+
+// repeated .oteldemo.Product results = 1;
+inline int SearchProductsResponse::_internal_results_size() const {
+  return _internal_results().size();
 }
-inline int Cart::items_size() const {
-  return _internal_items_size();
+inline int SearchProductsResponse::results_size() const {
+  return _internal_results_size();
 }
-inline void Cart::clear_items() {
-  _internal_mutable_items()->Clear();
+inline void SearchProductsResponse::clear_results() {
+  _internal_mutable_results()->Clear();
 }
-inline ::oteldemo::CartItem* Cart::mutable_items(int index) {
-  // @@protoc_insertion_point(field_mutable:oteldemo.Cart.items)
-  return _internal_mutable_items()->Mutable(index);
+inline ::oteldemo::Product* SearchProductsResponse::mutable_results(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.SearchProductsResponse.results)
+  return _internal_mutable_results()->Mutable(index);
 }
-inline ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >*
-Cart::mutable_items() {
-  // @@protoc_insertion_point(field_mutable_list:oteldemo.Cart.items)
+inline ::google::protobuf::RepeatedPtrField< ::oteldemo::Product >*
+SearchProductsResponse::mutable_results() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.SearchProductsResponse.results)
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_items();
+  return _internal_mutable_results();
 }
-inline const ::oteldemo::CartItem& Cart::items(int index) const {
-  // @@protoc_insertion_point(field_get:oteldemo.Cart.items)
-    return _internal_items().Get(index);
+inline const ::oteldemo::Product& SearchProductsResponse::results(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.SearchProductsResponse.results)
+    return _internal_results().Get(index);
 }
-inline ::oteldemo::CartItem* Cart::add_items() {
+inline ::oteldemo::Product* SearchProductsResponse::add_results() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ::oteldemo::CartItem* _add = _internal_mutable_items()->Add();
-  // @@protoc_insertion_point(field_add:oteldemo.Cart.items)
+  ::oteldemo::Product* _add = _internal_mutable_results()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.SearchProductsResponse.results)
   return _add;
 }
-inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::CartItem >&
-Cart::items() const {
-  // @@protoc_insertion_point(field_list:oteldemo.Cart.items)
-  return _internal_items();
+inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::Product >&
+SearchProductsResponse::results() const {
+  // @@protoc_insertion_point(field_list:oteldemo.SearchProductsResponse.results)
+  return _internal_results();
 }
-inline const ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>&
-Cart::_internal_items() const {
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>&
+SearchProductsResponse::_internal_results() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.items_;
+  return _impl_.results_;
 }
-inline ::google::protobuf::RepeatedPtrField<::oteldemo::CartItem>*
-Cart::_internal_mutable_items() {
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::Product>*
+SearchProductsResponse::_internal_mutable_results() {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.items_;
+  return &_impl_.results_;
 }
 
 // -------------------------------------------------------------------
 
-// Empty
-
-// -------------------------------------------------------------------
-
-// ListRecommendationsRequest
+// ProductReview
 
-// string user_id = 1;
-inline void ListRecommendationsRequest::clear_user_id() {
-  _impl_.user_id_.ClearToEmpty();
+// string username = 1;
+inline void ProductReview::clear_username() {
+  _impl_.username_.ClearToEmpty();
 }
-inline const std::string& ListRecommendationsRequest::user_id() const {
-  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsRequest.user_id)
-  return _internal_user_id();
+inline const std::string& ProductReview::username() const {
+  // @@protoc_insertion_point(field_get:oteldemo.ProductReview.username)
+  return _internal_username();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void ListRecommendationsRequest::set_user_id(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void ProductReview::set_username(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.user_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsRequest.user_id)
+  _impl_.username_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.ProductReview.username)
 }
-inline std::string* ListRecommendationsRequest::mutable_user_id() {
-  std::string* _s = _internal_mutable_user_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsRequest.user_id)
+inline std::string* ProductReview::mutable_username() {
+  std::string* _s = _internal_mutable_username();
+  // @@protoc_insertion_point(field_mutable:oteldemo.ProductReview.username)
   return _s;
 }
-inline const std::string& ListRecommendationsRequest::_internal_user_id() const {
+inline const std::string& ProductReview::_internal_username() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.user_id_.Get();
+  return _impl_.username_.Get();
 }
-inline void ListRecommendationsRequest::_internal_set_user_id(const std::string& value) {
+inline void ProductReview::_internal_set_username(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.user_id_.Set(value, GetArenaForAllocation());
+  _impl_.username_.Set(value, GetArenaForAllocation());
 }
-inline std::string* ListRecommendationsRequest::_internal_mutable_user_id() {
+inline std::string* ProductReview::_internal_mutable_username() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.user_id_.Mutable( GetArenaForAllocation());
+  return _impl_.username_.Mutable( GetArenaForAllocation());
 }
-inline std::string* ListRecommendationsRequest::release_user_id() {
+inline std::string* ProductReview::release_username() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.ListRecommendationsRequest.user_id)
-  return _impl_.user_id_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.ProductReview.username)
+  return _impl_.username_.Release();
 }
-inline void ListRecommendationsRequest::set_allocated_user_id(std::string* value) {
+inline void ProductReview::set_allocated_username(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.user_id_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.username_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.user_id_.IsDefault()) {
-          _impl_.user_id_.Set("", GetArenaForAllocation());
+        if (_impl_.username_.IsDefault()) {
+          _impl_.username_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.ListRecommendationsRequest.user_id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.ProductReview.username)
 }
 
-// repeated string product_ids = 2;
-inline int ListRecommendationsRequest::_internal_product_ids_size() const {
-  return _internal_product_ids().size();
-}
-inline int ListRecommendationsRequest::product_ids_size() const {
-  return _internal_product_ids_size();
+// string description = 2;
+inline void ProductReview::clear_description() {
+  _impl_.description_.ClearToEmpty();
 }
-inline void ListRecommendationsRequest::clear_product_ids() {
-  _internal_mutable_product_ids()->Clear();
+inline const std::string& ProductReview::description() const {
+  // @@protoc_insertion_point(field_get:oteldemo.ProductReview.description)
+  return _internal_description();
 }
-inline std::string* ListRecommendationsRequest::add_product_ids() {
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void ProductReview::set_description(Arg_&& arg,
+                                                     Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  std::string* _s = _internal_mutable_product_ids()->Add();
-  // @@protoc_insertion_point(field_add_mutable:oteldemo.ListRecommendationsRequest.product_ids)
+  ;
+  _impl_.description_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.ProductReview.description)
+}
+inline std::string* ProductReview::mutable_description() {
+  std::string* _s = _internal_mutable_description();
+  // @@protoc_insertion_point(field_mutable:oteldemo.ProductReview.description)
   return _s;
 }
-inline const std::string& ListRecommendationsRequest::product_ids(int index) const {
-  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsRequest.product_ids)
-  return _internal_product_ids().Get(index);
+inline const std::string& ProductReview::_internal_description() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.description_.Get();
 }
-inline std::string* ListRecommendationsRequest::mutable_product_ids(int index) {
-  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsRequest.product_ids)
-  return _internal_mutable_product_ids()->Mutable(index);
+inline void ProductReview::_internal_set_description(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.description_.Set(value, GetArenaForAllocation());
 }
-inline void ListRecommendationsRequest::set_product_ids(int index, const std::string& value) {
-  _internal_mutable_product_ids()->Mutable(index)->assign(value);
-  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsRequest.product_ids)
+inline std::string* ProductReview::_internal_mutable_description() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  return _impl_.description_.Mutable( GetArenaForAllocation());
 }
-inline void ListRecommendationsRequest::set_product_ids(int index, std::string&& value) {
-  _internal_mutable_product_ids()->Mutable(index)->assign(std::move(value));
-  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsRequest.product_ids)
+inline std::string* ProductReview::release_description() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.ProductReview.description)
+  return _impl_.description_.Release();
 }
-inline void ListRecommendationsRequest::set_product_ids(int index, const char* value) {
-  ABSL_DCHECK(value != nullptr);
-  _internal_mutable_product_ids()->Mutable(index)->assign(value);
-  // @@protoc_insertion_point(field_set_char:oteldemo.ListRecommendationsRequest.product_ids)
+inline void ProductReview::set_allocated_description(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.description_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.description_.IsDefault()) {
+          _impl_.description_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.ProductReview.description)
 }
-inline void ListRecommendationsRequest::set_product_ids(int index, const char* value,
-                              std::size_t size) {
-  _internal_mutable_product_ids()->Mutable(index)->assign(
-      reinterpret_cast<const char*>(value), size);
-  // @@protoc_insertion_point(field_set_pointer:oteldemo.ListRecommendationsRequest.product_ids)
+
+// string score = 3;
+inline void ProductReview::clear_score() {
+  _impl_.score_.ClearToEmpty();
 }
-inline void ListRecommendationsRequest::set_product_ids(int index, absl::string_view value) {
-  _internal_mutable_product_ids()->Mutable(index)->assign(value.data(),
-                                                     value.size());
-  // @@protoc_insertion_point(field_set_string_piece:oteldemo.ListRecommendationsRequest.product_ids)
+inline const std::string& ProductReview::score() const {
+  // @@protoc_insertion_point(field_get:oteldemo.ProductReview.score)
+  return _internal_score();
 }
-inline void ListRecommendationsRequest::add_product_ids(const std::string& value) {
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void ProductReview::set_score(Arg_&& arg,
+                                                     Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_product_ids()->Add()->assign(value);
-  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsRequest.product_ids)
+  ;
+  _impl_.score_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.ProductReview.score)
 }
-inline void ListRecommendationsRequest::add_product_ids(std::string&& value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_product_ids()->Add(std::move(value));
-  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsRequest.product_ids)
+inline std::string* ProductReview::mutable_score() {
+  std::string* _s = _internal_mutable_score();
+  // @@protoc_insertion_point(field_mutable:oteldemo.ProductReview.score)
+  return _s;
 }
-inline void ListRecommendationsRequest::add_product_ids(const char* value) {
-  ABSL_DCHECK(value != nullptr);
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_product_ids()->Add()->assign(value);
-  // @@protoc_insertion_point(field_add_char:oteldemo.ListRecommendationsRequest.product_ids)
+inline const std::string& ProductReview::_internal_score() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.score_.Get();
 }
-inline void ListRecommendationsRequest::add_product_ids(const char* value, std::size_t size) {
+inline void ProductReview::_internal_set_score(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_product_ids()->Add()->assign(
-      reinterpret_cast<const char*>(value), size);
-  // @@protoc_insertion_point(field_add_pointer:oteldemo.ListRecommendationsRequest.product_ids)
+  ;
+  _impl_.score_.Set(value, GetArenaForAllocation());
 }
-inline void ListRecommendationsRequest::add_product_ids(absl::string_view value) {
+inline std::string* ProductReview::_internal_mutable_score() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_product_ids()->Add()->assign(value.data(), value.size());
-  // @@protoc_insertion_point(field_add_string_piece:oteldemo.ListRecommendationsRequest.product_ids)
-}
-inline const ::google::protobuf::RepeatedPtrField<std::string>&
-ListRecommendationsRequest::product_ids() const {
-  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsRequest.product_ids)
-  return _internal_product_ids();
+  ;
+  return _impl_.score_.Mutable( GetArenaForAllocation());
 }
-inline ::google::protobuf::RepeatedPtrField<std::string>* ListRecommendationsRequest::mutable_product_ids() {
-  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsRequest.product_ids)
+inline std::string* ProductReview::release_score() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_product_ids();
-}
-inline const ::google::protobuf::RepeatedPtrField<std::string>&
-ListRecommendationsRequest::_internal_product_ids() const {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.product_ids_;
+  // @@protoc_insertion_point(field_release:oteldemo.ProductReview.score)
+  return _impl_.score_.Release();
 }
-inline ::google::protobuf::RepeatedPtrField<std::string>*
-ListRecommendationsRequest::_internal_mutable_product_ids() {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.product_ids_;
+inline void ProductReview::set_allocated_score(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.score_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.score_.IsDefault()) {
+          _impl_.score_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.ProductReview.score)
 }
 
 // -------------------------------------------------------------------
 
-// ListRecommendationsResponse
+// GetProductReviewsRequest
 
-// repeated string product_ids = 1;
-inline int ListRecommendationsResponse::_internal_product_ids_size() const {
-  return _internal_product_ids().size();
-}
-inline int ListRecommendationsResponse::product_ids_size() const {
-  return _internal_product_ids_size();
-}
-inline void ListRecommendationsResponse::clear_product_ids() {
-  _internal_mutable_product_ids()->Clear();
-}
-inline std::string* ListRecommendationsResponse::add_product_ids() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  std::string* _s = _internal_mutable_product_ids()->Add();
-  // @@protoc_insertion_point(field_add_mutable:oteldemo.ListRecommendationsResponse.product_ids)
-  return _s;
-}
-inline const std::string& ListRecommendationsResponse::product_ids(int index) const {
-  // @@protoc_insertion_point(field_get:oteldemo.ListRecommendationsResponse.product_ids)
-  return _internal_product_ids().Get(index);
-}
-inline std::string* ListRecommendationsResponse::mutable_product_ids(int index) {
-  // @@protoc_insertion_point(field_mutable:oteldemo.ListRecommendationsResponse.product_ids)
-  return _internal_mutable_product_ids()->Mutable(index);
-}
-inline void ListRecommendationsResponse::set_product_ids(int index, const std::string& value) {
-  _internal_mutable_product_ids()->Mutable(index)->assign(value);
-  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsResponse.product_ids)
+// string product_id = 1;
+inline void GetProductReviewsRequest::clear_product_id() {
+  _impl_.product_id_.ClearToEmpty();
 }
-inline void ListRecommendationsResponse::set_product_ids(int index, std::string&& value) {
-  _internal_mutable_product_ids()->Mutable(index)->assign(std::move(value));
-  // @@protoc_insertion_point(field_set:oteldemo.ListRecommendationsResponse.product_ids)
+inline const std::string& GetProductReviewsRequest::product_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsRequest.product_id)
+  return _internal_product_id();
 }
-inline void ListRecommendationsResponse::set_product_ids(int index, const char* value) {
-  ABSL_DCHECK(value != nullptr);
-  _internal_mutable_product_ids()->Mutable(index)->assign(value);
-  // @@protoc_insertion_point(field_set_char:oteldemo.ListRecommendationsResponse.product_ids)
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void GetProductReviewsRequest::set_product_id(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewsRequest.product_id)
 }
-inline void ListRecommendationsResponse::set_product_ids(int index, const char* value,
-                              std::size_t size) {
-  _internal_mutable_product_ids()->Mutable(index)->assign(
-      reinterpret_cast<const char*>(value), size);
-  // @@protoc_insertion_point(field_set_pointer:oteldemo.ListRecommendationsResponse.product_ids)
+inline std::string* GetProductReviewsRequest::mutable_product_id() {
+  std::string* _s = _internal_mutable_product_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewsRequest.product_id)
+  return _s;
 }
-inline void ListRecommendationsResponse::set_product_ids(int index, absl::string_view value) {
-  _internal_mutable_product_ids()->Mutable(index)->assign(value.data(),
-                                                     value.size());
-  // @@protoc_insertion_point(field_set_string_piece:oteldemo.ListRecommendationsResponse.product_ids)
+inline const std::string& GetProductReviewsRequest::_internal_product_id() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.product_id_.Get();
 }
-inline void ListRecommendationsResponse::add_product_ids(const std::string& value) {
+inline void GetProductReviewsRequest::_internal_set_product_id(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_product_ids()->Add()->assign(value);
-  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsResponse.product_ids)
+  ;
+  _impl_.product_id_.Set(value, GetArenaForAllocation());
 }
-inline void ListRecommendationsResponse::add_product_ids(std::string&& value) {
+inline std::string* GetProductReviewsRequest::_internal_mutable_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_product_ids()->Add(std::move(value));
-  // @@protoc_insertion_point(field_add:oteldemo.ListRecommendationsResponse.product_ids)
+  ;
+  return _impl_.product_id_.Mutable( GetArenaForAllocation());
 }
-inline void ListRecommendationsResponse::add_product_ids(const char* value) {
-  ABSL_DCHECK(value != nullptr);
+inline std::string* GetProductReviewsRequest::release_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_product_ids()->Add()->assign(value);
-  // @@protoc_insertion_point(field_add_char:oteldemo.ListRecommendationsResponse.product_ids)
+  // @@protoc_insertion_point(field_release:oteldemo.GetProductReviewsRequest.product_id)
+  return _impl_.product_id_.Release();
 }
-inline void ListRecommendationsResponse::add_product_ids(const char* value, std::size_t size) {
+inline void GetProductReviewsRequest::set_allocated_product_id(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_product_ids()->Add()->assign(
-      reinterpret_cast<const char*>(value), size);
-  // @@protoc_insertion_point(field_add_pointer:oteldemo.ListRecommendationsResponse.product_ids)
+  _impl_.product_id_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.product_id_.IsDefault()) {
+          _impl_.product_id_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetProductReviewsRequest.product_id)
 }
-inline void ListRecommendationsResponse::add_product_ids(absl::string_view value) {
+
+// -------------------------------------------------------------------
+
+// GetProductReviewsResponse
+
+// repeated .oteldemo.ProductReview product_reviews = 1;
+inline int GetProductReviewsResponse::_internal_product_reviews_size() const {
+  return _internal_product_reviews().size();
+}
+inline int GetProductReviewsResponse::product_reviews_size() const {
+  return _internal_product_reviews_size();
+}
+inline void GetProductReviewsResponse::clear_product_reviews() {
+  _internal_mutable_product_reviews()->Clear();
+}
+inline ::oteldemo::ProductReview* GetProductReviewsResponse::mutable_product_reviews(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewsResponse.product_reviews)
+  return _internal_mutable_product_reviews()->Mutable(index);
+}
+inline ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview >*
+GetProductReviewsResponse::mutable_product_reviews() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.GetProductReviewsResponse.product_reviews)
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_product_ids()->Add()->assign(value.data(), value.size());
-  // @@protoc_insertion_point(field_add_string_piece:oteldemo.ListRecommendationsResponse.product_ids)
+  return _internal_mutable_product_reviews();
 }
-inline const ::google::protobuf::RepeatedPtrField<std::string>&
-ListRecommendationsResponse::product_ids() const {
-  // @@protoc_insertion_point(field_list:oteldemo.ListRecommendationsResponse.product_ids)
-  return _internal_product_ids();
+inline const ::oteldemo::ProductReview& GetProductReviewsResponse::product_reviews(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsResponse.product_reviews)
+    return _internal_product_reviews().Get(index);
 }
-inline ::google::protobuf::RepeatedPtrField<std::string>* ListRecommendationsResponse::mutable_product_ids() {
-  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListRecommendationsResponse.product_ids)
+inline ::oteldemo::ProductReview* GetProductReviewsResponse::add_product_reviews() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_product_ids();
+  ::oteldemo::ProductReview* _add = _internal_mutable_product_reviews()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.GetProductReviewsResponse.product_reviews)
+  return _add;
 }
-inline const ::google::protobuf::RepeatedPtrField<std::string>&
-ListRecommendationsResponse::_internal_product_ids() const {
+inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview >&
+GetProductReviewsResponse::product_reviews() const {
+  // @@protoc_insertion_point(field_list:oteldemo.GetProductReviewsResponse.product_reviews)
+  return _internal_product_reviews();
+}
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReview>&
+GetProductReviewsResponse::_internal_product_reviews() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.product_ids_;
+  return _impl_.product_reviews_;
 }
-inline ::google::protobuf::RepeatedPtrField<std::string>*
-ListRecommendationsResponse::_internal_mutable_product_ids() {
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReview>*
+GetProductReviewsResponse::_internal_mutable_product_reviews() {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.product_ids_;
+  return &_impl_.product_reviews_;
 }
 
 // -------------------------------------------------------------------
 
-// Product
+// GetAverageProductReviewScoreRequest
 
-// string id = 1;
-inline void Product::clear_id() {
-  _impl_.id_.ClearToEmpty();
+// string product_id = 1;
+inline void GetAverageProductReviewScoreRequest::clear_product_id() {
+  _impl_.product_id_.ClearToEmpty();
 }
-inline const std::string& Product::id() const {
-  // @@protoc_insertion_point(field_get:oteldemo.Product.id)
-  return _internal_id();
+inline const std::string& GetAverageProductReviewScoreRequest::product_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetAverageProductReviewScoreRequest.product_id)
+  return _internal_product_id();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void Product::set_id(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void GetAverageProductReviewScoreRequest::set_product_id(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.Product.id)
+  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.GetAverageProductReviewScoreRequest.product_id)
 }
-inline std::string* Product::mutable_id() {
-  std::string* _s = _internal_mutable_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.Product.id)
+inline std::string* GetAverageProductReviewScoreRequest::mutable_product_id() {
+  std::string* _s = _internal_mutable_product_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetAverageProductReviewScoreRequest.product_id)
   return _s;
 }
-inline const std::string& Product::_internal_id() const {
+inline const std::string& GetAverageProductReviewScoreRequest::_internal_product_id() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.id_.Get();
+  return _impl_.product_id_.Get();
 }
-inline void Product::_internal_set_id(const std::string& value) {
+inline void GetAverageProductReviewScoreRequest::_internal_set_product_id(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.id_.Set(value, GetArenaForAllocation());
+  _impl_.product_id_.Set(value, GetArenaForAllocation());
 }
-inline std::string* Product::_internal_mutable_id() {
+inline std::string* GetAverageProductReviewScoreRequest::_internal_mutable_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.id_.Mutable( GetArenaForAllocation());
+  return _impl_.product_id_.Mutable( GetArenaForAllocation());
 }
-inline std::string* Product::release_id() {
+inline std::string* GetAverageProductReviewScoreRequest::release_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.Product.id)
-  return _impl_.id_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.GetAverageProductReviewScoreRequest.product_id)
+  return _impl_.product_id_.Release();
 }
-inline void Product::set_allocated_id(std::string* value) {
+inline void GetAverageProductReviewScoreRequest::set_allocated_product_id(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.id_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.product_id_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.id_.IsDefault()) {
-          _impl_.id_.Set("", GetArenaForAllocation());
+        if (_impl_.product_id_.IsDefault()) {
+          _impl_.product_id_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.Product.id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetAverageProductReviewScoreRequest.product_id)
 }
 
-// string name = 2;
-inline void Product::clear_name() {
-  _impl_.name_.ClearToEmpty();
+// -------------------------------------------------------------------
+
+// GetAverageProductReviewScoreResponse
+
+// string average_score = 1;
+inline void GetAverageProductReviewScoreResponse::clear_average_score() {
+  _impl_.average_score_.ClearToEmpty();
 }
-inline const std::string& Product::name() const {
-  // @@protoc_insertion_point(field_get:oteldemo.Product.name)
-  return _internal_name();
+inline const std::string& GetAverageProductReviewScoreResponse::average_score() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetAverageProductReviewScoreResponse.average_score)
+  return _internal_average_score();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void Product::set_name(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void GetAverageProductReviewScoreResponse::set_average_score(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.name_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.Product.name)
+  _impl_.average_score_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.GetAverageProductReviewScoreResponse.average_score)
 }
-inline std::string* Product::mutable_name() {
-  std::string* _s = _internal_mutable_name();
-  // @@protoc_insertion_point(field_mutable:oteldemo.Product.name)
+inline std::string* GetAverageProductReviewScoreResponse::mutable_average_score() {
+  std::string* _s = _internal_mutable_average_score();
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetAverageProductReviewScoreResponse.average_score)
   return _s;
 }
-inline const std::string& Product::_internal_name() const {
+inline const std::string& GetAverageProductReviewScoreResponse::_internal_average_score() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.name_.Get();
+  return _impl_.average_score_.Get();
 }
-inline void Product::_internal_set_name(const std::string& value) {
+inline void GetAverageProductReviewScoreResponse::_internal_set_average_score(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.name_.Set(value, GetArenaForAllocation());
+  _impl_.average_score_.Set(value, GetArenaForAllocation());
 }
-inline std::string* Product::_internal_mutable_name() {
+inline std::string* GetAverageProductReviewScoreResponse::_internal_mutable_average_score() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.name_.Mutable( GetArenaForAllocation());
+  return _impl_.average_score_.Mutable( GetArenaForAllocation());
 }
-inline std::string* Product::release_name() {
+inline std::string* GetAverageProductReviewScoreResponse::release_average_score() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.Product.name)
-  return _impl_.name_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.GetAverageProductReviewScoreResponse.average_score)
+  return _impl_.average_score_.Release();
 }
-inline void Product::set_allocated_name(std::string* value) {
+inline void GetAverageProductReviewScoreResponse::set_allocated_average_score(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.name_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.average_score_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.name_.IsDefault()) {
-          _impl_.name_.Set("", GetArenaForAllocation());
+        if (_impl_.average_score_.IsDefault()) {
+          _impl_.average_score_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.Product.name)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetAverageProductReviewScoreResponse.average_score)
 }
 
-// string description = 3;
-inline void Product::clear_description() {
-  _impl_.description_.ClearToEmpty();
+// -------------------------------------------------------------------
+
+// GetProductReviewScoreHistogramRequest
+
+// string product_id = 1;
+inline void GetProductReviewScoreHistogramRequest::clear_product_id() {
+  _impl_.product_id_.ClearToEmpty();
 }
-inline const std::string& Product::description() const {
-  // @@protoc_insertion_point(field_get:oteldemo.Product.description)
-  return _internal_description();
+inline const std::string& GetProductReviewScoreHistogramRequest::product_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewScoreHistogramRequest.product_id)
+  return _internal_product_id();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void Product::set_description(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void GetProductReviewScoreHistogramRequest::set_product_id(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.description_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.Product.description)
+  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewScoreHistogramRequest.product_id)
 }
-inline std::string* Product::mutable_description() {
-  std::string* _s = _internal_mutable_description();
-  // @@protoc_insertion_point(field_mutable:oteldemo.Product.description)
+inline std::string* GetProductReviewScoreHistogramRequest::mutable_product_id() {
+  std::string* _s = _internal_mutable_product_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewScoreHistogramRequest.product_id)
   return _s;
 }
-inline const std::string& Product::_internal_description() const {
+inline const std::string& GetProductReviewScoreHistogramRequest::_internal_product_id() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.description_.Get();
+  return _impl_.product_id_.Get();
 }
-inline void Product::_internal_set_description(const std::string& value) {
+inline void GetProductReviewScoreHistogramRequest::_internal_set_product_id(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.description_.Set(value, GetArenaForAllocation());
+  _impl_.product_id_.Set(value, GetArenaForAllocation());
 }
-inline std::string* Product::_internal_mutable_description() {
+inline std::string* GetProductReviewScoreHistogramRequest::_internal_mutable_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.description_.Mutable( GetArenaForAllocation());
+  return _impl_.product_id_.Mutable( GetArenaForAllocation());
 }
-inline std::string* Product::release_description() {
+inline std::string* GetProductReviewScoreHistogramRequest::release_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.Product.description)
-  return _impl_.description_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.GetProductReviewScoreHistogramRequest.product_id)
+  return _impl_.product_id_.Release();
 }
-inline void Product::set_allocated_description(std::string* value) {
+inline void GetProductReviewScoreHistogramRequest::set_allocated_product_id(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.description_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.product_id_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.description_.IsDefault()) {
-          _impl_.description_.Set("", GetArenaForAllocation());
+        if (_impl_.product_id_.IsDefault()) {
+          _impl_.product_id_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.Product.description)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetProductReviewScoreHistogramRequest.product_id)
 }
 
-// string picture = 4;
-inline void Product::clear_picture() {
-  _impl_.picture_.ClearToEmpty();
+// -------------------------------------------------------------------
+
+// GetProductReviewScoreHistogramResponse
+
+// int32 review_count = 1;
+inline void GetProductReviewScoreHistogramResponse::clear_review_count() {
+  _impl_.review_count_ = 0;
 }
-inline const std::string& Product::picture() const {
-  // @@protoc_insertion_point(field_get:oteldemo.Product.picture)
-  return _internal_picture();
+inline ::int32_t GetProductReviewScoreHistogramResponse::review_count() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewScoreHistogramResponse.review_count)
+  return _internal_review_count();
+}
+inline void GetProductReviewScoreHistogramResponse::set_review_count(::int32_t value) {
+  _internal_set_review_count(value);
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewScoreHistogramResponse.review_count)
+}
+inline ::int32_t GetProductReviewScoreHistogramResponse::_internal_review_count() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.review_count_;
+}
+inline void GetProductReviewScoreHistogramResponse::_internal_set_review_count(::int32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.review_count_ = value;
+}
+
+// string average_score = 2;
+inline void GetProductReviewScoreHistogramResponse::clear_average_score() {
+  _impl_.average_score_.ClearToEmpty();
+}
+inline const std::string& GetProductReviewScoreHistogramResponse::average_score() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewScoreHistogramResponse.average_score)
+  return _internal_average_score();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void Product::set_picture(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void GetProductReviewScoreHistogramResponse::set_average_score(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.picture_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.Product.picture)
+  _impl_.average_score_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewScoreHistogramResponse.average_score)
 }
-inline std::string* Product::mutable_picture() {
-  std::string* _s = _internal_mutable_picture();
-  // @@protoc_insertion_point(field_mutable:oteldemo.Product.picture)
+inline std::string* GetProductReviewScoreHistogramResponse::mutable_average_score() {
+  std::string* _s = _internal_mutable_average_score();
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewScoreHistogramResponse.average_score)
   return _s;
 }
-inline const std::string& Product::_internal_picture() const {
+inline const std::string& GetProductReviewScoreHistogramResponse::_internal_average_score() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.picture_.Get();
+  return _impl_.average_score_.Get();
 }
-inline void Product::_internal_set_picture(const std::string& value) {
+inline void GetProductReviewScoreHistogramResponse::_internal_set_average_score(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.picture_.Set(value, GetArenaForAllocation());
+  _impl_.average_score_.Set(value, GetArenaForAllocation());
 }
-inline std::string* Product::_internal_mutable_picture() {
+inline std::string* GetProductReviewScoreHistogramResponse::_internal_mutable_average_score() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.picture_.Mutable( GetArenaForAllocation());
+  return _impl_.average_score_.Mutable( GetArenaForAllocation());
 }
-inline std::string* Product::release_picture() {
+inline std::string* GetProductReviewScoreHistogramResponse::release_average_score() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.Product.picture)
-  return _impl_.picture_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.GetProductReviewScoreHistogramResponse.average_score)
+  return _impl_.average_score_.Release();
 }
-inline void Product::set_allocated_picture(std::string* value) {
+inline void GetProductReviewScoreHistogramResponse::set_allocated_average_score(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.picture_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.average_score_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.picture_.IsDefault()) {
-          _impl_.picture_.Set("", GetArenaForAllocation());
+        if (_impl_.average_score_.IsDefault()) {
+          _impl_.average_score_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.Product.picture)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetProductReviewScoreHistogramResponse.average_score)
 }
 
-// .oteldemo.Money price_usd = 5;
-inline bool Product::has_price_usd() const {
-  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
-  PROTOBUF_ASSUME(!value || _impl_.price_usd_ != nullptr);
-  return value;
+// repeated int32 star_counts = 3;
+inline int GetProductReviewScoreHistogramResponse::_internal_star_counts_size() const {
+  return _internal_star_counts().size();
 }
-inline void Product::clear_price_usd() {
-  if (_impl_.price_usd_ != nullptr) _impl_.price_usd_->Clear();
-  _impl_._has_bits_[0] &= ~0x00000001u;
+inline int GetProductReviewScoreHistogramResponse::star_counts_size() const {
+  return _internal_star_counts_size();
 }
-inline const ::oteldemo::Money& Product::_internal_price_usd() const {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  const ::oteldemo::Money* p = _impl_.price_usd_;
-  return p != nullptr ? *p : reinterpret_cast<const ::oteldemo::Money&>(::oteldemo::_Money_default_instance_);
+inline void GetProductReviewScoreHistogramResponse::clear_star_counts() {
+  _internal_mutable_star_counts()->Clear();
 }
-inline const ::oteldemo::Money& Product::price_usd() const {
-  // @@protoc_insertion_point(field_get:oteldemo.Product.price_usd)
-  return _internal_price_usd();
+inline ::int32_t GetProductReviewScoreHistogramResponse::star_counts(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewScoreHistogramResponse.star_counts)
+  return _internal_star_counts().Get(index);
 }
-inline void Product::unsafe_arena_set_allocated_price_usd(::oteldemo::Money* value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  if (GetArenaForAllocation() == nullptr) {
-    delete reinterpret_cast<::google::protobuf::MessageLite*>(_impl_.price_usd_);
-  }
-  _impl_.price_usd_ = reinterpret_cast<::oteldemo::Money*>(value);
-  if (value != nullptr) {
-    _impl_._has_bits_[0] |= 0x00000001u;
-  } else {
-    _impl_._has_bits_[0] &= ~0x00000001u;
-  }
-  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:oteldemo.Product.price_usd)
+inline void GetProductReviewScoreHistogramResponse::set_star_counts(int index, ::int32_t value) {
+  _internal_mutable_star_counts()->Set(index, value);
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewScoreHistogramResponse.star_counts)
 }
-inline ::oteldemo::Money* Product::release_price_usd() {
+inline void GetProductReviewScoreHistogramResponse::add_star_counts(::int32_t value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-
-  _impl_._has_bits_[0] &= ~0x00000001u;
-  ::oteldemo::Money* released = _impl_.price_usd_;
-  _impl_.price_usd_ = nullptr;
-#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
-  auto* old = reinterpret_cast<::google::protobuf::MessageLite*>(released);
-  released = ::google::protobuf::internal::DuplicateIfNonNull(released);
-  if (GetArenaForAllocation() == nullptr) {
-    delete old;
-  }
-#else   // PROTOBUF_FORCE_COPY_IN_RELEASE
-  if (GetArenaForAllocation() != nullptr) {
-    released = ::google::protobuf::internal::DuplicateIfNonNull(released);
-  }
-#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
-  return released;
+  _internal_mutable_star_counts()->Add(value);
+  // @@protoc_insertion_point(field_add:oteldemo.GetProductReviewScoreHistogramResponse.star_counts)
 }
-inline ::oteldemo::Money* Product::unsafe_arena_release_price_usd() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.Product.price_usd)
-
-  _impl_._has_bits_[0] &= ~0x00000001u;
-  ::oteldemo::Money* temp = _impl_.price_usd_;
-  _impl_.price_usd_ = nullptr;
-  return temp;
+inline const ::google::protobuf::RepeatedField<::int32_t>& GetProductReviewScoreHistogramResponse::star_counts() const {
+  // @@protoc_insertion_point(field_list:oteldemo.GetProductReviewScoreHistogramResponse.star_counts)
+  return _internal_star_counts();
 }
-inline ::oteldemo::Money* Product::_internal_mutable_price_usd() {
+inline ::google::protobuf::RepeatedField<::int32_t>* GetProductReviewScoreHistogramResponse::mutable_star_counts() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.GetProductReviewScoreHistogramResponse.star_counts)
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_._has_bits_[0] |= 0x00000001u;
-  if (_impl_.price_usd_ == nullptr) {
-    auto* p = CreateMaybeMessage<::oteldemo::Money>(GetArenaForAllocation());
-    _impl_.price_usd_ = reinterpret_cast<::oteldemo::Money*>(p);
-  }
-  return _impl_.price_usd_;
+  return _internal_mutable_star_counts();
 }
-inline ::oteldemo::Money* Product::mutable_price_usd() {
-  ::oteldemo::Money* _msg = _internal_mutable_price_usd();
-  // @@protoc_insertion_point(field_mutable:oteldemo.Product.price_usd)
-  return _msg;
+
+inline const ::google::protobuf::RepeatedField<::int32_t>& GetProductReviewScoreHistogramResponse::_internal_star_counts() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.star_counts_;
+}
+inline ::google::protobuf::RepeatedField<::int32_t>* GetProductReviewScoreHistogramResponse::_internal_mutable_star_counts() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.star_counts_;
 }
-inline void Product::set_allocated_price_usd(::oteldemo::Money* value) {
-  ::google::protobuf::Arena* message_arena = GetArenaForAllocation();
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  if (message_arena == nullptr) {
-    delete reinterpret_cast<::oteldemo::Money*>(_impl_.price_usd_);
-  }
 
-  if (value != nullptr) {
-    ::google::protobuf::Arena* submessage_arena =
-        ::google::protobuf::Arena::InternalGetOwningArena(reinterpret_cast<::oteldemo::Money*>(value));
-    if (message_arena != submessage_arena) {
-      value = ::google::protobuf::internal::GetOwnedMessage(message_arena, value, submessage_arena);
-    }
-    _impl_._has_bits_[0] |= 0x00000001u;
-  } else {
-    _impl_._has_bits_[0] &= ~0x00000001u;
-  }
+// -------------------------------------------------------------------
 
-  _impl_.price_usd_ = reinterpret_cast<::oteldemo::Money*>(value);
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.Product.price_usd)
-}
+// GetProductReviewsBatchRequest
 
-// repeated string categories = 6;
-inline int Product::_internal_categories_size() const {
-  return _internal_categories().size();
+// repeated string product_ids = 1;
+inline int GetProductReviewsBatchRequest::_internal_product_ids_size() const {
+  return _internal_product_ids().size();
 }
-inline int Product::categories_size() const {
-  return _internal_categories_size();
+inline int GetProductReviewsBatchRequest::product_ids_size() const {
+  return _internal_product_ids_size();
 }
-inline void Product::clear_categories() {
-  _internal_mutable_categories()->Clear();
+inline void GetProductReviewsBatchRequest::clear_product_ids() {
+  _internal_mutable_product_ids()->Clear();
 }
-inline std::string* Product::add_categories() {
+inline std::string* GetProductReviewsBatchRequest::add_product_ids() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  std::string* _s = _internal_mutable_categories()->Add();
-  // @@protoc_insertion_point(field_add_mutable:oteldemo.Product.categories)
+  std::string* _s = _internal_mutable_product_ids()->Add();
+  // @@protoc_insertion_point(field_add_mutable:oteldemo.GetProductReviewsBatchRequest.product_ids)
   return _s;
 }
-inline const std::string& Product::categories(int index) const {
-  // @@protoc_insertion_point(field_get:oteldemo.Product.categories)
-  return _internal_categories().Get(index);
+inline const std::string& GetProductReviewsBatchRequest::product_ids(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsBatchRequest.product_ids)
+  return _internal_product_ids().Get(index);
 }
-inline std::string* Product::mutable_categories(int index) {
-  // @@protoc_insertion_point(field_mutable:oteldemo.Product.categories)
-  return _internal_mutable_categories()->Mutable(index);
+inline std::string* GetProductReviewsBatchRequest::mutable_product_ids(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewsBatchRequest.product_ids)
+  return _internal_mutable_product_ids()->Mutable(index);
 }
-inline void Product::set_categories(int index, const std::string& value) {
-  _internal_mutable_categories()->Mutable(index)->assign(value);
-  // @@protoc_insertion_point(field_set:oteldemo.Product.categories)
+inline void GetProductReviewsBatchRequest::set_product_ids(int index, const std::string& value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewsBatchRequest.product_ids)
 }
-inline void Product::set_categories(int index, std::string&& value) {
-  _internal_mutable_categories()->Mutable(index)->assign(std::move(value));
-  // @@protoc_insertion_point(field_set:oteldemo.Product.categories)
+inline void GetProductReviewsBatchRequest::set_product_ids(int index, std::string&& value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewsBatchRequest.product_ids)
 }
-inline void Product::set_categories(int index, const char* value) {
+inline void GetProductReviewsBatchRequest::set_product_ids(int index, const char* value) {
   ABSL_DCHECK(value != nullptr);
-  _internal_mutable_categories()->Mutable(index)->assign(value);
-  // @@protoc_insertion_point(field_set_char:oteldemo.Product.categories)
+  _internal_mutable_product_ids()->Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:oteldemo.GetProductReviewsBatchRequest.product_ids)
 }
-inline void Product::set_categories(int index, const char* value,
+inline void GetProductReviewsBatchRequest::set_product_ids(int index, const char* value,
                               std::size_t size) {
-  _internal_mutable_categories()->Mutable(index)->assign(
+  _internal_mutable_product_ids()->Mutable(index)->assign(
       reinterpret_cast<const char*>(value), size);
-  // @@protoc_insertion_point(field_set_pointer:oteldemo.Product.categories)
+  // @@protoc_insertion_point(field_set_pointer:oteldemo.GetProductReviewsBatchRequest.product_ids)
 }
-inline void Product::set_categories(int index, absl::string_view value) {
-  _internal_mutable_categories()->Mutable(index)->assign(value.data(),
+inline void GetProductReviewsBatchRequest::set_product_ids(int index, absl::string_view value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(value.data(),
                                                      value.size());
-  // @@protoc_insertion_point(field_set_string_piece:oteldemo.Product.categories)
-}
-inline void Product::add_categories(const std::string& value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_categories()->Add()->assign(value);
-  // @@protoc_insertion_point(field_add:oteldemo.Product.categories)
-}
-inline void Product::add_categories(std::string&& value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_categories()->Add(std::move(value));
-  // @@protoc_insertion_point(field_add:oteldemo.Product.categories)
-}
-inline void Product::add_categories(const char* value) {
-  ABSL_DCHECK(value != nullptr);
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_categories()->Add()->assign(value);
-  // @@protoc_insertion_point(field_add_char:oteldemo.Product.categories)
-}
-inline void Product::add_categories(const char* value, std::size_t size) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_categories()->Add()->assign(
-      reinterpret_cast<const char*>(value), size);
-  // @@protoc_insertion_point(field_add_pointer:oteldemo.Product.categories)
-}
-inline void Product::add_categories(absl::string_view value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _internal_mutable_categories()->Add()->assign(value.data(), value.size());
-  // @@protoc_insertion_point(field_add_string_piece:oteldemo.Product.categories)
-}
-inline const ::google::protobuf::RepeatedPtrField<std::string>&
-Product::categories() const {
-  // @@protoc_insertion_point(field_list:oteldemo.Product.categories)
-  return _internal_categories();
-}
-inline ::google::protobuf::RepeatedPtrField<std::string>* Product::mutable_categories() {
-  // @@protoc_insertion_point(field_mutable_list:oteldemo.Product.categories)
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_categories();
-}
-inline const ::google::protobuf::RepeatedPtrField<std::string>&
-Product::_internal_categories() const {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.categories_;
-}
-inline ::google::protobuf::RepeatedPtrField<std::string>*
-Product::_internal_mutable_categories() {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.categories_;
-}
-
-// -------------------------------------------------------------------
-
-// ListProductsResponse
-
-// repeated .oteldemo.Product products = 1;
-inline int ListProductsResponse::_internal_products_size() const {
-  return _internal_products().size();
-}
-inline int ListProductsResponse::products_size() const {
-  return _internal_products_size();
+  // @@protoc_insertion_point(field_set_string_piece:oteldemo.GetProductReviewsBatchRequest.product_ids)
 }
-inline void ListProductsResponse::clear_products() {
-  _internal_mutable_products()->Clear();
+inline void GetProductReviewsBatchRequest::add_product_ids(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(value);
+  // @@protoc_insertion_point(field_add:oteldemo.GetProductReviewsBatchRequest.product_ids)
 }
-inline ::oteldemo::Product* ListProductsResponse::mutable_products(int index) {
-  // @@protoc_insertion_point(field_mutable:oteldemo.ListProductsResponse.products)
-  return _internal_mutable_products()->Mutable(index);
+inline void GetProductReviewsBatchRequest::add_product_ids(std::string&& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add(std::move(value));
+  // @@protoc_insertion_point(field_add:oteldemo.GetProductReviewsBatchRequest.product_ids)
 }
-inline ::google::protobuf::RepeatedPtrField< ::oteldemo::Product >*
-ListProductsResponse::mutable_products() {
-  // @@protoc_insertion_point(field_mutable_list:oteldemo.ListProductsResponse.products)
+inline void GetProductReviewsBatchRequest::add_product_ids(const char* value) {
+  ABSL_DCHECK(value != nullptr);
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_products();
+  _internal_mutable_product_ids()->Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:oteldemo.GetProductReviewsBatchRequest.product_ids)
 }
-inline const ::oteldemo::Product& ListProductsResponse::products(int index) const {
-  // @@protoc_insertion_point(field_get:oteldemo.ListProductsResponse.products)
-    return _internal_products().Get(index);
+inline void GetProductReviewsBatchRequest::add_product_ids(const char* value, std::size_t size) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(
+      reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:oteldemo.GetProductReviewsBatchRequest.product_ids)
 }
-inline ::oteldemo::Product* ListProductsResponse::add_products() {
+inline void GetProductReviewsBatchRequest::add_product_ids(absl::string_view value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ::oteldemo::Product* _add = _internal_mutable_products()->Add();
-  // @@protoc_insertion_point(field_add:oteldemo.ListProductsResponse.products)
-  return _add;
+  _internal_mutable_product_ids()->Add()->assign(value.data(), value.size());
+  // @@protoc_insertion_point(field_add_string_piece:oteldemo.GetProductReviewsBatchRequest.product_ids)
 }
-inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::Product >&
-ListProductsResponse::products() const {
-  // @@protoc_insertion_point(field_list:oteldemo.ListProductsResponse.products)
-  return _internal_products();
+inline const ::google::protobuf::RepeatedPtrField<std::string>&
+GetProductReviewsBatchRequest::product_ids() const {
+  // @@protoc_insertion_point(field_list:oteldemo.GetProductReviewsBatchRequest.product_ids)
+  return _internal_product_ids();
 }
-inline const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>&
-ListProductsResponse::_internal_products() const {
+inline ::google::protobuf::RepeatedPtrField<std::string>* GetProductReviewsBatchRequest::mutable_product_ids() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.GetProductReviewsBatchRequest.product_ids)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_product_ids();
+}
+inline const ::google::protobuf::RepeatedPtrField<std::string>&
+GetProductReviewsBatchRequest::_internal_product_ids() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.products_;
+  return _impl_.product_ids_;
 }
-inline ::google::protobuf::RepeatedPtrField<::oteldemo::Product>*
-ListProductsResponse::_internal_mutable_products() {
+inline ::google::protobuf::RepeatedPtrField<std::string>*
+GetProductReviewsBatchRequest::_internal_mutable_product_ids() {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.products_;
+  return &_impl_.product_ids_;
 }
 
 // -------------------------------------------------------------------
 
-// GetProductRequest
+// ProductReviews
 
-// string id = 1;
-inline void GetProductRequest::clear_id() {
-  _impl_.id_.ClearToEmpty();
+// string product_id = 1;
+inline void ProductReviews::clear_product_id() {
+  _impl_.product_id_.ClearToEmpty();
 }
-inline const std::string& GetProductRequest::id() const {
-  // @@protoc_insertion_point(field_get:oteldemo.GetProductRequest.id)
-  return _internal_id();
+inline const std::string& ProductReviews::product_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.ProductReviews.product_id)
+  return _internal_product_id();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void GetProductRequest::set_id(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void ProductReviews::set_product_id(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.GetProductRequest.id)
+  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.ProductReviews.product_id)
 }
-inline std::string* GetProductRequest::mutable_id() {
-  std::string* _s = _internal_mutable_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductRequest.id)
+inline std::string* ProductReviews::mutable_product_id() {
+  std::string* _s = _internal_mutable_product_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.ProductReviews.product_id)
   return _s;
 }
-inline const std::string& GetProductRequest::_internal_id() const {
+inline const std::string& ProductReviews::_internal_product_id() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.id_.Get();
+  return _impl_.product_id_.Get();
 }
-inline void GetProductRequest::_internal_set_id(const std::string& value) {
+inline void ProductReviews::_internal_set_product_id(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.id_.Set(value, GetArenaForAllocation());
+  _impl_.product_id_.Set(value, GetArenaForAllocation());
 }
-inline std::string* GetProductRequest::_internal_mutable_id() {
+inline std::string* ProductReviews::_internal_mutable_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.id_.Mutable( GetArenaForAllocation());
+  return _impl_.product_id_.Mutable( GetArenaForAllocation());
 }
-inline std::string* GetProductRequest::release_id() {
+inline std::string* ProductReviews::release_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.GetProductRequest.id)
-  return _impl_.id_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.ProductReviews.product_id)
+  return _impl_.product_id_.Release();
 }
-inline void GetProductRequest::set_allocated_id(std::string* value) {
+inline void ProductReviews::set_allocated_product_id(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.id_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.product_id_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.id_.IsDefault()) {
-          _impl_.id_.Set("", GetArenaForAllocation());
+        if (_impl_.product_id_.IsDefault()) {
+          _impl_.product_id_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetProductRequest.id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.ProductReviews.product_id)
 }
 
-// -------------------------------------------------------------------
-
-// SearchProductsRequest
-
-// string query = 1;
-inline void SearchProductsRequest::clear_query() {
-  _impl_.query_.ClearToEmpty();
+// repeated .oteldemo.ProductReview product_reviews = 2;
+inline int ProductReviews::_internal_product_reviews_size() const {
+  return _internal_product_reviews().size();
 }
-inline const std::string& SearchProductsRequest::query() const {
-  // @@protoc_insertion_point(field_get:oteldemo.SearchProductsRequest.query)
-  return _internal_query();
+inline int ProductReviews::product_reviews_size() const {
+  return _internal_product_reviews_size();
 }
-template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void SearchProductsRequest::set_query(Arg_&& arg,
-                                                     Args_... args) {
+inline void ProductReviews::clear_product_reviews() {
+  _internal_mutable_product_reviews()->Clear();
+}
+inline ::oteldemo::ProductReview* ProductReviews::mutable_product_reviews(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.ProductReviews.product_reviews)
+  return _internal_mutable_product_reviews()->Mutable(index);
+}
+inline ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview >*
+ProductReviews::mutable_product_reviews() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.ProductReviews.product_reviews)
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ;
-  _impl_.query_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.SearchProductsRequest.query)
+  return _internal_mutable_product_reviews();
 }
-inline std::string* SearchProductsRequest::mutable_query() {
-  std::string* _s = _internal_mutable_query();
-  // @@protoc_insertion_point(field_mutable:oteldemo.SearchProductsRequest.query)
-  return _s;
+inline const ::oteldemo::ProductReview& ProductReviews::product_reviews(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.ProductReviews.product_reviews)
+    return _internal_product_reviews().Get(index);
 }
-inline const std::string& SearchProductsRequest::_internal_query() const {
+inline ::oteldemo::ProductReview* ProductReviews::add_product_reviews() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ::oteldemo::ProductReview* _add = _internal_mutable_product_reviews()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.ProductReviews.product_reviews)
+  return _add;
+}
+inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview >&
+ProductReviews::product_reviews() const {
+  // @@protoc_insertion_point(field_list:oteldemo.ProductReviews.product_reviews)
+  return _internal_product_reviews();
+}
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReview>&
+ProductReviews::_internal_product_reviews() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.query_.Get();
+  return _impl_.product_reviews_;
 }
-inline void SearchProductsRequest::_internal_set_query(const std::string& value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ;
-  _impl_.query_.Set(value, GetArenaForAllocation());
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReview>*
+ProductReviews::_internal_mutable_product_reviews() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.product_reviews_;
 }
-inline std::string* SearchProductsRequest::_internal_mutable_query() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ;
-  return _impl_.query_.Mutable( GetArenaForAllocation());
+
+// -------------------------------------------------------------------
+
+// GetProductReviewsBatchResponse
+
+// repeated .oteldemo.ProductReviews product_reviews = 1;
+inline int GetProductReviewsBatchResponse::_internal_product_reviews_size() const {
+  return _internal_product_reviews().size();
 }
-inline std::string* SearchProductsRequest::release_query() {
+inline int GetProductReviewsBatchResponse::product_reviews_size() const {
+  return _internal_product_reviews_size();
+}
+inline void GetProductReviewsBatchResponse::clear_product_reviews() {
+  _internal_mutable_product_reviews()->Clear();
+}
+inline ::oteldemo::ProductReviews* GetProductReviewsBatchResponse::mutable_product_reviews(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewsBatchResponse.product_reviews)
+  return _internal_mutable_product_reviews()->Mutable(index);
+}
+inline ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReviews >*
+GetProductReviewsBatchResponse::mutable_product_reviews() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.GetProductReviewsBatchResponse.product_reviews)
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.SearchProductsRequest.query)
-  return _impl_.query_.Release();
+  return _internal_mutable_product_reviews();
 }
-inline void SearchProductsRequest::set_allocated_query(std::string* value) {
+inline const ::oteldemo::ProductReviews& GetProductReviewsBatchResponse::product_reviews(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsBatchResponse.product_reviews)
+    return _internal_product_reviews().Get(index);
+}
+inline ::oteldemo::ProductReviews* GetProductReviewsBatchResponse::add_product_reviews() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.query_.SetAllocated(value, GetArenaForAllocation());
-  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.query_.IsDefault()) {
-          _impl_.query_.Set("", GetArenaForAllocation());
-        }
-  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.SearchProductsRequest.query)
+  ::oteldemo::ProductReviews* _add = _internal_mutable_product_reviews()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.GetProductReviewsBatchResponse.product_reviews)
+  return _add;
+}
+inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReviews >&
+GetProductReviewsBatchResponse::product_reviews() const {
+  // @@protoc_insertion_point(field_list:oteldemo.GetProductReviewsBatchResponse.product_reviews)
+  return _internal_product_reviews();
+}
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReviews>&
+GetProductReviewsBatchResponse::_internal_product_reviews() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.product_reviews_;
+}
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReviews>*
+GetProductReviewsBatchResponse::_internal_mutable_product_reviews() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.product_reviews_;
 }
 
 // -------------------------------------------------------------------
 
-// SearchProductsResponse
+// GetAverageScoresBatchRequest
 
-// repeated .oteldemo.Product results = 1;
-inline int SearchProductsResponse::_internal_results_size() const {
-  return _internal_results().size();
+// repeated string product_ids = 1;
+inline int GetAverageScoresBatchRequest::_internal_product_ids_size() const {
+  return _internal_product_ids().size();
 }
-inline int SearchProductsResponse::results_size() const {
-  return _internal_results_size();
+inline int GetAverageScoresBatchRequest::product_ids_size() const {
+  return _internal_product_ids_size();
 }
-inline void SearchProductsResponse::clear_results() {
-  _internal_mutable_results()->Clear();
+inline void GetAverageScoresBatchRequest::clear_product_ids() {
+  _internal_mutable_product_ids()->Clear();
 }
-inline ::oteldemo::Product* SearchProductsResponse::mutable_results(int index) {
-  // @@protoc_insertion_point(field_mutable:oteldemo.SearchProductsResponse.results)
-  return _internal_mutable_results()->Mutable(index);
+inline std::string* GetAverageScoresBatchRequest::add_product_ids() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  std::string* _s = _internal_mutable_product_ids()->Add();
+  // @@protoc_insertion_point(field_add_mutable:oteldemo.GetAverageScoresBatchRequest.product_ids)
+  return _s;
 }
-inline ::google::protobuf::RepeatedPtrField< ::oteldemo::Product >*
-SearchProductsResponse::mutable_results() {
-  // @@protoc_insertion_point(field_mutable_list:oteldemo.SearchProductsResponse.results)
+inline const std::string& GetAverageScoresBatchRequest::product_ids(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetAverageScoresBatchRequest.product_ids)
+  return _internal_product_ids().Get(index);
+}
+inline std::string* GetAverageScoresBatchRequest::mutable_product_ids(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetAverageScoresBatchRequest.product_ids)
+  return _internal_mutable_product_ids()->Mutable(index);
+}
+inline void GetAverageScoresBatchRequest::set_product_ids(int index, const std::string& value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:oteldemo.GetAverageScoresBatchRequest.product_ids)
+}
+inline void GetAverageScoresBatchRequest::set_product_ids(int index, std::string&& value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:oteldemo.GetAverageScoresBatchRequest.product_ids)
+}
+inline void GetAverageScoresBatchRequest::set_product_ids(int index, const char* value) {
+  ABSL_DCHECK(value != nullptr);
+  _internal_mutable_product_ids()->Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:oteldemo.GetAverageScoresBatchRequest.product_ids)
+}
+inline void GetAverageScoresBatchRequest::set_product_ids(int index, const char* value,
+                              std::size_t size) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(
+      reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:oteldemo.GetAverageScoresBatchRequest.product_ids)
+}
+inline void GetAverageScoresBatchRequest::set_product_ids(int index, absl::string_view value) {
+  _internal_mutable_product_ids()->Mutable(index)->assign(value.data(),
+                                                     value.size());
+  // @@protoc_insertion_point(field_set_string_piece:oteldemo.GetAverageScoresBatchRequest.product_ids)
+}
+inline void GetAverageScoresBatchRequest::add_product_ids(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  return _internal_mutable_results();
+  _internal_mutable_product_ids()->Add()->assign(value);
+  // @@protoc_insertion_point(field_add:oteldemo.GetAverageScoresBatchRequest.product_ids)
 }
-inline const ::oteldemo::Product& SearchProductsResponse::results(int index) const {
-  // @@protoc_insertion_point(field_get:oteldemo.SearchProductsResponse.results)
-    return _internal_results().Get(index);
+inline void GetAverageScoresBatchRequest::add_product_ids(std::string&& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add(std::move(value));
+  // @@protoc_insertion_point(field_add:oteldemo.GetAverageScoresBatchRequest.product_ids)
 }
-inline ::oteldemo::Product* SearchProductsResponse::add_results() {
+inline void GetAverageScoresBatchRequest::add_product_ids(const char* value) {
+  ABSL_DCHECK(value != nullptr);
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ::oteldemo::Product* _add = _internal_mutable_results()->Add();
-  // @@protoc_insertion_point(field_add:oteldemo.SearchProductsResponse.results)
-  return _add;
+  _internal_mutable_product_ids()->Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:oteldemo.GetAverageScoresBatchRequest.product_ids)
 }
-inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::Product >&
-SearchProductsResponse::results() const {
-  // @@protoc_insertion_point(field_list:oteldemo.SearchProductsResponse.results)
-  return _internal_results();
+inline void GetAverageScoresBatchRequest::add_product_ids(const char* value, std::size_t size) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(
+      reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:oteldemo.GetAverageScoresBatchRequest.product_ids)
 }
-inline const ::google::protobuf::RepeatedPtrField<::oteldemo::Product>&
-SearchProductsResponse::_internal_results() const {
+inline void GetAverageScoresBatchRequest::add_product_ids(absl::string_view value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _internal_mutable_product_ids()->Add()->assign(value.data(), value.size());
+  // @@protoc_insertion_point(field_add_string_piece:oteldemo.GetAverageScoresBatchRequest.product_ids)
+}
+inline const ::google::protobuf::RepeatedPtrField<std::string>&
+GetAverageScoresBatchRequest::product_ids() const {
+  // @@protoc_insertion_point(field_list:oteldemo.GetAverageScoresBatchRequest.product_ids)
+  return _internal_product_ids();
+}
+inline ::google::protobuf::RepeatedPtrField<std::string>* GetAverageScoresBatchRequest::mutable_product_ids() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.GetAverageScoresBatchRequest.product_ids)
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  return _internal_mutable_product_ids();
+}
+inline const ::google::protobuf::RepeatedPtrField<std::string>&
+GetAverageScoresBatchRequest::_internal_product_ids() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.results_;
+  return _impl_.product_ids_;
 }
-inline ::google::protobuf::RepeatedPtrField<::oteldemo::Product>*
-SearchProductsResponse::_internal_mutable_results() {
+inline ::google::protobuf::RepeatedPtrField<std::string>*
+GetAverageScoresBatchRequest::_internal_mutable_product_ids() {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return &_impl_.results_;
+  return &_impl_.product_ids_;
 }
 
 // -------------------------------------------------------------------
 
-// ProductReview
+// ProductAverageScore
 
-// string username = 1;
-inline void ProductReview::clear_username() {
-  _impl_.username_.ClearToEmpty();
+// string product_id = 1;
+inline void ProductAverageScore::clear_product_id() {
+  _impl_.product_id_.ClearToEmpty();
 }
-inline const std::string& ProductReview::username() const {
-  // @@protoc_insertion_point(field_get:oteldemo.ProductReview.username)
-  return _internal_username();
+inline const std::string& ProductAverageScore::product_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.ProductAverageScore.product_id)
+  return _internal_product_id();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void ProductReview::set_username(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void ProductAverageScore::set_product_id(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.username_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.ProductReview.username)
+  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.ProductAverageScore.product_id)
 }
-inline std::string* ProductReview::mutable_username() {
-  std::string* _s = _internal_mutable_username();
-  // @@protoc_insertion_point(field_mutable:oteldemo.ProductReview.username)
+inline std::string* ProductAverageScore::mutable_product_id() {
+  std::string* _s = _internal_mutable_product_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.ProductAverageScore.product_id)
   return _s;
 }
-inline const std::string& ProductReview::_internal_username() const {
+inline const std::string& ProductAverageScore::_internal_product_id() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.username_.Get();
+  return _impl_.product_id_.Get();
 }
-inline void ProductReview::_internal_set_username(const std::string& value) {
+inline void ProductAverageScore::_internal_set_product_id(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.username_.Set(value, GetArenaForAllocation());
+  _impl_.product_id_.Set(value, GetArenaForAllocation());
 }
-inline std::string* ProductReview::_internal_mutable_username() {
+inline std::string* ProductAverageScore::_internal_mutable_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.username_.Mutable( GetArenaForAllocation());
+  return _impl_.product_id_.Mutable( GetArenaForAllocation());
 }
-inline std::string* ProductReview::release_username() {
+inline std::string* ProductAverageScore::release_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.ProductReview.username)
-  return _impl_.username_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.ProductAverageScore.product_id)
+  return _impl_.product_id_.Release();
 }
-inline void ProductReview::set_allocated_username(std::string* value) {
+inline void ProductAverageScore::set_allocated_product_id(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.username_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.product_id_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.username_.IsDefault()) {
-          _impl_.username_.Set("", GetArenaForAllocation());
+        if (_impl_.product_id_.IsDefault()) {
+          _impl_.product_id_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.ProductReview.username)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.ProductAverageScore.product_id)
 }
 
-// string description = 2;
-inline void ProductReview::clear_description() {
-  _impl_.description_.ClearToEmpty();
+// string average_score = 2;
+inline void ProductAverageScore::clear_average_score() {
+  _impl_.average_score_.ClearToEmpty();
 }
-inline const std::string& ProductReview::description() const {
-  // @@protoc_insertion_point(field_get:oteldemo.ProductReview.description)
-  return _internal_description();
+inline const std::string& ProductAverageScore::average_score() const {
+  // @@protoc_insertion_point(field_get:oteldemo.ProductAverageScore.average_score)
+  return _internal_average_score();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void ProductReview::set_description(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void ProductAverageScore::set_average_score(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.description_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.ProductReview.description)
+  _impl_.average_score_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.ProductAverageScore.average_score)
 }
-inline std::string* ProductReview::mutable_description() {
-  std::string* _s = _internal_mutable_description();
-  // @@protoc_insertion_point(field_mutable:oteldemo.ProductReview.description)
+inline std::string* ProductAverageScore::mutable_average_score() {
+  std::string* _s = _internal_mutable_average_score();
+  // @@protoc_insertion_point(field_mutable:oteldemo.ProductAverageScore.average_score)
   return _s;
 }
-inline const std::string& ProductReview::_internal_description() const {
+inline const std::string& ProductAverageScore::_internal_average_score() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.description_.Get();
+  return _impl_.average_score_.Get();
 }
-inline void ProductReview::_internal_set_description(const std::string& value) {
+inline void ProductAverageScore::_internal_set_average_score(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.description_.Set(value, GetArenaForAllocation());
+  _impl_.average_score_.Set(value, GetArenaForAllocation());
 }
-inline std::string* ProductReview::_internal_mutable_description() {
+inline std::string* ProductAverageScore::_internal_mutable_average_score() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.description_.Mutable( GetArenaForAllocation());
+  return _impl_.average_score_.Mutable( GetArenaForAllocation());
 }
-inline std::string* ProductReview::release_description() {
+inline std::string* ProductAverageScore::release_average_score() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.ProductReview.description)
-  return _impl_.description_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.ProductAverageScore.average_score)
+  return _impl_.average_score_.Release();
 }
-inline void ProductReview::set_allocated_description(std::string* value) {
+inline void ProductAverageScore::set_allocated_average_score(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.description_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.average_score_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.description_.IsDefault()) {
-          _impl_.description_.Set("", GetArenaForAllocation());
+        if (_impl_.average_score_.IsDefault()) {
+          _impl_.average_score_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.ProductReview.description)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.ProductAverageScore.average_score)
 }
 
-// string score = 3;
-inline void ProductReview::clear_score() {
-  _impl_.score_.ClearToEmpty();
-}
-inline const std::string& ProductReview::score() const {
-  // @@protoc_insertion_point(field_get:oteldemo.ProductReview.score)
-  return _internal_score();
+// -------------------------------------------------------------------
+
+// GetAverageScoresBatchResponse
+
+// repeated .oteldemo.ProductAverageScore average_scores = 1;
+inline int GetAverageScoresBatchResponse::_internal_average_scores_size() const {
+  return _internal_average_scores().size();
 }
-template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void ProductReview::set_score(Arg_&& arg,
-                                                     Args_... args) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ;
-  _impl_.score_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.ProductReview.score)
+inline int GetAverageScoresBatchResponse::average_scores_size() const {
+  return _internal_average_scores_size();
 }
-inline std::string* ProductReview::mutable_score() {
-  std::string* _s = _internal_mutable_score();
-  // @@protoc_insertion_point(field_mutable:oteldemo.ProductReview.score)
-  return _s;
+inline void GetAverageScoresBatchResponse::clear_average_scores() {
+  _internal_mutable_average_scores()->Clear();
 }
-inline const std::string& ProductReview::_internal_score() const {
-  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.score_.Get();
+inline ::oteldemo::ProductAverageScore* GetAverageScoresBatchResponse::mutable_average_scores(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetAverageScoresBatchResponse.average_scores)
+  return _internal_mutable_average_scores()->Mutable(index);
 }
-inline void ProductReview::_internal_set_score(const std::string& value) {
+inline ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductAverageScore >*
+GetAverageScoresBatchResponse::mutable_average_scores() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.GetAverageScoresBatchResponse.average_scores)
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ;
-  _impl_.score_.Set(value, GetArenaForAllocation());
+  return _internal_mutable_average_scores();
 }
-inline std::string* ProductReview::_internal_mutable_score() {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  ;
-  return _impl_.score_.Mutable( GetArenaForAllocation());
+inline const ::oteldemo::ProductAverageScore& GetAverageScoresBatchResponse::average_scores(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetAverageScoresBatchResponse.average_scores)
+    return _internal_average_scores().Get(index);
 }
-inline std::string* ProductReview::release_score() {
+inline ::oteldemo::ProductAverageScore* GetAverageScoresBatchResponse::add_average_scores() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.ProductReview.score)
-  return _impl_.score_.Release();
+  ::oteldemo::ProductAverageScore* _add = _internal_mutable_average_scores()->Add();
+  // @@protoc_insertion_point(field_add:oteldemo.GetAverageScoresBatchResponse.average_scores)
+  return _add;
 }
-inline void ProductReview::set_allocated_score(std::string* value) {
-  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.score_.SetAllocated(value, GetArenaForAllocation());
-  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.score_.IsDefault()) {
-          _impl_.score_.Set("", GetArenaForAllocation());
-        }
-  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.ProductReview.score)
+inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductAverageScore >&
+GetAverageScoresBatchResponse::average_scores() const {
+  // @@protoc_insertion_point(field_list:oteldemo.GetAverageScoresBatchResponse.average_scores)
+  return _internal_average_scores();
+}
+inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ProductAverageScore>&
+GetAverageScoresBatchResponse::_internal_average_scores() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.average_scores_;
+}
+inline ::google::protobuf::RepeatedPtrField<::oteldemo::ProductAverageScore>*
+GetAverageScoresBatchResponse::_internal_mutable_average_scores() {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return &_impl_.average_scores_;
 }
 
 // -------------------------------------------------------------------
 
-// GetProductReviewsRequest
+// GetProductReviewsPageRequest
 
 // string product_id = 1;
-inline void GetProductReviewsRequest::clear_product_id() {
+inline void GetProductReviewsPageRequest::clear_product_id() {
   _impl_.product_id_.ClearToEmpty();
 }
-inline const std::string& GetProductReviewsRequest::product_id() const {
-  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsRequest.product_id)
+inline const std::string& GetProductReviewsPageRequest::product_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsPageRequest.product_id)
   return _internal_product_id();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void GetProductReviewsRequest::set_product_id(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void GetProductReviewsPageRequest::set_product_id(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
   _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewsRequest.product_id)
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewsPageRequest.product_id)
 }
-inline std::string* GetProductReviewsRequest::mutable_product_id() {
+inline std::string* GetProductReviewsPageRequest::mutable_product_id() {
   std::string* _s = _internal_mutable_product_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewsRequest.product_id)
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewsPageRequest.product_id)
   return _s;
 }
-inline const std::string& GetProductReviewsRequest::_internal_product_id() const {
+inline const std::string& GetProductReviewsPageRequest::_internal_product_id() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
   return _impl_.product_id_.Get();
 }
-inline void GetProductReviewsRequest::_internal_set_product_id(const std::string& value) {
+inline void GetProductReviewsPageRequest::_internal_set_product_id(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
   _impl_.product_id_.Set(value, GetArenaForAllocation());
 }
-inline std::string* GetProductReviewsRequest::_internal_mutable_product_id() {
+inline std::string* GetProductReviewsPageRequest::_internal_mutable_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
   return _impl_.product_id_.Mutable( GetArenaForAllocation());
 }
-inline std::string* GetProductReviewsRequest::release_product_id() {
+inline std::string* GetProductReviewsPageRequest::release_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.GetProductReviewsRequest.product_id)
+  // @@protoc_insertion_point(field_release:oteldemo.GetProductReviewsPageRequest.product_id)
   return _impl_.product_id_.Release();
 }
-inline void GetProductReviewsRequest::set_allocated_product_id(std::string* value) {
+inline void GetProductReviewsPageRequest::set_allocated_product_id(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   _impl_.product_id_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
@@ -10545,167 +13877,258 @@ inline void GetProductReviewsRequest::set_allocated_product_id(std::string* valu
           _impl_.product_id_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetProductReviewsRequest.product_id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetProductReviewsPageRequest.product_id)
+}
+
+// int32 page_size = 2;
+inline void GetProductReviewsPageRequest::clear_page_size() {
+  _impl_.page_size_ = 0;
+}
+inline ::int32_t GetProductReviewsPageRequest::page_size() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsPageRequest.page_size)
+  return _internal_page_size();
+}
+inline void GetProductReviewsPageRequest::set_page_size(::int32_t value) {
+  _internal_set_page_size(value);
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewsPageRequest.page_size)
+}
+inline ::int32_t GetProductReviewsPageRequest::_internal_page_size() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.page_size_;
+}
+inline void GetProductReviewsPageRequest::_internal_set_page_size(::int32_t value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.page_size_ = value;
+}
+
+// string page_token = 3;
+inline void GetProductReviewsPageRequest::clear_page_token() {
+  _impl_.page_token_.ClearToEmpty();
+}
+inline const std::string& GetProductReviewsPageRequest::page_token() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsPageRequest.page_token)
+  return _internal_page_token();
+}
+template <typename Arg_, typename... Args_>
+inline PROTOBUF_ALWAYS_INLINE void GetProductReviewsPageRequest::set_page_token(Arg_&& arg,
+                                                     Args_... args) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.page_token_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewsPageRequest.page_token)
+}
+inline std::string* GetProductReviewsPageRequest::mutable_page_token() {
+  std::string* _s = _internal_mutable_page_token();
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewsPageRequest.page_token)
+  return _s;
+}
+inline const std::string& GetProductReviewsPageRequest::_internal_page_token() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.page_token_.Get();
+}
+inline void GetProductReviewsPageRequest::_internal_set_page_token(const std::string& value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.page_token_.Set(value, GetArenaForAllocation());
+}
+inline std::string* GetProductReviewsPageRequest::_internal_mutable_page_token() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  return _impl_.page_token_.Mutable( GetArenaForAllocation());
+}
+inline std::string* GetProductReviewsPageRequest::release_page_token() {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  // @@protoc_insertion_point(field_release:oteldemo.GetProductReviewsPageRequest.page_token)
+  return _impl_.page_token_.Release();
+}
+inline void GetProductReviewsPageRequest::set_allocated_page_token(std::string* value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  _impl_.page_token_.SetAllocated(value, GetArenaForAllocation());
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+        if (_impl_.page_token_.IsDefault()) {
+          _impl_.page_token_.Set("", GetArenaForAllocation());
+        }
+  #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetProductReviewsPageRequest.page_token)
+}
+
+// bool order_by_score = 4;
+inline void GetProductReviewsPageRequest::clear_order_by_score() {
+  _impl_.order_by_score_ = false;
+}
+inline bool GetProductReviewsPageRequest::order_by_score() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsPageRequest.order_by_score)
+  return _internal_order_by_score();
+}
+inline void GetProductReviewsPageRequest::set_order_by_score(bool value) {
+  _internal_set_order_by_score(value);
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewsPageRequest.order_by_score)
+}
+inline bool GetProductReviewsPageRequest::_internal_order_by_score() const {
+  PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
+  return _impl_.order_by_score_;
+}
+inline void GetProductReviewsPageRequest::_internal_set_order_by_score(bool value) {
+  PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
+  ;
+  _impl_.order_by_score_ = value;
 }
 
 // -------------------------------------------------------------------
 
-// GetProductReviewsResponse
+// GetProductReviewsPageResponse
 
 // repeated .oteldemo.ProductReview product_reviews = 1;
-inline int GetProductReviewsResponse::_internal_product_reviews_size() const {
+inline int GetProductReviewsPageResponse::_internal_product_reviews_size() const {
   return _internal_product_reviews().size();
 }
-inline int GetProductReviewsResponse::product_reviews_size() const {
+inline int GetProductReviewsPageResponse::product_reviews_size() const {
   return _internal_product_reviews_size();
 }
-inline void GetProductReviewsResponse::clear_product_reviews() {
+inline void GetProductReviewsPageResponse::clear_product_reviews() {
   _internal_mutable_product_reviews()->Clear();
 }
-inline ::oteldemo::ProductReview* GetProductReviewsResponse::mutable_product_reviews(int index) {
-  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewsResponse.product_reviews)
+inline ::oteldemo::ProductReview* GetProductReviewsPageResponse::mutable_product_reviews(int index) {
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewsPageResponse.product_reviews)
   return _internal_mutable_product_reviews()->Mutable(index);
 }
 inline ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview >*
-GetProductReviewsResponse::mutable_product_reviews() {
-  // @@protoc_insertion_point(field_mutable_list:oteldemo.GetProductReviewsResponse.product_reviews)
+GetProductReviewsPageResponse::mutable_product_reviews() {
+  // @@protoc_insertion_point(field_mutable_list:oteldemo.GetProductReviewsPageResponse.product_reviews)
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   return _internal_mutable_product_reviews();
 }
-inline const ::oteldemo::ProductReview& GetProductReviewsResponse::product_reviews(int index) const {
-  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsResponse.product_reviews)
+inline const ::oteldemo::ProductReview& GetProductReviewsPageResponse::product_reviews(int index) const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsPageResponse.product_reviews)
     return _internal_product_reviews().Get(index);
 }
-inline ::oteldemo::ProductReview* GetProductReviewsResponse::add_product_reviews() {
+inline ::oteldemo::ProductReview* GetProductReviewsPageResponse::add_product_reviews() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ::oteldemo::ProductReview* _add = _internal_mutable_product_reviews()->Add();
-  // @@protoc_insertion_point(field_add:oteldemo.GetProductReviewsResponse.product_reviews)
+  // @@protoc_insertion_point(field_add:oteldemo.GetProductReviewsPageResponse.product_reviews)
   return _add;
 }
 inline const ::google::protobuf::RepeatedPtrField< ::oteldemo::ProductReview >&
-GetProductReviewsResponse::product_reviews() const {
-  // @@protoc_insertion_point(field_list:oteldemo.GetProductReviewsResponse.product_reviews)
+GetProductReviewsPageResponse::product_reviews() const {
+  // @@protoc_insertion_point(field_list:oteldemo.GetProductReviewsPageResponse.product_reviews)
   return _internal_product_reviews();
 }
 inline const ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReview>&
-GetProductReviewsResponse::_internal_product_reviews() const {
+GetProductReviewsPageResponse::_internal_product_reviews() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
   return _impl_.product_reviews_;
 }
 inline ::google::protobuf::RepeatedPtrField<::oteldemo::ProductReview>*
-GetProductReviewsResponse::_internal_mutable_product_reviews() {
+GetProductReviewsPageResponse::_internal_mutable_product_reviews() {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
   return &_impl_.product_reviews_;
 }
 
-// -------------------------------------------------------------------
-
-// GetAverageProductReviewScoreRequest
-
-// string product_id = 1;
-inline void GetAverageProductReviewScoreRequest::clear_product_id() {
-  _impl_.product_id_.ClearToEmpty();
+// string next_page_token = 2;
+inline void GetProductReviewsPageResponse::clear_next_page_token() {
+  _impl_.next_page_token_.ClearToEmpty();
 }
-inline const std::string& GetAverageProductReviewScoreRequest::product_id() const {
-  // @@protoc_insertion_point(field_get:oteldemo.GetAverageProductReviewScoreRequest.product_id)
-  return _internal_product_id();
+inline const std::string& GetProductReviewsPageResponse::next_page_token() const {
+  // @@protoc_insertion_point(field_get:oteldemo.GetProductReviewsPageResponse.next_page_token)
+  return _internal_next_page_token();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void GetAverageProductReviewScoreRequest::set_product_id(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void GetProductReviewsPageResponse::set_next_page_token(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.GetAverageProductReviewScoreRequest.product_id)
+  _impl_.next_page_token_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.GetProductReviewsPageResponse.next_page_token)
 }
-inline std::string* GetAverageProductReviewScoreRequest::mutable_product_id() {
-  std::string* _s = _internal_mutable_product_id();
-  // @@protoc_insertion_point(field_mutable:oteldemo.GetAverageProductReviewScoreRequest.product_id)
+inline std::string* GetProductReviewsPageResponse::mutable_next_page_token() {
+  std::string* _s = _internal_mutable_next_page_token();
+  // @@protoc_insertion_point(field_mutable:oteldemo.GetProductReviewsPageResponse.next_page_token)
   return _s;
 }
-inline const std::string& GetAverageProductReviewScoreRequest::_internal_product_id() const {
+inline const std::string& GetProductReviewsPageResponse::_internal_next_page_token() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.product_id_.Get();
+  return _impl_.next_page_token_.Get();
 }
-inline void GetAverageProductReviewScoreRequest::_internal_set_product_id(const std::string& value) {
+inline void GetProductReviewsPageResponse::_internal_set_next_page_token(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.product_id_.Set(value, GetArenaForAllocation());
+  _impl_.next_page_token_.Set(value, GetArenaForAllocation());
 }
-inline std::string* GetAverageProductReviewScoreRequest::_internal_mutable_product_id() {
+inline std::string* GetProductReviewsPageResponse::_internal_mutable_next_page_token() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.product_id_.Mutable( GetArenaForAllocation());
+  return _impl_.next_page_token_.Mutable( GetArenaForAllocation());
 }
-inline std::string* GetAverageProductReviewScoreRequest::release_product_id() {
+inline std::string* GetProductReviewsPageResponse::release_next_page_token() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.GetAverageProductReviewScoreRequest.product_id)
-  return _impl_.product_id_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.GetProductReviewsPageResponse.next_page_token)
+  return _impl_.next_page_token_.Release();
 }
-inline void GetAverageProductReviewScoreRequest::set_allocated_product_id(std::string* value) {
+inline void GetProductReviewsPageResponse::set_allocated_next_page_token(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.product_id_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.next_page_token_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.product_id_.IsDefault()) {
-          _impl_.product_id_.Set("", GetArenaForAllocation());
+        if (_impl_.next_page_token_.IsDefault()) {
+          _impl_.next_page_token_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetAverageProductReviewScoreRequest.product_id)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetProductReviewsPageResponse.next_page_token)
 }
 
 // -------------------------------------------------------------------
 
-// GetAverageProductReviewScoreResponse
+// StreamProductReviewsRequest
 
-// string average_score = 1;
-inline void GetAverageProductReviewScoreResponse::clear_average_score() {
-  _impl_.average_score_.ClearToEmpty();
+// string product_id = 1;
+inline void StreamProductReviewsRequest::clear_product_id() {
+  _impl_.product_id_.ClearToEmpty();
 }
-inline const std::string& GetAverageProductReviewScoreResponse::average_score() const {
-  // @@protoc_insertion_point(field_get:oteldemo.GetAverageProductReviewScoreResponse.average_score)
-  return _internal_average_score();
+inline const std::string& StreamProductReviewsRequest::product_id() const {
+  // @@protoc_insertion_point(field_get:oteldemo.StreamProductReviewsRequest.product_id)
+  return _internal_product_id();
 }
 template <typename Arg_, typename... Args_>
-inline PROTOBUF_ALWAYS_INLINE void GetAverageProductReviewScoreResponse::set_average_score(Arg_&& arg,
+inline PROTOBUF_ALWAYS_INLINE void StreamProductReviewsRequest::set_product_id(Arg_&& arg,
                                                      Args_... args) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.average_score_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
-  // @@protoc_insertion_point(field_set:oteldemo.GetAverageProductReviewScoreResponse.average_score)
+  _impl_.product_id_.Set(static_cast<Arg_&&>(arg), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:oteldemo.StreamProductReviewsRequest.product_id)
 }
-inline std::string* GetAverageProductReviewScoreResponse::mutable_average_score() {
-  std::string* _s = _internal_mutable_average_score();
-  // @@protoc_insertion_point(field_mutable:oteldemo.GetAverageProductReviewScoreResponse.average_score)
+inline std::string* StreamProductReviewsRequest::mutable_product_id() {
+  std::string* _s = _internal_mutable_product_id();
+  // @@protoc_insertion_point(field_mutable:oteldemo.StreamProductReviewsRequest.product_id)
   return _s;
 }
-inline const std::string& GetAverageProductReviewScoreResponse::_internal_average_score() const {
+inline const std::string& StreamProductReviewsRequest::_internal_product_id() const {
   PROTOBUF_TSAN_READ(&_impl_._tsan_detect_race);
-  return _impl_.average_score_.Get();
+  return _impl_.product_id_.Get();
 }
-inline void GetAverageProductReviewScoreResponse::_internal_set_average_score(const std::string& value) {
+inline void StreamProductReviewsRequest::_internal_set_product_id(const std::string& value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  _impl_.average_score_.Set(value, GetArenaForAllocation());
+  _impl_.product_id_.Set(value, GetArenaForAllocation());
 }
-inline std::string* GetAverageProductReviewScoreResponse::_internal_mutable_average_score() {
+inline std::string* StreamProductReviewsRequest::_internal_mutable_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
   ;
-  return _impl_.average_score_.Mutable( GetArenaForAllocation());
+  return _impl_.product_id_.Mutable( GetArenaForAllocation());
 }
-inline std::string* GetAverageProductReviewScoreResponse::release_average_score() {
+inline std::string* StreamProductReviewsRequest::release_product_id() {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  // @@protoc_insertion_point(field_release:oteldemo.GetAverageProductReviewScoreResponse.average_score)
-  return _impl_.average_score_.Release();
+  // @@protoc_insertion_point(field_release:oteldemo.StreamProductReviewsRequest.product_id)
+  return _impl_.product_id_.Release();
 }
-inline void GetAverageProductReviewScoreResponse::set_allocated_average_score(std::string* value) {
+inline void StreamProductReviewsRequest::set_allocated_product_id(std::string* value) {
   PROTOBUF_TSAN_WRITE(&_impl_._tsan_detect_race);
-  _impl_.average_score_.SetAllocated(value, GetArenaForAllocation());
+  _impl_.product_id_.SetAllocated(value, GetArenaForAllocation());
   #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
-        if (_impl_.average_score_.IsDefault()) {
-          _impl_.average_score_.Set("", GetArenaForAllocation());
+        if (_impl_.product_id_.IsDefault()) {
+          _impl_.product_id_.Set("", GetArenaForAllocation());
         }
   #endif  // PROTOBUF_FORCE_COPY_DEFAULT_STRING
-  // @@protoc_insertion_point(field_set_allocated:oteldemo.GetAverageProductReviewScoreResponse.average_score)
+  // @@protoc_insertion_point(field_set_allocated:oteldemo.StreamProductReviewsRequest.product_id)
 }
 
 // -------------------------------------------------------------------
@@ -31,6 +31,9 @@ class MockRecommendationServiceStub : public RecommendationService::StubInterfac
   MOCK_METHOD3(ListRecommendations, ::grpc::Status(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::oteldemo::ListRecommendationsResponse* response));
   MOCK_METHOD3(AsyncListRecommendationsRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>*(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq));
   MOCK_METHOD3(PrepareAsyncListRecommendationsRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsResponse>*(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(ListRecommendationsBatch, ::grpc::Status(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::oteldemo::ListRecommendationsBatchResponse* response));
+  MOCK_METHOD3(AsyncListRecommendationsBatchRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>*(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(PrepareAsyncListRecommendationsBatchRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::ListRecommendationsBatchResponse>*(::grpc::ClientContext* context, const ::oteldemo::ListRecommendationsBatchRequest& request, ::grpc::CompletionQueue* cq));
 };
 
 class MockProductCatalogServiceStub : public ProductCatalogService::StubInterface {
@@ -57,6 +60,21 @@ class MockProductReviewServiceStub : public ProductReviewService::StubInterface
   MOCK_METHOD3(AskProductAIAssistant, ::grpc::Status(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest& request, ::oteldemo::AskProductAIAssistantResponse* response));
   MOCK_METHOD3(AsyncAskProductAIAssistantRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::AskProductAIAssistantResponse>*(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest& request, ::grpc::CompletionQueue* cq));
   MOCK_METHOD3(PrepareAsyncAskProductAIAssistantRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::AskProductAIAssistantResponse>*(::grpc::ClientContext* context, const ::oteldemo::AskProductAIAssistantRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(GetProductReviewScoreHistogram, ::grpc::Status(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::oteldemo::GetProductReviewScoreHistogramResponse* response));
+  MOCK_METHOD3(AsyncGetProductReviewScoreHistogramRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewScoreHistogramResponse>*(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(PrepareAsyncGetProductReviewScoreHistogramRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewScoreHistogramResponse>*(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewScoreHistogramRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(GetProductReviewsBatch, ::grpc::Status(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::oteldemo::GetProductReviewsBatchResponse* response));
+  MOCK_METHOD3(AsyncGetProductReviewsBatchRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsBatchResponse>*(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(PrepareAsyncGetProductReviewsBatchRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsBatchResponse>*(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsBatchRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(GetAverageScoresBatch, ::grpc::Status(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::oteldemo::GetAverageScoresBatchResponse* response));
+  MOCK_METHOD3(AsyncGetAverageScoresBatchRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetAverageScoresBatchResponse>*(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(PrepareAsyncGetAverageScoresBatchRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetAverageScoresBatchResponse>*(::grpc::ClientContext* context, const ::oteldemo::GetAverageScoresBatchRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(GetProductReviewsPage, ::grpc::Status(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::oteldemo::GetProductReviewsPageResponse* response));
+  MOCK_METHOD3(AsyncGetProductReviewsPageRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsPageResponse>*(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD3(PrepareAsyncGetProductReviewsPageRaw, ::grpc::ClientAsyncResponseReaderInterface< ::oteldemo::GetProductReviewsPageResponse>*(::grpc::ClientContext* context, const ::oteldemo::GetProductReviewsPageRequest& request, ::grpc::CompletionQueue* cq));
+  MOCK_METHOD2(StreamProductReviewsRaw, ::grpc::ClientReaderInterface< ::oteldemo::ProductReview>*(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request));
+  MOCK_METHOD4(AsyncStreamProductReviewsRaw, ::grpc::ClientAsyncReaderInterface< ::oteldemo::ProductReview>*(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq, void* tag));
+  MOCK_METHOD3(PrepareAsyncStreamProductReviewsRaw, ::grpc::ClientAsyncReaderInterface< ::oteldemo::ProductReview>*(::grpc::ClientContext* context, const ::oteldemo::StreamProductReviewsRequest& request, ::grpc::CompletionQueue* cq));
 };
 
 class MockShippingServiceStub : public ShippingService::StubInterface {
@@ -11,7 +11,9 @@ import {
   type ChannelCredentials,
   Client,
   type ClientOptions,
+  type ClientReadableStream,
   type ClientUnaryCall,
+  type handleServerStreamingCall,
   type handleUnaryCall,
   makeGenericClientConstructor,
   type Metadata,
@@ -56,6 +58,14 @@ export interface ListRecommendationsResponse {
   productIds: string[];
 }
 
+export interface ListRecommendationsBatchRequest {
+  requests: ListRecommendationsRequest[];
+}
+
+export interface ListRecommendationsBatchResponse {
+  responses: ListRecommendationsResponse[];
+}
+
 export interface Product {
   id: string;
   name: string;
@@ -109,6 +119,65 @@ export interface GetAverageProductReviewScoreResponse {
   averageScore: string;
 }
 
+export interface GetProductReviewScoreHistogramRequest {
+  productId: string;
+}
+
+export interface GetProductReviewScoreHistogramResponse {
+  reviewCount: number;
+  averageScore: string;
+  /** Number of reviews per star rating, from 1 to 5 stars */
+  starCounts: number[];
+}
+
+export interface GetProductReviewsBatchRequest {
+  productIds: string[];
+}
+
+export interface ProductReviews {
+  productId: string;
+  productReviews: ProductReview[];
+}
+
+export interface GetProductReviewsBatchResponse {
+  /** In the order of the requested product ids */
+  productReviews: ProductReviews[];
+}
+
+export interface GetAverageScoresBatchRequest {
+  productIds: string[];
+}
+
+export interface ProductAverageScore {
+  productId: string;
+  averageScore: string;
+}
+
+export interface GetAverageScoresBatchResponse {
+  /** In the order of the requested product ids */
+  averageScores: ProductAverageScore[];
+}
+
+export interface GetProductReviewsPageRequest {
+  productId: string;
+  /** Defaults to 20 reviews, at most 100 */
+  pageSize: number;
+  /** next_page_token of the previous page, empty for the first page */
+  pageToken: string;
+  /** Highest scores first instead of oldest reviews first */
+  orderByScore: boolean;
+}
+
+export interface GetProductReviewsPageResponse {
+  productReviews: ProductReview[];
+  /** Empty on the last page */
+  nextPageToken: string;
+}
+
+export interface StreamProductReviewsRequest {
+  productId: string;
+}
+
 export interface AskProductAIAssistantRequest {
   productId: string;
   question: string;
@@ -812,6 +881,136 @@ export const ListRecommendationsResponse: MessageFns<ListRecommendationsResponse
   },
 };
 
+function createBaseListRecommendationsBatchRequest(): ListRecommendationsBatchRequest {
+  return { requests: [] };
+}
+
+export const ListRecommendationsBatchRequest: MessageFns<ListRecommendationsBatchRequest> = {
+  encode(message: ListRecommendationsBatchRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.requests) {
+      ListRecommendationsRequest.encode(v!, writer.uint32(10).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ListRecommendationsBatchRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseListRecommendationsBatchRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.requests.push(ListRecommendationsRequest.decode(reader, reader.uint32()));
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ListRecommendationsBatchRequest {
+    return {
+      requests: globalThis.Array.isArray(object?.requests)
+        ? object.requests.map((e: any) => ListRecommendationsRequest.fromJSON(e))
+        : [],
+    };
+  },
+
+  toJSON(message: ListRecommendationsBatchRequest): unknown {
+    const obj: any = {};
+    if (message.requests?.length) {
+      obj.requests = message.requests.map((e) => ListRecommendationsRequest.toJSON(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ListRecommendationsBatchRequest>, I>>(base?: I): ListRecommendationsBatchRequest {
+    return ListRecommendationsBatchRequest.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ListRecommendationsBatchRequest>, I>>(
+    object: I,
+  ): ListRecommendationsBatchRequest {
+    const message = createBaseListRecommendationsBatchRequest();
+    message.requests = object.requests?.map((e) => ListRecommendationsRequest.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBaseListRecommendationsBatchResponse(): ListRecommendationsBatchResponse {
+  return { responses: [] };
+}
+
+export const ListRecommendationsBatchResponse: MessageFns<ListRecommendationsBatchResponse> = {
+  encode(message: ListRecommendationsBatchResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.responses) {
+      ListRecommendationsResponse.encode(v!, writer.uint32(10).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ListRecommendationsBatchResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseListRecommendationsBatchResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.responses.push(ListRecommendationsResponse.decode(reader, reader.uint32()));
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ListRecommendationsBatchResponse {
+    return {
+      responses: globalThis.Array.isArray(object?.responses)
+        ? object.responses.map((e: any) => ListRecommendationsResponse.fromJSON(e))
+        : [],
+    };
+  },
+
+  toJSON(message: ListRecommendationsBatchResponse): unknown {
+    const obj: any = {};
+    if (message.responses?.length) {
+      obj.responses = message.responses.map((e) => ListRecommendationsResponse.toJSON(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ListRecommendationsBatchResponse>, I>>(
+    base?: I,
+  ): ListRecommendationsBatchResponse {
+    return ListRecommendationsBatchResponse.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ListRecommendationsBatchResponse>, I>>(
+    object: I,
+  ): ListRecommendationsBatchResponse {
+    const message = createBaseListRecommendationsBatchResponse();
+    message.responses = object.responses?.map((e) => ListRecommendationsResponse.fromPartial(e)) || [];
+    return message;
+  },
+};
+
 function createBaseProduct(): Product {
   return { id: "", name: "", description: "", picture: "", priceUsd: undefined, categories: [] };
 }
@@ -1182,38 +1381,811 @@ export const SearchProductsResponse: MessageFns<SearchProductsResponse> = {
     return obj;
   },
 
-  create<I extends Exact<DeepPartial<SearchProductsResponse>, I>>(base?: I): SearchProductsResponse {
-    return SearchProductsResponse.fromPartial(base ?? ({} as any));
+  create<I extends Exact<DeepPartial<SearchProductsResponse>, I>>(base?: I): SearchProductsResponse {
+    return SearchProductsResponse.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<SearchProductsResponse>, I>>(object: I): SearchProductsResponse {
+    const message = createBaseSearchProductsResponse();
+    message.results = object.results?.map((e) => Product.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBaseProductReview(): ProductReview {
+  return { username: "", description: "", score: "" };
+}
+
+export const ProductReview: MessageFns<ProductReview> = {
+  encode(message: ProductReview, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.username !== "") {
+      writer.uint32(10).string(message.username);
+    }
+    if (message.description !== "") {
+      writer.uint32(18).string(message.description);
+    }
+    if (message.score !== "") {
+      writer.uint32(26).string(message.score);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ProductReview {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseProductReview();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.username = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.description = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.score = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ProductReview {
+    return {
+      username: isSet(object.username) ? globalThis.String(object.username) : "",
+      description: isSet(object.description) ? globalThis.String(object.description) : "",
+      score: isSet(object.score) ? globalThis.String(object.score) : "",
+    };
+  },
+
+  toJSON(message: ProductReview): unknown {
+    const obj: any = {};
+    if (message.username !== "") {
+      obj.username = message.username;
+    }
+    if (message.description !== "") {
+      obj.description = message.description;
+    }
+    if (message.score !== "") {
+      obj.score = message.score;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ProductReview>, I>>(base?: I): ProductReview {
+    return ProductReview.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ProductReview>, I>>(object: I): ProductReview {
+    const message = createBaseProductReview();
+    message.username = object.username ?? "";
+    message.description = object.description ?? "";
+    message.score = object.score ?? "";
+    return message;
+  },
+};
+
+function createBaseGetProductReviewsRequest(): GetProductReviewsRequest {
+  return { productId: "" };
+}
+
+export const GetProductReviewsRequest: MessageFns<GetProductReviewsRequest> = {
+  encode(message: GetProductReviewsRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.productId !== "") {
+      writer.uint32(10).string(message.productId);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetProductReviewsRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetProductReviewsRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.productId = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetProductReviewsRequest {
+    return { productId: isSet(object.productId) ? globalThis.String(object.productId) : "" };
+  },
+
+  toJSON(message: GetProductReviewsRequest): unknown {
+    const obj: any = {};
+    if (message.productId !== "") {
+      obj.productId = message.productId;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<GetProductReviewsRequest>, I>>(base?: I): GetProductReviewsRequest {
+    return GetProductReviewsRequest.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<GetProductReviewsRequest>, I>>(object: I): GetProductReviewsRequest {
+    const message = createBaseGetProductReviewsRequest();
+    message.productId = object.productId ?? "";
+    return message;
+  },
+};
+
+function createBaseGetProductReviewsResponse(): GetProductReviewsResponse {
+  return { productReviews: [] };
+}
+
+export const GetProductReviewsResponse: MessageFns<GetProductReviewsResponse> = {
+  encode(message: GetProductReviewsResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.productReviews) {
+      ProductReview.encode(v!, writer.uint32(10).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetProductReviewsResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetProductReviewsResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.productReviews.push(ProductReview.decode(reader, reader.uint32()));
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetProductReviewsResponse {
+    return {
+      productReviews: globalThis.Array.isArray(object?.productReviews)
+        ? object.productReviews.map((e: any) => ProductReview.fromJSON(e))
+        : [],
+    };
+  },
+
+  toJSON(message: GetProductReviewsResponse): unknown {
+    const obj: any = {};
+    if (message.productReviews?.length) {
+      obj.productReviews = message.productReviews.map((e) => ProductReview.toJSON(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<GetProductReviewsResponse>, I>>(base?: I): GetProductReviewsResponse {
+    return GetProductReviewsResponse.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<GetProductReviewsResponse>, I>>(object: I): GetProductReviewsResponse {
+    const message = createBaseGetProductReviewsResponse();
+    message.productReviews = object.productReviews?.map((e) => ProductReview.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBaseGetAverageProductReviewScoreRequest(): GetAverageProductReviewScoreRequest {
+  return { productId: "" };
+}
+
+export const GetAverageProductReviewScoreRequest: MessageFns<GetAverageProductReviewScoreRequest> = {
+  encode(message: GetAverageProductReviewScoreRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.productId !== "") {
+      writer.uint32(10).string(message.productId);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetAverageProductReviewScoreRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetAverageProductReviewScoreRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.productId = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetAverageProductReviewScoreRequest {
+    return { productId: isSet(object.productId) ? globalThis.String(object.productId) : "" };
+  },
+
+  toJSON(message: GetAverageProductReviewScoreRequest): unknown {
+    const obj: any = {};
+    if (message.productId !== "") {
+      obj.productId = message.productId;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<GetAverageProductReviewScoreRequest>, I>>(
+    base?: I,
+  ): GetAverageProductReviewScoreRequest {
+    return GetAverageProductReviewScoreRequest.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<GetAverageProductReviewScoreRequest>, I>>(
+    object: I,
+  ): GetAverageProductReviewScoreRequest {
+    const message = createBaseGetAverageProductReviewScoreRequest();
+    message.productId = object.productId ?? "";
+    return message;
+  },
+};
+
+function createBaseGetAverageProductReviewScoreResponse(): GetAverageProductReviewScoreResponse {
+  return { averageScore: "" };
+}
+
+export const GetAverageProductReviewScoreResponse: MessageFns<GetAverageProductReviewScoreResponse> = {
+  encode(message: GetAverageProductReviewScoreResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.averageScore !== "") {
+      writer.uint32(10).string(message.averageScore);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetAverageProductReviewScoreResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetAverageProductReviewScoreResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.averageScore = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetAverageProductReviewScoreResponse {
+    return { averageScore: isSet(object.averageScore) ? globalThis.String(object.averageScore) : "" };
+  },
+
+  toJSON(message: GetAverageProductReviewScoreResponse): unknown {
+    const obj: any = {};
+    if (message.averageScore !== "") {
+      obj.averageScore = message.averageScore;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<GetAverageProductReviewScoreResponse>, I>>(
+    base?: I,
+  ): GetAverageProductReviewScoreResponse {
+    return GetAverageProductReviewScoreResponse.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<GetAverageProductReviewScoreResponse>, I>>(
+    object: I,
+  ): GetAverageProductReviewScoreResponse {
+    const message = createBaseGetAverageProductReviewScoreResponse();
+    message.averageScore = object.averageScore ?? "";
+    return message;
+  },
+};
+
+function createBaseGetProductReviewScoreHistogramRequest(): GetProductReviewScoreHistogramRequest {
+  return { productId: "" };
+}
+
+export const GetProductReviewScoreHistogramRequest: MessageFns<GetProductReviewScoreHistogramRequest> = {
+  encode(message: GetProductReviewScoreHistogramRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.productId !== "") {
+      writer.uint32(10).string(message.productId);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetProductReviewScoreHistogramRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetProductReviewScoreHistogramRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.productId = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetProductReviewScoreHistogramRequest {
+    return { productId: isSet(object.productId) ? globalThis.String(object.productId) : "" };
+  },
+
+  toJSON(message: GetProductReviewScoreHistogramRequest): unknown {
+    const obj: any = {};
+    if (message.productId !== "") {
+      obj.productId = message.productId;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<GetProductReviewScoreHistogramRequest>, I>>(
+    base?: I,
+  ): GetProductReviewScoreHistogramRequest {
+    return GetProductReviewScoreHistogramRequest.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<GetProductReviewScoreHistogramRequest>, I>>(
+    object: I,
+  ): GetProductReviewScoreHistogramRequest {
+    const message = createBaseGetProductReviewScoreHistogramRequest();
+    message.productId = object.productId ?? "";
+    return message;
+  },
+};
+
+function createBaseGetProductReviewScoreHistogramResponse(): GetProductReviewScoreHistogramResponse {
+  return { reviewCount: 0, averageScore: "", starCounts: [] };
+}
+
+export const GetProductReviewScoreHistogramResponse: MessageFns<GetProductReviewScoreHistogramResponse> = {
+  encode(message: GetProductReviewScoreHistogramResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.reviewCount !== 0) {
+      writer.uint32(8).int32(message.reviewCount);
+    }
+    if (message.averageScore !== "") {
+      writer.uint32(18).string(message.averageScore);
+    }
+    writer.uint32(26).fork();
+    for (const v of message.starCounts) {
+      writer.int32(v);
+    }
+    writer.join();
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetProductReviewScoreHistogramResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetProductReviewScoreHistogramResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.reviewCount = reader.int32();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.averageScore = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag === 24) {
+            message.starCounts.push(reader.int32());
+
+            continue;
+          }
+
+          if (tag === 26) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.starCounts.push(reader.int32());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetProductReviewScoreHistogramResponse {
+    return {
+      reviewCount: isSet(object.reviewCount) ? globalThis.Number(object.reviewCount) : 0,
+      averageScore: isSet(object.averageScore) ? globalThis.String(object.averageScore) : "",
+      starCounts: globalThis.Array.isArray(object?.starCounts)
+        ? object.starCounts.map((e: any) => globalThis.Number(e))
+        : [],
+    };
+  },
+
+  toJSON(message: GetProductReviewScoreHistogramResponse): unknown {
+    const obj: any = {};
+    if (message.reviewCount !== 0) {
+      obj.reviewCount = Math.round(message.reviewCount);
+    }
+    if (message.averageScore !== "") {
+      obj.averageScore = message.averageScore;
+    }
+    if (message.starCounts?.length) {
+      obj.starCounts = message.starCounts.map((e) => Math.round(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<GetProductReviewScoreHistogramResponse>, I>>(
+    base?: I,
+  ): GetProductReviewScoreHistogramResponse {
+    return GetProductReviewScoreHistogramResponse.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<GetProductReviewScoreHistogramResponse>, I>>(
+    object: I,
+  ): GetProductReviewScoreHistogramResponse {
+    const message = createBaseGetProductReviewScoreHistogramResponse();
+    message.reviewCount = object.reviewCount ?? 0;
+    message.averageScore = object.averageScore ?? "";
+    message.starCounts = object.starCounts?.map((e) => e) || [];
+    return message;
+  },
+};
+
+function createBaseGetProductReviewsBatchRequest(): GetProductReviewsBatchRequest {
+  return { productIds: [] };
+}
+
+export const GetProductReviewsBatchRequest: MessageFns<GetProductReviewsBatchRequest> = {
+  encode(message: GetProductReviewsBatchRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.productIds) {
+      writer.uint32(10).string(v!);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetProductReviewsBatchRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetProductReviewsBatchRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.productIds.push(reader.string());
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetProductReviewsBatchRequest {
+    return {
+      productIds: globalThis.Array.isArray(object?.productIds)
+        ? object.productIds.map((e: any) => globalThis.String(e))
+        : [],
+    };
+  },
+
+  toJSON(message: GetProductReviewsBatchRequest): unknown {
+    const obj: any = {};
+    if (message.productIds?.length) {
+      obj.productIds = message.productIds;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<GetProductReviewsBatchRequest>, I>>(base?: I): GetProductReviewsBatchRequest {
+    return GetProductReviewsBatchRequest.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<GetProductReviewsBatchRequest>, I>>(
+    object: I,
+  ): GetProductReviewsBatchRequest {
+    const message = createBaseGetProductReviewsBatchRequest();
+    message.productIds = object.productIds?.map((e) => e) || [];
+    return message;
+  },
+};
+
+function createBaseProductReviews(): ProductReviews {
+  return { productId: "", productReviews: [] };
+}
+
+export const ProductReviews: MessageFns<ProductReviews> = {
+  encode(message: ProductReviews, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.productId !== "") {
+      writer.uint32(10).string(message.productId);
+    }
+    for (const v of message.productReviews) {
+      ProductReview.encode(v!, writer.uint32(18).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ProductReviews {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseProductReviews();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.productId = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.productReviews.push(ProductReview.decode(reader, reader.uint32()));
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ProductReviews {
+    return {
+      productId: isSet(object.productId) ? globalThis.String(object.productId) : "",
+      productReviews: globalThis.Array.isArray(object?.productReviews)
+        ? object.productReviews.map((e: any) => ProductReview.fromJSON(e))
+        : [],
+    };
+  },
+
+  toJSON(message: ProductReviews): unknown {
+    const obj: any = {};
+    if (message.productId !== "") {
+      obj.productId = message.productId;
+    }
+    if (message.productReviews?.length) {
+      obj.productReviews = message.productReviews.map((e) => ProductReview.toJSON(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ProductReviews>, I>>(base?: I): ProductReviews {
+    return ProductReviews.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ProductReviews>, I>>(object: I): ProductReviews {
+    const message = createBaseProductReviews();
+    message.productId = object.productId ?? "";
+    message.productReviews = object.productReviews?.map((e) => ProductReview.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBaseGetProductReviewsBatchResponse(): GetProductReviewsBatchResponse {
+  return { productReviews: [] };
+}
+
+export const GetProductReviewsBatchResponse: MessageFns<GetProductReviewsBatchResponse> = {
+  encode(message: GetProductReviewsBatchResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.productReviews) {
+      ProductReviews.encode(v!, writer.uint32(10).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetProductReviewsBatchResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetProductReviewsBatchResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.productReviews.push(ProductReviews.decode(reader, reader.uint32()));
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetProductReviewsBatchResponse {
+    return {
+      productReviews: globalThis.Array.isArray(object?.productReviews)
+        ? object.productReviews.map((e: any) => ProductReviews.fromJSON(e))
+        : [],
+    };
+  },
+
+  toJSON(message: GetProductReviewsBatchResponse): unknown {
+    const obj: any = {};
+    if (message.productReviews?.length) {
+      obj.productReviews = message.productReviews.map((e) => ProductReviews.toJSON(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<GetProductReviewsBatchResponse>, I>>(base?: I): GetProductReviewsBatchResponse {
+    return GetProductReviewsBatchResponse.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<GetProductReviewsBatchResponse>, I>>(
+    object: I,
+  ): GetProductReviewsBatchResponse {
+    const message = createBaseGetProductReviewsBatchResponse();
+    message.productReviews = object.productReviews?.map((e) => ProductReviews.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBaseGetAverageScoresBatchRequest(): GetAverageScoresBatchRequest {
+  return { productIds: [] };
+}
+
+export const GetAverageScoresBatchRequest: MessageFns<GetAverageScoresBatchRequest> = {
+  encode(message: GetAverageScoresBatchRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.productIds) {
+      writer.uint32(10).string(v!);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetAverageScoresBatchRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetAverageScoresBatchRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.productIds.push(reader.string());
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetAverageScoresBatchRequest {
+    return {
+      productIds: globalThis.Array.isArray(object?.productIds)
+        ? object.productIds.map((e: any) => globalThis.String(e))
+        : [],
+    };
+  },
+
+  toJSON(message: GetAverageScoresBatchRequest): unknown {
+    const obj: any = {};
+    if (message.productIds?.length) {
+      obj.productIds = message.productIds;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<GetAverageScoresBatchRequest>, I>>(base?: I): GetAverageScoresBatchRequest {
+    return GetAverageScoresBatchRequest.fromPartial(base ?? ({} as any));
   },
-  fromPartial<I extends Exact<DeepPartial<SearchProductsResponse>, I>>(object: I): SearchProductsResponse {
-    const message = createBaseSearchProductsResponse();
-    message.results = object.results?.map((e) => Product.fromPartial(e)) || [];
+  fromPartial<I extends Exact<DeepPartial<GetAverageScoresBatchRequest>, I>>(object: I): GetAverageScoresBatchRequest {
+    const message = createBaseGetAverageScoresBatchRequest();
+    message.productIds = object.productIds?.map((e) => e) || [];
     return message;
   },
 };
 
-function createBaseProductReview(): ProductReview {
-  return { username: "", description: "", score: "" };
+function createBaseProductAverageScore(): ProductAverageScore {
+  return { productId: "", averageScore: "" };
 }
 
-export const ProductReview: MessageFns<ProductReview> = {
-  encode(message: ProductReview, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    if (message.username !== "") {
-      writer.uint32(10).string(message.username);
-    }
-    if (message.description !== "") {
-      writer.uint32(18).string(message.description);
+export const ProductAverageScore: MessageFns<ProductAverageScore> = {
+  encode(message: ProductAverageScore, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.productId !== "") {
+      writer.uint32(10).string(message.productId);
     }
-    if (message.score !== "") {
-      writer.uint32(26).string(message.score);
+    if (message.averageScore !== "") {
+      writer.uint32(18).string(message.averageScore);
     }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): ProductReview {
+  decode(input: BinaryReader | Uint8Array, length?: number): ProductAverageScore {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     const end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseProductReview();
+    const message = createBaseProductAverageScore();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
@@ -1222,7 +2194,7 @@ export const ProductReview: MessageFns<ProductReview> = {
             break;
           }
 
-          message.username = reader.string();
+          message.productId = reader.string();
           continue;
         }
         case 2: {
@@ -1230,15 +2202,7 @@ export const ProductReview: MessageFns<ProductReview> = {
             break;
           }
 
-          message.description = reader.string();
-          continue;
-        }
-        case 3: {
-          if (tag !== 26) {
-            break;
-          }
-
-          message.score = reader.string();
+          message.averageScore = reader.string();
           continue;
         }
       }
@@ -1250,56 +2214,51 @@ export const ProductReview: MessageFns<ProductReview> = {
     return message;
   },
 
-  fromJSON(object: any): ProductReview {
+  fromJSON(object: any): ProductAverageScore {
     return {
-      username: isSet(object.username) ? globalThis.String(object.username) : "",
-      description: isSet(object.description) ? globalThis.String(object.description) : "",
-      score: isSet(object.score) ? globalThis.String(object.score) : "",
+      productId: isSet(object.productId) ? globalThis.String(object.productId) : "",
+      averageScore: isSet(object.averageScore) ? globalThis.String(object.averageScore) : "",
     };
   },
 
-  toJSON(message: ProductReview): unknown {
+  toJSON(message: ProductAverageScore): unknown {
     const obj: any = {};
-    if (message.username !== "") {
-      obj.username = message.username;
-    }
-    if (message.description !== "") {
-      obj.description = message.description;
+    if (message.productId !== "") {
+      obj.productId = message.productId;
     }
-    if (message.score !== "") {
-      obj.score = message.score;
+    if (message.averageScore !== "") {
+      obj.averageScore = message.averageScore;
     }
     return obj;
   },
 
-  create<I extends Exact<DeepPartial<ProductReview>, I>>(base?: I): ProductReview {
-    return ProductReview.fromPartial(base ?? ({} as any));
+  create<I extends Exact<DeepPartial<ProductAverageScore>, I>>(base?: I): ProductAverageScore {
+    return ProductAverageScore.fromPartial(base ?? ({} as any));
   },
-  fromPartial<I extends Exact<DeepPartial<ProductReview>, I>>(object: I): ProductReview {
-    const message = createBaseProductReview();
-    message.username = object.username ?? "";
-    message.description = object.description ?? "";
-    message.score = object.score ?? "";
+  fromPartial<I extends Exact<DeepPartial<ProductAverageScore>, I>>(object: I): ProductAverageScore {
+    const message = createBaseProductAverageScore();
+    message.productId = object.productId ?? "";
+    message.averageScore = object.averageScore ?? "";
     return message;
   },
 };
 
-function createBaseGetProductReviewsRequest(): GetProductReviewsRequest {
-  return { productId: "" };
+function createBaseGetAverageScoresBatchResponse(): GetAverageScoresBatchResponse {
+  return { averageScores: [] };
 }
 
-export const GetProductReviewsRequest: MessageFns<GetProductReviewsRequest> = {
-  encode(message: GetProductReviewsRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    if (message.productId !== "") {
-      writer.uint32(10).string(message.productId);
+export const GetAverageScoresBatchResponse: MessageFns<GetAverageScoresBatchResponse> = {
+  encode(message: GetAverageScoresBatchResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.averageScores) {
+      ProductAverageScore.encode(v!, writer.uint32(10).fork()).join();
     }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): GetProductReviewsRequest {
+  decode(input: BinaryReader | Uint8Array, length?: number): GetAverageScoresBatchResponse {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     const end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseGetProductReviewsRequest();
+    const message = createBaseGetAverageScoresBatchResponse();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
@@ -1308,7 +2267,7 @@ export const GetProductReviewsRequest: MessageFns<GetProductReviewsRequest> = {
             break;
           }
 
-          message.productId = reader.string();
+          message.averageScores.push(ProductAverageScore.decode(reader, reader.uint32()));
           continue;
         }
       }
@@ -1320,44 +2279,59 @@ export const GetProductReviewsRequest: MessageFns<GetProductReviewsRequest> = {
     return message;
   },
 
-  fromJSON(object: any): GetProductReviewsRequest {
-    return { productId: isSet(object.productId) ? globalThis.String(object.productId) : "" };
+  fromJSON(object: any): GetAverageScoresBatchResponse {
+    return {
+      averageScores: globalThis.Array.isArray(object?.averageScores)
+        ? object.averageScores.map((e: any) => ProductAverageScore.fromJSON(e))
+        : [],
+    };
   },
 
-  toJSON(message: GetProductReviewsRequest): unknown {
+  toJSON(message: GetAverageScoresBatchResponse): unknown {
     const obj: any = {};
-    if (message.productId !== "") {
-      obj.productId = message.productId;
+    if (message.averageScores?.length) {
+      obj.averageScores = message.averageScores.map((e) => ProductAverageScore.toJSON(e));
     }
     return obj;
   },
 
-  create<I extends Exact<DeepPartial<GetProductReviewsRequest>, I>>(base?: I): GetProductReviewsRequest {
-    return GetProductReviewsRequest.fromPartial(base ?? ({} as any));
+  create<I extends Exact<DeepPartial<GetAverageScoresBatchResponse>, I>>(base?: I): GetAverageScoresBatchResponse {
+    return GetAverageScoresBatchResponse.fromPartial(base ?? ({} as any));
   },
-  fromPartial<I extends Exact<DeepPartial<GetProductReviewsRequest>, I>>(object: I): GetProductReviewsRequest {
-    const message = createBaseGetProductReviewsRequest();
-    message.productId = object.productId ?? "";
+  fromPartial<I extends Exact<DeepPartial<GetAverageScoresBatchResponse>, I>>(
+    object: I,
+  ): GetAverageScoresBatchResponse {
+    const message = createBaseGetAverageScoresBatchResponse();
+    message.averageScores = object.averageScores?.map((e) => ProductAverageScore.fromPartial(e)) || [];
     return message;
   },
 };
 
-function createBaseGetProductReviewsResponse(): GetProductReviewsResponse {
-  return { productReviews: [] };
+function createBaseGetProductReviewsPageRequest(): GetProductReviewsPageRequest {
+  return { productId: "", pageSize: 0, pageToken: "", orderByScore: false };
 }
 
-export const GetProductReviewsResponse: MessageFns<GetProductReviewsResponse> = {
-  encode(message: GetProductReviewsResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    for (const v of message.productReviews) {
-      ProductReview.encode(v!, writer.uint32(10).fork()).join();
+export const GetProductReviewsPageRequest: MessageFns<GetProductReviewsPageRequest> = {
+  encode(message: GetProductReviewsPageRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.productId !== "") {
+      writer.uint32(10).string(message.productId);
+    }
+    if (message.pageSize !== 0) {
+      writer.uint32(16).int32(message.pageSize);
+    }
+    if (message.pageToken !== "") {
+      writer.uint32(26).string(message.pageToken);
+    }
+    if (message.orderByScore !== false) {
+      writer.uint32(32).bool(message.orderByScore);
     }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): GetProductReviewsResponse {
+  decode(input: BinaryReader | Uint8Array, length?: number): GetProductReviewsPageRequest {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     const end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseGetProductReviewsResponse();
+    const message = createBaseGetProductReviewsPageRequest();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
@@ -1366,7 +2340,31 @@ export const GetProductReviewsResponse: MessageFns<GetProductReviewsResponse> =
             break;
           }
 
-          message.productReviews.push(ProductReview.decode(reader, reader.uint32()));
+          message.productId = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.pageSize = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.pageToken = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.orderByScore = reader.bool();
           continue;
         }
       }
@@ -1378,48 +2376,64 @@ export const GetProductReviewsResponse: MessageFns<GetProductReviewsResponse> =
     return message;
   },
 
-  fromJSON(object: any): GetProductReviewsResponse {
+  fromJSON(object: any): GetProductReviewsPageRequest {
     return {
-      productReviews: globalThis.Array.isArray(object?.productReviews)
-        ? object.productReviews.map((e: any) => ProductReview.fromJSON(e))
-        : [],
+      productId: isSet(object.productId) ? globalThis.String(object.productId) : "",
+      pageSize: isSet(object.pageSize) ? globalThis.Number(object.pageSize) : 0,
+      pageToken: isSet(object.pageToken) ? globalThis.String(object.pageToken) : "",
+      orderByScore: isSet(object.orderByScore) ? globalThis.Boolean(object.orderByScore) : false,
     };
   },
 
-  toJSON(message: GetProductReviewsResponse): unknown {
+  toJSON(message: GetProductReviewsPageRequest): unknown {
     const obj: any = {};
-    if (message.productReviews?.length) {
-      obj.productReviews = message.productReviews.map((e) => ProductReview.toJSON(e));
+    if (message.productId !== "") {
+      obj.productId = message.productId;
+    }
+    if (message.pageSize !== 0) {
+      obj.pageSize = Math.round(message.pageSize);
+    }
+    if (message.pageToken !== "") {
+      obj.pageToken = message.pageToken;
+    }
+    if (message.orderByScore !== false) {
+      obj.orderByScore = message.orderByScore;
     }
     return obj;
   },
 
-  create<I extends Exact<DeepPartial<GetProductReviewsResponse>, I>>(base?: I): GetProductReviewsResponse {
-    return GetProductReviewsResponse.fromPartial(base ?? ({} as any));
+  create<I extends Exact<DeepPartial<GetProductReviewsPageRequest>, I>>(base?: I): GetProductReviewsPageRequest {
+    return GetProductReviewsPageRequest.fromPartial(base ?? ({} as any));
   },
-  fromPartial<I extends Exact<DeepPartial<GetProductReviewsResponse>, I>>(object: I): GetProductReviewsResponse {
-    const message = createBaseGetProductReviewsResponse();
-    message.productReviews = object.productReviews?.map((e) => ProductReview.fromPartial(e)) || [];
+  fromPartial<I extends Exact<DeepPartial<GetProductReviewsPageRequest>, I>>(object: I): GetProductReviewsPageRequest {
+    const message = createBaseGetProductReviewsPageRequest();
+    message.productId = object.productId ?? "";
+    message.pageSize = object.pageSize ?? 0;
+    message.pageToken = object.pageToken ?? "";
+    message.orderByScore = object.orderByScore ?? false;
     return message;
   },
 };
 
-function createBaseGetAverageProductReviewScoreRequest(): GetAverageProductReviewScoreRequest {
-  return { productId: "" };
+function createBaseGetProductReviewsPageResponse(): GetProductReviewsPageResponse {
+  return { productReviews: [], nextPageToken: "" };
 }
 
-export const GetAverageProductReviewScoreRequest: MessageFns<GetAverageProductReviewScoreRequest> = {
-  encode(message: GetAverageProductReviewScoreRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    if (message.productId !== "") {
-      writer.uint32(10).string(message.productId);
+export const GetProductReviewsPageResponse: MessageFns<GetProductReviewsPageResponse> = {
+  encode(message: GetProductReviewsPageResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.productReviews) {
+      ProductReview.encode(v!, writer.uint32(10).fork()).join();
+    }
+    if (message.nextPageToken !== "") {
+      writer.uint32(18).string(message.nextPageToken);
     }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): GetAverageProductReviewScoreRequest {
+  decode(input: BinaryReader | Uint8Array, length?: number): GetProductReviewsPageResponse {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     const end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseGetAverageProductReviewScoreRequest();
+    const message = createBaseGetProductReviewsPageResponse();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
@@ -1428,7 +2442,15 @@ export const GetAverageProductReviewScoreRequest: MessageFns<GetAverageProductRe
             break;
           }
 
-          message.productId = reader.string();
+          message.productReviews.push(ProductReview.decode(reader, reader.uint32()));
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.nextPageToken = reader.string();
           continue;
         }
       }
@@ -1440,48 +2462,55 @@ export const GetAverageProductReviewScoreRequest: MessageFns<GetAverageProductRe
     return message;
   },
 
-  fromJSON(object: any): GetAverageProductReviewScoreRequest {
-    return { productId: isSet(object.productId) ? globalThis.String(object.productId) : "" };
+  fromJSON(object: any): GetProductReviewsPageResponse {
+    return {
+      productReviews: globalThis.Array.isArray(object?.productReviews)
+        ? object.productReviews.map((e: any) => ProductReview.fromJSON(e))
+        : [],
+      nextPageToken: isSet(object.nextPageToken) ? globalThis.String(object.nextPageToken) : "",
+    };
   },
 
-  toJSON(message: GetAverageProductReviewScoreRequest): unknown {
+  toJSON(message: GetProductReviewsPageResponse): unknown {
     const obj: any = {};
-    if (message.productId !== "") {
-      obj.productId = message.productId;
+    if (message.productReviews?.length) {
+      obj.productReviews = message.productReviews.map((e) => ProductReview.toJSON(e));
+    }
+    if (message.nextPageToken !== "") {
+      obj.nextPageToken = message.nextPageToken;
     }
     return obj;
   },
 
-  create<I extends Exact<DeepPartial<GetAverageProductReviewScoreRequest>, I>>(
-    base?: I,
-  ): GetAverageProductReviewScoreRequest {
-    return GetAverageProductReviewScoreRequest.fromPartial(base ?? ({} as any));
+  create<I extends Exact<DeepPartial<GetProductReviewsPageResponse>, I>>(base?: I): GetProductReviewsPageResponse {
+    return GetProductReviewsPageResponse.fromPartial(base ?? ({} as any));
   },
-  fromPartial<I extends Exact<DeepPartial<GetAverageProductReviewScoreRequest>, I>>(
+  fromPartial<I extends Exact<DeepPartial<GetProductReviewsPageResponse>, I>>(
     object: I,
-  ): GetAverageProductReviewScoreRequest {
-    const message = createBaseGetAverageProductReviewScoreRequest();
-    message.productId = object.productId ?? "";
+  ): GetProductReviewsPageResponse {
+    const message = createBaseGetProductReviewsPageResponse();
+    message.productReviews = object.productReviews?.map((e) => ProductReview.fromPartial(e)) || [];
+    message.nextPageToken = object.nextPageToken ?? "";
     return message;
   },
 };
 
-function createBaseGetAverageProductReviewScoreResponse(): GetAverageProductReviewScoreResponse {
-  return { averageScore: "" };
+function createBaseStreamProductReviewsRequest(): StreamProductReviewsRequest {
+  return { productId: "" };
 }
 
-export const GetAverageProductReviewScoreResponse: MessageFns<GetAverageProductReviewScoreResponse> = {
-  encode(message: GetAverageProductReviewScoreResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    if (message.averageScore !== "") {
-      writer.uint32(10).string(message.averageScore);
+export const StreamProductReviewsRequest: MessageFns<StreamProductReviewsRequest> = {
+  encode(message: StreamProductReviewsRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.productId !== "") {
+      writer.uint32(10).string(message.productId);
     }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): GetAverageProductReviewScoreResponse {
+  decode(input: BinaryReader | Uint8Array, length?: number): StreamProductReviewsRequest {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     const end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseGetAverageProductReviewScoreResponse();
+    const message = createBaseStreamProductReviewsRequest();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
@@ -1490,7 +2519,7 @@ export const GetAverageProductReviewScoreResponse: MessageFns<GetAverageProductR
             break;
           }
 
-          message.averageScore = reader.string();
+          message.productId = reader.string();
           continue;
         }
       }
@@ -1502,28 +2531,24 @@ export const GetAverageProductReviewScoreResponse: MessageFns<GetAverageProductR
     return message;
   },
 
-  fromJSON(object: any): GetAverageProductReviewScoreResponse {
-    return { averageScore: isSet(object.averageScore) ? globalThis.String(object.averageScore) : "" };
+  fromJSON(object: any): StreamProductReviewsRequest {
+    return { productId: isSet(object.productId) ? globalThis.String(object.productId) : "" };
   },
 
-  toJSON(message: GetAverageProductReviewScoreResponse): unknown {
+  toJSON(message: StreamProductReviewsRequest): unknown {
     const obj: any = {};
-    if (message.averageScore !== "") {
-      obj.averageScore = message.averageScore;
+    if (message.productId !== "") {
+      obj.productId = message.productId;
     }
     return obj;
   },
 
-  create<I extends Exact<DeepPartial<GetAverageProductReviewScoreResponse>, I>>(
-    base?: I,
-  ): GetAverageProductReviewScoreResponse {
-    return GetAverageProductReviewScoreResponse.fromPartial(base ?? ({} as any));
+  create<I extends Exact<DeepPartial<StreamProductReviewsRequest>, I>>(base?: I): StreamProductReviewsRequest {
+    return StreamProductReviewsRequest.fromPartial(base ?? ({} as any));
   },
-  fromPartial<I extends Exact<DeepPartial<GetAverageProductReviewScoreResponse>, I>>(
-    object: I,
-  ): GetAverageProductReviewScoreResponse {
-    const message = createBaseGetAverageProductReviewScoreResponse();
-    message.averageScore = object.averageScore ?? "";
+  fromPartial<I extends Exact<DeepPartial<StreamProductReviewsRequest>, I>>(object: I): StreamProductReviewsRequest {
+    const message = createBaseStreamProductReviewsRequest();
+    message.productId = object.productId ?? "";
     return message;
   },
 };
@@ -3990,10 +5015,24 @@ export const RecommendationServiceService = {
       Buffer.from(ListRecommendationsResponse.encode(value).finish()),
     responseDeserialize: (value: Buffer): ListRecommendationsResponse => ListRecommendationsResponse.decode(value),
   },
+  listRecommendationsBatch: {
+    path: "/oteldemo.RecommendationService/ListRecommendationsBatch",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: ListRecommendationsBatchRequest): Buffer =>
+      Buffer.from(ListRecommendationsBatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer): ListRecommendationsBatchRequest =>
+      ListRecommendationsBatchRequest.decode(value),
+    responseSerialize: (value: ListRecommendationsBatchResponse): Buffer =>
+      Buffer.from(ListRecommendationsBatchResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer): ListRecommendationsBatchResponse =>
+      ListRecommendationsBatchResponse.decode(value),
+  },
 } as const;
 
 export interface RecommendationServiceServer extends UntypedServiceImplementation {
   listRecommendations: handleUnaryCall<ListRecommendationsRequest, ListRecommendationsResponse>;
+  listRecommendationsBatch: handleUnaryCall<ListRecommendationsBatchRequest, ListRecommendationsBatchResponse>;
 }
 
 export interface RecommendationServiceClient extends Client {
@@ -4012,6 +5051,21 @@ export interface RecommendationServiceClient extends Client {
     options: Partial<CallOptions>,
     callback: (error: ServiceError | null, response: ListRecommendationsResponse) => void,
   ): ClientUnaryCall;
+  listRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    callback: (error: ServiceError | null, response: ListRecommendationsBatchResponse) => void,
+  ): ClientUnaryCall;
+  listRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: ListRecommendationsBatchResponse) => void,
+  ): ClientUnaryCall;
+  listRecommendationsBatch(
+    request: ListRecommendationsBatchRequest,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: ListRecommendationsBatchResponse) => void,
+  ): ClientUnaryCall;
 }
 
 export const RecommendationServiceClient = makeGenericClientConstructor(
@@ -4157,6 +5211,63 @@ export const ProductReviewServiceService = {
       Buffer.from(AskProductAIAssistantResponse.encode(value).finish()),
     responseDeserialize: (value: Buffer): AskProductAIAssistantResponse => AskProductAIAssistantResponse.decode(value),
   },
+  getProductReviewScoreHistogram: {
+    path: "/oteldemo.ProductReviewService/GetProductReviewScoreHistogram",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: GetProductReviewScoreHistogramRequest): Buffer =>
+      Buffer.from(GetProductReviewScoreHistogramRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer): GetProductReviewScoreHistogramRequest =>
+      GetProductReviewScoreHistogramRequest.decode(value),
+    responseSerialize: (value: GetProductReviewScoreHistogramResponse): Buffer =>
+      Buffer.from(GetProductReviewScoreHistogramResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer): GetProductReviewScoreHistogramResponse =>
+      GetProductReviewScoreHistogramResponse.decode(value),
+  },
+  getProductReviewsBatch: {
+    path: "/oteldemo.ProductReviewService/GetProductReviewsBatch",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: GetProductReviewsBatchRequest): Buffer =>
+      Buffer.from(GetProductReviewsBatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer): GetProductReviewsBatchRequest => GetProductReviewsBatchRequest.decode(value),
+    responseSerialize: (value: GetProductReviewsBatchResponse): Buffer =>
+      Buffer.from(GetProductReviewsBatchResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer): GetProductReviewsBatchResponse =>
+      GetProductReviewsBatchResponse.decode(value),
+  },
+  getAverageScoresBatch: {
+    path: "/oteldemo.ProductReviewService/GetAverageScoresBatch",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: GetAverageScoresBatchRequest): Buffer =>
+      Buffer.from(GetAverageScoresBatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer): GetAverageScoresBatchRequest => GetAverageScoresBatchRequest.decode(value),
+    responseSerialize: (value: GetAverageScoresBatchResponse): Buffer =>
+      Buffer.from(GetAverageScoresBatchResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer): GetAverageScoresBatchResponse => GetAverageScoresBatchResponse.decode(value),
+  },
+  getProductReviewsPage: {
+    path: "/oteldemo.ProductReviewService/GetProductReviewsPage",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: GetProductReviewsPageRequest): Buffer =>
+      Buffer.from(GetProductReviewsPageRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer): GetProductReviewsPageRequest => GetProductReviewsPageRequest.decode(value),
+    responseSerialize: (value: GetProductReviewsPageResponse): Buffer =>
+      Buffer.from(GetProductReviewsPageResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer): GetProductReviewsPageResponse => GetProductReviewsPageResponse.decode(value),
+  },
+  streamProductReviews: {
+    path: "/oteldemo.ProductReviewService/StreamProductReviews",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: StreamProductReviewsRequest): Buffer =>
+      Buffer.from(StreamProductReviewsRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer): StreamProductReviewsRequest => StreamProductReviewsRequest.decode(value),
+    responseSerialize: (value: ProductReview): Buffer => Buffer.from(ProductReview.encode(value).finish()),
+    responseDeserialize: (value: Buffer): ProductReview => ProductReview.decode(value),
+  },
 } as const;
 
 export interface ProductReviewServiceServer extends UntypedServiceImplementation {
@@ -4166,6 +5277,14 @@ export interface ProductReviewServiceServer extends UntypedServiceImplementation
     GetAverageProductReviewScoreResponse
   >;
   askProductAiAssistant: handleUnaryCall<AskProductAIAssistantRequest, AskProductAIAssistantResponse>;
+  getProductReviewScoreHistogram: handleUnaryCall<
+    GetProductReviewScoreHistogramRequest,
+    GetProductReviewScoreHistogramResponse
+  >;
+  getProductReviewsBatch: handleUnaryCall<GetProductReviewsBatchRequest, GetProductReviewsBatchResponse>;
+  getAverageScoresBatch: handleUnaryCall<GetAverageScoresBatchRequest, GetAverageScoresBatchResponse>;
+  getProductReviewsPage: handleUnaryCall<GetProductReviewsPageRequest, GetProductReviewsPageResponse>;
+  streamProductReviews: handleServerStreamingCall<StreamProductReviewsRequest, ProductReview>;
 }
 
 export interface ProductReviewServiceClient extends Client {
@@ -4214,6 +5333,75 @@ export interface ProductReviewServiceClient extends Client {
     options: Partial<CallOptions>,
     callback: (error: ServiceError | null, response: AskProductAIAssistantResponse) => void,
   ): ClientUnaryCall;
+  getProductReviewScoreHistogram(
+    request: GetProductReviewScoreHistogramRequest,
+    callback: (error: ServiceError | null, response: GetProductReviewScoreHistogramResponse) => void,
+  ): ClientUnaryCall;
+  getProductReviewScoreHistogram(
+    request: GetProductReviewScoreHistogramRequest,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: GetProductReviewScoreHistogramResponse) => void,
+  ): ClientUnaryCall;
+  getProductReviewScoreHistogram(
+    request: GetProductReviewScoreHistogramRequest,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: GetProductReviewScoreHistogramResponse) => void,
+  ): ClientUnaryCall;
+  getProductReviewsBatch(
+    request: GetProductReviewsBatchRequest,
+    callback: (error: ServiceError | null, response: GetProductReviewsBatchResponse) => void,
+  ): ClientUnaryCall;
+  getProductReviewsBatch(
+    request: GetProductReviewsBatchRequest,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: GetProductReviewsBatchResponse) => void,
+  ): ClientUnaryCall;
+  getProductReviewsBatch(
+    request: GetProductReviewsBatchRequest,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: GetProductReviewsBatchResponse) => void,
+  ): ClientUnaryCall;
+  getAverageScoresBatch(
+    request: GetAverageScoresBatchRequest,
+    callback: (error: ServiceError | null, response: GetAverageScoresBatchResponse) => void,
+  ): ClientUnaryCall;
+  getAverageScoresBatch(
+    request: GetAverageScoresBatchRequest,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: GetAverageScoresBatchResponse) => void,
+  ): ClientUnaryCall;
+  getAverageScoresBatch(
+    request: GetAverageScoresBatchRequest,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: GetAverageScoresBatchResponse) => void,
+  ): ClientUnaryCall;
+  getProductReviewsPage(
+    request: GetProductReviewsPageRequest,
+    callback: (error: ServiceError | null, response: GetProductReviewsPageResponse) => void,
+  ): ClientUnaryCall;
+  getProductReviewsPage(
+    request: GetProductReviewsPageRequest,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: GetProductReviewsPageResponse) => void,
+  ): ClientUnaryCall;
+  getProductReviewsPage(
+    request: GetProductReviewsPageRequest,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: GetProductReviewsPageResponse) => void,
+  ): ClientUnaryCall;
+  streamProductReviews(
+    request: StreamProductReviewsRequest,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<ProductReview>;
+  streamProductReviews(
+    request: StreamProductReviewsRequest,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<ProductReview>;
 }
 
 export const ProductReviewServiceClient = makeGenericClientConstructor(
@@ -4,7 +4,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from flask import Flask, request, jsonify, Response
+import hashlib
 import json
+import math
 import time
 import random
 import re
@@ -14,6 +16,8 @@ import logging
 from openfeature import api
 from openfeature.contrib.provider.flagd import FlagdProvider
 
+from flag_cache import FlagCache
+
 app = Flask(__name__)
 app.logger.setLevel(logging.INFO)
 
@@ -23,6 +27,24 @@ product_review_summaries_file_path = "./product-review-summaries.json"
 inaccurate_product_review_summaries = None
 inaccurate_product_review_summaries_file_path = "./inaccurate-product-review-summaries.json"
 
+flag_cache = None
+product_info_tool_call = False
+
+# Dimensions of the mock embeddings
+EMBEDDING_DIMENSIONS = 256
+# Words that are ignored or mean the same to the mock embeddings, so that
+# common paraphrases of the questions asked in the shop embed alike
+EMBEDDING_STOP_WORDS = {
+    'a', 'about', 'an', 'any', 'are', 'can', 'do', 'does', 'for', 'is', 'it', 'me',
+    'of', 'on', 'please', 'product', 'the', 'there', 'this', 'what', 'you',
+}
+EMBEDDING_SYNONYMS = {
+    'summarize': 'summary', 'summarise': 'summary', 'overview': 'summary', 'think': 'summary',
+    'review': 'reviews', 'opinions': 'reviews', 'feedback': 'reviews', 'people': 'reviews',
+    'age': 'ages', 'old': 'ages', 'kids': 'ages', 'children': 'ages',
+    'bad': 'negative', 'complaints': 'negative',
+}
+
 def load_product_review_summaries(file_path):
     try:
         with open(file_path, 'r') as file:
@@ -129,6 +151,24 @@ def chat_completions():
             }
             return jsonify(response), 429
         else:
+            tool_calls = [{
+                "id": "call",
+                "type": "function",
+                "function": {
+                    "name": "fetch_product_reviews",
+                    "arguments": tool_args
+                }
+            }]
+            if product_info_tool_call:
+                tool_calls.append({
+                    "id": "call_info",
+                    "type": "function",
+                    "function": {
+                        "name": "fetch_product_info",
+                        "arguments": tool_args
+                    }
+                })
+
             # Non-streaming response
             response = {
                 "id": f"chatcmpl-mock-{int(time.time())}",
@@ -140,14 +180,7 @@ def chat_completions():
                     "message": {
                         "role": "assistant",
                         "content": "requesting a tool call",
-                        "tool_calls": [{
-                            "id": "call",
-                            "type": "function",
-                            "function": {
-                                "name": "fetch_product_reviews",
-                                "arguments": tool_args
-                            }
-                        }]
+                        "tool_calls": tool_calls
                     },
                     "finish_reason": "tool_calls"
                 }],
@@ -189,6 +222,43 @@ def build_response(model, messages, response_text):
     }
     return jsonify(response)
 
+@app.route('/v1/embeddings', methods=['POST'])
+def embeddings():
+    data = request.json
+    inputs = data.get('input', [])
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    model = data.get('model', 'astronomy-embeddings')
+
+    app.logger.info(f"Received an embeddings request: '{inputs}'")
+
+    token_count = sum(len(text.split()) for text in inputs)
+    return jsonify({
+        "object": "list",
+        "data": [
+            {"object": "embedding", "index": index, "embedding": embed(text)}
+            for index, text in enumerate(inputs)
+        ],
+        "model": model,
+        "usage": {
+            "prompt_tokens": token_count,
+            "total_tokens": token_count
+        }
+    })
+
+def embed(text):
+    """Deterministic embedding that hashes the words of the text into a unit vector."""
+    vector = [0.0] * EMBEDDING_DIMENSIONS
+    for word in re.findall(r"[a-z0-9]+", text.lower()):
+        if len(word) < 2 or word in EMBEDDING_STOP_WORDS:
+            continue
+        digest = hashlib.md5(EMBEDDING_SYNONYMS.get(word, word).encode()).digest()
+        index = int.from_bytes(digest[:4], 'little') % EMBEDDING_DIMENSIONS
+        vector[index] += 1.0 if digest[4] & 1 else -1.0
+
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm > 0 else vector
+
 @app.route('/v1/models', methods=['GET'])
 def list_models():
     """List available models"""
@@ -200,18 +270,27 @@ def list_models():
                 "object": "model",
                 "created": int(time.time()),
                 "owned_by": "astronomy-shop"
+            },
+            {
+                "id": "astronomy-embeddings",
+                "object": "model",
+                "created": int(time.time()),
+                "owned_by": "astronomy-shop"
             }
         ]
     })
 
 def check_feature_flag(flag_name: str):
-    # Initialize OpenFeature
-    client = api.get_client()
-    return client.get_boolean_value(flag_name, False)
+    return flag_cache.get(flag_name)
 
 if __name__ == '__main__':
 
     api.set_provider(FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
+
+    # Flags are evaluated in the background and read from memory on requests
+    flag_cache = FlagCache(["llmInaccurateResponse"], float(os.environ.get('LLM_FLAG_REFRESH_INTERVAL', 5)))
+    flag_cache.start()
+    product_info_tool_call = os.environ.get('LLM_PRODUCT_INFO_TOOL_CALL', 'false') == 'true'
     product_review_summaries = load_product_review_summaries(product_review_summaries_file_path)
     inaccurate_product_review_summaries = load_product_review_summaries(inaccurate_product_review_summaries_file_path)
 
@@ -0,0 +1,100 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import logging
+import threading
+import time
+
+# Pip
+from openfeature import api
+from openfeature.event import ProviderEvent
+
+logger = logging.getLogger('main')
+
+
+class FlagCache:
+    """In-memory copy of boolean feature flags for the request path.
+
+    A background thread evaluates the flags with the OpenFeature client every
+    `refresh_interval` seconds, and right away when the provider reports that
+    its configuration changed, so looking a flag up never waits on flagd.
+    Every flag the service uses must be passed in `flag_names`; other flags
+    return their default until the next refresh evaluated them.
+    """
+
+    def __init__(self, flag_names, refresh_interval):
+        self._refresh_interval = refresh_interval
+        self._evaluation_histogram = None
+        self._lock = threading.Lock()
+        self._flag_names = set(flag_names)
+        self._refreshed_at = None
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name='flag-cache-refresh', daemon=True)
+
+        # Replaced as a whole on every refresh, so readers never need the lock
+        self._values = {}
+
+    def start(self, evaluation_histogram=None):
+        self._evaluation_histogram = evaluation_histogram
+        api.add_handler(ProviderEvent.PROVIDER_READY, self._on_provider_event)
+        api.add_handler(ProviderEvent.PROVIDER_CONFIGURATION_CHANGED, self._on_provider_event)
+        self._thread.start()
+
+    def get(self, flag_name, default=False):
+        value = self._values.get(flag_name)
+        if value is not None:
+            return value
+
+        # Unknown flags are evaluated by the next refresh instead of on the
+        # request path
+        if flag_name not in self._flag_names:
+            with self._lock:
+                self._flag_names.add(flag_name)
+            self._wakeup.set()
+        return default
+
+    def staleness_seconds(self):
+        """Returns the time since the flags were last refreshed, or None before the first refresh."""
+        refreshed_at = self._refreshed_at
+        return None if refreshed_at is None else time.monotonic() - refreshed_at
+
+    def refresh(self):
+        client = api.get_client()
+        with self._lock:
+            flag_names = list(self._flag_names)
+
+        # Flags that fail to evaluate keep their last known value, or the
+        # default until they were evaluated once, and only a refresh without
+        # errors counts towards the staleness
+        values = dict(self._values)
+        failed = []
+        for flag_name in flag_names:
+            started_at = time.monotonic()
+            details = client.get_boolean_details(flag_name, False)
+            if self._evaluation_histogram is not None:
+                self._evaluation_histogram.record(time.monotonic() - started_at, {'feature_flag.key': flag_name})
+            if details.error_code is None or flag_name not in values:
+                values[flag_name] = details.value
+            if details.error_code is not None:
+                failed.append(flag_name)
+
+        self._values = values
+        if failed:
+            raise Exception(f"Could not evaluate {', '.join(failed)}")
+        self._refreshed_at = time.monotonic()
+
+    def _on_provider_event(self, event_details):
+        self._wakeup.set()
+
+    def _refresh_loop(self):
+        while True:
+            self._wakeup.clear()
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Feature flag refresh failed: {e}")
+            self._wakeup.wait(self._refresh_interval)
@@ -33,10 +33,18 @@ CREATE TABLE accounting.orderitem (
     product_id TEXT NOT NULL,
     quantity INT NOT NULL,
     order_id TEXT NOT NULL,
+    seq BIGINT GENERATED ALWAYS AS IDENTITY,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
     PRIMARY KEY (order_id, product_id),
     FOREIGN KEY (order_id) REFERENCES accounting."order"(order_id) ON DELETE CASCADE
 );
 
+-- Recommendation Service: create index for incremental order item reads
+CREATE INDEX orderitem_seq_index ON accounting.orderitem (seq);
+
+-- Recommendation Service: create index for recent order volume aggregation
+CREATE INDEX orderitem_created_at_index ON accounting.orderitem (created_at);
+
 -- Accounting Service: grant permission to schema
 GRANT SELECT, INSERT, UPDATE ON ALL TABLES IN SCHEMA accounting TO otelu;
 
@@ -56,6 +64,111 @@ CREATE TABLE reviews.productreviews (
 -- Product Review Service: create index for product_id lookups
 CREATE INDEX product_id_index ON reviews.productreviews (product_id);
 
+-- Product Review Service: create indexes for paginated review reads, in id
+-- order or from the highest score down
+CREATE INDEX product_id_id_index ON reviews.productreviews (product_id, id);
+CREATE INDEX product_id_score_index ON reviews.productreviews (product_id, score, id);
+
+-- Product Review Service: notify the service about changed reviews, so it can
+-- invalidate its review cache. The payload is the product id, or empty when
+-- the table was truncated.
+CREATE FUNCTION reviews.notify_productreviews_changed() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM pg_notify('productreviews_changed', '');
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM pg_notify('productreviews_changed', OLD.product_id);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM pg_notify('productreviews_changed', NEW.product_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER productreviews_changed
+    AFTER INSERT OR UPDATE OR DELETE ON reviews.productreviews
+    FOR EACH ROW EXECUTE FUNCTION reviews.notify_productreviews_changed();
+
+CREATE TRIGGER productreviews_truncated
+    AFTER TRUNCATE ON reviews.productreviews
+    FOR EACH STATEMENT EXECUTE FUNCTION reviews.notify_productreviews_changed();
+
+-- Product Review Service: per product review count, score sum and number of
+-- reviews per star rating, maintained by triggers on reviews.productreviews.
+-- Scores are counted in the star rating they round down to, between 1 and 5.
+CREATE TABLE reviews.productreviewstats (
+    product_id VARCHAR(16) PRIMARY KEY,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    score_sum NUMERIC NOT NULL DEFAULT 0,
+    star_1 INTEGER NOT NULL DEFAULT 0,
+    star_2 INTEGER NOT NULL DEFAULT 0,
+    star_3 INTEGER NOT NULL DEFAULT 0,
+    star_4 INTEGER NOT NULL DEFAULT 0,
+    star_5 INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE FUNCTION reviews.add_productreview_score(review_product_id VARCHAR, review_score NUMERIC, delta INTEGER) RETURNS void AS $$
+DECLARE
+    star INTEGER := LEAST(5, GREATEST(1, FLOOR(review_score)))::INTEGER;
+BEGIN
+    INSERT INTO reviews.productreviewstats AS stats
+        (product_id, review_count, score_sum, star_1, star_2, star_3, star_4, star_5)
+    VALUES (
+        review_product_id, delta, delta * review_score,
+        CASE WHEN star = 1 THEN delta ELSE 0 END,
+        CASE WHEN star = 2 THEN delta ELSE 0 END,
+        CASE WHEN star = 3 THEN delta ELSE 0 END,
+        CASE WHEN star = 4 THEN delta ELSE 0 END,
+        CASE WHEN star = 5 THEN delta ELSE 0 END
+    )
+    ON CONFLICT (product_id) DO UPDATE SET
+        review_count = stats.review_count + EXCLUDED.review_count,
+        score_sum = stats.score_sum + EXCLUDED.score_sum,
+        star_1 = stats.star_1 + EXCLUDED.star_1,
+        star_2 = stats.star_2 + EXCLUDED.star_2,
+        star_3 = stats.star_3 + EXCLUDED.star_3,
+        star_4 = stats.star_4 + EXCLUDED.star_4,
+        star_5 = stats.star_5 + EXCLUDED.star_5;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Runs as the owner, so writing reviews does not require write access to the
+-- aggregates
+CREATE FUNCTION reviews.update_productreviewstats() RETURNS trigger
+SECURITY DEFINER SET search_path = reviews, pg_temp AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM reviews.productreviewstats;
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM reviews.add_productreview_score(OLD.product_id, OLD.score, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM reviews.add_productreview_score(NEW.product_id, NEW.score, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER productreviewstats_changed
+    AFTER INSERT OR UPDATE OR DELETE ON reviews.productreviews
+    FOR EACH ROW EXECUTE FUNCTION reviews.update_productreviewstats();
+
+CREATE TRIGGER productreviewstats_truncated
+    AFTER TRUNCATE ON reviews.productreviews
+    FOR EACH STATEMENT EXECUTE FUNCTION reviews.update_productreviewstats();
+
+-- Product Review Service: versions of the migrations in src/product-reviews/migrations
+-- that were applied on top of this schema
+CREATE TABLE reviews.schema_migrations (
+    version VARCHAR(16) PRIMARY KEY,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
 -- Product Review Service: grant permission to schema
 GRANT SELECT, INSERT, UPDATE ON ALL TABLES IN SCHEMA reviews TO otelu;
 
@@ -411,6 +411,94 @@ func (x *ListRecommendationsResponse) GetProductIds() []string {
 	return nil
 }
 
+type ListRecommendationsBatchRequest struct {
+	state         protoimpl.MessageState        `protogen:"open.v1"`
+	Requests      []*ListRecommendationsRequest `protobuf:"bytes,1,rep,name=requests,proto3" json:"requests,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ListRecommendationsBatchRequest) Reset() {
+	*x = ListRecommendationsBatchRequest{}
+	mi := &file_demo_proto_msgTypes[8]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ListRecommendationsBatchRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ListRecommendationsBatchRequest) ProtoMessage() {}
+
+func (x *ListRecommendationsBatchRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[8]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ListRecommendationsBatchRequest.ProtoReflect.Descriptor instead.
+func (*ListRecommendationsBatchRequest) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{8}
+}
+
+func (x *ListRecommendationsBatchRequest) GetRequests() []*ListRecommendationsRequest {
+	if x != nil {
+		return x.Requests
+	}
+	return nil
+}
+
+type ListRecommendationsBatchResponse struct {
+	state         protoimpl.MessageState         `protogen:"open.v1"`
+	Responses     []*ListRecommendationsResponse `protobuf:"bytes,1,rep,name=responses,proto3" json:"responses,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ListRecommendationsBatchResponse) Reset() {
+	*x = ListRecommendationsBatchResponse{}
+	mi := &file_demo_proto_msgTypes[9]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ListRecommendationsBatchResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ListRecommendationsBatchResponse) ProtoMessage() {}
+
+func (x *ListRecommendationsBatchResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[9]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ListRecommendationsBatchResponse.ProtoReflect.Descriptor instead.
+func (*ListRecommendationsBatchResponse) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{9}
+}
+
+func (x *ListRecommendationsBatchResponse) GetResponses() []*ListRecommendationsResponse {
+	if x != nil {
+		return x.Responses
+	}
+	return nil
+}
+
 type Product struct {
 	state       protoimpl.MessageState `protogen:"open.v1"`
 	Id          string                 `protobuf:"bytes,1,opt,name=id,proto3" json:"id,omitempty"`
@@ -427,7 +515,7 @@ type Product struct {
 
 func (x *Product) Reset() {
 	*x = Product{}
-	mi := &file_demo_proto_msgTypes[8]
+	mi := &file_demo_proto_msgTypes[10]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -439,7 +527,7 @@ func (x *Product) String() string {
 func (*Product) ProtoMessage() {}
 
 func (x *Product) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[8]
+	mi := &file_demo_proto_msgTypes[10]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -452,7 +540,7 @@ func (x *Product) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use Product.ProtoReflect.Descriptor instead.
 func (*Product) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{8}
+	return file_demo_proto_rawDescGZIP(), []int{10}
 }
 
 func (x *Product) GetId() string {
@@ -506,7 +594,7 @@ type ListProductsResponse struct {
 
 func (x *ListProductsResponse) Reset() {
 	*x = ListProductsResponse{}
-	mi := &file_demo_proto_msgTypes[9]
+	mi := &file_demo_proto_msgTypes[11]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -518,7 +606,7 @@ func (x *ListProductsResponse) String() string {
 func (*ListProductsResponse) ProtoMessage() {}
 
 func (x *ListProductsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[9]
+	mi := &file_demo_proto_msgTypes[11]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -531,7 +619,7 @@ func (x *ListProductsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListProductsResponse.ProtoReflect.Descriptor instead.
 func (*ListProductsResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{9}
+	return file_demo_proto_rawDescGZIP(), []int{11}
 }
 
 func (x *ListProductsResponse) GetProducts() []*Product {
@@ -550,7 +638,7 @@ type GetProductRequest struct {
 
 func (x *GetProductRequest) Reset() {
 	*x = GetProductRequest{}
-	mi := &file_demo_proto_msgTypes[10]
+	mi := &file_demo_proto_msgTypes[12]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -562,7 +650,7 @@ func (x *GetProductRequest) String() string {
 func (*GetProductRequest) ProtoMessage() {}
 
 func (x *GetProductRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[10]
+	mi := &file_demo_proto_msgTypes[12]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -575,7 +663,7 @@ func (x *GetProductRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetProductRequest.ProtoReflect.Descriptor instead.
 func (*GetProductRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{10}
+	return file_demo_proto_rawDescGZIP(), []int{12}
 }
 
 func (x *GetProductRequest) GetId() string {
@@ -594,7 +682,7 @@ type SearchProductsRequest struct {
 
 func (x *SearchProductsRequest) Reset() {
 	*x = SearchProductsRequest{}
-	mi := &file_demo_proto_msgTypes[11]
+	mi := &file_demo_proto_msgTypes[13]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -606,7 +694,7 @@ func (x *SearchProductsRequest) String() string {
 func (*SearchProductsRequest) ProtoMessage() {}
 
 func (x *SearchProductsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[11]
+	mi := &file_demo_proto_msgTypes[13]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -619,7 +707,7 @@ func (x *SearchProductsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SearchProductsRequest.ProtoReflect.Descriptor instead.
 func (*SearchProductsRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{11}
+	return file_demo_proto_rawDescGZIP(), []int{13}
 }
 
 func (x *SearchProductsRequest) GetQuery() string {
@@ -638,7 +726,7 @@ type SearchProductsResponse struct {
 
 func (x *SearchProductsResponse) Reset() {
 	*x = SearchProductsResponse{}
-	mi := &file_demo_proto_msgTypes[12]
+	mi := &file_demo_proto_msgTypes[14]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -650,7 +738,7 @@ func (x *SearchProductsResponse) String() string {
 func (*SearchProductsResponse) ProtoMessage() {}
 
 func (x *SearchProductsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[12]
+	mi := &file_demo_proto_msgTypes[14]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -663,7 +751,7 @@ func (x *SearchProductsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SearchProductsResponse.ProtoReflect.Descriptor instead.
 func (*SearchProductsResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{12}
+	return file_demo_proto_rawDescGZIP(), []int{14}
 }
 
 func (x *SearchProductsResponse) GetResults() []*Product {
@@ -684,7 +772,7 @@ type ProductReview struct {
 
 func (x *ProductReview) Reset() {
 	*x = ProductReview{}
-	mi := &file_demo_proto_msgTypes[13]
+	mi := &file_demo_proto_msgTypes[15]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -696,7 +784,7 @@ func (x *ProductReview) String() string {
 func (*ProductReview) ProtoMessage() {}
 
 func (x *ProductReview) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[13]
+	mi := &file_demo_proto_msgTypes[15]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -709,7 +797,7 @@ func (x *ProductReview) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ProductReview.ProtoReflect.Descriptor instead.
 func (*ProductReview) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{13}
+	return file_demo_proto_rawDescGZIP(), []int{15}
 }
 
 func (x *ProductReview) GetUsername() string {
@@ -742,7 +830,7 @@ type GetProductReviewsRequest struct {
 
 func (x *GetProductReviewsRequest) Reset() {
 	*x = GetProductReviewsRequest{}
-	mi := &file_demo_proto_msgTypes[14]
+	mi := &file_demo_proto_msgTypes[16]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -754,7 +842,526 @@ func (x *GetProductReviewsRequest) String() string {
 func (*GetProductReviewsRequest) ProtoMessage() {}
 
 func (x *GetProductReviewsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[14]
+	mi := &file_demo_proto_msgTypes[16]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetProductReviewsRequest.ProtoReflect.Descriptor instead.
+func (*GetProductReviewsRequest) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{16}
+}
+
+func (x *GetProductReviewsRequest) GetProductId() string {
+	if x != nil {
+		return x.ProductId
+	}
+	return ""
+}
+
+type GetProductReviewsResponse struct {
+	state          protoimpl.MessageState `protogen:"open.v1"`
+	ProductReviews []*ProductReview       `protobuf:"bytes,1,rep,name=product_reviews,json=productReviews,proto3" json:"product_reviews,omitempty"`
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
+}
+
+func (x *GetProductReviewsResponse) Reset() {
+	*x = GetProductReviewsResponse{}
+	mi := &file_demo_proto_msgTypes[17]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetProductReviewsResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetProductReviewsResponse) ProtoMessage() {}
+
+func (x *GetProductReviewsResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[17]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetProductReviewsResponse.ProtoReflect.Descriptor instead.
+func (*GetProductReviewsResponse) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{17}
+}
+
+func (x *GetProductReviewsResponse) GetProductReviews() []*ProductReview {
+	if x != nil {
+		return x.ProductReviews
+	}
+	return nil
+}
+
+type GetAverageProductReviewScoreRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ProductId     string                 `protobuf:"bytes,1,opt,name=product_id,json=productId,proto3" json:"product_id,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetAverageProductReviewScoreRequest) Reset() {
+	*x = GetAverageProductReviewScoreRequest{}
+	mi := &file_demo_proto_msgTypes[18]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetAverageProductReviewScoreRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetAverageProductReviewScoreRequest) ProtoMessage() {}
+
+func (x *GetAverageProductReviewScoreRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[18]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetAverageProductReviewScoreRequest.ProtoReflect.Descriptor instead.
+func (*GetAverageProductReviewScoreRequest) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{18}
+}
+
+func (x *GetAverageProductReviewScoreRequest) GetProductId() string {
+	if x != nil {
+		return x.ProductId
+	}
+	return ""
+}
+
+type GetAverageProductReviewScoreResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	AverageScore  string                 `protobuf:"bytes,1,opt,name=average_score,json=averageScore,proto3" json:"average_score,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetAverageProductReviewScoreResponse) Reset() {
+	*x = GetAverageProductReviewScoreResponse{}
+	mi := &file_demo_proto_msgTypes[19]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetAverageProductReviewScoreResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetAverageProductReviewScoreResponse) ProtoMessage() {}
+
+func (x *GetAverageProductReviewScoreResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[19]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetAverageProductReviewScoreResponse.ProtoReflect.Descriptor instead.
+func (*GetAverageProductReviewScoreResponse) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{19}
+}
+
+func (x *GetAverageProductReviewScoreResponse) GetAverageScore() string {
+	if x != nil {
+		return x.AverageScore
+	}
+	return ""
+}
+
+type GetProductReviewScoreHistogramRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ProductId     string                 `protobuf:"bytes,1,opt,name=product_id,json=productId,proto3" json:"product_id,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetProductReviewScoreHistogramRequest) Reset() {
+	*x = GetProductReviewScoreHistogramRequest{}
+	mi := &file_demo_proto_msgTypes[20]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetProductReviewScoreHistogramRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetProductReviewScoreHistogramRequest) ProtoMessage() {}
+
+func (x *GetProductReviewScoreHistogramRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[20]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetProductReviewScoreHistogramRequest.ProtoReflect.Descriptor instead.
+func (*GetProductReviewScoreHistogramRequest) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{20}
+}
+
+func (x *GetProductReviewScoreHistogramRequest) GetProductId() string {
+	if x != nil {
+		return x.ProductId
+	}
+	return ""
+}
+
+type GetProductReviewScoreHistogramResponse struct {
+	state        protoimpl.MessageState `protogen:"open.v1"`
+	ReviewCount  int32                  `protobuf:"varint,1,opt,name=review_count,json=reviewCount,proto3" json:"review_count,omitempty"`
+	AverageScore string                 `protobuf:"bytes,2,opt,name=average_score,json=averageScore,proto3" json:"average_score,omitempty"`
+	// Number of reviews per star rating, from 1 to 5 stars
+	StarCounts    []int32 `protobuf:"varint,3,rep,packed,name=star_counts,json=starCounts,proto3" json:"star_counts,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetProductReviewScoreHistogramResponse) Reset() {
+	*x = GetProductReviewScoreHistogramResponse{}
+	mi := &file_demo_proto_msgTypes[21]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetProductReviewScoreHistogramResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetProductReviewScoreHistogramResponse) ProtoMessage() {}
+
+func (x *GetProductReviewScoreHistogramResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[21]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetProductReviewScoreHistogramResponse.ProtoReflect.Descriptor instead.
+func (*GetProductReviewScoreHistogramResponse) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{21}
+}
+
+func (x *GetProductReviewScoreHistogramResponse) GetReviewCount() int32 {
+	if x != nil {
+		return x.ReviewCount
+	}
+	return 0
+}
+
+func (x *GetProductReviewScoreHistogramResponse) GetAverageScore() string {
+	if x != nil {
+		return x.AverageScore
+	}
+	return ""
+}
+
+func (x *GetProductReviewScoreHistogramResponse) GetStarCounts() []int32 {
+	if x != nil {
+		return x.StarCounts
+	}
+	return nil
+}
+
+type GetProductReviewsBatchRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ProductIds    []string               `protobuf:"bytes,1,rep,name=product_ids,json=productIds,proto3" json:"product_ids,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetProductReviewsBatchRequest) Reset() {
+	*x = GetProductReviewsBatchRequest{}
+	mi := &file_demo_proto_msgTypes[22]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetProductReviewsBatchRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetProductReviewsBatchRequest) ProtoMessage() {}
+
+func (x *GetProductReviewsBatchRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[22]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetProductReviewsBatchRequest.ProtoReflect.Descriptor instead.
+func (*GetProductReviewsBatchRequest) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{22}
+}
+
+func (x *GetProductReviewsBatchRequest) GetProductIds() []string {
+	if x != nil {
+		return x.ProductIds
+	}
+	return nil
+}
+
+type ProductReviews struct {
+	state          protoimpl.MessageState `protogen:"open.v1"`
+	ProductId      string                 `protobuf:"bytes,1,opt,name=product_id,json=productId,proto3" json:"product_id,omitempty"`
+	ProductReviews []*ProductReview       `protobuf:"bytes,2,rep,name=product_reviews,json=productReviews,proto3" json:"product_reviews,omitempty"`
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
+}
+
+func (x *ProductReviews) Reset() {
+	*x = ProductReviews{}
+	mi := &file_demo_proto_msgTypes[23]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ProductReviews) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ProductReviews) ProtoMessage() {}
+
+func (x *ProductReviews) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[23]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ProductReviews.ProtoReflect.Descriptor instead.
+func (*ProductReviews) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{23}
+}
+
+func (x *ProductReviews) GetProductId() string {
+	if x != nil {
+		return x.ProductId
+	}
+	return ""
+}
+
+func (x *ProductReviews) GetProductReviews() []*ProductReview {
+	if x != nil {
+		return x.ProductReviews
+	}
+	return nil
+}
+
+type GetProductReviewsBatchResponse struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// In the order of the requested product ids
+	ProductReviews []*ProductReviews `protobuf:"bytes,1,rep,name=product_reviews,json=productReviews,proto3" json:"product_reviews,omitempty"`
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
+}
+
+func (x *GetProductReviewsBatchResponse) Reset() {
+	*x = GetProductReviewsBatchResponse{}
+	mi := &file_demo_proto_msgTypes[24]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetProductReviewsBatchResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetProductReviewsBatchResponse) ProtoMessage() {}
+
+func (x *GetProductReviewsBatchResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[24]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetProductReviewsBatchResponse.ProtoReflect.Descriptor instead.
+func (*GetProductReviewsBatchResponse) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{24}
+}
+
+func (x *GetProductReviewsBatchResponse) GetProductReviews() []*ProductReviews {
+	if x != nil {
+		return x.ProductReviews
+	}
+	return nil
+}
+
+type GetAverageScoresBatchRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ProductIds    []string               `protobuf:"bytes,1,rep,name=product_ids,json=productIds,proto3" json:"product_ids,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetAverageScoresBatchRequest) Reset() {
+	*x = GetAverageScoresBatchRequest{}
+	mi := &file_demo_proto_msgTypes[25]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetAverageScoresBatchRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetAverageScoresBatchRequest) ProtoMessage() {}
+
+func (x *GetAverageScoresBatchRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[25]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GetAverageScoresBatchRequest.ProtoReflect.Descriptor instead.
+func (*GetAverageScoresBatchRequest) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{25}
+}
+
+func (x *GetAverageScoresBatchRequest) GetProductIds() []string {
+	if x != nil {
+		return x.ProductIds
+	}
+	return nil
+}
+
+type ProductAverageScore struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	ProductId     string                 `protobuf:"bytes,1,opt,name=product_id,json=productId,proto3" json:"product_id,omitempty"`
+	AverageScore  string                 `protobuf:"bytes,2,opt,name=average_score,json=averageScore,proto3" json:"average_score,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ProductAverageScore) Reset() {
+	*x = ProductAverageScore{}
+	mi := &file_demo_proto_msgTypes[26]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ProductAverageScore) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ProductAverageScore) ProtoMessage() {}
+
+func (x *ProductAverageScore) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[26]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ProductAverageScore.ProtoReflect.Descriptor instead.
+func (*ProductAverageScore) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{26}
+}
+
+func (x *ProductAverageScore) GetProductId() string {
+	if x != nil {
+		return x.ProductId
+	}
+	return ""
+}
+
+func (x *ProductAverageScore) GetAverageScore() string {
+	if x != nil {
+		return x.AverageScore
+	}
+	return ""
+}
+
+type GetAverageScoresBatchResponse struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// In the order of the requested product ids
+	AverageScores []*ProductAverageScore `protobuf:"bytes,1,rep,name=average_scores,json=averageScores,proto3" json:"average_scores,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GetAverageScoresBatchResponse) Reset() {
+	*x = GetAverageScoresBatchResponse{}
+	mi := &file_demo_proto_msgTypes[27]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GetAverageScoresBatchResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GetAverageScoresBatchResponse) ProtoMessage() {}
+
+func (x *GetAverageScoresBatchResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[27]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -765,40 +1372,46 @@ func (x *GetProductReviewsRequest) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetProductReviewsRequest.ProtoReflect.Descriptor instead.
-func (*GetProductReviewsRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{14}
+// Deprecated: Use GetAverageScoresBatchResponse.ProtoReflect.Descriptor instead.
+func (*GetAverageScoresBatchResponse) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{27}
 }
 
-func (x *GetProductReviewsRequest) GetProductId() string {
+func (x *GetAverageScoresBatchResponse) GetAverageScores() []*ProductAverageScore {
 	if x != nil {
-		return x.ProductId
+		return x.AverageScores
 	}
-	return ""
+	return nil
 }
 
-type GetProductReviewsResponse struct {
-	state          protoimpl.MessageState `protogen:"open.v1"`
-	ProductReviews []*ProductReview       `protobuf:"bytes,1,rep,name=product_reviews,json=productReviews,proto3" json:"product_reviews,omitempty"`
-	unknownFields  protoimpl.UnknownFields
-	sizeCache      protoimpl.SizeCache
+type GetProductReviewsPageRequest struct {
+	state     protoimpl.MessageState `protogen:"open.v1"`
+	ProductId string                 `protobuf:"bytes,1,opt,name=product_id,json=productId,proto3" json:"product_id,omitempty"`
+	// Defaults to 20 reviews, at most 100
+	PageSize int32 `protobuf:"varint,2,opt,name=page_size,json=pageSize,proto3" json:"page_size,omitempty"`
+	// next_page_token of the previous page, empty for the first page
+	PageToken string `protobuf:"bytes,3,opt,name=page_token,json=pageToken,proto3" json:"page_token,omitempty"`
+	// Highest scores first instead of oldest reviews first
+	OrderByScore  bool `protobuf:"varint,4,opt,name=order_by_score,json=orderByScore,proto3" json:"order_by_score,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetProductReviewsResponse) Reset() {
-	*x = GetProductReviewsResponse{}
-	mi := &file_demo_proto_msgTypes[15]
+func (x *GetProductReviewsPageRequest) Reset() {
+	*x = GetProductReviewsPageRequest{}
+	mi := &file_demo_proto_msgTypes[28]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetProductReviewsResponse) String() string {
+func (x *GetProductReviewsPageRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetProductReviewsResponse) ProtoMessage() {}
+func (*GetProductReviewsPageRequest) ProtoMessage() {}
 
-func (x *GetProductReviewsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[15]
+func (x *GetProductReviewsPageRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[28]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -809,40 +1422,63 @@ func (x *GetProductReviewsResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetProductReviewsResponse.ProtoReflect.Descriptor instead.
-func (*GetProductReviewsResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{15}
+// Deprecated: Use GetProductReviewsPageRequest.ProtoReflect.Descriptor instead.
+func (*GetProductReviewsPageRequest) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{28}
 }
 
-func (x *GetProductReviewsResponse) GetProductReviews() []*ProductReview {
+func (x *GetProductReviewsPageRequest) GetProductId() string {
 	if x != nil {
-		return x.ProductReviews
+		return x.ProductId
 	}
-	return nil
+	return ""
 }
 
-type GetAverageProductReviewScoreRequest struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	ProductId     string                 `protobuf:"bytes,1,opt,name=product_id,json=productId,proto3" json:"product_id,omitempty"`
+func (x *GetProductReviewsPageRequest) GetPageSize() int32 {
+	if x != nil {
+		return x.PageSize
+	}
+	return 0
+}
+
+func (x *GetProductReviewsPageRequest) GetPageToken() string {
+	if x != nil {
+		return x.PageToken
+	}
+	return ""
+}
+
+func (x *GetProductReviewsPageRequest) GetOrderByScore() bool {
+	if x != nil {
+		return x.OrderByScore
+	}
+	return false
+}
+
+type GetProductReviewsPageResponse struct {
+	state          protoimpl.MessageState `protogen:"open.v1"`
+	ProductReviews []*ProductReview       `protobuf:"bytes,1,rep,name=product_reviews,json=productReviews,proto3" json:"product_reviews,omitempty"`
+	// Empty on the last page
+	NextPageToken string `protobuf:"bytes,2,opt,name=next_page_token,json=nextPageToken,proto3" json:"next_page_token,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetAverageProductReviewScoreRequest) Reset() {
-	*x = GetAverageProductReviewScoreRequest{}
-	mi := &file_demo_proto_msgTypes[16]
+func (x *GetProductReviewsPageResponse) Reset() {
+	*x = GetProductReviewsPageResponse{}
+	mi := &file_demo_proto_msgTypes[29]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetAverageProductReviewScoreRequest) String() string {
+func (x *GetProductReviewsPageResponse) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetAverageProductReviewScoreRequest) ProtoMessage() {}
+func (*GetProductReviewsPageResponse) ProtoMessage() {}
 
-func (x *GetAverageProductReviewScoreRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[16]
+func (x *GetProductReviewsPageResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[29]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -853,40 +1489,47 @@ func (x *GetAverageProductReviewScoreRequest) ProtoReflect() protoreflect.Messag
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetAverageProductReviewScoreRequest.ProtoReflect.Descriptor instead.
-func (*GetAverageProductReviewScoreRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{16}
+// Deprecated: Use GetProductReviewsPageResponse.ProtoReflect.Descriptor instead.
+func (*GetProductReviewsPageResponse) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{29}
 }
 
-func (x *GetAverageProductReviewScoreRequest) GetProductId() string {
+func (x *GetProductReviewsPageResponse) GetProductReviews() []*ProductReview {
 	if x != nil {
-		return x.ProductId
+		return x.ProductReviews
+	}
+	return nil
+}
+
+func (x *GetProductReviewsPageResponse) GetNextPageToken() string {
+	if x != nil {
+		return x.NextPageToken
 	}
 	return ""
 }
 
-type GetAverageProductReviewScoreResponse struct {
+type StreamProductReviewsRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	AverageScore  string                 `protobuf:"bytes,1,opt,name=average_score,json=averageScore,proto3" json:"average_score,omitempty"`
+	ProductId     string                 `protobuf:"bytes,1,opt,name=product_id,json=productId,proto3" json:"product_id,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
-func (x *GetAverageProductReviewScoreResponse) Reset() {
-	*x = GetAverageProductReviewScoreResponse{}
-	mi := &file_demo_proto_msgTypes[17]
+func (x *StreamProductReviewsRequest) Reset() {
+	*x = StreamProductReviewsRequest{}
+	mi := &file_demo_proto_msgTypes[30]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *GetAverageProductReviewScoreResponse) String() string {
+func (x *StreamProductReviewsRequest) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*GetAverageProductReviewScoreResponse) ProtoMessage() {}
+func (*StreamProductReviewsRequest) ProtoMessage() {}
 
-func (x *GetAverageProductReviewScoreResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[17]
+func (x *StreamProductReviewsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_demo_proto_msgTypes[30]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -897,14 +1540,14 @@ func (x *GetAverageProductReviewScoreResponse) ProtoReflect() protoreflect.Messa
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use GetAverageProductReviewScoreResponse.ProtoReflect.Descriptor instead.
-func (*GetAverageProductReviewScoreResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{17}
+// Deprecated: Use StreamProductReviewsRequest.ProtoReflect.Descriptor instead.
+func (*StreamProductReviewsRequest) Descriptor() ([]byte, []int) {
+	return file_demo_proto_rawDescGZIP(), []int{30}
 }
 
-func (x *GetAverageProductReviewScoreResponse) GetAverageScore() string {
+func (x *StreamProductReviewsRequest) GetProductId() string {
 	if x != nil {
-		return x.AverageScore
+		return x.ProductId
 	}
 	return ""
 }
@@ -919,7 +1562,7 @@ type AskProductAIAssistantRequest struct {
 
 func (x *AskProductAIAssistantRequest) Reset() {
 	*x = AskProductAIAssistantRequest{}
-	mi := &file_demo_proto_msgTypes[18]
+	mi := &file_demo_proto_msgTypes[31]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -931,7 +1574,7 @@ func (x *AskProductAIAssistantRequest) String() string {
 func (*AskProductAIAssistantRequest) ProtoMessage() {}
 
 func (x *AskProductAIAssistantRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[18]
+	mi := &file_demo_proto_msgTypes[31]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -944,7 +1587,7 @@ func (x *AskProductAIAssistantRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use AskProductAIAssistantRequest.ProtoReflect.Descriptor instead.
 func (*AskProductAIAssistantRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{18}
+	return file_demo_proto_rawDescGZIP(), []int{31}
 }
 
 func (x *AskProductAIAssistantRequest) GetProductId() string {
@@ -970,7 +1613,7 @@ type AskProductAIAssistantResponse struct {
 
 func (x *AskProductAIAssistantResponse) Reset() {
 	*x = AskProductAIAssistantResponse{}
-	mi := &file_demo_proto_msgTypes[19]
+	mi := &file_demo_proto_msgTypes[32]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -982,7 +1625,7 @@ func (x *AskProductAIAssistantResponse) String() string {
 func (*AskProductAIAssistantResponse) ProtoMessage() {}
 
 func (x *AskProductAIAssistantResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[19]
+	mi := &file_demo_proto_msgTypes[32]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -995,7 +1638,7 @@ func (x *AskProductAIAssistantResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use AskProductAIAssistantResponse.ProtoReflect.Descriptor instead.
 func (*AskProductAIAssistantResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{19}
+	return file_demo_proto_rawDescGZIP(), []int{32}
 }
 
 func (x *AskProductAIAssistantResponse) GetResponse() string {
@@ -1015,7 +1658,7 @@ type GetQuoteRequest struct {
 
 func (x *GetQuoteRequest) Reset() {
 	*x = GetQuoteRequest{}
-	mi := &file_demo_proto_msgTypes[20]
+	mi := &file_demo_proto_msgTypes[33]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1027,7 +1670,7 @@ func (x *GetQuoteRequest) String() string {
 func (*GetQuoteRequest) ProtoMessage() {}
 
 func (x *GetQuoteRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[20]
+	mi := &file_demo_proto_msgTypes[33]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1040,7 +1683,7 @@ func (x *GetQuoteRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetQuoteRequest.ProtoReflect.Descriptor instead.
 func (*GetQuoteRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{20}
+	return file_demo_proto_rawDescGZIP(), []int{33}
 }
 
 func (x *GetQuoteRequest) GetAddress() *Address {
@@ -1066,7 +1709,7 @@ type GetQuoteResponse struct {
 
 func (x *GetQuoteResponse) Reset() {
 	*x = GetQuoteResponse{}
-	mi := &file_demo_proto_msgTypes[21]
+	mi := &file_demo_proto_msgTypes[34]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1078,7 +1721,7 @@ func (x *GetQuoteResponse) String() string {
 func (*GetQuoteResponse) ProtoMessage() {}
 
 func (x *GetQuoteResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[21]
+	mi := &file_demo_proto_msgTypes[34]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1091,7 +1734,7 @@ func (x *GetQuoteResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetQuoteResponse.ProtoReflect.Descriptor instead.
 func (*GetQuoteResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{21}
+	return file_demo_proto_rawDescGZIP(), []int{34}
 }
 
 func (x *GetQuoteResponse) GetCostUsd() *Money {
@@ -1111,7 +1754,7 @@ type ShipOrderRequest struct {
 
 func (x *ShipOrderRequest) Reset() {
 	*x = ShipOrderRequest{}
-	mi := &file_demo_proto_msgTypes[22]
+	mi := &file_demo_proto_msgTypes[35]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1123,7 +1766,7 @@ func (x *ShipOrderRequest) String() string {
 func (*ShipOrderRequest) ProtoMessage() {}
 
 func (x *ShipOrderRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[22]
+	mi := &file_demo_proto_msgTypes[35]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1136,7 +1779,7 @@ func (x *ShipOrderRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ShipOrderRequest.ProtoReflect.Descriptor instead.
 func (*ShipOrderRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{22}
+	return file_demo_proto_rawDescGZIP(), []int{35}
 }
 
 func (x *ShipOrderRequest) GetAddress() *Address {
@@ -1162,7 +1805,7 @@ type ShipOrderResponse struct {
 
 func (x *ShipOrderResponse) Reset() {
 	*x = ShipOrderResponse{}
-	mi := &file_demo_proto_msgTypes[23]
+	mi := &file_demo_proto_msgTypes[36]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1174,7 +1817,7 @@ func (x *ShipOrderResponse) String() string {
 func (*ShipOrderResponse) ProtoMessage() {}
 
 func (x *ShipOrderResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[23]
+	mi := &file_demo_proto_msgTypes[36]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1187,7 +1830,7 @@ func (x *ShipOrderResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ShipOrderResponse.ProtoReflect.Descriptor instead.
 func (*ShipOrderResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{23}
+	return file_demo_proto_rawDescGZIP(), []int{36}
 }
 
 func (x *ShipOrderResponse) GetTrackingId() string {
@@ -1210,7 +1853,7 @@ type Address struct {
 
 func (x *Address) Reset() {
 	*x = Address{}
-	mi := &file_demo_proto_msgTypes[24]
+	mi := &file_demo_proto_msgTypes[37]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1222,7 +1865,7 @@ func (x *Address) String() string {
 func (*Address) ProtoMessage() {}
 
 func (x *Address) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[24]
+	mi := &file_demo_proto_msgTypes[37]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1235,7 +1878,7 @@ func (x *Address) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use Address.ProtoReflect.Descriptor instead.
 func (*Address) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{24}
+	return file_demo_proto_rawDescGZIP(), []int{37}
 }
 
 func (x *Address) GetStreetAddress() string {
@@ -1294,7 +1937,7 @@ type Money struct {
 
 func (x *Money) Reset() {
 	*x = Money{}
-	mi := &file_demo_proto_msgTypes[25]
+	mi := &file_demo_proto_msgTypes[38]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1306,7 +1949,7 @@ func (x *Money) String() string {
 func (*Money) ProtoMessage() {}
 
 func (x *Money) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[25]
+	mi := &file_demo_proto_msgTypes[38]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1319,7 +1962,7 @@ func (x *Money) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use Money.ProtoReflect.Descriptor instead.
 func (*Money) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{25}
+	return file_demo_proto_rawDescGZIP(), []int{38}
 }
 
 func (x *Money) GetCurrencyCode() string {
@@ -1353,7 +1996,7 @@ type GetSupportedCurrenciesResponse struct {
 
 func (x *GetSupportedCurrenciesResponse) Reset() {
 	*x = GetSupportedCurrenciesResponse{}
-	mi := &file_demo_proto_msgTypes[26]
+	mi := &file_demo_proto_msgTypes[39]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1365,7 +2008,7 @@ func (x *GetSupportedCurrenciesResponse) String() string {
 func (*GetSupportedCurrenciesResponse) ProtoMessage() {}
 
 func (x *GetSupportedCurrenciesResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[26]
+	mi := &file_demo_proto_msgTypes[39]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1378,7 +2021,7 @@ func (x *GetSupportedCurrenciesResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetSupportedCurrenciesResponse.ProtoReflect.Descriptor instead.
 func (*GetSupportedCurrenciesResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{26}
+	return file_demo_proto_rawDescGZIP(), []int{39}
 }
 
 func (x *GetSupportedCurrenciesResponse) GetCurrencyCodes() []string {
@@ -1399,7 +2042,7 @@ type CurrencyConversionRequest struct {
 
 func (x *CurrencyConversionRequest) Reset() {
 	*x = CurrencyConversionRequest{}
-	mi := &file_demo_proto_msgTypes[27]
+	mi := &file_demo_proto_msgTypes[40]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1411,7 +2054,7 @@ func (x *CurrencyConversionRequest) String() string {
 func (*CurrencyConversionRequest) ProtoMessage() {}
 
 func (x *CurrencyConversionRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[27]
+	mi := &file_demo_proto_msgTypes[40]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1424,7 +2067,7 @@ func (x *CurrencyConversionRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CurrencyConversionRequest.ProtoReflect.Descriptor instead.
 func (*CurrencyConversionRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{27}
+	return file_demo_proto_rawDescGZIP(), []int{40}
 }
 
 func (x *CurrencyConversionRequest) GetFrom() *Money {
@@ -1453,7 +2096,7 @@ type CreditCardInfo struct {
 
 func (x *CreditCardInfo) Reset() {
 	*x = CreditCardInfo{}
-	mi := &file_demo_proto_msgTypes[28]
+	mi := &file_demo_proto_msgTypes[41]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1465,7 +2108,7 @@ func (x *CreditCardInfo) String() string {
 func (*CreditCardInfo) ProtoMessage() {}
 
 func (x *CreditCardInfo) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[28]
+	mi := &file_demo_proto_msgTypes[41]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1478,7 +2121,7 @@ func (x *CreditCardInfo) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CreditCardInfo.ProtoReflect.Descriptor instead.
 func (*CreditCardInfo) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{28}
+	return file_demo_proto_rawDescGZIP(), []int{41}
 }
 
 func (x *CreditCardInfo) GetCreditCardNumber() string {
@@ -1519,7 +2162,7 @@ type ChargeRequest struct {
 
 func (x *ChargeRequest) Reset() {
 	*x = ChargeRequest{}
-	mi := &file_demo_proto_msgTypes[29]
+	mi := &file_demo_proto_msgTypes[42]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1531,7 +2174,7 @@ func (x *ChargeRequest) String() string {
 func (*ChargeRequest) ProtoMessage() {}
 
 func (x *ChargeRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[29]
+	mi := &file_demo_proto_msgTypes[42]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1544,7 +2187,7 @@ func (x *ChargeRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ChargeRequest.ProtoReflect.Descriptor instead.
 func (*ChargeRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{29}
+	return file_demo_proto_rawDescGZIP(), []int{42}
 }
 
 func (x *ChargeRequest) GetAmount() *Money {
@@ -1570,7 +2213,7 @@ type ChargeResponse struct {
 
 func (x *ChargeResponse) Reset() {
 	*x = ChargeResponse{}
-	mi := &file_demo_proto_msgTypes[30]
+	mi := &file_demo_proto_msgTypes[43]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1582,7 +2225,7 @@ func (x *ChargeResponse) String() string {
 func (*ChargeResponse) ProtoMessage() {}
 
 func (x *ChargeResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[30]
+	mi := &file_demo_proto_msgTypes[43]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1595,7 +2238,7 @@ func (x *ChargeResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ChargeResponse.ProtoReflect.Descriptor instead.
 func (*ChargeResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{30}
+	return file_demo_proto_rawDescGZIP(), []int{43}
 }
 
 func (x *ChargeResponse) GetTransactionId() string {
@@ -1615,7 +2258,7 @@ type OrderItem struct {
 
 func (x *OrderItem) Reset() {
 	*x = OrderItem{}
-	mi := &file_demo_proto_msgTypes[31]
+	mi := &file_demo_proto_msgTypes[44]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1627,7 +2270,7 @@ func (x *OrderItem) String() string {
 func (*OrderItem) ProtoMessage() {}
 
 func (x *OrderItem) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[31]
+	mi := &file_demo_proto_msgTypes[44]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1640,7 +2283,7 @@ func (x *OrderItem) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use OrderItem.ProtoReflect.Descriptor instead.
 func (*OrderItem) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{31}
+	return file_demo_proto_rawDescGZIP(), []int{44}
 }
 
 func (x *OrderItem) GetItem() *CartItem {
@@ -1670,7 +2313,7 @@ type OrderResult struct {
 
 func (x *OrderResult) Reset() {
 	*x = OrderResult{}
-	mi := &file_demo_proto_msgTypes[32]
+	mi := &file_demo_proto_msgTypes[45]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1682,7 +2325,7 @@ func (x *OrderResult) String() string {
 func (*OrderResult) ProtoMessage() {}
 
 func (x *OrderResult) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[32]
+	mi := &file_demo_proto_msgTypes[45]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1695,7 +2338,7 @@ func (x *OrderResult) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use OrderResult.ProtoReflect.Descriptor instead.
 func (*OrderResult) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{32}
+	return file_demo_proto_rawDescGZIP(), []int{45}
 }
 
 func (x *OrderResult) GetOrderId() string {
@@ -1743,7 +2386,7 @@ type SendOrderConfirmationRequest struct {
 
 func (x *SendOrderConfirmationRequest) Reset() {
 	*x = SendOrderConfirmationRequest{}
-	mi := &file_demo_proto_msgTypes[33]
+	mi := &file_demo_proto_msgTypes[46]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1755,7 +2398,7 @@ func (x *SendOrderConfirmationRequest) String() string {
 func (*SendOrderConfirmationRequest) ProtoMessage() {}
 
 func (x *SendOrderConfirmationRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[33]
+	mi := &file_demo_proto_msgTypes[46]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1768,7 +2411,7 @@ func (x *SendOrderConfirmationRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use SendOrderConfirmationRequest.ProtoReflect.Descriptor instead.
 func (*SendOrderConfirmationRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{33}
+	return file_demo_proto_rawDescGZIP(), []int{46}
 }
 
 func (x *SendOrderConfirmationRequest) GetEmail() string {
@@ -1798,7 +2441,7 @@ type PlaceOrderRequest struct {
 
 func (x *PlaceOrderRequest) Reset() {
 	*x = PlaceOrderRequest{}
-	mi := &file_demo_proto_msgTypes[34]
+	mi := &file_demo_proto_msgTypes[47]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1810,7 +2453,7 @@ func (x *PlaceOrderRequest) String() string {
 func (*PlaceOrderRequest) ProtoMessage() {}
 
 func (x *PlaceOrderRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[34]
+	mi := &file_demo_proto_msgTypes[47]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1823,7 +2466,7 @@ func (x *PlaceOrderRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use PlaceOrderRequest.ProtoReflect.Descriptor instead.
 func (*PlaceOrderRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{34}
+	return file_demo_proto_rawDescGZIP(), []int{47}
 }
 
 func (x *PlaceOrderRequest) GetUserId() string {
@@ -1870,7 +2513,7 @@ type PlaceOrderResponse struct {
 
 func (x *PlaceOrderResponse) Reset() {
 	*x = PlaceOrderResponse{}
-	mi := &file_demo_proto_msgTypes[35]
+	mi := &file_demo_proto_msgTypes[48]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1882,7 +2525,7 @@ func (x *PlaceOrderResponse) String() string {
 func (*PlaceOrderResponse) ProtoMessage() {}
 
 func (x *PlaceOrderResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[35]
+	mi := &file_demo_proto_msgTypes[48]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1895,7 +2538,7 @@ func (x *PlaceOrderResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use PlaceOrderResponse.ProtoReflect.Descriptor instead.
 func (*PlaceOrderResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{35}
+	return file_demo_proto_rawDescGZIP(), []int{48}
 }
 
 func (x *PlaceOrderResponse) GetOrder() *OrderResult {
@@ -1915,7 +2558,7 @@ type AdRequest struct {
 
 func (x *AdRequest) Reset() {
 	*x = AdRequest{}
-	mi := &file_demo_proto_msgTypes[36]
+	mi := &file_demo_proto_msgTypes[49]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1927,7 +2570,7 @@ func (x *AdRequest) String() string {
 func (*AdRequest) ProtoMessage() {}
 
 func (x *AdRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[36]
+	mi := &file_demo_proto_msgTypes[49]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1940,7 +2583,7 @@ func (x *AdRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use AdRequest.ProtoReflect.Descriptor instead.
 func (*AdRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{36}
+	return file_demo_proto_rawDescGZIP(), []int{49}
 }
 
 func (x *AdRequest) GetContextKeys() []string {
@@ -1959,7 +2602,7 @@ type AdResponse struct {
 
 func (x *AdResponse) Reset() {
 	*x = AdResponse{}
-	mi := &file_demo_proto_msgTypes[37]
+	mi := &file_demo_proto_msgTypes[50]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1971,7 +2614,7 @@ func (x *AdResponse) String() string {
 func (*AdResponse) ProtoMessage() {}
 
 func (x *AdResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[37]
+	mi := &file_demo_proto_msgTypes[50]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1984,7 +2627,7 @@ func (x *AdResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use AdResponse.ProtoReflect.Descriptor instead.
 func (*AdResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{37}
+	return file_demo_proto_rawDescGZIP(), []int{50}
 }
 
 func (x *AdResponse) GetAds() []*Ad {
@@ -2006,7 +2649,7 @@ type Ad struct {
 
 func (x *Ad) Reset() {
 	*x = Ad{}
-	mi := &file_demo_proto_msgTypes[38]
+	mi := &file_demo_proto_msgTypes[51]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2018,7 +2661,7 @@ func (x *Ad) String() string {
 func (*Ad) ProtoMessage() {}
 
 func (x *Ad) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[38]
+	mi := &file_demo_proto_msgTypes[51]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2031,7 +2674,7 @@ func (x *Ad) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use Ad.ProtoReflect.Descriptor instead.
 func (*Ad) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{38}
+	return file_demo_proto_rawDescGZIP(), []int{51}
 }
 
 func (x *Ad) GetRedirectUrl() string {
@@ -2059,7 +2702,7 @@ type Flag struct {
 
 func (x *Flag) Reset() {
 	*x = Flag{}
-	mi := &file_demo_proto_msgTypes[39]
+	mi := &file_demo_proto_msgTypes[52]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2071,7 +2714,7 @@ func (x *Flag) String() string {
 func (*Flag) ProtoMessage() {}
 
 func (x *Flag) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[39]
+	mi := &file_demo_proto_msgTypes[52]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2084,7 +2727,7 @@ func (x *Flag) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use Flag.ProtoReflect.Descriptor instead.
 func (*Flag) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{39}
+	return file_demo_proto_rawDescGZIP(), []int{52}
 }
 
 func (x *Flag) GetName() string {
@@ -2117,7 +2760,7 @@ type GetFlagRequest struct {
 
 func (x *GetFlagRequest) Reset() {
 	*x = GetFlagRequest{}
-	mi := &file_demo_proto_msgTypes[40]
+	mi := &file_demo_proto_msgTypes[53]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2129,7 +2772,7 @@ func (x *GetFlagRequest) String() string {
 func (*GetFlagRequest) ProtoMessage() {}
 
 func (x *GetFlagRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[40]
+	mi := &file_demo_proto_msgTypes[53]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2142,7 +2785,7 @@ func (x *GetFlagRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetFlagRequest.ProtoReflect.Descriptor instead.
 func (*GetFlagRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{40}
+	return file_demo_proto_rawDescGZIP(), []int{53}
 }
 
 func (x *GetFlagRequest) GetName() string {
@@ -2161,7 +2804,7 @@ type GetFlagResponse struct {
 
 func (x *GetFlagResponse) Reset() {
 	*x = GetFlagResponse{}
-	mi := &file_demo_proto_msgTypes[41]
+	mi := &file_demo_proto_msgTypes[54]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2173,7 +2816,7 @@ func (x *GetFlagResponse) String() string {
 func (*GetFlagResponse) ProtoMessage() {}
 
 func (x *GetFlagResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[41]
+	mi := &file_demo_proto_msgTypes[54]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2186,7 +2829,7 @@ func (x *GetFlagResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use GetFlagResponse.ProtoReflect.Descriptor instead.
 func (*GetFlagResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{41}
+	return file_demo_proto_rawDescGZIP(), []int{54}
 }
 
 func (x *GetFlagResponse) GetFlag() *Flag {
@@ -2207,7 +2850,7 @@ type CreateFlagRequest struct {
 
 func (x *CreateFlagRequest) Reset() {
 	*x = CreateFlagRequest{}
-	mi := &file_demo_proto_msgTypes[42]
+	mi := &file_demo_proto_msgTypes[55]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2219,7 +2862,7 @@ func (x *CreateFlagRequest) String() string {
 func (*CreateFlagRequest) ProtoMessage() {}
 
 func (x *CreateFlagRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[42]
+	mi := &file_demo_proto_msgTypes[55]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2232,7 +2875,7 @@ func (x *CreateFlagRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CreateFlagRequest.ProtoReflect.Descriptor instead.
 func (*CreateFlagRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{42}
+	return file_demo_proto_rawDescGZIP(), []int{55}
 }
 
 func (x *CreateFlagRequest) GetName() string {
@@ -2265,7 +2908,7 @@ type CreateFlagResponse struct {
 
 func (x *CreateFlagResponse) Reset() {
 	*x = CreateFlagResponse{}
-	mi := &file_demo_proto_msgTypes[43]
+	mi := &file_demo_proto_msgTypes[56]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2277,7 +2920,7 @@ func (x *CreateFlagResponse) String() string {
 func (*CreateFlagResponse) ProtoMessage() {}
 
 func (x *CreateFlagResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[43]
+	mi := &file_demo_proto_msgTypes[56]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2290,7 +2933,7 @@ func (x *CreateFlagResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use CreateFlagResponse.ProtoReflect.Descriptor instead.
 func (*CreateFlagResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{43}
+	return file_demo_proto_rawDescGZIP(), []int{56}
 }
 
 func (x *CreateFlagResponse) GetFlag() *Flag {
@@ -2310,7 +2953,7 @@ type UpdateFlagRequest struct {
 
 func (x *UpdateFlagRequest) Reset() {
 	*x = UpdateFlagRequest{}
-	mi := &file_demo_proto_msgTypes[44]
+	mi := &file_demo_proto_msgTypes[57]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2322,7 +2965,7 @@ func (x *UpdateFlagRequest) String() string {
 func (*UpdateFlagRequest) ProtoMessage() {}
 
 func (x *UpdateFlagRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[44]
+	mi := &file_demo_proto_msgTypes[57]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2335,7 +2978,7 @@ func (x *UpdateFlagRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use UpdateFlagRequest.ProtoReflect.Descriptor instead.
 func (*UpdateFlagRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{44}
+	return file_demo_proto_rawDescGZIP(), []int{57}
 }
 
 func (x *UpdateFlagRequest) GetName() string {
@@ -2360,7 +3003,7 @@ type UpdateFlagResponse struct {
 
 func (x *UpdateFlagResponse) Reset() {
 	*x = UpdateFlagResponse{}
-	mi := &file_demo_proto_msgTypes[45]
+	mi := &file_demo_proto_msgTypes[58]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2372,7 +3015,7 @@ func (x *UpdateFlagResponse) String() string {
 func (*UpdateFlagResponse) ProtoMessage() {}
 
 func (x *UpdateFlagResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[45]
+	mi := &file_demo_proto_msgTypes[58]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2385,7 +3028,7 @@ func (x *UpdateFlagResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use UpdateFlagResponse.ProtoReflect.Descriptor instead.
 func (*UpdateFlagResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{45}
+	return file_demo_proto_rawDescGZIP(), []int{58}
 }
 
 type ListFlagsRequest struct {
@@ -2396,7 +3039,7 @@ type ListFlagsRequest struct {
 
 func (x *ListFlagsRequest) Reset() {
 	*x = ListFlagsRequest{}
-	mi := &file_demo_proto_msgTypes[46]
+	mi := &file_demo_proto_msgTypes[59]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2408,7 +3051,7 @@ func (x *ListFlagsRequest) String() string {
 func (*ListFlagsRequest) ProtoMessage() {}
 
 func (x *ListFlagsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[46]
+	mi := &file_demo_proto_msgTypes[59]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2421,7 +3064,7 @@ func (x *ListFlagsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListFlagsRequest.ProtoReflect.Descriptor instead.
 func (*ListFlagsRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{46}
+	return file_demo_proto_rawDescGZIP(), []int{59}
 }
 
 type ListFlagsResponse struct {
@@ -2433,7 +3076,7 @@ type ListFlagsResponse struct {
 
 func (x *ListFlagsResponse) Reset() {
 	*x = ListFlagsResponse{}
-	mi := &file_demo_proto_msgTypes[47]
+	mi := &file_demo_proto_msgTypes[60]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2445,7 +3088,7 @@ func (x *ListFlagsResponse) String() string {
 func (*ListFlagsResponse) ProtoMessage() {}
 
 func (x *ListFlagsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[47]
+	mi := &file_demo_proto_msgTypes[60]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2458,7 +3101,7 @@ func (x *ListFlagsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListFlagsResponse.ProtoReflect.Descriptor instead.
 func (*ListFlagsResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{47}
+	return file_demo_proto_rawDescGZIP(), []int{60}
 }
 
 func (x *ListFlagsResponse) GetFlag() []*Flag {
@@ -2477,7 +3120,7 @@ type DeleteFlagRequest struct {
 
 func (x *DeleteFlagRequest) Reset() {
 	*x = DeleteFlagRequest{}
-	mi := &file_demo_proto_msgTypes[48]
+	mi := &file_demo_proto_msgTypes[61]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2489,7 +3132,7 @@ func (x *DeleteFlagRequest) String() string {
 func (*DeleteFlagRequest) ProtoMessage() {}
 
 func (x *DeleteFlagRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[48]
+	mi := &file_demo_proto_msgTypes[61]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2502,7 +3145,7 @@ func (x *DeleteFlagRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use DeleteFlagRequest.ProtoReflect.Descriptor instead.
 func (*DeleteFlagRequest) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{48}
+	return file_demo_proto_rawDescGZIP(), []int{61}
 }
 
 func (x *DeleteFlagRequest) GetName() string {
@@ -2520,7 +3163,7 @@ type DeleteFlagResponse struct {
 
 func (x *DeleteFlagResponse) Reset() {
 	*x = DeleteFlagResponse{}
-	mi := &file_demo_proto_msgTypes[49]
+	mi := &file_demo_proto_msgTypes[62]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -2532,7 +3175,7 @@ func (x *DeleteFlagResponse) String() string {
 func (*DeleteFlagResponse) ProtoMessage() {}
 
 func (x *DeleteFlagResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_demo_proto_msgTypes[49]
+	mi := &file_demo_proto_msgTypes[62]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -2545,7 +3188,7 @@ func (x *DeleteFlagResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use DeleteFlagResponse.ProtoReflect.Descriptor instead.
 func (*DeleteFlagResponse) Descriptor() ([]byte, []int) {
-	return file_demo_proto_rawDescGZIP(), []int{49}
+	return file_demo_proto_rawDescGZIP(), []int{62}
 }
 
 var File_demo_proto protoreflect.FileDescriptor
@@ -2575,7 +3218,11 @@ const file_demo_proto_rawDesc = "" +
 	"productIds\">\n" +
 	"\x1bListRecommendationsResponse\x12\x1f\n" +
 	"\vproduct_ids\x18\x01 \x03(\tR\n" +
-	"productIds\"\xb7\x01\n" +
+	"productIds\"c\n" +
+	"\x1fListRecommendationsBatchRequest\x12@\n" +
+	"\brequests\x18\x01 \x03(\v2$.oteldemo.ListRecommendationsRequestR\brequests\"g\n" +
+	" ListRecommendationsBatchResponse\x12C\n" +
+	"\tresponses\x18\x01 \x03(\v2%.oteldemo.ListRecommendationsResponseR\tresponses\"\xb7\x01\n" +
 	"\aProduct\x12\x0e\n" +
 	"\x02id\x18\x01 \x01(\tR\x02id\x12\x12\n" +
 	"\x04name\x18\x02 \x01(\tR\x04name\x12 \n" +
@@ -2606,7 +3253,46 @@ const file_demo_proto_rawDesc = "" +
 	"\n" +
 	"product_id\x18\x01 \x01(\tR\tproductId\"K\n" +
 	"$GetAverageProductReviewScoreResponse\x12#\n" +
-	"\raverage_score\x18\x01 \x01(\tR\faverageScore\"Y\n" +
+	"\raverage_score\x18\x01 \x01(\tR\faverageScore\"F\n" +
+	"%GetProductReviewScoreHistogramRequest\x12\x1d\n" +
+	"\n" +
+	"product_id\x18\x01 \x01(\tR\tproductId\"\x91\x01\n" +
+	"&GetProductReviewScoreHistogramResponse\x12!\n" +
+	"\freview_count\x18\x01 \x01(\x05R\vreviewCount\x12#\n" +
+	"\raverage_score\x18\x02 \x01(\tR\faverageScore\x12\x1f\n" +
+	"\vstar_counts\x18\x03 \x03(\x05R\n" +
+	"starCounts\"@\n" +
+	"\x1dGetProductReviewsBatchRequest\x12\x1f\n" +
+	"\vproduct_ids\x18\x01 \x03(\tR\n" +
+	"productIds\"q\n" +
+	"\x0eProductReviews\x12\x1d\n" +
+	"\n" +
+	"product_id\x18\x01 \x01(\tR\tproductId\x12@\n" +
+	"\x0fproduct_reviews\x18\x02 \x03(\v2\x17.oteldemo.ProductReviewR\x0eproductReviews\"c\n" +
+	"\x1eGetProductReviewsBatchResponse\x12A\n" +
+	"\x0fproduct_reviews\x18\x01 \x03(\v2\x18.oteldemo.ProductReviewsR\x0eproductReviews\"?\n" +
+	"\x1cGetAverageScoresBatchRequest\x12\x1f\n" +
+	"\vproduct_ids\x18\x01 \x03(\tR\n" +
+	"productIds\"Y\n" +
+	"\x13ProductAverageScore\x12\x1d\n" +
+	"\n" +
+	"product_id\x18\x01 \x01(\tR\tproductId\x12#\n" +
+	"\raverage_score\x18\x02 \x01(\tR\faverageScore\"e\n" +
+	"\x1dGetAverageScoresBatchResponse\x12D\n" +
+	"\x0eaverage_scores\x18\x01 \x03(\v2\x1d.oteldemo.ProductAverageScoreR\raverageScores\"\x9f\x01\n" +
+	"\x1cGetProductReviewsPageRequest\x12\x1d\n" +
+	"\n" +
+	"product_id\x18\x01 \x01(\tR\tproductId\x12\x1b\n" +
+	"\tpage_size\x18\x02 \x01(\x05R\bpageSize\x12\x1d\n" +
+	"\n" +
+	"page_token\x18\x03 \x01(\tR\tpageToken\x12$\n" +
+	"\x0eorder_by_score\x18\x04 \x01(\bR\forderByScore\"\x89\x01\n" +
+	"\x1dGetProductReviewsPageResponse\x12@\n" +
+	"\x0fproduct_reviews\x18\x01 \x03(\v2\x17.oteldemo.ProductReviewR\x0eproductReviews\x12&\n" +
+	"\x0fnext_page_token\x18\x02 \x01(\tR\rnextPageToken\"<\n" +
+	"\x1bStreamProductReviewsRequest\x12\x1d\n" +
+	"\n" +
+	"product_id\x18\x01 \x01(\tR\tproductId\"Y\n" +
 	"\x1cAskProductAIAssistantRequest\x12\x1d\n" +
 	"\n" +
 	"product_id\x18\x01 \x01(\tR\tproductId\x12\x1a\n" +
@@ -2706,18 +3392,24 @@ const file_demo_proto_rawDesc = "" +
 	"\vCartService\x126\n" +
 	"\aAddItem\x12\x18.oteldemo.AddItemRequest\x1a\x0f.oteldemo.Empty\"\x00\x125\n" +
 	"\aGetCart\x12\x18.oteldemo.GetCartRequest\x1a\x0e.oteldemo.Cart\"\x00\x12:\n" +
-	"\tEmptyCart\x12\x1a.oteldemo.EmptyCartRequest\x1a\x0f.oteldemo.Empty\"\x002}\n" +
+	"\tEmptyCart\x12\x1a.oteldemo.EmptyCartRequest\x1a\x0f.oteldemo.Empty\"\x002\xf2\x01\n" +
 	"\x15RecommendationService\x12d\n" +
-	"\x13ListRecommendations\x12$.oteldemo.ListRecommendationsRequest\x1a%.oteldemo.ListRecommendationsResponse\"\x002\xf1\x01\n" +
+	"\x13ListRecommendations\x12$.oteldemo.ListRecommendationsRequest\x1a%.oteldemo.ListRecommendationsResponse\"\x00\x12s\n" +
+	"\x18ListRecommendationsBatch\x12).oteldemo.ListRecommendationsBatchRequest\x1a*.oteldemo.ListRecommendationsBatchResponse\"\x002\xf1\x01\n" +
 	"\x15ProductCatalogService\x12A\n" +
 	"\fListProducts\x12\x0f.oteldemo.Empty\x1a\x1e.oteldemo.ListProductsResponse\"\x00\x12>\n" +
 	"\n" +
 	"GetProduct\x12\x1b.oteldemo.GetProductRequest\x1a\x11.oteldemo.Product\"\x00\x12U\n" +
-	"\x0eSearchProducts\x12\x1f.oteldemo.SearchProductsRequest\x1a .oteldemo.SearchProductsResponse\"\x002\xe3\x02\n" +
+	"\x0eSearchProducts\x12\x1f.oteldemo.SearchProductsRequest\x1a .oteldemo.SearchProductsResponse\"\x002\x8e\a\n" +
 	"\x14ProductReviewService\x12^\n" +
 	"\x11GetProductReviews\x12\".oteldemo.GetProductReviewsRequest\x1a#.oteldemo.GetProductReviewsResponse\"\x00\x12\x7f\n" +
 	"\x1cGetAverageProductReviewScore\x12-.oteldemo.GetAverageProductReviewScoreRequest\x1a..oteldemo.GetAverageProductReviewScoreResponse\"\x00\x12j\n" +
-	"\x15AskProductAIAssistant\x12&.oteldemo.AskProductAIAssistantRequest\x1a'.oteldemo.AskProductAIAssistantResponse\"\x002\x9e\x01\n" +
+	"\x15AskProductAIAssistant\x12&.oteldemo.AskProductAIAssistantRequest\x1a'.oteldemo.AskProductAIAssistantResponse\"\x00\x12\x85\x01\n" +
+	"\x1eGetProductReviewScoreHistogram\x12/.oteldemo.GetProductReviewScoreHistogramRequest\x1a0.oteldemo.GetProductReviewScoreHistogramResponse\"\x00\x12m\n" +
+	"\x16GetProductReviewsBatch\x12'.oteldemo.GetProductReviewsBatchRequest\x1a(.oteldemo.GetProductReviewsBatchResponse\"\x00\x12j\n" +
+	"\x15GetAverageScoresBatch\x12&.oteldemo.GetAverageScoresBatchRequest\x1a'.oteldemo.GetAverageScoresBatchResponse\"\x00\x12j\n" +
+	"\x15GetProductReviewsPage\x12&.oteldemo.GetProductReviewsPageRequest\x1a'.oteldemo.GetProductReviewsPageResponse\"\x00\x12Z\n" +
+	"\x14StreamProductReviews\x12%.oteldemo.StreamProductReviewsRequest\x1a\x17.oteldemo.ProductReview\"\x000\x012\x9e\x01\n" +
 	"\x0fShippingService\x12C\n" +
 	"\bGetQuote\x12\x19.oteldemo.GetQuoteRequest\x1a\x1a.oteldemo.GetQuoteResponse\"\x00\x12F\n" +
 	"\tShipOrder\x12\x1a.oteldemo.ShipOrderRequest\x1a\x1b.oteldemo.ShipOrderResponse\"\x002\xab\x01\n" +
@@ -2755,138 +3447,169 @@ func file_demo_proto_rawDescGZIP() []byte {
 	return file_demo_proto_rawDescData
 }
 
-var file_demo_proto_msgTypes = make([]protoimpl.MessageInfo, 50)
+var file_demo_proto_msgTypes = make([]protoimpl.MessageInfo, 63)
 var file_demo_proto_goTypes = []any{
-	(*CartItem)(nil),                             // 0: oteldemo.CartItem
-	(*AddItemRequest)(nil),                       // 1: oteldemo.AddItemRequest
-	(*EmptyCartRequest)(nil),                     // 2: oteldemo.EmptyCartRequest
-	(*GetCartRequest)(nil),                       // 3: oteldemo.GetCartRequest
-	(*Cart)(nil),                                 // 4: oteldemo.Cart
-	(*Empty)(nil),                                // 5: oteldemo.Empty
-	(*ListRecommendationsRequest)(nil),           // 6: oteldemo.ListRecommendationsRequest
-	(*ListRecommendationsResponse)(nil),          // 7: oteldemo.ListRecommendationsResponse
-	(*Product)(nil),                              // 8: oteldemo.Product
-	(*ListProductsResponse)(nil),                 // 9: oteldemo.ListProductsResponse
-	(*GetProductRequest)(nil),                    // 10: oteldemo.GetProductRequest
-	(*SearchProductsRequest)(nil),                // 11: oteldemo.SearchProductsRequest
-	(*SearchProductsResponse)(nil),               // 12: oteldemo.SearchProductsResponse
-	(*ProductReview)(nil),                        // 13: oteldemo.ProductReview
-	(*GetProductReviewsRequest)(nil),             // 14: oteldemo.GetProductReviewsRequest
-	(*GetProductReviewsResponse)(nil),            // 15: oteldemo.GetProductReviewsResponse
-	(*GetAverageProductReviewScoreRequest)(nil),  // 16: oteldemo.GetAverageProductReviewScoreRequest
-	(*GetAverageProductReviewScoreResponse)(nil), // 17: oteldemo.GetAverageProductReviewScoreResponse
-	(*AskProductAIAssistantRequest)(nil),         // 18: oteldemo.AskProductAIAssistantRequest
-	(*AskProductAIAssistantResponse)(nil),        // 19: oteldemo.AskProductAIAssistantResponse
-	(*GetQuoteRequest)(nil),                      // 20: oteldemo.GetQuoteRequest
-	(*GetQuoteResponse)(nil),                     // 21: oteldemo.GetQuoteResponse
-	(*ShipOrderRequest)(nil),                     // 22: oteldemo.ShipOrderRequest
-	(*ShipOrderResponse)(nil),                    // 23: oteldemo.ShipOrderResponse
-	(*Address)(nil),                              // 24: oteldemo.Address
-	(*Money)(nil),                                // 25: oteldemo.Money
-	(*GetSupportedCurrenciesResponse)(nil),       // 26: oteldemo.GetSupportedCurrenciesResponse
-	(*CurrencyConversionRequest)(nil),            // 27: oteldemo.CurrencyConversionRequest
-	(*CreditCardInfo)(nil),                       // 28: oteldemo.CreditCardInfo
-	(*ChargeRequest)(nil),                        // 29: oteldemo.ChargeRequest
-	(*ChargeResponse)(nil),                       // 30: oteldemo.ChargeResponse
-	(*OrderItem)(nil),                            // 31: oteldemo.OrderItem
-	(*OrderResult)(nil),                          // 32: oteldemo.OrderResult
-	(*SendOrderConfirmationRequest)(nil),         // 33: oteldemo.SendOrderConfirmationRequest
-	(*PlaceOrderRequest)(nil),                    // 34: oteldemo.PlaceOrderRequest
-	(*PlaceOrderResponse)(nil),                   // 35: oteldemo.PlaceOrderResponse
-	(*AdRequest)(nil),                            // 36: oteldemo.AdRequest
-	(*AdResponse)(nil),                           // 37: oteldemo.AdResponse
-	(*Ad)(nil),                                   // 38: oteldemo.Ad
-	(*Flag)(nil),                                 // 39: oteldemo.Flag
-	(*GetFlagRequest)(nil),                       // 40: oteldemo.GetFlagRequest
-	(*GetFlagResponse)(nil),                      // 41: oteldemo.GetFlagResponse
-	(*CreateFlagRequest)(nil),                    // 42: oteldemo.CreateFlagRequest
-	(*CreateFlagResponse)(nil),                   // 43: oteldemo.CreateFlagResponse
-	(*UpdateFlagRequest)(nil),                    // 44: oteldemo.UpdateFlagRequest
-	(*UpdateFlagResponse)(nil),                   // 45: oteldemo.UpdateFlagResponse
-	(*ListFlagsRequest)(nil),                     // 46: oteldemo.ListFlagsRequest
-	(*ListFlagsResponse)(nil),                    // 47: oteldemo.ListFlagsResponse
-	(*DeleteFlagRequest)(nil),                    // 48: oteldemo.DeleteFlagRequest
-	(*DeleteFlagResponse)(nil),                   // 49: oteldemo.DeleteFlagResponse
+	(*CartItem)(nil),                               // 0: oteldemo.CartItem
+	(*AddItemRequest)(nil),                         // 1: oteldemo.AddItemRequest
+	(*EmptyCartRequest)(nil),                       // 2: oteldemo.EmptyCartRequest
+	(*GetCartRequest)(nil),                         // 3: oteldemo.GetCartRequest
+	(*Cart)(nil),                                   // 4: oteldemo.Cart
+	(*Empty)(nil),                                  // 5: oteldemo.Empty
+	(*ListRecommendationsRequest)(nil),             // 6: oteldemo.ListRecommendationsRequest
+	(*ListRecommendationsResponse)(nil),            // 7: oteldemo.ListRecommendationsResponse
+	(*ListRecommendationsBatchRequest)(nil),        // 8: oteldemo.ListRecommendationsBatchRequest
+	(*ListRecommendationsBatchResponse)(nil),       // 9: oteldemo.ListRecommendationsBatchResponse
+	(*Product)(nil),                                // 10: oteldemo.Product
+	(*ListProductsResponse)(nil),                   // 11: oteldemo.ListProductsResponse
+	(*GetProductRequest)(nil),                      // 12: oteldemo.GetProductRequest
+	(*SearchProductsRequest)(nil),                  // 13: oteldemo.SearchProductsRequest
+	(*SearchProductsResponse)(nil),                 // 14: oteldemo.SearchProductsResponse
+	(*ProductReview)(nil),                          // 15: oteldemo.ProductReview
+	(*GetProductReviewsRequest)(nil),               // 16: oteldemo.GetProductReviewsRequest
+	(*GetProductReviewsResponse)(nil),              // 17: oteldemo.GetProductReviewsResponse
+	(*GetAverageProductReviewScoreRequest)(nil),    // 18: oteldemo.GetAverageProductReviewScoreRequest
+	(*GetAverageProductReviewScoreResponse)(nil),   // 19: oteldemo.GetAverageProductReviewScoreResponse
+	(*GetProductReviewScoreHistogramRequest)(nil),  // 20: oteldemo.GetProductReviewScoreHistogramRequest
+	(*GetProductReviewScoreHistogramResponse)(nil), // 21: oteldemo.GetProductReviewScoreHistogramResponse
+	(*GetProductReviewsBatchRequest)(nil),          // 22: oteldemo.GetProductReviewsBatchRequest
+	(*ProductReviews)(nil),                         // 23: oteldemo.ProductReviews
+	(*GetProductReviewsBatchResponse)(nil),         // 24: oteldemo.GetProductReviewsBatchResponse
+	(*GetAverageScoresBatchRequest)(nil),           // 25: oteldemo.GetAverageScoresBatchRequest
+	(*ProductAverageScore)(nil),                    // 26: oteldemo.ProductAverageScore
+	(*GetAverageScoresBatchResponse)(nil),          // 27: oteldemo.GetAverageScoresBatchResponse
+	(*GetProductReviewsPageRequest)(nil),           // 28: oteldemo.GetProductReviewsPageRequest
+	(*GetProductReviewsPageResponse)(nil),          // 29: oteldemo.GetProductReviewsPageResponse
+	(*StreamProductReviewsRequest)(nil),            // 30: oteldemo.StreamProductReviewsRequest
+	(*AskProductAIAssistantRequest)(nil),           // 31: oteldemo.AskProductAIAssistantRequest
+	(*AskProductAIAssistantResponse)(nil),          // 32: oteldemo.AskProductAIAssistantResponse
+	(*GetQuoteRequest)(nil),                        // 33: oteldemo.GetQuoteRequest
+	(*GetQuoteResponse)(nil),                       // 34: oteldemo.GetQuoteResponse
+	(*ShipOrderRequest)(nil),                       // 35: oteldemo.ShipOrderRequest
+	(*ShipOrderResponse)(nil),                      // 36: oteldemo.ShipOrderResponse
+	(*Address)(nil),                                // 37: oteldemo.Address
+	(*Money)(nil),                                  // 38: oteldemo.Money
+	(*GetSupportedCurrenciesResponse)(nil),         // 39: oteldemo.GetSupportedCurrenciesResponse
+	(*CurrencyConversionRequest)(nil),              // 40: oteldemo.CurrencyConversionRequest
+	(*CreditCardInfo)(nil),                         // 41: oteldemo.CreditCardInfo
+	(*ChargeRequest)(nil),                          // 42: oteldemo.ChargeRequest
+	(*ChargeResponse)(nil),                         // 43: oteldemo.ChargeResponse
+	(*OrderItem)(nil),                              // 44: oteldemo.OrderItem
+	(*OrderResult)(nil),                            // 45: oteldemo.OrderResult
+	(*SendOrderConfirmationRequest)(nil),           // 46: oteldemo.SendOrderConfirmationRequest
+	(*PlaceOrderRequest)(nil),                      // 47: oteldemo.PlaceOrderRequest
+	(*PlaceOrderResponse)(nil),                     // 48: oteldemo.PlaceOrderResponse
+	(*AdRequest)(nil),                              // 49: oteldemo.AdRequest
+	(*AdResponse)(nil),                             // 50: oteldemo.AdResponse
+	(*Ad)(nil),                                     // 51: oteldemo.Ad
+	(*Flag)(nil),                                   // 52: oteldemo.Flag
+	(*GetFlagRequest)(nil),                         // 53: oteldemo.GetFlagRequest
+	(*GetFlagResponse)(nil),                        // 54: oteldemo.GetFlagResponse
+	(*CreateFlagRequest)(nil),                      // 55: oteldemo.CreateFlagRequest
+	(*CreateFlagResponse)(nil),                     // 56: oteldemo.CreateFlagResponse
+	(*UpdateFlagRequest)(nil),                      // 57: oteldemo.UpdateFlagRequest
+	(*UpdateFlagResponse)(nil),                     // 58: oteldemo.UpdateFlagResponse
+	(*ListFlagsRequest)(nil),                       // 59: oteldemo.ListFlagsRequest
+	(*ListFlagsResponse)(nil),                      // 60: oteldemo.ListFlagsResponse
+	(*DeleteFlagRequest)(nil),                      // 61: oteldemo.DeleteFlagRequest
+	(*DeleteFlagResponse)(nil),                     // 62: oteldemo.DeleteFlagResponse
 }
 var file_demo_proto_depIdxs = []int32{
 	0,  // 0: oteldemo.AddItemRequest.item:type_name -> oteldemo.CartItem
 	0,  // 1: oteldemo.Cart.items:type_name -> oteldemo.CartItem
-	25, // 2: oteldemo.Product.price_usd:type_name -> oteldemo.Money
-	8,  // 3: oteldemo.ListProductsResponse.products:type_name -> oteldemo.Product
-	8,  // 4: oteldemo.SearchProductsResponse.results:type_name -> oteldemo.Product
-	13, // 5: oteldemo.GetProductReviewsResponse.product_reviews:type_name -> oteldemo.ProductReview
-	24, // 6: oteldemo.GetQuoteRequest.address:type_name -> oteldemo.Address
-	0,  // 7: oteldemo.GetQuoteRequest.items:type_name -> oteldemo.CartItem
-	25, // 8: oteldemo.GetQuoteResponse.cost_usd:type_name -> oteldemo.Money
-	24, // 9: oteldemo.ShipOrderRequest.address:type_name -> oteldemo.Address
-	0,  // 10: oteldemo.ShipOrderRequest.items:type_name -> oteldemo.CartItem
-	25, // 11: oteldemo.CurrencyConversionRequest.from:type_name -> oteldemo.Money
-	25, // 12: oteldemo.ChargeRequest.amount:type_name -> oteldemo.Money
-	28, // 13: oteldemo.ChargeRequest.credit_card:type_name -> oteldemo.CreditCardInfo
-	0,  // 14: oteldemo.OrderItem.item:type_name -> oteldemo.CartItem
-	25, // 15: oteldemo.OrderItem.cost:type_name -> oteldemo.Money
-	25, // 16: oteldemo.OrderResult.shipping_cost:type_name -> oteldemo.Money
-	24, // 17: oteldemo.OrderResult.shipping_address:type_name -> oteldemo.Address
-	31, // 18: oteldemo.OrderResult.items:type_name -> oteldemo.OrderItem
-	32, // 19: oteldemo.SendOrderConfirmationRequest.order:type_name -> oteldemo.OrderResult
-	24, // 20: oteldemo.PlaceOrderRequest.address:type_name -> oteldemo.Address
-	28, // 21: oteldemo.PlaceOrderRequest.credit_card:type_name -> oteldemo.CreditCardInfo
-	32, // 22: oteldemo.PlaceOrderResponse.order:type_name -> oteldemo.OrderResult
-	38, // 23: oteldemo.AdResponse.ads:type_name -> oteldemo.Ad
-	39, // 24: oteldemo.GetFlagResponse.flag:type_name -> oteldemo.Flag
-	39, // 25: oteldemo.CreateFlagResponse.flag:type_name -> oteldemo.Flag
-	39, // 26: oteldemo.ListFlagsResponse.flag:type_name -> oteldemo.Flag
-	1,  // 27: oteldemo.CartService.AddItem:input_type -> oteldemo.AddItemRequest
-	3,  // 28: oteldemo.CartService.GetCart:input_type -> oteldemo.GetCartRequest
-	2,  // 29: oteldemo.CartService.EmptyCart:input_type -> oteldemo.EmptyCartRequest
-	6,  // 30: oteldemo.RecommendationService.ListRecommendations:input_type -> oteldemo.ListRecommendationsRequest
-	5,  // 31: oteldemo.ProductCatalogService.ListProducts:input_type -> oteldemo.Empty
-	10, // 32: oteldemo.ProductCatalogService.GetProduct:input_type -> oteldemo.GetProductRequest
-	11, // 33: oteldemo.ProductCatalogService.SearchProducts:input_type -> oteldemo.SearchProductsRequest
-	14, // 34: oteldemo.ProductReviewService.GetProductReviews:input_type -> oteldemo.GetProductReviewsRequest
-	16, // 35: oteldemo.ProductReviewService.GetAverageProductReviewScore:input_type -> oteldemo.GetAverageProductReviewScoreRequest
-	18, // 36: oteldemo.ProductReviewService.AskProductAIAssistant:input_type -> oteldemo.AskProductAIAssistantRequest
-	20, // 37: oteldemo.ShippingService.GetQuote:input_type -> oteldemo.GetQuoteRequest
-	22, // 38: oteldemo.ShippingService.ShipOrder:input_type -> oteldemo.ShipOrderRequest
-	5,  // 39: oteldemo.CurrencyService.GetSupportedCurrencies:input_type -> oteldemo.Empty
-	27, // 40: oteldemo.CurrencyService.Convert:input_type -> oteldemo.CurrencyConversionRequest
-	29, // 41: oteldemo.PaymentService.Charge:input_type -> oteldemo.ChargeRequest
-	33, // 42: oteldemo.EmailService.SendOrderConfirmation:input_type -> oteldemo.SendOrderConfirmationRequest
-	34, // 43: oteldemo.CheckoutService.PlaceOrder:input_type -> oteldemo.PlaceOrderRequest
-	36, // 44: oteldemo.AdService.GetAds:input_type -> oteldemo.AdRequest
-	40, // 45: oteldemo.FeatureFlagService.GetFlag:input_type -> oteldemo.GetFlagRequest
-	42, // 46: oteldemo.FeatureFlagService.CreateFlag:input_type -> oteldemo.CreateFlagRequest
-	44, // 47: oteldemo.FeatureFlagService.UpdateFlag:input_type -> oteldemo.UpdateFlagRequest
-	46, // 48: oteldemo.FeatureFlagService.ListFlags:input_type -> oteldemo.ListFlagsRequest
-	48, // 49: oteldemo.FeatureFlagService.DeleteFlag:input_type -> oteldemo.DeleteFlagRequest
-	5,  // 50: oteldemo.CartService.AddItem:output_type -> oteldemo.Empty
-	4,  // 51: oteldemo.CartService.GetCart:output_type -> oteldemo.Cart
-	5,  // 52: oteldemo.CartService.EmptyCart:output_type -> oteldemo.Empty
-	7,  // 53: oteldemo.RecommendationService.ListRecommendations:output_type -> oteldemo.ListRecommendationsResponse
-	9,  // 54: oteldemo.ProductCatalogService.ListProducts:output_type -> oteldemo.ListProductsResponse
-	8,  // 55: oteldemo.ProductCatalogService.GetProduct:output_type -> oteldemo.Product
-	12, // 56: oteldemo.ProductCatalogService.SearchProducts:output_type -> oteldemo.SearchProductsResponse
-	15, // 57: oteldemo.ProductReviewService.GetProductReviews:output_type -> oteldemo.GetProductReviewsResponse
-	17, // 58: oteldemo.ProductReviewService.GetAverageProductReviewScore:output_type -> oteldemo.GetAverageProductReviewScoreResponse
-	19, // 59: oteldemo.ProductReviewService.AskProductAIAssistant:output_type -> oteldemo.AskProductAIAssistantResponse
-	21, // 60: oteldemo.ShippingService.GetQuote:output_type -> oteldemo.GetQuoteResponse
-	23, // 61: oteldemo.ShippingService.ShipOrder:output_type -> oteldemo.ShipOrderResponse
-	26, // 62: oteldemo.CurrencyService.GetSupportedCurrencies:output_type -> oteldemo.GetSupportedCurrenciesResponse
-	25, // 63: oteldemo.CurrencyService.Convert:output_type -> oteldemo.Money
-	30, // 64: oteldemo.PaymentService.Charge:output_type -> oteldemo.ChargeResponse
-	5,  // 65: oteldemo.EmailService.SendOrderConfirmation:output_type -> oteldemo.Empty
-	35, // 66: oteldemo.CheckoutService.PlaceOrder:output_type -> oteldemo.PlaceOrderResponse
-	37, // 67: oteldemo.AdService.GetAds:output_type -> oteldemo.AdResponse
-	41, // 68: oteldemo.FeatureFlagService.GetFlag:output_type -> oteldemo.GetFlagResponse
-	43, // 69: oteldemo.FeatureFlagService.CreateFlag:output_type -> oteldemo.CreateFlagResponse
-	45, // 70: oteldemo.FeatureFlagService.UpdateFlag:output_type -> oteldemo.UpdateFlagResponse
-	47, // 71: oteldemo.FeatureFlagService.ListFlags:output_type -> oteldemo.ListFlagsResponse
-	49, // 72: oteldemo.FeatureFlagService.DeleteFlag:output_type -> oteldemo.DeleteFlagResponse
-	50, // [50:73] is the sub-list for method output_type
-	27, // [27:50] is the sub-list for method input_type
-	27, // [27:27] is the sub-list for extension type_name
-	27, // [27:27] is the sub-list for extension extendee
-	0,  // [0:27] is the sub-list for field type_name
+	6,  // 2: oteldemo.ListRecommendationsBatchRequest.requests:type_name -> oteldemo.ListRecommendationsRequest
+	7,  // 3: oteldemo.ListRecommendationsBatchResponse.responses:type_name -> oteldemo.ListRecommendationsResponse
+	38, // 4: oteldemo.Product.price_usd:type_name -> oteldemo.Money
+	10, // 5: oteldemo.ListProductsResponse.products:type_name -> oteldemo.Product
+	10, // 6: oteldemo.SearchProductsResponse.results:type_name -> oteldemo.Product
+	15, // 7: oteldemo.GetProductReviewsResponse.product_reviews:type_name -> oteldemo.ProductReview
+	15, // 8: oteldemo.ProductReviews.product_reviews:type_name -> oteldemo.ProductReview
+	23, // 9: oteldemo.GetProductReviewsBatchResponse.product_reviews:type_name -> oteldemo.ProductReviews
+	26, // 10: oteldemo.GetAverageScoresBatchResponse.average_scores:type_name -> oteldemo.ProductAverageScore
+	15, // 11: oteldemo.GetProductReviewsPageResponse.product_reviews:type_name -> oteldemo.ProductReview
+	37, // 12: oteldemo.GetQuoteRequest.address:type_name -> oteldemo.Address
+	0,  // 13: oteldemo.GetQuoteRequest.items:type_name -> oteldemo.CartItem
+	38, // 14: oteldemo.GetQuoteResponse.cost_usd:type_name -> oteldemo.Money
+	37, // 15: oteldemo.ShipOrderRequest.address:type_name -> oteldemo.Address
+	0,  // 16: oteldemo.ShipOrderRequest.items:type_name -> oteldemo.CartItem
+	38, // 17: oteldemo.CurrencyConversionRequest.from:type_name -> oteldemo.Money
+	38, // 18: oteldemo.ChargeRequest.amount:type_name -> oteldemo.Money
+	41, // 19: oteldemo.ChargeRequest.credit_card:type_name -> oteldemo.CreditCardInfo
+	0,  // 20: oteldemo.OrderItem.item:type_name -> oteldemo.CartItem
+	38, // 21: oteldemo.OrderItem.cost:type_name -> oteldemo.Money
+	38, // 22: oteldemo.OrderResult.shipping_cost:type_name -> oteldemo.Money
+	37, // 23: oteldemo.OrderResult.shipping_address:type_name -> oteldemo.Address
+	44, // 24: oteldemo.OrderResult.items:type_name -> oteldemo.OrderItem
+	45, // 25: oteldemo.SendOrderConfirmationRequest.order:type_name -> oteldemo.OrderResult
+	37, // 26: oteldemo.PlaceOrderRequest.address:type_name -> oteldemo.Address
+	41, // 27: oteldemo.PlaceOrderRequest.credit_card:type_name -> oteldemo.CreditCardInfo
+	45, // 28: oteldemo.PlaceOrderResponse.order:type_name -> oteldemo.OrderResult
+	51, // 29: oteldemo.AdResponse.ads:type_name -> oteldemo.Ad
+	52, // 30: oteldemo.GetFlagResponse.flag:type_name -> oteldemo.Flag
+	52, // 31: oteldemo.CreateFlagResponse.flag:type_name -> oteldemo.Flag
+	52, // 32: oteldemo.ListFlagsResponse.flag:type_name -> oteldemo.Flag
+	1,  // 33: oteldemo.CartService.AddItem:input_type -> oteldemo.AddItemRequest
+	3,  // 34: oteldemo.CartService.GetCart:input_type -> oteldemo.GetCartRequest
+	2,  // 35: oteldemo.CartService.EmptyCart:input_type -> oteldemo.EmptyCartRequest
+	6,  // 36: oteldemo.RecommendationService.ListRecommendations:input_type -> oteldemo.ListRecommendationsRequest
+	8,  // 37: oteldemo.RecommendationService.ListRecommendationsBatch:input_type -> oteldemo.ListRecommendationsBatchRequest
+	5,  // 38: oteldemo.ProductCatalogService.ListProducts:input_type -> oteldemo.Empty
+	12, // 39: oteldemo.ProductCatalogService.GetProduct:input_type -> oteldemo.GetProductRequest
+	13, // 40: oteldemo.ProductCatalogService.SearchProducts:input_type -> oteldemo.SearchProductsRequest
+	16, // 41: oteldemo.ProductReviewService.GetProductReviews:input_type -> oteldemo.GetProductReviewsRequest
+	18, // 42: oteldemo.ProductReviewService.GetAverageProductReviewScore:input_type -> oteldemo.GetAverageProductReviewScoreRequest
+	31, // 43: oteldemo.ProductReviewService.AskProductAIAssistant:input_type -> oteldemo.AskProductAIAssistantRequest
+	20, // 44: oteldemo.ProductReviewService.GetProductReviewScoreHistogram:input_type -> oteldemo.GetProductReviewScoreHistogramRequest
+	22, // 45: oteldemo.ProductReviewService.GetProductReviewsBatch:input_type -> oteldemo.GetProductReviewsBatchRequest
+	25, // 46: oteldemo.ProductReviewService.GetAverageScoresBatch:input_type -> oteldemo.GetAverageScoresBatchRequest
+	28, // 47: oteldemo.ProductReviewService.GetProductReviewsPage:input_type -> oteldemo.GetProductReviewsPageRequest
+	30, // 48: oteldemo.ProductReviewService.StreamProductReviews:input_type -> oteldemo.StreamProductReviewsRequest
+	33, // 49: oteldemo.ShippingService.GetQuote:input_type -> oteldemo.GetQuoteRequest
+	35, // 50: oteldemo.ShippingService.ShipOrder:input_type -> oteldemo.ShipOrderRequest
+	5,  // 51: oteldemo.CurrencyService.GetSupportedCurrencies:input_type -> oteldemo.Empty
+	40, // 52: oteldemo.CurrencyService.Convert:input_type -> oteldemo.CurrencyConversionRequest
+	42, // 53: oteldemo.PaymentService.Charge:input_type -> oteldemo.ChargeRequest
+	46, // 54: oteldemo.EmailService.SendOrderConfirmation:input_type -> oteldemo.SendOrderConfirmationRequest
+	47, // 55: oteldemo.CheckoutService.PlaceOrder:input_type -> oteldemo.PlaceOrderRequest
+	49, // 56: oteldemo.AdService.GetAds:input_type -> oteldemo.AdRequest
+	53, // 57: oteldemo.FeatureFlagService.GetFlag:input_type -> oteldemo.GetFlagRequest
+	55, // 58: oteldemo.FeatureFlagService.CreateFlag:input_type -> oteldemo.CreateFlagRequest
+	57, // 59: oteldemo.FeatureFlagService.UpdateFlag:input_type -> oteldemo.UpdateFlagRequest
+	59, // 60: oteldemo.FeatureFlagService.ListFlags:input_type -> oteldemo.ListFlagsRequest
+	61, // 61: oteldemo.FeatureFlagService.DeleteFlag:input_type -> oteldemo.DeleteFlagRequest
+	5,  // 62: oteldemo.CartService.AddItem:output_type -> oteldemo.Empty
+	4,  // 63: oteldemo.CartService.GetCart:output_type -> oteldemo.Cart
+	5,  // 64: oteldemo.CartService.EmptyCart:output_type -> oteldemo.Empty
+	7,  // 65: oteldemo.RecommendationService.ListRecommendations:output_type -> oteldemo.ListRecommendationsResponse
+	9,  // 66: oteldemo.RecommendationService.ListRecommendationsBatch:output_type -> oteldemo.ListRecommendationsBatchResponse
+	11, // 67: oteldemo.ProductCatalogService.ListProducts:output_type -> oteldemo.ListProductsResponse
+	10, // 68: oteldemo.ProductCatalogService.GetProduct:output_type -> oteldemo.Product
+	14, // 69: oteldemo.ProductCatalogService.SearchProducts:output_type -> oteldemo.SearchProductsResponse
+	17, // 70: oteldemo.ProductReviewService.GetProductReviews:output_type -> oteldemo.GetProductReviewsResponse
+	19, // 71: oteldemo.ProductReviewService.GetAverageProductReviewScore:output_type -> oteldemo.GetAverageProductReviewScoreResponse
+	32, // 72: oteldemo.ProductReviewService.AskProductAIAssistant:output_type -> oteldemo.AskProductAIAssistantResponse
+	21, // 73: oteldemo.ProductReviewService.GetProductReviewScoreHistogram:output_type -> oteldemo.GetProductReviewScoreHistogramResponse
+	24, // 74: oteldemo.ProductReviewService.GetProductReviewsBatch:output_type -> oteldemo.GetProductReviewsBatchResponse
+	27, // 75: oteldemo.ProductReviewService.GetAverageScoresBatch:output_type -> oteldemo.GetAverageScoresBatchResponse
+	29, // 76: oteldemo.ProductReviewService.GetProductReviewsPage:output_type -> oteldemo.GetProductReviewsPageResponse
+	15, // 77: oteldemo.ProductReviewService.StreamProductReviews:output_type -> oteldemo.ProductReview
+	34, // 78: oteldemo.ShippingService.GetQuote:output_type -> oteldemo.GetQuoteResponse
+	36, // 79: oteldemo.ShippingService.ShipOrder:output_type -> oteldemo.ShipOrderResponse
+	39, // 80: oteldemo.CurrencyService.GetSupportedCurrencies:output_type -> oteldemo.GetSupportedCurrenciesResponse
+	38, // 81: oteldemo.CurrencyService.Convert:output_type -> oteldemo.Money
+	43, // 82: oteldemo.PaymentService.Charge:output_type -> oteldemo.ChargeResponse
+	5,  // 83: oteldemo.EmailService.SendOrderConfirmation:output_type -> oteldemo.Empty
+	48, // 84: oteldemo.CheckoutService.PlaceOrder:output_type -> oteldemo.PlaceOrderResponse
+	50, // 85: oteldemo.AdService.GetAds:output_type -> oteldemo.AdResponse
+	54, // 86: oteldemo.FeatureFlagService.GetFlag:output_type -> oteldemo.GetFlagResponse
+	56, // 87: oteldemo.FeatureFlagService.CreateFlag:output_type -> oteldemo.CreateFlagResponse
+	58, // 88: oteldemo.FeatureFlagService.UpdateFlag:output_type -> oteldemo.UpdateFlagResponse
+	60, // 89: oteldemo.FeatureFlagService.ListFlags:output_type -> oteldemo.ListFlagsResponse
+	62, // 90: oteldemo.FeatureFlagService.DeleteFlag:output_type -> oteldemo.DeleteFlagResponse
+	62, // [62:91] is the sub-list for method output_type
+	33, // [33:62] is the sub-list for method input_type
+	33, // [33:33] is the sub-list for extension type_name
+	33, // [33:33] is the sub-list for extension extendee
+	0,  // [0:33] is the sub-list for field type_name
 }
 
 func init() { file_demo_proto_init() }
@@ -2900,7 +3623,7 @@ func file_demo_proto_init() {
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_demo_proto_rawDesc), len(file_demo_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   50,
+			NumMessages:   63,
 			NumExtensions: 0,
 			NumServices:   11,
 		},
@@ -211,7 +211,8 @@ var CartService_ServiceDesc = grpc.ServiceDesc{
 }
 
 const (
-	RecommendationService_ListRecommendations_FullMethodName = "/oteldemo.RecommendationService/ListRecommendations"
+	RecommendationService_ListRecommendations_FullMethodName      = "/oteldemo.RecommendationService/ListRecommendations"
+	RecommendationService_ListRecommendationsBatch_FullMethodName = "/oteldemo.RecommendationService/ListRecommendationsBatch"
 )
 
 // RecommendationServiceClient is the client API for RecommendationService service.
@@ -219,6 +220,7 @@ const (
 // For semantics around ctx use and closing/ending streaming RPCs, please refer to https://pkg.go.dev/google.golang.org/grpc/?tab=doc#ClientConn.NewStream.
 type RecommendationServiceClient interface {
 	ListRecommendations(ctx context.Context, in *ListRecommendationsRequest, opts ...grpc.CallOption) (*ListRecommendationsResponse, error)
+	ListRecommendationsBatch(ctx context.Context, in *ListRecommendationsBatchRequest, opts ...grpc.CallOption) (*ListRecommendationsBatchResponse, error)
 }
 
 type recommendationServiceClient struct {
@@ -239,11 +241,22 @@ func (c *recommendationServiceClient) ListRecommendations(ctx context.Context, i
 	return out, nil
 }
 
+func (c *recommendationServiceClient) ListRecommendationsBatch(ctx context.Context, in *ListRecommendationsBatchRequest, opts ...grpc.CallOption) (*ListRecommendationsBatchResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(ListRecommendationsBatchResponse)
+	err := c.cc.Invoke(ctx, RecommendationService_ListRecommendationsBatch_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // RecommendationServiceServer is the server API for RecommendationService service.
 // All implementations must embed UnimplementedRecommendationServiceServer
 // for forward compatibility.
 type RecommendationServiceServer interface {
 	ListRecommendations(context.Context, *ListRecommendationsRequest) (*ListRecommendationsResponse, error)
+	ListRecommendationsBatch(context.Context, *ListRecommendationsBatchRequest) (*ListRecommendationsBatchResponse, error)
 	mustEmbedUnimplementedRecommendationServiceServer()
 }
 
@@ -257,6 +270,9 @@ type UnimplementedRecommendationServiceServer struct{}
 func (UnimplementedRecommendationServiceServer) ListRecommendations(context.Context, *ListRecommendationsRequest) (*ListRecommendationsResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method ListRecommendations not implemented")
 }
+func (UnimplementedRecommendationServiceServer) ListRecommendationsBatch(context.Context, *ListRecommendationsBatchRequest) (*ListRecommendationsBatchResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method ListRecommendationsBatch not implemented")
+}
 func (UnimplementedRecommendationServiceServer) mustEmbedUnimplementedRecommendationServiceServer() {}
 func (UnimplementedRecommendationServiceServer) testEmbeddedByValue()                               {}
 
@@ -296,6 +312,24 @@ func _RecommendationService_ListRecommendations_Handler(srv interface{}, ctx con
 	return interceptor(ctx, in, info, handler)
 }
 
+func _RecommendationService_ListRecommendationsBatch_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(ListRecommendationsBatchRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(RecommendationServiceServer).ListRecommendationsBatch(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: RecommendationService_ListRecommendationsBatch_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(RecommendationServiceServer).ListRecommendationsBatch(ctx, req.(*ListRecommendationsBatchRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 // RecommendationService_ServiceDesc is the grpc.ServiceDesc for RecommendationService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -307,6 +341,10 @@ var RecommendationService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "ListRecommendations",
 			Handler:    _RecommendationService_ListRecommendations_Handler,
 		},
+		{
+			MethodName: "ListRecommendationsBatch",
+			Handler:    _RecommendationService_ListRecommendationsBatch_Handler,
+		},
 	},
 	Streams:  []grpc.StreamDesc{},
 	Metadata: "demo.proto",
@@ -491,9 +529,14 @@ var ProductCatalogService_ServiceDesc = grpc.ServiceDesc{
 }
 
 const (
-	ProductReviewService_GetProductReviews_FullMethodName            = "/oteldemo.ProductReviewService/GetProductReviews"
-	ProductReviewService_GetAverageProductReviewScore_FullMethodName = "/oteldemo.ProductReviewService/GetAverageProductReviewScore"
-	ProductReviewService_AskProductAIAssistant_FullMethodName        = "/oteldemo.ProductReviewService/AskProductAIAssistant"
+	ProductReviewService_GetProductReviews_FullMethodName              = "/oteldemo.ProductReviewService/GetProductReviews"
+	ProductReviewService_GetAverageProductReviewScore_FullMethodName   = "/oteldemo.ProductReviewService/GetAverageProductReviewScore"
+	ProductReviewService_AskProductAIAssistant_FullMethodName          = "/oteldemo.ProductReviewService/AskProductAIAssistant"
+	ProductReviewService_GetProductReviewScoreHistogram_FullMethodName = "/oteldemo.ProductReviewService/GetProductReviewScoreHistogram"
+	ProductReviewService_GetProductReviewsBatch_FullMethodName         = "/oteldemo.ProductReviewService/GetProductReviewsBatch"
+	ProductReviewService_GetAverageScoresBatch_FullMethodName          = "/oteldemo.ProductReviewService/GetAverageScoresBatch"
+	ProductReviewService_GetProductReviewsPage_FullMethodName          = "/oteldemo.ProductReviewService/GetProductReviewsPage"
+	ProductReviewService_StreamProductReviews_FullMethodName           = "/oteldemo.ProductReviewService/StreamProductReviews"
 )
 
 // ProductReviewServiceClient is the client API for ProductReviewService service.
@@ -503,6 +546,11 @@ type ProductReviewServiceClient interface {
 	GetProductReviews(ctx context.Context, in *GetProductReviewsRequest, opts ...grpc.CallOption) (*GetProductReviewsResponse, error)
 	GetAverageProductReviewScore(ctx context.Context, in *GetAverageProductReviewScoreRequest, opts ...grpc.CallOption) (*GetAverageProductReviewScoreResponse, error)
 	AskProductAIAssistant(ctx context.Context, in *AskProductAIAssistantRequest, opts ...grpc.CallOption) (*AskProductAIAssistantResponse, error)
+	GetProductReviewScoreHistogram(ctx context.Context, in *GetProductReviewScoreHistogramRequest, opts ...grpc.CallOption) (*GetProductReviewScoreHistogramResponse, error)
+	GetProductReviewsBatch(ctx context.Context, in *GetProductReviewsBatchRequest, opts ...grpc.CallOption) (*GetProductReviewsBatchResponse, error)
+	GetAverageScoresBatch(ctx context.Context, in *GetAverageScoresBatchRequest, opts ...grpc.CallOption) (*GetAverageScoresBatchResponse, error)
+	GetProductReviewsPage(ctx context.Context, in *GetProductReviewsPageRequest, opts ...grpc.CallOption) (*GetProductReviewsPageResponse, error)
+	StreamProductReviews(ctx context.Context, in *StreamProductReviewsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ProductReview], error)
 }
 
 type productReviewServiceClient struct {
@@ -543,6 +591,65 @@ func (c *productReviewServiceClient) AskProductAIAssistant(ctx context.Context,
 	return out, nil
 }
 
+func (c *productReviewServiceClient) GetProductReviewScoreHistogram(ctx context.Context, in *GetProductReviewScoreHistogramRequest, opts ...grpc.CallOption) (*GetProductReviewScoreHistogramResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(GetProductReviewScoreHistogramResponse)
+	err := c.cc.Invoke(ctx, ProductReviewService_GetProductReviewScoreHistogram_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *productReviewServiceClient) GetProductReviewsBatch(ctx context.Context, in *GetProductReviewsBatchRequest, opts ...grpc.CallOption) (*GetProductReviewsBatchResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(GetProductReviewsBatchResponse)
+	err := c.cc.Invoke(ctx, ProductReviewService_GetProductReviewsBatch_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *productReviewServiceClient) GetAverageScoresBatch(ctx context.Context, in *GetAverageScoresBatchRequest, opts ...grpc.CallOption) (*GetAverageScoresBatchResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(GetAverageScoresBatchResponse)
+	err := c.cc.Invoke(ctx, ProductReviewService_GetAverageScoresBatch_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *productReviewServiceClient) GetProductReviewsPage(ctx context.Context, in *GetProductReviewsPageRequest, opts ...grpc.CallOption) (*GetProductReviewsPageResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(GetProductReviewsPageResponse)
+	err := c.cc.Invoke(ctx, ProductReviewService_GetProductReviewsPage_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *productReviewServiceClient) StreamProductReviews(ctx context.Context, in *StreamProductReviewsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ProductReview], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &ProductReviewService_ServiceDesc.Streams[0], ProductReviewService_StreamProductReviews_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[StreamProductReviewsRequest, ProductReview]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ProductReviewService_StreamProductReviewsClient = grpc.ServerStreamingClient[ProductReview]
+
 // ProductReviewServiceServer is the server API for ProductReviewService service.
 // All implementations must embed UnimplementedProductReviewServiceServer
 // for forward compatibility.
@@ -550,6 +657,11 @@ type ProductReviewServiceServer interface {
 	GetProductReviews(context.Context, *GetProductReviewsRequest) (*GetProductReviewsResponse, error)
 	GetAverageProductReviewScore(context.Context, *GetAverageProductReviewScoreRequest) (*GetAverageProductReviewScoreResponse, error)
 	AskProductAIAssistant(context.Context, *AskProductAIAssistantRequest) (*AskProductAIAssistantResponse, error)
+	GetProductReviewScoreHistogram(context.Context, *GetProductReviewScoreHistogramRequest) (*GetProductReviewScoreHistogramResponse, error)
+	GetProductReviewsBatch(context.Context, *GetProductReviewsBatchRequest) (*GetProductReviewsBatchResponse, error)
+	GetAverageScoresBatch(context.Context, *GetAverageScoresBatchRequest) (*GetAverageScoresBatchResponse, error)
+	GetProductReviewsPage(context.Context, *GetProductReviewsPageRequest) (*GetProductReviewsPageResponse, error)
+	StreamProductReviews(*StreamProductReviewsRequest, grpc.ServerStreamingServer[ProductReview]) error
 	mustEmbedUnimplementedProductReviewServiceServer()
 }
 
@@ -569,6 +681,21 @@ func (UnimplementedProductReviewServiceServer) GetAverageProductReviewScore(cont
 func (UnimplementedProductReviewServiceServer) AskProductAIAssistant(context.Context, *AskProductAIAssistantRequest) (*AskProductAIAssistantResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method AskProductAIAssistant not implemented")
 }
+func (UnimplementedProductReviewServiceServer) GetProductReviewScoreHistogram(context.Context, *GetProductReviewScoreHistogramRequest) (*GetProductReviewScoreHistogramResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetProductReviewScoreHistogram not implemented")
+}
+func (UnimplementedProductReviewServiceServer) GetProductReviewsBatch(context.Context, *GetProductReviewsBatchRequest) (*GetProductReviewsBatchResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetProductReviewsBatch not implemented")
+}
+func (UnimplementedProductReviewServiceServer) GetAverageScoresBatch(context.Context, *GetAverageScoresBatchRequest) (*GetAverageScoresBatchResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetAverageScoresBatch not implemented")
+}
+func (UnimplementedProductReviewServiceServer) GetProductReviewsPage(context.Context, *GetProductReviewsPageRequest) (*GetProductReviewsPageResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetProductReviewsPage not implemented")
+}
+func (UnimplementedProductReviewServiceServer) StreamProductReviews(*StreamProductReviewsRequest, grpc.ServerStreamingServer[ProductReview]) error {
+	return status.Errorf(codes.Unimplemented, "method StreamProductReviews not implemented")
+}
 func (UnimplementedProductReviewServiceServer) mustEmbedUnimplementedProductReviewServiceServer() {}
 func (UnimplementedProductReviewServiceServer) testEmbeddedByValue()                              {}
 
@@ -644,6 +771,89 @@ func _ProductReviewService_AskProductAIAssistant_Handler(srv interface{}, ctx co
 	return interceptor(ctx, in, info, handler)
 }
 
+func _ProductReviewService_GetProductReviewScoreHistogram_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetProductReviewScoreHistogramRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ProductReviewServiceServer).GetProductReviewScoreHistogram(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ProductReviewService_GetProductReviewScoreHistogram_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ProductReviewServiceServer).GetProductReviewScoreHistogram(ctx, req.(*GetProductReviewScoreHistogramRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _ProductReviewService_GetProductReviewsBatch_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetProductReviewsBatchRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ProductReviewServiceServer).GetProductReviewsBatch(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ProductReviewService_GetProductReviewsBatch_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ProductReviewServiceServer).GetProductReviewsBatch(ctx, req.(*GetProductReviewsBatchRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _ProductReviewService_GetAverageScoresBatch_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetAverageScoresBatchRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ProductReviewServiceServer).GetAverageScoresBatch(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ProductReviewService_GetAverageScoresBatch_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ProductReviewServiceServer).GetAverageScoresBatch(ctx, req.(*GetAverageScoresBatchRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _ProductReviewService_GetProductReviewsPage_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(GetProductReviewsPageRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(ProductReviewServiceServer).GetProductReviewsPage(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: ProductReviewService_GetProductReviewsPage_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(ProductReviewServiceServer).GetProductReviewsPage(ctx, req.(*GetProductReviewsPageRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _ProductReviewService_StreamProductReviews_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(StreamProductReviewsRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(ProductReviewServiceServer).StreamProductReviews(m, &grpc.GenericServerStream[StreamProductReviewsRequest, ProductReview]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type ProductReviewService_StreamProductReviewsServer = grpc.ServerStreamingServer[ProductReview]
+
 // ProductReviewService_ServiceDesc is the grpc.ServiceDesc for ProductReviewService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -663,8 +873,30 @@ var ProductReviewService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "AskProductAIAssistant",
 			Handler:    _ProductReviewService_AskProductAIAssistant_Handler,
 		},
+		{
+			MethodName: "GetProductReviewScoreHistogram",
+			Handler:    _ProductReviewService_GetProductReviewScoreHistogram_Handler,
+		},
+		{
+			MethodName: "GetProductReviewsBatch",
+			Handler:    _ProductReviewService_GetProductReviewsBatch_Handler,
+		},
+		{
+			MethodName: "GetAverageScoresBatch",
+			Handler:    _ProductReviewService_GetAverageScoresBatch_Handler,
+		},
+		{
+			MethodName: "GetProductReviewsPage",
+			Handler:    _ProductReviewService_GetProductReviewsPage_Handler,
+		},
+	},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "StreamProductReviews",
+			Handler:       _ProductReviewService_StreamProductReviews_Handler,
+			ServerStreams: true,
+		},
 	},
-	Streams:  []grpc.StreamDesc{},
 	Metadata: "demo.proto",
 }
 
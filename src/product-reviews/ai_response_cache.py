@@ -0,0 +1,113 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_question(question):
+    """Lowercases the question, collapses whitespace and drops trailing punctuation."""
+    return ' '.join(question.lower().split()).rstrip('?!. ')
+
+
+class CachedAIResponse:
+    """An AskProductAIAssistantResponse and the time it took to build it."""
+
+    __slots__ = ('response', 'latency')
+
+    def __init__(self, response, latency):
+        self.response = response
+        self.latency = latency
+
+
+class AIResponseCache:
+    """Bounded LRU cache of AI assistant responses that expire after `ttl` seconds.
+
+    Keys are tuples that start with the product id, so all responses about a
+    product are dropped when a ReviewChangeListener reports that its reviews
+    changed. As with ReviewCache, entries are only served while the listener
+    is connected, and a load that overlaps with an invalidation is returned
+    but not cached.
+    """
+
+    def __init__(self, max_entries, ttl):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (entry, expires_at), the most recently used last
+        self._entries = OrderedDict()
+        self._keys_by_product = {}
+        self._generation = 0
+        self._listening = False
+
+    def get(self, key, load):
+        """Returns (entry, hit), calling load() to build a missing entry."""
+        entry, generation = self._lookup(key)
+        if entry is not None:
+            return entry, True
+
+        entry = load()
+        self._put(generation, key, entry)
+        return entry, False
+
+    async def get_async(self, key, load_async):
+        """Returns (entry, hit), awaiting load_async() to build a missing entry."""
+        entry, generation = self._lookup(key)
+        if entry is not None:
+            return entry, True
+
+        entry = await load_async()
+        self._put(generation, key, entry)
+        return entry, False
+
+    def _lookup(self, key):
+        with self._lock:
+            item = self._entries.get(key) if self._listening else None
+            if item is None:
+                return None, self._generation
+            if item[1] <= time.monotonic():
+                self._remove(key)
+                return None, self._generation
+            self._entries.move_to_end(key)
+            return item[0], self._generation
+
+    def _put(self, generation, key, entry):
+        with self._lock:
+            if not self._listening or generation != self._generation:
+                return
+            self._entries[key] = (entry, time.monotonic() + self._ttl)
+            self._entries.move_to_end(key)
+            self._keys_by_product.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        del self._entries[key]
+        keys = self._keys_by_product[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_product[key[0]]
+
+    def invalidate(self, product_id):
+        with self._lock:
+            self._generation += 1
+            for key in self._keys_by_product.pop(product_id, ()):
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_product.clear()
+
+    def set_listening(self, listening):
+        # Changes may have been missed while nobody was listening
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_product.clear()
+            self._listening = listening
@@ -0,0 +1,140 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import asyncio
+import threading
+import time
+
+
+class _Batch:
+
+    __slots__ = ('keys', 'full', 'done', 'dispatched_at', 'results', 'error')
+
+    def __init__(self):
+        # Distinct keys in the order they were requested
+        self.keys = {}
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.dispatched_at = None
+        self.results = None
+        self.error = None
+
+
+class BatchLoader:
+    """Merges concurrent single-key loads into one call of `load_many`.
+
+    The first load starts a batch and waits up to `window` seconds for other
+    threads to add their keys, or until the batch holds `max_batch_size`
+    distinct keys. It then calls `load_many(keys)`, which returns a dict with
+    an entry per key, and hands every waiting thread its own result. An
+    exception raised by `load_many` is raised in all of them.
+    """
+
+    def __init__(self, load_many, window, max_batch_size, metrics, name):
+        self._load_many = load_many
+        self._window = window
+        self._max_batch_size = max(max_batch_size, 1)
+        self._lock = threading.Lock()
+        self._batch = None
+        self._attributes = {'loader': name}
+
+        self._batch_size_histogram = metrics['app_product_reviews_batch_size']
+        self._wait_time_histogram = metrics['app_product_reviews_batch_wait_time']
+
+    def load(self, key):
+        started_at = time.monotonic()
+        with self._lock:
+            batch = self._batch
+            leader = batch is None
+            if leader:
+                batch = self._batch = _Batch()
+            batch.keys[key] = None
+            if len(batch.keys) >= self._max_batch_size:
+                self._batch = None
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self._window)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._dispatch(batch)
+        else:
+            batch.done.wait()
+
+        # Only the time until the batch was sent counts, not the query itself
+        self._wait_time_histogram.record(batch.dispatched_at - started_at, self._attributes)
+        if batch.error is not None:
+            raise batch.error
+        return batch.results[key]
+
+    def _dispatch(self, batch):
+        batch.dispatched_at = time.monotonic()
+        self._batch_size_histogram.record(len(batch.keys), self._attributes)
+        try:
+            batch.results = self._load_many(list(batch.keys))
+        except Exception as e:
+            batch.error = e
+        finally:
+            batch.done.set()
+
+
+class AsyncBatchLoader:
+    """BatchLoader for the asyncio server mode.
+
+    Keys requested on the event loop within `window` seconds of the first one
+    are loaded with one call of the coroutine function `load_many`, or as
+    soon as `max_batch_size` distinct keys were requested.
+    """
+
+    def __init__(self, load_many, window, max_batch_size, metrics, name):
+        self._load_many = load_many
+        self._window = window
+        self._max_batch_size = max(max_batch_size, 1)
+        self._keys = None
+        self._timer = None
+        # Running loads, referenced until they finish
+        self._tasks = set()
+        self._attributes = {'loader': name}
+
+        self._batch_size_histogram = metrics['app_product_reviews_batch_size']
+        self._wait_time_histogram = metrics['app_product_reviews_batch_wait_time']
+
+    async def load(self, key):
+        started_at = time.monotonic()
+        loop = asyncio.get_running_loop()
+        if self._keys is None:
+            self._keys = {}
+            self._timer = loop.call_later(self._window, self._dispatch)
+        future = self._keys.get(key)
+        if future is None:
+            future = self._keys[key] = loop.create_future()
+        if len(self._keys) >= self._max_batch_size:
+            self._timer.cancel()
+            self._dispatch()
+
+        # Callers waiting on the same key share the future, so one of them
+        # being cancelled must not cancel it for the others
+        result, dispatched_at = await asyncio.shield(future)
+        self._wait_time_histogram.record(dispatched_at - started_at, self._attributes)
+        return result
+
+    def _dispatch(self):
+        keys, self._keys = self._keys, None
+        self._batch_size_histogram.record(len(keys), self._attributes)
+        task = asyncio.create_task(self._load(keys, time.monotonic()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, keys, dispatched_at):
+        try:
+            results = await self._load_many(list(keys))
+        except Exception as e:
+            for future in keys.values():
+                future.set_exception(e)
+        else:
+            for key, future in keys.items():
+                future.set_result((results[key], dispatched_at))
@@ -0,0 +1,80 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Compares the per-query latency and the Postgres planning and execution time
+# of the review queries sent as text against the same queries run from
+# statements prepared on the connection.
+#
+# Usage: DB_CONNECTION_STRING=... python benchmark_prepared_statements.py
+
+# Python
+import json
+import statistics
+import time
+
+# Postgres
+import psycopg2
+
+# Local
+from database import EXECUTE_STATEMENTS, PREPARED_QUERIES, db_connection_str
+from db_pool import prepare_statements
+
+ITERATIONS = 2000
+BATCH_SIZE = 10
+
+
+def measure_latency(cursor, statement, params, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        cursor.execute(statement, params)
+        cursor.fetchall()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6
+
+
+def measure_server_time(cursor, statement, params, iterations):
+    # Planning and execution time as reported by Postgres, a proxy for the
+    # CPU time the backend spends on the query
+    planning, execution = [], []
+    for _ in range(iterations):
+        cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", params)
+        plan = cursor.fetchone()[0]
+        plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]
+        planning.append(plan['Planning Time'])
+        execution.append(plan['Execution Time'])
+    return statistics.median(planning) * 1e3, statistics.median(execution) * 1e3
+
+
+def main():
+    connection = psycopg2.connect(db_connection_str)
+    connection.autocommit = True
+    prepare_statements(connection, PREPARED_QUERIES)
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT product_id FROM reviews.productreviewstats ORDER BY product_id LIMIT %s", (BATCH_SIZE, ))
+        product_ids = [row[0] for row in cursor.fetchall()]
+        params = {
+            'product_reviews': (product_ids[0], ),
+            'product_reviews_batch': (product_ids, ),
+            'product_review_stats': (product_ids[0], ),
+            'product_review_stats_batch': (product_ids, ),
+        }
+
+        print(f"{'query':<28} | {'method':<8} | {'median latency (us)':>20} | {'planning (us)':>14} | {'execution (us)':>15}")
+        print('-' * 98)
+        for name, query in PREPARED_QUERIES.items():
+            for method, statement in [('text', query), ('prepared', EXECUTE_STATEMENTS[name])]:
+                # Warm up, so prepared statements can switch to their generic plan
+                measure_latency(cursor, statement, params[name], iterations=10)
+                latency = measure_latency(cursor, statement, params[name], iterations=ITERATIONS)
+                planning, execution = measure_server_time(cursor, statement, params[name], iterations=ITERATIONS // 10)
+                print(f"{name:<28} | {method:<8} | {latency:>20.1f} | {planning:>14.1f} | {execution:>15.1f}")
+
+    connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,25 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # Python
+import asyncio
+import logging
 import os
+import time
+from contextlib import asynccontextmanager
+from decimal import Decimal, InvalidOperation
 import simplejson as json
 
-# Postgres
-import psycopg2
+# Postgres driver for the async server mode
+from psycopg_pool import AsyncConnectionPool
+
+# Local
+import demo_pb2
+from batch_loader import AsyncBatchLoader, BatchLoader
+from db_pool import MAX_IDLE_TIME, ConnectionPool
+from review_cache import CachedReviews, ReviewCache, ReviewChangeListener, ReviewStats
+from schema_migrations import run_migrations
+
+logger = logging.getLogger('main')
 
 def must_map_env(key: str):
     value = os.environ.get(key)
@@ -18,6 +32,108 @@ def must_map_env(key: str):
 
 # Retrieve Postgres environment variables
 db_connection_str = must_map_env('DB_CONNECTION_STRING')
+use_prepared_statements = os.environ.get('PRODUCT_REVIEWS_DB_PREPARED_STATEMENTS', 'true') == 'true'
+
+connection_pool = None
+review_cache = None
+review_stats_cache = None
+review_batch_loader = None
+review_stats_batch_loader = None
+
+# Used instead of the above in the async server mode
+async_connection_pool = None
+async_connection_pool_metrics = None
+review_batch_loader_async = None
+review_stats_batch_loader_async = None
+
+# Rows fetched per round trip when streaming reviews through a server-side cursor
+STREAM_CHUNK_SIZE = 500
+
+# Queries shared by the threaded and the async server mode. psycopg2 and
+# psycopg both adapt a list parameter to an array for ANY().
+PRODUCT_REVIEWS_QUERY = "SELECT username, description, score FROM reviews.productreviews WHERE product_id= %s"
+PRODUCT_REVIEWS_BATCH_QUERY = "SELECT product_id, username, description, score FROM reviews.productreviews WHERE product_id = ANY(%s)"
+STREAM_PRODUCT_REVIEWS_QUERY = "SELECT username, description, score FROM reviews.productreviews WHERE product_id = %s ORDER BY id"
+# The aggregates are maintained by a trigger on reviews.productreviews
+PRODUCT_REVIEW_STATS_QUERY = "SELECT review_count, score_sum, star_1, star_2, star_3, star_4, star_5 FROM reviews.productreviewstats WHERE product_id = %s"
+PRODUCT_REVIEW_STATS_BATCH_QUERY = "SELECT product_id, review_count, score_sum, star_1, star_2, star_3, star_4, star_5 FROM reviews.productreviewstats WHERE product_id = ANY(%s)"
+
+# Hot queries, prepared on every pooled connection by statement name, so
+# Postgres parses and plans them once per connection instead of on every call.
+# psycopg2 runs them with EXECUTE, while psycopg prepares them by itself.
+PREPARED_QUERIES = {
+    "product_reviews": PRODUCT_REVIEWS_QUERY,
+    "product_reviews_batch": PRODUCT_REVIEWS_BATCH_QUERY,
+    "product_review_stats": PRODUCT_REVIEW_STATS_QUERY,
+    "product_review_stats_batch": PRODUCT_REVIEW_STATS_BATCH_QUERY,
+}
+EXECUTE_STATEMENTS = {
+    name: f"EXECUTE {name}({', '.join(['%s'] * query.count('%s'))})" for name, query in PREPARED_QUERIES.items()
+}
+
+def prepared_query(name):
+    """Returns the psycopg2 statement that runs one of the PREPARED_QUERIES."""
+    return EXECUTE_STATEMENTS[name] if use_prepared_statements else PREPARED_QUERIES[name]
+
+def apply_schema_migrations(timeout):
+    """Applies the pending schema migrations, retrying failures for up to `timeout` seconds.
+
+    The database may still be starting, so failures are retried with an
+    exponential backoff. Once the timeout expires the last failure is raised,
+    so the service does not start with an outdated schema.
+    """
+    # The service user is not allowed to change the schema, so migrations
+    # can run with a separate connection string
+    dsn = os.environ.get('DB_MIGRATION_CONNECTION_STRING', db_connection_str)
+    deadline = time.monotonic() + timeout
+    delay = 0.5
+    while True:
+        try:
+            run_migrations(dsn)
+            return
+        except Exception as e:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error(f"Could not apply schema migrations: {e}")
+                raise
+            delay = min(delay * 2, 10, remaining)
+            logger.warning(f"Could not apply schema migrations, retrying in {delay:.1f}s: {e}")
+            time.sleep(delay)
+
+def init_connection_pool(product_review_svc_metrics):
+    global connection_pool
+    connection_pool = ConnectionPool(
+        db_connection_str,
+        min_size=int(os.environ.get('PRODUCT_REVIEWS_DB_POOL_MIN_SIZE', 2)),
+        max_size=int(os.environ.get('PRODUCT_REVIEWS_DB_POOL_MAX_SIZE', 10)),
+        checkout_timeout=float(os.environ.get('PRODUCT_REVIEWS_DB_POOL_TIMEOUT', 5)),
+        validation_interval=float(os.environ.get('PRODUCT_REVIEWS_DB_POOL_VALIDATION_INTERVAL', 30)),
+        metrics=product_review_svc_metrics,
+        prepared_statements=PREPARED_QUERIES if use_prepared_statements else None)
+    connection_pool.open()
+
+def init_review_cache(max_entries, derived_caches=()):
+    """Creates the review caches, `derived_caches` hold other data about products that changes with their reviews."""
+    global review_cache, review_stats_cache
+    caches = list(derived_caches)
+    if max_entries > 0:
+        review_cache = ReviewCache(max_entries)
+        review_stats_cache = ReviewCache(max_entries)
+        caches += [review_cache, review_stats_cache]
+    if caches:
+        ReviewChangeListener(db_connection_str, caches).start()
+
+def init_batch_loaders(window, max_batch_size, product_review_svc_metrics):
+    global review_batch_loader, review_stats_batch_loader, review_batch_loader_async, review_stats_batch_loader_async
+    if window > 0:
+        review_batch_loader = BatchLoader(
+            load_product_reviews_batch, window, max_batch_size, product_review_svc_metrics, 'reviews')
+        review_stats_batch_loader = BatchLoader(
+            query_product_review_stats_batch, window, max_batch_size, product_review_svc_metrics, 'review_stats')
+        review_batch_loader_async = AsyncBatchLoader(
+            load_product_reviews_batch_async, window, max_batch_size, product_review_svc_metrics, 'reviews')
+        review_stats_batch_loader_async = AsyncBatchLoader(
+            query_product_review_stats_batch_async, window, max_batch_size, product_review_svc_metrics, 'review_stats')
 
 def fetch_product_reviews(product_id):
     try:
@@ -26,65 +142,298 @@ def fetch_product_reviews(product_id):
         return json.dumps({"error": str(e)})
 
 def fetch_product_reviews_from_db(request_product_id):
+    return get_cached_product_reviews(request_product_id)[0].rows
 
-    connection = None
+def get_cached_product_reviews(request_product_id):
+    """Returns (CachedReviews, cache_hit) for the product, reading through the review cache when it is enabled."""
+    if review_cache is None:
+        return load_product_reviews(request_product_id), False
+    return review_cache.get(request_product_id, load_product_reviews)
 
-    try:
-        with psycopg2.connect(db_connection_str) as connection:
+def get_cached_product_reviews_batch(request_product_ids):
+    """Returns ({product_id: CachedReviews}, cache_hits) for distinct product ids, loading all missing products with one query."""
+    if review_cache is None:
+        return load_product_reviews_batch(request_product_ids), 0
+    return review_cache.get_many(request_product_ids, load_product_reviews_batch)
 
-            with connection.cursor() as cursor:
-                # Define the SQL query
-                query = "SELECT username, description, score FROM reviews.productreviews WHERE product_id= %s"
+def load_product_reviews(request_product_id):
+    # Concurrent lookups of single products share one query when batching is enabled
+    if review_batch_loader is not None:
+        return review_batch_loader.load(request_product_id)
+    return build_cached_reviews(query_product_reviews(request_product_id))
 
-                # Execute the query
-                cursor.execute(query, (request_product_id, ))
+def load_product_reviews_batch(request_product_ids):
+    return build_cached_reviews_batch(request_product_ids, query_product_reviews_batch(request_product_ids))
 
-                # Fetch all the rows from the query result
-                records = cursor.fetchall()
-                return records
+def build_cached_reviews_batch(request_product_ids, records):
+    records_by_product = {product_id: [] for product_id in request_product_ids}
+    for row in records:
+        records_by_product[row[0]].append(row[1:])
 
-    except Exception as e:
-        raise e
-    finally:
-        if connection is not None:
-            try:
-                connection.close()
-            except Exception as e:
-                pass
+    return {product_id: build_cached_reviews(records) for product_id, records in records_by_product.items()}
 
-def fetch_avg_product_review_score_from_db(request_product_id):
+def build_cached_reviews(records):
+    product_reviews = demo_pb2.GetProductReviewsResponse()
+    for row in records:
+        product_reviews.product_reviews.add(
+                username=row[0],
+                description=row[1],
+                score=str(row[2])
+        )
+
+    return CachedReviews(records, product_reviews.SerializeToString())
 
-    connection = None
+def query_product_reviews(request_product_id):
 
+    with connection_pool.connection() as connection:
+
+        with connection.cursor() as cursor:
+            # Execute the query
+            cursor.execute(prepared_query("product_reviews"), (request_product_id, ))
+
+            # Fetch all the rows from the query result
+            records = cursor.fetchall()
+            return records
+
+def query_product_reviews_batch(request_product_ids):
+
+    with connection_pool.connection() as connection:
+
+        with connection.cursor() as cursor:
+            cursor.execute(prepared_query("product_reviews_batch"), (list(request_product_ids), ))
+            return cursor.fetchall()
+
+def fetch_product_reviews_page(request_product_id, page_size, page_token, order_by_score):
+    """Returns (rows, next_page_token) for one page of the product's reviews.
+
+    Pages are read with keyset pagination, continuing after the id, or the
+    score and id, of the last review of the previous page encoded in
+    `page_token`, so deep pages cost the same as the first one. Raises
+    ValueError for a malformed page token.
+    """
+    query, params = product_reviews_page_query(request_product_id, page_size, page_token, order_by_score)
+
+    with connection_pool.connection() as connection:
+
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+            records = cursor.fetchall()
+
+    return split_product_reviews_page(records, page_size, order_by_score)
+
+def product_reviews_page_query(request_product_id, page_size, page_token, order_by_score):
+    after = parse_page_token(page_token, order_by_score)
+    if order_by_score:
+        keyset, order = "(score, id) < (%s, %s)", "score DESC, id DESC"
+    else:
+        keyset, order = "id > %s", "id"
+    condition = f" AND {keyset}" if after else ""
+    query = f"SELECT id, username, description, score FROM reviews.productreviews WHERE product_id = %s{condition} ORDER BY {order} LIMIT %s"
+
+    # One extra row tells whether there is a next page
+    return query, (request_product_id, *after, page_size + 1)
+
+def split_product_reviews_page(records, page_size, order_by_score):
+    if len(records) <= page_size:
+        return [row[1:] for row in records], ""
+    last = records[page_size - 1]
+    next_page_token = f"{last[3]}:{last[0]}" if order_by_score else str(last[0])
+    return [row[1:] for row in records[:page_size]], next_page_token
+
+def parse_page_token(page_token, order_by_score):
+    if not page_token:
+        return ()
     try:
-        with psycopg2.connect(db_connection_str) as connection:
+        if order_by_score:
+            score, review_id = page_token.split(":")
+            return Decimal(score), int(review_id)
+        return int(page_token),
+    except (ValueError, InvalidOperation):
+        raise ValueError(f"Invalid page token: {page_token}")
+
+def stream_product_reviews_from_db(request_product_id):
+    """Yields the (username, description, score) rows of the product in id order.
 
-            with connection.cursor() as cursor:
-                # Define the SQL query
-                query = "SELECT AVG(score) FROM reviews.productreviews WHERE product_id= %s"
+    The rows are read through a server-side cursor, STREAM_CHUNK_SIZE at a
+    time, so memory use does not grow with the number of reviews.
+    """
+    with connection_pool.connection() as connection:
 
-                # Execute the query
-                cursor.execute(query, (request_product_id, ))
+        with connection.cursor(name="stream_product_reviews") as cursor:
+            cursor.itersize = STREAM_CHUNK_SIZE
+            cursor.execute(STREAM_PRODUCT_REVIEWS_QUERY, (request_product_id, ))
+            yield from cursor
+
+def fetch_avg_product_review_score_from_db(request_product_id):
+    return fetch_product_review_stats(request_product_id).average_score()
 
-                # Fetch all the rows from the query result
-                records = cursor.fetchall()
+def fetch_product_review_stats(request_product_id):
+    """Returns the ReviewStats of the product, reading through the review cache when it is enabled."""
+    if review_stats_cache is None:
+        return load_product_review_stats(request_product_id)
+    return review_stats_cache.get(request_product_id, load_product_review_stats)[0]
 
-                # Extract the average score
-                if records:
-                    # records will be a list like [(average_score,)]
-                    average_score = records[0][0]
-                else:
-                    # Handle the case where no records are returned (e.g., no reviews for the product)
-                    average_score = None
+def fetch_product_review_stats_batch(request_product_ids):
+    """Returns {product_id: ReviewStats} for distinct product ids, loading all uncached products with one query."""
+    if review_stats_cache is None:
+        return query_product_review_stats_batch(request_product_ids)
+    return review_stats_cache.get_many(request_product_ids, query_product_review_stats_batch)[0]
 
-                # return the score as a string rounded to 1 decimal place
-                return f"{average_score:.1f}"
+def load_product_review_stats(request_product_id):
+    if review_stats_batch_loader is not None:
+        return review_stats_batch_loader.load(request_product_id)
+    return query_product_review_stats(request_product_id)
 
+def query_product_review_stats(request_product_id):
+
+    with connection_pool.connection() as connection:
+
+        with connection.cursor() as cursor:
+            # Execute the query
+            cursor.execute(prepared_query("product_review_stats"), (request_product_id, ))
+            return build_review_stats(cursor.fetchone())
+
+def query_product_review_stats_batch(request_product_ids):
+
+    with connection_pool.connection() as connection:
+
+        with connection.cursor() as cursor:
+            cursor.execute(prepared_query("product_review_stats_batch"), (list(request_product_ids), ))
+            return build_review_stats_batch(request_product_ids, cursor.fetchall())
+
+def build_review_stats(record):
+    # Products without reviews have no row
+    if record is None or record[0] == 0:
+        return ReviewStats(0, 0, [0] * 5)
+    return ReviewStats(record[0], record[1], list(record[2:]))
+
+def build_review_stats_batch(request_product_ids, records):
+    review_stats = {product_id: build_review_stats(None) for product_id in request_product_ids}
+    for record in records:
+        review_stats[record[0]] = build_review_stats(record[1:])
+    return review_stats
+
+# --- Async server mode ---
+#
+# The functions below mirror the ones above for the grpc.aio server, reading
+# through a psycopg AsyncConnectionPool so queries never block the event loop.
+
+async def init_async_connection_pool(product_review_svc_metrics):
+    """Opens the async connection pool, must be called on the running event loop."""
+    global async_connection_pool, async_connection_pool_metrics
+    async_connection_pool_metrics = product_review_svc_metrics
+
+    async def configure(connection):
+        product_review_svc_metrics["app_product_reviews_db_pool_connections_created"].add(1)
+
+    async_connection_pool = AsyncConnectionPool(
+        db_connection_str,
+        min_size=int(os.environ.get('PRODUCT_REVIEWS_DB_POOL_MIN_SIZE', 2)),
+        max_size=int(os.environ.get('PRODUCT_REVIEWS_DB_POOL_MAX_SIZE', 10)),
+        timeout=float(os.environ.get('PRODUCT_REVIEWS_DB_POOL_TIMEOUT', 5)),
+        max_idle=MAX_IDLE_TIME,
+        configure=configure,
+        open=False)
+    await async_connection_pool.open()
+
+    # Idle connections are checked in the background rather than on checkout
+    validation_interval = float(os.environ.get('PRODUCT_REVIEWS_DB_POOL_VALIDATION_INTERVAL', 30))
+    asyncio.create_task(check_async_connection_pool(validation_interval))
+
+async def check_async_connection_pool(validation_interval):
+    while True:
+        await asyncio.sleep(validation_interval)
+        try:
+            await async_connection_pool.check()
+        except Exception as e:
+            logger.warning(f"Database connection check failed: {e}")
+
+@asynccontextmanager
+async def async_connection():
+    """Checks a connection out of the async pool for a single transaction."""
+    started_at = time.monotonic()
+    async with async_connection_pool.connection() as connection:
+        async_connection_pool_metrics["app_product_reviews_db_pool_wait_time"].record(time.monotonic() - started_at)
+        async_connection_pool_metrics["app_product_reviews_db_pool_connections_in_use"].add(1)
+        try:
+            yield connection
+        finally:
+            async_connection_pool_metrics["app_product_reviews_db_pool_connections_in_use"].add(-1)
+
+async def fetch_product_reviews_async(product_id):
+    try:
+        product_reviews = (await get_cached_product_reviews_async(product_id))[0]
+        return json.dumps(product_reviews.rows, use_decimal=True)
     except Exception as e:
-        raise e
-    finally:
-        if connection is not None:
-            try:
-                connection.close()
-            except Exception as e:
-                pass
+        return json.dumps({"error": str(e)})
+
+async def get_cached_product_reviews_async(request_product_id):
+    if review_cache is None:
+        return await load_product_reviews_async(request_product_id), False
+    return await review_cache.get_async(request_product_id, load_product_reviews_async)
+
+async def get_cached_product_reviews_batch_async(request_product_ids):
+    if review_cache is None:
+        return await load_product_reviews_batch_async(request_product_ids), 0
+    return await review_cache.get_many_async(request_product_ids, load_product_reviews_batch_async)
+
+async def load_product_reviews_async(request_product_id):
+    if review_batch_loader_async is not None:
+        return await review_batch_loader_async.load(request_product_id)
+    return build_cached_reviews(await query_product_reviews_async(request_product_id))
+
+async def load_product_reviews_batch_async(request_product_ids):
+    return build_cached_reviews_batch(request_product_ids, await query_product_reviews_batch_async(request_product_ids))
+
+async def query_product_reviews_async(request_product_id):
+    async with async_connection() as connection:
+        cursor = await connection.execute(PRODUCT_REVIEWS_QUERY, (request_product_id, ), prepare=use_prepared_statements)
+        return await cursor.fetchall()
+
+async def query_product_reviews_batch_async(request_product_ids):
+    async with async_connection() as connection:
+        cursor = await connection.execute(PRODUCT_REVIEWS_BATCH_QUERY, (list(request_product_ids), ), prepare=use_prepared_statements)
+        return await cursor.fetchall()
+
+async def fetch_product_reviews_page_async(request_product_id, page_size, page_token, order_by_score):
+    query, params = product_reviews_page_query(request_product_id, page_size, page_token, order_by_score)
+
+    async with async_connection() as connection:
+        cursor = await connection.execute(query, params)
+        records = await cursor.fetchall()
+
+    return split_product_reviews_page(records, page_size, order_by_score)
+
+async def stream_product_reviews_from_db_async(request_product_id):
+    async with async_connection() as connection:
+
+        async with connection.cursor(name="stream_product_reviews") as cursor:
+            cursor.itersize = STREAM_CHUNK_SIZE
+            await cursor.execute(STREAM_PRODUCT_REVIEWS_QUERY, (request_product_id, ))
+            async for row in cursor:
+                yield row
+
+async def fetch_product_review_stats_async(request_product_id):
+    if review_stats_cache is None:
+        return await load_product_review_stats_async(request_product_id)
+    return (await review_stats_cache.get_async(request_product_id, load_product_review_stats_async))[0]
+
+async def fetch_product_review_stats_batch_async(request_product_ids):
+    if review_stats_cache is None:
+        return await query_product_review_stats_batch_async(request_product_ids)
+    return (await review_stats_cache.get_many_async(request_product_ids, query_product_review_stats_batch_async))[0]
+
+async def load_product_review_stats_async(request_product_id):
+    if review_stats_batch_loader_async is not None:
+        return await review_stats_batch_loader_async.load(request_product_id)
+    return await query_product_review_stats_async(request_product_id)
+
+async def query_product_review_stats_async(request_product_id):
+    async with async_connection() as connection:
+        cursor = await connection.execute(PRODUCT_REVIEW_STATS_QUERY, (request_product_id, ), prepare=use_prepared_statements)
+        return build_review_stats(await cursor.fetchone())
+
+async def query_product_review_stats_batch_async(request_product_ids):
+    async with async_connection() as connection:
+        cursor = await connection.execute(PRODUCT_REVIEW_STATS_BATCH_QUERY, (list(request_product_ids), ), prepare=use_prepared_statements)
+        return build_review_stats_batch(request_product_ids, await cursor.fetchall())
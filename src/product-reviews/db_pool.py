@@ -0,0 +1,182 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+# Postgres
+import psycopg2
+from psycopg2 import extensions
+
+logger = logging.getLogger('main')
+
+# Idle connections above min_size are closed after this many seconds
+MAX_IDLE_TIME = 600
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+def prepare_statements(connection, statements):
+    """Prepares the {name: query} statements on the connection for EXECUTE.
+
+    The queries use psycopg2's %s placeholders, which are numbered for PREPARE.
+    """
+    with connection.cursor() as cursor:
+        for name, query in statements.items():
+            parts = query.split('%s')
+            numbered_query = parts[0] + ''.join(f'${i}{part}' for i, part in enumerate(parts[1:], 1))
+            cursor.execute(f"PREPARE {name} AS {numbered_query}")
+    connection.commit()
+
+
+class ConnectionPool:
+    """Thread-safe pool of Postgres connections.
+
+    Keeps between `min_size` and `max_size` connections open. A checkout waits
+    up to `checkout_timeout` seconds for a connection when all of them are in
+    use. Connections that sat idle for longer than `validation_interval`
+    seconds are checked with a round trip before they are handed out,
+    connections that broke while in use are closed instead of returned, and
+    idle connections above `min_size` are closed after MAX_IDLE_TIME. The
+    `prepared_statements` are prepared once on every new connection.
+    """
+
+    def __init__(self, dsn, min_size, max_size, checkout_timeout, validation_interval, metrics, prepared_statements=None):
+        self._dsn = dsn
+        self._prepared_statements = prepared_statements or {}
+        self._min_size = min_size
+        self._max_size = max(max_size, min_size, 1)
+        self._checkout_timeout = checkout_timeout
+        self._validation_interval = validation_interval
+        self._condition = threading.Condition()
+        # (connection, returned_at) pairs, the most recently used last
+        self._idle = []
+        self._size = 0
+
+        self._wait_histogram = metrics['app_product_reviews_db_pool_wait_time']
+        self._in_use_counter = metrics['app_product_reviews_db_pool_connections_in_use']
+        self._created_counter = metrics['app_product_reviews_db_pool_connections_created']
+        self._closed_counter = metrics['app_product_reviews_db_pool_connections_closed']
+
+    def open(self):
+        """Opens the first `min_size` connections, failures are retried by later checkouts."""
+        for _ in range(self._min_size):
+            with self._condition:
+                self._size += 1
+            try:
+                connection = self._connect_reserved()
+            except psycopg2.Error as e:
+                logger.warning(f"Could not open database connection: {e}")
+                return
+            self._checkin(connection)
+
+    @contextmanager
+    def connection(self):
+        """Checks a connection out for a single transaction.
+
+        The transaction is committed when the block succeeds and rolled back
+        when it raises.
+        """
+        connection = self._checkout()
+        try:
+            with connection:
+                yield connection
+        except BaseException:
+            if connection.closed or connection.get_transaction_status() == extensions.TRANSACTION_STATUS_UNKNOWN:
+                self._discard(connection)
+            else:
+                self._checkin(connection)
+            raise
+        else:
+            self._checkin(connection)
+        finally:
+            self._in_use_counter.add(-1)
+
+    def _checkout(self):
+        started_at = time.monotonic()
+        deadline = started_at + self._checkout_timeout
+        while True:
+            with self._condition:
+                while not self._idle and self._size >= self._max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._wait_histogram.record(time.monotonic() - started_at)
+                        raise PoolTimeout(f"No database connection available after {self._checkout_timeout}s")
+                    self._condition.wait(remaining)
+                idle = self._idle.pop() if self._idle else None
+                if idle is None:
+                    self._size += 1
+
+            if idle is None:
+                connection = self._connect_reserved()
+            else:
+                connection, returned_at = idle
+                if not self._is_usable(connection, returned_at):
+                    self._discard(connection)
+                    continue
+
+            self._wait_histogram.record(time.monotonic() - started_at)
+            self._in_use_counter.add(1)
+            return connection
+
+    def _is_usable(self, connection, returned_at):
+        if connection.closed:
+            return False
+        if time.monotonic() - returned_at < self._validation_interval:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _connect_reserved(self):
+        # The caller already counted the connection towards the pool size
+        try:
+            connection = psycopg2.connect(self._dsn)
+        except BaseException:
+            self._release_slot()
+            raise
+        self._created_counter.add(1)
+
+        if self._prepared_statements:
+            try:
+                prepare_statements(connection, self._prepared_statements)
+            except BaseException:
+                self._discard(connection)
+                raise
+        return connection
+
+    def _checkin(self, connection):
+        expired = []
+        with self._condition:
+            now = time.monotonic()
+            self._idle.append((connection, now))
+            while len(self._idle) > 1 and self._size - len(expired) > self._min_size and now - self._idle[0][1] > MAX_IDLE_TIME:
+                expired.append(self._idle.pop(0)[0])
+            self._condition.notify()
+
+        for connection in expired:
+            self._discard(connection)
+
+    def _discard(self, connection):
+        try:
+            connection.close()
+        except psycopg2.Error:
+            pass
+        self._closed_counter.add(1)
+        self._release_slot()
+
+    def _release_slot(self):
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
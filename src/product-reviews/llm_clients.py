@@ -0,0 +1,147 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import time
+
+# Pip
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+# The first httpcore trace event of a request that opens a new connection,
+# requests on a reused connection start with sending their headers
+CONNECT_EVENT = 'connection.connect_tcp.started'
+
+
+class _ConnectionTrace:
+    """Notes how long a request waited for a pooled connection and whether it opened one."""
+
+    __slots__ = ('started_at', 'wait_time', 'connected', 'trace')
+
+    def __init__(self, trace):
+        self.started_at = time.monotonic()
+        self.wait_time = None
+        self.connected = False
+        # A trace extension set by someone else is still called
+        self.trace = trace
+
+    def on_event(self, name):
+        if self.wait_time is None:
+            self.wait_time = time.monotonic() - self.started_at
+        if name == CONNECT_EVENT:
+            self.connected = True
+
+
+class _ConnectionMetrics:
+
+    def __init__(self, metrics, base_url):
+        self._requests_counter = metrics['app_product_reviews_llm_requests']
+        self._pool_wait_histogram = metrics['app_product_reviews_llm_pool_wait_time']
+        self._attributes = {'llm.base_url': base_url}
+
+    def record(self, connection_trace):
+        # Requests that failed before they got a connection, for example on
+        # a pool timeout, waited for all of their time
+        wait_time = connection_trace.wait_time
+        if wait_time is None:
+            wait_time = time.monotonic() - connection_trace.started_at
+        self._pool_wait_histogram.record(wait_time, self._attributes)
+        self._requests_counter.add(1, {**self._attributes, 'connection.reused': not connection_trace.connected})
+
+
+class InstrumentedTransport(httpx.HTTPTransport):
+    """HTTPTransport recording connection reuse and pool wait time of every request."""
+
+    def __init__(self, metrics, base_url, **kwargs):
+        super().__init__(**kwargs)
+        self._metrics = _ConnectionMetrics(metrics, base_url)
+
+    def handle_request(self, request):
+        connection_trace = _ConnectionTrace(request.extensions.get('trace'))
+
+        def trace(name, info):
+            connection_trace.on_event(name)
+            if connection_trace.trace is not None:
+                connection_trace.trace(name, info)
+
+        request.extensions['trace'] = trace
+        try:
+            return super().handle_request(request)
+        finally:
+            self._metrics.record(connection_trace)
+
+
+class AsyncInstrumentedTransport(httpx.AsyncHTTPTransport):
+    """InstrumentedTransport for the asyncio server mode."""
+
+    def __init__(self, metrics, base_url, **kwargs):
+        super().__init__(**kwargs)
+        self._metrics = _ConnectionMetrics(metrics, base_url)
+
+    async def handle_async_request(self, request):
+        connection_trace = _ConnectionTrace(request.extensions.get('trace'))
+
+        async def trace(name, info):
+            connection_trace.on_event(name)
+            if connection_trace.trace is not None:
+                await connection_trace.trace(name, info)
+
+        request.extensions['trace'] = trace
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            self._metrics.record(connection_trace)
+
+
+class LLMClients:
+    """Long-lived OpenAI clients, one per LLM base URL.
+
+    Every client keeps a pool of up to `max_connections` HTTP connections, of
+    which `max_keepalive_connections` are kept open for up to
+    `keepalive_expiry` idle seconds, so LLM calls reuse connections instead of
+    connecting every time. Requests wait up to `pool_timeout` seconds for a
+    connection when all of them are in use, and failed requests are retried
+    up to `max_retries` times.
+    """
+
+    def __init__(self, api_key, max_connections, max_keepalive_connections, keepalive_expiry,
+                 connect_timeout, read_timeout, pool_timeout, max_retries, metrics):
+        self._api_key = api_key
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry)
+        self._timeout = httpx.Timeout(read_timeout, connect=connect_timeout, pool=pool_timeout)
+        self._max_retries = max_retries
+        self._metrics = metrics
+        self._clients = {}
+        self._async_clients = {}
+
+    def get(self, base_url):
+        client = self._clients.get(base_url)
+        if client is None:
+            transport = InstrumentedTransport(self._metrics, base_url, limits=self._limits)
+            client = self._clients[base_url] = OpenAI(
+                base_url=base_url,
+                # The OpenAI API requires an api_key to be present, but
+                # our LLM doesn't use it
+                api_key=self._api_key,
+                timeout=self._timeout,
+                max_retries=self._max_retries,
+                http_client=DefaultHttpxClient(transport=transport, timeout=self._timeout))
+        return client
+
+    def get_async(self, base_url):
+        """Returns the AsyncOpenAI client for the base URL, which must be created on the running event loop."""
+        client = self._async_clients.get(base_url)
+        if client is None:
+            transport = AsyncInstrumentedTransport(self._metrics, base_url, limits=self._limits)
+            client = self._async_clients[base_url] = AsyncOpenAI(
+                base_url=base_url,
+                api_key=self._api_key,
+                timeout=self._timeout,
+                max_retries=self._max_retries,
+                http_client=DefaultAsyncHttpxClient(transport=transport, timeout=self._timeout))
+        return client
@@ -3,7 +3,9 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
-def init_metrics(meter):
+from opentelemetry.metrics import Observation
+
+def init_metrics(meter, flag_cache=None):
 
     # Product reviews counter
     app_product_review_counter = meter.create_counter(
@@ -15,9 +17,143 @@ def init_metrics(meter):
         'app_ai_assistant_counter', unit='summaries', description="Counts the total number of AI Assistant requests"
     )
 
+    # Admission control metrics
+    app_product_reviews_rpcs_in_flight = meter.create_up_down_counter(
+        'app_product_reviews_rpcs_in_flight', unit='requests', description="Number of RPCs being handled by the product reviews server"
+    )
+    app_product_reviews_rpc_queue_depth = meter.create_up_down_counter(
+        'app_product_reviews_rpc_queue_depth', unit='requests', description="Number of RPCs waiting for a free product reviews server worker"
+    )
+    app_product_reviews_rpc_queue_time = meter.create_histogram(
+        'app_product_reviews_rpc_queue_time', unit='s', description="Time RPCs spent waiting for a free product reviews server worker"
+    )
+    app_product_reviews_rpcs_shed = meter.create_counter(
+        'app_product_reviews_rpcs_shed', unit='requests', description="Counts the RPCs rejected by product reviews admission control"
+    )
+
+    # Feature flag evaluation histogram
+    app_product_reviews_flag_evaluation_duration = meter.create_histogram(
+        'app_product_reviews_flag_evaluation_duration', unit='s', description="Duration of the background feature flag evaluations"
+    )
+
+    # Feature flag staleness gauge
+    if flag_cache is not None:
+        def observe_flag_staleness(options):
+            staleness = flag_cache.staleness_seconds()
+            return [] if staleness is None else [Observation(staleness)]
+
+        meter.create_observable_gauge(
+            'app_product_reviews_flag_staleness', callbacks=[observe_flag_staleness], unit='s', description="Time since the cached feature flags were last refreshed"
+        )
+
+    # Database connection pool metrics
+    app_product_reviews_db_pool_wait_time = meter.create_histogram(
+        'app_product_reviews_db_pool_wait_time', unit='s', description="Time spent waiting to check out a database connection"
+    )
+    app_product_reviews_db_pool_connections_in_use = meter.create_up_down_counter(
+        'app_product_reviews_db_pool_connections_in_use', unit='connections', description="Number of database connections checked out of the pool"
+    )
+    app_product_reviews_db_pool_connections_created = meter.create_counter(
+        'app_product_reviews_db_pool_connections_created', unit='connections', description="Counts the database connections opened by the pool"
+    )
+    app_product_reviews_db_pool_connections_closed = meter.create_counter(
+        'app_product_reviews_db_pool_connections_closed', unit='connections', description="Counts the broken or idle database connections closed by the pool"
+    )
+
+    # Review cache counters
+    app_product_reviews_cache_hits = meter.create_counter(
+        'app_product_reviews_cache_hits', unit='requests', description="Counts the product review lookups served from the review cache"
+    )
+    app_product_reviews_cache_misses = meter.create_counter(
+        'app_product_reviews_cache_misses', unit='requests', description="Counts the product review lookups that read from the database"
+    )
+
+    # AI assistant response cache metrics
+    app_product_reviews_ai_cache_hits = meter.create_counter(
+        'app_product_reviews_ai_cache_hits', unit='requests', description="Counts the AI assistant requests answered from the response cache"
+    )
+    app_product_reviews_ai_cache_misses = meter.create_counter(
+        'app_product_reviews_ai_cache_misses', unit='requests', description="Counts the cacheable AI assistant requests that called the LLM"
+    )
+    app_product_reviews_ai_cache_saved_time = meter.create_histogram(
+        'app_product_reviews_ai_cache_saved_time', unit='s', description="Time it took to build the AI assistant responses served from the response cache"
+    )
+
+    # Semantic AI assistant response cache metrics
+    app_product_reviews_semantic_cache_hits = meter.create_counter(
+        'app_product_reviews_semantic_cache_hits', unit='requests', description="Counts the AI assistant requests answered with the cached response to a similar question"
+    )
+    app_product_reviews_semantic_cache_misses = meter.create_counter(
+        'app_product_reviews_semantic_cache_misses', unit='requests', description="Counts the AI assistant requests without a cached response to a similar question"
+    )
+    app_product_reviews_semantic_cache_lookup_time = meter.create_histogram(
+        'app_product_reviews_semantic_cache_lookup_time', unit='s', description="Time spent searching the cached question embeddings of a product"
+    )
+    app_product_reviews_semantic_cache_similarity = meter.create_histogram(
+        'app_product_reviews_semantic_cache_similarity', unit='1', description="Cosine similarity of questions to the most similar cached question about the product"
+    )
+
+    # Single-flight AI assistant request metrics
+    app_product_reviews_single_flight_shared = meter.create_counter(
+        'app_product_reviews_single_flight_shared', unit='requests', description="Counts the AI assistant requests that joined an identical request in flight"
+    )
+    app_product_reviews_single_flight_cancelled = meter.create_counter(
+        'app_product_reviews_single_flight_cancelled', unit='requests', description="Counts the shared AI assistant requests cancelled after all of their callers were gone"
+    )
+
+    # LLM tool call metrics
+    app_product_reviews_tool_call_duration = meter.create_histogram(
+        'app_product_reviews_tool_call_duration', unit='s', description="Time the handlers of LLM tool calls took, by tool"
+    )
+    app_product_reviews_tool_call_timeouts = meter.create_counter(
+        'app_product_reviews_tool_call_timeouts', unit='calls', description="Counts the LLM tool calls that were not done within the timeout of their tool"
+    )
+
+    # Batch loader histograms
+    app_product_reviews_batch_size = meter.create_histogram(
+        'app_product_reviews_batch_size', unit='products', description="Number of products read by a batched review query"
+    )
+    app_product_reviews_batch_wait_time = meter.create_histogram(
+        'app_product_reviews_batch_wait_time', unit='s', description="Time review lookups waited for their batched query to be sent"
+    )
+
+    # LLM client metrics
+    app_product_reviews_llm_requests = meter.create_counter(
+        'app_product_reviews_llm_requests', unit='requests', description="Counts the LLM HTTP requests, by whether they reused a pooled connection"
+    )
+    app_product_reviews_llm_pool_wait_time = meter.create_histogram(
+        'app_product_reviews_llm_pool_wait_time', unit='s', description="Time LLM HTTP requests waited for a pooled connection or a new one to be opened"
+    )
+
     product_review_svc_metrics = {
         "app_product_review_counter": app_product_review_counter,
         "app_ai_assistant_counter": app_ai_assistant_counter,
+        "app_product_reviews_rpcs_in_flight": app_product_reviews_rpcs_in_flight,
+        "app_product_reviews_rpc_queue_depth": app_product_reviews_rpc_queue_depth,
+        "app_product_reviews_rpc_queue_time": app_product_reviews_rpc_queue_time,
+        "app_product_reviews_rpcs_shed": app_product_reviews_rpcs_shed,
+        "app_product_reviews_flag_evaluation_duration": app_product_reviews_flag_evaluation_duration,
+        "app_product_reviews_db_pool_wait_time": app_product_reviews_db_pool_wait_time,
+        "app_product_reviews_db_pool_connections_in_use": app_product_reviews_db_pool_connections_in_use,
+        "app_product_reviews_db_pool_connections_created": app_product_reviews_db_pool_connections_created,
+        "app_product_reviews_db_pool_connections_closed": app_product_reviews_db_pool_connections_closed,
+        "app_product_reviews_cache_hits": app_product_reviews_cache_hits,
+        "app_product_reviews_cache_misses": app_product_reviews_cache_misses,
+        "app_product_reviews_ai_cache_hits": app_product_reviews_ai_cache_hits,
+        "app_product_reviews_ai_cache_misses": app_product_reviews_ai_cache_misses,
+        "app_product_reviews_ai_cache_saved_time": app_product_reviews_ai_cache_saved_time,
+        "app_product_reviews_semantic_cache_hits": app_product_reviews_semantic_cache_hits,
+        "app_product_reviews_semantic_cache_misses": app_product_reviews_semantic_cache_misses,
+        "app_product_reviews_semantic_cache_lookup_time": app_product_reviews_semantic_cache_lookup_time,
+        "app_product_reviews_semantic_cache_similarity": app_product_reviews_semantic_cache_similarity,
+        "app_product_reviews_single_flight_shared": app_product_reviews_single_flight_shared,
+        "app_product_reviews_single_flight_cancelled": app_product_reviews_single_flight_cancelled,
+        "app_product_reviews_tool_call_duration": app_product_reviews_tool_call_duration,
+        "app_product_reviews_tool_call_timeouts": app_product_reviews_tool_call_timeouts,
+        "app_product_reviews_batch_size": app_product_reviews_batch_size,
+        "app_product_reviews_batch_wait_time": app_product_reviews_batch_wait_time,
+        "app_product_reviews_llm_requests": app_product_reviews_llm_requests,
+        "app_product_reviews_llm_pool_wait_time": app_product_reviews_llm_pool_wait_time,
     }
 
     return product_review_svc_metrics
@@ -0,0 +1,8 @@
+-- Copyright The OpenTelemetry Authors
+-- SPDX-License-Identifier: Apache-2.0
+
+-- Lets review reads by product id be answered with index-only scans instead
+-- of fetching username, description and score from the table. It replaces
+-- product_id_index, which it makes redundant.
+CREATE INDEX IF NOT EXISTS product_id_covering_index ON reviews.productreviews (product_id) INCLUDE (username, description, score);
+DROP INDEX IF EXISTS reviews.product_id_index;
@@ -0,0 +1,121 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# The same module is copied into src/recommendation and src/product-reviews,
+# since each service image only packages its own directory. Keep the two
+# copies identical.
+
+# Python
+import logging
+import math
+import os
+import signal
+import subprocess
+import sys
+import time
+import uuid
+
+logger = logging.getLogger('main')
+
+# Set in the environment of the worker processes started by the supervisor
+WORKER_INDEX_ENV = 'PREFORK_WORKER_INDEX'
+
+# Options for servers that share their port with the other workers
+SERVER_OPTIONS = [('grpc.so_reuseport', 1)]
+
+# Workers exiting sooner than this after being started are restarted with a
+# delay, so a crashing worker does not turn into a busy loop
+MIN_WORKER_UPTIME = 5.0
+
+
+def is_worker():
+    return WORKER_INDEX_ENV in os.environ
+
+
+def cpu_quota_workers():
+    """Returns the number of workers matching the cgroup CPU quota.
+
+    Falls back to the CPUs this process may run on when no quota is set.
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+    quota = read_cgroup_cpu_quota()
+    if quota is None:
+        return cpus
+    return max(1, min(cpus, math.ceil(quota)))
+
+
+def read_cgroup_cpu_quota():
+    # cgroup v2: "<quota> <period>", or "max <period>" without a limit
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+        return None if quota == 'max' else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+
+    # cgroup v1: a quota of -1 means no limit
+    try:
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:
+            quota = int(f.read())
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+            period = int(f.read())
+        return None if quota <= 0 else quota / period
+    except (OSError, ValueError):
+        return None
+
+
+def supervise(num_workers):
+    """Runs `num_workers` copies of the current script and restarts any that exit.
+
+    Every worker is a fresh interpreter rather than a fork, so it sets up its
+    own OpenTelemetry providers, feature flag provider and gRPC channels. The
+    workers bind the same port with SO_REUSEPORT and the kernel spreads
+    incoming connections across them. Returns once SIGTERM or SIGINT has been
+    forwarded to the workers and they have exited.
+    """
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    workers = {index: start_worker(index) for index in range(num_workers)}
+    logger.info(f'Started {num_workers} worker processes')
+
+    while not stopping:
+        time.sleep(1)
+        for index, (process, started_at) in list(workers.items()):
+            if stopping or process.poll() is None:
+                continue
+            logger.warning(f'Worker {index} (pid {process.pid}) exited with code {process.returncode}, restarting it')
+            uptime = time.monotonic() - started_at
+            if uptime < MIN_WORKER_UPTIME:
+                time.sleep(MIN_WORKER_UPTIME - uptime)
+            workers[index] = start_worker(index)
+
+    logger.info('Stopping worker processes')
+    for process, _ in workers.values():
+        if process.poll() is None:
+            process.terminate()
+    for process, _ in workers.values():
+        process.wait()
+
+
+def start_worker(index):
+    env = dict(os.environ)
+    env[WORKER_INDEX_ENV] = str(index)
+
+    # Give every worker its own service instance, so the metrics of the
+    # workers are exported as separate series instead of overwriting each other
+    resource_attributes = env.get('OTEL_RESOURCE_ATTRIBUTES', '')
+    if 'service.instance.id=' not in resource_attributes:
+        instance_id = f'service.instance.id={uuid.uuid4()}'
+        env['OTEL_RESOURCE_ATTRIBUTES'] = f'{resource_attributes},{instance_id}' if resource_attributes else instance_id
+
+    process = subprocess.Popen([sys.executable] + sys.argv, env=env)
+    return process, time.monotonic()
@@ -5,10 +5,12 @@
 
 
 # Python
+import asyncio
 import os
+import sys
 import json
-from concurrent import futures
 import random
+import time
 
 # Pip
 import grpc
@@ -28,7 +30,16 @@ import demo_pb2
 import demo_pb2_grpc
 from grpc_health.v1 import health_pb2
 from grpc_health.v1 import health_pb2_grpc
-from database import fetch_product_reviews, fetch_product_reviews_from_db, fetch_avg_product_review_score_from_db
+import prefork
+from admission import AdmissionControl, AsyncAdmissionControl
+from ai_response_cache import AIResponseCache, CachedAIResponse, normalize_question
+from semantic_cache import SemanticCache
+from singleflight import AsyncSingleFlight, SingleFlight
+from tool_calls import AsyncToolRegistry, ToolRegistry
+from flag_cache import FlagCache
+from llm_clients import LLMClients
+from database import apply_schema_migrations, init_connection_pool, init_review_cache, init_batch_loaders, get_cached_product_reviews, get_cached_product_reviews_batch, fetch_product_reviews, fetch_product_reviews_page, stream_product_reviews_from_db, fetch_avg_product_review_score_from_db, fetch_product_review_stats, fetch_product_review_stats_batch
+from database import init_async_connection_pool, get_cached_product_reviews_async, get_cached_product_reviews_batch_async, fetch_product_reviews_async, fetch_product_reviews_page_async, stream_product_reviews_from_db_async, fetch_product_review_stats_async, fetch_product_review_stats_batch_async
 
 from openfeature import api
 from openfeature.contrib.provider.flagd import FlagdProvider
@@ -37,9 +48,6 @@ from metrics import (
     init_metrics
 )
 
-# OpenAI
-from openai import OpenAI
-
 from google.protobuf.json_format import MessageToJson, MessageToDict
 
 llm_host = None
@@ -48,6 +56,43 @@ llm_mock_url = None
 llm_base_url = None
 llm_api_key = None
 llm_model = None
+flag_cache = None
+
+# Caches of AI assistant responses, None when disabled
+ai_response_cache = None
+semantic_cache = None
+embeddings_base_url = None
+embeddings_model = None
+
+# Coalesce identical AI assistant requests in flight, None when disabled
+ai_single_flight = None
+ai_single_flight_async = None
+
+# Shared LLM clients, created when the server starts
+llm_clients = None
+llm_client = None
+llm_mock_client = None
+embeddings_client = None
+
+# Handlers of the LLM tool calls, created when the server starts
+tool_registry = None
+tool_call_workers = None
+fetch_product_reviews_timeout = None
+fetch_product_info_timeout = None
+
+# Clients of the async server mode, created on its event loop
+product_catalog_async_stub = None
+llm_async_client = None
+llm_mock_async_client = None
+async_tool_registry = None
+embeddings_async_client = None
+
+# Upper bound on the product ids of a single batch request
+MAX_BATCH_SIZE = 100
+
+# Reviews per page of GetProductReviewsPage
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
 
 # --- Define the tool for the OpenAI API ---
 tools = [
@@ -100,9 +145,48 @@ class ProductReviewService(demo_pb2_grpc.ProductReviewServiceServicer):
 
         return product_reviews
 
+    def GetProductReviewScoreHistogram(self, request, context):
+        logger.info(f"Receive GetProductReviewScoreHistogram for product id:{request.product_id}")
+        product_review_score_histogram = get_product_review_score_histogram(request.product_id)
+
+        return product_review_score_histogram
+
+    def GetProductReviewsBatch(self, request, context):
+        logger.info(f"Receive GetProductReviewsBatch for {len(request.product_ids)} product ids")
+        try:
+            check_batch_size(request.product_ids)
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        product_reviews_batch = get_product_reviews_batch(request.product_ids)
+
+        return product_reviews_batch
+
+    def GetAverageScoresBatch(self, request, context):
+        logger.info(f"Receive GetAverageScoresBatch for {len(request.product_ids)} product ids")
+        try:
+            check_batch_size(request.product_ids)
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        average_scores_batch = get_average_scores_batch(request.product_ids)
+
+        return average_scores_batch
+
+    def GetProductReviewsPage(self, request, context):
+        logger.info(f"Receive GetProductReviewsPage for product id:{request.product_id}, page token: {request.page_token}")
+        try:
+            product_reviews_page = get_product_reviews_page(request.product_id, get_page_size(request), request.page_token, request.order_by_score)
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+
+        return product_reviews_page
+
+    def StreamProductReviews(self, request, context):
+        logger.info(f"Receive StreamProductReviews for product id:{request.product_id}")
+        return stream_product_reviews(request.product_id)
+
     def AskProductAIAssistant(self, request, context):
         logger.info(f"Receive AskProductAIAssistant for product id:{request.product_id}, question: {request.question}")
-        ai_assistant_response = get_ai_assistant_response(request.product_id, request.question)
+        ai_assistant_response = ask_ai_assistant(request.product_id, request.question)
 
         return ai_assistant_response
 
@@ -114,29 +198,111 @@ class ProductReviewService(demo_pb2_grpc.ProductReviewServiceServicer):
         return health_pb2.HealthCheckResponse(
             status=health_pb2.HealthCheckResponse.UNIMPLEMENTED)
 
+
+class AsyncProductReviewService(demo_pb2_grpc.ProductReviewServiceServicer):
+    async def GetProductReviews(self, request, context):
+        logger.info(f"Receive GetProductReviews for product id:{request.product_id}")
+        product_reviews = await get_product_reviews_async(request.product_id)
+
+        return product_reviews
+
+    async def GetAverageProductReviewScore(self, request, context):
+        logger.info(f"Receive GetAverageProductReviewScore for product id:{request.product_id}")
+        product_reviews = await get_average_product_review_score_async(request.product_id)
+
+        return product_reviews
+
+    async def GetProductReviewScoreHistogram(self, request, context):
+        logger.info(f"Receive GetProductReviewScoreHistogram for product id:{request.product_id}")
+        product_review_score_histogram = await get_product_review_score_histogram_async(request.product_id)
+
+        return product_review_score_histogram
+
+    async def GetProductReviewsBatch(self, request, context):
+        logger.info(f"Receive GetProductReviewsBatch for {len(request.product_ids)} product ids")
+        try:
+            check_batch_size(request.product_ids)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        product_reviews_batch = await get_product_reviews_batch_async(request.product_ids)
+
+        return product_reviews_batch
+
+    async def GetAverageScoresBatch(self, request, context):
+        logger.info(f"Receive GetAverageScoresBatch for {len(request.product_ids)} product ids")
+        try:
+            check_batch_size(request.product_ids)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        average_scores_batch = await get_average_scores_batch_async(request.product_ids)
+
+        return average_scores_batch
+
+    async def GetProductReviewsPage(self, request, context):
+        logger.info(f"Receive GetProductReviewsPage for product id:{request.product_id}, page token: {request.page_token}")
+        try:
+            product_reviews_page = await get_product_reviews_page_async(request.product_id, get_page_size(request), request.page_token, request.order_by_score)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+
+        return product_reviews_page
+
+    async def StreamProductReviews(self, request, context):
+        logger.info(f"Receive StreamProductReviews for product id:{request.product_id}")
+        async for product_review in stream_product_reviews_async(request.product_id):
+            yield product_review
+
+    async def AskProductAIAssistant(self, request, context):
+        logger.info(f"Receive AskProductAIAssistant for product id:{request.product_id}, question: {request.question}")
+        ai_assistant_response = await ask_ai_assistant_async(request.product_id, request.question)
+
+        return ai_assistant_response
+
+    async def Check(self, request, context):
+        return health_pb2.HealthCheckResponse(
+            status=health_pb2.HealthCheckResponse.SERVING)
+
+    async def Watch(self, request, context):
+        return health_pb2.HealthCheckResponse(
+            status=health_pb2.HealthCheckResponse.UNIMPLEMENTED)
+
+
 def get_product_reviews(request_product_id):
 
     with tracer.start_as_current_span("get_product_reviews") as span:
 
         span.set_attribute("app.product.id", request_product_id)
 
-        product_reviews = demo_pb2.GetProductReviewsResponse()
-        records = fetch_product_reviews_from_db(request_product_id)
+        product_reviews, cache_hit = get_cached_product_reviews(request_product_id)
+        return build_product_reviews_response(span, request_product_id, product_reviews, cache_hit)
 
-        for row in records:
-            logger.info(f"  username: {row[0]}, description: {row[1]}, score: {str(row[2])}")
-            product_reviews.product_reviews.add(
-                    username=row[0],
-                    description=row[1],
-                    score=str(row[2])
-            )
+async def get_product_reviews_async(request_product_id):
 
-        span.set_attribute("app.product_reviews.count", len(product_reviews.product_reviews))
+    with tracer.start_as_current_span("get_product_reviews") as span:
 
-        # Collect metrics for this service
-        product_review_svc_metrics["app_product_review_counter"].add(len(product_reviews.product_reviews), {'product.id': request_product_id})
+        span.set_attribute("app.product.id", request_product_id)
 
-        return product_reviews
+        product_reviews, cache_hit = await get_cached_product_reviews_async(request_product_id)
+        return build_product_reviews_response(span, request_product_id, product_reviews, cache_hit)
+
+def build_product_reviews_response(span, request_product_id, product_reviews, cache_hit):
+    # The cached reviews include the serialized GetProductReviewsResponse,
+    # which is sent as is
+    span.set_attribute("app.product_reviews.cache_hit", cache_hit)
+    if cache_hit:
+        product_review_svc_metrics["app_product_reviews_cache_hits"].add(1)
+    else:
+        product_review_svc_metrics["app_product_reviews_cache_misses"].add(1)
+
+    for row in product_reviews.rows:
+        logger.info(f"  username: {row[0]}, description: {row[1]}, score: {str(row[2])}")
+
+    span.set_attribute("app.product_reviews.count", len(product_reviews.rows))
+
+    # Collect metrics for this service
+    product_review_svc_metrics["app_product_review_counter"].add(len(product_reviews.rows), {'product.id': request_product_id})
+
+    return product_reviews.response_bytes
 
 def get_average_product_review_score(request_product_id):
 
@@ -144,13 +310,355 @@ def get_average_product_review_score(request_product_id):
 
         span.set_attribute("app.product.id", request_product_id)
 
-        product_review_score = demo_pb2.GetAverageProductReviewScoreResponse()
         avg_score = fetch_avg_product_review_score_from_db(request_product_id)
-        product_review_score.average_score = avg_score
+        return build_average_product_review_score_response(span, avg_score)
+
+async def get_average_product_review_score_async(request_product_id):
+
+    with tracer.start_as_current_span("get_average_product_review_score") as span:
+
+        span.set_attribute("app.product.id", request_product_id)
+
+        review_stats = await fetch_product_review_stats_async(request_product_id)
+        return build_average_product_review_score_response(span, review_stats.average_score())
+
+def build_average_product_review_score_response(span, avg_score):
+    product_review_score = demo_pb2.GetAverageProductReviewScoreResponse()
+    product_review_score.average_score = avg_score
+
+    span.set_attribute("app.product_reviews.average_score", avg_score)
+
+    return product_review_score
+
+def get_product_review_score_histogram(request_product_id):
+
+    with tracer.start_as_current_span("get_product_review_score_histogram") as span:
+
+        span.set_attribute("app.product.id", request_product_id)
+
+        review_stats = fetch_product_review_stats(request_product_id)
+        return build_product_review_score_histogram_response(span, review_stats)
+
+async def get_product_review_score_histogram_async(request_product_id):
+
+    with tracer.start_as_current_span("get_product_review_score_histogram") as span:
+
+        span.set_attribute("app.product.id", request_product_id)
+
+        review_stats = await fetch_product_review_stats_async(request_product_id)
+        return build_product_review_score_histogram_response(span, review_stats)
+
+def build_product_review_score_histogram_response(span, review_stats):
+    product_review_score_histogram = demo_pb2.GetProductReviewScoreHistogramResponse(
+        review_count=review_stats.review_count,
+        average_score=review_stats.average_score(),
+        star_counts=review_stats.star_counts
+    )
+
+    span.set_attribute("app.product_reviews.count", review_stats.review_count)
+
+    return product_review_score_histogram
+
+def get_page_size(request):
+    page_size = request.page_size or DEFAULT_PAGE_SIZE
+    if not 0 < page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+    return page_size
+
+def get_product_reviews_page(request_product_id, page_size, page_token, order_by_score):
+
+    with tracer.start_as_current_span("get_product_reviews_page") as span:
+
+        set_product_reviews_page_attributes(span, request_product_id, page_size, order_by_score)
+
+        records, next_page_token = fetch_product_reviews_page(request_product_id, page_size, page_token, order_by_score)
+        return build_product_reviews_page_response(span, request_product_id, records, next_page_token)
+
+async def get_product_reviews_page_async(request_product_id, page_size, page_token, order_by_score):
+
+    with tracer.start_as_current_span("get_product_reviews_page") as span:
+
+        set_product_reviews_page_attributes(span, request_product_id, page_size, order_by_score)
+
+        records, next_page_token = await fetch_product_reviews_page_async(request_product_id, page_size, page_token, order_by_score)
+        return build_product_reviews_page_response(span, request_product_id, records, next_page_token)
+
+def set_product_reviews_page_attributes(span, request_product_id, page_size, order_by_score):
+    span.set_attribute("app.product.id", request_product_id)
+    span.set_attribute("app.product_reviews.page_size", page_size)
+    span.set_attribute("app.product_reviews.order_by_score", order_by_score)
+
+def build_product_reviews_page_response(span, request_product_id, records, next_page_token):
+    product_reviews_page = demo_pb2.GetProductReviewsPageResponse(next_page_token=next_page_token)
+    for row in records:
+        product_reviews_page.product_reviews.add(
+            username=row[0],
+            description=row[1],
+            score=str(row[2])
+        )
+
+    span.set_attribute("app.product_reviews.count", len(records))
+
+    # Collect metrics for this service
+    product_review_svc_metrics["app_product_review_counter"].add(len(records), {'product.id': request_product_id})
+
+    return product_reviews_page
+
+def stream_product_reviews(request_product_id):
+
+    # The span is not made current, since the generator is suspended between
+    # reviews and may be closed from outside of its context
+    span = tracer.start_span("stream_product_reviews")
+    span.set_attribute("app.product.id", request_product_id)
+    count = 0
+    try:
+        for row in stream_product_reviews_from_db(request_product_id):
+            yield build_product_review(row)
+            count += 1
+    finally:
+        end_stream_product_reviews_span(span, request_product_id, count)
+
+async def stream_product_reviews_async(request_product_id):
+
+    span = tracer.start_span("stream_product_reviews")
+    span.set_attribute("app.product.id", request_product_id)
+    count = 0
+    try:
+        async for row in stream_product_reviews_from_db_async(request_product_id):
+            yield build_product_review(row)
+            count += 1
+    finally:
+        end_stream_product_reviews_span(span, request_product_id, count)
+
+def build_product_review(row):
+    return demo_pb2.ProductReview(
+        username=row[0],
+        description=row[1],
+        score=str(row[2])
+    )
+
+def end_stream_product_reviews_span(span, request_product_id, count):
+    span.set_attribute("app.product_reviews.count", count)
+    span.end()
+
+    # Collect metrics for this service
+    product_review_svc_metrics["app_product_review_counter"].add(count, {'product.id': request_product_id})
+
+def check_batch_size(request_product_ids):
+    if len(request_product_ids) > MAX_BATCH_SIZE:
+        raise ValueError(f"At most {MAX_BATCH_SIZE} product ids can be requested at once")
+
+def get_product_reviews_batch(request_product_ids):
+
+    with tracer.start_as_current_span("get_product_reviews_batch") as span:
+
+        product_ids = start_batch_span(span, request_product_ids)
+
+        cached_reviews, cache_hits = get_cached_product_reviews_batch(product_ids)
+        return build_product_reviews_batch_response(span, request_product_ids, product_ids, cached_reviews, cache_hits)
+
+async def get_product_reviews_batch_async(request_product_ids):
+
+    with tracer.start_as_current_span("get_product_reviews_batch") as span:
+
+        product_ids = start_batch_span(span, request_product_ids)
+
+        cached_reviews, cache_hits = await get_cached_product_reviews_batch_async(product_ids)
+        return build_product_reviews_batch_response(span, request_product_ids, product_ids, cached_reviews, cache_hits)
+
+def start_batch_span(span, request_product_ids):
+    """Sets the batch attributes on the span and returns the distinct product ids."""
+    product_ids = list(dict.fromkeys(request_product_ids))
+    span.set_attribute("app.product.ids", product_ids)
+    span.set_attribute("app.product_reviews.batch_size", len(request_product_ids))
+    return product_ids
+
+def build_product_reviews_batch_response(span, request_product_ids, product_ids, cached_reviews, cache_hits):
+    span.set_attribute("app.product_reviews.cache_hits", cache_hits)
+    product_review_svc_metrics["app_product_reviews_cache_hits"].add(cache_hits)
+    product_review_svc_metrics["app_product_reviews_cache_misses"].add(len(product_ids) - cache_hits)
+
+    product_reviews_batch = demo_pb2.GetProductReviewsBatchResponse()
+    for product_id in request_product_ids:
+        product_reviews = product_reviews_batch.product_reviews.add(product_id=product_id)
+        for row in cached_reviews[product_id].rows:
+            product_reviews.product_reviews.add(
+                username=row[0],
+                description=row[1],
+                score=str(row[2])
+            )
+
+    # Collect metrics for this service
+    for product_id in product_ids:
+        product_review_svc_metrics["app_product_review_counter"].add(len(cached_reviews[product_id].rows), {'product.id': product_id})
+
+    return product_reviews_batch
+
+def get_average_scores_batch(request_product_ids):
+
+    with tracer.start_as_current_span("get_average_scores_batch") as span:
+
+        product_ids = start_batch_span(span, request_product_ids)
+
+        review_stats = fetch_product_review_stats_batch(product_ids)
+        return build_average_scores_batch_response(request_product_ids, review_stats)
+
+async def get_average_scores_batch_async(request_product_ids):
 
-        span.set_attribute("app.product_reviews.average_score", avg_score)
+    with tracer.start_as_current_span("get_average_scores_batch") as span:
 
-        return product_review_score
+        product_ids = start_batch_span(span, request_product_ids)
+
+        review_stats = await fetch_product_review_stats_batch_async(product_ids)
+        return build_average_scores_batch_response(request_product_ids, review_stats)
+
+def build_average_scores_batch_response(request_product_ids, review_stats):
+    average_scores_batch = demo_pb2.GetAverageScoresBatchResponse()
+    for product_id in request_product_ids:
+        average_scores_batch.average_scores.add(
+            product_id=product_id,
+            average_score=review_stats[product_id].average_score()
+        )
+
+    return average_scores_batch
+
+def ask_ai_assistant(request_product_id, question):
+    key = get_ai_response_key(request_product_id, question)
+    if key is None:
+        return get_ai_assistant_response(request_product_id, question)
+    if ai_single_flight is None:
+        return get_cached_ai_assistant_response(request_product_id, question, key)
+
+    # Identical requests in flight share one response
+    response, coalesced = ai_single_flight.do(
+        key, lambda: get_cached_ai_assistant_response(request_product_id, question, key))
+    record_ai_single_flight(coalesced)
+    return response
+
+async def ask_ai_assistant_async(request_product_id, question):
+    key = get_ai_response_key(request_product_id, question)
+    if key is None:
+        return await get_ai_assistant_response_async(request_product_id, question)
+    if ai_single_flight_async is None:
+        return await get_cached_ai_assistant_response_async(request_product_id, question, key)
+
+    # Identical requests in flight share one response, which is only
+    # cancelled once every request waiting for it is gone
+    response, coalesced = await ai_single_flight_async.do(
+        key, lambda: get_cached_ai_assistant_response_async(request_product_id, question, key))
+    record_ai_single_flight(coalesced)
+    return response
+
+def record_ai_single_flight(coalesced):
+    trace.get_current_span().set_attribute("app.ai_assistant.coalesced", coalesced)
+    if coalesced:
+        product_review_svc_metrics["app_product_reviews_single_flight_shared"].add(1)
+
+def record_ai_single_flight_cancelled():
+    product_review_svc_metrics["app_product_reviews_single_flight_cancelled"].add(1)
+
+def get_ai_response_key(request_product_id, question):
+    """Returns the key of requests that get the same response, or None when each request must ask the LLM."""
+    # Rate limit errors are injected into the LLM calls, which a shared or
+    # cached response would skip
+    if check_feature_flag("llmRateLimitError"):
+        return None
+    # The flag changes the response, so both variants are kept apart
+    return (request_product_id, normalize_question(question), check_feature_flag("llmInaccurateResponse"))
+
+def get_cached_ai_assistant_response(request_product_id, question, key):
+    if ai_response_cache is None:
+        return get_similar_ai_assistant_response(request_product_id, question, key)
+
+    with tracer.start_as_current_span("get_cached_ai_assistant_response") as span:
+
+        def load():
+            started_at = time.monotonic()
+            response = get_similar_ai_assistant_response(request_product_id, question, key)
+            return CachedAIResponse(response, time.monotonic() - started_at)
+
+        cached_response, cache_hit = ai_response_cache.get(key, load)
+        return build_cached_ai_assistant_response(span, request_product_id, cached_response, cache_hit)
+
+async def get_cached_ai_assistant_response_async(request_product_id, question, key):
+    if ai_response_cache is None:
+        return await get_similar_ai_assistant_response_async(request_product_id, question, key)
+
+    with tracer.start_as_current_span("get_cached_ai_assistant_response") as span:
+
+        async def load_async():
+            started_at = time.monotonic()
+            response = await get_similar_ai_assistant_response_async(request_product_id, question, key)
+            return CachedAIResponse(response, time.monotonic() - started_at)
+
+        cached_response, cache_hit = await ai_response_cache.get_async(key, load_async)
+        return build_cached_ai_assistant_response(span, request_product_id, cached_response, cache_hit)
+
+def build_cached_ai_assistant_response(span, request_product_id, cached_response, cache_hit):
+    span.set_attribute("app.product.id", request_product_id)
+    span.set_attribute("app.ai_assistant.cache_hit", cache_hit)
+    if cache_hit:
+        product_review_svc_metrics["app_product_reviews_ai_cache_hits"].add(1)
+        product_review_svc_metrics["app_product_reviews_ai_cache_saved_time"].record(cached_response.latency)
+    else:
+        product_review_svc_metrics["app_product_reviews_ai_cache_misses"].add(1)
+    return cached_response.response
+
+def get_similar_ai_assistant_response(request_product_id, question, key):
+    """Returns the cached response to a similar question about the product, or asks the LLM."""
+    if semantic_cache is None:
+        return get_ai_assistant_response(request_product_id, question)
+
+    with tracer.start_as_current_span("get_similar_ai_assistant_response") as span:
+
+        span.set_attribute("app.product.id", request_product_id)
+
+        try:
+            embedding = embeddings_client.embeddings.create(model=embeddings_model, input=question).data[0].embedding
+        except Exception as e:
+            logger.warning(f"Could not embed the question, skipping the semantic cache: {e}")
+            return get_ai_assistant_response(request_product_id, question)
+
+        response, generation = lookup_similar_ai_assistant_response(span, key, embedding)
+        if response is None:
+            response = get_ai_assistant_response(request_product_id, question)
+            semantic_cache.add(generation, request_product_id, key[2], embedding, response)
+        return response
+
+async def get_similar_ai_assistant_response_async(request_product_id, question, key):
+    if semantic_cache is None:
+        return await get_ai_assistant_response_async(request_product_id, question)
+
+    with tracer.start_as_current_span("get_similar_ai_assistant_response") as span:
+
+        span.set_attribute("app.product.id", request_product_id)
+
+        try:
+            embedding = (await embeddings_async_client.embeddings.create(model=embeddings_model, input=question)).data[0].embedding
+        except Exception as e:
+            logger.warning(f"Could not embed the question, skipping the semantic cache: {e}")
+            return await get_ai_assistant_response_async(request_product_id, question)
+
+        response, generation = lookup_similar_ai_assistant_response(span, key, embedding)
+        if response is None:
+            response = await get_ai_assistant_response_async(request_product_id, question)
+            semantic_cache.add(generation, request_product_id, key[2], embedding, response)
+        return response
+
+def lookup_similar_ai_assistant_response(span, key, embedding):
+    started_at = time.monotonic()
+    response, similarity, generation = semantic_cache.lookup(key[0], key[2], embedding)
+    product_review_svc_metrics["app_product_reviews_semantic_cache_lookup_time"].record(time.monotonic() - started_at)
+
+    if similarity is not None:
+        span.set_attribute("app.ai_assistant.similarity", similarity)
+        product_review_svc_metrics["app_product_reviews_semantic_cache_similarity"].record(similarity)
+    span.set_attribute("app.ai_assistant.semantic_cache_hit", response is not None)
+    if response is not None:
+        product_review_svc_metrics["app_product_reviews_semantic_cache_hits"].add(1)
+    else:
+        product_review_svc_metrics["app_product_reviews_semantic_cache_misses"].add(1)
+    return response, generation
 
 def get_ai_assistant_response(request_product_id, question):
 
@@ -161,61 +669,27 @@ def get_ai_assistant_response(request_product_id, question):
         span.set_attribute("app.product.id", request_product_id)
         span.set_attribute("app.product.question", question)
 
-        llm_rate_limit_error = check_feature_flag("llmRateLimitError")
-        logger.info(f"llmRateLimitError feature flag: {llm_rate_limit_error}")
-        if llm_rate_limit_error:
-            random_number = random.random()
-            logger.info(f"Generated a random number: {str(random_number)}")
-            # return a rate limit error 50% of the time
-            if random_number < 0.5:
-
-                # ensure the mock LLM is always used, since we want to generate a 429 error
-                client = OpenAI(
-                    base_url=f"{llm_mock_url}",
-                    # The OpenAI API requires an api_key to be present, but
-                    # our LLM doesn't use it
-                    api_key=f"{llm_api_key}"
-                )
+        if use_llm_rate_limit_error():
 
-                user_prompt = f"Answer the following question about product ID:{request_product_id}: {question}"
-                messages = [
-                   {"role": "system", "content": "You are a helpful assistant that answers related to a specific product. Use tools as needed to fetch the product reviews and product information. Keep the response brief with no more than 1-2 sentences. If you don't know the answer, just say you don't know."},
-                   {"role": "user", "content": user_prompt}
-                ]
-                logger.info(f"Invoking mock LLM with model: astronomy-llm-rate-limit")
-
-                try:
-                    initial_response = client.chat.completions.create(
-                        model="astronomy-llm-rate-limit",
-                        messages=messages,
-                        tools=tools,
-                        tool_choice="auto"
-                    )
-                except Exception as e:
-                    logger.error(f"Caught Exception: {e}")
-                    # Record the exception
-                    span.record_exception(e)
-                    # Set the span status to ERROR
-                    span.set_status(Status(StatusCode.ERROR, description=str(e)))
-                    ai_assistant_response.response = "The system is unable to process your response. Please try again later."
-                    return ai_assistant_response
+            # ensure the mock LLM is always used, since we want to generate a 429 error
+            messages = build_ai_assistant_messages(request_product_id, question)
+            logger.info(f"Invoking mock LLM with model: astronomy-llm-rate-limit")
 
-        # otherwise, continue processing the request as normal
-        client = OpenAI(
-            base_url=f"{llm_base_url}",
-            # The OpenAI API requires an api_key to be present, but
-            # our LLM doesn't use it
-            api_key=f"{llm_api_key}"
-        )
+            try:
+                initial_response = llm_mock_client.chat.completions.create(
+                    model="astronomy-llm-rate-limit",
+                    messages=messages,
+                    tools=tools,
+                    tool_choice="auto"
+                )
+            except Exception as e:
+                return build_ai_assistant_error_response(span, e)
 
-        user_prompt = f"Answer the following question about product ID:{request_product_id}: {question}"
-        messages = [
-           {"role": "system", "content": "You are a helpful assistant that answers related to a specific product. Use tools as needed to fetch the product reviews and product information. Keep the response brief with no more than 1-2 sentences. If you don't know the answer, just say you don't know."},
-           {"role": "user", "content": user_prompt}
-        ]
+        # otherwise, continue processing the request as normal
+        messages = build_ai_assistant_messages(request_product_id, question)
 
         # use the LLM to summarize the product reviews
-        initial_response = client.chat.completions.create(
+        initial_response = llm_client.chat.completions.create(
             model=llm_model,
             messages=messages,
             tools=tools,
@@ -234,62 +708,96 @@ def get_ai_assistant_response(request_product_id, question):
             # Append the assistant's message with tool calls
             messages.append(response_message)
 
-            # Process all tool calls
-            for tool_call in tool_calls:
-                function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
-
-                logger.info(f"Processing tool call: '{function_name}' with arguments: {function_args}")
-
-                if function_name == "fetch_product_reviews":
-                    function_response = fetch_product_reviews(
-                        product_id=function_args.get("product_id")
-                    )
-                    logger.info(f"Function response for fetch_product_reviews: '{function_response}'")
-
-                elif function_name == "fetch_product_info":
-                    function_response = fetch_product_info(
-                        product_id=function_args.get("product_id")
-                    )
-                    logger.info(f"Function response for fetch_product_info: '{function_response}'")
-
-                else:
-                    raise Exception(f'Received unexpected tool call request: {function_name}')
-
-                # Append the tool response
-                messages.append(
-                    {
-                        "tool_call_id": tool_call.id,
-                        "role": "tool",
-                        "name": function_name,
-                        "content": function_response,
-                    }
-                )
+            # Process all tool calls concurrently, their messages are
+            # appended in the order of the calls
+            function_calls = [parse_tool_call(tool_call) for tool_call in tool_calls]
+            function_responses = tool_registry.run(function_calls)
+            for tool_call, (function_name, _), function_response in zip(tool_calls, function_calls, function_responses):
+                messages.append(build_tool_message(tool_call, function_name, function_response))
 
-            llm_inaccurate_response = check_feature_flag("llmInaccurateResponse")
-            logger.info(f"llmInaccurateResponse feature flag: {llm_inaccurate_response}")
+            messages.append(build_final_user_message(request_product_id))
 
-            if llm_inaccurate_response and request_product_id == "L9ECAV7KIM":
-                logger.info(f"Returning an inaccurate response for product_id: {request_product_id}")
-                # Add a final user message to ask the LLM to return an inaccurate response
-                messages.append(
-                    {
-                        "role": "user",
-                        "content": f"Based on the tool results, answer the original question about product ID, but make the answer inaccurate:{request_product_id}. Keep the response brief with no more than 1-2 sentences."
-                    }
-                )
-            else:
-                # Add a final user message to guide the LLM to synthesize the response
-                messages.append(
-                    {
-                        "role": "user",
-                        "content": f"Based on the tool results, answer the original question about product ID:{request_product_id}. Keep the response brief with no more than 1-2 sentences."
-                    }
+            logger.info(f"Invoking the LLM with the following messages: '{messages}'")
+
+            final_response = llm_client.chat.completions.create(
+                model=llm_model,
+                messages=messages
+            )
+
+            result = final_response.choices[0].message.content
+
+            ai_assistant_response.response = result
+
+            logger.info(f"Returning an AI assistant response: '{result}'")
+
+        else:
+            logger.info(f"Returning an AI assistant response: '{response_message}'")
+            ai_assistant_response.response = response_message.content
+
+        # Collect metrics for this service
+        product_review_svc_metrics["app_ai_assistant_counter"].add(1, {'product.id': request_product_id})
+
+        return ai_assistant_response
+
+async def get_ai_assistant_response_async(request_product_id, question):
+
+    with tracer.start_as_current_span("get_ai_assistant_response") as span:
+
+        ai_assistant_response = demo_pb2.AskProductAIAssistantResponse()
+
+        span.set_attribute("app.product.id", request_product_id)
+        span.set_attribute("app.product.question", question)
+
+        if use_llm_rate_limit_error():
+
+            # ensure the mock LLM is always used, since we want to generate a 429 error
+            messages = build_ai_assistant_messages(request_product_id, question)
+            logger.info(f"Invoking mock LLM with model: astronomy-llm-rate-limit")
+
+            try:
+                initial_response = await llm_mock_async_client.chat.completions.create(
+                    model="astronomy-llm-rate-limit",
+                    messages=messages,
+                    tools=tools,
+                    tool_choice="auto"
                 )
+            except Exception as e:
+                return build_ai_assistant_error_response(span, e)
+
+        messages = build_ai_assistant_messages(request_product_id, question)
+
+        # use the LLM to summarize the product reviews
+        initial_response = await llm_async_client.chat.completions.create(
+            model=llm_model,
+            messages=messages,
+            tools=tools,
+            tool_choice="auto"
+        )
+
+        response_message = initial_response.choices[0].message
+        tool_calls = response_message.tool_calls
+
+        logger.info(f"Response message: {response_message}")
+
+        # Check if the model wants to call a tool
+        if tool_calls:
+            logger.info(f"Model wants to call {len(tool_calls)} tool(s)")
+
+            # Append the assistant's message with tool calls
+            messages.append(response_message)
+
+            # Process all tool calls concurrently, their messages are
+            # appended in the order of the calls
+            function_calls = [parse_tool_call(tool_call) for tool_call in tool_calls]
+            function_responses = await async_tool_registry.run(function_calls)
+            for tool_call, (function_name, _), function_response in zip(tool_calls, function_calls, function_responses):
+                messages.append(build_tool_message(tool_call, function_name, function_response))
+
+            messages.append(build_final_user_message(request_product_id))
 
             logger.info(f"Invoking the LLM with the following messages: '{messages}'")
 
-            final_response = client.chat.completions.create(
+            final_response = await llm_async_client.chat.completions.create(
                 model=llm_model,
                 messages=messages
             )
@@ -309,15 +817,196 @@ def get_ai_assistant_response(request_product_id, question):
 
         return ai_assistant_response
 
-def fetch_product_info(product_id):
+def use_llm_rate_limit_error():
+    llm_rate_limit_error = check_feature_flag("llmRateLimitError")
+    logger.info(f"llmRateLimitError feature flag: {llm_rate_limit_error}")
+    if not llm_rate_limit_error:
+        return False
+
+    random_number = random.random()
+    logger.info(f"Generated a random number: {str(random_number)}")
+    # return a rate limit error 50% of the time
+    return random_number < 0.5
+
+def build_ai_assistant_messages(request_product_id, question):
+    user_prompt = f"Answer the following question about product ID:{request_product_id}: {question}"
+    return [
+       {"role": "system", "content": "You are a helpful assistant that answers related to a specific product. Use tools as needed to fetch the product reviews and product information. Keep the response brief with no more than 1-2 sentences. If you don't know the answer, just say you don't know."},
+       {"role": "user", "content": user_prompt}
+    ]
+
+def build_ai_assistant_error_response(span, e):
+    logger.error(f"Caught Exception: {e}")
+    # Record the exception
+    span.record_exception(e)
+    # Set the span status to ERROR
+    span.set_status(Status(StatusCode.ERROR, description=str(e)))
+    return demo_pb2.AskProductAIAssistantResponse(
+        response="The system is unable to process your response. Please try again later.")
+
+def parse_tool_call(tool_call):
+    function_name = tool_call.function.name
+    function_args = json.loads(tool_call.function.arguments)
+
+    logger.info(f"Processing tool call: '{function_name}' with arguments: {function_args}")
+
+    return function_name, function_args
+
+def build_tool_message(tool_call, function_name, function_response):
+    logger.info(f"Function response for {function_name}: '{function_response}'")
+
+    return {
+        "tool_call_id": tool_call.id,
+        "role": "tool",
+        "name": function_name,
+        "content": function_response,
+    }
+
+def build_final_user_message(request_product_id):
+    llm_inaccurate_response = check_feature_flag("llmInaccurateResponse")
+    logger.info(f"llmInaccurateResponse feature flag: {llm_inaccurate_response}")
+
+    if llm_inaccurate_response and request_product_id == "L9ECAV7KIM":
+        logger.info(f"Returning an inaccurate response for product_id: {request_product_id}")
+        # Add a final user message to ask the LLM to return an inaccurate response
+        return {
+            "role": "user",
+            "content": f"Based on the tool results, answer the original question about product ID, but make the answer inaccurate:{request_product_id}. Keep the response brief with no more than 1-2 sentences."
+        }
+
+    # Add a final user message to guide the LLM to synthesize the response
+    return {
+        "role": "user",
+        "content": f"Based on the tool results, answer the original question about product ID:{request_product_id}. Keep the response brief with no more than 1-2 sentences."
+    }
+
+def fetch_product_info(product_id, timeout=None):
     try:
-        product = product_catalog_stub.GetProduct(demo_pb2.GetProductRequest(id=product_id))
+        product = product_catalog_stub.GetProduct(demo_pb2.GetProductRequest(id=product_id), timeout=timeout)
         logger.info(f"product_catalog_stub.GetProduct returned: '{product}'")
         json_str = MessageToJson(product)
         return json_str
     except Exception as e:
         return json.dumps({"error": str(e)})
 
+async def fetch_product_info_async(product_id, timeout=None):
+    try:
+        product = await product_catalog_async_stub.GetProduct(demo_pb2.GetProductRequest(id=product_id), timeout=timeout)
+        logger.info(f"product_catalog_async_stub.GetProduct returned: '{product}'")
+        json_str = MessageToJson(product)
+        return json_str
+    except Exception as e:
+        return json.dumps({"error": str(e)})
+
+def register_tools(registry, fetch_reviews, fetch_info):
+    registry.register(
+        "fetch_product_reviews",
+        lambda function_args, timeout: fetch_reviews(product_id=function_args.get("product_id")),
+        fetch_product_reviews_timeout)
+    registry.register(
+        "fetch_product_info",
+        # The catalog call gives up when the tool call times out
+        lambda function_args, timeout: fetch_info(product_id=function_args.get("product_id"), timeout=timeout),
+        fetch_product_info_timeout)
+    return registry
+
+def serve(port, max_workers, max_concurrent_rpcs):
+    global llm_client, llm_mock_client, embeddings_client, tool_registry
+
+    # Reviews are read through a pool of database connections
+    init_connection_pool(product_review_svc_metrics)
+    llm_client = llm_clients.get(llm_base_url)
+    llm_mock_client = llm_clients.get(llm_mock_url)
+    embeddings_client = llm_clients.get(embeddings_base_url)
+    tool_registry = register_tools(
+        ToolRegistry(tool_call_workers, tracer, product_review_svc_metrics),
+        fetch_product_reviews, fetch_product_info)
+
+    # Create gRPC server, with admission control in front of the workers
+    admission = AdmissionControl(max_workers, max_concurrent_rpcs, product_review_svc_metrics, 'app_product_reviews')
+    server = admission.server(options=prefork.SERVER_OPTIONS)
+
+    # Add class to gRPC server
+    service = ProductReviewService()
+    add_product_review_service(service, server)
+    health_pb2_grpc.add_HealthServicer_to_server(service, server)
+
+    # Start server
+    server.add_insecure_port(f'[::]:{port}')
+    server.start()
+    logger.info(f'Product reviews service started, listening on port {port}')
+    server.wait_for_termination()
+
+async def serve_async(port, catalog_addr, max_running_rpcs, max_concurrent_rpcs):
+    global product_catalog_async_stub, llm_async_client, llm_mock_async_client, embeddings_async_client, async_tool_registry
+
+    # The pool, channel and LLM clients must be created on the running event loop
+    await init_async_connection_pool(product_review_svc_metrics)
+    pc_async_channel = grpc.aio.insecure_channel(catalog_addr)
+    product_catalog_async_stub = demo_pb2_grpc.ProductCatalogServiceStub(pc_async_channel)
+    llm_async_client = llm_clients.get_async(llm_base_url)
+    llm_mock_async_client = llm_clients.get_async(llm_mock_url)
+    embeddings_async_client = llm_clients.get_async(embeddings_base_url)
+    async_tool_registry = register_tools(
+        AsyncToolRegistry(tool_call_workers, tracer, product_review_svc_metrics),
+        fetch_product_reviews_async, fetch_product_info_async)
+
+    # Create gRPC asyncio server, with admission control in front of the
+    # event loop
+    admission = AsyncAdmissionControl(max_running_rpcs, max_concurrent_rpcs, product_review_svc_metrics, 'app_product_reviews')
+    server = admission.server(options=prefork.SERVER_OPTIONS)
+
+    # Add class to gRPC server
+    service = AsyncProductReviewService()
+    add_product_review_service(service, server)
+    health_pb2_grpc.add_HealthServicer_to_server(service, server)
+
+    # Start server
+    server.add_insecure_port(f'[::]:{port}')
+    await server.start()
+    logger.info(f'Product reviews service started in async mode, listening on port {port}')
+    await server.wait_for_termination()
+
+def add_product_review_service(service, server):
+    # GetProductReviews returns already serialized responses, so instead of
+    # the generated handler, one handler with a pass-through serializer for
+    # it owns every method of the service
+    rpc_method_handlers = {
+        'GetProductReviews': grpc.unary_unary_rpc_method_handler(
+            service.GetProductReviews,
+            request_deserializer=demo_pb2.GetProductReviewsRequest.FromString,
+            response_serializer=lambda response_bytes: response_bytes),
+        'GetAverageProductReviewScore': grpc.unary_unary_rpc_method_handler(
+            service.GetAverageProductReviewScore,
+            request_deserializer=demo_pb2.GetAverageProductReviewScoreRequest.FromString,
+            response_serializer=demo_pb2.GetAverageProductReviewScoreResponse.SerializeToString),
+        'AskProductAIAssistant': grpc.unary_unary_rpc_method_handler(
+            service.AskProductAIAssistant,
+            request_deserializer=demo_pb2.AskProductAIAssistantRequest.FromString,
+            response_serializer=demo_pb2.AskProductAIAssistantResponse.SerializeToString),
+        'GetProductReviewScoreHistogram': grpc.unary_unary_rpc_method_handler(
+            service.GetProductReviewScoreHistogram,
+            request_deserializer=demo_pb2.GetProductReviewScoreHistogramRequest.FromString,
+            response_serializer=demo_pb2.GetProductReviewScoreHistogramResponse.SerializeToString),
+        'GetProductReviewsBatch': grpc.unary_unary_rpc_method_handler(
+            service.GetProductReviewsBatch,
+            request_deserializer=demo_pb2.GetProductReviewsBatchRequest.FromString,
+            response_serializer=demo_pb2.GetProductReviewsBatchResponse.SerializeToString),
+        'GetAverageScoresBatch': grpc.unary_unary_rpc_method_handler(
+            service.GetAverageScoresBatch,
+            request_deserializer=demo_pb2.GetAverageScoresBatchRequest.FromString,
+            response_serializer=demo_pb2.GetAverageScoresBatchResponse.SerializeToString),
+        'GetProductReviewsPage': grpc.unary_unary_rpc_method_handler(
+            service.GetProductReviewsPage,
+            request_deserializer=demo_pb2.GetProductReviewsPageRequest.FromString,
+            response_serializer=demo_pb2.GetProductReviewsPageResponse.SerializeToString),
+        'StreamProductReviews': grpc.unary_stream_rpc_method_handler(
+            service.StreamProductReviews,
+            request_deserializer=demo_pb2.StreamProductReviewsRequest.FromString,
+            response_serializer=demo_pb2.ProductReview.SerializeToString),
+    }
+    server.add_generic_rpc_handlers((grpc.method_handlers_generic_handler('oteldemo.ProductReviewService', rpc_method_handlers),))
+
 def must_map_env(key: str):
     value = os.environ.get(key)
     if value is None:
@@ -325,20 +1014,29 @@ def must_map_env(key: str):
     return value
 
 def check_feature_flag(flag_name: str):
-    # Initialize OpenFeature
-    client = api.get_client()
-    return client.get_boolean_value(flag_name, False)
+    value = flag_cache.get(flag_name)
+    # The TracingHook records the evaluations of the flag cache's refresh
+    # thread, which has no request span, so the value used is recorded here
+    trace.get_current_span().add_event("feature_flag.evaluation", {
+        "feature_flag.key": flag_name,
+        "feature_flag.result.value": json.dumps(value),
+        "feature_flag.result.reason": "cached",
+    })
+    return value
 
 if __name__ == "__main__":
     service_name = must_map_env('OTEL_SERVICE_NAME')
 
-    api.set_provider(FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
-
     # Initialize Traces and Metrics
     tracer = trace.get_tracer_provider().get_tracer(service_name)
     meter = metrics.get_meter_provider().get_meter(service_name)
 
-    product_review_svc_metrics = init_metrics(meter)
+    # Flags are evaluated in the background and read from memory on requests
+    flag_cache = FlagCache(
+        ["llmRateLimitError", "llmInaccurateResponse"],
+        float(os.environ.get('PRODUCT_REVIEWS_FLAG_REFRESH_INTERVAL', 5)))
+
+    product_review_svc_metrics = init_metrics(meter, flag_cache)
 
     # Initialize Logs
     logger_provider = LoggerProvider(
@@ -357,13 +1055,44 @@ if __name__ == "__main__":
     logger = logging.getLogger('main')
     logger.addHandler(handler)
 
-    # Create gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    # Pending schema migrations are applied once, before any worker starts
+    if os.environ.get('PRODUCT_REVIEWS_DB_MIGRATIONS', 'true') == 'true':
+        apply_schema_migrations(float(os.environ.get('PRODUCT_REVIEWS_DB_MIGRATION_TIMEOUT', 60)))
 
-    # Add class to gRPC server
-    service = ProductReviewService()
-    demo_pb2_grpc.add_ProductReviewServiceServicer_to_server(service, server)
-    health_pb2_grpc.add_HealthServicer_to_server(service, server)
+    # In pre-fork mode this process only supervises the worker processes,
+    # which run everything below
+    if os.environ.get('PRODUCT_REVIEWS_PREFORK', 'false') == 'true' and not prefork.is_worker():
+        prefork.supervise(int(os.environ.get('PRODUCT_REVIEWS_WORKERS', 0)) or prefork.cpu_quota_workers())
+        sys.exit()
+
+    api.set_provider(FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
+    flag_cache.start(product_review_svc_metrics["app_product_reviews_flag_evaluation_duration"])
+
+    # Reviews are cached in memory and concurrent lookups batched, in both
+    # server modes
+    # AI assistant responses are cached per product and question, and dropped
+    # with the other cached data of a product when its reviews change
+    ai_response_cache_size = int(os.environ.get('PRODUCT_REVIEWS_AI_CACHE_SIZE', 1000))
+    ai_response_cache_ttl = float(os.environ.get('PRODUCT_REVIEWS_AI_CACHE_TTL', 300))
+    if ai_response_cache_size > 0:
+        ai_response_cache = AIResponseCache(ai_response_cache_size, ai_response_cache_ttl)
+    # Responses to similar questions are found by comparing embeddings
+    if os.environ.get('PRODUCT_REVIEWS_SEMANTIC_CACHE', 'false') == 'true':
+        semantic_cache = SemanticCache(
+            float(os.environ.get('PRODUCT_REVIEWS_SEMANTIC_CACHE_THRESHOLD', 0.9)),
+            int(os.environ.get('PRODUCT_REVIEWS_SEMANTIC_CACHE_PRODUCTS', 100)),
+            int(os.environ.get('PRODUCT_REVIEWS_SEMANTIC_CACHE_ENTRIES_PER_PRODUCT', 32)),
+            ai_response_cache_ttl)
+    if os.environ.get('PRODUCT_REVIEWS_AI_SINGLE_FLIGHT', 'true') == 'true':
+        ai_single_flight = SingleFlight()
+        ai_single_flight_async = AsyncSingleFlight(on_cancel=record_ai_single_flight_cancelled)
+    init_review_cache(
+        int(os.environ.get('PRODUCT_REVIEWS_CACHE_SIZE', 1000)),
+        [cache for cache in (ai_response_cache, semantic_cache) if cache is not None])
+    init_batch_loaders(
+        float(os.environ.get('PRODUCT_REVIEWS_BATCH_WINDOW', 0.002)),
+        int(os.environ.get('PRODUCT_REVIEWS_BATCH_MAX_SIZE', 50)),
+        product_review_svc_metrics)
 
     llm_host = must_map_env('LLM_HOST')
     llm_port = must_map_env('LLM_PORT')
@@ -371,14 +1100,39 @@ if __name__ == "__main__":
     llm_base_url = must_map_env('LLM_BASE_URL')
     llm_api_key = must_map_env('OPENAI_API_KEY')
     llm_model = must_map_env('LLM_MODEL')
+    # The mock LLM also serves embeddings
+    embeddings_base_url = os.environ.get('PRODUCT_REVIEWS_EMBEDDINGS_BASE_URL', llm_mock_url)
+    embeddings_model = os.environ.get('PRODUCT_REVIEWS_EMBEDDINGS_MODEL', 'astronomy-embeddings')
+
+    # LLM calls share one client per base URL, which keeps its connections
+    # alive between calls
+    llm_clients = LLMClients(
+        llm_api_key,
+        max_connections=int(os.environ.get('PRODUCT_REVIEWS_LLM_MAX_CONNECTIONS', 20)),
+        max_keepalive_connections=int(os.environ.get('PRODUCT_REVIEWS_LLM_MAX_KEEPALIVE_CONNECTIONS', 10)),
+        keepalive_expiry=float(os.environ.get('PRODUCT_REVIEWS_LLM_KEEPALIVE_EXPIRY', 30)),
+        connect_timeout=float(os.environ.get('PRODUCT_REVIEWS_LLM_CONNECT_TIMEOUT', 5)),
+        read_timeout=float(os.environ.get('PRODUCT_REVIEWS_LLM_READ_TIMEOUT', 60)),
+        pool_timeout=float(os.environ.get('PRODUCT_REVIEWS_LLM_POOL_TIMEOUT', 10)),
+        max_retries=int(os.environ.get('PRODUCT_REVIEWS_LLM_MAX_RETRIES', 2)),
+        metrics=product_review_svc_metrics)
+
+    # Tool calls requested together by the LLM run concurrently, each one
+    # bounded by the timeout of its tool
+    tool_call_workers = int(os.environ.get('PRODUCT_REVIEWS_TOOL_CALL_WORKERS', 10))
+    fetch_product_reviews_timeout = float(os.environ.get('PRODUCT_REVIEWS_FETCH_PRODUCT_REVIEWS_TIMEOUT', 5))
+    fetch_product_info_timeout = float(os.environ.get('PRODUCT_REVIEWS_FETCH_PRODUCT_INFO_TIMEOUT', 5))
 
     catalog_addr = must_map_env('PRODUCT_CATALOG_ADDR')
     pc_channel = grpc.insecure_channel(catalog_addr)
     product_catalog_stub = demo_pb2_grpc.ProductCatalogServiceStub(pc_channel)
 
-    # Start server
+    server_mode = os.environ.get('PRODUCT_REVIEWS_SERVER_MODE', 'threaded')
     port = must_map_env('PRODUCT_REVIEWS_PORT')
-    server.add_insecure_port(f'[::]:{port}')
-    server.start()
-    logger.info(f'Product reviews service started, listening on port {port}')
-    server.wait_for_termination()
+    max_concurrent_rpcs = int(os.environ.get('PRODUCT_REVIEWS_MAX_CONCURRENT_RPCS', 100))
+    if server_mode == 'threaded':
+        serve(port, int(os.environ.get('PRODUCT_REVIEWS_MAX_WORKERS', 10)), max_concurrent_rpcs)
+    elif server_mode == 'async':
+        asyncio.run(serve_async(port, catalog_addr, int(os.environ.get('PRODUCT_REVIEWS_MAX_RUNNING_RPCS', 50)), max_concurrent_rpcs))
+    else:
+        raise Exception(f'Unsupported PRODUCT_REVIEWS_SERVER_MODE: {server_mode}')
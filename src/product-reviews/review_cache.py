@@ -0,0 +1,201 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import logging
+import select
+import threading
+import time
+from collections import OrderedDict
+
+# Postgres
+import psycopg2
+
+logger = logging.getLogger('main')
+
+# Channel notified by the reviews.productreviews trigger in init.sql, with the
+# changed product id as payload, or an empty payload when all products changed
+CHANNEL = 'productreviews_changed'
+
+# Delay before reconnecting after the listening connection failed
+RECONNECT_DELAY = 5.0
+
+
+class CachedReviews:
+    """The reviews of one product, as rows and as a serialized GetProductReviewsResponse."""
+
+    __slots__ = ('rows', 'response_bytes')
+
+    def __init__(self, rows, response_bytes):
+        self.rows = rows
+        self.response_bytes = response_bytes
+
+
+class ReviewStats:
+    """Review count, score sum and reviews per star rating of one product."""
+
+    __slots__ = ('review_count', 'score_sum', 'star_counts')
+
+    def __init__(self, review_count, score_sum, star_counts):
+        self.review_count = review_count
+        self.score_sum = score_sum
+        self.star_counts = star_counts
+
+    def average_score(self):
+        """Returns the average score rounded to 1 decimal place, or an empty string without reviews."""
+        if self.review_count == 0:
+            return ""
+        return f"{self.score_sum / self.review_count:.1f}"
+
+
+class ReviewCache:
+    """Bounded LRU read-through cache of review data per product.
+
+    Entries are only served while a ReviewChangeListener is connected, so a
+    missed change notification can never leave a stale entry behind. A load
+    that overlaps with an invalidation is returned but not cached.
+    """
+
+    def __init__(self, max_entries):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._listening = False
+
+    def get(self, product_id, load):
+        """Returns (entry, hit), calling load(product_id) to build missing entries."""
+        entry, generation = self._lookup(product_id)
+        if entry is not None:
+            return entry, True
+
+        entry = load(product_id)
+        self._put(generation, {product_id: entry})
+        return entry, False
+
+    async def get_async(self, product_id, load_async):
+        """Returns (entry, hit), awaiting load_async(product_id) to build missing entries."""
+        entry, generation = self._lookup(product_id)
+        if entry is not None:
+            return entry, True
+
+        entry = await load_async(product_id)
+        self._put(generation, {product_id: entry})
+        return entry, False
+
+    def get_many(self, product_ids, load_many):
+        """Returns ({product_id: entry}, hits), calling load_many(product_ids) once for all missing entries."""
+        entries, generation = self._lookup_many(product_ids)
+        hits = len(entries)
+
+        missing = [product_id for product_id in product_ids if product_id not in entries]
+        if missing:
+            loaded = load_many(missing)
+            self._put(generation, loaded)
+            entries.update(loaded)
+        return entries, hits
+
+    async def get_many_async(self, product_ids, load_many_async):
+        """Returns ({product_id: entry}, hits), awaiting load_many_async(product_ids) once for all missing entries."""
+        entries, generation = self._lookup_many(product_ids)
+        hits = len(entries)
+
+        missing = [product_id for product_id in product_ids if product_id not in entries]
+        if missing:
+            loaded = await load_many_async(missing)
+            self._put(generation, loaded)
+            entries.update(loaded)
+        return entries, hits
+
+    def _lookup(self, product_id):
+        with self._lock:
+            entry = self._entries.get(product_id) if self._listening else None
+            if entry is not None:
+                self._entries.move_to_end(product_id)
+            return entry, self._generation
+
+    def _lookup_many(self, product_ids):
+        entries = {}
+        with self._lock:
+            if self._listening:
+                for product_id in product_ids:
+                    entry = self._entries.get(product_id)
+                    if entry is not None:
+                        self._entries.move_to_end(product_id)
+                        entries[product_id] = entry
+            return entries, self._generation
+
+    def _put(self, generation, entries):
+        with self._lock:
+            if not self._listening or generation != self._generation:
+                return
+            for product_id, entry in entries.items():
+                self._entries[product_id] = entry
+                self._entries.move_to_end(product_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, product_id):
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(product_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def set_listening(self, listening):
+        # Changes may have been missed while nobody was listening
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._listening = listening
+
+
+class ReviewChangeListener:
+    """Invalidates ReviewCache entries on Postgres notifications about changed reviews."""
+
+    def __init__(self, dsn, caches):
+        self._dsn = dsn
+        self._caches = caches
+        self._thread = threading.Thread(
+            target=self._listen_loop, name='review-change-listener', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _listen_loop(self):
+        while True:
+            connection = None
+            try:
+                connection = psycopg2.connect(self._dsn)
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                for cache in self._caches:
+                    cache.set_listening(True)
+                logger.info(f"Listening for review changes on {CHANNEL}")
+                self._dispatch_notifications(connection)
+            except Exception as e:
+                logger.warning(f"Review change listener failed, bypassing the review cache: {e}")
+            finally:
+                for cache in self._caches:
+                    cache.set_listening(False)
+                if connection is not None:
+                    connection.close()
+            time.sleep(RECONNECT_DELAY)
+
+    def _dispatch_notifications(self, connection):
+        while True:
+            select.select([connection], [], [], 60)
+            connection.poll()
+            while connection.notifies:
+                product_id = connection.notifies.pop(0).payload
+                for cache in self._caches:
+                    if product_id:
+                        cache.invalidate(product_id)
+                    else:
+                        cache.clear()
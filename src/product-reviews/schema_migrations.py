@@ -0,0 +1,85 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import logging
+import os
+
+# Postgres
+import psycopg2
+import psycopg2.errors
+
+logger = logging.getLogger('main')
+
+# Versioned SQL files named <version>_<description>.sql, applied in order
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+
+# Serializes service instances that start at the same time
+MIGRATION_LOCK_ID = 7342861
+
+MIGRATIONS_TABLE = 'reviews.schema_migrations'
+
+
+def load_migrations(migrations_dir=MIGRATIONS_DIR):
+    """Returns (version, sql) pairs for the migration files, ordered by version."""
+    migrations = []
+    for file_name in sorted(os.listdir(migrations_dir)):
+        if file_name.endswith('.sql'):
+            with open(os.path.join(migrations_dir, file_name)) as migration_file:
+                migrations.append((file_name.split('_', 1)[0], migration_file.read()))
+    return migrations
+
+
+def run_migrations(dsn, migrations_dir=MIGRATIONS_DIR):
+    """Applies the migrations that were not applied to the database yet.
+
+    Applied versions are recorded in MIGRATIONS_TABLE together with the
+    migration itself, so a restart against an up to date database only costs
+    one query. Returns the versions that were applied.
+
+    Only the owner of the schema may change it, so when the connection is
+    not allowed to, the remaining migrations are skipped with a warning.
+    """
+    migrations = load_migrations(migrations_dir)
+    applied = []
+    connection = psycopg2.connect(dsn)
+    try:
+        if not _pending(connection, migrations):
+            return applied
+
+        # The session lock is released when the connection is closed
+        with connection:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID, ))
+                cursor.execute(
+                    f"CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} ("
+                    "version VARCHAR(16) PRIMARY KEY, applied_at TIMESTAMPTZ NOT NULL DEFAULT now())")
+
+        # Another instance may have applied them while we waited for the lock.
+        # Each migration is committed together with its version.
+        for version, sql in _pending(connection, migrations):
+            with connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(sql)
+                    cursor.execute(f"INSERT INTO {MIGRATIONS_TABLE} (version) VALUES (%s)", (version, ))
+            logger.info(f"Applied schema migration {version}")
+            applied.append(version)
+        return applied
+    except psycopg2.errors.InsufficientPrivilege as e:
+        logger.warning(f"Skipped schema migrations, the database user may not change the schema: {e}")
+        return applied
+    finally:
+        connection.close()
+
+
+def _pending(connection, migrations):
+    with connection:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s)", (MIGRATIONS_TABLE, ))
+            if cursor.fetchone()[0] is None:
+                return migrations
+            cursor.execute(f"SELECT version FROM {MIGRATIONS_TABLE}")
+            applied = {row[0] for row in cursor.fetchall()}
+    return [(version, sql) for version, sql in migrations if version not in applied]
@@ -0,0 +1,152 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import threading
+import time
+from collections import OrderedDict
+
+# Pip
+import numpy as np
+
+# Rows allocated for the embeddings of a product at first, doubled as needed
+INITIAL_CAPACITY = 4
+
+
+class _VectorIndex:
+    """Normalized embeddings of up to `max_entries` questions and their cached entries.
+
+    Once full, the oldest entry is replaced first.
+    """
+
+    __slots__ = ('max_entries', 'vectors', 'expires_at', 'entries', 'size', 'next_slot')
+
+    def __init__(self, max_entries, dimensions):
+        capacity = min(INITIAL_CAPACITY, max_entries)
+        self.max_entries = max_entries
+        self.vectors = np.zeros((capacity, dimensions), dtype=np.float32)
+        self.expires_at = np.zeros(capacity)
+        self.entries = [None] * capacity
+        self.size = 0
+        self.next_slot = 0
+
+    def search(self, vector, now):
+        """Returns (slot, similarity) of the most similar unexpired embedding, or (None, None)."""
+        similarities = self.vectors[:self.size] @ vector
+        similarities[self.expires_at[:self.size] <= now] = -np.inf
+        if similarities.size == 0:
+            return None, None
+        slot = int(np.argmax(similarities))
+        similarity = float(similarities[slot])
+        return (None, None) if similarity == -np.inf else (slot, similarity)
+
+    def add(self, vector, entry, expires_at):
+        if self.size < self.max_entries:
+            if self.size == len(self.entries):
+                self._grow()
+            slot = self.size
+            self.size += 1
+        else:
+            slot = self.next_slot
+            self.next_slot = (slot + 1) % self.max_entries
+        self.vectors[slot] = vector
+        self.expires_at[slot] = expires_at
+        self.entries[slot] = entry
+
+    def _grow(self):
+        capacity = min(len(self.entries) * 2, self.max_entries)
+        vectors = np.zeros((capacity, self.vectors.shape[1]), dtype=np.float32)
+        vectors[:self.size] = self.vectors
+        expires_at = np.zeros(capacity)
+        expires_at[:self.size] = self.expires_at
+        self.vectors = vectors
+        self.expires_at = expires_at
+        self.entries.extend([None] * (capacity - self.size))
+
+
+class SemanticCache:
+    """In-memory vector index of AI assistant responses per product.
+
+    A lookup compares the embedding of a question with the embeddings of the
+    questions cached for the product with one matrix-vector product, and
+    returns the entry of the most similar one when the cosine similarity
+    reaches `threshold`. Each product keeps at most `max_entries_per_product`
+    entries, at most `max_products` products are kept, the least recently
+    used ones evicted first, and entries expire after `ttl` seconds. Entries
+    are cached separately per `variant` of the response.
+
+    As with ReviewCache, the entries of a product are dropped when a
+    ReviewChangeListener reports that its reviews changed, entries are only
+    served while the listener is connected, and an entry built while an
+    invalidation happened is not cached.
+    """
+
+    def __init__(self, threshold, max_products, max_entries_per_product, ttl):
+        self._threshold = threshold
+        self._max_products = max_products
+        self._max_entries_per_product = max_entries_per_product
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # product_id -> {variant: _VectorIndex}, the most recently used last
+        self._indexes = OrderedDict()
+        self._generation = 0
+        self._listening = False
+
+    def lookup(self, product_id, variant, embedding):
+        """Returns (entry, similarity, generation), the entry being None below the threshold.
+
+        The similarity is the one of the most similar cached question, or None
+        without any, and the generation is passed on to add().
+        """
+        vector = _normalize(embedding)
+        with self._lock:
+            indexes = self._indexes.get(product_id) if self._listening else None
+            index = None if indexes is None else indexes.get(variant)
+            if index is None or index.vectors.shape[1] != vector.shape[0]:
+                return None, None, self._generation
+
+            self._indexes.move_to_end(product_id)
+            slot, similarity = index.search(vector, time.monotonic())
+            if slot is None or similarity < self._threshold:
+                return None, similarity, self._generation
+            return index.entries[slot], similarity, self._generation
+
+    def add(self, generation, product_id, variant, embedding, entry):
+        vector = _normalize(embedding)
+        with self._lock:
+            if not self._listening or generation != self._generation:
+                return
+            indexes = self._indexes.setdefault(product_id, {})
+            self._indexes.move_to_end(product_id)
+            index = indexes.get(variant)
+            # The embedding model may have changed
+            if index is None or index.vectors.shape[1] != vector.shape[0]:
+                index = indexes[variant] = _VectorIndex(self._max_entries_per_product, vector.shape[0])
+            index.add(vector, entry, time.monotonic() + self._ttl)
+            while len(self._indexes) > self._max_products:
+                self._indexes.popitem(last=False)
+
+    def invalidate(self, product_id):
+        with self._lock:
+            self._generation += 1
+            self._indexes.pop(product_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._indexes.clear()
+
+    def set_listening(self, listening):
+        # Changes may have been missed while nobody was listening
+        with self._lock:
+            self._generation += 1
+            self._indexes.clear()
+            self._listening = listening
+
+
+def _normalize(embedding):
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
@@ -0,0 +1,101 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one in-flight call."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, timeout=None):
+        """Returns a tuple of (result, coalesced).
+
+        The first caller for `key` runs `fn`; callers arriving while it is in
+        flight wait up to `timeout` seconds for and share its result or
+        exception.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+
+        if not leader:
+            return call.result(timeout), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class _AsyncCall:
+
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent coroutine calls for the same key into one task.
+
+    The shared call runs as its own task, so a waiter that is cancelled or
+    times out does not cancel it for the others. The task is only cancelled
+    once every waiter is gone, calling `on_cancel` if given, and later calls
+    with the key then start a new one.
+    """
+
+    def __init__(self, on_cancel=None):
+        self._calls = {}
+        self._on_cancel = on_cancel
+
+    async def do(self, key, coroutine_fn, timeout=None):
+        """Returns a tuple of (result, coalesced).
+
+        Waits up to `timeout` seconds for the call in flight for `key`, or
+        for a new call of `coroutine_fn()`.
+        """
+        call = self._calls.get(key)
+        coalesced = call is not None
+        if not coalesced:
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(coroutine_fn()))
+            call.task.add_done_callback(lambda task: self._finish(key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(call.task), timeout), coalesced
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self._remove(key, call)
+                call.task.cancel()
+                if self._on_cancel is not None:
+                    self._on_cancel()
+
+    def _finish(self, key, call):
+        self._remove(key, call)
+        # Retrieve the exception in case every caller already gave up waiting
+        if not call.task.cancelled():
+            call.task.exception()
+
+    def _remove(self, key, call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import asyncio
+import concurrent.futures
+import contextvars
+import json
+import time
+
+
+class _Tool:
+
+    __slots__ = ('name', 'handler', 'timeout', 'attributes')
+
+    def __init__(self, name, handler, timeout):
+        self.name = name
+        self.handler = handler
+        self.timeout = timeout
+        self.attributes = {'tool.name': name}
+
+
+class _ToolRegistryBase:
+
+    def __init__(self, tracer, metrics):
+        self._tracer = tracer
+        self._tools = {}
+
+        self._duration_histogram = metrics['app_product_reviews_tool_call_duration']
+        self._timeouts_counter = metrics['app_product_reviews_tool_call_timeouts']
+
+    def register(self, name, handler, timeout):
+        """Registers the handler of a tool, called with the dict of arguments of a call and the seconds left of its timeout."""
+        self._tools[name] = _Tool(name, handler, timeout)
+
+    def _get_tools(self, calls):
+        tools = []
+        for name, _ in calls:
+            tool = self._tools.get(name)
+            if tool is None:
+                raise Exception(f'Received unexpected tool call request: {name}')
+            tools.append(tool)
+        return tools
+
+    def _start_span(self, tool):
+        return self._tracer.start_as_current_span(
+            f'execute_tool {tool.name}', attributes={'app.ai_assistant.tool.name': tool.name})
+
+    def _record(self, tool, started_at):
+        self._duration_histogram.record(time.monotonic() - started_at, tool.attributes)
+
+    def _timed_out(self, tool):
+        self._timeouts_counter.add(1, tool.attributes)
+        # The LLM is told, so it can still answer with the other results
+        return json.dumps({"error": f"{tool.name} timed out after {tool.timeout}s"})
+
+
+class ToolRegistry(_ToolRegistryBase):
+    """Runs the tool calls of an LLM response concurrently on a bounded thread pool.
+
+    Each tool is registered with a handler returning the content of its tool
+    message and a timeout in seconds, counted from when its calls are
+    submitted. A call that is not done in time gets an error message instead,
+    while its handler, which cannot be interrupted, runs to completion.
+    """
+
+    def __init__(self, max_workers, tracer, metrics):
+        super().__init__(tracer, metrics)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tool-call')
+
+    def run(self, calls):
+        """Returns the responses to the (name, arguments) calls, in the order of the calls."""
+        tools = self._get_tools(calls)
+        submitted_at = time.monotonic()
+        # The handlers run in the trace context of the caller
+        futures = [
+            self._executor.submit(contextvars.copy_context().run, self._call, tool, arguments, submitted_at + tool.timeout)
+            for tool, (_, arguments) in zip(tools, calls)]
+
+        responses = []
+        for tool, future in zip(tools, futures):
+            try:
+                responses.append(future.result(timeout=max(submitted_at + tool.timeout - time.monotonic(), 0)))
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                responses.append(self._timed_out(tool))
+        return responses
+
+    def _call(self, tool, arguments, deadline):
+        with self._start_span(tool):
+            started_at = time.monotonic()
+            try:
+                return tool.handler(arguments, max(deadline - started_at, 0))
+            finally:
+                self._record(tool, started_at)
+
+
+class AsyncToolRegistry(_ToolRegistryBase):
+    """ToolRegistry for the asyncio server mode.
+
+    The calls run as concurrent tasks, at most `max_concurrency` of them at a
+    time across all requests, and a call is cancelled at its timeout.
+    """
+
+    def __init__(self, max_concurrency, tracer, metrics):
+        super().__init__(tracer, metrics)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(self, calls):
+        """Returns the responses to the (name, arguments) calls, in the order of the calls."""
+        tools = self._get_tools(calls)
+        return await asyncio.gather(*(
+            self._run(tool, arguments) for tool, (_, arguments) in zip(tools, calls)))
+
+    async def _run(self, tool, arguments):
+        try:
+            return await asyncio.wait_for(self._call(tool, arguments, time.monotonic() + tool.timeout), tool.timeout)
+        except asyncio.TimeoutError:
+            return self._timed_out(tool)
+
+    async def _call(self, tool, arguments, deadline):
+        async with self._semaphore:
+            with self._start_span(tool):
+                started_at = time.monotonic()
+                try:
+                    return await tool.handler(arguments, max(deadline - started_at, 0))
+                finally:
+                    self._record(tool, started_at)
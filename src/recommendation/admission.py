@@ -0,0 +1,303 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# The same module is copied into src/recommendation and src/product-reviews,
+# since each service image only packages its own directory. Keep the two
+# copies identical.
+
+# Python
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from concurrent import futures
+
+# Pip
+import grpc
+
+# Health checks are answered even when the server is shedding load
+EXEMPT_METHOD_PREFIX = '/grpc.health.v1.Health/'
+
+# Weight of the latest call in the moving average of the service time
+SERVICE_TIME_SMOOTHING = 0.2
+
+
+class AdmissionControl(grpc.ServerInterceptor):
+    """Bounds the RPCs a threaded gRPC server runs and queues.
+
+    At most `max_workers` calls run at a time and up to
+    `max_concurrent_rpcs - max_workers` more wait for a free slot, anything
+    beyond that is rejected with RESOURCE_EXHAUSTED. Waiting calls hold an
+    idle pool thread, so each call can compare its estimated queue wait plus
+    the average service time with its own deadline and is shed straight away
+    when it would not finish in time, instead of running after its caller
+    has given up. Server streaming calls hold their slot until the stream
+    ends.
+    """
+
+    def __init__(self, max_workers, max_concurrent_rpcs, metrics, prefix):
+        self.max_workers = max_workers
+        self.max_concurrent_rpcs = max(max_concurrent_rpcs, max_workers)
+        self._slots = threading.Semaphore(max_workers)
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._queued = 0
+        self._service_time = 0.0
+
+        self._in_flight_counter = metrics[f'{prefix}_rpcs_in_flight']
+        self._queue_depth_counter = metrics[f'{prefix}_rpc_queue_depth']
+        self._queue_time_histogram = metrics[f'{prefix}_rpc_queue_time']
+        self._shed_counter = metrics[f'{prefix}_rpcs_shed']
+
+    def server(self, **kwargs):
+        """Returns a gRPC server with a pool thread for every running or queued call.
+
+        The extra `max_workers` threads answer the calls over the limit, and
+        gRPC itself rejects calls once those are busy as well.
+        """
+        pool_size = self.max_concurrent_rpcs + self.max_workers
+        return grpc.server(
+            futures.ThreadPoolExecutor(max_workers=pool_size),
+            interceptors=[self],
+            maximum_concurrent_rpcs=pool_size,
+            **kwargs)
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler_call_details.method.startswith(EXEMPT_METHOD_PREFIX):
+            return handler
+
+        if handler.unary_unary is not None:
+            behavior = handler.unary_unary
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, context: self._admit(behavior, request, context),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer)
+        if handler.unary_stream is not None:
+            behavior = handler.unary_stream
+            return grpc.unary_stream_rpc_method_handler(
+                lambda request, context: self._admit_stream(behavior, request, context),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer)
+        # The services have no client streaming RPCs
+        return handler
+
+    def estimated_queue_wait(self):
+        with self._lock:
+            return self._queued * self._service_time / self.max_workers
+
+    def latest_start(self, context):
+        """Returns how long the call can wait for a slot and still finish in time, or None without a deadline."""
+        time_remaining = context.time_remaining()
+        # The threaded server reports calls without a deadline as having
+        # practically unlimited time left, beyond what a lock wait accepts
+        if time_remaining is None or time_remaining > threading.TIMEOUT_MAX:
+            return None
+        return max(0.0, time_remaining - self._service_time)
+
+    def _admit(self, behavior, request, context):
+        started_at = self._enter(context)
+        try:
+            return behavior(request, context)
+        finally:
+            self._exit(started_at, True)
+
+    def _admit_stream(self, behavior, request, context):
+        # The slot is held until the last response was sent or the stream
+        # was cancelled. How long a stream lasts depends on how fast the
+        # client reads it, so it is left out of the average service time.
+        started_at = self._enter(context)
+        try:
+            yield from behavior(request, context)
+        finally:
+            self._exit(started_at, False)
+
+    def _enter(self, context):
+        """Waits for a free slot for the call, or aborts it, and returns when the call started to run."""
+        with self._lock:
+            admitted = self._admitted < self.max_concurrent_rpcs
+            if admitted:
+                self._admitted += 1
+        if not admitted:
+            self._shed(context, 'queue_full')
+
+        try:
+            self._wait_for_slot(context)
+        except BaseException:
+            with self._lock:
+                self._admitted -= 1
+            raise
+
+        self._in_flight_counter.add(1)
+        return time.monotonic()
+
+    def _wait_for_slot(self, context):
+        max_wait = self.latest_start(context)
+        if max_wait is not None and self.estimated_queue_wait() > max_wait:
+            self._shed(context, 'deadline')
+
+        enqueued_at = time.monotonic()
+        self._update_queued(1)
+        try:
+            acquired = self._slots.acquire(timeout=max_wait)
+        finally:
+            self._update_queued(-1)
+        self._queue_time_histogram.record(time.monotonic() - enqueued_at)
+        if not acquired:
+            self._shed(context, 'deadline')
+
+    def _exit(self, started_at, record_service_time):
+        service_time = time.monotonic() - started_at
+        with self._lock:
+            if record_service_time:
+                self._service_time += SERVICE_TIME_SMOOTHING * (service_time - self._service_time)
+            self._admitted -= 1
+        self._in_flight_counter.add(-1)
+        self._slots.release()
+
+    def _update_queued(self, delta):
+        with self._lock:
+            self._queued += delta
+        self._queue_depth_counter.add(delta)
+
+    def _shed(self, context, reason):
+        self._shed_counter.add(1, {'reason': reason})
+        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, f'Server is overloaded ({reason})')
+
+
+class AsyncAdmissionControl(grpc.aio.ServerInterceptor):
+    """AdmissionControl for the grpc.aio server mode.
+
+    At most `max_running` calls run on the event loop at a time and up to
+    `max_concurrent_rpcs - max_running` more wait for a free slot, anything
+    beyond that is rejected with RESOURCE_EXHAUSTED. As with the threaded
+    server, a waiting call is shed as soon as its estimated queue wait plus
+    the average service time exceeds its deadline.
+    """
+
+    def __init__(self, max_running, max_concurrent_rpcs, metrics, prefix):
+        self.max_running = max_running
+        self.max_concurrent_rpcs = max(max_concurrent_rpcs, max_running)
+        self._slots = asyncio.Semaphore(max_running)
+        self._admitted = 0
+        self._queued = 0
+        self._service_time = 0.0
+
+        self._in_flight_counter = metrics[f'{prefix}_rpcs_in_flight']
+        self._queue_depth_counter = metrics[f'{prefix}_rpc_queue_depth']
+        self._queue_time_histogram = metrics[f'{prefix}_rpc_queue_time']
+        self._shed_counter = metrics[f'{prefix}_rpcs_shed']
+
+    def server(self, **kwargs):
+        """Returns a grpc.aio server, which must be created on the running event loop.
+
+        gRPC itself only rejects calls once another `max_running` calls are
+        over the limit, so the others are rejected, and counted, here. Its
+        limit also counts the next call the server is waiting for.
+        """
+        return grpc.aio.server(
+            interceptors=[self],
+            maximum_concurrent_rpcs=self.max_concurrent_rpcs + self.max_running + 1,
+            **kwargs)
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None or handler_call_details.method.startswith(EXEMPT_METHOD_PREFIX):
+            return handler
+
+        # grpc.aio tells async behaviors apart by their function, which
+        # functools.partial keeps visible, unlike a lambda
+        if handler.unary_unary is not None:
+            return grpc.unary_unary_rpc_method_handler(
+                functools.partial(self._admit, handler.unary_unary),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer)
+        if handler.unary_stream is not None:
+            behavior = handler.unary_stream
+            # Streams are either async generators or write to the context
+            admit_stream = self._admit_stream if inspect.isasyncgenfunction(behavior) else self._admit
+            return grpc.unary_stream_rpc_method_handler(
+                functools.partial(admit_stream, behavior),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer)
+        # The services have no client streaming RPCs
+        return handler
+
+    def estimated_queue_wait(self):
+        return self._queued * self._service_time / self.max_running
+
+    def latest_start(self, context):
+        """Returns how long the call can wait for a slot and still finish in time, or None without a deadline."""
+        time_remaining = context.time_remaining()
+        if time_remaining is None or time_remaining > threading.TIMEOUT_MAX:
+            return None
+        return max(0.0, time_remaining - self._service_time)
+
+    async def _admit(self, behavior, request, context):
+        started_at = await self._enter(context)
+        try:
+            return await behavior(request, context)
+        finally:
+            self._exit(started_at, True)
+
+    async def _admit_stream(self, behavior, request, context):
+        # How long a stream lasts depends on how fast the client reads it,
+        # so it is left out of the average service time
+        started_at = await self._enter(context)
+        try:
+            async for response in behavior(request, context):
+                yield response
+        finally:
+            self._exit(started_at, False)
+
+    async def _enter(self, context):
+        """Waits for a free slot for the call, or aborts it, and returns when the call started to run."""
+        if self._admitted >= self.max_concurrent_rpcs:
+            await self._shed(context, 'queue_full')
+
+        self._admitted += 1
+        try:
+            await self._wait_for_slot(context)
+        except BaseException:
+            self._admitted -= 1
+            raise
+
+        self._in_flight_counter.add(1)
+        return time.monotonic()
+
+    async def _wait_for_slot(self, context):
+        max_wait = self.latest_start(context)
+        if max_wait is not None and self.estimated_queue_wait() > max_wait:
+            await self._shed(context, 'deadline')
+
+        enqueued_at = time.monotonic()
+        self._update_queued(1)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), max_wait)
+            acquired = True
+        except asyncio.TimeoutError:
+            acquired = False
+        finally:
+            self._update_queued(-1)
+        self._queue_time_histogram.record(time.monotonic() - enqueued_at)
+        if not acquired:
+            await self._shed(context, 'deadline')
+
+    def _exit(self, started_at, record_service_time):
+        if record_service_time:
+            service_time = time.monotonic() - started_at
+            self._service_time += SERVICE_TIME_SMOOTHING * (service_time - self._service_time)
+        self._admitted -= 1
+        self._in_flight_counter.add(-1)
+        self._slots.release()
+
+    def _update_queued(self, delta):
+        self._queued += delta
+        self._queue_depth_counter.add(delta)
+
+    async def _shed(self, context, reason):
+        self._shed_counter.add(1, {'reason': reason})
+        await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, f'Server is overloaded ({reason})')
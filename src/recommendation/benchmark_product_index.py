@@ -0,0 +1,81 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Compares the per-request cost of excluding the requested products with a
+# set difference against sampling from an interned ProductIndex, both when
+# the index is built for the request and when a catalog snapshot reuses it.
+#
+# Usage: python benchmark_product_index.py
+
+# Python
+import random
+import statistics
+import time
+import tracemalloc
+
+# Local
+from product_index import ProductIndex, ProductList
+
+CATALOG_SIZES = [10, 10_000, 1_000_000]
+MAX_RESPONSES = 5
+NUM_EXCLUDED = 2
+
+
+def sample_with_set_difference(product_ids, request_product_ids):
+    # The selection of catalogs fetched for a single request
+    return ProductList(product_ids).sample(MAX_RESPONSES, request_product_ids)[0]
+
+
+def sample_with_new_product_index(product_ids, request_product_ids):
+    # What every request would pay if it built its own index
+    return ProductIndex(product_ids).sample(MAX_RESPONSES, request_product_ids)[0]
+
+
+def sample_with_product_index(product_index, request_product_ids):
+    # The selection of the catalog snapshot, whose index is built once per refresh
+    return product_index.sample(MAX_RESPONSES, request_product_ids)[0]
+
+
+def measure_latency(fn, *args, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6
+
+
+def measure_allocation(fn, *args):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    print(f"{'catalog size':>12} | {'method':<22} | {'median latency (us)':>20} | {'peak allocation (bytes)':>24}")
+    print('-' * 88)
+    for size in CATALOG_SIZES:
+        product_ids = [f'PRODUCT{i:08d}' for i in range(size)]
+        request_product_ids = random.sample(product_ids, NUM_EXCLUDED)
+        product_index = ProductIndex(product_ids)
+        # Allocate the per-thread exclusion mask outside of the measurements
+        sample_with_product_index(product_index, request_product_ids)
+
+        iterations = max(10, min(10_000, 10_000_000 // size))
+        for method, fn, products in [
+            ('set difference', sample_with_set_difference, product_ids),
+            ('product index (built)', sample_with_new_product_index, product_ids),
+            ('product index (reused)', sample_with_product_index, product_index),
+        ]:
+            latency = measure_latency(fn, products, request_product_ids, iterations=iterations)
+            allocation = measure_allocation(fn, products, request_product_ids)
+            print(f"{size:>12} | {method:<22} | {latency:>20.1f} | {allocation:>24}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import logging
+import threading
+import time
+
+# Pip
+from opentelemetry import trace
+
+logger = logging.getLogger('main')
+tracer = trace.get_tracer(__name__)
+
+
+class CatalogSnapshotCache:
+    """In-process snapshot of the product catalog with a TTL.
+
+    A background thread refreshes the snapshot every `ttl_seconds`. Readers
+    always get the current snapshot, even while a refresh is running, and
+    only block on a synchronous fetch when no snapshot exists yet.
+    """
+
+    def __init__(self, fetch_products, ttl_seconds):
+        self._fetch_products = fetch_products
+        self._ttl_seconds = ttl_seconds
+        self._cold_start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name='catalog-snapshot-refresh', daemon=True)
+
+        # (products, refreshed_at) is swapped as a single tuple so readers
+        # never observe a half-updated snapshot
+        self._snapshot = None
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def get(self, timeout=None):
+        """Returns a tuple of (products, hit), waiting up to `timeout` seconds on a cold start."""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot[0], True
+
+        # Cold start: only one caller fetches, the others wait for its result
+        # for no longer than their own timeout, so they can fall back to the
+        # last good catalog instead of queueing behind a slow fetch
+        started = time.monotonic()
+        if not self._cold_start_lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise TimeoutError("Timed out waiting for the catalog snapshot")
+        try:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                return snapshot[0], True
+            if timeout is not None:
+                timeout = max(0, timeout - (time.monotonic() - started))
+            return self._refresh(timeout), False
+        finally:
+            self._cold_start_lock.release()
+
+    async def get_async(self, fetch_products_async, timeout=None):
+        """Returns a tuple of (products, hit), fetching with `fetch_products_async` on a cold start."""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot[0], True
+
+        products = await fetch_products_async(timeout)
+        self._snapshot = (products, time.monotonic())
+        return products, False
+
+    def age_seconds(self):
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        return time.monotonic() - snapshot[1]
+
+    def _refresh(self, timeout=None):
+        products = self._fetch_products(timeout)
+        self._snapshot = (products, time.monotonic())
+        return products
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self._ttl_seconds):
+            with tracer.start_as_current_span("refresh_catalog_snapshot") as span:
+                try:
+                    products = self._refresh()
+                    span.set_attribute("app.products.count", len(products))
+                except Exception as e:
+                    # Keep serving the previous snapshot until the next attempt
+                    span.record_exception(e)
+                    logger.warning(f"Catalog snapshot refresh failed: {e}")
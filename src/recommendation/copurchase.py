@@ -0,0 +1,216 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import heapq
+import logging
+import random
+import threading
+
+# Pip
+import numpy as np
+import psycopg2
+from opentelemetry import trace
+
+logger = logging.getLogger('main')
+tracer = trace.get_tracer(__name__)
+
+
+def co_purchase_pairs(order_codes, product_codes):
+    """Returns (left, right, counts) arrays of co-purchased product codes.
+
+    Every ordered pair of distinct items that share an order is emitted once
+    per order, so counts[i] is the number of orders that contained both
+    left[i] and right[i].
+    """
+    order = np.argsort(order_codes, kind='stable')
+    order_codes = order_codes[order]
+    product_codes = product_codes[order]
+
+    order_sizes = np.bincount(order_codes)
+    order_starts = np.cumsum(order_sizes) - order_sizes
+
+    # Pair every item with every item of its own order (including itself)
+    item_order_sizes = order_sizes[order_codes]
+    left = np.repeat(np.arange(len(order_codes)), item_order_sizes)
+    block_starts = np.repeat(np.cumsum(item_order_sizes) - item_order_sizes, item_order_sizes)
+    right = np.repeat(order_starts[order_codes], item_order_sizes) + (np.arange(len(left)) - block_starts)
+
+    distinct = left != right
+    left_products = product_codes[left[distinct]]
+    right_products = product_codes[right[distinct]]
+
+    num_products = int(product_codes.max()) + 1 if len(product_codes) else 0
+    pair_keys, counts = np.unique(left_products * num_products + right_products, return_counts=True)
+    return pair_keys // max(num_products, 1), pair_keys % max(num_products, 1), counts
+
+
+class CoPurchaseIndex:
+    """Item-to-item co-occurrence index built from accounting.orderitem.
+
+    Order items are read in batches after the last processed `seq`, so each
+    background refresh only processes the orders placed since the previous
+    one. Readers only touch the published top-k neighbour table and never
+    block on a refresh.
+
+    Sequence values are assigned before commit, so an order that commits
+    late can become visible below the last processed `seq`. Every refresh
+    reads the last `overlap` sequence values again and skips the items that
+    were already counted, so such orders are still counted once.
+    """
+
+    def __init__(self, db_connection_str, refresh_interval, batch_size=10000, top_k=10, overlap=10000):
+        self._db_connection_str = db_connection_str
+        self._refresh_interval = refresh_interval
+        self._batch_size = batch_size
+        self._top_k = top_k
+        self._overlap = overlap
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name='copurchase-index-refresh', daemon=True)
+
+        # Only touched by the refresh thread
+        self._product_codes = {}
+        self._co_counts = {}
+        self._last_seq = 0
+        # (order_id, product_id) -> seq of the items counted within the overlap
+        self._counted = {}
+
+        # (top_neighbours, product_ids) is swapped as a single tuple so readers
+        # never observe a half-updated index
+        self._published = ({}, ())
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def is_ready(self):
+        return bool(self._published[0])
+
+    def recommend(self, request_product_ids, max_responses):
+        top_neighbours, product_ids = self._published
+        excluded = set(request_product_ids)
+
+        # Sum the co-purchase counts of the top neighbours of each input product
+        scores = {}
+        for product_id in excluded:
+            for neighbour, count in top_neighbours.get(product_id, ()):
+                if neighbour not in excluded:
+                    scores[neighbour] = scores.get(neighbour, 0) + count
+        prod_list = heapq.nlargest(max_responses, scores, key=scores.get)
+
+        # Pad with random products that have been ordered at least once
+        attempts = 0
+        while len(prod_list) < max_responses and attempts < 4 * max_responses and product_ids:
+            attempts += 1
+            product_id = random.choice(product_ids)
+            if product_id not in excluded and product_id not in prod_list:
+                prod_list.append(product_id)
+
+        return prod_list
+
+    def refresh(self):
+        with tracer.start_as_current_span("refresh_copurchase_index") as span:
+            touched = set()
+            connection = psycopg2.connect(self._db_connection_str)
+            try:
+                with connection.cursor() as cursor:
+                    after_seq = max(self._last_seq - self._overlap, 0)
+                    while True:
+                        cursor.execute(
+                            "SELECT seq, order_id, product_id FROM accounting.orderitem WHERE seq > %s ORDER BY seq LIMIT %s",
+                            (after_seq, self._batch_size))
+                        rows = cursor.fetchall()
+                        last_batch = len(rows) < self._batch_size
+                        if not last_batch:
+                            rows = self._without_trailing_order(rows) or self._fetch_order(cursor, rows[0][1], after_seq)
+                        if not rows:
+                            break
+
+                        uncounted_rows = self._uncounted(rows)
+                        if uncounted_rows:
+                            touched.update(self._add_batch(uncounted_rows))
+                        after_seq = rows[-1][0]
+                        self._last_seq = max(self._last_seq, after_seq)
+                        self._forget_counted()
+                        if last_batch:
+                            break
+            finally:
+                connection.close()
+
+            if touched:
+                self._publish(touched)
+            span.set_attribute("app.recommendation.copurchase.updated_products", len(touched))
+            span.set_attribute("app.recommendation.copurchase.last_seq", self._last_seq)
+
+    def _refresh_loop(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Co-purchase index refresh failed: {e}")
+            if self._stop.wait(self._refresh_interval):
+                return
+
+    @staticmethod
+    def _without_trailing_order(rows):
+        # The items of the last order in a full batch may continue in the next
+        # batch, so leave that order for the next query
+        trailing_order_id = rows[-1][1]
+        end = len(rows)
+        while end > 0 and rows[end - 1][1] == trailing_order_id:
+            end -= 1
+        return rows[:end]
+
+    def _fetch_order(self, cursor, order_id, after_seq):
+        # A single order with more items than the batch size is read on its own
+        cursor.execute(
+            "SELECT seq, order_id, product_id FROM accounting.orderitem WHERE order_id = %s AND seq > %s ORDER BY seq",
+            (order_id, after_seq))
+        return cursor.fetchall()
+
+    def _uncounted(self, rows):
+        # Rows within the overlap are read again, an order item is only
+        # counted the first time
+        counted = self._counted
+        uncounted_rows = [row for row in rows if (row[1], row[2]) not in counted]
+        for seq, order_id, product_id in uncounted_rows:
+            counted[(order_id, product_id)] = seq
+        return uncounted_rows
+
+    def _forget_counted(self):
+        # Items below the overlap are not read again
+        oldest_seq = self._last_seq - self._overlap
+        self._counted = {key: seq for key, seq in self._counted.items() if seq > oldest_seq}
+
+    def _add_batch(self, rows):
+        product_codes = self._product_codes
+        order_ids = np.array([row[1] for row in rows])
+        products = np.fromiter(
+            (product_codes.setdefault(row[2], len(product_codes)) for row in rows),
+            dtype=np.int64, count=len(rows))
+        _, order_codes = np.unique(order_ids, return_inverse=True)
+
+        left, right, counts = co_purchase_pairs(order_codes.astype(np.int64), products)
+
+        touched = set()
+        for a, b, count in zip(left.tolist(), right.tolist(), counts.tolist()):
+            neighbours = self._co_counts.setdefault(a, {})
+            neighbours[b] = neighbours.get(b, 0) + count
+            touched.add(a)
+        # Products ordered on their own still become padding candidates
+        touched.update(products.tolist())
+        return touched
+
+    def _publish(self, touched):
+        product_ids = list(self._product_codes)
+        top_neighbours = dict(self._published[0])
+        for code in touched:
+            neighbours = self._co_counts.get(code, {})
+            top = heapq.nlargest(self._top_k, neighbours.items(), key=lambda item: item[1])
+            top_neighbours[product_ids[code]] = tuple((product_ids[n], count) for n, count in top)
+        self._published = (top_neighbours, tuple(product_ids))
@@ -13,7 +13,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ndemo.proto\x12\x08oteldemo\"0\n\x08\x43\x61rtItem\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\"C\n\x0e\x41\x64\x64ItemRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12 \n\x04item\x18\x02 \x01(\x0b\x32\x12.oteldemo.CartItem\"#\n\x10\x45mptyCartRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"!\n\x0eGetCartRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\":\n\x04\x43\x61rt\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12!\n\x05items\x18\x02 \x03(\x0b\x32\x12.oteldemo.CartItem\"\x07\n\x05\x45mpty\"B\n\x1aListRecommendationsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x13\n\x0bproduct_ids\x18\x02 \x03(\t\"2\n\x1bListRecommendationsResponse\x12\x13\n\x0bproduct_ids\x18\x01 \x03(\t\"\x81\x01\n\x07Product\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07picture\x18\x04 \x01(\t\x12\"\n\tprice_usd\x18\x05 \x01(\x0b\x32\x0f.oteldemo.Money\x12\x12\n\ncategories\x18\x06 \x03(\t\";\n\x14ListProductsResponse\x12#\n\x08products\x18\x01 \x03(\x0b\x32\x11.oteldemo.Product\"\x1f\n\x11GetProductRequest\x12\n\n\x02id\x18\x01 \x01(\t\"&\n\x15SearchProductsRequest\x12\r\n\x05query\x18\x01 \x01(\t\"<\n\x16SearchProductsResponse\x12\"\n\x07results\x18\x01 \x03(\x0b\x32\x11.oteldemo.Product\"E\n\rProductReview\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\r\n\x05score\x18\x03 \x01(\t\".\n\x18GetProductReviewsRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\"M\n\x19GetProductReviewsResponse\x12\x30\n\x0fproduct_reviews\x18\x01 \x03(\x0b\x32\x17.oteldemo.ProductReview\"9\n#GetAverageProductReviewScoreRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\"=\n$GetAverageProductReviewScoreResponse\x12\x15\n\raverage_score\x18\x01 \x01(\t\"D\n\x1c\x41skProductAIAssistantRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x10\n\x08question\x18\x02 \x01(\t\"1\n\x1d\x41skProductAIAssistantResponse\x12\x10\n\x08response\x18\x01 \x01(\t\"X\n\x0fGetQuoteRequest\x12\"\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0b\x32\x11.oteldemo.Address\x12!\n\x05items\x18\x02 \x03(\x0b\x32\x12.oteldemo.CartItem\"5\n\x10GetQuoteResponse\x12!\n\x08\x63ost_usd\x18\x01 \x01(\x0b\x32\x0f.oteldemo.Money\"Y\n\x10ShipOrderRequest\x12\"\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0b\x32\x11.oteldemo.Address\x12!\n\x05items\x18\x02 \x03(\x0b\x32\x12.oteldemo.CartItem\"(\n\x11ShipOrderResponse\x12\x13\n\x0btracking_id\x18\x01 \x01(\t\"a\n\x07\x41\x64\x64ress\x12\x16\n\x0estreet_address\x18\x01 \x01(\t\x12\x0c\n\x04\x63ity\x18\x02 \x01(\t\x12\r\n\x05state\x18\x03 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x04 \x01(\t\x12\x10\n\x08zip_code\x18\x05 \x01(\t\"<\n\x05Money\x12\x15\n\rcurrency_code\x18\x01 \x01(\t\x12\r\n\x05units\x18\x02 \x01(\x03\x12\r\n\x05nanos\x18\x03 \x01(\x05\"8\n\x1eGetSupportedCurrenciesResponse\x12\x16\n\x0e\x63urrency_codes\x18\x01 \x03(\t\"K\n\x19\x43urrencyConversionRequest\x12\x1d\n\x04\x66rom\x18\x01 \x01(\x0b\x32\x0f.oteldemo.Money\x12\x0f\n\x07to_code\x18\x02 \x01(\t\"\x90\x01\n\x0e\x43reditCardInfo\x12\x1a\n\x12\x63redit_card_number\x18\x01 \x01(\t\x12\x17\n\x0f\x63redit_card_cvv\x18\x02 \x01(\x05\x12#\n\x1b\x63redit_card_expiration_year\x18\x03 \x01(\x05\x12$\n\x1c\x63redit_card_expiration_month\x18\x04 \x01(\x05\"_\n\rChargeRequest\x12\x1f\n\x06\x61mount\x18\x01 \x01(\x0b\x32\x0f.oteldemo.Money\x12-\n\x0b\x63redit_card\x18\x02 \x01(\x0b\x32\x18.oteldemo.CreditCardInfo\"(\n\x0e\x43hargeResponse\x12\x16\n\x0etransaction_id\x18\x01 \x01(\t\"L\n\tOrderItem\x12 \n\x04item\x18\x01 \x01(\x0b\x32\x12.oteldemo.CartItem\x12\x1d\n\x04\x63ost\x18\x02 \x01(\x0b\x32\x0f.oteldemo.Money\"\xb6\x01\n\x0bOrderResult\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x1c\n\x14shipping_tracking_id\x18\x02 \x01(\t\x12&\n\rshipping_cost\x18\x03 \x01(\x0b\x32\x0f.oteldemo.Money\x12+\n\x10shipping_address\x18\x04 \x01(\x0b\x32\x11.oteldemo.Address\x12\"\n\x05items\x18\x05 \x03(\x0b\x32\x13.oteldemo.OrderItem\"S\n\x1cSendOrderConfirmationRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12$\n\x05order\x18\x02 \x01(\x0b\x32\x15.oteldemo.OrderResult\"\x9d\x01\n\x11PlaceOrderRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x15\n\ruser_currency\x18\x02 \x01(\t\x12\"\n\x07\x61\x64\x64ress\x18\x03 \x01(\x0b\x32\x11.oteldemo.Address\x12\r\n\x05\x65mail\x18\x05 \x01(\t\x12-\n\x0b\x63redit_card\x18\x06 \x01(\x0b\x32\x18.oteldemo.CreditCardInfo\":\n\x12PlaceOrderResponse\x12$\n\x05order\x18\x01 \x01(\x0b\x32\x15.oteldemo.OrderResult\"!\n\tAdRequest\x12\x14\n\x0c\x63ontext_keys\x18\x01 \x03(\t\"\'\n\nAdResponse\x12\x19\n\x03\x61\x64s\x18\x01 \x03(\x0b\x32\x0c.oteldemo.Ad\"(\n\x02\x41\x64\x12\x14\n\x0credirect_url\x18\x01 \x01(\t\x12\x0c\n\x04text\x18\x02 \x01(\t\":\n\x04\x46lag\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x0f\n\x07\x65nabled\x18\x03 \x01(\x08\"\x1e\n\x0eGetFlagRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"/\n\x0fGetFlagResponse\x12\x1c\n\x04\x66lag\x18\x01 \x01(\x0b\x32\x0e.oteldemo.Flag\"G\n\x11\x43reateFlagRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x0f\n\x07\x65nabled\x18\x03 \x01(\x08\"2\n\x12\x43reateFlagResponse\x12\x1c\n\x04\x66lag\x18\x01 \x01(\x0b\x32\x0e.oteldemo.Flag\"2\n\x11UpdateFlagRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x65nabled\x18\x02 \x01(\x08\"\x14\n\x12UpdateFlagResponse\"\x12\n\x10ListFlagsRequest\"1\n\x11ListFlagsResponse\x12\x1c\n\x04\x66lag\x18\x01 \x03(\x0b\x32\x0e.oteldemo.Flag\"!\n\x11\x44\x65leteFlagRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x14\n\x12\x44\x65leteFlagResponse2\xb8\x01\n\x0b\x43\x61rtService\x12\x36\n\x07\x41\x64\x64Item\x12\x18.oteldemo.AddItemRequest\x1a\x0f.oteldemo.Empty\"\x00\x12\x35\n\x07GetCart\x12\x18.oteldemo.GetCartRequest\x1a\x0e.oteldemo.Cart\"\x00\x12:\n\tEmptyCart\x12\x1a.oteldemo.EmptyCartRequest\x1a\x0f.oteldemo.Empty\"\x00\x32}\n\x15RecommendationService\x12\x64\n\x13ListRecommendations\x12$.oteldemo.ListRecommendationsRequest\x1a%.oteldemo.ListRecommendationsResponse\"\x00\x32\xf1\x01\n\x15ProductCatalogService\x12\x41\n\x0cListProducts\x12\x0f.oteldemo.Empty\x1a\x1e.oteldemo.ListProductsResponse\"\x00\x12>\n\nGetProduct\x12\x1b.oteldemo.GetProductRequest\x1a\x11.oteldemo.Product\"\x00\x12U\n\x0eSearchProducts\x12\x1f.oteldemo.SearchProductsRequest\x1a .oteldemo.SearchProductsResponse\"\x00\x32\xe3\x02\n\x14ProductReviewService\x12^\n\x11GetProductReviews\x12\".oteldemo.GetProductReviewsRequest\x1a#.oteldemo.GetProductReviewsResponse\"\x00\x12\x7f\n\x1cGetAverageProductReviewScore\x12-.oteldemo.GetAverageProductReviewScoreRequest\x1a..oteldemo.GetAverageProductReviewScoreResponse\"\x00\x12j\n\x15\x41skProductAIAssistant\x12&.oteldemo.AskProductAIAssistantRequest\x1a\'.oteldemo.AskProductAIAssistantResponse\"\x00\x32\x9e\x01\n\x0fShippingService\x12\x43\n\x08GetQuote\x12\x19.oteldemo.GetQuoteRequest\x1a\x1a.oteldemo.GetQuoteResponse\"\x00\x12\x46\n\tShipOrder\x12\x1a.oteldemo.ShipOrderRequest\x1a\x1b.oteldemo.ShipOrderResponse\"\x00\x32\xab\x01\n\x0f\x43urrencyService\x12U\n\x16GetSupportedCurrencies\x12\x0f.oteldemo.Empty\x1a(.oteldemo.GetSupportedCurrenciesResponse\"\x00\x12\x41\n\x07\x43onvert\x12#.oteldemo.CurrencyConversionRequest\x1a\x0f.oteldemo.Money\"\x00\x32O\n\x0ePaymentService\x12=\n\x06\x43harge\x12\x17.oteldemo.ChargeRequest\x1a\x18.oteldemo.ChargeResponse\"\x00\x32\x62\n\x0c\x45mailService\x12R\n\x15SendOrderConfirmation\x12&.oteldemo.SendOrderConfirmationRequest\x1a\x0f.oteldemo.Empty\"\x00\x32\\\n\x0f\x43heckoutService\x12I\n\nPlaceOrder\x12\x1b.oteldemo.PlaceOrderRequest\x1a\x1c.oteldemo.PlaceOrderResponse\"\x00\x32\x42\n\tAdService\x12\x35\n\x06GetAds\x12\x13.oteldemo.AdRequest\x1a\x14.oteldemo.AdResponse\"\x00\x32\xff\x02\n\x12\x46\x65\x61tureFlagService\x12@\n\x07GetFlag\x12\x18.oteldemo.GetFlagRequest\x1a\x19.oteldemo.GetFlagResponse\"\x00\x12I\n\nCreateFlag\x12\x1b.oteldemo.CreateFlagRequest\x1a\x1c.oteldemo.CreateFlagResponse\"\x00\x12I\n\nUpdateFlag\x12\x1b.oteldemo.UpdateFlagRequest\x1a\x1c.oteldemo.UpdateFlagResponse\"\x00\x12\x46\n\tListFlags\x12\x1a.oteldemo.ListFlagsRequest\x1a\x1b.oteldemo.ListFlagsResponse\"\x00\x12I\n\nDeleteFlag\x12\x1b.oteldemo.DeleteFlagRequest\x1a\x1c.oteldemo.DeleteFlagResponse\"\x00\x42\x13Z\x11genproto/oteldemob\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ndemo.proto\x12\x08oteldemo\"0\n\x08\x43\x61rtItem\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\"C\n\x0e\x41\x64\x64ItemRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12 \n\x04item\x18\x02 \x01(\x0b\x32\x12.oteldemo.CartItem\"#\n\x10\x45mptyCartRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"!\n\x0eGetCartRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\":\n\x04\x43\x61rt\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12!\n\x05items\x18\x02 \x03(\x0b\x32\x12.oteldemo.CartItem\"\x07\n\x05\x45mpty\"B\n\x1aListRecommendationsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x13\n\x0bproduct_ids\x18\x02 \x03(\t\"2\n\x1bListRecommendationsResponse\x12\x13\n\x0bproduct_ids\x18\x01 \x03(\t\"Y\n\x1fListRecommendationsBatchRequest\x12\x36\n\x08requests\x18\x01 \x03(\x0b\x32$.oteldemo.ListRecommendationsRequest\"\\\n ListRecommendationsBatchResponse\x12\x38\n\tresponses\x18\x01 \x03(\x0b\x32%.oteldemo.ListRecommendationsResponse\"\x81\x01\n\x07Product\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07picture\x18\x04 \x01(\t\x12\"\n\tprice_usd\x18\x05 \x01(\x0b\x32\x0f.oteldemo.Money\x12\x12\n\ncategories\x18\x06 \x03(\t\";\n\x14ListProductsResponse\x12#\n\x08products\x18\x01 \x03(\x0b\x32\x11.oteldemo.Product\"\x1f\n\x11GetProductRequest\x12\n\n\x02id\x18\x01 \x01(\t\"&\n\x15SearchProductsRequest\x12\r\n\x05query\x18\x01 \x01(\t\"<\n\x16SearchProductsResponse\x12\"\n\x07results\x18\x01 \x03(\x0b\x32\x11.oteldemo.Product\"E\n\rProductReview\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\r\n\x05score\x18\x03 \x01(\t\".\n\x18GetProductReviewsRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\"M\n\x19GetProductReviewsResponse\x12\x30\n\x0fproduct_reviews\x18\x01 \x03(\x0b\x32\x17.oteldemo.ProductReview\"9\n#GetAverageProductReviewScoreRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\"=\n$GetAverageProductReviewScoreResponse\x12\x15\n\raverage_score\x18\x01 \x01(\t\";\n%GetProductReviewScoreHistogramRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\"j\n&GetProductReviewScoreHistogramResponse\x12\x14\n\x0creview_count\x18\x01 \x01(\x05\x12\x15\n\raverage_score\x18\x02 \x01(\t\x12\x13\n\x0bstar_counts\x18\x03 \x03(\x05\"4\n\x1dGetProductReviewsBatchRequest\x12\x13\n\x0bproduct_ids\x18\x01 \x03(\t\"V\n\x0eProductReviews\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x30\n\x0fproduct_reviews\x18\x02 \x03(\x0b\x32\x17.oteldemo.ProductReview\"S\n\x1eGetProductReviewsBatchResponse\x12\x31\n\x0fproduct_reviews\x18\x01 \x03(\x0b\x32\x18.oteldemo.ProductReviews\"3\n\x1cGetAverageScoresBatchRequest\x12\x13\n\x0bproduct_ids\x18\x01 \x03(\t\"@\n\x13ProductAverageScore\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x15\n\raverage_score\x18\x02 \x01(\t\"V\n\x1dGetAverageScoresBatchResponse\x12\x35\n\x0e\x61verage_scores\x18\x01 \x03(\x0b\x32\x1d.oteldemo.ProductAverageScore\"q\n\x1cGetProductReviewsPageRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x16\n\x0eorder_by_score\x18\x04 \x01(\x08\"j\n\x1dGetProductReviewsPageResponse\x12\x30\n\x0fproduct_reviews\x18\x01 \x03(\x0b\x32\x17.oteldemo.ProductReview\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"1\n\x1bStreamProductReviewsRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\"D\n\x1c\x41skProductAIAssistantRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\t\x12\x10\n\x08question\x18\x02 \x01(\t\"1\n\x1d\x41skProductAIAssistantResponse\x12\x10\n\x08response\x18\x01 \x01(\t\"X\n\x0fGetQuoteRequest\x12\"\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0b\x32\x11.oteldemo.Address\x12!\n\x05items\x18\x02 \x03(\x0b\x32\x12.oteldemo.CartItem\"5\n\x10GetQuoteResponse\x12!\n\x08\x63ost_usd\x18\x01 \x01(\x0b\x32\x0f.oteldemo.Money\"Y\n\x10ShipOrderRequest\x12\"\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0b\x32\x11.oteldemo.Address\x12!\n\x05items\x18\x02 \x03(\x0b\x32\x12.oteldemo.CartItem\"(\n\x11ShipOrderResponse\x12\x13\n\x0btracking_id\x18\x01 \x01(\t\"a\n\x07\x41\x64\x64ress\x12\x16\n\x0estreet_address\x18\x01 \x01(\t\x12\x0c\n\x04\x63ity\x18\x02 \x01(\t\x12\r\n\x05state\x18\x03 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x04 \x01(\t\x12\x10\n\x08zip_code\x18\x05 \x01(\t\"<\n\x05Money\x12\x15\n\rcurrency_code\x18\x01 \x01(\t\x12\r\n\x05units\x18\x02 \x01(\x03\x12\r\n\x05nanos\x18\x03 \x01(\x05\"8\n\x1eGetSupportedCurrenciesResponse\x12\x16\n\x0e\x63urrency_codes\x18\x01 \x03(\t\"K\n\x19\x43urrencyConversionRequest\x12\x1d\n\x04\x66rom\x18\x01 \x01(\x0b\x32\x0f.oteldemo.Money\x12\x0f\n\x07to_code\x18\x02 \x01(\t\"\x90\x01\n\x0e\x43reditCardInfo\x12\x1a\n\x12\x63redit_card_number\x18\x01 \x01(\t\x12\x17\n\x0f\x63redit_card_cvv\x18\x02 \x01(\x05\x12#\n\x1b\x63redit_card_expiration_year\x18\x03 \x01(\x05\x12$\n\x1c\x63redit_card_expiration_month\x18\x04 \x01(\x05\"_\n\rChargeRequest\x12\x1f\n\x06\x61mount\x18\x01 \x01(\x0b\x32\x0f.oteldemo.Money\x12-\n\x0b\x63redit_card\x18\x02 \x01(\x0b\x32\x18.oteldemo.CreditCardInfo\"(\n\x0e\x43hargeResponse\x12\x16\n\x0etransaction_id\x18\x01 \x01(\t\"L\n\tOrderItem\x12 \n\x04item\x18\x01 \x01(\x0b\x32\x12.oteldemo.CartItem\x12\x1d\n\x04\x63ost\x18\x02 \x01(\x0b\x32\x0f.oteldemo.Money\"\xb6\x01\n\x0bOrderResult\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x1c\n\x14shipping_tracking_id\x18\x02 \x01(\t\x12&\n\rshipping_cost\x18\x03 \x01(\x0b\x32\x0f.oteldemo.Money\x12+\n\x10shipping_address\x18\x04 \x01(\x0b\x32\x11.oteldemo.Address\x12\"\n\x05items\x18\x05 \x03(\x0b\x32\x13.oteldemo.OrderItem\"S\n\x1cSendOrderConfirmationRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12$\n\x05order\x18\x02 \x01(\x0b\x32\x15.oteldemo.OrderResult\"\x9d\x01\n\x11PlaceOrderRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x15\n\ruser_currency\x18\x02 \x01(\t\x12\"\n\x07\x61\x64\x64ress\x18\x03 \x01(\x0b\x32\x11.oteldemo.Address\x12\r\n\x05\x65mail\x18\x05 \x01(\t\x12-\n\x0b\x63redit_card\x18\x06 \x01(\x0b\x32\x18.oteldemo.CreditCardInfo\":\n\x12PlaceOrderResponse\x12$\n\x05order\x18\x01 \x01(\x0b\x32\x15.oteldemo.OrderResult\"!\n\tAdRequest\x12\x14\n\x0c\x63ontext_keys\x18\x01 \x03(\t\"\'\n\nAdResponse\x12\x19\n\x03\x61\x64s\x18\x01 \x03(\x0b\x32\x0c.oteldemo.Ad\"(\n\x02\x41\x64\x12\x14\n\x0credirect_url\x18\x01 \x01(\t\x12\x0c\n\x04text\x18\x02 \x01(\t\":\n\x04\x46lag\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x0f\n\x07\x65nabled\x18\x03 \x01(\x08\"\x1e\n\x0eGetFlagRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"/\n\x0fGetFlagResponse\x12\x1c\n\x04\x66lag\x18\x01 \x01(\x0b\x32\x0e.oteldemo.Flag\"G\n\x11\x43reateFlagRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x0f\n\x07\x65nabled\x18\x03 \x01(\x08\"2\n\x12\x43reateFlagResponse\x12\x1c\n\x04\x66lag\x18\x01 \x01(\x0b\x32\x0e.oteldemo.Flag\"2\n\x11UpdateFlagRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x65nabled\x18\x02 \x01(\x08\"\x14\n\x12UpdateFlagResponse\"\x12\n\x10ListFlagsRequest\"1\n\x11ListFlagsResponse\x12\x1c\n\x04\x66lag\x18\x01 \x03(\x0b\x32\x0e.oteldemo.Flag\"!\n\x11\x44\x65leteFlagRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x14\n\x12\x44\x65leteFlagResponse2\xb8\x01\n\x0b\x43\x61rtService\x12\x36\n\x07\x41\x64\x64Item\x12\x18.oteldemo.AddItemRequest\x1a\x0f.oteldemo.Empty\"\x00\x12\x35\n\x07GetCart\x12\x18.oteldemo.GetCartRequest\x1a\x0e.oteldemo.Cart\"\x00\x12:\n\tEmptyCart\x12\x1a.oteldemo.EmptyCartRequest\x1a\x0f.oteldemo.Empty\"\x00\x32\xf2\x01\n\x15RecommendationService\x12\x64\n\x13ListRecommendations\x12$.oteldemo.ListRecommendationsRequest\x1a%.oteldemo.ListRecommendationsResponse\"\x00\x12s\n\x18ListRecommendationsBatch\x12).oteldemo.ListRecommendationsBatchRequest\x1a*.oteldemo.ListRecommendationsBatchResponse\"\x00\x32\xf1\x01\n\x15ProductCatalogService\x12\x41\n\x0cListProducts\x12\x0f.oteldemo.Empty\x1a\x1e.oteldemo.ListProductsResponse\"\x00\x12>\n\nGetProduct\x12\x1b.oteldemo.GetProductRequest\x1a\x11.oteldemo.Product\"\x00\x12U\n\x0eSearchProducts\x12\x1f.oteldemo.SearchProductsRequest\x1a .oteldemo.SearchProductsResponse\"\x00\x32\x8e\x07\n\x14ProductReviewService\x12^\n\x11GetProductReviews\x12\".oteldemo.GetProductReviewsRequest\x1a#.oteldemo.GetProductReviewsResponse\"\x00\x12\x7f\n\x1cGetAverageProductReviewScore\x12-.oteldemo.GetAverageProductReviewScoreRequest\x1a..oteldemo.GetAverageProductReviewScoreResponse\"\x00\x12j\n\x15\x41skProductAIAssistant\x12&.oteldemo.AskProductAIAssistantRequest\x1a\'.oteldemo.AskProductAIAssistantResponse\"\x00\x12\x85\x01\n\x1eGetProductReviewScoreHistogram\x12/.oteldemo.GetProductReviewScoreHistogramRequest\x1a\x30.oteldemo.GetProductReviewScoreHistogramResponse\"\x00\x12m\n\x16GetProductReviewsBatch\x12\'.oteldemo.GetProductReviewsBatchRequest\x1a(.oteldemo.GetProductReviewsBatchResponse\"\x00\x12j\n\x15GetAverageScoresBatch\x12&.oteldemo.GetAverageScoresBatchRequest\x1a\'.oteldemo.GetAverageScoresBatchResponse\"\x00\x12j\n\x15GetProductReviewsPage\x12&.oteldemo.GetProductReviewsPageRequest\x1a\'.oteldemo.GetProductReviewsPageResponse\"\x00\x12Z\n\x14StreamProductReviews\x12%.oteldemo.StreamProductReviewsRequest\x1a\x17.oteldemo.ProductReview\"\x00\x30\x01\x32\x9e\x01\n\x0fShippingService\x12\x43\n\x08GetQuote\x12\x19.oteldemo.GetQuoteRequest\x1a\x1a.oteldemo.GetQuoteResponse\"\x00\x12\x46\n\tShipOrder\x12\x1a.oteldemo.ShipOrderRequest\x1a\x1b.oteldemo.ShipOrderResponse\"\x00\x32\xab\x01\n\x0f\x43urrencyService\x12U\n\x16GetSupportedCurrencies\x12\x0f.oteldemo.Empty\x1a(.oteldemo.GetSupportedCurrenciesResponse\"\x00\x12\x41\n\x07\x43onvert\x12#.oteldemo.CurrencyConversionRequest\x1a\x0f.oteldemo.Money\"\x00\x32O\n\x0ePaymentService\x12=\n\x06\x43harge\x12\x17.oteldemo.ChargeRequest\x1a\x18.oteldemo.ChargeResponse\"\x00\x32\x62\n\x0c\x45mailService\x12R\n\x15SendOrderConfirmation\x12&.oteldemo.SendOrderConfirmationRequest\x1a\x0f.oteldemo.Empty\"\x00\x32\\\n\x0f\x43heckoutService\x12I\n\nPlaceOrder\x12\x1b.oteldemo.PlaceOrderRequest\x1a\x1c.oteldemo.PlaceOrderResponse\"\x00\x32\x42\n\tAdService\x12\x35\n\x06GetAds\x12\x13.oteldemo.AdRequest\x1a\x14.oteldemo.AdResponse\"\x00\x32\xff\x02\n\x12\x46\x65\x61tureFlagService\x12@\n\x07GetFlag\x12\x18.oteldemo.GetFlagRequest\x1a\x19.oteldemo.GetFlagResponse\"\x00\x12I\n\nCreateFlag\x12\x1b.oteldemo.CreateFlagRequest\x1a\x1c.oteldemo.CreateFlagResponse\"\x00\x12I\n\nUpdateFlag\x12\x1b.oteldemo.UpdateFlagRequest\x1a\x1c.oteldemo.UpdateFlagResponse\"\x00\x12\x46\n\tListFlags\x12\x1a.oteldemo.ListFlagsRequest\x1a\x1b.oteldemo.ListFlagsResponse\"\x00\x12I\n\nDeleteFlag\x12\x1b.oteldemo.DeleteFlagRequest\x1a\x1c.oteldemo.DeleteFlagResponse\"\x00\x42\x13Z\x11genproto/oteldemob\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -37,110 +37,136 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_LISTRECOMMENDATIONSREQUEST']._serialized_end=350
   _globals['_LISTRECOMMENDATIONSRESPONSE']._serialized_start=352
   _globals['_LISTRECOMMENDATIONSRESPONSE']._serialized_end=402
-  _globals['_PRODUCT']._serialized_start=405
-  _globals['_PRODUCT']._serialized_end=534
-  _globals['_LISTPRODUCTSRESPONSE']._serialized_start=536
-  _globals['_LISTPRODUCTSRESPONSE']._serialized_end=595
-  _globals['_GETPRODUCTREQUEST']._serialized_start=597
-  _globals['_GETPRODUCTREQUEST']._serialized_end=628
-  _globals['_SEARCHPRODUCTSREQUEST']._serialized_start=630
-  _globals['_SEARCHPRODUCTSREQUEST']._serialized_end=668
-  _globals['_SEARCHPRODUCTSRESPONSE']._serialized_start=670
-  _globals['_SEARCHPRODUCTSRESPONSE']._serialized_end=730
-  _globals['_PRODUCTREVIEW']._serialized_start=732
-  _globals['_PRODUCTREVIEW']._serialized_end=801
-  _globals['_GETPRODUCTREVIEWSREQUEST']._serialized_start=803
-  _globals['_GETPRODUCTREVIEWSREQUEST']._serialized_end=849
-  _globals['_GETPRODUCTREVIEWSRESPONSE']._serialized_start=851
-  _globals['_GETPRODUCTREVIEWSRESPONSE']._serialized_end=928
-  _globals['_GETAVERAGEPRODUCTREVIEWSCOREREQUEST']._serialized_start=930
-  _globals['_GETAVERAGEPRODUCTREVIEWSCOREREQUEST']._serialized_end=987
-  _globals['_GETAVERAGEPRODUCTREVIEWSCORERESPONSE']._serialized_start=989
-  _globals['_GETAVERAGEPRODUCTREVIEWSCORERESPONSE']._serialized_end=1050
-  _globals['_ASKPRODUCTAIASSISTANTREQUEST']._serialized_start=1052
-  _globals['_ASKPRODUCTAIASSISTANTREQUEST']._serialized_end=1120
-  _globals['_ASKPRODUCTAIASSISTANTRESPONSE']._serialized_start=1122
-  _globals['_ASKPRODUCTAIASSISTANTRESPONSE']._serialized_end=1171
-  _globals['_GETQUOTEREQUEST']._serialized_start=1173
-  _globals['_GETQUOTEREQUEST']._serialized_end=1261
-  _globals['_GETQUOTERESPONSE']._serialized_start=1263
-  _globals['_GETQUOTERESPONSE']._serialized_end=1316
-  _globals['_SHIPORDERREQUEST']._serialized_start=1318
-  _globals['_SHIPORDERREQUEST']._serialized_end=1407
-  _globals['_SHIPORDERRESPONSE']._serialized_start=1409
-  _globals['_SHIPORDERRESPONSE']._serialized_end=1449
-  _globals['_ADDRESS']._serialized_start=1451
-  _globals['_ADDRESS']._serialized_end=1548
-  _globals['_MONEY']._serialized_start=1550
-  _globals['_MONEY']._serialized_end=1610
-  _globals['_GETSUPPORTEDCURRENCIESRESPONSE']._serialized_start=1612
-  _globals['_GETSUPPORTEDCURRENCIESRESPONSE']._serialized_end=1668
-  _globals['_CURRENCYCONVERSIONREQUEST']._serialized_start=1670
-  _globals['_CURRENCYCONVERSIONREQUEST']._serialized_end=1745
-  _globals['_CREDITCARDINFO']._serialized_start=1748
-  _globals['_CREDITCARDINFO']._serialized_end=1892
-  _globals['_CHARGEREQUEST']._serialized_start=1894
-  _globals['_CHARGEREQUEST']._serialized_end=1989
-  _globals['_CHARGERESPONSE']._serialized_start=1991
-  _globals['_CHARGERESPONSE']._serialized_end=2031
-  _globals['_ORDERITEM']._serialized_start=2033
-  _globals['_ORDERITEM']._serialized_end=2109
-  _globals['_ORDERRESULT']._serialized_start=2112
-  _globals['_ORDERRESULT']._serialized_end=2294
-  _globals['_SENDORDERCONFIRMATIONREQUEST']._serialized_start=2296
-  _globals['_SENDORDERCONFIRMATIONREQUEST']._serialized_end=2379
-  _globals['_PLACEORDERREQUEST']._serialized_start=2382
-  _globals['_PLACEORDERREQUEST']._serialized_end=2539
-  _globals['_PLACEORDERRESPONSE']._serialized_start=2541
-  _globals['_PLACEORDERRESPONSE']._serialized_end=2599
-  _globals['_ADREQUEST']._serialized_start=2601
-  _globals['_ADREQUEST']._serialized_end=2634
-  _globals['_ADRESPONSE']._serialized_start=2636
-  _globals['_ADRESPONSE']._serialized_end=2675
-  _globals['_AD']._serialized_start=2677
-  _globals['_AD']._serialized_end=2717
-  _globals['_FLAG']._serialized_start=2719
-  _globals['_FLAG']._serialized_end=2777
-  _globals['_GETFLAGREQUEST']._serialized_start=2779
-  _globals['_GETFLAGREQUEST']._serialized_end=2809
-  _globals['_GETFLAGRESPONSE']._serialized_start=2811
-  _globals['_GETFLAGRESPONSE']._serialized_end=2858
-  _globals['_CREATEFLAGREQUEST']._serialized_start=2860
-  _globals['_CREATEFLAGREQUEST']._serialized_end=2931
-  _globals['_CREATEFLAGRESPONSE']._serialized_start=2933
-  _globals['_CREATEFLAGRESPONSE']._serialized_end=2983
-  _globals['_UPDATEFLAGREQUEST']._serialized_start=2985
-  _globals['_UPDATEFLAGREQUEST']._serialized_end=3035
-  _globals['_UPDATEFLAGRESPONSE']._serialized_start=3037
-  _globals['_UPDATEFLAGRESPONSE']._serialized_end=3057
-  _globals['_LISTFLAGSREQUEST']._serialized_start=3059
-  _globals['_LISTFLAGSREQUEST']._serialized_end=3077
-  _globals['_LISTFLAGSRESPONSE']._serialized_start=3079
-  _globals['_LISTFLAGSRESPONSE']._serialized_end=3128
-  _globals['_DELETEFLAGREQUEST']._serialized_start=3130
-  _globals['_DELETEFLAGREQUEST']._serialized_end=3163
-  _globals['_DELETEFLAGRESPONSE']._serialized_start=3165
-  _globals['_DELETEFLAGRESPONSE']._serialized_end=3185
-  _globals['_CARTSERVICE']._serialized_start=3188
-  _globals['_CARTSERVICE']._serialized_end=3372
-  _globals['_RECOMMENDATIONSERVICE']._serialized_start=3374
-  _globals['_RECOMMENDATIONSERVICE']._serialized_end=3499
-  _globals['_PRODUCTCATALOGSERVICE']._serialized_start=3502
-  _globals['_PRODUCTCATALOGSERVICE']._serialized_end=3743
-  _globals['_PRODUCTREVIEWSERVICE']._serialized_start=3746
-  _globals['_PRODUCTREVIEWSERVICE']._serialized_end=4101
-  _globals['_SHIPPINGSERVICE']._serialized_start=4104
-  _globals['_SHIPPINGSERVICE']._serialized_end=4262
-  _globals['_CURRENCYSERVICE']._serialized_start=4265
-  _globals['_CURRENCYSERVICE']._serialized_end=4436
-  _globals['_PAYMENTSERVICE']._serialized_start=4438
-  _globals['_PAYMENTSERVICE']._serialized_end=4517
-  _globals['_EMAILSERVICE']._serialized_start=4519
-  _globals['_EMAILSERVICE']._serialized_end=4617
-  _globals['_CHECKOUTSERVICE']._serialized_start=4619
-  _globals['_CHECKOUTSERVICE']._serialized_end=4711
-  _globals['_ADSERVICE']._serialized_start=4713
-  _globals['_ADSERVICE']._serialized_end=4779
-  _globals['_FEATUREFLAGSERVICE']._serialized_start=4782
-  _globals['_FEATUREFLAGSERVICE']._serialized_end=5165
+  _globals['_LISTRECOMMENDATIONSBATCHREQUEST']._serialized_start=404
+  _globals['_LISTRECOMMENDATIONSBATCHREQUEST']._serialized_end=493
+  _globals['_LISTRECOMMENDATIONSBATCHRESPONSE']._serialized_start=495
+  _globals['_LISTRECOMMENDATIONSBATCHRESPONSE']._serialized_end=587
+  _globals['_PRODUCT']._serialized_start=590
+  _globals['_PRODUCT']._serialized_end=719
+  _globals['_LISTPRODUCTSRESPONSE']._serialized_start=721
+  _globals['_LISTPRODUCTSRESPONSE']._serialized_end=780
+  _globals['_GETPRODUCTREQUEST']._serialized_start=782
+  _globals['_GETPRODUCTREQUEST']._serialized_end=813
+  _globals['_SEARCHPRODUCTSREQUEST']._serialized_start=815
+  _globals['_SEARCHPRODUCTSREQUEST']._serialized_end=853
+  _globals['_SEARCHPRODUCTSRESPONSE']._serialized_start=855
+  _globals['_SEARCHPRODUCTSRESPONSE']._serialized_end=915
+  _globals['_PRODUCTREVIEW']._serialized_start=917
+  _globals['_PRODUCTREVIEW']._serialized_end=986
+  _globals['_GETPRODUCTREVIEWSREQUEST']._serialized_start=988
+  _globals['_GETPRODUCTREVIEWSREQUEST']._serialized_end=1034
+  _globals['_GETPRODUCTREVIEWSRESPONSE']._serialized_start=1036
+  _globals['_GETPRODUCTREVIEWSRESPONSE']._serialized_end=1113
+  _globals['_GETAVERAGEPRODUCTREVIEWSCOREREQUEST']._serialized_start=1115
+  _globals['_GETAVERAGEPRODUCTREVIEWSCOREREQUEST']._serialized_end=1172
+  _globals['_GETAVERAGEPRODUCTREVIEWSCORERESPONSE']._serialized_start=1174
+  _globals['_GETAVERAGEPRODUCTREVIEWSCORERESPONSE']._serialized_end=1235
+  _globals['_GETPRODUCTREVIEWSCOREHISTOGRAMREQUEST']._serialized_start=1237
+  _globals['_GETPRODUCTREVIEWSCOREHISTOGRAMREQUEST']._serialized_end=1296
+  _globals['_GETPRODUCTREVIEWSCOREHISTOGRAMRESPONSE']._serialized_start=1298
+  _globals['_GETPRODUCTREVIEWSCOREHISTOGRAMRESPONSE']._serialized_end=1404
+  _globals['_GETPRODUCTREVIEWSBATCHREQUEST']._serialized_start=1406
+  _globals['_GETPRODUCTREVIEWSBATCHREQUEST']._serialized_end=1458
+  _globals['_PRODUCTREVIEWS']._serialized_start=1460
+  _globals['_PRODUCTREVIEWS']._serialized_end=1546
+  _globals['_GETPRODUCTREVIEWSBATCHRESPONSE']._serialized_start=1548
+  _globals['_GETPRODUCTREVIEWSBATCHRESPONSE']._serialized_end=1631
+  _globals['_GETAVERAGESCORESBATCHREQUEST']._serialized_start=1633
+  _globals['_GETAVERAGESCORESBATCHREQUEST']._serialized_end=1684
+  _globals['_PRODUCTAVERAGESCORE']._serialized_start=1686
+  _globals['_PRODUCTAVERAGESCORE']._serialized_end=1750
+  _globals['_GETAVERAGESCORESBATCHRESPONSE']._serialized_start=1752
+  _globals['_GETAVERAGESCORESBATCHRESPONSE']._serialized_end=1838
+  _globals['_GETPRODUCTREVIEWSPAGEREQUEST']._serialized_start=1840
+  _globals['_GETPRODUCTREVIEWSPAGEREQUEST']._serialized_end=1953
+  _globals['_GETPRODUCTREVIEWSPAGERESPONSE']._serialized_start=1955
+  _globals['_GETPRODUCTREVIEWSPAGERESPONSE']._serialized_end=2061
+  _globals['_STREAMPRODUCTREVIEWSREQUEST']._serialized_start=2063
+  _globals['_STREAMPRODUCTREVIEWSREQUEST']._serialized_end=2112
+  _globals['_ASKPRODUCTAIASSISTANTREQUEST']._serialized_start=2114
+  _globals['_ASKPRODUCTAIASSISTANTREQUEST']._serialized_end=2182
+  _globals['_ASKPRODUCTAIASSISTANTRESPONSE']._serialized_start=2184
+  _globals['_ASKPRODUCTAIASSISTANTRESPONSE']._serialized_end=2233
+  _globals['_GETQUOTEREQUEST']._serialized_start=2235
+  _globals['_GETQUOTEREQUEST']._serialized_end=2323
+  _globals['_GETQUOTERESPONSE']._serialized_start=2325
+  _globals['_GETQUOTERESPONSE']._serialized_end=2378
+  _globals['_SHIPORDERREQUEST']._serialized_start=2380
+  _globals['_SHIPORDERREQUEST']._serialized_end=2469
+  _globals['_SHIPORDERRESPONSE']._serialized_start=2471
+  _globals['_SHIPORDERRESPONSE']._serialized_end=2511
+  _globals['_ADDRESS']._serialized_start=2513
+  _globals['_ADDRESS']._serialized_end=2610
+  _globals['_MONEY']._serialized_start=2612
+  _globals['_MONEY']._serialized_end=2672
+  _globals['_GETSUPPORTEDCURRENCIESRESPONSE']._serialized_start=2674
+  _globals['_GETSUPPORTEDCURRENCIESRESPONSE']._serialized_end=2730
+  _globals['_CURRENCYCONVERSIONREQUEST']._serialized_start=2732
+  _globals['_CURRENCYCONVERSIONREQUEST']._serialized_end=2807
+  _globals['_CREDITCARDINFO']._serialized_start=2810
+  _globals['_CREDITCARDINFO']._serialized_end=2954
+  _globals['_CHARGEREQUEST']._serialized_start=2956
+  _globals['_CHARGEREQUEST']._serialized_end=3051
+  _globals['_CHARGERESPONSE']._serialized_start=3053
+  _globals['_CHARGERESPONSE']._serialized_end=3093
+  _globals['_ORDERITEM']._serialized_start=3095
+  _globals['_ORDERITEM']._serialized_end=3171
+  _globals['_ORDERRESULT']._serialized_start=3174
+  _globals['_ORDERRESULT']._serialized_end=3356
+  _globals['_SENDORDERCONFIRMATIONREQUEST']._serialized_start=3358
+  _globals['_SENDORDERCONFIRMATIONREQUEST']._serialized_end=3441
+  _globals['_PLACEORDERREQUEST']._serialized_start=3444
+  _globals['_PLACEORDERREQUEST']._serialized_end=3601
+  _globals['_PLACEORDERRESPONSE']._serialized_start=3603
+  _globals['_PLACEORDERRESPONSE']._serialized_end=3661
+  _globals['_ADREQUEST']._serialized_start=3663
+  _globals['_ADREQUEST']._serialized_end=3696
+  _globals['_ADRESPONSE']._serialized_start=3698
+  _globals['_ADRESPONSE']._serialized_end=3737
+  _globals['_AD']._serialized_start=3739
+  _globals['_AD']._serialized_end=3779
+  _globals['_FLAG']._serialized_start=3781
+  _globals['_FLAG']._serialized_end=3839
+  _globals['_GETFLAGREQUEST']._serialized_start=3841
+  _globals['_GETFLAGREQUEST']._serialized_end=3871
+  _globals['_GETFLAGRESPONSE']._serialized_start=3873
+  _globals['_GETFLAGRESPONSE']._serialized_end=3920
+  _globals['_CREATEFLAGREQUEST']._serialized_start=3922
+  _globals['_CREATEFLAGREQUEST']._serialized_end=3993
+  _globals['_CREATEFLAGRESPONSE']._serialized_start=3995
+  _globals['_CREATEFLAGRESPONSE']._serialized_end=4045
+  _globals['_UPDATEFLAGREQUEST']._serialized_start=4047
+  _globals['_UPDATEFLAGREQUEST']._serialized_end=4097
+  _globals['_UPDATEFLAGRESPONSE']._serialized_start=4099
+  _globals['_UPDATEFLAGRESPONSE']._serialized_end=4119
+  _globals['_LISTFLAGSREQUEST']._serialized_start=4121
+  _globals['_LISTFLAGSREQUEST']._serialized_end=4139
+  _globals['_LISTFLAGSRESPONSE']._serialized_start=4141
+  _globals['_LISTFLAGSRESPONSE']._serialized_end=4190
+  _globals['_DELETEFLAGREQUEST']._serialized_start=4192
+  _globals['_DELETEFLAGREQUEST']._serialized_end=4225
+  _globals['_DELETEFLAGRESPONSE']._serialized_start=4227
+  _globals['_DELETEFLAGRESPONSE']._serialized_end=4247
+  _globals['_CARTSERVICE']._serialized_start=4250
+  _globals['_CARTSERVICE']._serialized_end=4434
+  _globals['_RECOMMENDATIONSERVICE']._serialized_start=4437
+  _globals['_RECOMMENDATIONSERVICE']._serialized_end=4679
+  _globals['_PRODUCTCATALOGSERVICE']._serialized_start=4682
+  _globals['_PRODUCTCATALOGSERVICE']._serialized_end=4923
+  _globals['_PRODUCTREVIEWSERVICE']._serialized_start=4926
+  _globals['_PRODUCTREVIEWSERVICE']._serialized_end=5836
+  _globals['_SHIPPINGSERVICE']._serialized_start=5839
+  _globals['_SHIPPINGSERVICE']._serialized_end=5997
+  _globals['_CURRENCYSERVICE']._serialized_start=6000
+  _globals['_CURRENCYSERVICE']._serialized_end=6171
+  _globals['_PAYMENTSERVICE']._serialized_start=6173
+  _globals['_PAYMENTSERVICE']._serialized_end=6252
+  _globals['_EMAILSERVICE']._serialized_start=6254
+  _globals['_EMAILSERVICE']._serialized_end=6352
+  _globals['_CHECKOUTSERVICE']._serialized_start=6354
+  _globals['_CHECKOUTSERVICE']._serialized_end=6446
+  _globals['_ADSERVICE']._serialized_start=6448
+  _globals['_ADSERVICE']._serialized_end=6514
+  _globals['_FEATUREFLAGSERVICE']._serialized_start=6517
+  _globals['_FEATUREFLAGSERVICE']._serialized_end=6900
 # @@protoc_insertion_point(module_scope)
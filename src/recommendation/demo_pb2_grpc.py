@@ -154,6 +154,11 @@ class RecommendationServiceStub(object):
                 request_serializer=demo__pb2.ListRecommendationsRequest.SerializeToString,
                 response_deserializer=demo__pb2.ListRecommendationsResponse.FromString,
                 )
+        self.ListRecommendationsBatch = channel.unary_unary(
+                '/oteldemo.RecommendationService/ListRecommendationsBatch',
+                request_serializer=demo__pb2.ListRecommendationsBatchRequest.SerializeToString,
+                response_deserializer=demo__pb2.ListRecommendationsBatchResponse.FromString,
+                )
 
 
 class RecommendationServiceServicer(object):
@@ -167,6 +172,12 @@ class RecommendationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ListRecommendationsBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_RecommendationServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -175,6 +186,11 @@ def add_RecommendationServiceServicer_to_server(servicer, server):
                     request_deserializer=demo__pb2.ListRecommendationsRequest.FromString,
                     response_serializer=demo__pb2.ListRecommendationsResponse.SerializeToString,
             ),
+            'ListRecommendationsBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListRecommendationsBatch,
+                    request_deserializer=demo__pb2.ListRecommendationsBatchRequest.FromString,
+                    response_serializer=demo__pb2.ListRecommendationsBatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'oteldemo.RecommendationService', rpc_method_handlers)
@@ -204,6 +220,23 @@ class RecommendationService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def ListRecommendationsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/oteldemo.RecommendationService/ListRecommendationsBatch',
+            demo__pb2.ListRecommendationsBatchRequest.SerializeToString,
+            demo__pb2.ListRecommendationsBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
 
 class ProductCatalogServiceStub(object):
     """---------------Product Catalog----------------
@@ -364,6 +397,31 @@ class ProductReviewServiceStub(object):
                 request_serializer=demo__pb2.AskProductAIAssistantRequest.SerializeToString,
                 response_deserializer=demo__pb2.AskProductAIAssistantResponse.FromString,
                 )
+        self.GetProductReviewScoreHistogram = channel.unary_unary(
+                '/oteldemo.ProductReviewService/GetProductReviewScoreHistogram',
+                request_serializer=demo__pb2.GetProductReviewScoreHistogramRequest.SerializeToString,
+                response_deserializer=demo__pb2.GetProductReviewScoreHistogramResponse.FromString,
+                )
+        self.GetProductReviewsBatch = channel.unary_unary(
+                '/oteldemo.ProductReviewService/GetProductReviewsBatch',
+                request_serializer=demo__pb2.GetProductReviewsBatchRequest.SerializeToString,
+                response_deserializer=demo__pb2.GetProductReviewsBatchResponse.FromString,
+                )
+        self.GetAverageScoresBatch = channel.unary_unary(
+                '/oteldemo.ProductReviewService/GetAverageScoresBatch',
+                request_serializer=demo__pb2.GetAverageScoresBatchRequest.SerializeToString,
+                response_deserializer=demo__pb2.GetAverageScoresBatchResponse.FromString,
+                )
+        self.GetProductReviewsPage = channel.unary_unary(
+                '/oteldemo.ProductReviewService/GetProductReviewsPage',
+                request_serializer=demo__pb2.GetProductReviewsPageRequest.SerializeToString,
+                response_deserializer=demo__pb2.GetProductReviewsPageResponse.FromString,
+                )
+        self.StreamProductReviews = channel.unary_stream(
+                '/oteldemo.ProductReviewService/StreamProductReviews',
+                request_serializer=demo__pb2.StreamProductReviewsRequest.SerializeToString,
+                response_deserializer=demo__pb2.ProductReview.FromString,
+                )
 
 
 class ProductReviewServiceServicer(object):
@@ -389,6 +447,36 @@ class ProductReviewServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetProductReviewScoreHistogram(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetProductReviewsBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetAverageScoresBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetProductReviewsPage(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamProductReviews(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ProductReviewServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -407,6 +495,31 @@ def add_ProductReviewServiceServicer_to_server(servicer, server):
                     request_deserializer=demo__pb2.AskProductAIAssistantRequest.FromString,
                     response_serializer=demo__pb2.AskProductAIAssistantResponse.SerializeToString,
             ),
+            'GetProductReviewScoreHistogram': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetProductReviewScoreHistogram,
+                    request_deserializer=demo__pb2.GetProductReviewScoreHistogramRequest.FromString,
+                    response_serializer=demo__pb2.GetProductReviewScoreHistogramResponse.SerializeToString,
+            ),
+            'GetProductReviewsBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetProductReviewsBatch,
+                    request_deserializer=demo__pb2.GetProductReviewsBatchRequest.FromString,
+                    response_serializer=demo__pb2.GetProductReviewsBatchResponse.SerializeToString,
+            ),
+            'GetAverageScoresBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetAverageScoresBatch,
+                    request_deserializer=demo__pb2.GetAverageScoresBatchRequest.FromString,
+                    response_serializer=demo__pb2.GetAverageScoresBatchResponse.SerializeToString,
+            ),
+            'GetProductReviewsPage': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetProductReviewsPage,
+                    request_deserializer=demo__pb2.GetProductReviewsPageRequest.FromString,
+                    response_serializer=demo__pb2.GetProductReviewsPageResponse.SerializeToString,
+            ),
+            'StreamProductReviews': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamProductReviews,
+                    request_deserializer=demo__pb2.StreamProductReviewsRequest.FromString,
+                    response_serializer=demo__pb2.ProductReview.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'oteldemo.ProductReviewService', rpc_method_handlers)
@@ -470,6 +583,91 @@ class ProductReviewService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def GetProductReviewScoreHistogram(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/oteldemo.ProductReviewService/GetProductReviewScoreHistogram',
+            demo__pb2.GetProductReviewScoreHistogramRequest.SerializeToString,
+            demo__pb2.GetProductReviewScoreHistogramResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetProductReviewsBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/oteldemo.ProductReviewService/GetProductReviewsBatch',
+            demo__pb2.GetProductReviewsBatchRequest.SerializeToString,
+            demo__pb2.GetProductReviewsBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetAverageScoresBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/oteldemo.ProductReviewService/GetAverageScoresBatch',
+            demo__pb2.GetAverageScoresBatchRequest.SerializeToString,
+            demo__pb2.GetAverageScoresBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetProductReviewsPage(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/oteldemo.ProductReviewService/GetProductReviewsPage',
+            demo__pb2.GetProductReviewsPageRequest.SerializeToString,
+            demo__pb2.GetProductReviewsPageResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def StreamProductReviews(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/oteldemo.ProductReviewService/StreamProductReviews',
+            demo__pb2.StreamProductReviewsRequest.SerializeToString,
+            demo__pb2.ProductReview.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
 
 class ShippingServiceStub(object):
     """---------------Shipping Service----------
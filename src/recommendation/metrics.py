@@ -3,15 +3,87 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
-def init_metrics(meter):
+from opentelemetry.metrics import Observation
+
+def init_metrics(meter, catalog_cache=None, flag_cache=None):
 
     # Recommendations counter
     app_recommendations_counter = meter.create_counter(
         'app_recommendations_counter', unit='recommendations', description="Counts the total number of given recommendations"
     )
 
+    # Catalog snapshot cache counters
+    app_recommendation_catalog_cache_hits = meter.create_counter(
+        'app_recommendation_catalog_cache_hits', unit='requests', description="Counts the catalog lookups served from the in-process snapshot"
+    )
+    app_recommendation_catalog_cache_misses = meter.create_counter(
+        'app_recommendation_catalog_cache_misses', unit='requests', description="Counts the catalog lookups that had to fetch the catalog synchronously"
+    )
+
+    # Catalog fetch coalescing counters
+    app_recommendation_catalog_fetches_issued = meter.create_counter(
+        'app_recommendation_catalog_fetches_issued', unit='requests', description="Counts the ListProducts calls issued to the product catalog"
+    )
+    app_recommendation_catalog_fetches_coalesced = meter.create_counter(
+        'app_recommendation_catalog_fetches_coalesced', unit='requests', description="Counts the catalog fetches that shared an in-flight ListProducts call"
+    )
+
+    # Degraded responses counter
+    app_recommendation_degraded_responses = meter.create_counter(
+        'app_recommendation_degraded_responses', unit='responses', description="Counts the responses served from the last good catalog snapshot"
+    )
+
+    # Admission control metrics
+    app_recommendation_rpcs_in_flight = meter.create_up_down_counter(
+        'app_recommendation_rpcs_in_flight', unit='requests', description="Number of RPCs being handled by the recommendation server"
+    )
+    app_recommendation_rpc_queue_depth = meter.create_up_down_counter(
+        'app_recommendation_rpc_queue_depth', unit='requests', description="Number of RPCs waiting for a free recommendation server worker"
+    )
+    app_recommendation_rpc_queue_time = meter.create_histogram(
+        'app_recommendation_rpc_queue_time', unit='s', description="Time RPCs spent waiting for a free recommendation server worker"
+    )
+    app_recommendation_rpcs_shed = meter.create_counter(
+        'app_recommendation_rpcs_shed', unit='requests', description="Counts the RPCs rejected by recommendation admission control"
+    )
+
+    # Feature flag evaluation histogram
+    app_recommendation_flag_evaluation_duration = meter.create_histogram(
+        'app_recommendation_flag_evaluation_duration', unit='s', description="Duration of the background feature flag evaluations"
+    )
+
+    # Catalog snapshot age gauge
+    if catalog_cache is not None:
+        def observe_catalog_snapshot_age(options):
+            age = catalog_cache.age_seconds()
+            return [] if age is None else [Observation(age)]
+
+        meter.create_observable_gauge(
+            'app_recommendation_catalog_snapshot_age', callbacks=[observe_catalog_snapshot_age], unit='s', description="Age of the in-process catalog snapshot"
+        )
+
+    # Feature flag staleness gauge
+    if flag_cache is not None:
+        def observe_flag_staleness(options):
+            staleness = flag_cache.staleness_seconds()
+            return [] if staleness is None else [Observation(staleness)]
+
+        meter.create_observable_gauge(
+            'app_recommendation_flag_staleness', callbacks=[observe_flag_staleness], unit='s', description="Time since the cached feature flags were last refreshed"
+        )
+
     rec_svc_metrics = {
         "app_recommendations_counter": app_recommendations_counter,
+        "app_recommendation_catalog_cache_hits": app_recommendation_catalog_cache_hits,
+        "app_recommendation_catalog_cache_misses": app_recommendation_catalog_cache_misses,
+        "app_recommendation_catalog_fetches_issued": app_recommendation_catalog_fetches_issued,
+        "app_recommendation_catalog_fetches_coalesced": app_recommendation_catalog_fetches_coalesced,
+        "app_recommendation_degraded_responses": app_recommendation_degraded_responses,
+        "app_recommendation_rpcs_in_flight": app_recommendation_rpcs_in_flight,
+        "app_recommendation_rpc_queue_depth": app_recommendation_rpc_queue_depth,
+        "app_recommendation_rpc_queue_time": app_recommendation_rpc_queue_time,
+        "app_recommendation_rpcs_shed": app_recommendation_rpcs_shed,
+        "app_recommendation_flag_evaluation_duration": app_recommendation_flag_evaluation_duration,
     }
 
     return rec_svc_metrics
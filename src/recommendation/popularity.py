@@ -0,0 +1,146 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import logging
+import random
+import threading
+import time
+
+# Pip
+import numpy as np
+import psycopg2
+from opentelemetry import trace
+
+logger = logging.getLogger('main')
+tracer = trace.get_tracer(__name__)
+
+
+class AliasTable:
+    """Walker/Vose alias table for O(1) weighted draws."""
+
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        num_items = len(weights)
+        scaled = weights * (num_items / weights.sum())
+
+        prob = np.ones(num_items)
+        alias = np.arange(num_items)
+        small = np.flatnonzero(scaled < 1.0).tolist()
+        large = np.flatnonzero(scaled >= 1.0).tolist()
+        scaled = scaled.tolist()
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Plain lists are faster than NumPy arrays for single element access
+        self._prob = prob.tolist()
+        self._alias = alias.tolist()
+
+    def __len__(self):
+        return len(self._prob)
+
+    def draw(self):
+        i = random.randrange(len(self._prob))
+        return i if random.random() < self._prob[i] else self._alias[i]
+
+
+class PopularitySampler:
+    """Samples products weighted by their recent order volume.
+
+    A background thread aggregates the quantities ordered per product over
+    the last `window_seconds` from accounting.orderitem and rebuilds the
+    alias table, so each request only pays for a constant number of draws.
+    The table is dropped once no product was ordered for a whole window.
+    """
+
+    def __init__(self, db_connection_str, refresh_interval, window_seconds):
+        self._db_connection_str = db_connection_str
+        self._refresh_interval = refresh_interval
+        self._window_seconds = window_seconds
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name='popularity-sampler-refresh', daemon=True)
+
+        # (product_ids, alias_table) is swapped as a single tuple so readers
+        # never observe a half-updated sampler, with product_ids ranked by
+        # the quantity ordered
+        self._published = ((), None)
+        self._published_at = None
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def is_ready(self):
+        return self._published[1] is not None
+
+    def recommend(self, request_product_ids, max_responses):
+        product_ids, alias_table = self._published
+        excluded = set(request_product_ids)
+        prod_list = []
+
+        # Draw without replacement by rejecting repeated or excluded products,
+        # with a bounded number of draws so requests stay O(max_responses)
+        attempts = 0
+        while alias_table is not None and len(prod_list) < max_responses and attempts < 8 * max_responses:
+            attempts += 1
+            product_id = product_ids[alias_table.draw()]
+            if product_id not in excluded and product_id not in prod_list:
+                prod_list.append(product_id)
+
+        # Fill up with the most ordered products when the draws kept hitting
+        # excluded or already chosen products
+        for product_id in product_ids:
+            if len(prod_list) >= max_responses:
+                break
+            if product_id not in excluded and product_id not in prod_list:
+                prod_list.append(product_id)
+
+        return prod_list
+
+    def refresh(self):
+        with tracer.start_as_current_span("refresh_popularity_sampler") as span:
+            connection = psycopg2.connect(self._db_connection_str)
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT product_id, SUM(quantity) FROM accounting.orderitem WHERE created_at > now() - make_interval(secs => %s) GROUP BY product_id ORDER BY 2 DESC",
+                        (self._window_seconds, ))
+                    rows = cursor.fetchall()
+            finally:
+                connection.close()
+
+            span.set_attribute("app.products.count", len(rows))
+            if not rows:
+                # Keep the last table for a window, then stop recommending
+                # products nobody orders anymore
+                if self._published_at is not None and time.monotonic() - self._published_at > self._window_seconds:
+                    self._published = ((), None)
+                    self._published_at = None
+                return
+
+            product_ids = tuple(row[0] for row in rows)
+            alias_table = AliasTable(np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows)))
+            self._published = (product_ids, alias_table)
+            self._published_at = time.monotonic()
+
+    def _refresh_loop(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Popularity sampler refresh failed: {e}")
+            if self._stop.wait(self._refresh_interval):
+                return
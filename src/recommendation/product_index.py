@@ -0,0 +1,87 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# Python
+import random
+import threading
+
+# Pip
+import numpy as np
+
+
+class ProductList:
+    """Product ids sampled with a set difference of the requested products.
+
+    Building a ProductIndex costs more than a single set difference, so
+    catalogs that are only sampled once, like a catalog fetched for a single
+    request, are sampled this way instead.
+    """
+
+    def __init__(self, product_ids):
+        self.source_count = len(product_ids)
+        self.product_ids = product_ids
+
+    def sample(self, k, excluded_product_ids):
+        """Returns (product_ids, num_candidates) for up to k distinct ids not in `excluded_product_ids`."""
+        filtered_products = list(set(self.product_ids) - set(excluded_product_ids))
+        num_products = len(filtered_products)
+        indices = random.sample(range(num_products), min(k, num_products))
+        return [filtered_products[i] for i in indices], num_products
+
+
+class ProductIndex:
+    """Interned product id table mapping each id to a dense int32 index.
+
+    Exclusion of the requested products is done with a reusable boolean
+    mask, so sampling never builds a filtered copy of the catalog. Building
+    the index only pays off when it is sampled many times, like the catalog
+    snapshot.
+    """
+
+    def __init__(self, product_ids):
+        # Number of ids received, including duplicates
+        self.source_count = len(product_ids)
+        self.product_ids = tuple(dict.fromkeys(product_ids))
+        self._indices = {product_id: i for i, product_id in enumerate(self.product_ids)}
+        self._local = threading.local()
+
+    def __len__(self):
+        return len(self.product_ids)
+
+    def has_ids(self, product_ids):
+        """Returns True when the index was built from the same ids, in the same order."""
+        return self.source_count == len(product_ids) and self.product_ids == tuple(dict.fromkeys(product_ids))
+
+    def lookup(self, product_ids):
+        """Returns the distinct int32 indices of the known ids in `product_ids`."""
+        indices = self._indices
+        found = {indices[product_id] for product_id in product_ids if product_id in indices}
+        return np.fromiter(found, dtype=np.int32, count=len(found))
+
+    def sample(self, k, excluded_product_ids):
+        """Returns (product_ids, num_candidates) for up to k distinct ids not in `excluded_product_ids`."""
+        excluded = self.lookup(excluded_product_ids)
+        num_candidates = len(self.product_ids) - len(excluded)
+
+        # A uniform sample of k + len(excluded) indices still holds at least
+        # k candidates once the excluded ones are dropped
+        num_draws = min(len(self.product_ids), k + len(excluded))
+        drawn = np.fromiter(random.sample(range(len(self.product_ids)), num_draws), dtype=np.int32, count=num_draws)
+
+        mask = self._exclusion_mask()
+        mask[excluded] = True
+        try:
+            selected = drawn[~mask[drawn]][:k]
+        finally:
+            mask[excluded] = False
+
+        return [self.product_ids[i] for i in selected.tolist()], num_candidates
+
+    def _exclusion_mask(self):
+        # One mask per thread, allocated on first use and cleared after every sample
+        mask = getattr(self._local, 'mask', None)
+        if mask is None:
+            mask = self._local.mask = np.zeros(len(self.product_ids), dtype=bool)
+        return mask
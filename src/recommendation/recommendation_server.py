@@ -5,9 +5,11 @@
 
 
 # Python
+import asyncio
+import json
 import os
 import random
-from concurrent import futures
+import sys
 
 # Pip
 import grpc
@@ -35,25 +37,43 @@ from grpc_health.v1 import health_pb2_grpc
 from metrics import (
     init_metrics
 )
+from admission import AdmissionControl, AsyncAdmissionControl
+from catalog_cache import CatalogSnapshotCache
+from flag_cache import FlagCache
+from copurchase import CoPurchaseIndex
+from popularity import PopularitySampler
+import prefork
+from product_index import ProductIndex, ProductList
+from singleflight import AsyncSingleFlight, SingleFlight
 
 cached_ids = []
 first_run = True
+catalog_cache = None
+flag_cache = None
+recommendation_strategy = 'catalog'
+recommender = None
+product_catalog_async_stub = None
+catalog_fetches = SingleFlight()
+catalog_timeout_cap = 5.0
+last_good_products = None
+catalog_product_index = None
+catalog_fetches_async = AsyncSingleFlight()
+
+# Upper bound on the requests of a single batch request
+MAX_BATCH_SIZE = 100
 
 class RecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
     def ListRecommendations(self, request, context):
-        prod_list = get_product_list(request.product_ids)
-        span = trace.get_current_span()
-        span.set_attribute("app.products_recommended.count", len(prod_list))
-        logger.info(f"Receive ListRecommendations for product ids:{prod_list}")
+        prod_list, recommendation_type = get_product_list(request.product_ids, context)
+        return build_recommendations_response(prod_list, recommendation_type)
 
-        # build and return response
-        response = demo_pb2.ListRecommendationsResponse()
-        response.product_ids.extend(prod_list)
-
-        # Collect metrics for this service
-        rec_svc_metrics["app_recommendations_counter"].add(len(prod_list), {'recommendation.type': 'catalog'})
-
-        return response
+    def ListRecommendationsBatch(self, request, context):
+        try:
+            check_batch_size(request.requests)
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        prod_lists, recommendation_type = get_product_lists(request.requests, context)
+        return build_recommendations_batch_response(prod_lists, recommendation_type)
 
     def Check(self, request, context):
         return health_pb2.HealthCheckResponse(
@@ -64,53 +84,321 @@ class RecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
             status=health_pb2.HealthCheckResponse.UNIMPLEMENTED)
 
 
-def get_product_list(request_product_ids):
+class AsyncRecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
+    async def ListRecommendations(self, request, context):
+        prod_list, recommendation_type = await get_product_list_async(request.product_ids, context)
+        return build_recommendations_response(prod_list, recommendation_type)
+
+    async def ListRecommendationsBatch(self, request, context):
+        try:
+            check_batch_size(request.requests)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        prod_lists, recommendation_type = await get_product_lists_async(request.requests, context)
+        return build_recommendations_batch_response(prod_lists, recommendation_type)
+
+    async def Check(self, request, context):
+        return health_pb2.HealthCheckResponse(
+            status=health_pb2.HealthCheckResponse.SERVING)
+
+    async def Watch(self, request, context):
+        return health_pb2.HealthCheckResponse(
+            status=health_pb2.HealthCheckResponse.UNIMPLEMENTED)
+
+
+def build_recommendations_response(prod_list, recommendation_type):
+    span = trace.get_current_span()
+    span.set_attribute("app.products_recommended.count", len(prod_list))
+    span.set_attribute("app.recommendation.type", recommendation_type)
+    logger.info(f"Receive ListRecommendations for product ids:{prod_list}")
+
+    # build and return response
+    response = demo_pb2.ListRecommendationsResponse()
+    response.product_ids.extend(prod_list)
+
+    # Collect metrics for this service
+    rec_svc_metrics["app_recommendations_counter"].add(len(prod_list), {'recommendation.type': recommendation_type})
+
+    return response
+
+
+def build_recommendations_batch_response(prod_lists, recommendation_type):
+    span = trace.get_current_span()
+    span.set_attribute("app.products_recommended.count", sum(len(prod_list) for prod_list in prod_lists))
+    span.set_attribute("app.recommendation.type", recommendation_type)
+    logger.info(f"Receive ListRecommendationsBatch for {len(prod_lists)} requests")
+
+    # build and return response, in the same order as the requests
+    response = demo_pb2.ListRecommendationsBatchResponse()
+    for prod_list in prod_lists:
+        response.responses.add().product_ids.extend(prod_list)
+
+        # Collect metrics for this service
+        rec_svc_metrics["app_recommendations_counter"].add(len(prod_list), {'recommendation.type': recommendation_type})
+
+    return response
+
+
+def get_product_list(request_product_ids, context):
+    with tracer.start_as_current_span("get_product_list") as span:
+        request_product_ids = parse_request_product_ids(request_product_ids)
+        products, recommendation_type = get_candidate_products(span, context)
+
+        prod_list, attributes = select_recommendations(products, request_product_ids)
+        span.set_attributes(attributes)
+
+        return prod_list, recommendation_type
+
+
+async def get_product_list_async(request_product_ids, context):
+    with tracer.start_as_current_span("get_product_list") as span:
+        request_product_ids = parse_request_product_ids(request_product_ids)
+        products, recommendation_type = await get_candidate_products_async(span, context)
+
+        prod_list, attributes = select_recommendations(products, request_product_ids)
+        span.set_attributes(attributes)
+
+        return prod_list, recommendation_type
+
+
+def check_batch_size(requests):
+    if len(requests) > MAX_BATCH_SIZE:
+        raise ValueError(f"At most {MAX_BATCH_SIZE} requests can be batched at once")
+
+
+def get_product_lists(requests, context):
+    with tracer.start_as_current_span("get_product_lists") as span:
+        products, recommendation_type = get_candidate_products(span, context)
+        return select_batch_recommendations(span, products, requests), recommendation_type
+
+
+async def get_product_lists_async(requests, context):
+    with tracer.start_as_current_span("get_product_lists") as span:
+        products, recommendation_type = await get_candidate_products_async(span, context)
+        return select_batch_recommendations(span, products, requests), recommendation_type
+
+
+def get_candidate_products(span, context):
+    """Returns (products, recommendation_type), with products None when the recommender picks products."""
+    # Feature flag scenario - Cache Leak
+    if check_feature_flag("recommendationCacheFailure"):
+        span.set_attribute("app.recommendation.cache_enabled", True)
+        if is_leaky_cache_miss(span):
+            cat_response = product_catalog_stub.GetProduct(demo_pb2.Empty(), timeout=get_catalog_timeout(context))
+            return ProductList(add_to_leaky_cache(cat_response)), 'catalog'
+        return ProductList(cached_ids), 'catalog'
+
+    span.set_attribute("app.recommendation.cache_enabled", False)
+    if recommender is not None and recommender.is_ready():
+        return None, recommendation_strategy
+    return get_catalog_products(context), 'catalog'
+
+
+async def get_candidate_products_async(span, context):
+    """Returns (products, recommendation_type), with products None when the recommender picks products."""
+    # Feature flag scenario - Cache Leak
+    if check_feature_flag("recommendationCacheFailure"):
+        span.set_attribute("app.recommendation.cache_enabled", True)
+        if is_leaky_cache_miss(span):
+            cat_response = await product_catalog_async_stub.GetProduct(demo_pb2.Empty(), timeout=get_catalog_timeout(context))
+            return ProductList(add_to_leaky_cache(cat_response)), 'catalog'
+        return ProductList(cached_ids), 'catalog'
+
+    span.set_attribute("app.recommendation.cache_enabled", False)
+    if recommender is not None and recommender.is_ready():
+        return None, recommendation_strategy
+    return await get_catalog_products_async(context), 'catalog'
+
+
+def parse_request_product_ids(request_product_ids):
+    # Formulate the list of characters to list of strings
+    request_product_ids_str = ''.join(request_product_ids)
+    return request_product_ids_str.split(',')
+
+
+def is_leaky_cache_miss(span):
     global first_run
+    if random.random() < 0.5 or first_run:
+        first_run = False
+        span.set_attribute("app.cache_hit", False)
+        logger.info("get_product_list: cache miss")
+        return True
+
+    span.set_attribute("app.cache_hit", True)
+    logger.info("get_product_list: cache hit")
+    return False
+
+
+def add_to_leaky_cache(cat_response):
     global cached_ids
-    with tracer.start_as_current_span("get_product_list") as span:
-        max_responses = 5
-
-        # Formulate the list of characters to list of strings
-        request_product_ids_str = ''.join(request_product_ids)
-        request_product_ids = request_product_ids_str.split(',')
-
-        # Feature flag scenario - Cache Leak
-        if check_feature_flag("recommendationCacheFailure"):
-            span.set_attribute("app.recommendation.cache_enabled", True)
-            if random.random() < 0.5 or first_run:
-                first_run = False
-                span.set_attribute("app.cache_hit", False)
-                logger.info("get_product_list: cache miss")
-                cat_response = product_catalog_stub.GetProduct(demo_pb2.Empty())
-                response_ids = [x.id for x in cat_response.products]
-                cached_ids = cached_ids + response_ids
-                cached_ids = cached_ids + cached_ids[:len(cached_ids) // 4]
-                product_ids = cached_ids
-            else:
-                span.set_attribute("app.cache_hit", True)
-                logger.info("get_product_list: cache hit")
-                product_ids = cached_ids
-        else:
-            span.set_attribute("app.recommendation.cache_enabled", False)
-            cat_response = product_catalog_stub.ListProducts(demo_pb2.Empty())
-            product_ids = [x.id for x in cat_response.products]
-
-        span.set_attribute("app.products.count", len(product_ids))
-
-        # Create a filtered list of products excluding the products received as input
-        filtered_products = list(set(product_ids) - set(request_product_ids))
-        num_products = len(filtered_products)
-        span.set_attribute("app.filtered_products.count", num_products)
-        num_return = min(max_responses, num_products)
-
-        # Sample list of indicies to return
-        indices = random.sample(range(num_products), num_return)
-        # Fetch product ids from indices
-        prod_list = [filtered_products[i] for i in indices]
-
-        span.set_attribute("app.filtered_products.list", prod_list)
-
-        return prod_list
+    response_ids = [x.id for x in cat_response.products]
+    cached_ids = cached_ids + response_ids
+    cached_ids = cached_ids + cached_ids[:len(cached_ids) // 4]
+    return cached_ids
+
+
+def select_recommendations(products, request_product_ids):
+    """Returns (prod_list, attributes) where attributes describe the selection for spans and span events."""
+    max_responses = 5
+
+    if products is None:
+        prod_list = recommender.recommend(request_product_ids, max_responses)
+        return prod_list, {"app.filtered_products.list": prod_list}
+
+    # Sample products excluding the products received as input
+    prod_list, num_products = products.sample(max_responses, request_product_ids)
+
+    return prod_list, {
+        "app.products.count": products.source_count,
+        "app.filtered_products.count": num_products,
+        "app.filtered_products.list": prod_list,
+    }
+
+
+def select_batch_recommendations(span, products, requests):
+    # One span event per batch entry instead of one span per request
+    span.set_attribute("app.recommendation.batch.size", len(requests))
+    prod_lists = []
+    for index, request in enumerate(requests):
+        request_product_ids = parse_request_product_ids(request.product_ids)
+        prod_list, attributes = select_recommendations(products, request_product_ids)
+        span.add_event("recommendation", {"app.recommendation.batch.index": index, **attributes})
+        prod_lists.append(prod_list)
+    return prod_lists
+
+
+def get_catalog_products(context):
+    # Derived at call time so the time spent before the catalog call, such as
+    # the feature flag check, is not counted twice
+    timeout = get_catalog_timeout(context)
+    try:
+        if catalog_cache is None:
+            return ProductList(fetch_catalog_product_ids(timeout))
+
+        product_index, hit = catalog_cache.get(timeout)
+        record_catalog_cache_lookup(hit)
+        return product_index
+    except (grpc.RpcError, TimeoutError) as e:
+        return get_last_good_products(e)
+
+
+async def get_catalog_products_async(context):
+    # Derived at call time so the time spent before the catalog call, such as
+    # the feature flag check, is not counted twice
+    timeout = get_catalog_timeout(context)
+    try:
+        if catalog_cache is None:
+            return ProductList(await fetch_catalog_product_ids_async(timeout))
+
+        product_index, hit = await catalog_cache.get_async(fetch_catalog_product_index_async, timeout)
+        record_catalog_cache_lookup(hit)
+        return product_index
+    except (grpc.RpcError, TimeoutError) as e:
+        return get_last_good_products(e)
+
+
+def get_last_good_products(error):
+    # Serve the last catalog that was fetched successfully when the product
+    # catalog is slow or unavailable, and fail for any other error
+    if isinstance(error, grpc.RpcError):
+        reason = error.code().name
+        if error.code() not in (grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.UNAVAILABLE):
+            raise error
+    else:
+        reason = grpc.StatusCode.DEADLINE_EXCEEDED.name
+
+    if last_good_products is None:
+        raise error
+
+    span = trace.get_current_span()
+    span.set_attribute("app.recommendation.degraded", True)
+    span.set_attribute("app.recommendation.degraded.reason", reason)
+    rec_svc_metrics["app_recommendation_degraded_responses"].add(1, {'reason': reason})
+    logger.warning(f"Serving recommendations from the last good catalog snapshot: {reason}")
+    return last_good_products
+
+
+def get_catalog_timeout(context=None):
+    # Use part of the caller's remaining deadline, so there is still time to
+    # fall back to the last good snapshot, capped at catalog_timeout_cap
+    time_remaining = context.time_remaining() if context is not None else None
+    if time_remaining is None:
+        return catalog_timeout_cap
+    return max(0, min(time_remaining * 0.8, catalog_timeout_cap))
+
+
+def record_catalog_cache_lookup(hit):
+    span = trace.get_current_span()
+    span.set_attribute("app.recommendation.catalog_snapshot.hit", hit)
+    if hit:
+        rec_svc_metrics["app_recommendation_catalog_cache_hits"].add(1)
+    else:
+        rec_svc_metrics["app_recommendation_catalog_cache_misses"].add(1)
+
+
+def fetch_catalog_product_index(timeout=None):
+    # The catalog snapshot is sampled by every request until the next refresh
+    return build_catalog_product_index(fetch_catalog_product_ids(timeout))
+
+
+async def fetch_catalog_product_index_async(timeout=None):
+    return build_catalog_product_index(await fetch_catalog_product_ids_async(timeout))
+
+
+def build_catalog_product_index(product_ids):
+    global catalog_product_index
+    # The catalog rarely changes between refreshes, so the index, and the
+    # exclusion masks of its threads, are only rebuilt when it does
+    if catalog_product_index is None or not catalog_product_index.has_ids(product_ids):
+        catalog_product_index = ProductIndex(product_ids)
+    return catalog_product_index
+
+
+def fetch_catalog_product_ids(timeout=None):
+    if timeout is None:
+        timeout = get_catalog_timeout()
+
+    # Concurrent callers share a single in-flight ListProducts call
+    product_ids, coalesced = catalog_fetches.do(
+        'ListProducts', lambda: list_catalog_products(timeout), timeout)
+    record_catalog_fetch(coalesced)
+    return product_ids
+
+
+async def fetch_catalog_product_ids_async(timeout=None):
+    if timeout is None:
+        timeout = get_catalog_timeout()
+
+    # Concurrent callers share a single in-flight ListProducts call
+    product_ids, coalesced = await catalog_fetches_async.do(
+        'ListProducts', lambda: list_catalog_products_async(timeout), timeout)
+    record_catalog_fetch(coalesced)
+    return product_ids
+
+
+def list_catalog_products(timeout):
+    global last_good_products
+    cat_response = product_catalog_stub.ListProducts(demo_pb2.Empty(), timeout=timeout)
+    product_ids = [x.id for x in cat_response.products]
+    last_good_products = ProductList(product_ids)
+    return product_ids
+
+
+async def list_catalog_products_async(timeout):
+    global last_good_products
+    cat_response = await product_catalog_async_stub.ListProducts(demo_pb2.Empty(), timeout=timeout)
+    product_ids = [x.id for x in cat_response.products]
+    last_good_products = ProductList(product_ids)
+    return product_ids
+
+
+def record_catalog_fetch(coalesced):
+    span = trace.get_current_span()
+    span.set_attribute("app.recommendation.catalog_fetch.coalesced", coalesced)
+    if coalesced:
+        rec_svc_metrics["app_recommendation_catalog_fetches_coalesced"].add(1)
+    else:
+        rec_svc_metrics["app_recommendation_catalog_fetches_issued"].add(1)
 
 
 def must_map_env(key: str):
@@ -120,21 +408,65 @@ def must_map_env(key: str):
     return value
 
 
+def serve(port, max_workers, max_concurrent_rpcs):
+    # Create gRPC server, with admission control in front of the workers
+    admission = AdmissionControl(max_workers, max_concurrent_rpcs, rec_svc_metrics, 'app_recommendation')
+    server = admission.server(options=prefork.SERVER_OPTIONS)
+
+    # Add class to gRPC server
+    service = RecommendationService()
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
+    health_pb2_grpc.add_HealthServicer_to_server(service, server)
+
+    # Start server
+    server.add_insecure_port(f'[::]:{port}')
+    server.start()
+    logger.info(f'Recommendation service started, listening on port {port}')
+    server.wait_for_termination()
+
+
+async def serve_async(port, catalog_addr, max_running_rpcs, max_concurrent_rpcs):
+    global product_catalog_async_stub
+
+    # The asyncio channel must be created on the running event loop
+    pc_async_channel = grpc.aio.insecure_channel(catalog_addr)
+    product_catalog_async_stub = demo_pb2_grpc.ProductCatalogServiceStub(pc_async_channel)
+
+    # Create gRPC asyncio server, with admission control in front of the
+    # event loop
+    admission = AsyncAdmissionControl(max_running_rpcs, max_concurrent_rpcs, rec_svc_metrics, 'app_recommendation')
+    server = admission.server(options=prefork.SERVER_OPTIONS)
+
+    # Add class to gRPC server
+    service = AsyncRecommendationService()
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
+    health_pb2_grpc.add_HealthServicer_to_server(service, server)
+
+    # Start server
+    server.add_insecure_port(f'[::]:{port}')
+    await server.start()
+    logger.info(f'Recommendation service started in async mode, listening on port {port}')
+    await server.wait_for_termination()
+
+
 def check_feature_flag(flag_name: str):
-    # Initialize OpenFeature
-    client = api.get_client()
-    return client.get_boolean_value("recommendationCacheFailure", False)
+    value = flag_cache.get(flag_name)
+    # The TracingHook records the evaluations of the flag cache's refresh
+    # thread, which has no request span, so the value used is recorded here
+    trace.get_current_span().add_event("feature_flag.evaluation", {
+        "feature_flag.key": flag_name,
+        "feature_flag.result.value": json.dumps(value),
+        "feature_flag.result.reason": "cached",
+    })
+    return value
 
 
 if __name__ == "__main__":
     service_name = must_map_env('OTEL_SERVICE_NAME')
-    api.set_provider(FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
-    api.add_hooks([TracingHook()])
 
     # Initialize Traces and Metrics
     tracer = trace.get_tracer_provider().get_tracer(service_name)
     meter = metrics.get_meter_provider().get_meter(service_name)
-    rec_svc_metrics = init_metrics(meter)
 
     # Initialize Logs
     logger_provider = LoggerProvider(
@@ -153,21 +485,65 @@ if __name__ == "__main__":
     logger = logging.getLogger('main')
     logger.addHandler(handler)
 
+    # In pre-fork mode this process only supervises the worker processes,
+    # which run everything below
+    if os.environ.get('RECOMMENDATION_PREFORK', 'false') == 'true' and not prefork.is_worker():
+        prefork.supervise(int(os.environ.get('RECOMMENDATION_WORKERS', 0)) or prefork.cpu_quota_workers())
+        sys.exit()
+
+    api.set_provider(FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
+    api.add_hooks([TracingHook()])
+
+    # Flags are evaluated in the background and read from memory on requests
+    flag_cache = FlagCache(
+        ["recommendationCacheFailure"],
+        float(os.environ.get('RECOMMENDATION_FLAG_REFRESH_INTERVAL', 5)))
+
     catalog_addr = must_map_env('PRODUCT_CATALOG_ADDR')
     pc_channel = grpc.insecure_channel(catalog_addr)
     product_catalog_stub = demo_pb2_grpc.ProductCatalogServiceStub(pc_channel)
 
-    # Create gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-
-    # Add class to gRPC server
-    service = RecommendationService()
-    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
-    health_pb2_grpc.add_HealthServicer_to_server(service, server)
-
-    # Start server
+    # Upper bound for product catalog calls, lowered further by the deadline
+    # of the incoming request
+    catalog_timeout_cap = float(os.environ.get('RECOMMENDATION_CATALOG_TIMEOUT', catalog_timeout_cap))
+
+    # Optional in-process catalog snapshot, disabled when the TTL is 0
+    catalog_cache_ttl = float(os.environ.get('RECOMMENDATION_CATALOG_CACHE_TTL', 0))
+    if catalog_cache_ttl > 0:
+        catalog_cache = CatalogSnapshotCache(fetch_catalog_product_index, catalog_cache_ttl)
+        logger.info(f'Catalog snapshot cache enabled with a TTL of {catalog_cache_ttl}s')
+
+    # Recommendation strategy, falls back to random catalog products until
+    # the strategy has data to work with
+    recommendation_strategy = os.environ.get('RECOMMENDATION_STRATEGY', 'catalog')
+    if recommendation_strategy == 'copurchase':
+        recommender = CoPurchaseIndex(
+            must_map_env('DB_CONNECTION_STRING'),
+            float(os.environ.get('RECOMMENDATION_COPURCHASE_REFRESH_INTERVAL', 60)),
+            batch_size=int(os.environ.get('RECOMMENDATION_COPURCHASE_BATCH_SIZE', 10000)),
+            overlap=int(os.environ.get('RECOMMENDATION_COPURCHASE_OVERLAP', 10000)))
+        recommender.start()
+    elif recommendation_strategy == 'popularity':
+        recommender = PopularitySampler(
+            must_map_env('DB_CONNECTION_STRING'),
+            float(os.environ.get('RECOMMENDATION_POPULARITY_REFRESH_INTERVAL', 60)),
+            float(os.environ.get('RECOMMENDATION_POPULARITY_WINDOW', 86400)))
+        recommender.start()
+    elif recommendation_strategy != 'catalog':
+        raise Exception(f'Unsupported RECOMMENDATION_STRATEGY: {recommendation_strategy}')
+    logger.info(f'Using the {recommendation_strategy} recommendation strategy')
+
+    rec_svc_metrics = init_metrics(meter, catalog_cache, flag_cache)
+    flag_cache.start(rec_svc_metrics["app_recommendation_flag_evaluation_duration"])
+    if catalog_cache is not None:
+        catalog_cache.start()
+
+    server_mode = os.environ.get('RECOMMENDATION_SERVER_MODE', 'threaded')
     port = must_map_env('RECOMMENDATION_PORT')
-    server.add_insecure_port(f'[::]:{port}')
-    server.start()
-    logger.info(f'Recommendation service started, listening on port {port}')
-    server.wait_for_termination()
+    max_concurrent_rpcs = int(os.environ.get('RECOMMENDATION_MAX_CONCURRENT_RPCS', 100))
+    if server_mode == 'threaded':
+        serve(port, int(os.environ.get('RECOMMENDATION_MAX_WORKERS', 10)), max_concurrent_rpcs)
+    elif server_mode == 'async':
+        asyncio.run(serve_async(port, catalog_addr, int(os.environ.get('RECOMMENDATION_MAX_RUNNING_RPCS', 50)), max_concurrent_rpcs))
+    else:
+        raise Exception(f'Unsupported RECOMMENDATION_SERVER_MODE: {server_mode}')